@@ -0,0 +1,448 @@
+"""KiSTI — Post-Session Lap Comparison Engine
+
+Joins `telemetry` with `lap_times` (only timed laps) and resamples every
+lap onto one common distance grid, so laps can be compared point for
+point: channel overlays, time-delta curves and corner-by-corner minimum
+speed, braking point and time through the corner.  No GPU. No LLM.
+Pure numpy + DuckDB SQL.
+
+Resampling is one np.interp call per channel for all laps at once: each
+lap's distances (and the grid) are offset by ``lap_row * _LAP_STRIDE_M``
+so the laps lie side by side on a single increasing axis.
+
+Corners come from the best lap's speed trace: every speed minimum with
+at least CORNER_DROP_KPH of drop before and recovery after is an apex,
+and the fastest point between two apexes splits their corners.  Corner
+windows tile the whole lap, so per-corner times add up to the lap time
+and "time lost" per corner (vs the fastest any lap went through it) says
+where the lap went.
+
+Results are cached per session as Parquet next to the database
+(``lap_analytics/<session_id>.<laps>.overlay|corners.parquet``), so
+ParkedDebrief and voice queries answer without touching telemetry again.
+The lap count in the name invalidates the cache when laps are added.
+
+Usage:
+    analytics = LapAnalytics(db_store)
+    analysis = analytics.session(session_id)    # cached after the first call
+    analysis.time_lost()                        # [(Corner, seconds), ...] worst first
+    analytics.track(track_id)                   # every session at a track
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from data.duckdb_store import copy_columns_to_parquet
+
+log = logging.getLogger("kisti.analysis.laps")
+
+# Telemetry channels overlaid per lap
+CHANNELS = ("speed_kph", "throttle_pct", "brake_pressure", "steering_angle", "lateral_g")
+
+# Common distance grid spacing (metres)
+DEFAULT_STEP_M = 5.0
+
+# Laps shorter than this fraction of the median lap distance are partial
+MIN_LAP_FRACTION = 0.9
+
+# Speed drop (and recovery) that makes a minimum a corner
+CORNER_DROP_KPH = 8.0
+
+# Brake pressure (bar) that counts as braking
+BRAKE_ON_BAR = 5.0
+
+# Ignore per-corner losses below this when ranking (seconds)
+MIN_LOSS_S = 0.005
+
+_LAP_STRIDE_M = 1.0e6   # Separates laps on the stacked interpolation axis
+
+
+@dataclass
+class Corner:
+    """A corner window on the distance grid (tiles the lap)."""
+    number: int             # 1-based, in lap order
+    start_m: float
+    apex_m: float           # Best lap's minimum speed
+    end_m: float
+
+
+@dataclass
+class LapOverlay:
+    """Every lap resampled onto one distance grid: arrays are (laps, points)."""
+    distance_m: np.ndarray              # (N,) common grid
+    session_ids: np.ndarray             # (L,) per lap
+    lap_numbers: np.ndarray             # (L,)
+    lap_times_s: np.ndarray             # (L,) from lap_times
+    elapsed_s: np.ndarray               # (L, N) time since the lap's first sample
+    channels: dict[str, np.ndarray]     # name → (L, N)
+
+    @property
+    def lap_count(self) -> int:
+        return len(self.lap_numbers)
+
+    @property
+    def best(self) -> int:
+        """Row of the fastest lap."""
+        return int(np.argmin(self.lap_times_s))
+
+    def row(self, lap_number: int, session_id: Optional[str] = None) -> Optional[int]:
+        """Row of a lap (first match across sessions unless *session_id* is given)."""
+        mask = self.lap_numbers == lap_number
+        if session_id is not None:
+            mask &= self.session_ids == session_id
+        hits = np.flatnonzero(mask)
+        return int(hits[0]) if len(hits) else None
+
+    def time_delta(self, ref: Optional[int] = None) -> np.ndarray:
+        """(L, N) time behind lap row *ref* (default: the best lap) at each distance."""
+        ref = self.best if ref is None else ref
+        return self.elapsed_s - self.elapsed_s[ref]
+
+
+@dataclass
+class CornerTable:
+    """Per-corner stats for every lap: arrays are (laps, corners)."""
+    corners: list[Corner]
+    min_speed_kph: np.ndarray
+    brake_point_m: np.ndarray           # NaN = no braking found
+    time_s: np.ndarray                  # Time through the corner window
+
+    @property
+    def loss_s(self) -> np.ndarray:
+        """Time lost per lap and corner vs the fastest pass through that corner."""
+        if not self.time_s.size:
+            return self.time_s
+        return self.time_s - np.nanmin(self.time_s, axis=0)
+
+
+@dataclass
+class LapAnalysis:
+    """Overlay + corner table for a session (or every session at a track)."""
+    overlay: LapOverlay
+    corners: CornerTable
+
+    def time_lost(self, lap_number: Optional[int] = None, count: int = 3) -> list[tuple[Corner, float]]:
+        """(corner, seconds lost) worst first — for one lap, or averaged over all laps."""
+        loss = self.corners.loss_s
+        if not loss.size:
+            return []
+        row = self.overlay.row(lap_number) if lap_number is not None else None
+        per_corner = loss[row] if row is not None else np.nanmean(loss, axis=0)
+        order = np.argsort(-per_corner)
+        return [
+            (self.corners.corners[i], float(per_corner[i]))
+            for i in order[:count] if per_corner[i] > MIN_LOSS_S
+        ]
+
+    def summary(self) -> dict:
+        """Compact JSON-friendly digest (ParkedDebrief prompt)."""
+        ov, ct = self.overlay, self.corners
+        best = ov.best
+        return {
+            "laps": ov.lap_count,
+            "best_lap": {"lap": int(ov.lap_numbers[best]), "time_s": round(float(ov.lap_times_s[best]), 3)},
+            "theoretical_best_s": round(float(np.nansum(np.nanmin(ct.time_s, axis=0))), 3) if ct.corners else None,
+            "corners": [
+                {
+                    "corner": c.number,
+                    "apex_m": round(c.apex_m),
+                    "best_min_speed_kph": round(float(np.nanmax(ct.min_speed_kph[:, i])), 1),
+                    "avg_loss_s": round(float(np.nanmean(ct.loss_s[:, i])), 3),
+                }
+                for i, c in enumerate(ct.corners)
+            ],
+            "time_lost": [
+                {"corner": c.number, "apex_m": round(c.apex_m), "avg_loss_s": round(s, 3)}
+                for c, s in self.time_lost()
+            ],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Loading + resampling
+# ---------------------------------------------------------------------------
+
+
+def load_laps(conn, session_id: Optional[str] = None, track_id: Optional[str] = None) -> dict[str, np.ndarray]:
+    """Telemetry rows of timed laps for a session or a track, ordered by lap and time.
+
+    Columns: session_id, lap_number, lap_time_s, ts (epoch s), lap_distance_m
+    and CHANNELS (NULL → NaN).
+    """
+    where, param = ("l.session_id = ?", session_id) if session_id is not None else ("l.track_id = ?", track_id)
+    cols = ", ".join(f"t.{c}" for c in CHANNELS)
+    result = conn.execute(
+        "SELECT t.session_id, t.lap_number, l.lap_time_s, epoch(t.timestamp) AS ts, "
+        f"t.lap_distance_m, {cols} "
+        "FROM telemetry t JOIN lap_times l "
+        "ON t.session_id = l.session_id AND t.lap_number = l.lap_number "
+        f"WHERE {where} AND t.lap_distance_m IS NOT NULL "
+        "ORDER BY t.session_id, t.lap_number, t.timestamp",
+        [param],
+    ).fetchnumpy()
+    rows = {"session_id": np.asarray(result["session_id"], dtype=object),
+            "lap_number": np.ma.filled(result["lap_number"], 0).astype(np.int64)}
+    for name in ("lap_time_s", "ts", "lap_distance_m", *CHANNELS):
+        rows[name] = np.ma.filled(np.ma.asarray(result[name], dtype=np.float64), np.nan)
+    return rows
+
+
+def resample_laps(rows: dict[str, np.ndarray], step_m: float = DEFAULT_STEP_M) -> Optional[LapOverlay]:
+    """Resample load_laps() rows onto a common distance grid (None if no full lap)."""
+    n = len(rows["lap_number"])
+    if n == 0:
+        return None
+    key_change = (rows["lap_number"][1:] != rows["lap_number"][:-1]) | (rows["session_id"][1:] != rows["session_id"][:-1])
+    starts = np.concatenate(([0], np.flatnonzero(key_change) + 1))
+    ends = np.append(starts[1:], n)
+
+    # Distance must not run backwards within a lap; each lap starts at 0 m
+    dist = rows["lap_distance_m"].copy()
+    for s, e in zip(starts, ends):
+        dist[s:e] = np.maximum.accumulate(dist[s:e])
+        dist[s] = 0.0
+    lap_dist = dist[ends - 1]
+    keep = (ends - starts >= 2) & (lap_dist >= MIN_LAP_FRACTION * np.median(lap_dist))
+    if not keep.any():
+        return None
+    starts, ends = starts[keep], ends[keep]
+    grid = np.arange(0.0, float(lap_dist[keep].min()) + 1e-9, step_m)
+
+    # Stack the kept laps on one increasing axis; drop repeated distances
+    lap_of_row = np.repeat(np.arange(len(starts)), ends - starts)
+    sel = np.concatenate([np.arange(s, e) for s, e in zip(starts, ends)])
+    xp = dist[sel] + lap_of_row * _LAP_STRIDE_M
+    elapsed = rows["ts"][sel] - rows["ts"][starts][lap_of_row]
+    fresh = np.concatenate(([True], np.diff(xp) > 0.0))
+    x = (grid[None, :] + np.arange(len(starts))[:, None] * _LAP_STRIDE_M).ravel()
+    shape = (len(starts), len(grid))
+
+    def _interp(values: np.ndarray) -> np.ndarray:
+        return np.interp(x, xp[fresh], values[fresh]).reshape(shape)
+
+    return LapOverlay(
+        distance_m=grid,
+        session_ids=rows["session_id"][starts],
+        lap_numbers=rows["lap_number"][starts],
+        lap_times_s=rows["lap_time_s"][starts],
+        elapsed_s=_interp(elapsed),
+        channels={c: _interp(rows[c][sel]) for c in CHANNELS},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Corners
+# ---------------------------------------------------------------------------
+
+
+def find_corners(distance_m: np.ndarray, speed_kph: np.ndarray,
+                 min_drop_kph: float = CORNER_DROP_KPH) -> list[Corner]:
+    """Corners from one lap's speed trace (see module docstring)."""
+    v = np.where(np.isnan(speed_kph), -np.inf, speed_kph)
+    if len(v) < 3 or not np.isfinite(v).any():
+        return []
+    # Zig-zag: alternate confirmed speed peaks and minima ≥ min_drop apart
+    apexes: list[int] = []
+    hi, lo = 0, 0
+    seeking_max = True
+    for i in range(1, len(v)):
+        if seeking_max:
+            if v[i] > v[hi]:
+                hi = i
+            elif v[hi] - v[i] >= min_drop_kph:
+                seeking_max, lo = False, i
+        else:
+            if v[i] < v[lo]:
+                lo = i
+            elif v[i] - v[lo] >= min_drop_kph:
+                apexes.append(lo)
+                seeking_max, hi = True, i
+    if not apexes:
+        return []
+    bounds = [0]
+    for a, b in zip(apexes, apexes[1:]):
+        bounds.append(a + int(np.argmax(v[a:b + 1])))
+    bounds.append(len(v) - 1)
+    return [
+        Corner(k + 1, float(distance_m[bounds[k]]), float(distance_m[a]), float(distance_m[bounds[k + 1]]))
+        for k, a in enumerate(apexes)
+    ]
+
+
+def corner_stats(overlay: LapOverlay, corners: list[Corner],
+                 brake_on_bar: float = BRAKE_ON_BAR) -> CornerTable:
+    """Min speed, braking point and time through each corner, for every lap.
+
+    The braking point is the first sample above *brake_on_bar* between
+    the corner start and the apex; laps without brake pressure there fall
+    back to where the speed starts to fall (the fastest point).
+    """
+    d = overlay.distance_m
+    speed = overlay.channels["speed_kph"]
+    brake = overlay.channels["brake_pressure"]
+    shape = (overlay.lap_count, len(corners))
+    min_speed = np.full(shape, np.nan)
+    brake_m = np.full(shape, np.nan)
+    times = np.full(shape, np.nan)
+    for k, c in enumerate(corners):
+        s, a, e = np.searchsorted(d, [c.start_m, c.apex_m, c.end_m])
+        e = min(e, len(d) - 1)
+        window = speed[:, s:e + 1]
+        valid = ~np.isnan(window).all(axis=1)
+        min_speed[valid, k] = np.nanmin(window[valid], axis=1)
+        times[:, k] = overlay.elapsed_s[:, e] - overlay.elapsed_s[:, s]
+
+        on = np.nan_to_num(brake[:, s:a + 1]) > brake_on_bar
+        braked = on.any(axis=1)
+        first = np.argmax(on, axis=1)
+        lift = np.argmax(np.where(np.isnan(speed[:, s:a + 1]), -np.inf, speed[:, s:a + 1]), axis=1)
+        brake_m[:, k] = np.where(braked, d[s + first], d[s + lift])
+        brake_m[~valid & ~braked, k] = np.nan
+    return CornerTable(corners, min_speed, brake_m, times)
+
+
+def analyze(rows: dict[str, np.ndarray], step_m: float = DEFAULT_STEP_M) -> Optional[LapAnalysis]:
+    """Overlay + corners from load_laps() rows (None if no full lap)."""
+    overlay = resample_laps(rows, step_m)
+    if overlay is None:
+        return None
+    corners = find_corners(overlay.distance_m, overlay.channels["speed_kph"][overlay.best])
+    return LapAnalysis(overlay, corner_stats(overlay, corners))
+
+
+# ---------------------------------------------------------------------------
+# Cached engine
+# ---------------------------------------------------------------------------
+
+
+class LapAnalytics:
+    """Session / track lap analysis over the KiSTI DuckDB, cached as Parquet.
+
+    Thread-safe: each query runs on its own DuckDB cursor, so sessions can
+    be analysed off the UI thread when they end.
+    """
+
+    def __init__(self, db_store, cache_dir: Optional[Path] = None, step_m: float = DEFAULT_STEP_M) -> None:
+        self._db = db_store
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(db_store._db_path).parent / "lap_analytics"
+        self.step_m = step_m
+        self.latest: Optional[LapAnalysis] = None     # Last session analysed or loaded
+        self._lock = threading.Lock()
+
+    def session(self, session_id: str, refresh: bool = False) -> Optional[LapAnalysis]:
+        """Analysis of a session's timed laps (from the Parquet cache when current)."""
+        with self._lock:
+            conn = self._db._conn.cursor()
+            try:
+                laps = conn.execute(
+                    "SELECT COUNT(*) FROM lap_times WHERE session_id = ?", [session_id]
+                ).fetchone()[0]
+                if not laps:
+                    return None
+                overlay_path, corners_path = self._cache_paths(session_id, laps)
+                analysis = None
+                if not refresh and overlay_path.exists() and corners_path.exists():
+                    analysis = _read_cache(conn, overlay_path, corners_path)
+                if analysis is None:
+                    analysis = analyze(load_laps(conn, session_id=session_id), self.step_m)
+                    if analysis is not None:
+                        self._write_cache(conn, session_id, laps, analysis)
+            finally:
+                conn.close()
+            if analysis is not None:
+                self.latest = analysis
+            return analysis
+
+    def track(self, track_id: str) -> Optional[LapAnalysis]:
+        """Analysis over every timed lap of every session at a track (not cached)."""
+        conn = self._db._conn.cursor()
+        try:
+            return analyze(load_laps(conn, track_id=track_id), self.step_m)
+        finally:
+            conn.close()
+
+    # ── Parquet cache ─────────────────────────────────────────────────
+
+    def _cache_paths(self, session_id: str, laps: int) -> tuple[Path, Path]:
+        stem = f"{session_id}.{laps}"
+        return self.cache_dir / f"{stem}.overlay.parquet", self.cache_dir / f"{stem}.corners.parquet"
+
+    def _write_cache(self, conn, session_id: str, laps: int, analysis: LapAnalysis) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.cache_dir.glob(f"{session_id}.*.parquet"):
+                stale.unlink()
+            overlay_path, corners_path = self._cache_paths(session_id, laps)
+            ov, ct = analysis.overlay, analysis.corners
+            n = len(ov.distance_m)
+            overlay = {
+                "session_id": np.repeat(ov.session_ids, n),
+                "lap_number": np.repeat(ov.lap_numbers, n),
+                "lap_time_s": np.repeat(ov.lap_times_s, n),
+                "distance_m": np.tile(ov.distance_m, ov.lap_count),
+                "elapsed_s": ov.elapsed_s.ravel(),
+                "delta_s": ov.time_delta().ravel(),
+                **{c: ov.channels[c].ravel() for c in CHANNELS},
+            }
+            copy_columns_to_parquet(conn, overlay, overlay_path)
+            c_count = len(ct.corners)
+            corners = {
+                "lap_number": np.repeat(ov.lap_numbers, c_count),
+                "corner": np.tile([c.number for c in ct.corners], ov.lap_count).astype(np.int64),
+                "start_m": np.tile([c.start_m for c in ct.corners], ov.lap_count).astype(np.float64),
+                "apex_m": np.tile([c.apex_m for c in ct.corners], ov.lap_count).astype(np.float64),
+                "end_m": np.tile([c.end_m for c in ct.corners], ov.lap_count).astype(np.float64),
+                "min_speed_kph": ct.min_speed_kph.ravel(),
+                "brake_point_m": ct.brake_point_m.ravel(),
+                "time_s": ct.time_s.ravel(),
+                "loss_s": ct.loss_s.ravel(),
+            }
+            copy_columns_to_parquet(conn, corners, corners_path)
+            log.info("Lap analytics cached: session %s, %d laps, %d corners",
+                     session_id[:8], ov.lap_count, c_count)
+        except Exception as exc:
+            log.warning("Lap analytics cache write failed: %s", exc)
+
+
+def _read_cache(conn, overlay_path: Path, corners_path: Path) -> Optional[LapAnalysis]:
+    """LapAnalysis from a session's cached Parquet pair (None if unreadable)."""
+    try:
+        o = conn.execute(
+            "SELECT * FROM read_parquet(?) ORDER BY lap_number, distance_m", [str(overlay_path)]
+        ).fetchnumpy()
+        c = conn.execute(
+            "SELECT * FROM read_parquet(?) ORDER BY lap_number, corner", [str(corners_path)]
+        ).fetchnumpy()
+    except Exception as exc:
+        log.warning("Lap analytics cache unreadable (%s) — recomputing", exc)
+        return None
+    lap_numbers, first = np.unique(o["lap_number"], return_index=True)
+    laps = len(lap_numbers)
+    n = len(o["lap_number"]) // laps
+    overlay = LapOverlay(
+        distance_m=np.asarray(o["distance_m"][:n], dtype=np.float64),
+        session_ids=np.asarray(o["session_id"], dtype=object)[first],
+        lap_numbers=lap_numbers.astype(np.int64),
+        lap_times_s=np.asarray(o["lap_time_s"], dtype=np.float64)[first],
+        elapsed_s=np.asarray(o["elapsed_s"], dtype=np.float64).reshape(laps, n),
+        channels={ch: np.asarray(o[ch], dtype=np.float64).reshape(laps, n) for ch in CHANNELS},
+    )
+    c_count = len(c["corner"]) // laps
+    shape = (laps, c_count)
+    corners = [
+        Corner(int(c["corner"][i]), float(c["start_m"][i]), float(c["apex_m"][i]), float(c["end_m"][i]))
+        for i in range(c_count)
+    ]
+
+    def _col(name: str) -> np.ndarray:
+        return np.ma.filled(np.ma.asarray(c[name], dtype=np.float64), np.nan).reshape(shape)
+
+    table = CornerTable(corners, _col("min_speed_kph"), _col("brake_point_m"), _col("time_s"))
+    return LapAnalysis(overlay, table)
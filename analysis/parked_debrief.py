@@ -34,10 +34,12 @@ class ParkedDebrief:
         db_store,
         api_key: str = "",
         model: str = DEFAULT_MODEL,
+        lap_analytics=None,
     ) -> None:
         self._db = db_store
         self._api_key = api_key
         self._model = model
+        self._laps = lap_analytics  # LapAnalytics — per-corner time loss (optional)
 
     def build_session_summary(self, session_id: str) -> dict:
         """Build a structured summary from DuckDB session data."""
@@ -142,6 +144,16 @@ class ParkedDebrief:
         if alert_stats:
             summary["alerts"] = {a[0]: a[1] for a in alert_stats}
 
+        # Lap comparison: best lap, corner min speeds, where time was lost
+        if self._laps is not None:
+            try:
+                analysis = self._laps.session(session_id)
+            except Exception as exc:
+                log.warning("Lap analytics failed: %s", exc)
+                analysis = None
+            if analysis is not None:
+                summary["laps"] = analysis.summary()
+
         return summary
 
     def generate(self, session_id: str) -> Optional[dict]:
@@ -165,7 +177,8 @@ class ParkedDebrief:
             f"{json.dumps(session_summary, indent=2, default=str)}\n\n"
             "Give me the 3 most important patterns or findings from this session. "
             "Focus on: safety concerns (ice risk, knock events, oil/coolant), "
-            "tune health (IAM, AFR, knock patterns), and surface conditions. "
+            "tune health (IAM, AFR, knock patterns), surface conditions, "
+            "and for lapping sessions the corners where the most time was lost. "
             "Be specific with numbers. Plain text, no markdown."
         )
 
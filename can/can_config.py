@@ -433,7 +433,9 @@ LED_MODE_WARMUP: int = 4
 LED_MODE_GFORCE: int = 5
 
 LED_COUNT: int = 10
-LED_OUTPUT_HZ: int = 30  # 30 Hz output rate
+LED_OUTPUT_HZ: int = 30  # 30 Hz output rate (changed frames)
+LED_KEEPALIVE_HZ: int = 5  # Unchanged LED frames resent at this rate
+KISTI_ALERT_HZ: int = 10   # 0x6C2 periodic rate (changes also sent immediately)
 
 # ---------------------------------------------------------------------------
 # Staleness / timing
@@ -18,6 +18,7 @@ import random
 import struct
 import threading
 import time
+from collections import deque
 from typing import Optional
 
 from PySide6.QtCore import QObject, QTimer
@@ -92,6 +93,7 @@ from can.can_config import (
     KEYPAD_PREV_OFFSET,
     KEYPAD_STATE_OFFSET,
     KISTI_ALERT_FRAME_ID,
+    KISTI_ALERT_HZ,
     KISTI_CAN_IDS,
     KISTI_CAN_OUTPUT_IDS,
     LED2_BRIGHTNESS_START,
@@ -100,6 +102,7 @@ from can.can_config import (
     LED2_COLOR_R_OFFSET,
     LED_BRIGHTNESS_START,
     LED_COUNT,
+    LED_KEEPALIVE_HZ,
     LED_MODE_OFFSET,
     LED_OUTPUT_FRAME_2_ID,
     LED_OUTPUT_FRAME_ID,
@@ -156,6 +159,7 @@ from can.can_config import (
     WS_RR_OFFSET,
     WS_SCALE,
 )
+from can.led_output import encode_led_output
 from can.g5_generic_dash import G5GenericDashParser
 from model.vehicle_state import DiffStateBridge, SurfaceState
 
@@ -622,25 +626,6 @@ def encode_imu_gyro_frame(gyro_x: float, gyro_y: float, gyro_z: float) -> bytes:
     return struct.pack(">hhh", raw_gx, raw_gy, raw_gz) + b"\x00\x00"
 
 
-def encode_led_output(
-    mode: int, brightnesses: list[int], color_r: int, color_g: int, color_b: int,
-) -> tuple[bytes, bytes]:
-    """Encode LED output frames (0x6C0 + 0x6C1) for the MXG Strada dash.
-
-    Args:
-        mode: LED mode (0=off, 1=waveform, 2=rpm, 3=kitt, 4=warmup)
-        brightnesses: list of 10 brightness values (0-255)
-        color_r, color_g, color_b: base color (0-255 each)
-
-    Returns:
-        Tuple of (frame_1_bytes, frame_2_bytes).
-    """
-    b = brightnesses + [0] * (LED_COUNT - len(brightnesses))  # pad to 10
-    frame1 = struct.pack(">BBBBBBB B", mode, b[0], b[1], b[2], b[3], b[4], b[5], b[6])
-    frame2 = struct.pack(">BBB BBB BB", b[7], b[8], b[9], color_r, color_g, color_b, 0, 0)
-    return frame1, frame2
-
-
 def encode_kisti_alert(
     road_condition: str,
     road_event_severity: str,
@@ -701,8 +686,16 @@ class CanListenerThread(threading.Thread):
     """Background thread that reads CAN frames and updates DiffStateBridge.
 
     Runs until stop() is called.  Handles connection errors gracefully.
+    GPS / IMU frames carry their bus receive time (python-can
+    msg.timestamp, converted to the time.monotonic() domain) into the
+    bridge, so lap timing doesn't inherit UI-thread scheduling delay.
     """
 
+    # Wall-clock → monotonic offset is re-measured this often (NTP slews)
+    CLOCK_OFFSET_REFRESH_S = 1.0
+    # Receive stamps older than this (or from the future) are not trusted
+    MAX_RX_AGE_S = 1.0
+
     def __init__(self, bridge: DiffStateBridge, interface: str = CAN_INTERFACE) -> None:
         super().__init__(daemon=True, name="kisti-can-listener")
         self._bridge = bridge
@@ -710,10 +703,28 @@ class CanListenerThread(threading.Thread):
         self._running = threading.Event()
         self._running.set()
         self._g5_parser: G5GenericDashParser = G5GenericDashParser()
+        self._clock_offset = 0.0
+        self._clock_offset_at = float("-inf")
 
     def stop(self) -> None:
         self._running.clear()
 
+    def capture_ts(self, stamp: float, now: Optional[float] = None) -> float:
+        """python-can receive timestamp (wall clock) → time.monotonic() domain.
+
+        Falls back to now when the interface gives no usable stamp.
+        """
+        now = time.monotonic() if now is None else now
+        if now - self._clock_offset_at >= self.CLOCK_OFFSET_REFRESH_S:
+            self._clock_offset = now - time.time()
+            self._clock_offset_at = now
+        if not stamp:
+            return now
+        ts = stamp + self._clock_offset
+        if ts > now + 0.005 or now - ts > self.MAX_RX_AGE_S:
+            return now
+        return min(ts, now)
+
     def run(self) -> None:
         try:
             import can as python_can  # type: ignore[import-untyped]
@@ -744,15 +755,19 @@ class CanListenerThread(threading.Thread):
                     continue
 
                 try:
-                    self._dispatch_frame(msg.arbitration_id, msg.data)
+                    self._dispatch_frame(msg.arbitration_id, msg.data,
+                                         self.capture_ts(msg.timestamp))
                 except (ValueError, struct.error) as exc:
                     log.debug("Decode error on 0x%03X: %s", msg.arbitration_id, exc)
         finally:
             bus.shutdown()
             log.info("CAN bus closed")
 
-    def _dispatch_frame(self, arb_id: int, data: bytes) -> None:
-        """Route a CAN frame to the appropriate decoder and bridge update."""
+    def _dispatch_frame(self, arb_id: int, data: bytes, ts: Optional[float] = None) -> None:
+        """Route a CAN frame to the appropriate decoder and bridge update.
+
+        ts (monotonic receive time) is passed on for the GPS / IMU frames.
+        """
         if arb_id == DIFF_FRAME_ID:
             d = decode_diff_frame(data)
             self._bridge.update_diff(**d)
@@ -815,46 +830,123 @@ class CanListenerThread(threading.Thread):
         # GPS09 Pro frames
         elif arb_id == GPS_FRAME_ID:
             d = decode_gps_frame(data)
-            self._bridge.update_gps(**d)
+            self._bridge.update_gps(**d, ts=ts)
         elif arb_id == GPS_EXT_FRAME_ID:
             d = decode_gps_ext_frame(data)
-            self._bridge.update_gps_ext(**d)
+            self._bridge.update_gps_ext(**d, ts=ts)
         elif arb_id == IMU_FRAME_ID:
             d = decode_imu_frame(data)
-            self._bridge.update_imu(**d)
+            self._bridge.update_imu(**d, ts=ts)
         elif arb_id == IMU_GYRO_FRAME_ID:
             d = decode_imu_gyro_frame(data)
-            self._bridge.update_imu_gyro(**d)
+            self._bridge.update_imu_gyro(**d, ts=ts)
 
 
 # ---------------------------------------------------------------------------
 # CAN Output Thread (LED waveform → MXG Strada dash)
 # ---------------------------------------------------------------------------
 
+class OutputStreamStats:
+    """Cadence of one CAN output stream: achieved rate and deadline jitter.
+
+    Jitter is how late each periodic send went out relative to its absolute
+    deadline. Written by the output thread; read from any thread.
+    """
+
+    JITTER_SAMPLES = 256
+
+    def __init__(self) -> None:
+        self.sent = 0          # Frames (or frame pairs) put on the bus
+        self.immediate = 0     # Sends triggered by a state change, off-schedule
+        self.suppressed = 0    # Deadlines skipped because nothing changed
+        self.missed = 0        # Deadlines overrun by a whole interval or more
+        self.errors = 0
+        self.first = 0.0
+        self.last = 0.0
+        self._jitter_ms: deque[float] = deque(maxlen=self.JITTER_SAMPLES)
+        self.jitter_max_ms = 0.0
+
+    def record(self, now: float, deadline: Optional[float]) -> None:
+        if not self.sent:
+            self.first = now
+        self.sent += 1
+        self.last = now
+        if deadline is None:
+            self.immediate += 1
+            return
+        late_ms = max(0.0, (now - deadline) * 1000.0)
+        self._jitter_ms.append(late_ms)
+        if late_ms > self.jitter_max_ms:
+            self.jitter_max_ms = late_ms
+
+    @property
+    def rate_hz(self) -> float:
+        span = self.last - self.first
+        return (self.sent - 1) / span if self.sent > 1 and span > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        jitter = sorted(self._jitter_ms)
+        return {
+            "sent": self.sent,
+            "rate_hz": round(self.rate_hz, 2),
+            "immediate": self.immediate,
+            "suppressed": self.suppressed,
+            "missed": self.missed,
+            "errors": self.errors,
+            "jitter_mean_ms": round(sum(jitter) / len(jitter), 3) if jitter else 0.0,
+            "jitter_p99_ms": round(jitter[min(len(jitter) - 1, int(0.99 * len(jitter)))], 3) if jitter else 0.0,
+            "jitter_max_ms": round(self.jitter_max_ms, 3),
+        }
+
+
 class CanOutputThread(threading.Thread):
     """Background thread that sends LED waveform frames to the MXG Strada dash.
 
-    Reads LED state from a shared buffer and sends CAN frames at LED_OUTPUT_HZ.
-    Also sends KiSTI Alert frames (0x6C2) at 10 Hz for AiM Strada Status display.
+    Sends run on an absolute deadline grid, so encode/send time never
+    accumulates as drift:
+      - LED frames (0x6C0 + 0x6C1) at LED_OUTPUT_HZ while the LED state
+        changes; an unchanged state is only resent at LED_KEEPALIVE_HZ
+      - KiSTI Alert frame (0x6C2) at KISTI_ALERT_HZ for the AiM Strada Status
+        display, plus immediately whenever the encoded status changes
+
+    LED state is held as encoded frame data: set_led_frame() takes an
+    LEDFrame's precomputed payload, so table-driven animations cost no
+    encoding. The three python-can Messages are built once and their data
+    updated in place. The thread sleeps on an Event until the next deadline, so
+    set_alert_state() and stop() wake it at once. Achieved rate and jitter
+    per stream are available from stats().
     """
 
-    def __init__(self, interface: str = CAN_INTERFACE) -> None:
+    def __init__(
+        self,
+        interface: str = CAN_INTERFACE,
+        led_hz: float = LED_OUTPUT_HZ,
+        keepalive_hz: float = LED_KEEPALIVE_HZ,
+        alert_hz: float = KISTI_ALERT_HZ,
+    ) -> None:
         super().__init__(daemon=True, name="kisti-can-output")
         self._interface = interface
         self._running = threading.Event()
         self._running.set()
+        self._wake = threading.Event()
         self._lock = threading.Lock()
-        self._mode: int = 0
-        self._brightnesses: list[int] = [0] * LED_COUNT
-        self._color: tuple[int, int, int] = (0, 0, 0)
-        # Alert state
-        self._road_condition: str = ""
-        self._road_event_severity: str = ""
-        self._ec_warning_level: str = "none"
-        self._weather_threat_level: str = "CLEAR"
+        self._led_state: tuple[bytes, bytes] = encode_led_output(0, [], 0, 0, 0)  # 0x6C0, 0x6C1 data
+        self._led_changed = True      # First frame always goes out
+        self._alert_status = encode_kisti_alert("", "", "none", "CLEAR")
+        self._alert_changed = False
+        self._led_interval = 1.0 / led_hz
+        self._keepalive_interval = 1.0 / keepalive_hz
+        self._alert_interval = 1.0 / alert_hz
+        self._next_led = 0.0
+        self._next_alert = 0.0
+        self._led_keepalive_at = 0.0
+        self._messages: Optional[tuple] = None    # (led1, led2, alert) preallocated
+        self.led_stats = OutputStreamStats()
+        self.alert_stats = OutputStreamStats()
 
     def stop(self) -> None:
         self._running.clear()
+        self._wake.set()
 
     def set_leds(
         self,
@@ -865,12 +957,20 @@ class CanOutputThread(threading.Thread):
         color_b: int = 0,
     ) -> None:
         """Update LED state (thread-safe). Called from voice/mode managers."""
+        self.set_led_payload(*encode_led_output(mode, brightnesses[:LED_COUNT],
+                                                color_r, color_g, color_b))
+
+    def set_led_frame(self, frame) -> None:
+        """Update LED state from an LEDFrame, using its precomputed payload."""
+        self.set_led_payload(*frame.encoded())
+
+    def set_led_payload(self, frame1: bytes, frame2: bytes) -> None:
+        """Update LED state from encoded 0x6C0 / 0x6C1 data (thread-safe)."""
+        state = (frame1, frame2)
         with self._lock:
-            self._mode = mode
-            self._brightnesses = list(brightnesses[:LED_COUNT])
-            while len(self._brightnesses) < LED_COUNT:
-                self._brightnesses.append(0)
-            self._color = (color_r, color_g, color_b)
+            if state != self._led_state:
+                self._led_state = state
+                self._led_changed = True
 
     def set_alert_state(
         self,
@@ -879,12 +979,30 @@ class CanOutputThread(threading.Thread):
         ec_warning_level: str = "none",
         weather_threat_level: str = "CLEAR",
     ) -> None:
-        """Update alert state for AiM Strada (thread-safe)."""
+        """Update alert state for AiM Strada (thread-safe); a new status is sent at once."""
+        status = encode_kisti_alert(road_condition, road_event_severity,
+                                    ec_warning_level, weather_threat_level)
         with self._lock:
-            self._road_condition = road_condition
-            self._road_event_severity = road_event_severity
-            self._ec_warning_level = ec_warning_level
-            self._weather_threat_level = weather_threat_level
+            if status == self._alert_status:
+                return
+            self._alert_status = status
+            self._alert_changed = True
+        self._wake.set()
+
+    def stats(self) -> dict:
+        """Achieved rate / jitter per output stream."""
+        return {"led": self.led_stats.as_dict(), "alert": self.alert_stats.as_dict()}
+
+    def summary(self) -> str:
+        parts = []
+        for name, st in (("LED", self.led_stats), ("alert", self.alert_stats)):
+            d = st.as_dict()
+            parts.append(
+                f"{name} {d['rate_hz']:.1f} Hz ({d['sent']} sent, {d['suppressed']} suppressed, "
+                f"{d['immediate']} immediate), jitter {d['jitter_mean_ms']:.2f}ms mean / "
+                f"{d['jitter_max_ms']:.1f}ms max"
+            )
+        return "; ".join(parts)
 
     def run(self) -> None:
         try:
@@ -905,53 +1023,89 @@ class CanOutputThread(threading.Thread):
             log.warning("Failed to open CAN output bus: %s", exc)
             return
 
-        interval = 1.0 / LED_OUTPUT_HZ
-        alert_interval = 1.0 / 10.0  # Alert at 10 Hz
-        alert_phase = 0  # Send alert every 3rd LED cycle (30/10 = 3 cycles)
         try:
-            while self._running.is_set():
-                with self._lock:
-                    mode = self._mode
-                    brights = list(self._brightnesses)
-                    r, g, b = self._color
-                    road_condition = self._road_condition
-                    road_severity = self._road_event_severity
-                    ec_warning = self._ec_warning_level
-                    weather_threat = self._weather_threat_level
-
-                frame1, frame2 = encode_led_output(mode, brights, r, g, b)
-
-                try:
-                    msg1 = python_can.Message(
-                        arbitration_id=LED_OUTPUT_FRAME_ID,
-                        data=frame1,
-                        is_extended_id=False,
-                    )
-                    msg2 = python_can.Message(
-                        arbitration_id=LED_OUTPUT_FRAME_2_ID,
-                        data=frame2,
-                        is_extended_id=False,
-                    )
-                    bus.send(msg1)
-                    bus.send(msg2)
-
-                    # Send alert frame at 10 Hz (LED is 30 Hz)
-                    alert_phase = (alert_phase + 1) % 3
-                    if alert_phase == 0:
-                        alert_data = encode_kisti_alert(road_condition, road_severity, ec_warning, weather_threat)
-                        msg_alert = python_can.Message(
-                            arbitration_id=KISTI_ALERT_FRAME_ID,
-                            data=alert_data,
-                            is_extended_id=False,
-                        )
-                        bus.send(msg_alert)
-                except Exception as exc:
-                    log.debug("CAN output send error: %s", exc)
-
-                time.sleep(interval)
+            self._run_loop(bus, python_can.Message)
         finally:
             bus.shutdown()
-            log.info("CAN output bus closed")
+            log.info("CAN output bus closed — %s", self.summary())
+
+    def _run_loop(self, bus, message_cls) -> None:
+        """Deadline loop: send what is due, sleep until the next deadline or a wake."""
+        self.prepare(message_cls, time.monotonic())
+        while self._running.is_set():
+            self._wake.clear()
+            wake_at = self.step(bus, time.monotonic())
+            self._wake.wait(max(0.0, wake_at - time.monotonic()))
+
+    def prepare(self, message_cls, now: float) -> None:
+        """Build the output messages once and anchor the deadline grid at now."""
+        self._messages = tuple(
+            message_cls(arbitration_id=frame_id, data=bytearray(size), is_extended_id=False)
+            for frame_id, size in (
+                (LED_OUTPUT_FRAME_ID, 8), (LED_OUTPUT_FRAME_2_ID, 8), (KISTI_ALERT_FRAME_ID, 1),
+            )
+        )
+        self._next_led = now
+        self._next_alert = now
+        self._led_keepalive_at = now
+
+    def step(self, bus, now: float) -> float:
+        """Send every frame due at `now`; returns the next deadline."""
+        with self._lock:
+            led_changed, self._led_changed = self._led_changed, False
+            led1, led2 = self._led_state
+            alert_changed, self._alert_changed = self._alert_changed, False
+            status = self._alert_status
+        msg1, msg2, msg_alert = self._messages
+
+        if now >= self._next_led:
+            deadline = self._next_led
+            self._next_led = self._advance(deadline, self._led_interval, now, self.led_stats)
+            if led_changed or now >= self._led_keepalive_at:
+                msg1.data[:] = led1
+                msg2.data[:] = led2
+                if self._send(bus, self.led_stats, msg1, msg2):
+                    self.led_stats.record(now, deadline)
+                self._led_keepalive_at = now + self._keepalive_interval
+            else:
+                self.led_stats.suppressed += 1
+        elif led_changed:
+            with self._lock:          # Not due yet: keep it for the next LED deadline
+                self._led_changed = True
+
+        if alert_changed or now >= self._next_alert:
+            deadline = None if alert_changed else self._next_alert
+            if alert_changed:        # Restart the periodic grid after an immediate send
+                self._next_alert = now + self._alert_interval
+            else:
+                self._next_alert = self._advance(self._next_alert, self._alert_interval, now,
+                                                 self.alert_stats)
+            msg_alert.data[0] = status[0]
+            if self._send(bus, self.alert_stats, msg_alert):
+                self.alert_stats.record(now, deadline)
+
+        return min(self._next_led, self._next_alert)
+
+    @staticmethod
+    def _advance(deadline: float, interval: float, now: float, stats: OutputStreamStats) -> float:
+        """Next grid point after now; whole intervals overrun are counted, not replayed."""
+        nxt = deadline + interval
+        if nxt <= now:
+            missed = int((now - deadline) / interval)
+            stats.missed += missed
+            nxt = deadline + (missed + 1) * interval
+        return nxt
+
+    @staticmethod
+    def _send(bus, stats: OutputStreamStats, *messages) -> bool:
+        try:
+            for msg in messages:
+                bus.send(msg)
+            return True
+        except Exception as exc:
+            stats.errors += 1
+            log.debug("CAN output send error: %s", exc)
+            return False
 
 
 # ---------------------------------------------------------------------------
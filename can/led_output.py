@@ -0,0 +1,46 @@
+"""KiSTI — LED output frame encoding (0x6C0 / 0x6C1)
+
+Pure Python — no Qt.  Packs the MXG Strada shift-light state (mode, 10
+brightnesses, base color) into its two 8-byte CAN frames.  Shared by the
+CAN output thread (can/kisti_can.py) and the LED animation tables
+(voice/led_waveform.py), which must stay importable without PySide6.
+"""
+
+from __future__ import annotations
+
+import struct
+
+from can.can_config import LED_COUNT
+
+
+def encode_led_output(
+    mode: int, brightnesses: list[int], color_r: int, color_g: int, color_b: int,
+) -> tuple[bytes, bytes]:
+    """Encode LED output frames (0x6C0 + 0x6C1) for the MXG Strada dash.
+
+    Args:
+        mode: LED mode (0=off, 1=waveform, 2=rpm, 3=kitt, 4=warmup)
+        brightnesses: list of 10 brightness values (0-255)
+        color_r, color_g, color_b: base color (0-255 each)
+
+    Returns:
+        Tuple of (frame_1_bytes, frame_2_bytes).
+    """
+    frame1, frame2 = bytearray(8), bytearray(8)
+    encode_led_output_into(frame1, frame2, mode, brightnesses, color_r, color_g, color_b)
+    return bytes(frame1), bytes(frame2)
+
+
+_LED_FRAME = struct.Struct(">8B")
+
+
+def encode_led_output_into(
+    frame1: bytearray, frame2: bytearray,
+    mode: int, brightnesses, color_r: int, color_g: int, color_b: int,
+) -> None:
+    """encode_led_output() into existing 8-byte buffers (no allocation)."""
+    b = brightnesses
+    if len(b) < LED_COUNT:
+        b = list(b) + [0] * (LED_COUNT - len(b))  # pad to 10
+    _LED_FRAME.pack_into(frame1, 0, mode, b[0], b[1], b[2], b[3], b[4], b[5], b[6])
+    _LED_FRAME.pack_into(frame2, 0, b[7], b[8], b[9], color_r, color_g, color_b, 0, 0)
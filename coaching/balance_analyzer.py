@@ -8,7 +8,9 @@ computed from steering angle and vehicle speed using the single-track
   ratio > 1.03  →  oversteer  (rear stepping out)
   0.97..1.03    →  neutral
 
-Pure Python — no Qt, no numpy. 1Hz feed from coaching timer.
+Pure Python — no Qt, no numpy. Fed timestamped samples (~50 Hz); the
+rolling mean over the last _WINDOW_S seconds is kept incrementally,
+O(1) per sample.
 """
 
 from __future__ import annotations
@@ -17,6 +19,7 @@ import math
 from collections import deque
 from typing import Optional
 
+from coaching.streaming_stats import TIME_EPS_S, RunningStats, SampleClock
 from model.vehicle_state import DiffState
 
 # 2014 Subaru WRX STI (GR chassis)
@@ -66,32 +69,43 @@ def classify_balance(ratio: float) -> str:
 
 
 class BalanceAnalyzer:
-    """Rolling-window balance analysis from 1Hz DiffState snapshots.
+    """Rolling-window balance analysis from DiffState snapshots.
 
-    Uses a 5-sample rolling average to detect sustained balance trends,
+    Uses a 5-second rolling average to detect sustained balance trends,
     not instantaneous events (the driver's feel is faster for those).
     """
 
-    _WINDOW = 5
+    _WINDOW_S = 5.0
 
-    def __init__(self) -> None:
-        self._ratios: deque[float] = deque(maxlen=self._WINDOW)
+    def __init__(self, sample_hz: float = 1.0) -> None:
+        self._clock = SampleClock(sample_hz)
+        self._ratios: deque[tuple[float, float, float]] = deque()   # (ts, dt, ratio)
+        self._span_s = 0.0
+        self._stats = RunningStats()
 
-    def feed(self, snap: DiffState) -> None:
-        """Accept a 1Hz DiffState snapshot."""
+    def feed(self, snap: DiffState, ts: Optional[float] = None) -> None:
+        """Accept one DiffState snapshot taken at *ts* (seconds, monotonic)."""
+        ts, dt = self._clock.tick(ts)
         speed = snap.gps_speed_mps
         if speed < SPEED_GATE_MPS:
-            self._ratios.append(1.0)
-            return
-        exp = expected_yaw_rate(speed, snap.steering_angle)
-        ratio = balance_ratio(snap.imu_gyro_z, exp)
-        self._ratios.append(ratio)
+            ratio = 1.0
+        else:
+            exp = expected_yaw_rate(speed, snap.steering_angle)
+            ratio = balance_ratio(snap.imu_gyro_z, exp)
+        self._ratios.append((ts, dt, ratio))
+        self._stats.add(ratio)
+        self._span_s += dt
+        cutoff = ts - self._WINDOW_S + TIME_EPS_S
+        while self._ratios[0][0] <= cutoff:
+            _, old_dt, old = self._ratios.popleft()
+            self._stats.remove(old)
+            self._span_s -= old_dt
 
     def current_ratio(self) -> float:
         """Mean of rolling window. Default 1.0 (neutral)."""
         if not self._ratios:
             return 1.0
-        return sum(self._ratios) / len(self._ratios)
+        return self._stats.mean
 
     def current_classification(self) -> str:
         """Classify current rolling-average balance."""
@@ -103,7 +117,7 @@ class BalanceAnalyzer:
         Only produces text for sustained (full window) non-neutral states.
         Returns ('', 'dim') when neutral or insufficient data.
         """
-        if len(self._ratios) < self._WINDOW:
+        if self._span_s < self._WINDOW_S - TIME_EPS_S:
             return ("", "dim")
         ratio = self.current_ratio()
         cls = classify_balance(ratio)
@@ -7,13 +7,16 @@ percentages that can be displayed alongside the DCCD lock indicator.
   slip_ratio = |wheel_speed - gps_speed| / gps_speed
   grip_pct   = 1.0 - max(left_slip, right_slip)
 
-Pure Python — no Qt, no numpy. 1Hz feed from coaching timer.
+Pure Python — no Qt, no numpy. Fed timestamped samples (~50 Hz);
+per-axle grip is EWMA-smoothed over GRIP_TAU_S seconds of sample time
+so single-sample wheel speed noise doesn't flash the indicator.
 """
 
 from __future__ import annotations
 
 from typing import Optional
 
+from coaching.streaming_stats import Ewma, SampleClock
 from model.vehicle_state import DiffState
 
 # Speed gate: slip ratio unreliable below this (divide-by-near-zero)
@@ -23,6 +26,9 @@ SPEED_GATE_MPS = 10.0 / 3.6  # 10 km/h
 SLIP_ADVISORY = 0.10   # 10% slip
 SLIP_WARNING = 0.20    # 20% slip
 
+# Grip smoothing time constant (seconds)
+GRIP_TAU_S = 0.3
+
 
 def wheel_slip_ratio(wheel_speed_kph: float, gps_speed_mps: float) -> float:
     """Compute slip ratio for a single wheel.
@@ -60,21 +66,27 @@ def axle_grip_pct(
 
 
 class GripAnalyzer:
-    """Per-axle grip analysis from 1Hz DiffState snapshots."""
+    """Per-axle grip analysis from DiffState snapshots."""
 
-    def __init__(self) -> None:
+    def __init__(self, sample_hz: float = 1.0) -> None:
+        self._clock = SampleClock(sample_hz)
+        self._front_ewma = Ewma(GRIP_TAU_S, sample_hz)
+        self._rear_ewma = Ewma(GRIP_TAU_S, sample_hz)
         self._front: float = 1.0
         self._rear: float = 1.0
 
-    def feed(self, snap: DiffState) -> None:
-        """Accept a 1Hz DiffState snapshot."""
-        self._front, self._rear = axle_grip_pct(
+    def feed(self, snap: DiffState, ts: Optional[float] = None) -> None:
+        """Accept one DiffState snapshot taken at *ts* (seconds, monotonic)."""
+        _, dt = self._clock.tick(ts)
+        front, rear = axle_grip_pct(
             snap.wheel_speed_fl,
             snap.wheel_speed_fr,
             snap.wheel_speed_rl,
             snap.wheel_speed_rr,
             snap.gps_speed_mps,
         )
+        self._front = self._front_ewma.update(front, dt)
+        self._rear = self._rear_ewma.update(rear, dt)
 
     def front_grip_pct(self) -> float:
         """Front axle grip (0.0-1.0)."""
@@ -0,0 +1,333 @@
+"""Lap-level brake and corner event extraction — native sample rate.
+
+Pure Python — no Qt, no numpy.  Consumes the live 50 Hz stream (or
+telemetry replayed from DuckDB) and segments each timed lap into:
+
+  - braking zones: front/rear brake pressure above BRAKE_ON_BAR until it
+    falls below BRAKE_OFF_BAR (hysteresis)
+  - corners: steering angle or lateral g above their turn-in thresholds
+    until both are back below their exit thresholds
+
+Per event: entry / minimum / exit speed, peak decel (−imu_accel_x), peak
+lateral g, peak pressure, trail-brake overlap (seconds braking while
+cornering) and, for braking zones, the release rate (bar/s from peak
+pressure to release).  Distances are lap distances; ``apex_m`` is where
+peak decel (brake) or minimum speed (corner) occurred.
+
+Repeat visits are matched by apex distance: a DistanceIndex per event
+kind keeps sorted reference distances, so each event finds its
+``corner_id`` with one bisect — O(log n) — and a new place on track gets
+the next id.  Seed the indexes from earlier sessions with
+set_references() to keep ids stable across sessions at a track.
+
+Usage:
+    extractor = LapEventExtractor()
+    extractor.feed_state(snap, time.monotonic())      # every sample
+    store.record_lap_events(session_id, track_id, extractor.drain())
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from coaching.streaming_stats import ONSET, RELEASE, Hysteresis
+
+# Braking zone: pressure (bar, max of front/rear) on / off
+BRAKE_ON_BAR = 5.0
+BRAKE_OFF_BAR = 2.0
+
+# Corner: steering angle (deg) or lateral g on / off
+STEER_ON_DEG = 20.0
+STEER_OFF_DEG = 10.0
+LAT_G_ON = 0.4
+LAT_G_OFF = 0.25
+
+# Shorter events are pedal taps / lane corrections
+MIN_EVENT_S = 0.2
+
+# Repeat visits whose apexes lie within this distance are the same place
+MATCH_TOLERANCE_M = 50.0
+
+# Sample gaps longer than this (logger pause) don't count toward durations,
+# release spans or trail overlap
+_MAX_DT_S = 1.0
+
+KINDS = ("brake", "corner")
+
+
+@dataclass
+class LapEvent:
+    """A braking zone or corner on one lap."""
+    kind: str                       # "brake" | "corner"
+    lap_number: int
+    start_m: float
+    apex_m: float                   # brake: peak decel; corner: minimum speed
+    end_m: float
+    start_ts: float
+    duration_s: float
+    entry_speed_kph: float
+    min_speed_kph: float
+    exit_speed_kph: float
+    peak_decel_g: float
+    peak_lateral_g: float
+    peak_pressure_bar: float
+    trail_overlap_s: float          # Braking and cornering at the same time
+    release_rate_bar_s: float       # Brake: peak → release pressure drop rate (0 for corners)
+    corner_id: int = 0              # Same id = same place on track (per kind)
+
+
+class _Open:
+    """Accumulator for an event in progress."""
+
+    __slots__ = ("kind", "lap", "start_m", "start_ts", "entry_speed", "min_speed", "min_speed_m",
+                 "peak_decel", "peak_decel_m", "peak_lat", "peak_p", "release_s", "trail_s",
+                 "elapsed_s", "last_m", "last_ts", "last_speed", "last_p")
+
+    def __init__(self, kind: str, lap: int, ts: float, dist: float, speed: float) -> None:
+        self.kind = kind
+        self.lap = lap
+        self.start_m = dist
+        self.start_ts = ts
+        self.entry_speed = speed
+        self.min_speed = speed
+        self.min_speed_m = dist
+        self.peak_decel = 0.0
+        self.peak_decel_m = dist
+        self.peak_lat = 0.0
+        self.peak_p = 0.0
+        self.release_s = 0.0            # Since the last sample at peak pressure
+        self.trail_s = 0.0
+        self.elapsed_s = 0.0
+        self.last_m = dist
+        self.last_ts = ts
+        self.last_speed = speed
+        self.last_p = 0.0
+
+    def update(self, ts: float, dist: float, speed: float, pressure: float,
+               decel: float, lat: float, dt: float) -> None:
+        if ts != self.last_ts:              # Not the opening sample: dt is inside the event
+            self.elapsed_s += dt
+            self.release_s += dt
+        if speed < self.min_speed:
+            self.min_speed, self.min_speed_m = speed, dist
+        if decel > self.peak_decel:
+            self.peak_decel, self.peak_decel_m = decel, dist
+        if lat > self.peak_lat:
+            self.peak_lat = lat
+        if pressure >= self.peak_p:         # Last sample at peak: release starts there
+            self.peak_p, self.release_s = pressure, 0.0
+        self.last_m, self.last_ts, self.last_speed, self.last_p = dist, ts, speed, pressure
+
+    def close(self) -> LapEvent:
+        brake = self.kind == "brake"
+        release_s = self.release_s
+        return LapEvent(
+            kind=self.kind,
+            lap_number=self.lap,
+            start_m=self.start_m,
+            apex_m=self.peak_decel_m if brake else self.min_speed_m,
+            end_m=self.last_m,
+            start_ts=self.start_ts,
+            duration_s=self.elapsed_s,
+            entry_speed_kph=self.entry_speed,
+            min_speed_kph=self.min_speed,
+            exit_speed_kph=self.last_speed,
+            peak_decel_g=self.peak_decel,
+            peak_lateral_g=self.peak_lat,
+            peak_pressure_bar=self.peak_p,
+            trail_overlap_s=self.trail_s,
+            release_rate_bar_s=(self.peak_p - self.last_p) / release_s if brake and release_s > 0 else 0.0,
+        )
+
+
+class DistanceIndex:
+    """Reference lap distances → ids, nearest match by bisect (O(log n)).
+
+    With *lap_length_m* the match wraps around start/finish, and distances
+    past one lap (missed S/F crossing, a line longer than the official
+    length) are taken modulo the lap length.
+    """
+
+    def __init__(self, tolerance_m: float = MATCH_TOLERANCE_M, lap_length_m: float = 0.0) -> None:
+        self.tolerance_m = tolerance_m
+        self.lap_length_m = lap_length_m
+        self._dist: list[float] = []
+        self._ids: list[int] = []
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self._dist)
+
+    def _wrap(self, distance_m: float) -> float:
+        return distance_m % self.lap_length_m if self.lap_length_m > 0 else distance_m
+
+    def add(self, distance_m: float, ref_id: int) -> None:
+        """Insert a known reference (e.g. from an earlier session)."""
+        distance_m = self._wrap(distance_m)
+        i = bisect_left(self._dist, distance_m)
+        self._dist.insert(i, distance_m)
+        self._ids.insert(i, ref_id)
+        self._next_id = max(self._next_id, ref_id + 1)
+
+    def find(self, distance_m: float) -> Optional[int]:
+        """Id of the nearest reference within tolerance, else None."""
+        if not self._dist:
+            return None
+        distance_m = self._wrap(distance_m)
+        i = bisect_left(self._dist, distance_m)
+        candidates = {i - 1, min(i, len(self._dist) - 1)}
+        if self.lap_length_m > 0:
+            candidates |= {0, len(self._dist) - 1}      # Across start/finish
+        best_id, best_gap = None, self.tolerance_m
+        for j in candidates:
+            if j < 0:
+                continue
+            gap = abs(self._dist[j] - distance_m)
+            if self.lap_length_m > 0:
+                gap %= self.lap_length_m
+                gap = min(gap, self.lap_length_m - gap)
+            if gap <= best_gap:
+                best_id, best_gap = self._ids[j], gap
+        return best_id
+
+    def match(self, distance_m: float) -> int:
+        """Id of the matching reference, registering a new one if none is close."""
+        ref_id = self.find(distance_m)
+        if ref_id is None:
+            ref_id = self._next_id
+            self.add(distance_m, ref_id)
+        return ref_id
+
+
+class LapEventExtractor:
+    """Streams samples into per-lap braking zone and corner events.
+
+    Samples before the first timed lap (lap_number < 1) are ignored; a
+    lap change closes any event still open.
+    """
+
+    def __init__(self, tolerance_m: float = MATCH_TOLERANCE_M, lap_length_m: float = 0.0) -> None:
+        self._tolerance_m = tolerance_m
+        self._lap_length_m = lap_length_m
+        self.indexes = {kind: DistanceIndex(tolerance_m, lap_length_m) for kind in KINDS}
+        self._brake = Hysteresis(BRAKE_ON_BAR, BRAKE_OFF_BAR)
+        self._steer = Hysteresis(STEER_ON_DEG, STEER_OFF_DEG)
+        self._lat = Hysteresis(LAT_G_ON, LAT_G_OFF)
+        self._open: dict[str, Optional[_Open]] = {kind: None for kind in KINDS}
+        self._lap = 0
+        self._prev_ts: Optional[float] = None
+        self._done: list[LapEvent] = []
+
+    def set_references(self, references: Iterable[tuple[str, int, float]],
+                       lap_length_m: float = 0.0) -> None:
+        """Reset matching to known (kind, corner_id, apex_m) references for a track."""
+        self._lap_length_m = lap_length_m or self._lap_length_m
+        self.indexes = {kind: DistanceIndex(self._tolerance_m, self._lap_length_m) for kind in KINDS}
+        for kind, ref_id, apex_m in references:
+            if kind in self.indexes:
+                self.indexes[kind].add(apex_m, ref_id)
+
+    def feed(
+        self,
+        ts: float,
+        lap_number: int,
+        distance_m: float,
+        speed_kph: float,
+        brake_front: float,
+        brake_rear: float,
+        accel_x: float,
+        accel_y: float,
+        steering_deg: float,
+    ) -> None:
+        """Consume one sample (ts in seconds, any monotonic origin)."""
+        dt = 0.0 if self._prev_ts is None else ts - self._prev_ts
+        self._prev_ts = ts
+        if not 0.0 < dt <= _MAX_DT_S:
+            dt = 0.0
+
+        if lap_number != self._lap:
+            self.finish()
+            self._lap = lap_number
+        if lap_number < 1:
+            return
+
+        pressure = max(brake_front, brake_rear)
+        brake_edge = self._brake.update(pressure)
+        was_cornering = self._steer.active or self._lat.active
+        self._steer.update(abs(steering_deg))
+        self._lat.update(abs(accel_y))
+        cornering = self._steer.active or self._lat.active
+
+        if brake_edge == ONSET:
+            self._open["brake"] = _Open("brake", lap_number, ts, distance_m, speed_kph)
+        if cornering and not was_cornering:
+            self._open["corner"] = _Open("corner", lap_number, ts, distance_m, speed_kph)
+
+        decel = max(0.0, -accel_x)
+        lat = abs(accel_y)
+        trail = self._brake.active and cornering
+        for ev in self._open.values():
+            if ev is not None:
+                ev.update(ts, distance_m, speed_kph, pressure, decel, lat, dt)
+                if trail:
+                    ev.trail_s += dt
+
+        if brake_edge == RELEASE:
+            self._close("brake")
+        if was_cornering and not cornering:
+            self._close("corner")
+
+    def feed_state(self, snap, ts: float) -> None:
+        """Consume one DiffState snapshot."""
+        self.feed(
+            ts, snap.lap_count, snap.lap_distance_m, snap.speed_kph,
+            max(snap.brake_pressure_front, snap.brake_pressure),
+            snap.brake_pressure_rear,
+            snap.imu_accel_x, snap.imu_accel_y, snap.steering_angle,
+        )
+
+    def finish(self) -> None:
+        """Close any open events (lap change / end of stream)."""
+        for kind in KINDS:
+            self._close(kind)
+
+    def drain(self) -> list[LapEvent]:
+        """Completed events since the last drain, matched to corner ids.
+
+        Matching happens here rather than at close, so events completed
+        before the track was known still match references seeded since.
+        """
+        done, self._done = self._done, []
+        for event in done:
+            event.corner_id = self.indexes[event.kind].match(event.apex_m)
+        return done
+
+    def _close(self, kind: str) -> None:
+        ev = self._open[kind]
+        self._open[kind] = None
+        if ev is None:
+            return
+        event = ev.close()
+        if event.duration_s >= MIN_EVENT_S:
+            self._done.append(event)
+
+
+def events_from_telemetry(conn, session_id: str, references: Iterable[tuple[str, int, float]] = (),
+                          lap_length_m: float = 0.0) -> list[LapEvent]:
+    """Replay a session's recorded telemetry through a LapEventExtractor."""
+    extractor = LapEventExtractor(lap_length_m=lap_length_m)
+    extractor.set_references(references)
+    rows = conn.execute(
+        "SELECT epoch(timestamp), COALESCE(lap_number, 0), COALESCE(lap_distance_m, 0), "
+        "COALESCE(speed_kph, 0), GREATEST(COALESCE(brake_pressure_front, 0), COALESCE(brake_pressure, 0)), "
+        "COALESCE(brake_pressure_rear, 0), COALESCE(imu_accel_x, 0), COALESCE(imu_accel_y, 0), "
+        "COALESCE(steering_angle, 0) "
+        "FROM telemetry WHERE session_id = ? ORDER BY timestamp",
+        [session_id],
+    ).fetchall()
+    for row in rows:
+        extractor.feed(*row)
+    extractor.finish()
+    return extractor.drain()
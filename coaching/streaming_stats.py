@@ -0,0 +1,194 @@
+"""Streaming statistics for coaching analyzers — O(1) per sample.
+
+Pure Python — no Qt, no numpy.  Lets the analyzers sample telemetry at
+~50 Hz instead of 1 Hz snapshots, without rescanning their windows on
+each call:
+
+  - RunningStats: Welford mean / variance with removal, so a rolling
+    window (or a filtered subset of one, e.g. braking samples only) is
+    maintained by adding the new sample and removing the expired one
+  - Ewma: exponentially weighted moving average with a time constant
+  - WindowExtremum: sliding-window max (or min) over a monotonic deque,
+    amortised O(1) push / expire
+  - Hysteresis: on/off event detector (brake onset/release, turn-in /
+    unwind) that ignores chatter around a single threshold
+  - SampleClock: per-sample timestamp and interval
+
+Windows are defined in seconds and expired by sample timestamp, not by
+sample count: the bridge emits once per decoded frame (several hundred
+per second, bursty), so a count-sized window would not span the seconds
+it claims.  Analyzers are fed timestamps (time.monotonic()); without one
+a sample is stamped one nominal 1 / sample_hz after the previous.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Optional
+
+# Rate the analyzers sample DiffStateBridge at (main.py coaching timer)
+NATIVE_SAMPLE_HZ = 50.0
+
+# Hysteresis.update() results
+ONSET = 1
+RELEASE = -1
+
+# Longest interval one sample is weighted for (feed paused / car parked)
+MAX_SAMPLE_GAP_S = 0.5
+
+# Slack for "window holds N seconds" comparisons of summed intervals
+TIME_EPS_S = 1e-6
+
+
+class RunningStats:
+    """Welford running mean / population variance, with sample removal."""
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+
+    def remove(self, x: float) -> None:
+        """Remove a value previously added (rolling windows)."""
+        if self.count <= 1:
+            self.clear()
+            return
+        delta = x - self.mean
+        self.count -= 1
+        self.mean -= delta / self.count
+        self._m2 = max(0.0, self._m2 - delta * (x - self.mean))
+
+    def clear(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 below two samples)."""
+        return self._m2 / self.count if self.count >= 2 else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(self.variance)
+
+
+class Ewma:
+    """Exponentially weighted moving average with time constant *tau_s*.
+
+    The first sample seeds the average, so a single update reports it
+    exactly (no warm-up from zero).  update() takes the sample interval
+    *dt*; without it the nominal 1 / sample_hz is assumed.
+    """
+
+    __slots__ = ("_tau_s", "_alpha", "value")
+
+    def __init__(self, tau_s: float, sample_hz: float = NATIVE_SAMPLE_HZ) -> None:
+        self._tau_s = tau_s
+        self._alpha = self._alpha_for(1.0 / sample_hz)
+        self.value: Optional[float] = None
+
+    def _alpha_for(self, dt: float) -> float:
+        return 1.0 - math.exp(-dt / self._tau_s) if self._tau_s > 0 else 1.0
+
+    def update(self, x: float, dt: Optional[float] = None) -> float:
+        if self.value is None:
+            self.value = x
+        else:
+            alpha = self._alpha if dt is None else self._alpha_for(dt)
+            self.value += alpha * (x - self.value)
+        return self.value
+
+
+class WindowExtremum:
+    """Sliding-window maximum (or minimum) over a monotonic deque.
+
+    Values are pushed with a sequence number or timestamp; expire(seq)
+    drops entries older than *seq*.  Each entry is pushed and popped
+    once, so a push / expire pair is amortised O(1).
+    """
+
+    __slots__ = ("_q", "_sign")
+
+    def __init__(self, maximum: bool = True) -> None:
+        self._q: deque[tuple[float, float]] = deque()
+        self._sign = 1.0 if maximum else -1.0
+
+    def push(self, seq: float, x: float) -> None:
+        key = self._sign * x
+        q = self._q
+        while q and self._sign * q[-1][1] <= key:
+            q.pop()
+        q.append((seq, x))
+
+    def expire(self, oldest_seq: float) -> None:
+        """Drop entries with sequence number below *oldest_seq*."""
+        q = self._q
+        while q and q[0][0] < oldest_seq:
+            q.popleft()
+
+    def clear(self) -> None:
+        self._q.clear()
+
+    @property
+    def value(self) -> Optional[float]:
+        """Current window extremum (None if empty)."""
+        return self._q[0][1] if self._q else None
+
+
+class Hysteresis:
+    """On/off detector: onset at >= *on*, release at < *off* (off <= on)."""
+
+    __slots__ = ("on", "off", "active")
+
+    def __init__(self, on: float, off: float) -> None:
+        self.on = on
+        self.off = off
+        self.active = False
+
+    def update(self, x: float) -> int:
+        """ONSET / RELEASE on a transition, else 0."""
+        if self.active:
+            if x < self.off:
+                self.active = False
+                return RELEASE
+        elif x >= self.on:
+            self.active = True
+            return ONSET
+        return 0
+
+
+class SampleClock:
+    """Timestamp and interval of each sample fed to an analyzer.
+
+    tick(ts) returns (ts, dt): *dt* is the time since the previous sample,
+    capped at MAX_SAMPLE_GAP_S or one nominal interval, whichever is
+    longer (the first sample covers one nominal interval).  With ts None
+    the sample is stamped one nominal interval after the previous one,
+    so callers without a clock get sample_hz.
+    """
+
+    __slots__ = ("nominal_dt", "ts", "_max_dt")
+
+    def __init__(self, sample_hz: float = NATIVE_SAMPLE_HZ) -> None:
+        self.nominal_dt = 1.0 / sample_hz
+        self.ts: Optional[float] = None
+        self._max_dt = max(MAX_SAMPLE_GAP_S, self.nominal_dt)
+
+    def tick(self, ts: Optional[float] = None) -> tuple[float, float]:
+        prev = self.ts
+        if ts is None:
+            ts = 0.0 if prev is None else prev + self.nominal_dt
+        dt = self.nominal_dt if prev is None else min(max(ts - prev, 0.0), self._max_dt)
+        self.ts = ts
+        return ts, dt
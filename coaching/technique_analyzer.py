@@ -1,69 +1,190 @@
-"""Driving technique analyzer — 1Hz sample rate, 30s rolling window.
+"""Driving technique analyzer — native sample rate, 10s rolling window.
 
-Pure Python (no Qt). Receives DiffState snapshots, computes technique
-metrics, returns a single coaching string + sentiment color.
+Pure Python (no Qt). Receives timestamped DiffState snapshots (~50 Hz),
+computes technique metrics, returns a single coaching string + sentiment
+color (read at 1Hz).
 
 Metrics:
   - Brake consistency: std dev of brake pressure during braking events
   - Steering smoothness: std dev of steering rate (jerk proxy)
-  - Trail braking quality: % of braking samples with simultaneous steering
+  - Trail braking quality: % of corner entries (turn-in) made while still
+    braking, or of braking samples with simultaneous steering
+
+Every window statistic is maintained incrementally (streaming_stats):
+feed() adds the new sample and removes the ones leaving the window, so
+each sample costs O(1) and analyze() / brake_quality() never rescan.
+Windows, minimum amounts of data and the steering rate are all in
+seconds of sample time (SampleClock), so the verdicts don't depend on
+how often the analyzer is fed.  Without timestamps, samples are spaced
+1 / sample_hz (at the default 1 Hz, one sample = one second).
 """
 
 from __future__ import annotations
 
-import math
 from collections import deque
 from dataclasses import dataclass
 from typing import Optional
 
+from coaching.streaming_stats import (
+    ONSET, TIME_EPS_S, Hysteresis, RunningStats, SampleClock, WindowExtremum,
+)
 from model.vehicle_state import DiffState
 
 
 @dataclass
 class _Sample:
+    ts: float
+    dt: float                    # seconds this sample covers
     speed_kph: float
     brake_pressure: float
     steering_angle: float
-    steering_rate: float
+    steering_rate: float         # deg/s
     lateral_g: float
     throttle_pct: float
     longitudinal_g: float = 0.0  # imu_accel_x (negative = braking)
     brake_front: float = 0.0     # front axle pressure (bar)
     brake_rear: float = 0.0      # rear axle pressure (bar)
     brake_bias_pct: float = 0.0  # front % (0-100)
+    braking: bool = False
+    cornering: bool = False
 
 
 # Thresholds
 _BRAKE_ACTIVE = 5.0       # bar — minimum to count as braking
-_STEER_ACTIVE = 20.0      # deg — minimum to count as cornering
+_BRAKE_RELEASE = 2.0      # bar — brake event ends below this
+_STEER_ACTIVE = 20.0      # deg — minimum to count as cornering (turn-in)
+_STEER_RELEASE = 10.0     # deg — corner exit (unwound) below this
 _TRAIL_STEER = 30.0       # deg — steering threshold for trail braking
-_MIN_SAMPLES = 5          # need at least this many for analysis
-_WINDOW = 10              # 10s at 1Hz — real-time feedback, not forensics
+_MIN_SAMPLES_S = 5.0      # need at least this much data for analysis
+_WINDOW_S = 10.0          # real-time feedback, not forensics
+_FADE_SPAN_S = 4.0        # fade compares braking this far apart
+_MIN_TURN_INS = 3         # corner entries before the entry-based trail metric
+_STEER_RATE_S = 0.1       # steering rate is measured over at least this span,
+                          # so frame arrival jitter doesn't alias into it
 
 
 class TechniqueAnalyzer:
     """Analyze driving technique from a rolling window of telemetry."""
 
-    def __init__(self) -> None:
-        self._samples: deque[_Sample] = deque(maxlen=_WINDOW)
-        self._prev_steering: float = 0.0
-
-    def feed(self, snap: DiffState) -> None:
-        """Accept a 1Hz DiffState snapshot."""
-        steering_rate = snap.steering_angle - self._prev_steering
-        self._samples.append(_Sample(
+    def __init__(self, sample_hz: float = 1.0) -> None:
+        self._clock = SampleClock(sample_hz)
+        self._samples: deque[_Sample] = deque()
+        self._span_s = 0.0                      # seconds covered by the window
+        self._steer_hist: deque[tuple[float, float]] = deque()   # (ts, angle)
+
+        # Braking samples in the window
+        self._brake_p = RunningStats()          # pressure
+        self._brake_g = RunningStats()          # |longitudinal g|
+        self._brake_g_max = WindowExtremum()
+        self._brake_bias = RunningStats()       # bias, samples with bias > 0
+        self._brake_s = 0.0                     # seconds braking
+        self._bias_s = 0.0                      # seconds with a bias reading
+        self._brake_trail_s = 0.0               # with steering or combined g
+        self._brake_fast = 0                    # above 60 km/h
+        self._brake_dual = 0                    # front sensor reporting
+        self._fade: deque[tuple[float, float, float]] = deque()   # (ts, total pressure, g)
+
+        # Cornering samples in the window
+        self._steer_rate = RunningStats()
+        self._corner_s = 0.0
+
+        # Events: brake onset/release, turn-in → (ts, braking at turn-in)
+        self._brake_event = Hysteresis(_BRAKE_ACTIVE, _BRAKE_RELEASE)
+        self._turn_event = Hysteresis(_STEER_ACTIVE, _STEER_RELEASE)
+        self._turn_ins: deque[tuple[float, bool]] = deque()
+
+    def feed(self, snap: DiffState, ts: Optional[float] = None) -> None:
+        """Accept one DiffState snapshot taken at *ts* (seconds, monotonic)."""
+        ts, dt = self._clock.tick(ts)
+        s = _Sample(
+            ts=ts,
+            dt=dt,
             speed_kph=snap.speed_kph,
             brake_pressure=snap.brake_pressure,
             steering_angle=snap.steering_angle,
-            steering_rate=steering_rate,
+            steering_rate=self._steering_rate(ts, snap.steering_angle),
             lateral_g=snap.imu_accel_y,
             throttle_pct=snap.throttle_pct,
             longitudinal_g=snap.imu_accel_x,
             brake_front=snap.brake_pressure_front,
             brake_rear=snap.brake_pressure_rear,
             brake_bias_pct=snap.brake_bias_pct,
-        ))
-        self._prev_steering = snap.steering_angle
+            braking=snap.brake_pressure > _BRAKE_ACTIVE,
+            cornering=abs(snap.steering_angle) > _STEER_ACTIVE,
+        )
+
+        self._brake_event.update(s.brake_pressure)
+        if self._turn_event.update(abs(s.steering_angle)) == ONSET:
+            self._turn_ins.append((ts, self._brake_event.active))
+
+        self._samples.append(s)
+        self._account(s, +1)
+        cutoff = ts - _WINDOW_S + TIME_EPS_S
+        while self._samples[0].ts <= cutoff:
+            self._account(self._samples.popleft(), -1)
+        oldest = self._samples[0].ts
+        self._brake_g_max.expire(oldest)
+        while self._turn_ins and self._turn_ins[0][0] < oldest:
+            self._turn_ins.popleft()
+        while self._fade and self._fade[0][0] < oldest:
+            self._fade.popleft()
+
+    def _steering_rate(self, ts: float, angle: float) -> float:
+        """deg/s against the newest sample at least _STEER_RATE_S old."""
+        hist = self._steer_hist
+        hist.append((ts, angle))
+        while len(hist) > 1 and hist[1][0] <= ts - _STEER_RATE_S + TIME_EPS_S:
+            hist.popleft()
+        t0, a0 = hist[0]
+        return (angle - a0) / (ts - t0) if ts > t0 else 0.0
+
+    def _account(self, s: _Sample, sign: int) -> None:
+        """Add (+1) or remove (-1) a sample's contribution to the window stats."""
+        dt = sign * s.dt
+        self._span_s += dt
+        if s.braking:
+            g = abs(s.longitudinal_g)
+            self._brake_s += dt
+            if sign > 0:
+                self._brake_p.add(s.brake_pressure)
+                self._brake_g.add(g)
+                self._brake_g_max.push(s.ts, g)
+                if s.brake_bias_pct > 0:
+                    self._brake_bias.add(s.brake_bias_pct)
+                self._fade.append((s.ts, s.brake_front + s.brake_rear, g))
+                # Keep one entry at least _FADE_SPAN_S older than the newest
+                while len(self._fade) > 1 and self._fade[1][0] <= s.ts - _FADE_SPAN_S + TIME_EPS_S:
+                    self._fade.popleft()
+            else:
+                self._brake_p.remove(s.brake_pressure)
+                self._brake_g.remove(g)
+                if s.brake_bias_pct > 0:
+                    self._brake_bias.remove(s.brake_bias_pct)
+            if s.brake_bias_pct > 0:
+                self._bias_s += dt
+            if (abs(s.steering_angle) > _TRAIL_STEER
+                    or (s.longitudinal_g < -0.3 and abs(s.lateral_g) > 0.3)):
+                self._brake_trail_s += dt
+            if s.speed_kph > 60:
+                self._brake_fast += sign
+            if s.brake_front > 0:
+                self._brake_dual += sign
+        if s.cornering:
+            self._corner_s += dt
+            if sign > 0:
+                self._steer_rate.add(s.steering_rate)
+            else:
+                self._steer_rate.remove(s.steering_rate)
+
+    @property
+    def peak_brake_g(self) -> float:
+        """Peak braking deceleration (g) in the window, 0.0 if none."""
+        return self._brake_g_max.value or 0.0
+
+    @staticmethod
+    def _has(covered_s: float, seconds: float) -> bool:
+        """True once *covered_s* of window time reaches *seconds*."""
+        return covered_s >= seconds - TIME_EPS_S
 
     def analyze(self) -> tuple[str, str]:
         """Return (coaching_text, sentiment) from the rolling window.
@@ -71,16 +192,16 @@ class TechniqueAnalyzer:
         sentiment: 'green' | 'amber' | 'dim'
         Returns ('', 'dim') if insufficient data.
         """
-        if len(self._samples) < _MIN_SAMPLES:
+        if not self._has(self._span_s, _MIN_SAMPLES_S):
             return ("", "dim")
 
         issues: list[tuple[int, str, str]] = []  # (priority, text, sentiment)
+        braking_s = self._brake_s
+        cornering_s = self._corner_s
 
         # --- Brake consistency ---
-        braking = [s for s in self._samples if s.brake_pressure > _BRAKE_ACTIVE]
-        if len(braking) >= 3:
-            pressures = [s.brake_pressure for s in braking]
-            std = _std_dev(pressures)
+        if self._has(braking_s, 3):
+            std = self._brake_p.std
             if std > 12:
                 issues.append((0, "Inconsistent brake pressure", "amber"))
             elif std > 8:
@@ -89,10 +210,8 @@ class TechniqueAnalyzer:
                 issues.append((10, "Smooth braking", "green"))
 
         # --- Steering smoothness ---
-        cornering = [s for s in self._samples if abs(s.steering_angle) > _STEER_ACTIVE]
-        if len(cornering) >= 3:
-            rates = [s.steering_rate for s in cornering]
-            std = _std_dev(rates)
+        if self._has(cornering_s, 3):
+            std = self._steer_rate.std
             if std > 30:
                 issues.append((0, "Abrupt steering corrections", "amber"))
             elif std > 20:
@@ -100,37 +219,33 @@ class TechniqueAnalyzer:
             elif std <= 12:
                 issues.append((10, "Smooth steering", "green"))
 
-        # --- Trail braking (enhanced: steering angle OR G-based) ---
-        if len(braking) >= 5:
-            trail_count = sum(
-                1 for s in braking
-                if abs(s.steering_angle) > _TRAIL_STEER
-                or (s.longitudinal_g < -0.3 and abs(s.lateral_g) > 0.3)
-            )
-            trail_ratio = trail_count / len(braking)
+        # --- Trail braking: corner entries still on the brakes, else
+        #     braking samples with steering angle OR combined G ---
+        trail_ratio = None
+        if len(self._turn_ins) >= _MIN_TURN_INS:
+            trail_ratio = sum(braked for _, braked in self._turn_ins) / len(self._turn_ins)
+        elif self._has(braking_s, 5):
+            trail_ratio = self._brake_trail_s / braking_s
+        if trail_ratio is not None:
             if trail_ratio > 0.3:
                 issues.append((10, "Good trail braking", "green"))
-            elif trail_ratio < 0.1 and len(cornering) >= 3:
+            elif trail_ratio < 0.1 and self._has(cornering_s, 3):
                 issues.append((3, "Try trail braking at corner entry", "dim"))
 
         # --- Brake G quality (longitudinal G during braking) ---
         # Only analyze if IMU is reporting actual braking G (> 0.1g)
-        if len(braking) >= 3:
-            brake_gs = [abs(s.longitudinal_g) for s in braking]
-            peak_g = max(brake_gs)
+        if self._has(braking_s, 3):
+            peak_g = self._brake_g_max.value or 0.0
             if peak_g > 0.1:
-                g_std = _std_dev(brake_gs)
-                if peak_g > 0.8 and g_std < 0.15:
+                if peak_g > 0.8 and self._brake_g.std < 0.15:
                     issues.append((10, "Strong consistent braking", "green"))
-                elif peak_g < 0.5 and any(s.speed_kph > 60 for s in braking):
+                elif peak_g < 0.5 and self._brake_fast:
                     issues.append((2, "Brake harder — more grip available", "amber"))
 
         # --- Brake bias consistency (front/rear sensors) ---
-        bias_samples = [s for s in braking if s.brake_bias_pct > 0]
-        if len(bias_samples) >= 3:
-            biases = [s.brake_bias_pct for s in bias_samples]
-            bias_std = _std_dev(biases)
-            avg_bias = sum(biases) / len(biases)
+        if self._has(self._bias_s, 3):
+            bias_std = self._brake_bias.std
+            avg_bias = self._brake_bias.mean
             if bias_std > 8:
                 issues.append((1, "Erratic brake bias — check pedal feel", "amber"))
             elif avg_bias < 55:
@@ -138,17 +253,13 @@ class TechniqueAnalyzer:
             elif bias_std <= 3 and 60 <= avg_bias <= 70:
                 issues.append((10, f"Brake bias steady F{avg_bias:.0f}/R{100-avg_bias:.0f}", "green"))
 
-        # --- Brake fade detection (pressure up, decel G down) ---
-        if len(braking) >= 5:
-            has_front_rear = any(s.brake_front > 0 for s in braking)
-            if has_front_rear:
-                recent = list(braking)[-5:]
-                pressures_trend = [s.brake_front + s.brake_rear for s in recent]
-                gs_trend = [abs(s.longitudinal_g) for s in recent]
-                if (pressures_trend[-1] > pressures_trend[0] * 1.2
-                        and gs_trend[-1] < gs_trend[0] * 0.7
-                        and gs_trend[0] > 0.3):
-                    issues.append((0, "Possible brake fade — pressure up, decel down", "amber"))
+        # --- Brake fade detection (pressure up, decel G down over _FADE_SPAN_S) ---
+        if (self._has(braking_s, 5) and self._brake_dual and self._fade
+                and self._has(self._fade[-1][0] - self._fade[0][0], _FADE_SPAN_S)):
+            _, p_first, g_first = self._fade[0]
+            _, p_last, g_last = self._fade[-1]
+            if p_last > p_first * 1.2 and g_last < g_first * 0.7 and g_first > 0.3:
+                issues.append((0, "Possible brake fade — pressure up, decel down", "amber"))
 
         if not issues:
             return ("", "dim")
@@ -164,41 +275,26 @@ class TechniqueAnalyzer:
         Based on rolling window peak G and consistency — same quality applied
         to all sectors (per-sector tracking requires AiM sector boundary events).
         """
-        braking = [s for s in self._samples if s.brake_pressure > _BRAKE_ACTIVE]
-        if len(braking) < 3:
+        if not self._has(self._brake_s, 3):
             return "yellow"  # insufficient data — neutral
 
-        brake_gs = [abs(s.longitudinal_g) for s in braking]
-        peak_g = max(brake_gs)
+        peak_g = self._brake_g_max.value or 0.0
         if peak_g <= 0.1:
             return "yellow"  # IMU not reporting — neutral
 
-        g_std = _std_dev(brake_gs)
-        pressures = [s.brake_pressure for s in braking]
-        p_std = _std_dev(pressures)
+        g_std = self._brake_g.std
+        p_std = self._brake_p.std
 
         # Bias consistency (if dual sensors available)
-        bias_samples = [s for s in braking if s.brake_bias_pct > 0]
         bias_penalty = False
-        if len(bias_samples) >= 3:
-            bias_std = _std_dev([s.brake_bias_pct for s in bias_samples])
-            avg_bias = sum(s.brake_bias_pct for s in bias_samples) / len(bias_samples)
-            if bias_std > 8 or avg_bias < 55:
+        if self._has(self._bias_s, 3):
+            if self._brake_bias.std > 8 or self._brake_bias.mean < 55:
                 bias_penalty = True
 
         if peak_g > 0.8 and g_std < 0.15 and p_std < 8 and not bias_penalty:
             return "green"
-        if peak_g < 0.5 and any(s.speed_kph > 60 for s in braking):
+        if peak_g < 0.5 and self._brake_fast:
             return "red"
         if p_std > 12 or bias_penalty:
             return "red"
         return "yellow"
-
-
-def _std_dev(values: list[float]) -> float:
-    """Population standard deviation."""
-    if len(values) < 2:
-        return 0.0
-    mean = sum(values) / len(values)
-    variance = sum((v - mean) ** 2 for v in values) / len(values)
-    return math.sqrt(variance)
@@ -10,6 +10,7 @@ Schema from JK's Master Architecture Plan v1.0.
 from __future__ import annotations
 
 import logging
+import math
 import time
 import uuid
 from datetime import datetime, timezone
@@ -227,6 +228,57 @@ CREATE TABLE IF NOT EXISTS lap_times (
     timestamp TIMESTAMP
 );
 
+-- Race analysis: best equal-distance micro-sector times per track
+CREATE TABLE IF NOT EXISTS track_mini_sectors (
+    track_id TEXT PRIMARY KEY,
+    segment_length_m DOUBLE,
+    best_times JSON,
+    optimal_lap_s DOUBLE,
+    updated_at TIMESTAMP
+);
+
+-- Race analysis: braking zones + corners per lap, keyed by lap distance
+-- (corner_id = same place on track across laps/sessions, per kind)
+CREATE TABLE IF NOT EXISTS lap_events (
+    event_id TEXT PRIMARY KEY,
+    session_id TEXT,
+    track_id TEXT,
+    lap_number INTEGER,
+    kind TEXT,
+    corner_id INTEGER,
+    start_m DOUBLE,
+    apex_m DOUBLE,
+    end_m DOUBLE,
+    duration_s DOUBLE,
+    entry_speed_kph DOUBLE,
+    min_speed_kph DOUBLE,
+    exit_speed_kph DOUBLE,
+    peak_decel_g DOUBLE,
+    peak_lateral_g DOUBLE,
+    peak_pressure_bar DOUBLE,
+    trail_overlap_s DOUBLE,
+    release_rate_bar_s DOUBLE,
+    timestamp TIMESTAMP
+);
+
+-- Race analysis: normalized track outlines + precomputed RDP levels of detail
+CREATE TABLE IF NOT EXISTS track_outlines (
+    track_id TEXT PRIMARY KEY,
+    points JSON,
+    lods JSON,
+    updated_at TIMESTAMP
+);
+
+-- Race analysis: bulk track import manifest (unchanged source files are skipped)
+CREATE TABLE IF NOT EXISTS track_import_manifest (
+    path TEXT PRIMARY KEY,
+    size_bytes BIGINT,
+    mtime_ns BIGINT,
+    content_hash TEXT,
+    track_id TEXT,
+    imported_at TIMESTAMP
+);
+
 -- Data collection: FLIR thermal readings at 3Hz
 CREATE TABLE IF NOT EXISTS flir_readings (
     timestamp TIMESTAMP,
@@ -285,6 +337,20 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def sql_literal(value: Any) -> str:
+    """Quote *value* (e.g. a file path) as a SQL string literal — for COPY, which takes no parameters."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def copy_columns_to_parquet(conn, columns: dict, path: Path) -> None:
+    """Write equal-length numpy columns (name → array) to a Parquet file with DuckDB COPY."""
+    conn.register("_parquet_columns", columns)
+    try:
+        conn.execute(f"COPY (SELECT * FROM _parquet_columns) TO {sql_literal(path)} (FORMAT PARQUET)")
+    finally:
+        conn.unregister("_parquet_columns")
+
+
 class DuckDBStore:
     """Local DuckDB session store for KiSTI.
 
@@ -620,7 +686,7 @@ class DuckDBStore:
         output_dir.mkdir(parents=True, exist_ok=True)
         files = []
 
-        for table in ["telemetry", "thermal_state", "events", "alerts", "lap_times",
+        for table in ["telemetry", "thermal_state", "events", "alerts", "lap_times", "lap_events",
                       "flir_readings", "surface_transitions", "knock_events", "patterns"]:
             # Check if there's data to export
             count = self._conn.execute(
@@ -636,7 +702,7 @@ class DuckDBStore:
             # DuckDB COPY doesn't support prepared params — use validated literal
             self._conn.execute(
                 f"COPY (SELECT * FROM {table} WHERE session_id = '{session_id}') "
-                f"TO '{path}' (FORMAT PARQUET)"
+                f"TO {sql_literal(path)} (FORMAT PARQUET)"
             )
             files.append(path)
             log.debug("Exported %s (%d rows) → %s", table, count, path)
@@ -674,7 +740,7 @@ class DuckDBStore:
         for sid in sids:
             for table in ["telemetry", "thermal_state", "events", "alerts", "segments",
                           "summaries", "flir_readings", "surface_transitions",
-                          "knock_events", "patterns"]:
+                          "knock_events", "patterns", "lap_events"]:
                 self._conn.execute(f"DELETE FROM {table} WHERE session_id = ?", [sid])
             self._conn.execute("DELETE FROM sessions WHERE session_id = ?", [sid])
 
@@ -696,14 +762,14 @@ class DuckDBStore:
         path = output_dir / "ambient_conditions.parquet"
         self._conn.execute(
             f"COPY (SELECT * FROM ambient_conditions ORDER BY timestamp) "
-            f"TO '{path}' (FORMAT PARQUET)"
+            f"TO {sql_literal(path)} (FORMAT PARQUET)"
         )
 
         # Also export CSV for easy viewing
         csv_path = output_dir / "ambient_conditions.csv"
         self._conn.execute(
             f"COPY (SELECT * FROM ambient_conditions ORDER BY timestamp) "
-            f"TO '{csv_path}' (FORMAT CSV, HEADER TRUE)"
+            f"TO {sql_literal(csv_path)} (FORMAT CSV, HEADER TRUE)"
         )
 
         # Summary JSON
@@ -745,7 +811,7 @@ class DuckDBStore:
         stats = {}
         for table in ["sessions", "telemetry", "thermal_state", "events", "alerts",
                        "segments", "summaries", "ambient_conditions", "service_events",
-                       "voice_latency", "tracks", "lap_times",
+                       "voice_latency", "tracks", "lap_times", "lap_events",
                        "flir_readings", "surface_transitions", "knock_events", "patterns"]:
             count = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
             stats[table] = count
@@ -891,6 +957,94 @@ class DuckDBStore:
             laps.append(lap)
         return laps
 
+    def record_lap_events(self, session_id: str, track_id: Optional[str], events: list) -> int:
+        """Store LapEvents (coaching/lap_events.py) for a session. Returns rows written."""
+        if not events:
+            return 0
+        now = _now()
+        self._conn.executemany(
+            "INSERT INTO lap_events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                [_new_id(), session_id, track_id, e.lap_number, e.kind, e.corner_id,
+                 e.start_m, e.apex_m, e.end_m, e.duration_s,
+                 e.entry_speed_kph, e.min_speed_kph, e.exit_speed_kph,
+                 e.peak_decel_g, e.peak_lateral_g, e.peak_pressure_bar,
+                 e.trail_overlap_s, e.release_rate_bar_s, now]
+                for e in events
+            ],
+        )
+        return len(events)
+
+    def get_lap_events(
+        self,
+        session_id: Optional[str] = None,
+        track_id: Optional[str] = None,
+        kind: Optional[str] = None,
+        corner_id: Optional[int] = None,
+    ) -> list[dict]:
+        """Lap events filtered by session / track / kind / corner, in lap + distance order."""
+        where, params = [], []
+        for col, val in (("session_id", session_id), ("track_id", track_id),
+                         ("kind", kind), ("corner_id", corner_id)):
+            if val is not None:
+                where.append(f"{col} = ?")
+                params.append(val)
+        sql = "SELECT * FROM lap_events"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        rows = self._conn.execute(sql + " ORDER BY session_id, lap_number, start_m", params).fetchall()
+        cols = [d[0] for d in self._conn.description]
+        return [dict(zip(cols, row)) for row in rows]
+
+    def get_lap_event_references(self, track_id: str, lap_length_m: float = 0.0) -> list[tuple[str, int, float]]:
+        """(kind, corner_id, mean apex_m) per place on a track — seeds distance matching.
+
+        With *lap_length_m* the mean is circular, so apexes either side of
+        start/finish (5 m and 1995 m on a 2 km lap) average to ~0 m, not mid-lap.
+        """
+        if lap_length_m <= 0:
+            return self._conn.execute(
+                "SELECT kind, corner_id, AVG(apex_m) FROM lap_events WHERE track_id = ? "
+                "GROUP BY kind, corner_id ORDER BY kind, corner_id",
+                [track_id],
+            ).fetchall()
+        rows = self._conn.execute(
+            "SELECT kind, corner_id, AVG(sin(2 * pi() * apex_m / ?)), AVG(cos(2 * pi() * apex_m / ?)) "
+            "FROM lap_events WHERE track_id = ? GROUP BY kind, corner_id ORDER BY kind, corner_id",
+            [lap_length_m, lap_length_m, track_id],
+        ).fetchall()
+        return [
+            (kind, corner_id, (math.atan2(s, c) / (2 * math.pi) * lap_length_m) % lap_length_m)
+            for kind, corner_id, s, c in rows
+        ]
+
+    def save_mini_sectors(
+        self,
+        track_id: str,
+        segment_length_m: float,
+        best_times: list[Optional[float]],
+        optimal_lap_s: Optional[float] = None,
+    ) -> None:
+        """Store a track's best micro-sector times (replaces the previous row)."""
+        import json
+        self._conn.execute(
+            "INSERT OR REPLACE INTO track_mini_sectors VALUES (?, ?, ?, ?, ?)",
+            [track_id, segment_length_m, json.dumps(best_times), optimal_lap_s, _now()],
+        )
+
+    def get_mini_sectors(self, track_id: str) -> Optional[dict]:
+        """Best micro-sector times for a track, or None if never recorded."""
+        import json
+        row = self._conn.execute(
+            "SELECT segment_length_m, best_times, optimal_lap_s "
+            "FROM track_mini_sectors WHERE track_id = ?",
+            [track_id],
+        ).fetchone()
+        if row is None:
+            return None
+        best = json.loads(row[1]) if isinstance(row[1], str) else row[1]
+        return {"segment_length_m": row[0], "best_times": best, "optimal_lap_s": row[2]}
+
     def get_service_history_context(self, max_events: int = 5) -> str:
         """Build service history string for LLM context."""
         events = self.get_service_events(limit=max_events)
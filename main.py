@@ -67,6 +67,8 @@ def main():
                         help="ALSA capture device for mic (default: 'default')")
     parser.add_argument("--headless", action="store_true",
                         help="Headless voice mode — no display, pure voice chat")
+    parser.add_argument("--fps", type=int, default=None, choices=(30, 60),
+                        help="UI render clock rate (default: KISTI_UI_FPS or 30)")
     args = parser.parse_args()
 
     # .demo-mode flag file: toggle demo without editing session script
@@ -150,6 +152,21 @@ def main():
         from ui.main_window import MainWindow
         app = QApplication(sys.argv)
 
+    # Main-thread timing (UI only): event-loop lag + per-subsystem slot,
+    # timer and paint cost, shown by the SETTINGS / F12 overlay
+    loop_monitor = None
+    if not args.headless:
+        from ui.loop_monitor import LoopMonitor
+        from ui.render_clock import frame_interval_ms, resolve_fps
+        _primary = app.primaryScreen()
+        loop_monitor = LoopMonitor(frame_interval_ms(
+            resolve_fps(args.fps), _primary.refreshRate() if _primary else None,
+        ))
+
+    def _timed(name, fn):
+        """fn timed by the loop monitor under `name` (fn itself when headless)."""
+        return loop_monitor.wrap(name, fn) if loop_monitor else fn
+
     # Wire signal handlers now that QApplication exists
     signal.signal(signal.SIGTERM, lambda *_: app.quit())
     signal.signal(signal.SIGINT, lambda *_: app.quit())
@@ -388,7 +405,7 @@ def main():
                             log.info("K2: push-to-talk ended (passthrough disabled)")
 
             bridge.keypad_pressed.connect(_on_keypad_pressed)
-            bridge.state_changed.connect(_check_keypad_release)
+            bridge.state_changed.connect(_timed("voice.ptt", _check_keypad_release))
 
             log.info("Voice pipeline enabled")
 
@@ -586,15 +603,11 @@ def main():
         # LED output to AiM MXG Strada shift lights via CAN
         can_output = CanOutputThread()
         can_output.start()
-        log.info("CAN LED output started (30 Hz → 0x6C0/0x6C1)")
+        log.info("CAN LED output started (30 Hz on change, 5 Hz keep-alive → 0x6C0/0x6C1; alert 0x6C2)")
 
         # Wire voice LED frames to CAN output
         if voice_mgr:
-            voice_mgr.led_frame_ready.connect(
-                lambda f: can_output.set_leds(
-                    f.mode, f.brightnesses, f.color_r, f.color_g, f.color_b
-                )
-            )
+            voice_mgr.led_frame_ready.connect(can_output.set_led_frame)
     else:
         log.info("No CAN hardware — ECU features disabled")
 
@@ -655,6 +668,7 @@ def main():
     _prev_knock_count = [0]  # track knock count changes
     pattern_eng = None
     parked_debrief = None
+    lap_analytics = None
     _pending_debrief = [None]  # debrief text from bg thread → UI coaching bar
 
     if db_store:
@@ -662,10 +676,19 @@ def main():
         from analysis.pattern_engine import PatternEngine
         pattern_eng = PatternEngine(db_store, lambda: session_id)
 
+        # Lap comparison: distance-aligned overlays + corners, Parquet-cached
+        from analysis.lap_analytics import LapAnalytics
+        lap_analytics = LapAnalytics(db_store)
+        if voice_mgr:
+            voice_mgr.set_lap_analytics(lap_analytics)
+
         # Parked debrief: Haiku session analysis (WiFi-gated)
         from analysis.parked_debrief import ParkedDebrief
         _anthropic_key = os.environ.get("ANTHROPIC_API_KEY_KISTI") or os.environ.get("ANTHROPIC_API_KEY", "")
-        parked_debrief = ParkedDebrief(db_store, _anthropic_key) if _anthropic_key else None
+        parked_debrief = (
+            ParkedDebrief(db_store, _anthropic_key, lap_analytics=lap_analytics)
+            if _anthropic_key else None
+        )
 
         def _on_state_changed():
             telemetry_tick[0] += 1
@@ -794,12 +817,16 @@ def main():
                 if pattern_eng:
                     pattern_eng.stop()
                 db_store.end_session(session_id)
-                # Trigger Haiku debrief in background if WiFi available
-                if parked_debrief:
+                # Lap analytics, then Haiku debrief if WiFi available (background)
+                if lap_analytics or parked_debrief:
                     import threading as _debrief_threading
                     _debrief_sid = session_id
                     def _run_debrief(sid=_debrief_sid):
                         try:
+                            if lap_analytics:
+                                lap_analytics.session(sid)
+                            if not parked_debrief:
+                                return
                             from sync.sync_manager import SyncManager
                             if SyncManager._check_connectivity():
                                 result = parked_debrief.generate(sid)
@@ -830,7 +857,7 @@ def main():
                 log.info("Session ended: %s", session_id[:8])
                 session_id = None
 
-        bridge.state_changed.connect(_on_state_changed)
+        bridge.state_changed.connect(_timed("telemetry", _on_state_changed))
         bridge.surface_state_changed.connect(_on_surface_state_changed)
         mode_mgr.session_toggle.connect(_on_session_toggle)
 
@@ -876,32 +903,41 @@ def main():
 
     # --- UI vs Headless ---
     window = None
+    render_clock = None
     if not args.headless:
         window = MainWindow(
             fullscreen=args.fullscreen,
             bridge=bridge,
             mode_manager=mode_mgr,
             flir_reader=flir_reader,
+            loop_monitor=loop_monitor,
         )
 
-        # Feed DiffState snapshots to the active screen at 20Hz
-        _ui_tick = [0]
+        # Render clock: CAN frames only mark the UI dirty; the active screen
+        # gets one snapshot per tick at a fixed 30/60 fps (KISTI_UI_FPS)
+        from ui.render_clock import RenderClock
+        _screen = app.primaryScreen()
+        render_clock = RenderClock(
+            bridge.snapshot,
+            fps=args.fps,
+            refresh_hz=_screen.refreshRate() if _screen else None,
+        )
+        _last_timing_feed = [0.0]
 
-        def _update_screen():
-            _ui_tick[0] += 1
-            snap = bridge.snapshot()
-            window.update_from_bridge(snap)
+        def _update_screen(snap, now):
+            window.update_from_bridge(snap, now)
             # Also feed timing display at 4Hz
-            if timing_mgr and _ui_tick[0] % 5 == 0:
+            if timing_mgr and now - _last_timing_feed[0] >= 0.25:
+                _last_timing_feed[0] = now
                 if hasattr(window, '_track_mode'):
                     window._track_mode.update_timing(snap)
-                # Feed timing data to both Sport Sharp screen variants
+                # Timing data for the Sport Sharp screens (only the visible one is fed)
                 if hasattr(timing_mgr, 'get_timing_data'):
-                    td = timing_mgr.get_timing_data()
-                    window._sharp_screen.update_timing(td)
-                    window._sharp_screen_track.update_timing(td)
+                    window.push_to_screens("update_timing", timing_mgr.get_timing_data())
 
-        bridge.state_changed.connect(_update_screen)
+        bridge.state_changed.connect(_timed("render.dirty", render_clock.mark_dirty))
+        render_clock.frame.connect(_timed("render.frame", _update_screen))
+        render_clock.start()
 
         # Visual flash overlay for WARNING/CRITICAL alerts in S# mode
         alert_eng.alert_fired.connect(window.flash_alert)
@@ -926,24 +962,45 @@ def main():
         _ticker_timer.setInterval(1000)
 
         def _push_ticker():
-            lines = list(_voice_ticker_deque)
-            for screen in (window._intelligent_screen, window._sport_screen,
-                           window._sharp_screen, window._sharp_screen_track):
-                screen.update_voice_ticker(lines)
+            window.push_to_screens("update_voice_ticker", list(_voice_ticker_deque))
 
         _ticker_timer.timeout.connect(_push_ticker)
         _ticker_timer.start()
 
-        # --- Coaching analyzers (Sport + Sharp screen at 1Hz) ---
+        # --- Coaching analyzers (sampled at 50Hz, Sport + Sharp screen text at 1Hz) ---
         from coaching.technique_analyzer import TechniqueAnalyzer
         from coaching.balance_analyzer import BalanceAnalyzer
         from coaching.grip_analyzer import GripAnalyzer
         from coaching.condition_rules import evaluate as _eval_conditions
         from coaching.session_lap_tracker import SessionLapTracker as _SessionLapTracker
-        _technique_analyzer = TechniqueAnalyzer()
-        _balance_analyzer = BalanceAnalyzer()
-        _grip_analyzer = GripAnalyzer()
+        from coaching.streaming_stats import NATIVE_SAMPLE_HZ
+        _technique_analyzer = TechniqueAnalyzer(sample_hz=NATIVE_SAMPLE_HZ)
+        _balance_analyzer = BalanceAnalyzer(sample_hz=NATIVE_SAMPLE_HZ)
+        _grip_analyzer = GripAnalyzer(sample_hz=NATIVE_SAMPLE_HZ)
         _session_lap_tracker = _SessionLapTracker()
+        import time as _etime
+        from coaching.lap_events import LapEventExtractor
+        _lap_events = LapEventExtractor()
+        _lap_events_track = [None]      # track_id the distance index is seeded for
+
+        def _coaching_sample():
+            # O(1) streaming update per sample — 1Hz sampling missed braking events.
+            # Sampled on a fixed clock, not per state_changed: the bridge emits once
+            # per decoded frame (~200/s, bursty), which would shrink every window
+            # and snapshot the full DiffState on each emit.
+            snap = bridge.snapshot()
+            ts = _etime.monotonic()
+            _technique_analyzer.feed(snap, ts)
+            _balance_analyzer.feed(snap, ts)
+            _grip_analyzer.feed(snap, ts)
+            _lap_events.feed_state(snap, ts)
+
+        from PySide6.QtCore import Qt as _SampleQt
+        _coaching_sample_timer = QTimer()
+        _coaching_sample_timer.setTimerType(_SampleQt.TimerType.PreciseTimer)
+        _coaching_sample_timer.setInterval(round(1000 / NATIVE_SAMPLE_HZ))
+        _coaching_sample_timer.timeout.connect(_timed("coaching.sample", _coaching_sample))
+        _coaching_sample_timer.start()
 
         _coaching_timer = QTimer()
         _coaching_timer.setInterval(1000)
@@ -952,47 +1009,53 @@ def main():
             snap = bridge.snapshot()
 
             # Technique analyzer — brake G, trail brake, coaching text
-            _technique_analyzer.feed(snap)
             text, sentiment = _technique_analyzer.analyze()
             # SC-3: safety conditions override technique coaching on Sport screen
             cond = _eval_conditions(snap, 0)  # level 0 = ICE + LOW_GRIP only
             if cond:
                 text, sentiment = cond
-            window._sport_screen.update_coaching(text, sentiment)
-            window._sharp_screen.update_coaching(text, sentiment)
-            window._sharp_screen_track.update_coaching(text, sentiment)
+            window.push_to_screens("update_coaching", text, sentiment,
+                                   screens=window.driving_screens)
             _session_lap_tracker.record_tick(text, sentiment)
 
             # Balance analyzer — understeer/oversteer via bicycle model
-            _balance_analyzer.feed(snap)
             ratio = _balance_analyzer.current_ratio()
             bal_text, bal_sentiment = _balance_analyzer.coaching_text()
-            window._sport_screen.update_balance(ratio, bal_text, bal_sentiment)
-            window._sharp_screen.update_balance(ratio, bal_text, bal_sentiment)
-            window._sharp_screen_track.update_balance(ratio, bal_text, bal_sentiment)
+            window.push_to_screens("update_balance", ratio, bal_text, bal_sentiment)
 
             # Grip analyzer — per-axle traction from wheel speeds
-            _grip_analyzer.feed(snap)
             front = _grip_analyzer.front_grip_pct()
             rear = _grip_analyzer.rear_grip_pct()
-            window._sport_screen.update_grip(front, rear)
-            window._sharp_screen.update_grip(front, rear)
-            window._sharp_screen_track.update_grip(front, rear)
+            window.push_to_screens("update_grip", front, rear)
 
-            # Brake analysis — longitudinal G as peak brake G to Sport screen
-            peak_g = abs(snap.imu_accel_x) if snap.imu_accel_x < -0.1 else 0.0
+            # Brake analysis — window peak brake G (every sample) to Sport screen
+            peak_g = _technique_analyzer.peak_brake_g
+            peak_g = peak_g if peak_g > 0.1 else 0.0
             trail = 1.0 if (snap.imu_accel_x < -0.3 and abs(snap.imu_accel_y) > 0.3) else 0.0
-            window._sport_screen.update_brake_analysis(peak_g, trail * 100.0)
+            window.push_to_screens("update_brake_analysis", peak_g, trail * 100.0)
 
             # Brake quality dots — fed to both S# screen variants (uniform per rolling window)
             if timing_mgr:
-                td = timing_mgr.get_timing_data()
-                sc = td.get("sector_count", 0)
+                sc = timing_mgr.timing_snapshot.sector_count
                 if sc > 0:
                     quality = _technique_analyzer.brake_quality()
                     qualities = [quality] * sc
-                    window._sharp_screen.update_brake_quality(qualities)
-                    window._sharp_screen_track.update_brake_quality(qualities)
+                    window.push_to_screens("update_brake_quality", qualities)
+
+            # Lap events (braking zones / corners) → DuckDB while a session records.
+            # A newly detected track seeds the distance index before the drain matches ids.
+            track = timing_mgr.lap_timer._track if timing_mgr else None
+            if track and track.track_id != _lap_events_track[0]:
+                _lap_events_track[0] = track.track_id
+                refs = (db_store.get_lap_event_references(track.track_id, track.length_m)
+                        if db_store else [])
+                _lap_events.set_references(refs, lap_length_m=track.length_m)
+            events = _lap_events.drain()
+            if events and db_store and session_id:
+                try:
+                    db_store.record_lap_events(session_id, _lap_events_track[0], events)
+                except Exception as e:
+                    log.warning("Lap event write failed: %s", e)
 
             # GPS → road weather manager: feed position + heading for region switching
             if road_mgr and snap.gps_latitude != 0.0:
@@ -1068,6 +1131,20 @@ def main():
         _condition_timer.timeout.connect(_condition_tick)
         _condition_timer.start()
 
+        # Main-thread subsystems: timers via the monitor's event filter
+        loop_monitor.watch("ticker", _ticker_timer)
+        loop_monitor.watch("coaching", _coaching_timer)
+        loop_monitor.watch("conditions", _condition_timer)
+        loop_monitor.watch("alerts", alert_eng)
+        loop_monitor.watch("mode_manager", mode_mgr)
+        if mock is not None:
+            loop_monitor.watch("mock_can", mock)
+        if pattern_eng:
+            loop_monitor.watch("patterns", pattern_eng)
+        if timing_mgr:
+            loop_monitor.rewire(bridge.state_changed, timing_mgr._on_state_changed, "timing")
+        loop_monitor.start()
+
         # Wire coaching level changes from K5 button
         mode_mgr.coaching_changed.connect(
             window._intelligent_screen.set_coaching_level
@@ -1197,12 +1274,19 @@ def main():
 
     # Cleanup
     log.info("Shutting down...")
+    if render_clock:
+        render_clock.stop()
+        log.info("Render clock: %s", render_clock.stats.summary())
+    if loop_monitor:
+        loop_monitor.stop()
+        log.info("Loop monitor: %s", loop_monitor.summary())
     if pattern_eng:
         pattern_eng.stop()
     if listener:
         listener.stop()
     if can_output:
         can_output.stop()
+        log.info("CAN output: %s", can_output.summary())
     if mock:
         mock.stop()
     if voice_mgr:
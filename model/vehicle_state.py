@@ -12,6 +12,7 @@ from __future__ import annotations
 import copy
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Optional
@@ -419,8 +420,9 @@ class DiffStateBridge(QObject):
     update the internal DiffState. The UI thread calls snapshot() from
     a QTimer to get a copy without blocking.
 
-    Emits state_changed when a CAN frame is decoded. Recommended
-    pattern is polling via QTimer at 20 Hz.
+    Emits state_changed when a CAN frame is decoded. The UI does not
+    paint on it: ui.render_clock.RenderClock marks itself dirty and
+    snapshots once per frame at a fixed 30/60 fps.
     """
 
     state_changed = Signal()       # lightweight notification (no payload)
@@ -433,6 +435,9 @@ class DiffStateBridge(QObject):
     # At 3 Hz FLIR, N=3 ≈ 1 second settling time.
     SURFACE_HYSTERESIS_N = 3
 
+    # GPS / IMU samples kept for drain_motion() (~2.5 s of GPS09 Pro traffic)
+    MOTION_LOG_LEN = 512
+
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
         self._state = DiffState()
@@ -444,12 +449,28 @@ class DiffStateBridge(QObject):
         # Per-zone hysteresis (L, C, R)
         self._zone_hysteresis: list[int] = [0, 0, 0]
         self._zone_pending: list[Optional[SurfaceState]] = [None, None, None]
+        # (kind, capture ts, a, b): "gps" lat/lon, "gps_ext" speed/heading, "imu" accel x/y
+        self._motion_log: deque[tuple[str, float, float, float]] = deque(maxlen=self.MOTION_LOG_LEN)
 
     def snapshot(self) -> DiffState:
         """Return a thread-safe copy of the current state."""
         with self._lock:
             return copy.copy(self._state)
 
+    def drain_motion(self) -> list[tuple[str, float, float, float]]:
+        """GPS / IMU samples logged since the last call, oldest first.
+
+        snapshot() only holds the newest frame of each kind; lap timing
+        integrates motion and must also see the frames that arrived while
+        the UI thread was busy. Entries are (kind, ts, a, b) with kind
+        "gps" (lat, lon), "gps_ext" (speed m/s, heading deg) or "imu"
+        (accel x, accel y in g); ts is the capture time.
+        """
+        with self._lock:
+            samples = list(self._motion_log)
+            self._motion_log.clear()
+        return samples
+
     def update_diff(
         self,
         dccd_command_pct: float,
@@ -652,12 +673,18 @@ class DiffStateBridge(QObject):
         if pressed_buttons:
             self.keypad_pressed.emit(pressed_buttons)
 
-    def update_gps(self, latitude: float, longitude: float) -> None:
-        """Called from CAN listener with decoded GPS position frame (0x6A4)."""
+    def update_gps(self, latitude: float, longitude: float, ts: Optional[float] = None) -> None:
+        """Called from CAN listener with decoded GPS position frame (0x6A4).
+
+        ts is the frame's bus receive time (time.monotonic() domain) when
+        known; lap timing uses it instead of when the UI thread got round
+        to the update. Same for the other GPS09 Pro frames below.
+        """
         with self._lock:
             self._state.gps_latitude = latitude
             self._state.gps_longitude = longitude
-            self._state.gps_frame_ts = time.monotonic()
+            self._state.gps_frame_ts = time.monotonic() if ts is None else ts
+            self._motion_log.append(("gps", self._state.gps_frame_ts, latitude, longitude))
             self._state.can_connected = True
         self.state_changed.emit()
 
@@ -668,6 +695,7 @@ class DiffStateBridge(QObject):
         heading: float,
         satellites: int,
         fix_quality: int,
+        ts: Optional[float] = None,
     ) -> None:
         """Called from CAN listener with decoded GPS extended frame (0x6A5)."""
         with self._lock:
@@ -676,27 +704,33 @@ class DiffStateBridge(QObject):
             self._state.gps_heading = heading
             self._state.gps_satellites = satellites
             self._state.gps_fix_quality = fix_quality
-            self._state.gps_ext_frame_ts = time.monotonic()
+            self._state.gps_ext_frame_ts = time.monotonic() if ts is None else ts
+            self._motion_log.append(("gps_ext", self._state.gps_ext_frame_ts, speed_mps, heading))
             self._state.can_connected = True
         self.state_changed.emit()
 
-    def update_imu(self, accel_x: float, accel_y: float, accel_z: float) -> None:
+    def update_imu(
+        self, accel_x: float, accel_y: float, accel_z: float, ts: Optional[float] = None,
+    ) -> None:
         """Called from CAN listener with decoded IMU accelerometer frame (0x6A6)."""
         with self._lock:
             self._state.imu_accel_x = accel_x
             self._state.imu_accel_y = accel_y
             self._state.imu_accel_z = accel_z
-            self._state.imu_frame_ts = time.monotonic()
+            self._state.imu_frame_ts = time.monotonic() if ts is None else ts
+            self._motion_log.append(("imu", self._state.imu_frame_ts, accel_x, accel_y))
             self._state.can_connected = True
         self.state_changed.emit()
 
-    def update_imu_gyro(self, gyro_x: float, gyro_y: float, gyro_z: float) -> None:
+    def update_imu_gyro(
+        self, gyro_x: float, gyro_y: float, gyro_z: float, ts: Optional[float] = None,
+    ) -> None:
         """Called from CAN listener with decoded IMU gyroscope frame (0x6A7)."""
         with self._lock:
             self._state.imu_gyro_x = gyro_x
             self._state.imu_gyro_y = gyro_y
             self._state.imu_gyro_z = gyro_z
-            self._state.imu_gyro_frame_ts = time.monotonic()
+            self._state.imu_gyro_frame_ts = time.monotonic() if ts is None else ts
             self._state.can_connected = True
         self.state_changed.emit()
 
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""KiSTI — Geo Trace Benchmark: NumPy whole-trace geometry vs scalar loops.
+
+Times the batch operations track import / learning run over a full GPS
+trace two ways on the same synthetic lap:
+
+  - scalar: timing.geo functions looped in Python (the pre-array path)
+  - array: timing.geo_array
+
+plus an end-to-end tools.rs3_track_import.trace_to_track(), and reports the
+largest difference between the two results.
+
+Usage:
+    python3 scripts/geo_trace_benchmark.py
+    python3 scripts/geo_trace_benchmark.py --points 50000
+    python3 scripts/geo_trace_benchmark.py --json benchmarks/geo_trace.json
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np  # noqa: E402
+
+from timing import geo_array  # noqa: E402
+from timing.geo import LocalFrame, TimingLine, bearing, haversine_distance  # noqa: E402
+from tools.rs3_track_import import trace_to_track  # noqa: E402
+
+_LAT, _LON = 49.45, -119.55
+
+
+def synthesize(points: int, seed: int = 1) -> list[tuple[float, float]]:
+    """An oval-ish lap of ~4 km with 5 cm GPS jitter."""
+    rng = random.Random(seed)
+    m_lat = 111_320.0
+    m_lon = m_lat * math.cos(math.radians(_LAT))
+    trace = []
+    for k in range(points):
+        a = 2 * math.pi * k / points
+        x = 900.0 * math.cos(a) + 120.0 * math.cos(3 * a) + rng.gauss(0, 0.05)
+        y = 450.0 * math.sin(a) + rng.gauss(0, 0.05)
+        trace.append((_LAT + y / m_lat, _LON + x / m_lon))
+    return trace
+
+
+def _scalar(trace):
+    cum = [0.0]
+    for (lat0, lon0), (lat1, lon1) in zip(trace, trace[1:]):
+        cum.append(cum[-1] + haversine_distance(lat0, lon0, lat1, lon1))
+    n = len(trace)
+    heads = [bearing(*trace[max(0, i - 2)], *trace[min(n - 1, i + 2)]) for i in range(n)]
+    frame = LocalFrame(*trace[0])
+    line = TimingLine.from_latlon(frame, _LAT - 0.001, _LON, _LAT + 0.001, _LON)
+    xy = [frame.project(lat, lon) for lat, lon in trace]
+    hits = [i for i in range(n - 1) if line.crossing(*xy[i], *xy[i + 1]) is not None]
+    return np.array(cum), np.array(heads), hits
+
+
+def _array(trace):
+    lats, lons = geo_array.split_trace(trace)
+    cum = geo_array.cumulative_distances(lats, lons)
+    heads = geo_array.smoothed_bearings(lats, lons)
+    frame = LocalFrame(trace[0][0], trace[0][1])
+    line = TimingLine.from_latlon(frame, _LAT - 0.001, _LON, _LAT + 0.001, _LON)
+    hits, _ = geo_array.segment_crossings(*geo_array.project(frame, lats, lons), line)
+    return cum, heads, hits.tolist()
+
+
+def _time_ms(fn, *args, repeat: int = 5) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000.0
+
+
+def run(points: int) -> dict:
+    trace = synthesize(points)
+    s_cum, s_heads, s_hits = _scalar(trace)
+    a_cum, a_heads, a_hits = _array(trace)
+    head_err = np.abs((a_heads - s_heads + 180.0) % 360.0 - 180.0)
+    return {
+        "scalar_ms": _time_ms(_scalar, trace, repeat=2),
+        "array_ms": _time_ms(_array, trace),
+        "trace_to_track_ms": _time_ms(trace_to_track, trace, "Bench"),
+        "length_m": float(a_cum[-1]),
+        "max_distance_diff_m": float(np.abs(a_cum - s_cum).max()),
+        "max_heading_diff_deg": float(head_err.max()),
+        "crossings_match": a_hits == s_hits,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark whole-trace GPS geometry")
+    parser.add_argument("--points", type=int, default=20000, help="Trace length")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    r = run(args.points)
+    print(f"{args.points} points, {r['length_m']:.0f} m lap")
+    print(f"scalar loops   {r['scalar_ms']:>8.1f}ms")
+    print(f"geo_array      {r['array_ms']:>8.1f}ms  ({r['scalar_ms'] / r['array_ms']:.0f}x)")
+    print(f"trace_to_track {r['trace_to_track_ms']:>8.1f}ms")
+    print(f"max diff: {r['max_distance_diff_m']:.2e} m, {r['max_heading_diff_deg']:.2e} deg; "
+          f"crossings match: {r['crossings_match']}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"points": args.points, **r}, indent=2))
+        print(f"Saved: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
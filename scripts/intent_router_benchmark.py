@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""KiSTI — Intent Router Benchmark: compiled trie vs linear keyword scans.
+
+Extracts every utterance the voice tests feed to the routing handlers
+(handle_voice_query, _answer_from_timing, _answer_from_sensors,
+_handle_timing_command, _handle_frontier_command, _match_persona,
+_match_safety_fast_path) and, for each one, compares:
+
+  - every keyword-group decision: any(kw in query) vs group in route
+  - the reference-lap slot: regex on the raw query vs route slot
+  - quiet/resume command detection on punctuation-stripped text
+  - persona and instant-response winners for every SI Drive mode
+
+Reports routing latency for both approaches and exits non-zero if any
+decision differs.
+
+Usage:
+    python3 scripts/intent_router_benchmark.py
+    python3 scripts/intent_router_benchmark.py --corpus tests/test_voice.py tests/test_voice_timing.py
+    python3 scripts/intent_router_benchmark.py --json benchmarks/intent_router.json
+"""
+
+import argparse
+import ast
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from voice.llm_engine import (  # noqa: E402
+    _INSTANT_RESPONSES, _INSTANT_TABLE, _MODE_ALLOWED_CATEGORIES, _PERSONA_TABLE,
+    _PERSONA_TRIE, PERSONA_RESPONSES,
+)
+from voice.voice_manager import (  # noqa: E402
+    _COMMAND_ROUTER, _INTENT_GROUPS, _INTENT_ROUTER, QUIET_COMMANDS, RESUME_COMMANDS,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CORPUS = [REPO_ROOT / "tests" / "test_voice.py"]
+
+ROUTED_CALLS = {
+    "handle_voice_query", "_answer_from_timing", "_answer_from_sensors",
+    "_handle_timing_command", "_handle_frontier_command",
+    "_match_persona", "_match_safety_fast_path", "_resolve_speculative",
+}
+
+_REFERENCE_LAP = re.compile(r'(?:use\s+)?lap\s+(\d+)\s+as\s+reference|reference\s+lap\s+(\d+)')
+
+
+def extract_utterances(paths: list[Path]) -> list[str]:
+    """String literals passed as the first argument to a routed call."""
+    seen: dict[str, None] = {}
+    for path in paths:
+        tree = ast.parse(path.read_text(), filename=str(path))
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or not node.args:
+                continue
+            func = node.func
+            name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")
+            arg = node.args[0]
+            if name in ROUTED_CALLS and isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                seen.setdefault(arg.value, None)
+    return list(seen)
+
+
+# ---- Linear reference (the pre-router decision logic) ----
+
+def _linear_best(entries, lower: str, allowed=None) -> tuple[int, int | None]:
+    best_score, best_index = 0, None
+    for i, (keywords, _response, category) in enumerate(entries):
+        if allowed is not None and category not in allowed:
+            continue
+        score = sum(len(kw) for kw in keywords if kw in lower)
+        if score > best_score:
+            best_score, best_index = score, i
+    return best_score, best_index
+
+
+def linear_route(lower: str) -> dict:
+    nopunct = re.sub(r'[^\w\s]', '', lower)
+    match = _REFERENCE_LAP.search(lower)
+    return {
+        "groups": tuple(g for g, kws in _INTENT_GROUPS.items() if any(kw in lower for kw in kws)),
+        "reference_lap": int(match.group(1) or match.group(2)) if match else None,
+        "quiet": any(cmd in nopunct for cmd in QUIET_COMMANDS),
+        "resume": any(cmd in nopunct for cmd in RESUME_COMMANDS),
+        "instant": _linear_best(_INSTANT_RESPONSES, lower),
+        "persona": tuple(
+            _linear_best(PERSONA_RESPONSES, lower, allowed)
+            for allowed in _MODE_ALLOWED_CATEGORIES.values()
+        ),
+    }
+
+
+def compiled_route(lower: str) -> dict:
+    route = _INTENT_ROUTER.route(lower)
+    command = _COMMAND_ROUTER.route(re.sub(r'[^\w\s]', '', lower))
+    persona_hits = _PERSONA_TRIE.scan(lower)
+    return {
+        "groups": route.intents,
+        "reference_lap": route.slots.get("timing_cmd.reference_lap"),
+        "quiet": "command.quiet" in command,
+        "resume": "command.resume" in command,
+        "instant": _INSTANT_TABLE.best(route.hits),
+        "persona": tuple(
+            _PERSONA_TABLE.best(persona_hits, allowed)
+            for allowed in _MODE_ALLOWED_CATEGORIES.values()
+        ),
+    }
+
+
+def compare(utterances: list[str]) -> list[tuple[str, str, object, object]]:
+    """Return (utterance, decision, linear, compiled) for every mismatch."""
+    mismatches = []
+    for text in utterances:
+        lower = text.lower().strip()
+        linear, compiled = linear_route(lower), compiled_route(lower)
+        for key in linear:
+            if linear[key] != compiled[key]:
+                mismatches.append((text, key, linear[key], compiled[key]))
+    return mismatches
+
+
+def _time_us(fn, utterances: list[str], rounds: int) -> list[float]:
+    lowered = [u.lower().strip() for u in utterances]
+    samples = []
+    for _ in range(rounds):
+        for lower in lowered:
+            t0 = time.perf_counter()
+            fn(lower)
+            samples.append((time.perf_counter() - t0) * 1e6)
+    return samples
+
+
+def _summary(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "mean_us": round(statistics.fmean(ordered), 2),
+        "p50_us": round(ordered[len(ordered) // 2], 2),
+        "p99_us": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the compiled intent router")
+    parser.add_argument("--corpus", nargs="+", type=Path, default=DEFAULT_CORPUS,
+                        help="Test files to extract utterances from")
+    parser.add_argument("--rounds", type=int, default=50, help="Timing rounds over the corpus")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    utterances = extract_utterances(args.corpus)
+    mismatches = compare(utterances)
+    linear = _summary(_time_us(linear_route, utterances, args.rounds))
+    compiled = _summary(_time_us(compiled_route, utterances, args.rounds))
+
+    print(f"Utterances: {len(utterances)}  Keyword groups: {len(_INTENT_GROUPS)}  "
+          f"Persona entries: {len(PERSONA_RESPONSES)}")
+    print(f"{'':10} {'mean':>9} {'p50':>9} {'p99':>9}")
+    for name, s in (("linear", linear), ("compiled", compiled)):
+        print(f"{name:10} {s['mean_us']:>7.1f}us {s['p50_us']:>7.1f}us {s['p99_us']:>7.1f}us")
+    print(f"Speedup (mean): {linear['mean_us'] / compiled['mean_us']:.1f}x")
+    print(f"Routing decisions identical: {not mismatches} ({len(mismatches)} mismatches)")
+    for text, key, a, b in mismatches[:20]:
+        print(f"  MISMATCH [{key}] '{text}': linear={a} compiled={b}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({
+            "utterances": len(utterances),
+            "linear": linear,
+            "compiled": compiled,
+            "mismatches": len(mismatches),
+        }, indent=2))
+        print(f"Saved: {args.json}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
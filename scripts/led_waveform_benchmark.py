@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""KiSTI — LED Animation Benchmark: compiled tables vs per-frame float math.
+
+For each shift-light animation (KITT sweep, RPM shift bar, G-force,
+waveform, warm-up) times producing one frame ready for the CAN output
+thread two ways:
+
+  - reference: the per-frame generator (voice.led_waveform._*_leds) plus
+    encode_led_output() — the pre-table send path
+  - table: LEDWaveformGenerator, a table lookup returning a frame with its
+    encoded payload
+
+and reports the largest per-LED brightness / color difference between the
+two over the same input sequence.
+
+Usage:
+    python3 scripts/led_waveform_benchmark.py
+    python3 scripts/led_waveform_benchmark.py --frames 20000
+    python3 scripts/led_waveform_benchmark.py --json benchmarks/led_waveform.json
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from can.can_config import (  # noqa: E402
+    LED_COUNT, LED_MODE_GFORCE, LED_MODE_KITT, LED_MODE_RPM, LED_MODE_WARMUP, LED_MODE_WAVEFORM,
+)
+from can.led_output import encode_led_output  # noqa: E402
+from voice.led_waveform import (  # noqa: E402
+    KITT_SPEED, LEDWaveformGenerator, _gforce_leds, _kitt_leds, _rpm_leds,
+    _warmup_brightness, _warmup_color, _waveform_leds, led_animation_tables,
+)
+
+DT = 1.0 / 30.0
+
+
+def _inputs(frames: int, seed: int = 1) -> dict[str, list]:
+    rng = random.Random(seed)
+    return {
+        "kitt": [DT] * frames,
+        "rpm": [rng.uniform(3000.0, 8000.0) for _ in range(frames)],
+        "g_force": [(rng.uniform(-1.5, 1.5), rng.uniform(-1.5, 1.5)) for _ in range(frames)],
+        "waveform": [rng.random() for _ in range(frames)],
+        "warmup": [i / frames for i in range(frames)],
+    }
+
+
+def _reference(name: str):
+    """Per-frame generator + encode, as the send path did before the tables."""
+    phase = [0.0]
+
+    def kitt(dt):
+        phase[0] += dt * KITT_SPEED
+        b, (r, g, bl) = _kitt_leds(phase[0])
+        return LED_MODE_KITT, b, (r, g, bl), encode_led_output(LED_MODE_KITT, b, r, g, bl)
+
+    def rpm(value, shift=6500.0, redline=7500.0):
+        if value < shift * 0.6:
+            b, rgb = [0] * LED_COUNT, (0, 0, 0)
+        else:
+            b, rgb = _rpm_leds(max(0.0, min(1.0, (value - shift * 0.6) / (redline - shift * 0.6))))
+        return LED_MODE_RPM, b, rgb, encode_led_output(LED_MODE_RPM, b, *rgb)
+
+    def g_force(accel):
+        b, rgb = _gforce_leds(math.sqrt(accel[0] ** 2 + accel[1] ** 2))
+        return LED_MODE_GFORCE, b, rgb, encode_led_output(LED_MODE_GFORCE, b, *rgb)
+
+    def waveform(amp):
+        b, rgb = _waveform_leds(amp)
+        return LED_MODE_WAVEFORM, b, rgb, encode_led_output(LED_MODE_WAVEFORM, b, *rgb)
+
+    def warmup(progress):
+        phase[0] += DT
+        b = [_warmup_brightness(phase[0] * 2.0)] * LED_COUNT
+        rgb = _warmup_color(progress)
+        return LED_MODE_WARMUP, b, rgb, encode_led_output(LED_MODE_WARMUP, b, *rgb)
+
+    return {"kitt": kitt, "rpm": rpm, "g_force": g_force,
+            "waveform": waveform, "warmup": warmup}[name]
+
+
+def _table(name: str):
+    gen = LEDWaveformGenerator()
+
+    def wrap(fn):
+        def produce(arg):
+            frame = fn(arg)
+            return (frame.mode, frame.brightnesses,
+                    (frame.color_r, frame.color_g, frame.color_b), frame.payload)
+        return produce
+
+    return wrap({
+        "kitt": gen.kitt_sweep_frame,
+        "rpm": gen.rpm_shift_frame,
+        "g_force": lambda a: gen.g_force_frame(*a),
+        "waveform": gen.waveform_frame,
+        "warmup": gen.warmup_frame,
+    }[name])
+
+
+def _time(produce, args: list) -> tuple[float, list]:
+    out = []
+    start = time.perf_counter()
+    for arg in args:
+        out.append(produce(arg))
+    return (time.perf_counter() - start) / len(args) * 1e6, out
+
+
+def run(frames: int) -> dict:
+    build_start = time.perf_counter()
+    led_animation_tables.cache_clear()
+    led_animation_tables()
+    build_ms = (time.perf_counter() - build_start) * 1000.0
+
+    results = {}
+    for name, args in _inputs(frames).items():
+        ref_us, ref = _time(_reference(name), args)
+        tab_us, tab = _time(_table(name), args)
+        max_led = max(max(abs(a - b) for a, b in zip(r[1], t[1])) for r, t in zip(ref, tab))
+        max_rgb = max(max(abs(a - b) for a, b in zip(r[2], t[2])) for r, t in zip(ref, tab))
+        exact = sum(r[3] == t[3] for r, t in zip(ref, tab)) / frames
+        results[name] = {
+            "reference_us": round(ref_us, 3),
+            "table_us": round(tab_us, 3),
+            "speedup": round(ref_us / max(tab_us, 1e-9), 1),
+            "max_led_diff": max_led,
+            "max_rgb_diff": max_rgb,
+            "identical_payloads": round(exact, 4),
+        }
+    return {"build_ms": round(build_ms, 1), "results": results}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark LED animation frame generation")
+    parser.add_argument("--frames", type=int, default=10000, help="Frames per animation")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    report = run(args.frames)
+    print(f"Tables built in {report['build_ms']:.1f}ms; {args.frames} frames per animation")
+    print(f"{'animation':10} {'reference':>11} {'table':>9} {'speedup':>8} "
+          f"{'max LED':>8} {'max RGB':>8} {'identical':>10}")
+    for name, r in report["results"].items():
+        print(f"{name:10} {r['reference_us']:>9.2f}us {r['table_us']:>7.2f}us "
+              f"{r['speedup']:>7.1f}x {r['max_led_diff']:>8} {r['max_rgb_diff']:>8} "
+              f"{r['identical_payloads']:>10.1%}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"frames": args.frames, **report}, indent=2))
+        print(f"Saved: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""KiSTI — Mic Front-End Benchmark: ring buffer vs bytes/list buffering.
+
+Feeds the same synthetic 16kHz capture (road noise with speech-like bursts)
+through the per-frame audio work of MicCapture._vad_process:
+
+  - legacy: read_fn gain via astype/clip/tobytes, oww_buffer bytes +=
+    and re-slicing, //3 gain undo per chunk, astype float for the VAD,
+    pre-roll list + speech_buffer list joined at the end
+  - ring:   AudioFrontEnd (preallocated int16 ring, in-place scratch)
+
+Reports per-frame CPU time, per-frame transient allocation (tracemalloc
+peak above baseline) and allocated blocks, and checks that both paths feed
+identical samples to the VAD and openwakeword.
+
+Usage:
+    python3 scripts/mic_frontend_benchmark.py
+    python3 scripts/mic_frontend_benchmark.py --seconds 120 --json benchmarks/mic_frontend.json
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from voice.audio_frontend import FRAME_SAMPLES, OWW_CHUNK_SAMPLES, AudioFrontEnd  # noqa: E402
+from voice.mic_capture import (  # noqa: E402
+    FRAME_BYTES, MAX_UTTERANCE_FRAMES, PRE_ROLL_FRAMES, SAMPLE_RATE, SOFTWARE_GAIN,
+)
+
+SPEECH_RMS = 0.02  # Stand-in VAD: float RMS above this counts as speech
+
+
+def synthetic_capture(seconds: float, seed: int = 0) -> list[bytes]:
+    """Road noise with 1.5s speech-like bursts every 4s, as raw frames."""
+    rng = np.random.default_rng(seed)
+    n = int(seconds * SAMPLE_RATE) // FRAME_SAMPLES * FRAME_SAMPLES
+    t = np.arange(n) / SAMPLE_RATE
+    audio = rng.normal(0, 150, n)
+    bursts = (t % 4.0) < 1.5
+    audio += bursts * 9000 * np.sin(2 * np.pi * 220 * t) * (1 + 0.5 * np.sin(2 * np.pi * 3 * t))
+    pcm = np.clip(audio, -32768, 32767).astype(np.int16).tobytes()
+    return [pcm[i:i + FRAME_BYTES] for i in range(0, len(pcm), FRAME_BYTES)]
+
+
+def _legacy_gain(raw: bytes) -> bytes:
+    arr = np.frombuffer(raw, dtype=np.int16).astype(np.int32) * SOFTWARE_GAIN
+    return np.clip(arr, -32768, 32767).astype(np.int16).tobytes()
+
+
+class LegacyPath:
+    """The pre-ring per-frame buffering, kept verbatim for comparison."""
+
+    def __init__(self) -> None:
+        self.pre_roll: list[bytes] = []
+        self.speech_buffer: list[bytes] = []
+        self.oww_buffer = b""
+        self.in_speech = False
+        self.silent = 0
+        self.vad_inputs: list[np.ndarray] = []
+        self.oww_inputs: list[np.ndarray] = []
+        self.utterances = 0
+
+    def frame(self, raw: bytes, record: bool) -> None:
+        frame = _legacy_gain(raw)
+        self.oww_buffer += frame
+        while len(self.oww_buffer) >= OWW_CHUNK_SAMPLES * 2:
+            chunk = self.oww_buffer[:OWW_CHUNK_SAMPLES * 2]
+            self.oww_buffer = self.oww_buffer[OWW_CHUNK_SAMPLES * 2:]
+            oww_audio = (np.frombuffer(chunk, dtype=np.int16).astype(np.int32) // 3).astype(np.int16)
+            if record:
+                self.oww_inputs.append(oww_audio.copy())
+        audio_float = np.frombuffer(frame, dtype=np.int16).astype(np.float32) / 32768.0
+        if record:
+            self.vad_inputs.append(audio_float.copy())
+        is_speech = float(np.sqrt((audio_float ** 2).mean())) > SPEECH_RMS
+        if not self.in_speech:
+            self.pre_roll.append(frame)
+            if len(self.pre_roll) > PRE_ROLL_FRAMES:
+                self.pre_roll.pop(0)
+            if is_speech:
+                self.in_speech = True
+                self.silent = 0
+                self.speech_buffer = list(self.pre_roll)
+                self.speech_buffer.append(frame)
+                self.pre_roll.clear()
+        else:
+            self.speech_buffer.append(frame)
+            self.silent = 0 if is_speech else self.silent + 1
+            if self.silent >= 19 or len(self.speech_buffer) >= MAX_UTTERANCE_FRAMES:
+                b"".join(self.speech_buffer)
+                self.speech_buffer.clear()
+                self.in_speech = False
+                self.utterances += 1
+
+
+class RingPath:
+    """The same work on AudioFrontEnd."""
+
+    def __init__(self) -> None:
+        self.fe = AudioFrontEnd(gain=SOFTWARE_GAIN, max_frames=MAX_UTTERANCE_FRAMES + PRE_ROLL_FRAMES + 1)
+        self.in_speech = False
+        self.silent = 0
+        self.start = 0
+        self.floor = 0
+        self.vad_inputs: list[np.ndarray] = []
+        self.oww_inputs: list[np.ndarray] = []
+        self.utterances = 0
+
+    def frame(self, raw: bytes, record: bool) -> None:
+        fe = self.fe
+        fe.push(raw)
+        for chunk in fe.oww_chunks(undo_gain=True):
+            if record:
+                self.oww_inputs.append(chunk.copy())
+        if record:
+            self.vad_inputs.append(fe.vad_float.copy())
+        is_speech = fe.rms(fe.frame) / 32768.0 > SPEECH_RMS
+        if not self.in_speech:
+            if is_speech:
+                self.in_speech = True
+                self.silent = 0
+                self.start = max(fe.written - (PRE_ROLL_FRAMES + 1) * FRAME_SAMPLES, self.floor)
+        else:
+            self.silent = 0 if is_speech else self.silent + 1
+            if self.silent >= 19 or (fe.written - self.start) // FRAME_SAMPLES >= MAX_UTTERANCE_FRAMES:
+                fe.pcm(self.start)
+                self.floor = fe.written
+                self.in_speech = False
+                self.utterances += 1
+        fe.frame_done()
+
+
+def _measure(path_cls, frames: list[bytes]) -> dict:
+    path = path_cls()
+    for raw in frames[:200]:  # Warm up (numpy dispatch caches, ring pages)
+        path.frame(raw, record=False)
+    path = path_cls()
+
+    cpu = []
+    for raw in frames:
+        t0 = time.thread_time_ns()
+        path.frame(raw, record=False)
+        cpu.append(time.thread_time_ns() - t0)
+
+    path = path_cls()
+    tracemalloc.start()
+    peaks, blocks = [], []
+    for raw in frames:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        before = sys.getallocatedblocks()
+        path.frame(raw, record=False)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - base)
+        blocks.append(max(0, sys.getallocatedblocks() - before))
+    tracemalloc.stop()
+
+    cpu_us = np.array(cpu) / 1000
+    return {
+        "frames": len(frames),
+        "cpu_us_mean": round(float(cpu_us.mean()), 2),
+        "cpu_us_p99": round(float(np.percentile(cpu_us, 99)), 2),
+        "alloc_bytes_per_frame": round(float(np.mean(peaks)), 1),
+        "alloc_bytes_max": int(max(peaks)),
+        "net_blocks_per_frame": round(float(np.mean(blocks)), 2),
+        "utterances": path.utterances,
+    }
+
+
+def parity(frames: list[bytes]) -> bool:
+    """Both paths hand identical samples to the VAD and openwakeword."""
+    legacy, ring = LegacyPath(), RingPath()
+    for raw in frames:
+        legacy.frame(raw, record=True)
+        ring.frame(raw, record=True)
+    return (
+        len(legacy.vad_inputs) == len(ring.vad_inputs)
+        and all(np.array_equal(a, b) for a, b in zip(legacy.vad_inputs, ring.vad_inputs))
+        and len(legacy.oww_inputs) == len(ring.oww_inputs)
+        and all(np.array_equal(a, b) for a, b in zip(legacy.oww_inputs, ring.oww_inputs))
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the mic audio front-end")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Synthetic capture length")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    frames = synthetic_capture(args.seconds)
+    identical = parity(frames)
+    results = {"legacy": _measure(LegacyPath, frames), "ring": _measure(RingPath, frames)}
+
+    print(f"Frames: {len(frames)} ({args.seconds:.0f}s @ {SAMPLE_RATE}Hz, gain {SOFTWARE_GAIN}x)")
+    print(f"{'':8} {'cpu mean':>10} {'cpu p99':>10} {'alloc/frame':>12} {'alloc max':>10} {'net blk':>7}")
+    for name, r in results.items():
+        print(f"{name:8} {r['cpu_us_mean']:>8.1f}us {r['cpu_us_p99']:>8.1f}us "
+              f"{r['alloc_bytes_per_frame']:>10.0f}B {r['alloc_bytes_max']:>9}B "
+              f"{r['net_blocks_per_frame']:>7.2f}")
+    print(f"VAD/OWW inputs identical: {identical}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({**results, "identical": identical}, indent=2))
+        print(f"Saved: {args.json}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""KiSTI — Timing Replay Benchmark: capture-timestamped GPS+IMU vs slot-time GPS.
+
+Replays a synthetic session with known ground truth through both timing
+paths and reports lap / sector precision and event latency:
+
+  - session: a stadium circuit (300 m straights, 80 m turns) driven with a
+    speed profile that brakes into and accelerates out of every turn;
+    GPS09 Pro frames at 10 Hz (position, speed, course) and IMU at 100 Hz,
+    each stamped with its bus receive time
+  - main thread: the UI thread only gets to the frames every few ms, with
+    occasional stalls (DB flush, heavy paint) of 80–250 ms
+  - legacy path: LapTimer fed the newest raw fix whenever the main thread
+    runs, stamped time.monotonic() at that moment (the pre-fusion
+    TimingManager)
+  - capture path: every raw fix, stamped with its receive time (shows what
+    the timestamps alone buy)
+  - fused path: the real TimingManager draining a motion log the way it
+    drains DiffStateBridge's — capture timestamps + GpsImuFusion dead
+    reckoning
+
+Usage:
+    python3 scripts/timing_replay_benchmark.py
+    python3 scripts/timing_replay_benchmark.py --laps 10 --seed 3
+    python3 scripts/timing_replay_benchmark.py --json benchmarks/timing_replay.json
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from timing.lap_timer import LapTimer, TimingEventType  # noqa: E402
+from timing.timing_manager import TimingManager  # noqa: E402
+from timing.track_db import SectorDefinition, StartFinishLine, TrackDefinition  # noqa: E402
+
+BASE_LAT, BASE_LON = 45.0, -122.0
+M_PER_DEG_LAT = 111_320.0
+M_PER_DEG_LON = M_PER_DEG_LAT * math.cos(math.radians(BASE_LAT))
+G = 9.80665
+
+STRAIGHT_M = 300.0
+TURN_R = 80.0
+LAP_M = 2 * STRAIGHT_M + 2 * math.pi * TURN_R
+V_STRAIGHT = 45.0      # m/s at the end of a straight
+V_TURN = 24.0          # m/s through a turn
+SIM_DT = 0.001         # Ground-truth integration step
+GPS_HZ = 10
+IMU_HZ = 100
+IMU_NOISE_G = 0.02
+TRANSPORT_S = 0.004    # Receiver → CAN receive (the same for every frame)
+
+
+# ── Circuit geometry (arc length → pose) ─────────────────────────────
+
+def _pose(s: float) -> tuple[float, float, float, float]:
+    """(east, north, heading rad, signed curvature 1/m) at arc length s.
+
+    Driven counter-clockwise: bottom straight eastbound from (-150, -80),
+    left turn up the east end, top straight westbound, left turn down the
+    west end. Curvature is dheading/ds (negative = turning left).
+    """
+    s %= LAP_M
+    half = STRAIGHT_M / 2
+    turn = math.pi * TURN_R
+    if s < STRAIGHT_M:                                    # Bottom, eastbound
+        return -half + s, -TURN_R, math.pi / 2, 0.0
+    s -= STRAIGHT_M
+    if s < turn:                                          # East turn
+        a = s / TURN_R
+        return half + TURN_R * math.sin(a), -TURN_R * math.cos(a), math.pi / 2 - a, -1.0 / TURN_R
+    s -= turn
+    if s < STRAIGHT_M:                                    # Top, westbound
+        return half - s, TURN_R, -math.pi / 2, 0.0
+    s -= STRAIGHT_M
+    a = s / TURN_R                                        # West turn
+    return -half - TURN_R * math.sin(a), TURN_R * math.cos(a), -math.pi / 2 - a, -1.0 / TURN_R
+
+
+def _target_speed(s: float) -> float:
+    """Speed profile: slow through the turns, fast at the end of the straights."""
+    s %= LAP_M
+    seg = STRAIGHT_M + math.pi * TURN_R
+    x = s % seg
+    if x >= STRAIGHT_M:
+        return V_TURN
+    return V_TURN + (V_STRAIGHT - V_TURN) * math.sin(math.pi * x / STRAIGHT_M)
+
+
+def _latlon(east: float, north: float) -> tuple[float, float]:
+    return BASE_LAT + north / M_PER_DEG_LAT, BASE_LON + east / M_PER_DEG_LON
+
+
+def _line_at(s: float, half_width: float = 15.0) -> StartFinishLine:
+    east, north, heading, _ = _pose(s)
+    px, py = math.cos(heading), -math.sin(heading)        # Perpendicular to travel
+    lat1, lon1 = _latlon(east + px * half_width, north + py * half_width)
+    lat2, lon2 = _latlon(east - px * half_width, north - py * half_width)
+    return StartFinishLine(lat1=lat1, lon1=lon1, lat2=lat2, lon2=lon2)
+
+
+# Lines where straight-line interpolation between fixes is worst: S/F
+# while accelerating, sectors at the east turn apex, under braking on the
+# top straight and at the west turn exit
+SF_S = STRAIGHT_M * 0.25
+SECTOR_S = [
+    STRAIGHT_M + math.pi * TURN_R / 2,
+    STRAIGHT_M + math.pi * TURN_R + STRAIGHT_M * 0.85,
+    2 * STRAIGHT_M + math.pi * TURN_R * 1.9,
+]
+
+
+def replay_track() -> tuple[TrackDefinition, list[SectorDefinition]]:
+    track = TrackDefinition(
+        track_id="replay-stadium", name="Replay Stadium",
+        center_lat=BASE_LAT, center_lon=BASE_LON, radius_m=2000.0,
+        track_type="circuit", start_finish=_line_at(SF_S),
+        country="XX", region="Test", length_m=LAP_M, source="manual",
+    )
+    sectors = [
+        SectorDefinition(f"replay-s{i}", track.track_id, i, _line_at(s), f"S{i + 1}")
+        for i, s in enumerate(SECTOR_S)
+    ]
+    return track, sectors
+
+
+# ── Session synthesis ────────────────────────────────────────────────
+
+@dataclass
+class Session:
+    frames: list[tuple] = field(default_factory=list)     # (capture ts, kind, a, b)
+    sf_times: list[float] = field(default_factory=list)   # True S/F crossing times
+    sector_times: list[float] = field(default_factory=list)
+    wakeups: list[float] = field(default_factory=list)    # Main-thread slot runs
+
+
+def synthesize(laps: int = 5, seed: int = 1, stall_prob: float = 0.03) -> Session:
+    rng = random.Random(seed)
+    session = Session()
+    gps_period, imu_period = 1.0 / GPS_HZ, 1.0 / IMU_HZ
+    next_gps, next_imu = rng.uniform(0, gps_period), rng.uniform(0, imu_period)
+    lines = sorted([(SF_S, "sf")] + [(s, "sector") for s in SECTOR_S])
+    line_i, line_base = 0, 0.0
+    t, s, v = 0.0, 0.0, V_TURN
+    total = (laps + 1.3) * LAP_M
+
+    while s < total:
+        target = _target_speed(s)
+        accel = max(-1.2 * G, min(0.6 * G, (target - v) * 2.0))
+        s_next = s + v * SIM_DT + 0.5 * accel * SIM_DT ** 2
+        v_next = v + accel * SIM_DT
+
+        # Exact line crossings inside this step (linear within 1 ms)
+        while line_base + lines[line_i][0] <= s_next:
+            cross_s = line_base + lines[line_i][0]
+            ct = t + SIM_DT * (cross_s - s) / (s_next - s)
+            (session.sf_times if lines[line_i][1] == "sf" else session.sector_times).append(ct)
+            line_i += 1
+            if line_i == len(lines):
+                line_i, line_base = 0, line_base + LAP_M
+
+        t, s, v = t + SIM_DT, s_next, v_next
+        east, north, heading, curvature = _pose(s)
+        if t >= next_gps:
+            lat, lon = _latlon(east, north)
+            rx = t + TRANSPORT_S
+            session.frames.append((rx, "gps", lat, lon))
+            session.frames.append((rx + 0.0002, "gps_ext", v, math.degrees(heading) % 360.0))
+            next_gps += gps_period
+        if t >= next_imu:
+            lateral = v * v * curvature / G             # +ve = right
+            session.frames.append((
+                t + TRANSPORT_S, "imu",
+                accel / G + rng.gauss(0.0, IMU_NOISE_G), lateral + rng.gauss(0.0, IMU_NOISE_G),
+            ))
+            next_imu += imu_period
+
+    # Main thread: runs the slot every few ms, sometimes stalls
+    w = 0.0
+    while w < t:
+        w += rng.uniform(0.002, 0.015)
+        if rng.random() < stall_prob:
+            w += rng.uniform(0.08, 0.25)
+        session.wakeups.append(w)
+    session.frames.sort()
+    return session
+
+
+# ── Timing paths ─────────────────────────────────────────────────────
+
+def run_legacy(session: Session, capture_ts: bool = False) -> dict:
+    """Raw fixes, stamped when the main thread gets to them (or with capture_ts)."""
+    timer = LapTimer()
+    timer.set_track(*replay_track())
+    laps, sectors, latency = [], [], []
+    fi, fed = 0, None
+    for w in session.wakeups:
+        fixes = []
+        while fi < len(session.frames) and session.frames[fi][0] <= w:
+            if session.frames[fi][1] == "gps":
+                fixes.append(session.frames[fi])
+            fi += 1
+        if not capture_ts:                      # Snapshot: newest fix only
+            fixes = fixes[-1:]
+        for ts, _, lat, lon in fixes:
+            if (lat, lon) == fed:
+                continue
+            fed = (lat, lon)
+            for ev in timer.update(lat, lon, ts if capture_ts else w):
+                _collect(ev, w, laps, sectors, latency)
+    return _result(session, laps, sectors, latency)
+
+
+class ReplayBridge:
+    """The slice of DiffStateBridge TimingManager uses, fed from a replay.
+
+    Frames queue up like DiffStateBridge's motion log until the (simulated)
+    main thread drains them; no Qt signals, so replays run at full speed.
+    """
+
+    def __init__(self) -> None:
+        self._log: list[tuple[str, float, float, float]] = []
+        self.timing: dict = {}
+
+    def push(self, ts: float, kind: str, a: float, b: float) -> None:
+        self._log.append((kind, ts, a, b))
+
+    def drain_motion(self) -> list[tuple[str, float, float, float]]:
+        samples, self._log = self._log, []
+        return samples
+
+    def update_timing(self, **kwargs) -> None:
+        self.timing = kwargs
+
+    def blockSignals(self, block: bool) -> bool:  # noqa: N802
+        return False
+
+
+def run_fused(session: Session) -> dict:
+    """The real TimingManager: capture timestamps + GPS/IMU fusion."""
+    bridge = ReplayBridge()
+    mgr = TimingManager(bridge=bridge, db_store=None)
+    mgr._timer.set_track(*replay_track())
+    mgr._track_detected = True
+    mgr._active = True
+    laps, sectors, latency = [], [], []
+    now = [0.0]
+    mgr.lap_completed.connect(lambda p: _collect_payload(p, now[0], laps, latency))
+    mgr.sector_completed.connect(lambda p: _collect_payload(p, now[0], sectors, latency))
+
+    fi = 0
+    for w in session.wakeups:
+        pending = False
+        while fi < len(session.frames) and session.frames[fi][0] <= w:
+            bridge.push(*session.frames[fi])
+            fi += 1
+            pending = True
+        if pending:
+            now[0] = w
+            mgr._on_state_changed()
+    result = _result(session, laps, sectors, latency)
+    result["dead_reckoned"] = mgr.fusion.estimates
+    return result
+
+
+def _collect(ev, w, laps, sectors, latency) -> None:
+    if ev.event_type == TimingEventType.LAP_COMPLETE:
+        laps.append(ev.time_s)
+        latency.append(w)
+    elif ev.event_type == TimingEventType.SECTOR_COMPLETE:
+        sectors.append(ev.time_s)
+        latency.append(w)
+
+
+def _collect_payload(payload, w, out, latency) -> None:
+    out.append(payload["time_s"])
+    latency.append(w)
+
+
+def _result(session: Session, laps: list[float], sectors: list[float], emitted: list[float]) -> dict:
+    true_laps = [b - a for a, b in zip(session.sf_times, session.sf_times[1:])]
+    crossings = sorted(session.sf_times + session.sector_times)
+    true_sectors = [b - a for a, b in zip(crossings, crossings[1:])]
+    true_sectors = [st for i, st in enumerate(true_sectors)
+                    if crossings[i + 1] not in session.sf_times]   # LapTimer reports S1..S3
+    lap_err = [abs(m - t) * 1000 for m, t in zip(laps, true_laps)]
+    sec_err = [abs(m - t) * 1000 for m, t in zip(sectors, true_sectors)]
+    # Latency: event emission (main-thread time) after the true crossing it reports
+    event_crossings = [c for c in crossings[1:]]
+    lat_ms = [(w - c) * 1000 for w, c in zip(sorted(emitted), event_crossings)]
+    return {
+        "laps": len(laps),
+        "sectors": len(sectors),
+        "lap_err_ms": _stats(lap_err),
+        "sector_err_ms": _stats(sec_err),
+        "latency_ms": _stats(lat_ms),
+    }
+
+
+def _stats(values: list[float]) -> dict:
+    if not values:
+        return {"mean": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    return {
+        "mean": round(statistics.fmean(ordered), 2),
+        "p95": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 2),
+        "max": round(ordered[-1], 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay a synthetic session through both timing paths")
+    parser.add_argument("--laps", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--stall-prob", type=float, default=0.03,
+                        help="Chance per main-thread run of an 80–250 ms stall")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    session = synthesize(args.laps, args.seed, args.stall_prob)
+    results = {
+        "legacy": run_legacy(session),
+        "capture": run_legacy(session, capture_ts=True),
+        "fused": run_fused(session),
+    }
+
+    print(f"{args.laps} laps of {LAP_M:.0f} m, GPS {GPS_HZ} Hz / IMU {IMU_HZ} Hz, "
+          f"stall probability {args.stall_prob:.0%}")
+    print(f"{'path':8} {'laps':>5} {'lap err mean/p95/max ms':>26} "
+          f"{'sector err mean/p95/max ms':>28} {'latency mean/p95 ms':>20}")
+    for name, r in results.items():
+        le, se, la = r["lap_err_ms"], r["sector_err_ms"], r["latency_ms"]
+        print(f"{name:8} {r['laps']:>5} {le['mean']:>10.2f} {le['p95']:>7.2f} {le['max']:>7.2f} "
+              f"{se['mean']:>12.2f} {se['p95']:>7.2f} {se['max']:>7.2f} "
+              f"{la['mean']:>11.1f} {la['p95']:>7.1f}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"laps": args.laps, "seed": args.seed,
+                                         "stall_prob": args.stall_prob, **results}, indent=2))
+        print(f"Saved: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""KiSTI — UI Paint Benchmark: per-screen paint time, static layer cache on vs off.
+
+Renders each dashboard offscreen at 800x480 from the synthetic DiffState
+stream of scripts/ui_render_benchmark.py and times paintEvent via
+QWidget.render(). Every screen is run twice: with
+ui.layers static-layer caching enabled, then with it disabled (the
+pre-cache paint path, everything redrawn each frame).
+
+Usage:
+    python3 scripts/ui_paint_benchmark.py
+    python3 scripts/ui_paint_benchmark.py --frames 600 --screens sharp sport
+    python3 scripts/ui_paint_benchmark.py --json benchmarks/ui_paint.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtGui import QImage  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from model.vehicle_state import DiffState  # noqa: E402
+from scripts.ui_render_benchmark import fresh, synthetic_state  # noqa: E402
+from ui import layers  # noqa: E402
+
+WIDTH, HEIGHT = 800, 480
+
+
+def _screens() -> dict:
+    """name -> widget factory (imported lazily, after QApplication exists)."""
+    from ui.diff_mode import _TorqueSilhouette
+    from ui.intelligent_screen import IntelligentScreenWidget
+    from ui.sharp_screen import SportSharpScreenWidget
+    from ui.sharp_screen_track import SportSharpTrackScreenWidget
+    from ui.sport_screen import SportScreenWidget
+    from ui.widgets.sti_heatmap_widget import StiHeatmapWidget
+    from ui.widgets.track_map_widget import TrackMapWidget
+
+    return {
+        "intelligent": IntelligentScreenWidget,
+        "sport": SportScreenWidget,
+        "sharp": SportSharpScreenWidget,
+        "sharp_track": SportSharpTrackScreenWidget,
+        "torque_silhouette": _TorqueSilhouette,
+        "track_map": TrackMapWidget,
+        "sti_heatmap": StiHeatmapWidget,
+    }
+
+
+def _feed(widget, snap: DiffState, i: int) -> None:
+    if hasattr(widget, "update_state"):
+        widget.update_state(snap)
+    elif hasattr(widget, "set_state"):
+        ws = {"FL": snap.wheel_speed_fl, "FR": snap.wheel_speed_fr,
+              "RL": snap.wheel_speed_rl, "RR": snap.wheel_speed_rr}
+        widget.set_state(snap.dccd_command_pct, snap.throttle_pct, snap.slip_delta, False, ws)
+    elif hasattr(widget, "set_progress"):
+        widget.set_progress(i / 600.0)
+
+
+def bench_screen(factory, frames: int, warmup: int = 10) -> dict:
+    """Paint `frames` frames into an offscreen image; per-frame times in ms."""
+    widget = factory()
+    widget.resize(WIDTH, HEIGHT)
+    image = QImage(WIDTH, HEIGHT, QImage.Format.Format_ARGB32_Premultiplied)
+    times = []
+    for i in range(warmup + frames):
+        _feed(widget, fresh(synthetic_state(i)), i)
+        t0 = time.perf_counter()
+        widget.render(image)
+        elapsed = (time.perf_counter() - t0) * 1000.0
+        if i >= warmup:
+            times.append(elapsed)
+    ms = np.array(times)
+    return {
+        "mean_ms": round(float(ms.mean()), 3),
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p99_ms": round(float(np.percentile(ms, 99)), 3),
+        "max_ms": round(float(ms.max()), 3),
+    }
+
+
+def run(names: list[str], frames: int) -> dict:
+    screens = _screens()
+    results = {}
+    for name in names:
+        layers.set_layer_cache_enabled(True)
+        cached = bench_screen(screens[name], frames)
+        layers.set_layer_cache_enabled(False)
+        uncached = bench_screen(screens[name], frames)
+        results[name] = {
+            "cached": cached,
+            "uncached": uncached,
+            "speedup": round(uncached["mean_ms"] / max(cached["mean_ms"], 1e-6), 2),
+        }
+    layers.set_layer_cache_enabled(True)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dashboard paint time")
+    parser.add_argument("--frames", type=int, default=300, help="Frames per screen per mode")
+    parser.add_argument("--screens", nargs="+", help="Subset of screens (default: all)")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    names = args.screens or list(_screens())
+    unknown = set(names) - set(_screens())
+    if unknown:
+        parser.error(f"unknown screens: {', '.join(sorted(unknown))}")
+
+    results = run(names, args.frames)
+
+    print(f"{WIDTH}x{HEIGHT} offscreen, {args.frames} frames per screen")
+    print(f"{'screen':18} {'cached':>10} {'p99':>8} {'uncached':>10} {'p99':>8} {'speedup':>8}")
+    for name, r in results.items():
+        c, u = r["cached"], r["uncached"]
+        print(f"{name:18} {c['mean_ms']:>8.2f}ms {c['p99_ms']:>6.2f}ms "
+              f"{u['mean_ms']:>8.2f}ms {u['p99_ms']:>6.2f}ms {r['speedup']:>7.2f}x")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({
+            "size": [WIDTH, HEIGHT], "frames": args.frames, "results": results,
+        }, indent=2))
+        print(f"Saved: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""KiSTI — UI Render Benchmark: every dashboard screen, headless, JSON out.
+
+Builds the screens MainWindow stacks (Intelligent, Sport, Sharp, Sharp
+Track, DIFF, Track, KiSTI) under the Qt offscreen platform, feeds each one
+a DiffState stream — synthetic, or a session recorded in the DuckDB
+telemetry table — and renders N frames at 800x480. Per screen it reports:
+
+  - paint time percentiles (QWidget.render, children included)
+  - feed time (update_state / bridge refresh) percentiles
+  - allocations per frame: tracemalloc peak above the pre-frame baseline,
+    and net Python blocks retained (a leak shows up as a steady positive)
+  - Python hot spots: cProfile top functions under ui/, per frame
+
+Timing, allocation and profiling run as separate passes so the
+instrumentation doesn't inflate the paint numbers.
+
+--baseline compares against an earlier --json result and exits 1 when any
+screen's mean or p99 paint time regressed past --tolerance.
+
+Usage:
+    python3 scripts/ui_render_benchmark.py
+    python3 scripts/ui_render_benchmark.py --frames 600 --screens sharp diff
+    python3 scripts/ui_render_benchmark.py --db /data/duckdb/kisti.duckdb --session <id>
+    python3 scripts/ui_render_benchmark.py --json benchmarks/ui.json --baseline benchmarks/ui_main.json
+"""
+
+import argparse
+import cProfile
+import dataclasses
+import json
+import math
+import os
+import platform
+import pstats
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import PySide6  # noqa: E402
+from PySide6.QtGui import QImage  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from model.vehicle_state import DiffState, SIDriveMode, SurfaceState  # noqa: E402
+
+WIDTH, HEIGHT = 800, 480
+HOTSPOT_COUNT = 8
+
+# DuckDB telemetry column → DiffState field (where the names differ)
+_TELEMETRY_FIELDS = {
+    "wheel_fl": "wheel_speed_fl",
+    "wheel_fr": "wheel_speed_fr",
+    "wheel_rl": "wheel_speed_rl",
+    "wheel_rr": "wheel_speed_rr",
+    "lap_number": "lap_count",
+    "sector_index": "current_sector",
+}
+
+
+# ---------------------------------------------------------------------------
+# DiffState streams
+# ---------------------------------------------------------------------------
+
+def synthetic_state(i: int) -> DiffState:
+    """Plausible spirited-drive telemetry that changes every frame."""
+    phase = i * 0.1
+    return DiffState(
+        dccd_command_pct=50 + 40 * math.sin(phase),
+        slip_delta=3 * math.sin(phase * 0.7),
+        gear=3,
+        speed_kph=90 + 20 * math.sin(phase * 0.3),
+        throttle_pct=60 + 30 * math.sin(phase * 1.3),
+        rpm=4500 + 1500 * math.sin(phase * 0.5),
+        wheel_speed_fl=90.0, wheel_speed_fr=90.5, wheel_speed_rl=91.0, wheel_speed_rr=92.0,
+        brake_pressure_front=max(0.0, 40 * math.sin(phase * 0.4)),
+        imu_accel_x=0.6 * math.cos(phase), imu_accel_y=0.8 * math.sin(phase),
+        ambient_available=True, ambient_temp_c=14.2, ambient_humidity_pct=71.0,
+        ambient_pressure_hpa=1012.0,
+        can_connected=True,
+    )
+
+
+def synthetic_stream() -> Iterator[DiffState]:
+    i = 0
+    while True:
+        yield synthetic_state(i)
+        i += 1
+
+
+def telemetry_row_to_state(row: dict) -> DiffState:
+    """One DuckDB telemetry row → DiffState (unknown columns ignored)."""
+    fields = {f.name for f in dataclasses.fields(DiffState)}
+    kwargs = {}
+    for column, value in row.items():
+        if value is None:
+            continue
+        name = _TELEMETRY_FIELDS.get(column, column)
+        if name == "si_drive_mode":
+            value = next((m for m in SIDriveMode if m.label == value), SIDriveMode.SPORT)
+        elif name == "surface_state":
+            value = next((s for s in SurfaceState if s.label == value), SurfaceState.DRY)
+        if name in fields:
+            kwargs[name] = value
+    return DiffState(**kwargs)
+
+
+def load_recorded(db_path: Path, session_id: str) -> list[DiffState]:
+    """Telemetry rows for a recorded session, oldest first."""
+    import duckdb
+
+    conn = duckdb.connect(str(db_path), read_only=True)
+    try:
+        cursor = conn.execute(
+            "SELECT * FROM telemetry WHERE session_id = ? ORDER BY timestamp", [session_id],
+        )
+        cols = [d[0] for d in cursor.description]
+        return [telemetry_row_to_state(dict(zip(cols, r))) for r in cursor.fetchall()]
+    finally:
+        conn.close()
+
+
+def replay_stream(states: list[DiffState]) -> Iterator[DiffState]:
+    while True:
+        yield from states
+
+
+def fresh(snap: DiffState) -> DiffState:
+    """Stamp every staleness timestamp with now so screens render live data."""
+    now = time.monotonic()
+    for f in dataclasses.fields(DiffState):
+        if f.name.endswith("_ts"):
+            setattr(snap, f.name, now)
+    return snap
+
+
+# ---------------------------------------------------------------------------
+# Screens
+# ---------------------------------------------------------------------------
+
+class _ReplayBridge:
+    """Stands in for DiffStateBridge: snapshot() returns the current frame."""
+
+    def __init__(self) -> None:
+        self.state = DiffState()
+
+    def snapshot(self) -> DiffState:
+        return self.state
+
+
+def _state_screen(cls) -> Callable:
+    def build():
+        widget = cls()
+        return widget, widget.update_state
+    return build
+
+
+def _diff_screen():
+    from ui.diff_mode import DiffModeWidget
+
+    widget = DiffModeWidget()
+    bridge = _ReplayBridge()
+    widget.set_bridge(bridge)
+    widget._refresh_timer.stop()    # Driven per frame below, not by its 20 Hz timer
+
+    def feed(snap):
+        bridge.state = snap
+        widget._refresh()
+    return widget, feed
+
+
+def _track_screen():
+    from ui.track_mode import TrackModeWidget
+
+    widget = TrackModeWidget()
+    frame = [0]
+
+    def feed(snap):
+        frame[0] += 1
+        widget._track_map.set_progress(frame[0] / 600.0)
+        widget.update_timing(snap)
+    return widget, feed
+
+
+def _kisti_screen():
+    from ui.kisti_mode import KistiModeWidget
+
+    widget = KistiModeWidget()
+    widget.set_bridge(_ReplayBridge())
+    return widget, lambda snap: None
+
+
+def screen_factories() -> dict[str, Callable]:
+    """name → build() returning (widget, feed(snap)), in MainWindow stack order."""
+    from ui.intelligent_screen import IntelligentScreenWidget
+    from ui.sharp_screen import SportSharpScreenWidget
+    from ui.sharp_screen_track import SportSharpTrackScreenWidget
+    from ui.sport_screen import SportScreenWidget
+
+    return {
+        "intelligent": _state_screen(IntelligentScreenWidget),
+        "sport": _state_screen(SportScreenWidget),
+        "sharp": _state_screen(SportSharpScreenWidget),
+        "sharp_track": _state_screen(SportSharpTrackScreenWidget),
+        "diff": _diff_screen,
+        "track": _track_screen,
+        "kisti": _kisti_screen,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def percentiles(samples_ms: list[float]) -> dict:
+    ms = np.asarray(samples_ms, dtype=np.float64)
+    if not len(ms):
+        return {}
+    return {
+        "mean_ms": round(float(ms.mean()), 4),
+        "p50_ms": round(float(np.percentile(ms, 50)), 4),
+        "p90_ms": round(float(np.percentile(ms, 90)), 4),
+        "p99_ms": round(float(np.percentile(ms, 99)), 4),
+        "max_ms": round(float(ms.max()), 4),
+    }
+
+
+def _run_frames(widget, feed, stream, image, frames, on_frame=None):
+    for _ in range(frames):
+        snap = fresh(next(stream))
+        if on_frame is None:
+            feed(snap)
+            widget.render(image)
+        else:
+            on_frame(snap)
+
+
+def _timing_pass(widget, feed, stream, image, frames):
+    paint, fed = [], []
+
+    def frame(snap):
+        t0 = time.perf_counter()
+        feed(snap)
+        t1 = time.perf_counter()
+        widget.render(image)
+        t2 = time.perf_counter()
+        fed.append((t1 - t0) * 1000.0)
+        paint.append((t2 - t1) * 1000.0)
+
+    _run_frames(widget, feed, stream, image, frames, frame)
+    return percentiles(paint), percentiles(fed)
+
+
+def _alloc_pass(widget, feed, stream, image, frames):
+    peaks = []
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        def frame(snap):
+            base, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            feed(snap)
+            widget.render(image)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - base)
+
+        _run_frames(widget, feed, stream, image, frames, frame)
+    finally:
+        tracemalloc.stop()
+    retained = sys.getallocatedblocks() - blocks_before
+    kb = np.asarray(peaks, dtype=np.float64) / 1024.0
+    return {
+        "peak_kb_mean": round(float(kb.mean()), 2),
+        "peak_kb_p99": round(float(np.percentile(kb, 99)), 2),
+        "retained_blocks_per_frame": round(retained / max(frames, 1), 2),
+    }
+
+
+def _profile_pass(widget, feed, stream, image, frames, top=HOTSPOT_COUNT):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    _run_frames(widget, feed, stream, image, frames)
+    profiler.disable()
+
+    ui_dir = str(ROOT / "ui")
+    rows = []
+    for (path, line, func), (_cc, calls, tottime, cumtime, _callers) in pstats.Stats(profiler).stats.items():
+        if not path.startswith(ui_dir):
+            continue
+        rows.append({
+            "function": f"{os.path.relpath(path, ROOT)}:{line}({func})",
+            "calls_per_frame": round(calls / frames, 2),
+            "self_ms_per_frame": round(tottime * 1000.0 / frames, 4),
+            "cum_ms_per_frame": round(cumtime * 1000.0 / frames, 4),
+        })
+    rows.sort(key=lambda r: r["self_ms_per_frame"], reverse=True)
+    return rows[:top]
+
+
+def bench_screen(build: Callable, stream: Iterator[DiffState], frames: int,
+                 warmup: int = 10, profile: bool = True, allocs: bool = True) -> dict:
+    """All passes for one screen."""
+    widget, feed = build()
+    widget.resize(WIDTH, HEIGHT)
+    image = QImage(WIDTH, HEIGHT, QImage.Format.Format_ARGB32_Premultiplied)
+
+    _run_frames(widget, feed, stream, image, warmup)
+    paint, fed = _timing_pass(widget, feed, stream, image, frames)
+    result = {"paint": paint, "feed": fed}
+    if allocs:
+        result["alloc"] = _alloc_pass(widget, feed, stream, image, frames)
+    if profile:
+        result["hotspots"] = _profile_pass(widget, feed, stream, image, frames)
+    widget.deleteLater()
+    return result
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Regressions (human-readable) of results vs a baseline JSON document."""
+    regressions = []
+    for name, r in results["screens"].items():
+        base = baseline.get("screens", {}).get(name)
+        if not base:
+            continue
+        for key in ("mean_ms", "p99_ms"):
+            old, new = base["paint"].get(key), r["paint"].get(key)
+            if old and new and new > old * (1.0 + tolerance):
+                regressions.append(f"{name} paint {key}: {old:.3f} -> {new:.3f} (+{new / old - 1:.0%})")
+    return regressions
+
+
+def run(names: list[str], frames: int, stream_factory: Callable[[], Iterator[DiffState]],
+        source: str, profile: bool = True, allocs: bool = True) -> dict:
+    factories = screen_factories()
+    screens = {}
+    for name in names:
+        screens[name] = bench_screen(factories[name], stream_factory(), frames,
+                                     profile=profile, allocs=allocs)
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "size": [WIDTH, HEIGHT],
+            "frames": frames,
+            "source": source,
+            "python": platform.python_version(),
+            "pyside": PySide6.__version__,
+            "machine": platform.machine(),
+            "platform": os.environ.get("QT_QPA_PLATFORM", ""),
+        },
+        "screens": screens,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark every dashboard screen offscreen")
+    parser.add_argument("--frames", type=int, default=300, help="Frames per screen per pass")
+    parser.add_argument("--screens", nargs="+", help="Subset of screens (default: all)")
+    parser.add_argument("--db", type=Path, help="DuckDB file with recorded telemetry")
+    parser.add_argument("--session", help="Session id to replay from --db")
+    parser.add_argument("--no-profile", action="store_true", help="Skip the cProfile pass")
+    parser.add_argument("--no-alloc", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="Earlier --json result to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed paint-time growth vs baseline (default 0.15 = 15%%)")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    factories = screen_factories()
+    names = args.screens or list(factories)
+    unknown = set(names) - set(factories)
+    if unknown:
+        parser.error(f"unknown screens: {', '.join(sorted(unknown))}")
+
+    if args.db:
+        if not args.session:
+            parser.error("--db needs --session")
+        states = load_recorded(args.db, args.session)
+        if not states:
+            parser.error(f"no telemetry for session {args.session} in {args.db}")
+        source = f"recorded {args.session} ({len(states)} rows)"
+        stream_factory = lambda: replay_stream(states)  # noqa: E731
+    else:
+        source = "synthetic"
+        stream_factory = synthetic_stream
+
+    results = run(names, args.frames, stream_factory, source,
+                  profile=not args.no_profile, allocs=not args.no_alloc)
+
+    print(f"{WIDTH}x{HEIGHT} offscreen, {args.frames} frames per screen, {source}")
+    print(f"{'screen':12} {'mean':>8} {'p50':>8} {'p99':>8} {'max':>8} {'feed':>8} {'alloc':>9} {'retained':>9}")
+    for name, r in results["screens"].items():
+        paint, alloc = r["paint"], r.get("alloc", {})
+        alloc_s = f"{alloc['peak_kb_mean']:.1f}KB" if alloc else "-"
+        retained_s = f"{alloc['retained_blocks_per_frame']:+.1f}" if alloc else "-"
+        print(f"{name:12} {paint['mean_ms']:>6.2f}ms {paint['p50_ms']:>6.2f}ms {paint['p99_ms']:>6.2f}ms "
+              f"{paint['max_ms']:>6.2f}ms {r['feed']['mean_ms']:>6.2f}ms {alloc_s:>9} {retained_s:>9}")
+        for spot in r.get("hotspots", [])[:3]:
+            print(f"    {spot['self_ms_per_frame']:>7.3f}ms/frame  {spot['function']}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"Saved: {args.json}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""KiSTI — VAD Backend Benchmark: load time, memory, per-frame latency, parity.
+
+Each backend is loaded in a fresh interpreter so startup time and resident
+memory reflect what MicCapture pays for it (torch for "silero", ONNX Runtime
+for "silero_onnx"). Then every backend scores the same frames — WAV clips
+from scripts/record_wake_samples.py, or a synthetic capture when none are
+available — and frame decisions are compared against the first backend.
+
+Usage:
+    python3 scripts/vad_benchmark.py
+    python3 scripts/vad_benchmark.py --samples /tmp/kisti_wake_samples/real_positive/
+    python3 scripts/vad_benchmark.py --backends silero_onnx energy --json benchmarks/vad.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from voice.mic_capture import SOFTWARE_GAIN, SPEECH_THRESHOLD  # noqa: E402
+from voice.vad import FRAME_SAMPLES, SAMPLE_RATE, VAD_TYPES, load_vad  # noqa: E402
+
+DEFAULT_SAMPLES = Path("/tmp/kisti_wake_samples/real_positive/")
+
+# Run in a child process: load one backend, report load time and peak RSS
+_LOAD_PROBE = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.monotonic()
+from voice.vad import load_vad
+load_vad({name!r})
+load_ms = (time.monotonic() - t0) * 1000
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"load_ms": load_ms, "rss_mb": rss / 1024, "rss_delta_mb": (rss - base) / 1024}}))
+"""
+
+
+def load_wav_frames(path: Path, gain: int = SOFTWARE_GAIN) -> list[np.ndarray]:
+    """16kHz mono s16le WAV → gained int16 frames, as the mic loop sees them."""
+    with wave.open(str(path), "rb") as wf:
+        if wf.getframerate() != SAMPLE_RATE or wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+            raise ValueError(f"{path}: expected 16kHz mono 16-bit")
+        pcm = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    pcm = np.clip(pcm.astype(np.int32) * gain, -32768, 32767).astype(np.int16)
+    n = len(pcm) // FRAME_SAMPLES
+    return [pcm[i * FRAME_SAMPLES:(i + 1) * FRAME_SAMPLES] for i in range(n)]
+
+
+def synthetic_clips(count: int = 10, seed: int = 0) -> list[list[np.ndarray]]:
+    """2s clips: road noise, then a 0.8s speech-like burst in the middle."""
+    rng = np.random.default_rng(seed)
+    clips = []
+    n = 2 * SAMPLE_RATE // FRAME_SAMPLES * FRAME_SAMPLES
+    t = np.arange(n) / SAMPLE_RATE
+    for _ in range(count):
+        audio = rng.normal(0, 200, n)
+        burst = (t > 0.6) & (t < 1.4)
+        f0 = rng.uniform(110, 240)
+        audio += burst * 6000 * np.sin(2 * np.pi * f0 * t) * (1 + 0.6 * np.sin(2 * np.pi * 4 * t))
+        pcm = np.clip(audio, -32768, 32767).astype(np.int16)
+        clips.append([pcm[i:i + FRAME_SAMPLES] for i in range(0, n, FRAME_SAMPLES)])
+    return clips
+
+
+def frame_decisions(backend, frames: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """Per-frame speech decisions and CPU time (ns) for one clip."""
+    backend.reset_states()
+    decisions = np.zeros(len(frames), dtype=bool)
+    cpu = np.zeros(len(frames), dtype=np.int64)
+    for i, pcm in enumerate(frames):
+        samples = pcm.astype(np.float32) / 32768.0
+        t0 = time.thread_time_ns()
+        decisions[i] = backend.confidence(samples, pcm) > SPEECH_THRESHOLD
+        cpu[i] = time.thread_time_ns() - t0
+    return decisions, cpu
+
+
+def agreement(a: np.ndarray, b: np.ndarray) -> float:
+    """Fraction of frames where two decision tracks agree."""
+    return float(np.mean(a == b)) if len(a) else 1.0
+
+
+def measure_load(name: str) -> dict:
+    """Load time and RSS for one backend in a fresh interpreter."""
+    root = str(Path(__file__).resolve().parent.parent)
+    proc = subprocess.run(
+        [sys.executable, "-c", _LOAD_PROBE.format(root=root, name=name)],
+        capture_output=True, text=True, timeout=120,
+    )
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def run(backends: list[str], clips: list[list[np.ndarray]]) -> dict:
+    results: dict = {}
+    reference = None
+    for name in backends:
+        entry = {"load": measure_load(name)}
+        results[name] = entry
+        if "error" in entry["load"]:
+            continue
+        vad = load_vad(name)
+        tracks, cpu = [], []
+        for frames in clips:
+            decisions, ns = frame_decisions(vad, frames)
+            tracks.append(decisions)
+            cpu.append(ns)
+        all_cpu = np.concatenate(cpu) / 1000 if cpu else np.zeros(1)
+        entry["cpu_us_mean"] = round(float(all_cpu.mean()), 2)
+        entry["cpu_us_p99"] = round(float(np.percentile(all_cpu, 99)), 2)
+        entry["clips_with_speech"] = sum(bool(t.any()) for t in tracks)
+        entry["speech_frames"] = int(sum(t.sum() for t in tracks))
+        if reference is None:
+            reference = (name, tracks)
+        else:
+            entry["agreement_vs"] = reference[0]
+            entry["agreement"] = round(float(np.mean(
+                [agreement(a, b) for a, b in zip(reference[1], tracks)]
+            )), 4)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark VAD backends")
+    parser.add_argument("--samples", type=Path, default=DEFAULT_SAMPLES, help="Directory of WAV clips")
+    parser.add_argument("--backends", nargs="+", default=list(VAD_TYPES), choices=VAD_TYPES)
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    wavs = sorted(args.samples.glob("*.wav")) if args.samples.is_dir() else []
+    if wavs:
+        clips = [load_wav_frames(p) for p in wavs]
+        source = f"{len(wavs)} clips from {args.samples}"
+    else:
+        clips = synthetic_clips()
+        source = f"{len(clips)} synthetic clips (no WAVs in {args.samples})"
+
+    results = run(args.backends, clips)
+
+    print(f"Source: {source}")
+    print(f"{'backend':12} {'load':>8} {'rss':>8} {'cpu mean':>10} {'cpu p99':>10} {'speech':>7} {'agree':>7}")
+    for name, r in results.items():
+        load = r["load"]
+        if "error" in load:
+            print(f"{name:12} unavailable: {load['error']}")
+            continue
+        agree = f"{r['agreement']:.1%}" if "agreement" in r else "ref"
+        print(f"{name:12} {load['load_ms']:>6.0f}ms {load['rss_mb']:>6.0f}MB "
+              f"{r['cpu_us_mean']:>8.1f}us {r['cpu_us_p99']:>8.1f}us "
+              f"{r['clips_with_speech']:>3}/{len(clips):<3} {agree:>7}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"source": source, "results": results}, indent=2))
+        print(f"Saved: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
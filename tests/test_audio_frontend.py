@@ -0,0 +1,212 @@
+"""Tests for the mic ring-buffer audio front-end (voice/audio_frontend.py)."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from voice.audio_frontend import (
+    FRAME_SAMPLES, OWW_CHUNK_SAMPLES, AudioFrontEnd, ring_capacity,
+)
+
+
+def _frames(n: int, seed: int = 0, scale: int = 8000) -> list[bytes]:
+    rng = np.random.default_rng(seed)
+    return [rng.integers(-scale, scale, FRAME_SAMPLES, dtype=np.int16).tobytes() for _ in range(n)]
+
+
+def _legacy_gain(raw: bytes, gain: int) -> np.ndarray:
+    arr = np.frombuffer(raw, dtype=np.int16).astype(np.int32) * gain
+    return np.clip(arr, -32768, 32767).astype(np.int16)
+
+
+class TestRingCapacity:
+
+    def test_aligned_to_frame_and_oww_chunk(self):
+        cap = ring_capacity(323)
+        assert cap % FRAME_SAMPLES == 0
+        assert cap % OWW_CHUNK_SAMPLES == 0
+        assert cap >= 326 * FRAME_SAMPLES
+
+
+class TestAudioFrontEnd:
+
+    def test_gain_matches_legacy_clip(self):
+        fe = AudioFrontEnd(gain=3)
+        for raw in _frames(20, scale=20000):
+            fe.push(raw)
+            np.testing.assert_array_equal(fe.frame, _legacy_gain(raw, 3))
+
+    def test_vad_float_matches_legacy(self):
+        fe = AudioFrontEnd(gain=3)
+        for raw in _frames(5):
+            fe.push(raw)
+            expected = _legacy_gain(raw, 3).astype(np.float32) / 32768.0
+            np.testing.assert_array_equal(fe.vad_float, expected)
+
+    def test_vad_float_buffer_reused(self):
+        fe = AudioFrontEnd()
+        buf = fe.vad_float
+        for raw in _frames(3):
+            fe.push(raw)
+        assert fe.vad_float is buf
+
+    def test_short_frame_rejected(self):
+        fe = AudioFrontEnd()
+        assert not fe.push(b"\x00" * 10)
+        assert fe.written == 0
+
+    def test_fill_from_readinto(self):
+        data = b"".join(_frames(2))
+        pos = 0
+
+        def readinto(buf):
+            nonlocal pos
+            n = min(len(buf), 300, len(data) - pos)  # Short reads, like a pipe
+            buf[:n] = data[pos:pos + n]
+            pos += n
+            return n
+
+        fe = AudioFrontEnd()
+        assert fe.fill(readinto)
+        assert fe.fill(readinto)
+        assert not fe.fill(readinto)
+        assert fe.pcm(0) == data
+
+    def test_oww_chunks_match_legacy_bytes_buffer(self):
+        frames = _frames(400, scale=20000)  # Wraps the ring
+        fe = AudioFrontEnd(gain=3, max_frames=40)
+        legacy_buf = b""
+        legacy, ring = [], []
+        for i, raw in enumerate(frames):
+            if i == 123:  # OWW reset misaligns chunks with the ring
+                legacy_buf = b""
+                fe.reset_oww()
+            legacy_buf += _legacy_gain(raw, 3).tobytes()
+            while len(legacy_buf) >= OWW_CHUNK_SAMPLES * 2:
+                chunk, legacy_buf = legacy_buf[:OWW_CHUNK_SAMPLES * 2], legacy_buf[OWW_CHUNK_SAMPLES * 2:]
+                legacy.append((np.frombuffer(chunk, dtype=np.int16).astype(np.int32) // 3).astype(np.int16))
+            fe.push(raw)
+            ring.extend(c.copy() for c in fe.oww_chunks(undo_gain=True))
+        assert len(ring) == len(legacy)
+        for a, b in zip(legacy, ring):
+            np.testing.assert_array_equal(a, b)
+
+    def test_reset_mid_iteration_stops_chunks(self):
+        fe = AudioFrontEnd()
+        for raw in _frames(10):
+            fe.push(raw)
+        got = []
+        for chunk in fe.oww_chunks():
+            got.append(chunk)
+            fe.reset_oww()
+        assert len(got) == 1
+
+    def test_pcm_across_wrap(self):
+        frames = _frames(100)
+        fe = AudioFrontEnd(max_frames=20)
+        for raw in frames:
+            fe.push(raw)
+        start = fe.written - 15 * FRAME_SAMPLES
+        assert fe.pcm(start) == b"".join(frames[-15:])
+
+    def test_pcm_clamps_to_retained_audio(self):
+        frames = _frames(100)
+        fe = AudioFrontEnd(max_frames=20)
+        for raw in frames:
+            fe.push(raw)
+        assert len(fe.pcm(0)) == fe.capacity * 2
+
+    def test_rms(self):
+        fe = AudioFrontEnd()
+        samples = np.full(OWW_CHUNK_SAMPLES, 6000, dtype=np.int16)
+        assert fe.rms(samples) == 6000
+        legacy = int((samples.astype(np.float32) ** 2).mean() ** 0.5)
+        assert fe.rms(samples) == legacy
+
+    def test_stats_accumulate(self):
+        fe = AudioFrontEnd()
+        for raw in _frames(5):
+            fe.push(raw)
+            fe.frame_done()
+        fe.frame_done()  # No frame pending — ignored
+        assert fe.stats.frames == 5
+        assert fe.stats.max_cpu_ns >= fe.stats.cpu_ns / 5
+        assert "5 frames" in fe.stats.summary()
+
+
+class TestMicCaptureFrontEnd:
+
+    def _run(self, mic, voiced: list[bool], read_frames: list[bytes] | None = None):
+        frames = read_frames or _frames(len(voiced))
+        flags = iter(voiced)
+        it = iter(frames)
+        mic._vad = MagicMock()
+        mic._vad.confidence.side_effect = lambda *_: 1.0 if next(flags) else 0.0
+        mic._running = True
+        mic._vad_process(lambda n: next(it, b""), alive_fn=lambda: True)
+        return frames
+
+    def test_utterance_includes_pre_roll_without_duplicates(self):
+        from voice.mic_capture import (
+            MicCapture, PRE_ROLL_FRAMES, SPEECH_END_FRAMES, SPEECH_START_FRAMES,
+        )
+
+        mic = MicCapture(device="nonexistent")
+        captured = []
+        mic.speech_captured.connect(captured.append)
+        lead, speech = 20, 30
+        voiced = [False] * lead + [True] * speech + [False] * SPEECH_END_FRAMES
+        frames = self._run(mic, voiced)
+
+        trigger = lead + SPEECH_START_FRAMES - 1
+        first = trigger - PRE_ROLL_FRAMES
+        assert captured == [b"".join(frames[first:lead + speech + SPEECH_END_FRAMES])]
+
+    def test_pre_roll_stops_at_pause(self):
+        from voice.mic_capture import MicCapture, SPEECH_END_FRAMES, SPEECH_START_FRAMES
+
+        mic = MicCapture(device="nonexistent")
+        captured = []
+        mic.speech_captured.connect(captured.append)
+        voiced = [True] * (SPEECH_START_FRAMES + 20) + [False] * SPEECH_END_FRAMES
+        frames = self._run(mic, voiced)
+        assert captured == [b"".join(frames)]  # Nothing before frame 0 to pre-roll
+
+    def test_frontend_stats_exposed(self):
+        from voice.mic_capture import MicCapture
+
+        mic = MicCapture(device="nonexistent")
+        assert mic.frontend_stats is None
+        self._run(mic, [False] * 12)
+        assert mic.frontend_stats.frames == 12
+
+    def test_barge_in_echo_gate_skips_loud_chunks(self):
+        from voice.mic_capture import MicCapture
+
+        mic = MicCapture(device="nonexistent")
+        mic._oww = MagicMock()
+        mic._oww.predict.return_value = {"hey_jarvis": 0.99}
+        mic.set_barge_in_mode(True)
+        captured = []
+        mic.speech_captured.connect(captured.append)
+        loud = [np.full(FRAME_SAMPLES, 9000, dtype=np.int16).tobytes()] * 6
+        self._run(mic, [False] * 6, read_frames=loud)
+        mic._oww.predict.assert_not_called()
+        assert captured == []
+
+    def test_barge_in_wake_word_emits_frame(self):
+        from voice.mic_capture import MicCapture
+
+        mic = MicCapture(device="nonexistent")
+        mic._oww = MagicMock()
+        mic._oww.predict.return_value = {"hey_jarvis": 0.99}
+        mic.set_barge_in_mode(True)
+        captured = []
+        mic.speech_captured.connect(captured.append)
+        frames = self._run(mic, [False] * 3)
+        assert captured == [frames[2]]
+        assert mic.wake_detected
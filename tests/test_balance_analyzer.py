@@ -198,3 +198,29 @@ class TestBalanceAnalyzer:
         text, sentiment = ba.coaching_text()
         assert "rear" in text.lower() or "stepping" in text.lower()
         assert sentiment == "amber"
+
+    def test_native_rate_window_is_five_seconds(self):
+        ba = BalanceAnalyzer(sample_hz=50.0)
+        exp = expected_yaw_rate(20.0, 90.0)
+        for _ in range(249):
+            ba.feed(_snap(speed_mps=20.0, steering=90.0, gyro_z=exp * 0.7))
+        assert ba.coaching_text() == ("", "dim")        # Not yet a full 5 s
+        ba.feed(_snap(speed_mps=20.0, steering=90.0, gyro_z=exp * 0.7))
+        assert ba.coaching_text()[1] == "amber"
+        for _ in range(250):
+            ba.feed(_snap(speed_mps=20.0, steering=0.0, gyro_z=0.0))
+        assert ba.current_ratio() == pytest.approx(1.0)
+
+    def test_window_is_five_seconds_of_timestamps(self):
+        """Fed at 220 Hz (bridge emit rate), the window still spans 5 s."""
+        ba = BalanceAnalyzer(sample_hz=50.0)
+        exp = expected_yaw_rate(20.0, 90.0)
+        for i in range(1078):
+            ba.feed(_snap(speed_mps=20.0, steering=90.0, gyro_z=exp * 0.7), ts=i / 220.0)
+        assert ba.coaching_text() == ("", "dim")        # 1078 samples, only 4.9 s
+        for i in range(1078, 1100):
+            ba.feed(_snap(speed_mps=20.0, steering=90.0, gyro_z=exp * 0.7), ts=i / 220.0)
+        assert ba.coaching_text()[1] == "amber"
+        for i in range(1100, 2200):
+            ba.feed(_snap(speed_mps=20.0, steering=0.0, gyro_z=0.0), ts=i / 220.0)
+        assert ba.current_ratio() == pytest.approx(1.0)
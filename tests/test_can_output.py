@@ -0,0 +1,165 @@
+"""Tests for the deadline-scheduled CAN output thread (CanOutputThread)."""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from can.can_config import (
+    KISTI_ALERT_FRAME_ID,
+    LED_MODE_KITT,
+    LED_MODE_WAVEFORM,
+    LED_OUTPUT_FRAME_2_ID,
+    LED_OUTPUT_FRAME_ID,
+)
+from can.kisti_can import CanOutputThread
+from can.led_output import encode_led_output, encode_led_output_into
+
+
+class _Message:
+    """Minimal python-can Message stand-in."""
+
+    def __init__(self, arbitration_id, data, is_extended_id=False):
+        self.arbitration_id = arbitration_id
+        self.data = data
+
+
+class _Bus:
+
+    def __init__(self):
+        self.sent = []        # (arbitration_id, bytes, message object)
+
+    def send(self, msg):
+        self.sent.append((msg.arbitration_id, bytes(msg.data), msg))
+
+    def ids(self):
+        return [frame_id for frame_id, _, _ in self.sent]
+
+
+def _thread(**kwargs):
+    out = CanOutputThread(led_hz=30, keepalive_hz=5, alert_hz=10, **kwargs)
+    bus = _Bus()
+    out.prepare(_Message, 0.0)
+    return out, bus
+
+
+class TestEncodeInto:
+
+    def test_matches_encode_led_output(self):
+        f1, f2 = bytearray(8), bytearray(8)
+        encode_led_output_into(f1, f2, LED_MODE_WAVEFORM, [10, 20, 30], 230, 1, 2)
+        assert (bytes(f1), bytes(f2)) == encode_led_output(LED_MODE_WAVEFORM, [10, 20, 30], 230, 1, 2)
+
+
+class TestSchedule:
+
+    def test_first_step_sends_everything(self):
+        out, bus = _thread()
+        next_at = out.step(bus, 0.0)
+        assert bus.ids() == [LED_OUTPUT_FRAME_ID, LED_OUTPUT_FRAME_2_ID, KISTI_ALERT_FRAME_ID]
+        assert next_at == pytest.approx(1 / 30)
+
+    def test_unchanged_leds_only_at_keepalive(self):
+        out, bus = _thread()
+        t = 0.0
+        while t < 0.99:
+            t = out.step(bus, t)
+        led_sends = bus.ids().count(LED_OUTPUT_FRAME_ID)
+        assert led_sends == 5                   # 0.0, 0.2, 0.4, 0.6, 0.8
+        assert out.led_stats.suppressed == 30 - 5
+        assert bus.ids().count(KISTI_ALERT_FRAME_ID) == 10
+
+    def test_changed_leds_at_full_rate(self):
+        out, bus = _thread()
+        t, i = 0.0, 0
+        while t < 0.99:
+            i += 1
+            out.set_leds(LED_MODE_KITT, [i % 256] * 10, 255, 0, 0)
+            t = out.step(bus, t)
+        assert bus.ids().count(LED_OUTPUT_FRAME_ID) == 30
+        assert out.led_stats.suppressed == 0
+        last = [data for frame_id, data, _ in bus.sent if frame_id == LED_OUTPUT_FRAME_ID][-1]
+        assert last[0] == LED_MODE_KITT and last[1] == i
+
+    def test_led_frame_payload_sent_as_is(self):
+        from voice.led_waveform import LEDWaveformGenerator
+
+        out, bus = _thread()
+        frame = LEDWaveformGenerator().kitt_sweep_frame()
+        out.set_led_frame(frame)
+        out.step(bus, 0.0)
+        assert [d for f, d, _ in bus.sent if f != KISTI_ALERT_FRAME_ID] == list(frame.payload)
+
+    def test_messages_preallocated(self):
+        out, bus = _thread()
+        t = 0.0
+        for i in range(10):
+            out.set_leds(LED_MODE_KITT, [i] * 10)
+            t = out.step(bus, t)
+        led_msgs = {id(msg) for frame_id, _, msg in bus.sent if frame_id == LED_OUTPUT_FRAME_ID}
+        assert len(led_msgs) == 1
+
+    def test_late_steps_do_not_drift(self):
+        out, bus = _thread()
+        interval = 1 / 30
+        t = out.step(bus, 0.0)
+        for _ in range(20):
+            out.set_leds(LED_MODE_KITT, [int(t * 1000) % 256] * 10)
+            t = out.step(bus, t + 0.004)        # Every send 4 ms late
+        assert t == pytest.approx(21 * interval)   # Still on the original grid
+        stats = out.led_stats.as_dict()
+        assert stats["jitter_max_ms"] == pytest.approx(4.0, abs=0.01)
+        assert stats["missed"] == 0
+
+    def test_overrun_counts_missed_deadlines(self):
+        out, bus = _thread()
+        out.step(bus, 0.0)
+        out.set_leds(LED_MODE_KITT, [1] * 10)
+        next_at = out.step(bus, 0.1 + 0.001)    # ~3 deadlines late
+        assert out.led_stats.missed == 2
+        assert next_at == pytest.approx(4 / 30)
+
+    def test_alert_change_sent_immediately(self):
+        out, bus = _thread()
+        out.step(bus, 0.0)
+        bus.sent.clear()
+        out.set_alert_state("ICY", "")
+        assert out._wake.is_set()
+        out.step(bus, 0.01)                      # Before any periodic deadline
+        assert bus.ids() == [KISTI_ALERT_FRAME_ID]
+        assert bus.sent[0][1] == bytes([2])
+        assert out.alert_stats.immediate == 1
+        out.set_alert_state("ICY", "")           # Same status: no wake
+        out._wake.clear()
+        out.set_alert_state("FROSTY", "")        # Same encoded status (ICY)
+        assert not out._wake.is_set()
+
+
+class TestThread:
+
+    def test_loop_wakes_for_alert_and_stop(self):
+        # Periodic deadlines 100 s apart: only a wake can send the alert or end the loop in time
+        out = CanOutputThread(led_hz=0.01, keepalive_hz=0.01, alert_hz=0.01)
+        bus = _Bus()
+        first_sent, alert_sent = threading.Event(), threading.Event()
+
+        def send(msg):
+            _Bus.send(bus, msg)
+            first_sent.set()
+            if msg.arbitration_id == KISTI_ALERT_FRAME_ID and bytes(msg.data) == bytes([5]):
+                alert_sent.set()
+
+        bus.send = send
+        worker = threading.Thread(target=out._run_loop, args=(bus, _Message), daemon=True)
+        worker.start()
+        assert first_sent.wait(5.0)
+        out.set_alert_state("", "CLOSURE")
+        assert alert_sent.wait(5.0)
+        out.stop()
+        worker.join(5.0)
+        assert not worker.is_alive()
+        assert out.stats()["alert"]["immediate"] == 1
+        assert "LED" in out.summary()
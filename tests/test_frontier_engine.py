@@ -1,6 +1,7 @@
 """Tests for FrontierLLMEngine — WiFi-aware cloud LLM with DuckDB cache."""
 
 import json
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
@@ -11,6 +12,8 @@ from data.duckdb_store import DuckDBStore
 from voice.frontier_engine import (
     FRONTIER_CACHE_DDL,
     FrontierLLMEngine,
+    SentenceAccumulator,
+    SentenceStream,
 )
 from voice.llm_engine import LLMEngine, LLMResponse
 
@@ -496,3 +499,230 @@ class TestLLMEngineIntegration:
         response = engine.query("How's your boost?")
         assert response.tier == "persona_match"
         assert response.model == "persona_keywords"
+
+
+# ---- Streaming (SSE) ----
+
+def _sse_events(text_chunks: list[str]) -> list[bytes]:
+    """Build a Messages API SSE event sequence for the given text deltas."""
+    events = [
+        ("message_start", {"type": "message_start", "message": {"id": "msg_1"}}),
+        ("content_block_start", {"type": "content_block_start", "index": 0,
+                                 "content_block": {"type": "text", "text": ""}}),
+    ]
+    for chunk in text_chunks:
+        events.append(("content_block_delta", {
+            "type": "content_block_delta", "index": 0,
+            "delta": {"type": "text_delta", "text": chunk},
+        }))
+    events.append(("content_block_stop", {"type": "content_block_stop", "index": 0}))
+    events.append(("message_stop", {"type": "message_stop"}))
+    return [f"event: {name}\ndata: {json.dumps(data)}\n\n".encode() for name, data in events]
+
+
+@pytest.fixture
+def sse_server():
+    """Local stand-in for the Messages API that streams SSE events.
+
+    Set ``server.chunks`` before querying; ``server.delay_s`` spaces events
+    out; ``server.sent`` counts events actually written before disconnect.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            self.server.requests.append(json.loads(self.rfile.read(length)))
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for event in _sse_events(self.server.chunks):
+                try:
+                    self.wfile.write(event)
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    return
+                self.server.sent += 1
+                time.sleep(self.server.delay_s)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.chunks = []
+    server.delay_s = 0.0
+    server.sent = 0
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/v1/messages"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stream_engine(db_conn, sse_server):
+    e = FrontierLLMEngine(api_key="test-key", db_conn=db_conn, api_url=sse_server.url)
+    e._running = True
+    e._wifi_available = True
+    return e
+
+
+class TestSentenceAccumulator:
+
+    def test_sentence_completes_on_trailing_whitespace(self):
+        acc = SentenceAccumulator()
+        assert acc.feed("Boost is ") == []
+        assert acc.feed("18 PSI.") == []  # Could still be "18 PSI.5"
+        assert acc.feed(" Oil is") == ["Boost is 18 PSI."]
+        assert acc.flush() == ["Oil is"]
+
+    def test_multiple_sentences_in_one_delta(self):
+        acc = SentenceAccumulator()
+        assert acc.feed("One. Two! Three? Fo") == ["One.", "Two!", "Three?"]
+        assert acc.flush() == ["Fo"]
+
+    def test_markdown_stripped_per_sentence(self):
+        acc = SentenceAccumulator()
+        assert acc.feed("**Bold** claim. ") == ["Bold claim."]
+
+    def test_paragraph_break_is_boundary(self):
+        acc = SentenceAccumulator()
+        assert acc.feed("Heading\n\nBody") == ["Heading"]
+
+    def test_flush_empty(self):
+        assert SentenceAccumulator().flush() == []
+
+
+class TestSentenceStream:
+
+    def test_iterates_until_closed(self):
+        stream = SentenceStream()
+        stream.put("One.")
+        stream.put("Two.")
+        stream.close()
+        assert list(stream) == ["One.", "Two."]
+        assert stream.text == "One. Two."
+
+    def test_first_sentence_callback_once(self):
+        calls = []
+        stream = SentenceStream(on_first_sentence=lambda: calls.append(1))
+        stream.put("One.")
+        stream.put("Two.")
+        assert calls == [1]
+        assert stream.first_sentence_at > 0
+
+    def test_cancel_rejects_put_and_ends_iteration(self):
+        stream = SentenceStream()
+        stream.put("One.")
+        stream.cancel()
+        assert stream.put("Two.") is False
+        assert list(stream) == []
+        assert stream.cancelled
+
+    def test_consumer_receives_across_threads(self):
+        stream = SentenceStream()
+
+        def produce():
+            for s in ("A.", "B.", "C."):
+                time.sleep(0.01)
+                stream.put(s)
+            stream.close()
+
+        threading.Thread(target=produce).start()
+        assert list(stream) == ["A.", "B.", "C."]
+
+
+class TestStreamingQuery:
+
+    def test_sentences_streamed_in_order(self, stream_engine, sse_server):
+        sse_server.chunks = ["Turbo lag is ", "spool time. ", "Bigger turbos ", "lag more."]
+        stream = SentenceStream()
+        result = stream_engine.query("What is turbo lag?", stream=stream)
+
+        assert result is not None
+        assert result.tier == "frontier_live"
+        assert result.text == "Turbo lag is spool time. Bigger turbos lag more."
+        assert list(stream) == ["Turbo lag is spool time.", "Bigger turbos lag more."]
+        assert sse_server.requests[0]["stream"] is True
+
+    def test_first_token_before_first_sentence(self, stream_engine, sse_server):
+        sse_server.chunks = ["Short ", "answer. ", "More."]
+        stream = SentenceStream()
+        stream_engine.query("q", stream=stream)
+        assert 0 < stream.first_token_at <= stream.first_sentence_at
+
+    def test_first_sentence_arrives_before_stream_ends(self, stream_engine, sse_server):
+        """Time-to-first-sentence is bounded by the first delta, not the full response."""
+        sse_server.chunks = ["First sentence. "] + ["word "] * 10 + ["end."]
+        sse_server.delay_s = 0.03
+        stream = SentenceStream()
+        start = time.monotonic()
+        result = stream_engine.query("q", stream=stream)
+        total = time.monotonic() - start
+
+        assert result is not None
+        assert stream.first_sentence_at - start < total / 2
+
+    def test_sport_sharp_cancels_after_one_sentence(self, stream_engine, sse_server):
+        sse_server.chunks = ["Brakes hot. ", "Cool them. ", "Then push."] + ["x"] * 20
+        sse_server.delay_s = 0.02
+        stream = SentenceStream()
+        result = stream_engine.query("brakes?", si_drive_mode="Sport #", stream=stream)
+
+        assert result.text == "Brakes hot."
+        assert list(stream) == ["Brakes hot."]
+        time.sleep(0.1)
+        # Server was cut off well before the end of its event list
+        assert sse_server.sent < len(_sse_events(sse_server.chunks))
+
+    def test_sport_truncates_to_two_sentences(self, stream_engine, sse_server):
+        sse_server.chunks = ["One. Two. Three. Four."]
+        stream = SentenceStream()
+        result = stream_engine.query("q", si_drive_mode="Sport", stream=stream)
+        assert result.text == "One. Two."
+        assert list(stream) == ["One.", "Two."]
+
+    def test_consumer_cancel_stops_stream_and_skips_cache(self, stream_engine, sse_server):
+        sse_server.chunks = ["One. ", "Two. ", "Three. "]
+        sse_server.delay_s = 0.02
+        stream = SentenceStream(on_first_sentence=lambda: stream.cancel())
+        result = stream_engine.query("cancel me", stream=stream)
+
+        assert result.text == "One."
+        assert stream_engine._check_cache(stream_engine._hash_query("cancel me")) is None
+
+    def test_streamed_response_cached(self, stream_engine, sse_server):
+        sse_server.chunks = ["Cached ", "answer."]
+        stream_engine.query("cache me", stream=SentenceStream())
+        cached = stream_engine._check_cache(stream_engine._hash_query("cache me"))
+        assert cached == "Cached answer."
+
+    def test_cache_hit_does_not_stream(self, stream_engine):
+        qhash = stream_engine._hash_query("cached")
+        stream_engine._cache_response(qhash, "cached", "From cache.", "haiku")
+        stream = SentenceStream()
+        result = stream_engine.query("cached", stream=stream)
+        assert result.tier == "frontier_cache"
+        assert not stream.started
+        assert list(stream) == []  # Closed on return
+
+    def test_stream_network_error_returns_none(self, db_conn):
+        e = FrontierLLMEngine(api_key="k", db_conn=db_conn, api_url="http://127.0.0.1:9/v1/messages")
+        e._running = True
+        e._wifi_available = True
+        stream = SentenceStream()
+        assert e.query("q", stream=stream) is None
+        assert list(stream) == []
+
+    def test_llm_engine_passes_stream_to_frontier(self):
+        mock_frontier = MagicMock()
+        mock_frontier.query.return_value = LLMResponse(
+            text="Answer.", model="m", tier="frontier_live", latency_s=0.1, tokens=1,
+        )
+        engine = LLMEngine(frontier=mock_frontier)
+        engine._running = True
+        stream = SentenceStream()
+        engine.query("what is the capital of Mongolia", stream=stream)
+        assert mock_frontier.query.call_args.kwargs["stream"] is stream
@@ -8,6 +8,7 @@ Tests cover:
   - point_in_radius: inside, outside, on boundary
   - cumulative_distance: empty, single, straight line, known circuit
   - bearing: cardinal directions, diagonal, wrap-around
+  - LocalFrame / TimingLine: projection round trip, crossings match line_segment_crossing
 """
 
 import math
@@ -19,6 +20,8 @@ import pytest
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from timing.geo import (
+    LocalFrame,
+    TimingLine,
     bearing,
     cumulative_distance,
     haversine_distance,
@@ -361,3 +364,55 @@ class TestBearing:
         """Bearing is always in [0, 360)."""
         b = bearing(45.0, -122.0, 44.0, -123.0)  # SW
         assert 0 <= b < 360
+
+
+# ── LocalFrame / TimingLine ─────────────────────────────────────────
+
+class TestLocalFrame:
+    def test_origin_is_zero(self):
+        frame = LocalFrame(36.5841, -121.7534)
+        assert frame.project(36.5841, -121.7534) == (0.0, 0.0)
+
+    def test_round_trip(self):
+        frame = LocalFrame(36.5841, -121.7534)
+        lat, lon = frame.unproject(*frame.project(36.5872, -121.7501))
+        assert lat == pytest.approx(36.5872, abs=1e-12)
+        assert lon == pytest.approx(-121.7501, abs=1e-12)
+
+    def test_distance_matches_haversine(self):
+        """Projected distance agrees with haversine across a circuit-sized area."""
+        frame = LocalFrame(36.5841, -121.7534)
+        a = (36.5841 + 0.004, -121.7534 - 0.006)
+        b = (a[0] + 0.00002, a[1] + 0.00003)           # ~3.3 m step, ~700 m out
+        (ax, ay), (bx, by) = frame.project(*a), frame.project(*b)
+        assert math.hypot(bx - ax, by - ay) == pytest.approx(haversine_distance(*a, *b), rel=1e-3)
+
+
+class TestTimingLine:
+    def test_matches_line_segment_crossing(self):
+        """Precompiled crossings agree with the per-call lat/lon version."""
+        import random
+
+        rng = random.Random(7)
+        frame = LocalFrame(36.5841, -121.7534)
+        hits = 0
+        for _ in range(2000):
+            line = [36.5841 + rng.uniform(-3e-4, 3e-4), -121.7534 + rng.uniform(-3e-4, 3e-4),
+                    36.5841 + rng.uniform(-3e-4, 3e-4), -121.7534 + rng.uniform(-3e-4, 3e-4)]
+            path = [36.5841 + rng.uniform(-3e-4, 3e-4), -121.7534 + rng.uniform(-3e-4, 3e-4)]
+            path += [path[0] + rng.uniform(-1e-4, 1e-4), path[1] + rng.uniform(-1e-4, 1e-4)]
+            expected = line_segment_crossing(*path, *line)
+            compiled = TimingLine.from_latlon(frame, *line)
+            got = compiled.crossing(*frame.project(*path[:2]), *frame.project(*path[2:]))
+            assert (got is None) == (expected is None)
+            if expected is not None:
+                hits += 1
+                assert got == pytest.approx(expected, abs=1e-6)
+        assert hits > 50
+
+    def test_bounding_box_reject(self):
+        line = TimingLine(0.0, -10.0, 0.0, 10.0)
+        assert line.crossing(-1.0, 11.0, 1.0, 12.0) is None     # Above the line
+        assert line.crossing(5.0, 0.0, 6.0, 0.0) is None        # Beside it
+        assert line.crossing(-1.0, 0.0, 1.0, 0.0) == pytest.approx(0.5)
+        assert line.crossing(1.0, 0.0, -3.0, 0.0) == pytest.approx(0.25)   # Either direction
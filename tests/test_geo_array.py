@@ -0,0 +1,127 @@
+"""Tests for the NumPy whole-trace geometry — timing/geo_array.py.
+
+Array results are checked against the scalar timing.geo functions on the
+same inputs.
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+
+from timing import geo_array
+from timing.geo import (
+    LocalFrame,
+    TimingLine,
+    bearing,
+    cumulative_distance,
+    haversine_distance,
+    perpendicular_line,
+)
+
+_LAT, _LON = 45.0, -122.0
+_M_LAT = 111_320.0
+_M_LON = _M_LAT * math.cos(math.radians(_LAT))
+
+
+def _trace(n: int = 200, jitter_m: float = 0.5, seed: int = 3) -> list[tuple[float, float]]:
+    """A ~1.3 km circle (radius 200 m) starting due east of centre, anticlockwise."""
+    rng = random.Random(seed)
+    return [
+        (_LAT + (200.0 * math.sin(2 * math.pi * k / n) + rng.gauss(0, jitter_m)) / _M_LAT,
+         _LON + (200.0 * math.cos(2 * math.pi * k / n) + rng.gauss(0, jitter_m)) / _M_LON)
+        for k in range(n)
+    ]
+
+
+class TestAgainstScalar:
+
+    def test_distances_and_bearings(self):
+        trace = _trace()
+        lats, lons = geo_array.split_trace(trace)
+        d = geo_array.haversine_distances(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        b = geo_array.bearings(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        for i, (p, q) in enumerate(zip(trace, trace[1:])):
+            assert d[i] == pytest.approx(haversine_distance(*p, *q), abs=1e-9)
+            assert b[i] == pytest.approx(bearing(*p, *q), abs=1e-9)
+
+    def test_cumulative_distance(self):
+        trace = _trace()
+        cum = geo_array.cumulative_distances(*geo_array.split_trace(trace))
+        expected = [0.0]
+        for p, q in zip(trace, trace[1:]):
+            expected.append(expected[-1] + haversine_distance(*p, *q))
+        assert cum.tolist() == pytest.approx(expected, abs=1e-6)
+        assert cumulative_distance(trace) == pytest.approx(expected, abs=1e-6)   # Scalar wrapper
+        assert cumulative_distance([]) == []
+        assert geo_array.cumulative_distances([_LAT], [_LON]).tolist() == [0.0]
+
+    def test_smoothed_bearings_use_five_point_window(self):
+        trace = _trace(50)
+        headings = geo_array.smoothed_bearings(*geo_array.split_trace(trace))
+        n = len(trace)
+        for i in (0, 1, 25, n - 2, n - 1):
+            expected = bearing(*trace[max(0, i - 2)], *trace[min(n - 1, i + 2)])
+            assert headings[i] == pytest.approx(expected, abs=1e-9)
+
+    def test_perpendicular_lines(self):
+        lat1, lon1, lat2, lon2 = geo_array.perpendicular_lines([_LAT, _LAT + 0.01], [_LON, _LON], [30.0, 200.0], 12.0)
+        for i, (lat, heading) in enumerate(((_LAT, 30.0), (_LAT + 0.01, 200.0))):
+            (a_lat, a_lon), (b_lat, b_lon) = perpendicular_line(lat, _LON, heading, 12.0)
+            assert (lat1[i], lon1[i], lat2[i], lon2[i]) == pytest.approx((a_lat, a_lon, b_lat, b_lon), abs=1e-12)
+
+    def test_segment_crossings_match_timing_line(self):
+        trace = _trace(400)
+        frame = LocalFrame(_LAT, _LON)
+        line = TimingLine.from_latlon(frame, _LAT, _LON - 250 / _M_LON, _LAT, _LON - 150 / _M_LON)
+        xs, ys = geo_array.project(frame, *geo_array.split_trace(trace))
+        idx, frac = geo_array.segment_crossings(xs, ys, line)
+        expected = [
+            (i, line.crossing(*frame.project(*trace[i]), *frame.project(*trace[i + 1])))
+            for i in range(len(trace) - 1)
+        ]
+        expected = [(i, f) for i, f in expected if f is not None]
+        assert len(expected) == 1                      # Halfway round, due west
+        assert idx.tolist() == [i for i, _ in expected]
+        assert frac.tolist() == pytest.approx([f for _, f in expected])
+
+
+class TestTraceOperations:
+
+    def test_interpolate_at_distance(self):
+        m_lat = LocalFrame(_LAT, _LON).m_per_deg_lat          # Haversine scale
+        lats = [_LAT, _LAT + 100 / m_lat, _LAT + 300 / m_lat]
+        lons = [_LON] * 3
+        cum = geo_array.cumulative_distances(lats, lons)
+        lat, _, seg = geo_array.interpolate_at_distance(lats, lons, cum, [50.0, 200.0, 1e6])
+        assert seg.tolist() == [0, 1, 1]
+        assert (lat - _LAT) * m_lat == pytest.approx([50.0, 200.0, 300.0])
+
+    def test_resample_by_distance(self):
+        lats, lons = geo_array.split_trace(_trace(1000, jitter_m=0.0))
+        r_lats, r_lons, dist = geo_array.resample_by_distance(lats, lons, 10.0)
+        total = geo_array.cumulative_distances(lats, lons)[-1]
+        assert dist[0] == 0.0 and dist[-1] == pytest.approx(total)
+        assert np.diff(dist)[:-1] == pytest.approx(10.0)
+        steps = geo_array.step_distances(r_lats, r_lons)
+        assert steps[:-1] == pytest.approx(10.0, abs=0.05)     # Chords of a 200 m circle
+        assert (r_lats[-1], r_lons[-1]) == (lats[-1], lons[-1])
+        with pytest.raises(ValueError):
+            geo_array.resample_by_distance(lats, lons, 0.0)
+
+    def test_smooth_trace_reduces_jitter_and_keeps_ends(self):
+        trace = _trace(500)
+        lats, lons = geo_array.split_trace(trace)
+        s_lats, s_lons = geo_array.smooth_trace(lats, lons, window=9)
+        raw = geo_array.cumulative_distances(lats, lons)[-1]
+        smooth = geo_array.cumulative_distances(s_lats, s_lons)[-1]
+        assert smooth < raw                                       # Jitter zig-zag removed
+        assert smooth == pytest.approx(2 * math.pi * 200.0, rel=0.05)
+        assert (s_lats[0], s_lons[0]) == (lats[0], lons[0])
+        assert (s_lats[-1], s_lons[-1]) == (lats[-1], lons[-1])
+        assert geo_array.smooth_trace(lats[:2], lons[:2])[0].tolist() == lats[:2].tolist()
@@ -119,6 +119,17 @@ class TestGripAnalyzer:
         ga.feed(_snap(gps_mps=20.0, rl=90.0, rr=90.0))
         assert ga.rear_grip_pct() < 0.9
 
+    def test_smoothing_follows_timestamps(self):
+        """0.3 s of slip settles the same whether fed at 50 Hz or 220 Hz."""
+        slow, fast = GripAnalyzer(sample_hz=50.0), GripAnalyzer(sample_hz=50.0)
+        slow.feed(_snap(), ts=0.0)
+        fast.feed(_snap(), ts=0.0)
+        for i in range(1, 16):
+            slow.feed(_snap(rl=90.0, rr=90.0), ts=i / 50.0)
+        for i in range(1, 67):
+            fast.feed(_snap(rl=90.0, rr=90.0), ts=i / 220.0)
+        assert fast.rear_grip_pct() == pytest.approx(slow.rear_grip_pct(), abs=0.01)
+
     def test_no_advisory_normal(self):
         ga = GripAnalyzer()
         ga.feed(_snap())
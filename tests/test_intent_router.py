@@ -0,0 +1,156 @@
+"""Tests for the compiled intent router (voice/intent_router.py)."""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from voice.intent_router import IntentRouter, KeywordTable, KeywordTrie, SlotPattern
+
+
+class TestKeywordTrie:
+
+    def test_nested_keywords_all_reported(self):
+        trie = KeywordTrie(["temp", "oil temp", "oil temperature", "temperature"])
+        assert trie.scan("what's my oil temperature") == {
+            "temp", "oil temp", "oil temperature", "temperature",
+        }
+
+    def test_prefix_backtracking(self):
+        trie = KeywordTrie(["abc", "abcdef"])
+        assert trie.scan("xxabcdexx") == {"abc"}
+
+    def test_overlapping_occurrences(self):
+        trie = KeywordTrie(["aa", "ab", "ba"])
+        assert trie.scan("aaba") == {"aa", "ab", "ba"}
+
+    def test_substring_semantics_preserved(self):
+        trie = KeywordTrie(["accelerat", " i "])
+        assert trie.scan("how's my acceleration") == {"accelerat"}
+        assert trie.scan("do i have boost") == {" i "}
+
+    def test_regex_metacharacters_escaped(self):
+        trie = KeywordTrie(["what's it like", "p 2 p", "a.b"])
+        assert trie.scan("axb") == frozenset()
+        assert trie.scan("a.b and what's it like") == {"a.b", "what's it like"}
+
+    def test_empty(self):
+        assert KeywordTrie([]).scan("anything") == frozenset()
+        assert KeywordTrie(["oil"]).scan("") == frozenset()
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        keywords = ["a", "ab", "abc", "bc", "c a", "temp", "temperature", "my ", " i "]
+        trie = KeywordTrie(keywords)
+        for _ in range(2000):
+            text = "".join(rng.choice("abc tempraui my") for _ in range(rng.randint(0, 30)))
+            assert trie.scan(text) == {kw for kw in keywords if kw in text}, text
+
+
+class TestKeywordTable:
+
+    ENTRIES = [
+        (["brake", "brakes"], "brakes", "safety"),
+        (["boost"], "boost", "tech"),
+        (["brakes", "fade"], "fade", "tech"),
+        (["joke", "joke"], "joke", "fun"),
+    ]
+
+    def _best(self, text, allowed=None):
+        table = KeywordTable(self.ENTRIES)
+        score, index = table.best(KeywordTrie(table.keywords).scan(text), allowed)
+        return score, (table.entries[index][1] if index is not None else None)
+
+    def test_sum_of_matched_lengths(self):
+        assert self._best("my brakes") == (11, "brakes")
+
+    def test_tie_goes_to_first_entry(self):
+        table = KeywordTable([(["oil"], "first", "tech"), (["oil"], "second", "tech")])
+        assert table.best(frozenset({"oil"})) == (3, 0)
+
+    def test_duplicate_keywords_count_twice(self):
+        assert self._best("tell me a joke") == (8, "joke")
+
+    def test_allowed_categories(self):
+        assert self._best("brakes fade", allowed={"tech"}) == (10, "fade")
+
+    def test_no_match(self):
+        assert self._best("nothing here") == (0, None)
+
+
+class TestIntentRouter:
+
+    def _router(self):
+        return IntentRouter(
+            {
+                "cmd.quiet": ("be quiet",),
+                "sensor.oil": ("oil temp", "oil"),
+                "sensor.temp": ("temp",),
+            },
+            slots=[SlotPattern(
+                name="cmd.lap", trigger="lap",
+                pattern=re.compile(r"lap (\d+)|reference (\d+)"), convert=int,
+            )],
+        )
+
+    def test_intents_ranked_by_group_order(self):
+        route = self._router().route("oil temp please, be quiet")
+        assert route.intents == ("cmd.quiet", "sensor.oil", "sensor.temp")
+        assert route.intent == "cmd.quiet"
+        assert "sensor.temp" in route
+
+    def test_family(self):
+        route = self._router().route("what's my oil")
+        assert route.family("sensor.")
+        assert not route.family("cmd.")
+
+    def test_slot_extracted_and_converted(self):
+        route = self._router().route("use lap 3")
+        assert route.slots == {"cmd.lap": 3}
+        assert route.family("cmd.")
+        assert route.intent is None
+
+    def test_slot_requires_trigger(self):
+        assert self._router().route("reference 3").slots == {}
+
+
+class TestVoiceRouting:
+    """The VoiceManager tables route exactly as the linear scans did."""
+
+    def test_test_voice_corpus_identical(self):
+        from scripts.intent_router_benchmark import DEFAULT_CORPUS, compare, extract_utterances
+
+        utterances = extract_utterances(DEFAULT_CORPUS)
+        assert len(utterances) > 50
+        assert compare(utterances) == []
+
+    def test_reference_lap_slot(self):
+        from voice.voice_manager import _INTENT_ROUTER
+
+        assert _INTENT_ROUTER.route("use lap 3 as reference").slots == {"timing_cmd.reference_lap": 3}
+        assert _INTENT_ROUTER.route("reference lap 12").slots == {"timing_cmd.reference_lap": 12}
+        assert _INTENT_ROUTER.route("my last lap").slots == {}
+
+    def test_deactivate_ranks_disable_before_enable(self):
+        from voice.voice_manager import _INTENT_ROUTER
+
+        route = _INTENT_ROUTER.route("deactivate cloud")
+        assert route.intents[:2] == ("cloud_cmd.disable", "cloud_cmd.enable")
+
+    def test_unrouted_query_skips_handlers(self):
+        from unittest.mock import MagicMock
+
+        from voice.voice_manager import VoiceManager
+
+        vm = VoiceManager(enable_mic=False)
+        vm._stream_frontier = False
+        vm._timing_manager = MagicMock()
+        vm._answer_from_timing = MagicMock(return_value=None)
+        vm._answer_from_sensors = MagicMock(return_value=None)
+        vm._handle_timing_command = MagicMock(return_value=None)
+        vm.handle_voice_query("who are you")
+        vm._handle_timing_command.assert_not_called()
+        vm._answer_from_timing.assert_not_called()
+        vm._answer_from_sensors.assert_not_called()
@@ -0,0 +1,220 @@
+"""Tests for the post-session lap comparison engine — analysis/lap_analytics.py.
+
+Test classes:
+  - TestResample: timed laps only, common grid, vectorized interpolation
+  - TestCorners: apexes, min speed, braking points, where time was lost
+  - TestCache: Parquet per session, invalidated by new laps; track-wide view
+  - TestConsumers: ParkedDebrief summary + voice "where did I lose time"
+"""
+
+import math
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from analysis import lap_analytics
+from analysis.lap_analytics import LapAnalytics, analyze, find_corners, load_laps, resample_laps
+from data.duckdb_store import DuckDBStore
+
+_LAP_M = 1200.0
+_APEXES = (400.0, 850.0)
+_HZ = 10.0
+
+
+def _speed(d: float, extra_loss_kph: float = 0.0) -> float:
+    """Two corners; *extra_loss_kph* makes the second one slower."""
+    return (160.0
+            - 70.0 * math.exp(-((d - _APEXES[0]) / 60.0) ** 2)
+            - (50.0 + extra_loss_kph) * math.exp(-((d - _APEXES[1]) / 50.0) ** 2))
+
+
+def _insert_lap(store, sid, lap_number, t0, extra_loss_kph=0.0, brake_early_m=0.0, timed=True,
+                lap_m=_LAP_M, track_id="circle") -> float:
+    """Telemetry for one lap at 10 Hz from *t0*; returns the end time."""
+    dt = 1.0 / _HZ
+    cols = {k: [] for k in ("ts", "speed", "brake", "dist")}
+    t, d = t0, 0.0
+    while d < lap_m:
+        v = _speed(d, extra_loss_kph)
+        braking = any(a - 100.0 - brake_early_m <= d <= a - 20.0 for a in _APEXES)
+        for k, val in zip(cols, (t, v, 40.0 if braking else 0.0, d)):
+            cols[k].append(val)
+        step = v / 3.6 * dt
+        if d + step >= lap_m:
+            t_end = t + dt * (lap_m - d) / step
+            break
+        d += step
+        t += dt
+    store._conn.register("rows", {k: np.asarray(v) for k, v in cols.items()})
+    store._conn.execute(
+        "INSERT INTO telemetry (timestamp, session_id, speed_kph, throttle_pct, brake_pressure, "
+        "steering_angle, lateral_g, lap_number, lap_distance_m) "
+        f"SELECT make_timestamp((ts * 1e6)::BIGINT), '{sid}', speed, 100.0 - brake, brake, 0.0, 0.5, "
+        f"{lap_number}, dist FROM rows"
+    )
+    store._conn.unregister("rows")
+    if timed:
+        store.record_lap_time(sid, track_id, lap_number, t_end - t0)
+    return t_end
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = DuckDBStore(db_path=tmp_path / "kisti.duckdb")
+    s.open()
+    yield s
+    s.close()
+
+
+@pytest.fixture
+def session(store):
+    """Out-lap (untimed), laps 1-4 (3 is slow into corner 2, brakes 25 m early), partial in-lap."""
+    sid = store.start_session(session_type="track")
+    t = _insert_lap(store, sid, 0, 1_700_000_000.0, timed=False, lap_m=700.0)
+    for lap in range(1, 5):
+        slow = lap == 3
+        t = _insert_lap(store, sid, lap, t, extra_loss_kph=15.0 if slow else 0.0,
+                        brake_early_m=25.0 if slow else 0.0)
+    _insert_lap(store, sid, 5, t, lap_m=500.0)        # Timed by mistake but only half a lap
+    return sid
+
+
+class TestResample:
+
+    def test_timed_full_laps_on_common_grid(self, store, session):
+        overlay = resample_laps(load_laps(store._conn, session_id=session))
+        assert overlay.lap_numbers.tolist() == [1, 2, 3, 4]
+        assert overlay.distance_m[0] == 0.0 and np.allclose(np.diff(overlay.distance_m), 5.0)
+        assert overlay.distance_m[-1] <= _LAP_M
+        assert overlay.elapsed_s.shape == overlay.channels["speed_kph"].shape == (4, len(overlay.distance_m))
+        # Interpolated elapsed time at the grid end ≈ lap time
+        assert np.allclose(overlay.elapsed_s[:, -1], overlay.lap_times_s, atol=0.15)
+        assert overlay.channels["speed_kph"][0, 0] == pytest.approx(_speed(0.0), abs=0.5)
+
+    def test_time_delta_vs_best(self, store, session):
+        overlay = resample_laps(load_laps(store._conn, session_id=session))
+        delta = overlay.time_delta()
+        assert np.all(delta[overlay.best] == 0.0)
+        slow = overlay.row(3)
+        assert delta[slow, -1] == pytest.approx(overlay.lap_times_s[slow] - overlay.lap_times_s.min(), abs=0.15)
+        before = overlay.distance_m < _APEXES[1] - 200
+        assert np.abs(delta[slow, before]).max() < 0.1       # Same pace until corner 2
+
+    def test_no_laps(self, store):
+        assert resample_laps(load_laps(store._conn, session_id="none")) is None
+
+
+class TestCorners:
+
+    def test_apexes_found(self):
+        d = np.arange(0.0, _LAP_M, 5.0)
+        corners = find_corners(d, np.array([_speed(x) for x in d]))
+        assert [c.number for c in corners] == [1, 2]
+        assert [c.apex_m for c in corners] == pytest.approx(list(_APEXES), abs=5.0)
+        assert corners[0].start_m == 0.0 and corners[1].end_m == d[-1]
+        assert corners[0].end_m == corners[1].start_m          # Windows tile the lap
+
+    def test_min_speed_braking_and_time_lost(self, store, session):
+        analysis = analyze(load_laps(store._conn, session_id=session))
+        ct, slow = analysis.corners, analysis.overlay.row(3)
+        assert ct.min_speed_kph[0] == pytest.approx([90.0, 110.0], abs=1.0)
+        assert ct.min_speed_kph[slow, 1] == pytest.approx(95.0, abs=1.0)
+        assert ct.brake_point_m[0] == pytest.approx([a - 100.0 for a in _APEXES], abs=10.0)
+        assert ct.brake_point_m[slow, 1] == pytest.approx(ct.brake_point_m[0, 1] - 25.0, abs=10.0)
+        # Corner times tile the lap
+        assert ct.time_s.sum(axis=1) == pytest.approx(analysis.overlay.elapsed_s[:, -1], abs=1e-6)
+        (corner, lost), = analysis.time_lost(lap_number=3)
+        assert corner.number == 2 and lost > 0.1
+        assert analysis.time_lost(lap_number=1) == []
+
+    def test_summary_is_json_friendly(self, store, session):
+        import json
+
+        summary = analyze(load_laps(store._conn, session_id=session)).summary()
+        json.dumps(summary)
+        assert summary["laps"] == 4 and summary["best_lap"]["lap"] in (1, 2, 4)
+        assert summary["time_lost"][0]["corner"] == 2
+        assert summary["theoretical_best_s"] <= summary["best_lap"]["time_s"] + 0.15
+
+
+class TestCache:
+
+    def test_parquet_written_and_reused(self, store, session, tmp_path, monkeypatch):
+        analytics = LapAnalytics(store)
+        first = analytics.session(session)
+        cache = tmp_path / "lap_analytics"
+        assert sorted(p.name for p in cache.iterdir()) == [
+            f"{session}.5.corners.parquet", f"{session}.5.overlay.parquet"]
+
+        monkeypatch.setattr(lap_analytics, "analyze", MagicMock(side_effect=AssertionError("recomputed")))
+        again = LapAnalytics(store).session(session)
+        assert again.overlay.lap_numbers.tolist() == first.overlay.lap_numbers.tolist()
+        assert np.allclose(again.overlay.elapsed_s, first.overlay.elapsed_s)
+        assert np.allclose(again.overlay.channels["brake_pressure"], first.overlay.channels["brake_pressure"])
+        assert np.allclose(again.corners.time_s, first.corners.time_s)
+        assert [c.number for c, _ in again.time_lost()] == [c.number for c, _ in first.time_lost()]
+
+        rows = duckdb.connect().execute(
+            f"SELECT count(*), max(delta_s) FROM read_parquet('{cache}/*.overlay.parquet')"
+        ).fetchone()
+        assert rows[0] == first.overlay.elapsed_s.size and rows[1] > 0.1
+
+    def test_new_lap_invalidates(self, store, session, tmp_path):
+        analytics = LapAnalytics(store)
+        analytics.session(session)
+        end = store._conn.execute(
+            "SELECT max(epoch(timestamp)) FROM telemetry WHERE session_id = ?", [session]).fetchone()[0]
+        _insert_lap(store, session, 6, end + 1.0)
+        analysis = analytics.session(session)
+        assert analysis.overlay.lap_numbers.tolist() == [1, 2, 3, 4, 6]
+        assert {p.name.split(".")[1] for p in (tmp_path / "lap_analytics").iterdir()} == {"6"}
+        assert analytics.latest is analysis
+
+    def test_quote_in_cache_dir(self, store, session, tmp_path):
+        cache = tmp_path / "o'brien"
+        first = LapAnalytics(store, cache_dir=cache).session(session)
+        assert len(list(cache.glob("*.parquet"))) == 2
+        again = LapAnalytics(store, cache_dir=cache).session(session)
+        assert np.allclose(again.overlay.elapsed_s, first.overlay.elapsed_s)
+
+    def test_session_without_laps(self, store):
+        sid = store.start_session()
+        assert LapAnalytics(store).session(sid) is None
+
+    def test_track_across_sessions(self, store, session):
+        other = store.start_session(session_type="track")
+        t = 1_800_000_000.0
+        for lap in (1, 2):
+            t = _insert_lap(store, other, lap, t)
+        _insert_lap(store, store.start_session(), 1, 1_900_000_000.0, track_id="elsewhere")
+        analysis = LapAnalytics(store).track("circle")
+        assert analysis.overlay.lap_count == 6
+        assert set(analysis.overlay.session_ids) == {session, other}
+        assert analysis.overlay.row(1, session_id=other) is not None
+
+
+class TestConsumers:
+
+    def test_parked_debrief_includes_laps(self, store, session):
+        from analysis.parked_debrief import ParkedDebrief
+
+        summary = ParkedDebrief(store, lap_analytics=LapAnalytics(store)).build_session_summary(session)
+        assert summary["laps"]["laps"] == 4
+        assert "laps" not in ParkedDebrief(store).build_session_summary(session)
+
+    def test_voice_where_did_i_lose_time(self, store, session):
+        from voice.voice_manager import VoiceManager
+
+        vm = VoiceManager.__new__(VoiceManager)
+        vm._lap_analytics = LapAnalytics(store)
+        assert vm._answer_session_time_lost() is None           # Nothing analysed yet
+        vm._lap_analytics.session(session)
+        answer = vm._answer_session_time_lost()
+        assert answer.startswith("Last session, 4 laps. Most time lost at corner 2 at 8")
@@ -0,0 +1,226 @@
+"""Tests for lap-level brake and corner event extraction — coaching/lap_events.py.
+
+Test classes:
+  - TestExtraction: braking zones + corners per lap, metrics, noise filtering
+  - TestDistanceIndex: bisect matching, tolerance, start/finish wrap-around
+  - TestMatching: repeat visits share corner ids across laps and sessions
+  - TestPersistence: lap_events table round trip, telemetry replay == live
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+
+from coaching.lap_events import DistanceIndex, LapEventExtractor, events_from_telemetry
+
+_HZ = 50.0
+_LAP_S = 50.0
+# (brake on, hold end, brake off, steer in, steer out) seconds into the lap
+_CORNERS = ((10.0, 11.5, 13.0, 12.0, 16.0), (32.0, 33.0, 34.0, 33.5, 38.0))
+
+
+def _ramp(t: float, a: float, b: float) -> float:
+    """0 before a, linear to 1 at b."""
+    return min(1.0, max(0.0, (t - a) / (b - a)))
+
+
+def _sample(t: float, early_s: float = 0.0):
+    """(speed, pressure, accel_x, accel_y, steering) at *t* seconds into a lap."""
+    speed, pressure, steer = 150.0, 0.0, 0.0
+    for on, hold, off, turn_in, turn_out in _CORNERS:
+        on -= early_s
+        if on <= t < off:
+            pressure = 40.0 * _ramp(t, on, on + 0.1) * (1.0 - _ramp(t, hold, off))
+        steer = max(steer, 60.0 * _ramp(t, turn_in, turn_in + 0.2) * (1.0 - _ramp(t, turn_out, turn_out + 0.2)))
+        if on <= t < turn_out:
+            speed = min(speed, 150.0 - 70.0 * _ramp(t, on, off))
+    if 40.0 <= t < 40.1:
+        pressure = 30.0                               # Pedal tap: shorter than MIN_EVENT_S
+    return speed, pressure, -pressure / 40.0, steer / 75.0, steer
+
+
+def _stream(laps=3, early_lap=2, early_s=0.2, t0=1_700_000_000.0):
+    """50 Hz rows (ts, lap, dist, speed, front, rear, ax, ay, steer): 10 s out-lap, then *laps* laps."""
+    rows, ts = [], t0
+    for lap in range(0, laps + 1):
+        dist, duration = 0.0, 10.0 if lap == 0 else _LAP_S
+        for i in range(int(duration * _HZ)):
+            t = i / _HZ
+            speed, p, ax, ay, steer = _sample(t, early_s if lap == early_lap else 0.0)
+            rows.append((ts, lap, dist, speed, p, 0.6 * p, ax, ay, steer))
+            dist += speed / 3.6 / _HZ
+            ts += 1.0 / _HZ
+    return rows
+
+
+def _extract(rows, **kwargs):
+    extractor = LapEventExtractor(**kwargs)
+    for row in rows:
+        extractor.feed(*row)
+    extractor.finish()
+    return extractor.drain()
+
+
+class TestExtraction:
+
+    def test_two_brake_zones_and_two_corners_per_lap(self):
+        events = _extract(_stream())
+        assert {e.lap_number for e in events} == {1, 2, 3}           # Out-lap ignored
+        for lap in (1, 2, 3):
+            lap_events = [e for e in events if e.lap_number == lap]
+            assert [e.kind for e in lap_events] == ["brake", "corner", "brake", "corner"]   # Tap dropped
+
+    def test_brake_zone_metrics(self):
+        brake = next(e for e in _extract(_stream()) if e.kind == "brake")
+        assert brake.peak_pressure_bar == pytest.approx(40.0)        # Max of front / rear
+        assert brake.peak_decel_g == pytest.approx(1.0)
+        assert brake.duration_s == pytest.approx(2.9, abs=0.05)
+        assert brake.release_rate_bar_s == pytest.approx(40.0 / 1.5, rel=0.05)
+        # Trail braking: steering past 20° at ~12.07 s until release at ~12.93 s
+        assert brake.trail_overlap_s == pytest.approx(0.86, abs=0.05)
+        assert brake.start_m < brake.apex_m <= brake.end_m
+        assert brake.entry_speed_kph == pytest.approx(150.0, abs=1.0)
+
+    def test_corner_metrics(self):
+        corner = next(e for e in _extract(_stream()) if e.kind == "corner")
+        assert corner.min_speed_kph == pytest.approx(80.0, abs=1.0)
+        assert corner.peak_lateral_g == pytest.approx(0.8)
+        assert corner.duration_s == pytest.approx(4.1, abs=0.1)
+        assert corner.trail_overlap_s == pytest.approx(0.86, abs=0.05)
+        assert corner.release_rate_bar_s == 0.0
+        assert corner.exit_speed_kph == pytest.approx(150.0)
+
+    def test_lap_change_closes_open_event(self):
+        extractor = LapEventExtractor()
+        for i in range(50):
+            extractor.feed(i / _HZ, 1, 1000.0 + i, 100.0, 30.0, 0.0, -0.8, 0.0, 0.0)
+        extractor.feed(1.0, 2, 0.0, 100.0, 30.0, 0.0, -0.8, 0.0, 0.0)
+        (event,) = extractor.drain()
+        assert event.lap_number == 1 and event.end_m == 1049.0
+
+    def test_logger_pause_not_counted(self):
+        extractor = LapEventExtractor()
+        feeds = [(i / _HZ, 30.0) for i in range(5)] + [(10.0 + i / _HZ, 30.0 - 10 * i) for i in range(4)]
+        for ts, pressure in feeds:                      # 0.08 s, 10 s pause, then 0.06 s release
+            extractor.feed(ts, 1, 100.0, 100.0, pressure, 0.0, -0.8, 0.0, 0.0)
+        assert extractor.drain() == []                  # 0.14 s of braking: a tap, not 10 s
+        feeds = [(20.0 + i / _HZ, 40.0) for i in range(10)] + [(30.0 + i / _HZ, 40.0 - 10 * i) for i in range(5)]
+        for ts, pressure in feeds:                      # 0.18 s at peak, pause, 0.08 s release
+            extractor.feed(ts, 1, 100.0, 100.0, pressure, 0.0, -0.8, 0.0, 0.0)
+        (event,) = extractor.drain()
+        assert event.duration_s == pytest.approx(0.26)
+        assert event.release_rate_bar_s == pytest.approx(40.0 / 0.08)
+
+
+class TestDistanceIndex:
+
+    def test_nearest_within_tolerance(self):
+        index = DistanceIndex(tolerance_m=40.0)
+        assert [index.match(d) for d in (500.0, 100.0, 900.0)] == [1, 2, 3]
+        assert index.match(130.0) == 2 and index.match(870.0) == 3 and index.match(525.0) == 1
+        assert index.match(300.0) == 4                               # Nothing within 40 m
+        assert index.find(700.0) is None and len(index) == 4
+
+    def test_wraps_across_start_finish(self):
+        index = DistanceIndex(tolerance_m=40.0, lap_length_m=1000.0)
+        index.add(990.0, 7)
+        assert index.find(15.0) == 7
+        assert DistanceIndex(tolerance_m=40.0).match(15.0) == 1       # No lap length → no wrap
+
+    def test_distances_past_one_lap(self):
+        """Missed S/F crossing: lap distance runs on past the lap length."""
+        index = DistanceIndex(tolerance_m=40.0, lap_length_m=2000.0)
+        for ref_id, dist in enumerate((100.0, 700.0, 1300.0, 1800.0), start=1):
+            index.add(dist, ref_id)
+        assert [index.find(d) for d in (2700.0, 3300.0, 3800.0, 4110.0)] == [2, 3, 4, 1]
+        assert index.find(4500.0) is None
+        assert index.match(4500.0) == 5 and index.find(500.0) == 5   # Stored within one lap
+
+
+class TestMatching:
+
+    def test_same_ids_across_laps(self):
+        events = _extract(_stream())
+        for kind in ("brake", "corner"):
+            ids = [[e.corner_id for e in events if e.kind == kind and e.lap_number == lap] for lap in (1, 2, 3)]
+            assert ids == [[1, 2]] * 3
+        early = [e for e in events if e.kind == "brake" and e.lap_number == 2]
+        late = [e for e in events if e.kind == "brake" and e.lap_number == 1]
+        assert early[0].start_m < late[0].start_m - 5.0             # Braked earlier, same zone
+
+    def test_references_keep_ids_across_sessions(self):
+        extractor = LapEventExtractor()
+        extractor.set_references([("corner", 5, 1330.0), ("corner", 4, 490.0), ("brake", 9, 1000.0)])
+        for row in _stream(laps=1):
+            extractor.feed(*row)
+        extractor.finish()
+        corners = [e for e in extractor.drain() if e.kind == "corner"]
+        assert [e.corner_id for e in corners] == [4, 5]
+
+
+    def test_references_set_after_events_close(self):
+        extractor = LapEventExtractor()
+        for row in _stream(laps=1):
+            extractor.feed(*row)
+        extractor.finish()
+        extractor.set_references([("corner", 4, 490.0), ("corner", 5, 1330.0)])   # Track detected late
+        corners = [e for e in extractor.drain() if e.kind == "corner"]
+        assert [e.corner_id for e in corners] == [4, 5]
+
+
+class TestPersistence:
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        pytest.importorskip("duckdb")
+        from data.duckdb_store import DuckDBStore
+
+        s = DuckDBStore(db_path=tmp_path / "kisti.duckdb")
+        s.open()
+        yield s
+        s.close()
+
+    def test_round_trip_and_references(self, store):
+        sid = store.start_session(session_type="track")
+        events = _extract(_stream())
+        assert store.record_lap_events(sid, "circle", events) == len(events) == 12
+        rows = store.get_lap_events(session_id=sid, kind="corner", corner_id=2)
+        assert [r["lap_number"] for r in rows] == [1, 2, 3]
+        assert rows[0]["min_speed_kph"] == pytest.approx(80.0, abs=1.0)
+        refs = store.get_lap_event_references("circle")
+        assert [(k, i) for k, i, _ in refs] == [("brake", 1), ("brake", 2), ("corner", 1), ("corner", 2)]
+        assert "lap_events" in store.db_stats()
+
+    def test_references_circular_mean_across_start_finish(self, store):
+        sid = store.start_session(session_type="track")
+        events = _extract(_stream(laps=1))[:2]
+        for event, apex in zip(events, (5.0, 1995.0)):
+            event.kind, event.corner_id, event.apex_m = "corner", 1, apex
+        store.record_lap_events(sid, "circle", events)
+        ((_, _, apex),) = store.get_lap_event_references("circle", lap_length_m=2000.0)
+        assert min(apex, 2000.0 - apex) == pytest.approx(0.0, abs=1e-6)
+        ((_, _, naive),) = store.get_lap_event_references("circle")
+        assert naive == pytest.approx(1000.0)
+
+    def test_replay_matches_live(self, store):
+        sid = store.start_session(session_type="track")
+        rows = _stream()
+        cols = ("ts", "lap", "dist", "speed", "front", "rear", "ax", "ay", "steer")
+        store._conn.register("stream", {c: np.array(v) for c, v in zip(cols, zip(*rows))})
+        store._conn.execute(
+            "INSERT INTO telemetry (timestamp, session_id, lap_number, lap_distance_m, speed_kph, "
+            "brake_pressure_front, brake_pressure_rear, imu_accel_x, imu_accel_y, steering_angle) "
+            f"SELECT make_timestamp(round(ts * 1e6)::BIGINT), '{sid}', lap, dist, speed, front, rear, "
+            "ax, ay, steer FROM stream"
+        )
+        live = _extract(rows)
+        replay = events_from_telemetry(store._conn, sid)
+        assert [(e.kind, e.lap_number, e.corner_id) for e in replay] == \
+               [(e.kind, e.lap_number, e.corner_id) for e in live]
+        for a, b in zip(replay, live):
+            assert a.start_m == pytest.approx(b.start_m)
+            assert a.trail_overlap_s == pytest.approx(b.trail_overlap_s, abs=1e-3)
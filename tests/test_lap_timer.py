@@ -34,6 +34,7 @@ Test classes:
   - TestPointToPoint (4 tests)
   - TestReset (2 tests)
   - TestEdgeCases (5 tests)
+  - TestTimingSnapshot (4 tests)
 """
 
 import math
@@ -50,6 +51,7 @@ from timing.lap_timer import (
     ReferenceLap,
     TimingEvent,
     TimingEventType,
+    TimingSnapshot,
 )
 from timing.track_db import SectorDefinition, StartFinishLine, TrackDefinition
 
@@ -943,3 +945,59 @@ class TestEdgeCases:
             timer.update(lat, lon, ts)
         d2 = timer.get_current_distance()
         assert d2 >= d1
+
+
+class TestTimingSnapshot:
+    """Incremental aggregates and the versioned immutable snapshot."""
+
+    def test_same_object_until_an_event(self):
+        timer = _timer_with_track()
+        pts = _generate_multi_lap_points(1)
+        timer.update(*pts[0])
+        snap = timer.snapshot()
+        assert isinstance(snap, TimingSnapshot)
+        assert timer.snapshot() is snap
+        timer.update(*pts[1])                       # Plain fix: nothing event-driven changed
+        assert timer.snapshot() is snap
+        with pytest.raises(AttributeError):
+            snap.lap_count = 3                      # Frozen
+
+    def test_version_bumps_on_sector_and_lap(self):
+        timer = _timer_with_track()
+        versions = []
+        kinds = []
+        for lat, lon, ts in _generate_multi_lap_points(2):
+            before = timer.version
+            events = timer.update(lat, lon, ts)
+            if timer.version != before:
+                versions.append(timer.snapshot())
+                kinds.append([e.event_type for e in events])
+        # Timing start, then per lap: 3 sectors + lap complete
+        assert len(versions) == 1 + 2 * 4
+        assert kinds[0] == [] and versions[0].lap_in_progress
+        assert kinds[4] == [TimingEventType.LAP_COMPLETE]
+        assert versions[4].lap_count == 2 and versions[4].best_lap_s is not None
+        assert [v.version for v in versions] == sorted({v.version for v in versions})
+
+    def test_aggregates_match_completed_laps(self):
+        timer = _timer_with_track()
+        _feed_points(timer, _generate_multi_lap_points(4, speed_factors=[1.0, 0.8, 1.3, 0.9]))
+        laps = timer._completed_laps
+        assert timer.best_lap_s == min(lap.total_time for lap in laps)
+        n = len(timer._sectors)
+        brute = [min(lap.sector_times[i] for lap in laps) for i in range(n)]
+        assert timer.get_best_sector_times() == brute
+        assert timer.get_theoretical_best() == pytest.approx(sum(brute))
+        snap = timer.snapshot()
+        assert snap.best_sector_times == tuple(brute)
+        assert snap.theoretical_best_s == timer.get_theoretical_best()
+
+    def test_reset_clears_aggregates(self):
+        timer = _timer_with_track()
+        _feed_points(timer, _generate_multi_lap_points(1))
+        version = timer.version
+        timer.set_track(_make_track(), _make_sectors())
+        snap = timer.snapshot()
+        assert snap.version > version
+        assert snap.best_lap_s is None and snap.theoretical_best_s is None
+        assert snap.best_sector_times == (None, None, None)
@@ -0,0 +1,157 @@
+"""Tests for static-layer caching (ui/layers.py) and cached theme paint objects."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QApplication
+
+from model.vehicle_state import DiffState
+from ui import layers, theme
+from ui.layers import StaticLayer
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture(autouse=True)
+def cache_enabled():
+    layers.set_layer_cache_enabled(True)
+    yield
+    layers.set_layer_cache_enabled(True)
+
+
+def _paint_into(layer, size=(40, 30), key=None):
+    image = QImage(*size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.black)
+    p = QPainter(image)
+    layer.draw(p, key)
+    p.end()
+    return image
+
+
+def _red_fill(p):
+    p.fillRect(0, 0, 10, 10, theme.color("#FF0000"))
+
+
+class TestStaticLayer:
+
+    def test_built_once_and_blitted(self, qapp):
+        layer = StaticLayer(_red_fill)
+        for _ in range(3):
+            image = _paint_into(layer)
+        assert layer.builds == 1
+        assert image.pixelColor(5, 5).name() == "#ff0000"
+        assert image.pixelColor(20, 20).name() == "#000000"  # Transparent outside content
+
+    def test_rebuilt_on_resize_key_and_theme(self, qapp):
+        layer = StaticLayer(_red_fill)
+        _paint_into(layer)
+        _paint_into(layer, size=(50, 30))
+        assert layer.builds == 2
+        _paint_into(layer, size=(50, 30), key="wet")
+        assert layer.builds == 3
+        theme.theme_changed()
+        _paint_into(layer, size=(50, 30), key="wet")
+        assert layer.builds == 4
+        layer.invalidate()
+        _paint_into(layer, size=(50, 30), key="wet")
+        assert layer.builds == 5
+
+    def test_region_layer_keeps_target_coordinates(self, qapp):
+        def paint(p):
+            p.fillRect(20, 10, 5, 5, theme.color("#00FF00"))
+
+        layer = StaticLayer(paint, rect=QRectF(15, 5, 20, 20))
+        image = _paint_into(layer)
+        assert image.pixelColor(22, 12).name() == "#00ff00"
+        assert image.pixelColor(5, 5).name() == "#000000"
+
+    def test_disabled_paints_directly(self, qapp):
+        calls = []
+
+        def paint(p):
+            calls.append(1)
+            _red_fill(p)
+
+        layers.set_layer_cache_enabled(False)
+        layer = StaticLayer(paint)
+        _paint_into(layer)
+        image = _paint_into(layer)
+        assert len(calls) == 2 and layer.builds == 0
+        assert image.pixelColor(5, 5).name() == "#ff0000"
+
+
+class TestThemeAccessors:
+
+    def test_cached_objects_reused(self, qapp):
+        assert theme.color("#00BFFF") is theme.color("#00BFFF")
+        assert theme.font(10, bold=True) is theme.font(10, bold=True)
+        assert theme.pen("#00BFFF", 2) is theme.pen("#00BFFF", 2)
+        assert theme.brush("#00BFFF") is theme.brush("#00BFFF")
+
+    def test_values(self, qapp):
+        assert theme.color("#00BFFF", alpha=30).alpha() == 30
+        assert theme.color((255, 0, 0)).name() == "#ff0000"
+        assert theme.font(10, bold=True).bold()
+        dash = theme.pen("#FFFFFF", 1.5, Qt.PenStyle.DashLine, alpha=40)
+        assert dash.widthF() == 1.5 and dash.style() == Qt.PenStyle.DashLine
+        assert dash.color().alpha() == 40
+
+    def test_theme_changed_clears_caches(self, qapp):
+        before = theme.color("#123456")
+        generation = theme.theme_generation()
+        theme.theme_changed()
+        assert theme.theme_generation() == generation + 1
+        assert theme.color("#123456") is not before
+
+
+class TestScreensUseLayers:
+
+    def test_g_ellipse_chrome_shared_between_frames(self, qapp):
+        from ui.g_force_ellipse import _CHROME_LAYERS
+        from ui.sharp_screen import SportSharpScreenWidget
+
+        screen = SportSharpScreenWidget()
+        screen.resize(800, 480)
+        screen.update_state(DiffState())
+        screen.grab()
+        builds = sum(layer.builds for layer in _CHROME_LAYERS.values())
+        screen.grab()
+        assert _CHROME_LAYERS
+        assert sum(layer.builds for layer in _CHROME_LAYERS.values()) == builds
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_cached_widgets_paint(self, qapp, enabled):
+        from ui.diff_mode import _TorqueSilhouette
+        from ui.intelligent_screen import IntelligentScreenWidget
+        from ui.widgets.sti_heatmap_widget import StiHeatmapWidget
+        from ui.widgets.track_map_widget import TrackMapWidget
+
+        layers.set_layer_cache_enabled(enabled)
+        for cls in (IntelligentScreenWidget, _TorqueSilhouette, StiHeatmapWidget, TrackMapWidget):
+            widget = cls()
+            widget.resize(400, 300)
+            assert not widget.grab().isNull()
+            assert not widget.grab().isNull()
+
+    def test_layer_rebuilt_after_resize(self, qapp):
+        from ui.diff_mode import _TorqueSilhouette
+
+        widget = _TorqueSilhouette()
+        widget.resize(200, 300)
+        widget.grab()
+        widget.grab()
+        assert widget._body_layer.builds == 1
+        widget.resize(240, 320)
+        widget.grab()
+        assert widget._body_layer.builds == 2
@@ -0,0 +1,183 @@
+"""Tests for main-thread timing instrumentation (ui/loop_monitor.py)."""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from PySide6.QtCore import QEventLoop, QObject, QTimer, Signal
+from PySide6.QtGui import QPainter
+from PySide6.QtWidgets import QApplication, QWidget
+
+from ui.loop_monitor import OTHER, LoopMonitor
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _spin(ms):
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+class _Engine(QObject):
+    """Subsystem with an internal timer, like AlertEngine."""
+
+    def __init__(self):
+        super().__init__()
+        self.ticks = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(5)
+        self._timer.timeout.connect(self._tick)
+
+    def _tick(self):
+        self.ticks += 1
+        time.sleep(0.002)
+
+
+class _Bridge(QObject):
+    state_changed = Signal()
+
+
+class _Painted(QWidget):
+
+    def paintEvent(self, event):  # noqa: N802
+        p = QPainter(self)
+        p.fillRect(0, 0, 10, 10, 0)
+        p.end()
+
+
+class TestSlotTiming:
+
+    def test_wrap_records_and_returns(self, qapp):
+        monitor = LoopMonitor(interval_ms=33.3)
+        timed = monitor.wrap("work", lambda x: x * 2)
+        assert timed(21) == 42
+        assert monitor.subsystems["work"].total == 1
+
+    def test_nested_time_counts_once(self, qapp):
+        monitor = LoopMonitor(interval_ms=33.3)
+        inner = monitor.wrap("inner", lambda: time.sleep(0.01))
+
+        def outer():
+            time.sleep(0.002)
+            inner()
+        monitor.wrap("outer", outer)()
+        assert monitor.subsystems["outer"].max_ms >= 12      # Inclusive histogram
+        assert monitor._window["inner"] >= 10
+        assert monitor._window["outer"] < 8                  # Self time only
+
+    def test_rewire_existing_connection(self, qapp):
+        monitor = LoopMonitor(interval_ms=33.3)
+        bridge, engine = _Bridge(), _Engine()
+        bridge.state_changed.connect(engine._tick)
+        monitor.rewire(bridge.state_changed, engine._tick, "timing")
+        bridge.state_changed.emit()
+        assert engine.ticks == 1
+        assert monitor.subsystems["timing"].total == 1
+
+
+class TestWatch:
+
+    def test_subsystem_timers(self, qapp):
+        monitor = LoopMonitor(interval_ms=33.3)
+        engine = _Engine()
+        monitor.watch("alerts", engine)
+        engine._timer.start()
+        _spin(40)
+        engine._timer.stop()
+        assert engine.ticks >= 2
+        hist = monitor.subsystems["alerts"]
+        assert hist.total == engine.ticks and hist.mean_ms >= 2
+
+    def test_widget_paint(self, qapp):
+        monitor = LoopMonitor(interval_ms=33.3)
+        widget = _Painted()
+        widget.resize(20, 20)
+        monitor.watch("paint.test", widget)
+        image = widget.grab().toImage()
+        assert image.pixelColor(5, 5).black() == 255           # Still painted
+        assert monitor.subsystems["paint.test"].total == 1
+
+
+class TestDropAttribution:
+
+    def test_late_probe_names_culprit(self, qapp):
+        monitor = LoopMonitor(interval_ms=20.0)
+        monitor._last_probe = 100.0
+        monitor.wrap("patterns", lambda: time.sleep(0.03))()
+        monitor.wrap("alerts", lambda: time.sleep(0.002))()
+        drop = monitor.record_probe(100.0 + 0.065)
+        assert drop is not None
+        assert drop.frames == 2 and drop.lag_ms == pytest.approx(45.0)
+        assert drop.culprit == "patterns" and drop.culprit_ms >= 30
+        assert list(drop.breakdown)[:2] == ["patterns", "alerts"]
+        assert monitor.dropped_frames == 2 and monitor.drops[-1] is drop
+        assert "patterns" in drop.describe()
+
+    def test_on_time_probe_is_not_a_drop(self, qapp):
+        monitor = LoopMonitor(interval_ms=20.0)
+        monitor._last_probe = 100.0
+        assert monitor.record_probe(100.025) is None
+        assert monitor.lag.max_ms == pytest.approx(5.0)
+        assert monitor._window == {}                          # Window closed
+
+    def test_unclaimed_busy_time_is_other(self, qapp):
+        monitor = LoopMonitor(interval_ms=20.0)
+        monitor._last_probe = 100.0
+        monitor._busy_ms = 40.0
+        drop = monitor.record_probe(100.05)
+        assert drop.culprit == OTHER and drop.culprit_ms == pytest.approx(40.0)
+
+    def test_probe_runs_in_event_loop(self, qapp):
+        monitor = LoopMonitor(interval_ms=5.0)
+        monitor.start()
+        _spin(40)
+        monitor.stop()
+        assert monitor.lag.total >= 3
+        assert "dropped frames" in monitor.summary()
+
+
+class TestOverlay:
+
+    def test_overlay_and_settings_toggle(self, qapp):
+        from ui.settings_mode import SettingsModeWidget
+        from ui.widgets.loop_monitor_overlay import LoopMonitorOverlay
+
+        monitor = LoopMonitor(interval_ms=20.0)
+        monitor.wrap("coaching", lambda: None)()
+        monitor._last_probe = 1.0
+        monitor.record_probe(1.05)
+        host = QWidget()
+        host.resize(800, 480)
+        overlay = LoopMonitorOverlay(monitor, host)
+        overlay.resize(800, 480)
+        settings = SettingsModeWidget()
+        settings.enable_loop_overlay_toggle(overlay.set_enabled)
+        settings.set_loop_overlay_checked(True)
+        assert overlay._timer.isActive()
+        assert not overlay.grab().isNull()
+        settings.set_loop_overlay_checked(False)
+        assert overlay.isHidden() and not overlay._timer.isActive()
+
+    def test_main_window_wiring(self, qapp):
+        from ui.main_window import MainWindow
+
+        monitor = LoopMonitor(interval_ms=33.3)
+        win = MainWindow(loop_monitor=monitor)
+        win._stack.setCurrentIndex(1)
+        win._stack.currentWidget().grab()
+        assert monitor.subsystems["paint.sport"].total >= 1
+        win._toggle_loop_overlay()
+        assert not win._loop_overlay.isHidden()
+        assert win._settings_mode._loop_overlay_button.isChecked()
+        win._toggle_loop_overlay()
+        assert win._loop_overlay.isHidden()
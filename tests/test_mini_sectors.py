@@ -0,0 +1,183 @@
+"""Tests for equal-distance micro-sectors — timing/mini_sectors.py.
+
+Test classes:
+  - TestMiniSectorTimer: layout, boundary interpolation, bests / deltas / optimal
+  - TestLapTimerMiniSectors: driven by LapTimer distance traces on a square track
+  - TestPersistence: DuckDB round trip of per-track bests
+"""
+
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from timing.lap_timer import LapTimer, TimingEventType
+from timing.mini_sectors import MiniSectorTimer
+from timing.track_db import StartFinishLine, TrackDefinition
+
+_LAT, _LON = 45.0, -122.0
+_M_LAT = 6_371_000.0 * math.pi / 180.0
+_M_LON = _M_LAT * math.cos(math.radians(_LAT))
+_SIDE_M = 250.0                       # 1000 m square lap
+
+
+def _drive(timer: MiniSectorTimer, lap_m: float, speed_at, step_m: float = 2.0) -> float:
+    """Feed one lap at speed_at(distance) m/s in step_m increments; returns lap time."""
+    d, t = 0.0, 0.0
+    timer.start_lap()
+    while d < lap_m:
+        nd = min(lap_m, d + step_m)
+        t += (nd - d) / speed_at(d)
+        d = nd
+        if d < lap_m:
+            timer.update(d, t)
+    timer.finish_lap(t)
+    return t
+
+
+class TestMiniSectorTimer:
+
+    def test_layout_rounds_to_whole_segments(self):
+        mini = MiniSectorTimer(segment_m=50.0)
+        mini.configure(1010.0)
+        assert mini.segment_count == 20
+        assert mini.segment_length_m == pytest.approx(50.5)
+
+    def test_boundary_times_interpolated(self):
+        mini = MiniSectorTimer(segment_m=50.0)
+        mini.configure(100.0)
+        mini.start_lap()
+        assert mini.update(40.0, 4.0) == 0
+        assert mini.update(60.0, 5.0) == 1            # 50 m reached at 4.5 s
+        assert mini.current[0] == pytest.approx(4.5)
+        mini.finish_lap(8.0)
+        assert mini.current[1] == pytest.approx(3.5)
+        assert mini.optimal_lap_s == pytest.approx(8.0)
+
+    def test_optimal_composes_best_segments(self):
+        mini = MiniSectorTimer(segment_m=50.0)
+        mini.configure(1000.0)
+        slow_first = _drive(mini, 1000.0, lambda d: 20.0 if d < 500 else 40.0)
+        slow_second = _drive(mini, 1000.0, lambda d: 40.0 if d < 500 else 20.0)
+        assert slow_first == pytest.approx(slow_second) == pytest.approx(37.5)
+        assert mini.optimal_lap_s == pytest.approx(25.0)      # Fast halves of both
+        deltas = mini.lap_deltas()
+        assert all(d == pytest.approx(-1.25) for d in deltas[:10])
+        assert all(d == pytest.approx(1.25) for d in deltas[10:])
+        assert mini.lap_delta_s == pytest.approx(0.0)
+
+    def test_live_deltas_during_lap(self):
+        mini = MiniSectorTimer(segment_m=50.0)
+        mini.configure(1000.0)
+        _drive(mini, 1000.0, lambda d: 25.0)
+        mini.start_lap()
+        mini.update(120.0, 120.0 / 20.0)              # 2 segments in, slower
+        assert mini.completed_segments == 2
+        deltas = mini.lap_deltas()
+        assert deltas[0] == pytest.approx(0.5) and deltas[1] == pytest.approx(0.5)
+        assert deltas[2] is None
+        assert mini.worst_segments(1) == [(0, pytest.approx(0.5))]
+
+    def test_first_lap_sets_layout_from_trace(self):
+        mini = MiniSectorTimer(segment_m=50.0)
+        distances = [float(d) for d in range(0, 1001, 5)]
+        times = [d / 25.0 for d in distances]
+        mini.start_lap()
+        for d, t in zip(distances[1:-1], times[1:-1]):
+            mini.update(d, t)                          # Unconfigured: ignored
+        assert mini.finish_lap(40.0, distances, times) == 20
+        assert mini.best_times() == [pytest.approx(2.0)] * 20
+
+    def test_short_lap_does_not_time_final_segment(self):
+        mini = MiniSectorTimer(segment_m=50.0)
+        mini.configure(1000.0)
+        mini.start_lap()
+        mini.update(930.0, 37.2)
+        mini.finish_lap(38.0)
+        assert mini.best_times()[-2:] == [None, None]
+        assert mini.optimal_lap_s is None
+
+    def test_seeded_bests(self):
+        mini = MiniSectorTimer()
+        mini.configure(300.0, [10.0, None, 12.0])
+        assert mini.segment_count == 3 and mini.segment_length_m == 100.0
+        assert mini.optimal_lap_s is None
+        _drive(mini, 300.0, lambda d: 10.0)
+        assert mini.optimal_lap_s == pytest.approx(30.0)
+        assert mini.last_delta[0] == pytest.approx(0.0)
+        assert mini.last_delta[2] == pytest.approx(-2.0)
+
+
+def _square_track() -> TrackDefinition:
+    dlat = _SIDE_M / _M_LAT
+    sf = StartFinishLine(_LAT - 10 / _M_LAT, _LON + 101 / _M_LON, _LAT + 10 / _M_LAT, _LON + 101 / _M_LON)
+    return TrackDefinition("square", "Square", _LAT + dlat / 2, _LON + 125 / _M_LON, start_finish=sf)
+
+
+def _square_laps(speeds: list, dt: float = 0.1) -> list[tuple[float, float, float]]:
+    """Anticlockwise 250 m square from (0, 0); speeds[lap](side) in m/s.
+
+    Timing starts at S/F (x=101) on the first lap; the final point crosses it again.
+    """
+    corners = [(0.0, 0.0), (_SIDE_M, 0.0), (_SIDE_M, _SIDE_M), (0.0, _SIDE_M)]
+    points, t = [], 0.0
+    for lap_speed in speeds:
+        for side in range(4):
+            (x0, y0), (x1, y1) = corners[side], corners[(side + 1) % 4]
+            v = lap_speed(side)
+            steps = round(_SIDE_M / (v * dt))
+            for k in range(steps):
+                f = k / steps
+                x, y = x0 + (x1 - x0) * f, y0 + (y1 - y0) * f
+                points.append((_LAT + y / _M_LAT, _LON + x / _M_LON, t))
+                t += dt
+    points.append((_LAT, _LON + 102 / _M_LON, t))     # Cross S/F to finish the last lap
+    return points
+
+
+class TestLapTimerMiniSectors:
+
+    def test_segments_track_slow_side(self):
+        timer = LapTimer()
+        timer.set_track(_square_track(), [])
+        laps = [lambda side: 25.0, lambda side: 12.5 if side == 2 else 25.0]
+        events = [e for p in _square_laps(laps) for e in timer.update(*p)]
+        assert sum(e.event_type == TimingEventType.LAP_COMPLETE for e in events) == 2
+
+        mini = timer.mini_sectors
+        assert mini.segment_count == 20                 # First lap laid it out
+        deltas = list(mini.last_delta)
+        slow = [i for i, d in enumerate(deltas) if d > 0.5]
+        # Side 2 is the third 250 m leg after S/F at x=101: 400..650 m into the lap
+        assert slow and min(slow) * 50 >= 350 and (max(slow) + 1) * 50 <= 700
+        assert mini.optimal_lap_s == pytest.approx(timer._completed_laps[0].total_time, abs=0.05)
+
+    def test_new_track_resets(self):
+        timer = LapTimer()
+        timer.set_track(_square_track(), [])
+        for p in _square_laps([lambda side: 25.0]):
+            timer.update(*p)
+        assert timer.mini_sectors.configured
+        timer.set_track(_square_track(), [])
+        assert not timer.mini_sectors.configured
+
+
+class TestPersistence:
+
+    def test_round_trip(self, tmp_path):
+        from data.duckdb_store import DuckDBStore
+
+        store = DuckDBStore(db_path=tmp_path / "mini.duckdb")
+        store.open()
+        try:
+            assert store.get_mini_sectors("square") is None
+            store.save_mini_sectors("square", 50.0, [2.0, None, 2.5], None)
+            store.save_mini_sectors("square", 50.0, [1.9, 2.1, 2.5], 6.5)
+            saved = store.get_mini_sectors("square")
+            assert saved == {"segment_length_m": 50.0, "best_times": [1.9, 2.1, 2.5],
+                             "optimal_lap_s": 6.5}
+        finally:
+            store.close()
@@ -0,0 +1,156 @@
+"""Tests for the fixed-cadence render clock (ui/render_clock.py)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from model.vehicle_state import DiffState
+from ui.render_clock import (
+    FrameTimeHistogram, RenderClock, TimedTrail, frame_interval_ms, resolve_fps,
+)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class TestFrameRate:
+
+    def test_resolve_snaps_to_supported(self, monkeypatch):
+        monkeypatch.delenv("KISTI_UI_FPS", raising=False)
+        assert resolve_fps() == 30
+        assert resolve_fps(60) == 60
+        assert resolve_fps(50) == 60
+        assert resolve_fps(20) == 30
+
+    def test_resolve_from_env(self, monkeypatch):
+        monkeypatch.setenv("KISTI_UI_FPS", "60")
+        assert resolve_fps() == 60
+        monkeypatch.setenv("KISTI_UI_FPS", "fast")
+        assert resolve_fps() == 30
+
+    def test_interval_locks_to_refresh(self):
+        assert frame_interval_ms(30, 60.0) == pytest.approx(1000 / 30)
+        assert frame_interval_ms(60, 60.0) == pytest.approx(1000 / 60)
+        assert frame_interval_ms(30, 75.0) == pytest.approx(2000 / 75)  # Every other vblank
+        assert frame_interval_ms(30, None) == pytest.approx(1000 / 30)
+
+
+class TestFrameTimeHistogram:
+
+    def test_buckets_and_percentiles(self):
+        h = FrameTimeHistogram(edges_ms=(1.0, 5.0, 10.0))
+        for ms in [0.5] * 90 + [3.0] * 9 + [40.0]:
+            h.record(ms)
+        assert h.counts == [90, 9, 0, 1]
+        assert h.percentile(50) == 1.0
+        assert h.percentile(99) == 5.0
+        assert h.percentile(100) == 40.0
+        assert h.max_ms == 40.0
+        assert h.as_dict()["buckets"] == {"<=1": 90, "<=5": 9, "<=10": 0, ">10": 1}
+
+    def test_reset(self):
+        h = FrameTimeHistogram()
+        h.record(3.0)
+        h.reset()
+        assert h.total == 0 and h.percentile(99) == 0.0
+
+
+class TestRenderClock:
+
+    def test_one_snapshot_per_tick_regardless_of_bus_rate(self, qapp):
+        snaps = []
+
+        def snapshot():
+            snaps.append(DiffState())
+            return snaps[-1]
+
+        clock = RenderClock(snapshot, fps=30)
+        frames = []
+        clock.frame.connect(lambda snap, now: frames.append(snap))
+        for _ in range(3):
+            for _ in range(50):  # 50 CAN frames between ticks
+                clock.mark_dirty()
+            clock.tick()
+        assert len(snaps) == 3
+        assert frames == snaps
+        assert clock.stats.notifications == 150
+        assert clock.stats.frames == 3
+
+    def test_idle_ticks_skip_snapshot(self, qapp):
+        calls = []
+        clock = RenderClock(lambda: calls.append(1), fps=30)
+        clock.tick()
+        clock.mark_dirty()
+        clock.tick()
+        clock.tick()
+        assert len(calls) == 1
+        assert clock.stats.skipped == 2
+        assert clock.stats.interval.total == 2
+        assert clock.stats.work.total == 1
+        assert "1 frames" in clock.stats.summary()
+
+    def test_timer_interval(self, qapp):
+        clock = RenderClock(lambda: None, fps=60, refresh_hz=60.0)
+        clock.start()
+        assert clock.is_running
+        assert clock._timer.interval() == 17
+        clock.stop()
+        assert not clock.is_running
+
+
+class TestTimedTrail:
+
+    def test_span_is_time_not_sample_count(self):
+        slow, fast = TimedTrail(span_s=1.0), TimedTrail(span_s=1.0)
+        for i in range(61):
+            fast.append(i / 60, 0.0, t=i / 60)
+        for i in range(11):
+            slow.append(i / 10, 0.0, t=i / 10)
+        a, b = slow.resample(11, now=1.0), fast.resample(11, now=1.0)
+        assert [x for x, _ in a] == pytest.approx([x for x, _ in b])
+        assert a[0][0] == pytest.approx(0.0) and a[-1][0] == pytest.approx(1.0)
+
+    def test_old_samples_pruned(self):
+        trail = TimedTrail(span_s=0.5)
+        for i in range(100):
+            trail.append(float(i), 0.0, t=i * 0.05)
+        assert len(trail) <= 12
+        pts = trail.resample(6, now=99 * 0.05)
+        assert pts[0][0] == pytest.approx(89.0)
+        assert pts[-1][0] == pytest.approx(99.0)
+
+    def test_interpolates_between_sparse_samples(self):
+        trail = TimedTrail(span_s=1.0)
+        trail.append(0.0, 0.0, t=0.0)
+        trail.append(1.0, -1.0, t=1.0)
+        assert trail.resample(3) == [(0.0, 0.0), (0.5, -0.5), (1.0, -1.0)]
+
+    def test_degenerate(self):
+        trail = TimedTrail()
+        assert trail.resample(5) == []
+        trail.append(0.2, 0.3, t=5.0)
+        assert trail.resample(5) == [(0.2, 0.3)]
+        assert trail[0] == (0.2, 0.3)
+
+
+class TestScreensUseTimedTrail:
+
+    def test_sharp_screen_trail_updates(self, qapp):
+        from ui.sharp_screen import SportSharpScreenWidget
+
+        screen = SportSharpScreenWidget()
+        snap = DiffState()
+        snap.imu_accel_y, snap.imu_accel_x = 0.4, -0.6
+        screen.update_state(snap)
+        assert isinstance(screen._g_trail, TimedTrail)
+        assert screen._g_trail[-1] == (0.4, -0.6)
+        assert screen._g_trail.resample(31) == [(0.4, -0.6)]
@@ -11,6 +11,7 @@ import pytest
 from tools.rs3_track_import import (
     manual_entry,
     merge_to_seed,
+    merge_tracks_to_seed,
     parse_csv,
     parse_gpx,
     trace_to_track,
@@ -250,6 +251,13 @@ class TestMergeToSeed:
         data = json.loads(seed.read_text())
         assert len(data) == 1
 
+    def test_merge_many_in_one_write(self, tmp_path):
+        seed = tmp_path / "tracks.json"
+        seed.write_text(json.dumps([{"name": "Existing", "track_id": "aaa"}]))
+        merge_tracks_to_seed([manual_entry("A", 49.0, -122.0), manual_entry("B", 50.0, -121.0)], seed)
+        data = json.loads(seed.read_text())
+        assert [t["name"] for t in data] == ["Existing", "A", "B"]
+
     def test_duplicate_name_still_merges(self, tmp_path):
         seed = tmp_path / "tracks.json"
         seed.write_text(json.dumps([{"name": "Area 27", "track_id": "aaa"}]))
@@ -0,0 +1,176 @@
+"""Tests for screen activate/deactivate routing (ui/screen_lifecycle.py)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication, QStackedWidget, QWidget
+
+from model.vehicle_state import DiffState
+from ui.screen_lifecycle import ScreenRouter, StateHistory, TimerGroup
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class _Screen(QWidget):
+    """Records every lifecycle call."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+        self.states = []
+
+    def activate(self):
+        self.calls.append("activate")
+
+    def deactivate(self):
+        self.calls.append("deactivate")
+
+    def update_state(self, snap):
+        self.states.append(snap.rpm)
+
+    def update_timing(self, data):
+        self.calls.append(("timing", data))
+
+
+class _TrailScreen(_Screen):
+
+    def catch_up(self, frames):
+        self.calls.append(("catch_up", [t for t, _ in frames]))
+
+
+def _router(*screens):
+    stack = QStackedWidget()
+    for screen in screens:
+        stack.addWidget(screen)
+    router = ScreenRouter(stack, StateHistory(max_age_s=10.0))
+    router.start()
+    return stack, router
+
+
+class TestTimerGroup:
+
+    def test_resumes_only_what_it_stopped(self, qapp):
+        running, idle = QTimer(), QTimer()
+        running.setInterval(1000)
+        running.start()
+        group = TimerGroup(running, idle)
+        group.suspend()
+        assert not running.isActive() and group.suspended
+        group.resume()
+        assert running.isActive() and not idle.isActive()
+        running.stop()
+
+
+class TestStateHistory:
+
+    def test_since_and_age_limit(self):
+        history = StateHistory(max_age_s=1.0)
+        for t in (0.5, 1.0, 1.5, 2.0):
+            history.record(t, t)
+        assert [t for t, _ in history.since(0.0)] == [1.0, 1.5, 2.0]
+        assert [t for t, _ in history.since(1.5)] == [2.0]
+        assert history.since(2.0) == []
+
+
+class TestScreenRouter:
+
+    def test_only_active_screen_fed(self, qapp):
+        a, b = _Screen(), _Screen()
+        stack, router = _router(a, b)
+        assert a.calls == ["activate"] and b.calls == ["deactivate"]
+        router.feed(DiffState(rpm=1000), 1.0)
+        assert a.states == [1000] and b.states == []
+
+    def test_switch_catches_up_newest_state(self, qapp):
+        a, b = _Screen(), _Screen()
+        stack, router = _router(a, b)
+        for i, rpm in enumerate((1000, 2000, 3000)):
+            router.feed(DiffState(rpm=rpm), float(i + 1))
+        stack.setCurrentIndex(1)
+        assert a.calls[-1] == "deactivate" and b.calls[-1] == "activate"
+        assert b.states == [3000]
+
+    def test_catch_up_gets_missed_frames(self, qapp):
+        a, b = _Screen(), _TrailScreen()
+        stack, router = _router(a, b)
+        router.feed(DiffState(), 1.0)
+        stack.setCurrentIndex(1)
+        router.feed(DiffState(), 2.0)
+        stack.setCurrentIndex(0)
+        router.feed(DiffState(), 3.0)
+        router.feed(DiffState(), 4.0)
+        stack.setCurrentIndex(1)
+        assert b.calls[-1] == ("catch_up", [3.0, 4.0])
+
+    def test_pushes_replayed_on_activation(self, qapp):
+        a, b, c = _Screen(), _Screen(), _Screen()
+        stack, router = _router(a, b, c)
+        router.push("update_timing", {"lap": 1})
+        router.push("update_timing", {"lap": 2})
+        router.push("update_timing", {"only": True}, screens=(a,))
+        assert a.calls.count(("timing", {"lap": 2})) == 1
+        stack.setCurrentIndex(1)
+        assert ("timing", {"lap": 2}) in b.calls
+        assert ("timing", {"lap": 1}) not in b.calls      # Latest wins
+        assert ("timing", {"only": True}) not in b.calls  # Not a target
+        stack.setCurrentIndex(0)
+        stack.setCurrentIndex(1)
+        assert b.calls.count(("timing", {"lap": 2})) == 1  # Nothing new, no replay
+
+    def test_background_widgets_suspended(self, qapp):
+        legacy = _Screen()
+        stack, router = _router(_Screen())
+        router.add_background(legacy)
+        assert legacy.calls == ["deactivate"]
+
+
+class TestScreens:
+
+    def test_intelligent_suspends_timers_and_skips_frames(self, qapp):
+        import numpy as np
+        from ui.intelligent_screen import IntelligentScreenWidget
+        from ui.thermal_display import ThermalDisplay
+
+        thermal = ThermalDisplay()
+        screen = IntelligentScreenWidget(thermal=thermal)
+        screen.deactivate()
+        assert not screen._repaint_timer.isActive()
+        assert not screen._alert_rotate_timer.isActive()
+        thermal.submit(np.full((120, 160), 3000, dtype=np.uint16))
+        screen.grab()
+        assert thermal.render_count == 1     # Rendered only when painted
+        screen.activate()
+        assert screen._repaint_timer.isActive()
+
+    def test_diff_mode_stops_polling(self, qapp):
+        from model.vehicle_state import DiffStateBridge
+        from ui.diff_mode import DiffModeWidget
+
+        widget = DiffModeWidget()
+        widget.set_bridge(DiffStateBridge())
+        widget.deactivate()
+        assert not widget._refresh_timer.isActive()
+        widget.catch_up([(1.0, DiffState(throttle_pct=40.0)), (2.0, DiffState(throttle_pct=50.0))])
+        assert widget._bottom.spark_throttle._buffer[0] == 40.0
+        widget.activate()
+        assert widget._refresh_timer.isActive()
+        widget._refresh_timer.stop()
+
+    def test_g_trail_backfilled(self, qapp):
+        from ui.sharp_screen import SportSharpScreenWidget
+
+        screen = SportSharpScreenWidget()
+        frames = [(100.0 + i * 0.1, DiffState(imu_accel_y=0.1 * i)) for i in range(5)]
+        screen.catch_up(frames)
+        assert len(screen._g_trail) >= 4
+        assert screen._snap is frames[-1][1]
@@ -0,0 +1,277 @@
+"""Tests for speculative intent resolution on partial transcripts."""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from voice.speculation import SpeculativeResolver, normalize_query
+from voice.tts_engine import TTSResult
+
+
+def _tts(text: str, latency_s: float = 0.2) -> TTSResult:
+    return TTSResult(
+        audio_pcm=b"\x00\x01" * 1600, sample_rate=16000, duration_s=0.1,
+        latency_s=latency_s, amplitude_envelope=[0.5] * 3,
+    )
+
+
+@pytest.fixture
+def resolver():
+    answers = {
+        "what is my oil temp": ("sensor", "Oil temperature 95 degrees. Optimal."),
+        "what is my oil temperature": ("sensor", "Oil temperature 95 degrees. Optimal."),
+    }
+    synth = MagicMock(side_effect=_tts)
+    r = SpeculativeResolver(
+        resolve=lambda q: answers.get(normalize_query(q)),
+        synthesize=synth,
+        memory_lookup=lambda q: f"memories for {q}",
+    )
+    r.synth = synth
+    return r
+
+
+class TestNormalizeQuery:
+
+    def test_strips_punctuation_and_case(self):
+        assert normalize_query("What's my  OIL temp?") == "what s my oil temp"
+
+    def test_collapses_whitespace(self):
+        assert normalize_query("  oil \n temp ") == "oil temp"
+
+
+class TestSpeculativeResolver:
+
+    def test_resolved_answer_is_presynthesized(self, resolver):
+        spec = resolver.speculate("What is my oil temp", resolver.generation)
+        assert spec.source == "sensor"
+        assert spec.tts is not None
+        resolver.synth.assert_called_once_with("Oil temperature 95 degrees. Optimal.")
+
+    def test_commit_on_identical_answer(self, resolver):
+        resolver.speculate("What is my oil temp", resolver.generation)
+        resolver.begin_final()
+        tts = resolver.take_tts("Oil temperature 95 degrees. Optimal.")
+        assert tts is not None
+        assert resolver.finish() == 200
+        assert resolver.stats.hits == 1
+        assert resolver.stats.hit_rate == 1.0
+        assert resolver.stats.saved_ms == 200
+
+    def test_discard_on_different_answer(self, resolver):
+        resolver.speculate("What is my oil temp", resolver.generation)
+        resolver.begin_final()
+        assert resolver.take_tts("Oil temperature 96 degrees. Optimal.") is None
+        assert resolver.finish() == 0
+        assert resolver.stats.misses == 1
+        assert resolver.stats.hit_rate == 0.0
+
+    def test_tts_committed_once(self, resolver):
+        resolver.speculate("What is my oil temp", resolver.generation)
+        resolver.begin_final()
+        answer = "Oil temperature 95 degrees. Optimal."
+        assert resolver.take_tts(answer) is not None
+        assert resolver.take_tts(answer) is None
+
+    def test_stale_generation_dropped(self, resolver):
+        gen = resolver.generation
+        resolver.begin_final()  # Final arrived before the partial finished
+        assert resolver.speculate("What is my oil temp", gen) is None
+        assert resolver.finish() == 0
+        assert resolver.stats.utterances == 0  # Nothing to count
+
+    def test_same_partial_not_recomputed(self, resolver):
+        gen = resolver.generation
+        resolver.speculate("What is my oil temp", gen)
+        resolver.speculate("what is my oil temp?", gen)
+        assert resolver.synth.call_count == 1
+        assert resolver.stats.partials == 1
+
+    def test_latest_partial_wins(self, resolver):
+        gen = resolver.generation
+        resolver.speculate("What is my oil temp", gen)
+        spec = resolver.speculate("What is my oil temperature", gen)
+        assert spec.key == "what is my oil temperature"
+        assert resolver.stats.partials == 2
+
+    def test_memory_prefetch_for_unresolved_query(self, resolver):
+        spec = resolver.speculate("Why do boxers rumble", resolver.generation)
+        assert spec.source == "memory"
+        assert spec.answer == ""
+        resolver.synth.assert_not_called()
+        resolver.begin_final()
+        assert resolver.take_memory_context("why do boxers rumble?") == "memories for Why do boxers rumble"
+        resolver.finish()
+        assert resolver.stats.hits == 1
+
+    def test_memory_not_committed_for_different_query(self, resolver):
+        resolver.speculate("Why do boxers rumble", resolver.generation)
+        resolver.begin_final()
+        assert resolver.take_memory_context("Why do boxers rumble so loud") is None
+
+    def test_frontier_cache_peek_presynthesized(self):
+        synth = MagicMock(side_effect=_tts)
+        r = SpeculativeResolver(
+            resolve=lambda q: None, synthesize=synth,
+            cache_peek=lambda q: "Turbo lag is spool time.",
+        )
+        spec = r.speculate("what causes turbo lag", r.generation)
+        assert spec.source == "frontier_cache"
+        synth.assert_called_once_with("Turbo lag is spool time.")
+
+    def test_single_word_partial_ignored(self, resolver):
+        assert resolver.speculate("Oil", resolver.generation) is None
+
+    def test_tts_failure_does_not_raise(self):
+        r = SpeculativeResolver(
+            resolve=lambda q: ("sensor", "Answer."),
+            synthesize=MagicMock(side_effect=RuntimeError("piper died")),
+        )
+        spec = r.speculate("oil temp please", r.generation)
+        assert spec.tts is None
+
+    def test_finish_without_speculation(self, resolver):
+        resolver.begin_final()
+        assert resolver.finish() == 0
+        assert resolver.stats.utterances == 0
+
+    def test_summary_reports_rate_and_savings(self, resolver):
+        resolver.speculate("What is my oil temp", resolver.generation)
+        resolver.begin_final()
+        resolver.take_tts("Oil temperature 95 degrees. Optimal.")
+        resolver.finish()
+        summary = resolver.stats.summary()
+        assert "1/1 hits (100%)" in summary
+        assert "saved 200ms" in summary
+
+
+class TestVoiceManagerSpeculation:
+
+    def _make_vm(self):
+        from voice.voice_manager import VoiceManager, VoiceState
+
+        vm = VoiceManager(enable_mic=False)
+        vm._stream_frontier = False
+        vm._tts.speak = MagicMock(side_effect=_tts)
+        snap = MagicMock()
+        snap.track_name = ""
+        snap.can_connected = True
+        snap.ambient_available = False
+        snap.oil_temp_c = 95.0
+        vm._telemetry_snapshot = snap
+        vm._state = VoiceState.IDLE
+        return vm
+
+    def test_resolve_speculative_uses_sensor_handler(self):
+        vm = self._make_vm()
+        assert vm._resolve_speculative("what's my oil temp") == (
+            "sensor", "Oil temperature 95 degrees. Optimal.",
+        )
+
+    def test_resolve_speculative_safety_fast_path(self):
+        vm = self._make_vm()
+        vm._telemetry_snapshot = None
+        source, _ = vm._resolve_speculative("tell me a joke")
+        assert source == "persona"
+
+    def test_partial_query_requires_wake_word_or_conversation(self):
+        vm = self._make_vm()
+        vm._last_interaction = 0.0
+        assert vm._partial_query("what's my oil temp") is None
+        assert vm._partial_query("Hey KiSTI, what's my oil temp") == "what's my oil temp"
+
+    def test_partial_query_in_conversation_window(self):
+        vm = self._make_vm()
+        vm._last_interaction = time.monotonic()
+        assert vm._partial_query("what's my oil temp") == "what's my oil temp"
+
+    def test_partial_query_rejects_mock_and_short(self):
+        vm = self._make_vm()
+        vm._last_interaction = time.monotonic()
+        assert vm._partial_query("[mock transcription]") is None
+        assert vm._partial_query("oil") is None
+
+    def test_final_commits_presynthesized_audio(self):
+        vm = self._make_vm()
+        vm._speculator.speculate("what's my oil temp", vm._speculator.generation)
+        vm._tts.speak.reset_mock()
+
+        vm._speculator.begin_final()
+        vm.handle_voice_query("what's my oil temp")
+        saved = vm._speculator.finish()
+
+        item = vm._speak_queue.get_nowait()
+        assert item.text == "Oil temperature 95 degrees. Optimal."
+        assert item.tts is not None
+        assert saved == 200
+        assert vm.speculation_stats.hits == 1
+        vm._tts.speak.assert_not_called()  # Synthesis happened before endpointing
+
+    def test_final_discards_stale_speculation(self):
+        vm = self._make_vm()
+        vm._speculator.speculate("what's my oil temp", vm._speculator.generation)
+        vm._telemetry_snapshot.oil_temp_c = 101.0  # Reading changed mid-utterance
+
+        vm._speculator.begin_final()
+        vm.handle_voice_query("what's my oil temp")
+        vm._speculator.finish()
+
+        item = vm._speak_queue.get_nowait()
+        assert item.text == "Oil temperature 101 degrees. Optimal."
+        assert item.tts is None
+        assert vm.speculation_stats.misses == 1
+
+    def test_partial_skipped_while_speaking(self):
+        from voice.voice_manager import VoiceState
+
+        vm = self._make_vm()
+        vm._state = VoiceState.SPEAKING
+        vm._stt = MagicMock()
+        vm._on_partial_speech(b"\x00" * 32000)
+        vm._stt.transcribe_partial.assert_not_called()
+
+
+class TestMicPartialWindows:
+
+    def _run_vad(self, mic, speech_frames: int):
+        from voice import mic_capture as mc
+
+        frames = [b"\x10\x00" * mc.SILERO_CHUNK_SAMPLES] * (speech_frames + mc.SPEECH_END_FRAMES)
+        voiced = [True] * speech_frames + [False] * mc.SPEECH_END_FRAMES
+        it = iter(frames)
+        flags = iter(voiced)
+        mic._vad = MagicMock()
+        mic._vad.confidence.side_effect = lambda *_: 1.0 if next(flags) else 0.0
+        mic._running = True
+        mic._vad_process(lambda n: next(it, b""), alive_fn=lambda: True)
+
+    def test_partials_emitted_during_speech(self):
+        from voice.mic_capture import MicCapture, PARTIAL_INTERVAL_FRAMES
+
+        mic = MicCapture(device="nonexistent")
+        mic.set_partials_enabled(True)
+        partials, finals = [], []
+        mic.partial_speech.connect(partials.append)
+        mic.speech_captured.connect(finals.append)
+
+        self._run_vad(mic, speech_frames=80)
+
+        assert len(partials) >= 2
+        assert all(len(p) % (PARTIAL_INTERVAL_FRAMES * 1024) == 0 for p in partials)
+        assert len(partials[1]) > len(partials[0])  # Rolling, growing window
+        assert len(finals) == 1
+        assert len(finals[0]) > len(partials[-1])
+
+    def test_no_partials_when_disabled(self):
+        from voice.mic_capture import MicCapture
+
+        mic = MicCapture(device="nonexistent")
+        partials = []
+        mic.partial_speech.connect(partials.append)
+        self._run_vad(mic, speech_frames=80)
+        assert partials == []
@@ -0,0 +1,112 @@
+"""Tests for the streaming statistics core — coaching/streaming_stats.py."""
+
+from __future__ import annotations
+
+import random
+import statistics
+import sys
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from coaching.streaming_stats import (
+    MAX_SAMPLE_GAP_S, ONSET, RELEASE, Ewma, Hysteresis, RunningStats, SampleClock, WindowExtremum,
+)
+
+
+class TestRunningStats:
+    def test_matches_population_stats(self):
+        values = [random.Random(1).uniform(-50, 50) for _ in range(200)]
+        rs = RunningStats()
+        for v in values:
+            rs.add(v)
+        assert rs.count == 200
+        assert rs.mean == pytest.approx(statistics.fmean(values))
+        assert rs.std == pytest.approx(statistics.pstdev(values))
+
+    def test_rolling_window_with_removal(self):
+        rng = random.Random(7)
+        window: deque[float] = deque()
+        rs = RunningStats()
+        for _ in range(5000):
+            v = rng.gauss(40.0, 10.0)
+            window.append(v)
+            rs.add(v)
+            if len(window) > 50:
+                rs.remove(window.popleft())
+        assert rs.mean == pytest.approx(statistics.fmean(window))
+        assert rs.std == pytest.approx(statistics.pstdev(window), rel=1e-9)
+
+    def test_small_counts(self):
+        rs = RunningStats()
+        assert rs.std == 0.0
+        rs.add(3.0)
+        assert rs.std == 0.0 and rs.mean == 3.0
+        rs.remove(3.0)
+        assert rs.count == 0 and rs.mean == 0.0
+
+
+class TestEwma:
+    def test_first_sample_seeds(self):
+        e = Ewma(0.5, sample_hz=50.0)
+        assert e.update(0.8) == 0.8
+
+    def test_time_constant(self):
+        e = Ewma(0.5, sample_hz=50.0)
+        e.update(0.0)
+        for _ in range(25):                             # One time constant
+            e.update(1.0)
+        assert e.value == pytest.approx(1 - 0.3679, abs=0.01)
+
+    def test_time_constant_from_intervals(self):
+        """Same elapsed time, different sample rate → same value."""
+        e = Ewma(0.5, sample_hz=50.0)
+        e.update(0.0)
+        for _ in range(100):                            # 0.5 s at 200 Hz
+            e.update(1.0, dt=0.005)
+        assert e.value == pytest.approx(1 - 0.3679, abs=0.01)
+
+
+class TestSampleClock:
+    def test_nominal_spacing_without_timestamps(self):
+        clock = SampleClock(sample_hz=50.0)
+        assert clock.tick() == (0.0, 0.02)
+        assert clock.tick() == pytest.approx((0.02, 0.02))
+
+    def test_intervals_from_timestamps(self):
+        clock = SampleClock(sample_hz=50.0)
+        assert clock.tick(100.0) == (100.0, 0.02)       # First sample: nominal interval
+        assert clock.tick(100.005) == pytest.approx((100.005, 0.005))
+        assert clock.tick(100.005)[1] == 0.0            # Same-instant burst
+        assert clock.tick(130.0)[1] == MAX_SAMPLE_GAP_S  # Paused feed isn't weighted 30 s
+
+
+class TestWindowExtremum:
+    @pytest.mark.parametrize("maximum", [True, False])
+    def test_matches_brute_force(self, maximum):
+        rng = random.Random(3)
+        ext = WindowExtremum(maximum=maximum)
+        values = [rng.uniform(0, 1) for _ in range(1000)]
+        pick = max if maximum else min
+        for seq, v in enumerate(values):
+            ext.push(seq, v)
+            ext.expire(seq - 19)
+            assert ext.value == pick(values[max(0, seq - 19):seq + 1])
+
+    def test_empty(self):
+        ext = WindowExtremum()
+        assert ext.value is None
+        ext.push(0, 1.0)
+        ext.expire(1)
+        assert ext.value is None
+
+
+class TestHysteresis:
+    def test_onset_and_release_ignore_chatter(self):
+        h = Hysteresis(on=5.0, off=2.0)
+        events = [h.update(v) for v in (0, 4.9, 5.0, 3.0, 6.0, 1.9, 4.0, 1.0)]
+        assert events == [0, 0, ONSET, 0, 0, RELEASE, 0, 0]
+        assert not h.active
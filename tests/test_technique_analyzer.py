@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import math
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+import pytest
+
 from model.vehicle_state import DiffState
 from coaching.technique_analyzer import TechniqueAnalyzer
 
@@ -179,3 +182,90 @@ class TestTechniqueAnalyzer:
         text, sentiment = ta.analyze()
         assert "fade" in text.lower()
         assert sentiment == "amber"
+
+
+class TestNativeRate:
+    """Fed at 50 Hz: windows and minimum counts are sized in seconds."""
+
+    def test_short_brake_event_seen(self):
+        """A 0.6 s stop at 50 Hz is ~30 samples — 1 Hz sampling could miss it."""
+        ta = TechniqueAnalyzer(sample_hz=50.0)
+        for i in range(500):
+            braking = 200 <= i < 230
+            ta.feed(_snap(brake=60.0 if braking else 0.0, imu_x=-1.1 if braking else 0.0))
+        assert ta.peak_brake_g == pytest.approx(1.1)
+
+    def test_window_is_ten_seconds(self):
+        ta = TechniqueAnalyzer(sample_hz=50.0)
+        for i in range(500):
+            ta.feed(_snap(brake=10 + 70 * (i % 2)))     # 10 s of erratic pressure
+        assert ta.analyze()[1] == "amber"
+        for _ in range(500):
+            ta.feed(_snap(brake=40.0))                  # then 10 s smooth
+        assert ta.analyze() == ("Smooth braking", "green")
+
+    def test_steering_rate_in_deg_per_s(self):
+        """The same smooth sweep at 1 Hz and at 50 Hz gives the same steering verdict."""
+        slow, fast = TechniqueAnalyzer(), TechniqueAnalyzer(sample_hz=50.0)
+        for i in range(30 * 50):
+            snap = _snap(steering=45.0 + 10.0 * math.sin(2 * math.pi * i / 200))
+            fast.feed(snap)
+            if i % 50 == 0:
+                slow.feed(snap)
+        assert fast.analyze()[0] == slow.analyze()[0] == "Smooth steering"
+
+    @staticmethod
+    def _corners(ta, release_at: int) -> None:
+        """4 × 2 s corners at 50 Hz: brake from 0, ramp steering in from sample 30."""
+        for _ in range(4):
+            for i in range(100):
+                steer = min(40.0, max(0.0, (i - 30) * 0.8))
+                ta.feed(_snap(brake=50.0 if i < release_at else 0.0, steering=steer))
+
+    def test_trail_braking_from_corner_entries(self):
+        """Turn-ins made while still on the brakes count as trail braking."""
+        ta = TechniqueAnalyzer(sample_hz=50.0)
+        self._corners(ta, release_at=70)
+        assert len(ta._turn_ins) >= 3 and all(braked for _, braked in ta._turn_ins)
+        assert ta.analyze()[1] == "green"
+
+    def test_braking_released_before_turn_in(self):
+        ta = TechniqueAnalyzer(sample_hz=50.0)
+        self._corners(ta, release_at=30)
+        assert not any(braked for _, braked in ta._turn_ins)
+        assert ta.analyze() == ("Try trail braking at corner entry", "dim")
+
+
+class TestFeedRate:
+    """Windows and rates follow sample timestamps, not how often feed() is called."""
+
+    _HZ = 220.0     # Bridge emit rate under MockCanGenerator, not sample_hz
+
+    def test_window_is_ten_seconds_of_timestamps(self):
+        ta = TechniqueAnalyzer(sample_hz=50.0)
+        n = int(10 * self._HZ)
+        for i in range(n):
+            ta.feed(_snap(brake=10 + 70 * (i % 2)), ts=i / self._HZ)
+        assert ta.analyze()[1] == "amber"
+        for i in range(n, 2 * n - 50):                  # Just short of 10 s smooth
+            ta.feed(_snap(brake=40.0), ts=i / self._HZ)
+        assert ta.analyze()[0] != "Smooth braking"      # Erratic tail still in window
+        for i in range(2 * n - 50, 2 * n):
+            ta.feed(_snap(brake=40.0), ts=i / self._HZ)
+        assert ta.analyze() == ("Smooth braking", "green")
+
+    def test_minimum_data_is_five_seconds(self):
+        ta = TechniqueAnalyzer(sample_hz=50.0)
+        for i in range(int(3 * self._HZ)):              # 660 samples, only 3 s
+            ta.feed(_snap(brake=40.0), ts=i / self._HZ)
+        assert ta.analyze() == ("", "dim")
+
+    def test_held_steering_sampled_fast_is_smooth(self):
+        """Steering updating at ~19 Hz, held between frames, fed at 220 Hz."""
+        ta = TechniqueAnalyzer(sample_hz=50.0)
+        for i in range(int(30 * self._HZ)):
+            t = i / self._HZ
+            frame_t = int(t * 19) / 19                  # Last steering frame
+            ta.feed(_snap(steering=45.0 + 10.0 * math.sin(2 * math.pi * frame_t / 4)), ts=t)
+        assert ta.analyze() == ("Smooth steering", "green")
+        assert abs(ta._samples[-1].steering_rate) < 20.0    # deg/s, not Δ × sample_hz
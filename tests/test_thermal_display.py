@@ -0,0 +1,103 @@
+"""Tests for the shared zero-copy thermal image (ui/thermal_display.py)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+from ui.thermal_display import INFERNO_LUT16, ThermalDisplay
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _frame(lo=27000, hi=30000, shape=(120, 160)):
+    ramp = np.linspace(lo, hi, shape[0] * shape[1])
+    return ramp.reshape(shape).astype(np.uint16)
+
+
+class TestLut:
+
+    def test_endpoints_and_opaque(self):
+        assert INFERNO_LUT16.shape == (65536,) and INFERNO_LUT16.dtype == np.uint32
+        assert INFERNO_LUT16[0] == 0xFF000000          # Black
+        assert INFERNO_LUT16[65535] == 0xFFFFFFFF      # White
+        assert np.all(INFERNO_LUT16 >> 24 == 0xFF)
+
+
+class TestThermalDisplay:
+
+    def test_no_frame_no_image(self, qapp):
+        thermal = ThermalDisplay()
+        assert thermal.image() is None
+        assert thermal.staleness_ms() == -1
+
+    def test_image_views_persistent_buffer(self, qapp):
+        thermal = ThermalDisplay()
+        thermal.submit(_frame())
+        image = thermal.image()
+        assert image.format() == QImage.Format_RGB32
+        assert (image.width(), image.height()) == (160, 120)
+        assert image.pixel(0, 0) == 0xFF000000
+        assert image.pixelColor(159, 119).lightness() >= 254   # Stretched to white
+        buffer = thermal._argb
+        thermal._argb[0, 0] = 0xFF123456
+        assert image.pixel(0, 0) == 0xFF123456       # No copy between buffer and image
+        thermal.submit(_frame())
+        thermal.image()
+        assert thermal._argb is buffer                # Reused, not reallocated
+
+    def test_rendered_once_per_frame_and_lazily(self, qapp):
+        thermal = ThermalDisplay()
+        ready = []
+        thermal.frame_ready.connect(lambda: ready.append(1))
+        for _ in range(3):
+            thermal.submit(_frame())
+        assert thermal.render_count == 0 and len(ready) == 3
+        first = thermal.image()
+        assert thermal.image() is first               # Second consumer, same image
+        assert thermal.render_count == 1
+
+    def test_temporal_smoothing(self, qapp):
+        thermal = ThermalDisplay()
+        thermal.submit(_frame())
+        thermal.image()
+        thermal.submit(np.full((120, 160), 28000, dtype=np.uint16))
+        thermal.image()
+        # 90 % flat frame + 10 % ramp: the ramp still sets the stretch
+        assert thermal._smooth[0, 0] == pytest.approx(0.9 * 28000 + 0.1 * 27000)
+
+    def test_shape_change_reallocates(self, qapp):
+        thermal = ThermalDisplay()
+        thermal.submit(_frame(shape=(60, 80)))
+        assert thermal.image().width() == 80
+        thermal.submit(_frame())
+        assert thermal.image().width() == 160
+
+    def test_rejects_bad_frames(self, qapp):
+        thermal = ThermalDisplay()
+        thermal.submit(np.zeros((0,), dtype=np.uint16))
+        thermal.submit(np.zeros((4, 4, 3), dtype=np.uint8))
+        assert thermal.frame_count == 0
+
+    def test_video_feed_paints_shared_image(self, qapp):
+        from ui.video_mode import VideoModeWidget
+
+        thermal = ThermalDisplay()
+        video = VideoModeWidget(thermal=thermal)
+        video.resize(800, 480)
+        video.activate()
+        thermal.submit(_frame())
+        assert not video._ir.grab().isNull()
+        assert thermal.render_count == 1
+        video.deactivate()
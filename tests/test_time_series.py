@@ -0,0 +1,131 @@
+"""Tests for the NumPy ring-buffer time-series base (ui/widgets/time_series.py)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPen
+from PySide6.QtWidgets import QApplication
+
+from ui.widgets.time_series import RingBuffer, TimeSeriesWidget, minmax_columns, to_polygon
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class TestRingBuffer:
+
+    def test_wraps_oldest_first(self):
+        rb = RingBuffer(4)
+        rb.extend([1, 2, 3, 4, 5, 6])
+        assert len(rb) == 4
+        np.testing.assert_array_equal(rb.values(), [3, 4, 5, 6])
+        assert rb[0] == 3 and rb[-1] == 6
+
+    def test_running_min_max_matches_window(self):
+        rng = np.random.default_rng(3)
+        rb = RingBuffer(50)
+        history = []
+        for v in rng.normal(size=500):
+            rb.push(v)
+            history.append(v)
+            assert rb.min == min(history[-50:])
+            assert rb.max == max(history[-50:])
+
+    def test_min_max_queues_stay_bounded(self):
+        rb = RingBuffer(10)
+        for i in range(1000):  # Monotonic input never pops from the min queue's tail
+            rb.push(float(i))
+        assert len(rb._min_q) <= 10
+        assert rb.min == 990.0
+
+    def test_drop_oldest_and_clear(self):
+        rb = RingBuffer(8)
+        rb.extend([5, 1, 9, 2])
+        rb.drop_oldest(2)
+        np.testing.assert_array_equal(rb.values(), [9, 2])
+        assert rb.min == 2 and rb.max == 9
+        rb.clear()
+        assert len(rb) == 0 and rb.min == 0.0
+        with pytest.raises(IndexError):
+            rb[0]
+
+    def test_rejects_zero_capacity(self):
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestMinMaxColumns:
+
+    def test_keeps_spikes(self):
+        values = np.zeros(10_000)
+        values[4321] = 7.0
+        values[8000] = -3.0
+        idx, mins, maxs = minmax_columns(values, 200)
+        assert len(idx) <= 200
+        assert maxs.max() == 7.0 and mins.min() == -3.0
+        assert idx[0] == 0 and idx[-1] == 9999
+        assert np.all(np.diff(idx) > 0)
+
+    def test_uneven_last_bucket(self):
+        idx, mins, maxs = minmax_columns(np.arange(10, dtype=float), 3)
+        np.testing.assert_array_equal(mins, [0, 4, 8])
+        np.testing.assert_array_equal(maxs, [3, 7, 9])
+
+
+class TestPolygon:
+
+    def test_to_polygon(self, qapp):
+        poly = to_polygon(np.array([0.0, 1.5, 3.0]), np.array([2.0, -1.0, 4.0]))
+        assert poly.toList() == [QPointF(0, 2), QPointF(1.5, -1), QPointF(3, 4)]
+        to_polygon(np.array([9.0]), np.array([8.0]), poly)  # Reuse shrinks in place
+        assert poly.toList() == [QPointF(9, 8)]
+
+
+class TestTimeSeriesWidget:
+
+    def _render(self, widget, lo, hi):
+        image = QImage(100, 20, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.black)
+        p = QPainter(image)
+        widget.draw_series(p, QRectF(0, 0, 100, 20), lo, hi, QPen(QColor("#FF0000"), 1.5))
+        p.end()
+        return image
+
+    def test_polyline_and_envelope_paths(self, qapp):
+        short, long = TimeSeriesWidget(50), TimeSeriesWidget(5000)
+        short.resize(100, 20)
+        long.resize(100, 20)
+        for i in range(50):
+            short.push(i % 2 * 10.0)
+        for i in range(5000):
+            long.push(10.0 if i == 2500 else 0.0)
+        self._render(short, 0.0, 10.0)
+        assert short._line.size() == 50            # One vertex per sample
+        image = self._render(long, 0.0, 10.0)
+        assert long._line.size() <= 2 * 100          # Envelope band, not 5000 vertices
+        assert image.pixelColor(50, 1).red() > 0     # Single-sample spike still drawn
+
+    def test_sparklines_paint(self, qapp):
+        from ui.widgets.diff_sparkline import DiffSparkline
+        from ui.widgets.sparkline_widget import SparklineWidget
+
+        spark = DiffSparkline(label="SLIP", min_val=-10, max_val=10, show_zero_line=True, capacity=6000)
+        spark.resize(300, 28)
+        for i in range(6000):
+            spark.push(np.sin(i / 100.0) * 12)
+        assert not spark.grab().isNull()
+
+        mini = SparklineWidget()
+        mini.update_data([3, 1, 4, 1, 5, 9, 2, 6])
+        assert len(mini._buffer) == 8
+        assert not mini.grab().isNull()
@@ -0,0 +1,176 @@
+"""Tests for capture-timestamped GPS/IMU fusion (timing/fusion.py).
+
+Covers the dead-reckoning filter, CAN receive-time conversion, the
+DiffStateBridge motion log, and a replayed synthetic session through
+TimingManager (scripts/timing_replay_benchmark.py) against ground truth.
+"""
+
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from timing.fusion import G, GpsImuFusion
+
+_LAT, _LON = 45.0, -122.0
+_M_PER_DEG_LON = 111_320.0 * math.cos(math.radians(_LAT))
+
+
+def _north_of(metres):
+    return _LAT + metres / 111_320.0
+
+
+class TestGpsImuFusion:
+
+    def test_straight_line_dead_reckoning(self):
+        fusion = GpsImuFusion()
+        fusion.set_motion(20.0, 0.0, 0.0)              # 20 m/s due north
+        assert fusion.add_fix(_LAT, _LON, 0.0) == [(_LAT, _LON, 0.0)]
+        estimates = [fusion.add_imu(0.0, 0.0, k * 0.01) for k in range(1, 10)]
+        assert estimates[-1][0] == pytest.approx(_north_of(1.8), abs=1e-9)
+        assert fusion.distance_since_fix == pytest.approx(1.8)
+
+        path = fusion.add_fix(_north_of(2.0), _LON, 0.1)
+        assert len(path) == 10 and path[-1] == (_north_of(2.0), _LON, 0.1)
+        for k, (lat, lon, ts) in enumerate(path[:-1], start=1):
+            assert ts == pytest.approx(k * 0.01)
+            assert lat == pytest.approx(_north_of(0.2 * k), abs=1e-9)
+        assert fusion.distance_since_fix == 0.0
+
+    def test_end_point_error_spread_over_interval(self):
+        fusion = GpsImuFusion()
+        fusion.set_motion(20.0, 0.0, 0.0)
+        fusion.add_fix(_LAT, _LON, 0.0)
+        for k in range(1, 10):
+            fusion.add_imu(0.0, 0.0, k * 0.01)
+        path = fusion.add_fix(_north_of(2.0), _LON + 1.0 / _M_PER_DEG_LON, 0.1)   # 1 m east
+        east = [(lon - _LON) * _M_PER_DEG_LON for _, lon, _ in path]
+        assert east[0] == pytest.approx(0.1, abs=1e-6)
+        assert east[8] == pytest.approx(0.9, abs=1e-6)
+        assert east[-1] == pytest.approx(1.0)
+
+    def test_lateral_g_turns_right(self):
+        fusion = GpsImuFusion()
+        fusion.set_motion(20.0, 0.0, 0.0)
+        fusion.add_fix(_LAT, _LON, 0.0)
+        fusion.add_imu(0.0, 1.0, 0.01)                  # 1 g to the right
+        lat, lon = fusion.add_imu(0.0, 1.0, 0.2)
+        assert lon > _LON                               # Drifted east of due north
+        assert fusion._heading == pytest.approx(G / 20.0 * 0.19, rel=0.01)
+
+    def test_longitudinal_g_changes_speed(self):
+        fusion = GpsImuFusion()
+        fusion.set_motion(20.0, 90.0, 0.0)
+        fusion.add_fix(_LAT, _LON, 0.0)
+        fusion.add_imu(-1.0, 0.0, 0.01)                 # Braking at 1 g
+        fusion.add_imu(-1.0, 0.0, 0.51)
+        assert fusion._speed == pytest.approx(20.0 - G * 0.5)
+
+    def test_without_motion_or_across_gaps_path_is_the_fix(self):
+        fusion = GpsImuFusion()
+        fusion.add_fix(_LAT, _LON, 0.0)
+        assert fusion.add_imu(0.0, 0.0, 0.01) is None  # No GPS speed/heading yet
+        fusion.set_motion(20.0, 0.0, 0.02)
+        fusion.add_imu(0.0, 0.0, 0.05)
+        assert len(fusion.add_fix(_north_of(1.0), _LON, 0.1)) == 2
+        fusion.add_imu(0.0, 0.0, 0.15)
+        gap = fusion.add_fix(_north_of(40.0), _LON, 0.1 + GpsImuFusion.MAX_FIX_GAP_S + 0.5)
+        assert gap == [(_north_of(40.0), _LON, 0.1 + GpsImuFusion.MAX_FIX_GAP_S + 0.5)]
+
+    def test_stale_imu_ignored(self):
+        fusion = GpsImuFusion()
+        fusion.set_motion(20.0, 0.0, 0.0)
+        fusion.add_fix(_LAT, _LON, 1.0)
+        assert fusion.add_imu(0.0, 0.0, 0.99) is None
+        assert fusion.estimates == 0
+
+
+class TestCaptureTimestamps:
+
+    def test_receive_stamp_to_monotonic(self):
+        from can.kisti_can import CanListenerThread
+
+        listener = CanListenerThread(bridge=None)
+        now = time.monotonic()
+        wall = time.time()
+        assert listener.capture_ts(wall - 0.030, now) == pytest.approx(now - 0.030, abs=0.003)
+
+    def test_unusable_stamps_fall_back_to_now(self):
+        from can.kisti_can import CanListenerThread
+
+        listener = CanListenerThread(bridge=None)
+        now = time.monotonic()
+        assert listener.capture_ts(0.0, now) == now
+        assert listener.capture_ts(time.time() - 30.0, now) == now    # Too old
+        assert listener.capture_ts(time.time() + 5.0, now) == now     # From the future
+
+    def test_bridge_keeps_capture_ts_and_motion_log(self):
+        from model.vehicle_state import DiffStateBridge
+
+        bridge = DiffStateBridge()
+        bridge.update_gps(45.0, -122.0, ts=10.0)
+        bridge.update_gps_ext(100.0, 25.0, 90.0, 12, 2, ts=10.001)
+        bridge.update_imu(0.1, -0.2, 1.0, ts=10.002)
+        bridge.update_gps(45.001, -122.0)               # No receive time: stamped now
+        snap = bridge.snapshot()
+        assert snap.imu_frame_ts == 10.002 and snap.gps_ext_frame_ts == 10.001
+        samples = bridge.drain_motion()
+        assert [kind for kind, *_ in samples] == ["gps", "gps_ext", "imu", "gps"]
+        assert samples[2] == ("imu", 10.002, 0.1, -0.2)
+        assert samples[3][1] == snap.gps_frame_ts > 10.002
+        assert bridge.drain_motion() == []
+
+
+@pytest.fixture(scope="module")
+def results():
+    from scripts.timing_replay_benchmark import run_fused, run_legacy, synthesize
+
+    session = synthesize(laps=2, seed=2, stall_prob=0.05)
+    return {
+        "legacy": run_legacy(session),
+        "capture": run_legacy(session, capture_ts=True),
+        "fused": run_fused(session),
+    }
+
+
+class TestReplayedSession:
+
+    def test_every_lap_and_sector_reported(self, results):
+        laps = {r["laps"] for r in results.values()}
+        sectors = {r["sectors"] for r in results.values()}
+        assert len(laps) == 1 and laps.pop() >= 2
+        assert len(sectors) == 1 and sectors.pop() >= 6
+
+    def test_fused_timing_within_10ms(self, results):
+        fused = results["fused"]
+        assert fused["lap_err_ms"]["max"] < 10.0
+        assert fused["sector_err_ms"]["max"] < 10.0
+        assert fused["dead_reckoned"] > 0
+
+    def test_better_than_slot_timestamps(self, results):
+        for key in ("lap_err_ms", "sector_err_ms"):
+            assert results["fused"][key]["max"] <= results["capture"][key]["max"]
+            assert results["capture"][key]["max"] < results["legacy"][key]["max"]
+
+    def test_live_delta_between_fixes(self):
+        from scripts.timing_replay_benchmark import ReplayBridge, replay_track
+        from timing.timing_manager import TimingManager
+
+        bridge = ReplayBridge()
+        mgr = TimingManager(bridge=bridge, db_store=None)
+        mgr._timer.set_track(*replay_track())
+        mgr._track_detected = True
+        mgr._active = True
+        mgr._timer._lap_start_ts = 0.0                  # Lap running
+        bridge.push(0.0, "gps_ext", 20.0, 0.0)
+        bridge.push(0.0, "gps", _LAT, _LON)
+        mgr._on_state_changed()
+        for k in range(1, 6):
+            bridge.push(k * 0.01, "imu", 0.0, 0.0)
+        mgr._on_state_changed()
+        assert bridge.timing["current_lap_time_ms"] == 50
+        assert bridge.timing["lap_distance_m"] == pytest.approx(1.0)
@@ -17,7 +17,7 @@ Test classes:
   - TestLapCompletion (4 tests)
   - TestSectorCompletion (3 tests)
   - TestBridgeTimingState (3 tests)
-  - TestDuckDBRecording (2 tests)
+  - TestDuckDBRecording (3 tests)
   - TestSessionLifecycle (3 tests)
   - TestSessionSummary (2 tests)
   - TestP2PMode (2 tests)
@@ -376,6 +376,19 @@ class TestDuckDBRecording:
         ).fetchone()
         assert rows[0] == 0
 
+    def test_mini_sector_bests_persist_per_track(self, timing_mgr, bridge, synth_db):
+        """Micro-sector bests are saved after a lap and restored on re-detection."""
+        _feed_gps(bridge, _SYNTH_LAP_COMPLETE)
+        saved = synth_db.get_mini_sectors(_SYNTH_TRACK_ID)
+        mini = timing_mgr.lap_timer.mini_sectors
+        assert saved is not None and len(saved["best_times"]) == mini.segment_count > 1
+
+        timing_mgr.set_session_id(None)
+        _feed_gps(bridge, [(_BASE_LAT, _BASE_LON)])
+        restored = timing_mgr.lap_timer.mini_sectors
+        assert restored.best_times() == pytest.approx(saved["best_times"])
+        assert restored.segment_length_m == pytest.approx(saved["segment_length_m"])
+
 
 # ── TestSessionLifecycle ──────────────────────────────────────────────
 
@@ -659,9 +672,23 @@ class TestGetTimingData:
             "track_name", "sector_count", "current_sector",
             "sector_times", "best_sector_times", "lap_in_progress",
             "track_outline", "lap_distance_m", "track_length_m",
+            "mini_sector_deltas_ms", "optimal_lap_ms", "timing_version",
         }
         assert set(data.keys()) == expected_keys
 
+    def test_timing_version_only_changes_on_events(self, timing_mgr, bridge):
+        """Between events the cached part is reused and timing_version holds."""
+        _feed_gps(bridge, _SYNTH_LAP[:2])           # Detect + S/F crossing
+        first = timing_mgr.get_timing_data()
+        again = timing_mgr.get_timing_data()
+        assert again["timing_version"] == first["timing_version"]
+        assert again["best_sector_times"] is first["best_sector_times"]
+        _feed_gps(bridge, _SYNTH_LAP[2:4])          # SEC0 crossing
+        after = timing_mgr.get_timing_data()
+        assert after["timing_version"] > first["timing_version"]
+        assert after["current_sector"] == 1
+        assert timing_mgr.timing_snapshot.current_sector == 1
+
     def test_timing_after_lap(self, timing_mgr, bridge):
         """After completing a lap, best_lap_ms is set."""
         _feed_gps(bridge, _SYNTH_LAP_COMPLETE)
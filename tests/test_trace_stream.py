@@ -0,0 +1,172 @@
+"""Tests for streaming log parsing and lap segmentation.
+
+Test classes:
+  - TestStreamingParsers: iter_gpx / iter_csv (timestamps, headers, flat memory)
+  - TestTraceSegmenter: learning then lap splitting, known-track timing
+  - TestStreamLog: end-to-end file → laps + Parquet parts
+"""
+
+import math
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from timing.trace_segmenter import TraceSegmenter
+from timing.track_db import StartFinishLine, TrackDefinition
+from tools.rs3_track_import import iter_csv, iter_gpx
+
+_LAT, _LON = 49.13, -122.31
+_M_LAT = 6_371_000.0 * math.pi / 180.0
+_M_LON = _M_LAT * math.cos(math.radians(_LAT))
+_RADIUS_M = 200.0
+_SPEED = 40.0                                   # m/s → 31.4 s laps
+_LAP_S = 2 * math.pi * _RADIUS_M / _SPEED
+
+
+def _session(laps: float = 4.0, hz: float = 10.0, approach_m: float = 600.0):
+    """Drive in from the south, then lap a 200 m-radius circle anticlockwise.
+
+    Yields (lat, lon, ts); the circle starts at its southernmost point.
+    """
+    t = 0.0
+    dt = 1.0 / hz
+    # Approach: straight north to the circle's south point, heading east-ish at arrival
+    steps = int(approach_m / (_SPEED * dt))
+    for k in range(steps):
+        y = -_RADIUS_M - approach_m + k * _SPEED * dt
+        yield _LAT + y / _M_LAT, _LON - 50.0 / _M_LON, t
+        t += dt
+    n = int(laps * _LAP_S * hz)
+    for k in range(n + 1):
+        a = -math.pi / 2 + _SPEED * dt * k / _RADIUS_M
+        yield _LAT + _RADIUS_M * math.sin(a) / _M_LAT, _LON + _RADIUS_M * math.cos(a) / _M_LON, t
+        t += dt
+
+
+def _write_gpx(path: Path, points, ns: str = "http://www.topografix.com/GPX/1/1") -> Path:
+    with open(path, "w") as f:
+        f.write(f'<?xml version="1.0"?><gpx xmlns="{ns}"><trk><trkseg>\n')
+        for lat, lon, ts in points:
+            stamp = datetime.fromtimestamp(1_700_000_000 + ts, tz=timezone.utc).isoformat(timespec="milliseconds")
+            f.write(f'<trkpt lat="{lat:.8f}" lon="{lon:.8f}"><ele>10</ele><time>{stamp.replace("+00:00", "Z")}</time></trkpt>\n')
+        f.write("</trkseg></trk></gpx>\n")
+    return path
+
+
+class TestStreamingParsers:
+
+    def test_gpx_points_and_times(self, tmp_path):
+        path = _write_gpx(tmp_path / "s.gpx", [(49.0, -122.0, 0.0), (49.001, -122.0, 0.1)])
+        points = list(iter_gpx(path))
+        assert points[0][:2] == (49.0, -122.0)
+        assert points[1][2] - points[0][2] == pytest.approx(0.1)
+
+    def test_gpx_waypoint_fallback_without_namespace(self, tmp_path):
+        path = tmp_path / "w.gpx"
+        path.write_text('<gpx><wpt lat="1.0" lon="2.0"/><wpt lat="3.0" lon="4.0"/></gpx>')
+        assert list(iter_gpx(path)) == [(1.0, 2.0, None), (3.0, 4.0, None)]
+
+    def test_gpx_memory_stays_flat(self, tmp_path):
+        path = _write_gpx(tmp_path / "big.gpx", _session(laps=30.0, hz=50.0))   # ~47k points, 5 MB
+        assert path.stat().st_size > 4_000_000
+        tracemalloc.start()
+        count = sum(1 for _ in iter_gpx(path))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert count > 40_000
+        assert peak < 1_000_000
+
+    def test_csv_header_columns_and_time(self, tmp_path):
+        path = tmp_path / "rr.csv"
+        path.write_text("Time,Speed,Latitude,Longitude\n0.0,10,49.0,-122.0\n0.1,11,49.001,-122.001\n")
+        assert list(iter_csv(path)) == [(49.0, -122.0, 0.0), (49.001, -122.001, 0.1)]
+
+    def test_csv_unknown_header_uses_first_columns(self, tmp_path):
+        path = tmp_path / "plain.csv"
+        path.write_text("a,b\n49.0,-122.0\n\n49.1,-122.1\n")
+        assert list(iter_csv(path)) == [(49.0, -122.0, None), (49.1, -122.1, None)]
+
+    def test_csv_bad_row_raises(self, tmp_path):
+        path = tmp_path / "bad.csv"
+        path.write_text("49.0,-122.0\nnope,1\n")
+        with pytest.raises(ValueError):
+            list(iter_csv(path))
+
+
+def _known_track() -> TrackDefinition:
+    south = _LAT - _RADIUS_M / _M_LAT
+    sf = StartFinishLine(south - 15 / _M_LAT, _LON, south + 15 / _M_LAT, _LON)
+    return TrackDefinition("circle", "Circle", _LAT, _LON, length_m=2 * math.pi * _RADIUS_M, start_finish=sf)
+
+
+class TestTraceSegmenter:
+
+    def test_learns_track_then_splits_laps(self):
+        seg = TraceSegmenter(max_lap_m=1500.0)     # Approach start never closes: re-anchor on the circle
+        events = [e for p in _session(laps=5.0) for e in seg.feed(*p)]
+        kinds = [e.kind for e in events]
+        assert kinds[0] == "track" and kinds.count("track") == 1
+        assert seg.track.length_m == pytest.approx(2 * math.pi * _RADIUS_M, rel=0.05)   # Closes within 50 m
+        laps = [e.lap for e in events if e.kind == "lap"]
+        assert len(laps) >= 3
+        for lap in laps:
+            assert lap.time_s == pytest.approx(_LAP_S, abs=0.01)
+            assert lap.distance_m == pytest.approx(2 * math.pi * _RADIUS_M, rel=0.002)
+            assert len(lap.sector_times) == 4 and sum(lap.sector_times) == pytest.approx(lap.time_s)
+        assert [lap.lap_number for lap in laps] == list(range(1, len(laps) + 1))
+        assert laps[1].first_point == laps[0].last_point
+
+    def test_known_track_times_from_first_crossing(self):
+        seg = TraceSegmenter(_known_track())
+        laps = [e.lap for p in _session(laps=3.2) for e in seg.feed(*p) if e.kind == "lap"]
+        assert len(laps) == 3
+        assert laps[0].start_ts == pytest.approx(600.0 / _SPEED, abs=0.01)   # Arrived at S/F
+        assert all(lap.time_s == pytest.approx(_LAP_S, abs=0.01) for lap in laps)
+
+    def test_points_without_timestamps_use_sample_rate(self):
+        seg = TraceSegmenter(_known_track(), sample_hz=10.0)
+        laps = [e.lap for lat, lon, _ in _session(laps=2.2) for e in seg.feed(lat, lon) if e.kind == "lap"]
+        assert len(laps) == 2 and laps[0].time_s == pytest.approx(_LAP_S, abs=0.01)
+
+    def test_learner_restarts_when_not_closing(self):
+        seg = TraceSegmenter(max_lap_m=500.0)
+        for k in range(1000):                           # 5 km straight line
+            seg.feed(_LAT + 5 * k / _M_LAT, _LON)
+        assert seg._learner.total_distance <= 500.0 and seg.track is None
+
+
+class TestStreamLog:
+
+    def test_laps_and_parquet_parts(self, tmp_path):
+        duckdb = pytest.importorskip("duckdb")
+        from tools.trace_stream import stream_log
+
+        log_path = _write_gpx(tmp_path / "session.gpx", _session(laps=3.5))
+        out = tmp_path / "o'brien"            # Quote in the path must survive COPY
+        events = list(stream_log(log_path, TraceSegmenter(_known_track()), out, chunk_rows=300))
+        laps = [e.lap for e in events if e.kind == "lap"]
+        assert len(laps) == 3
+
+        parts = sorted(out.glob("part-*.parquet"))
+        assert len(parts) > 3
+        con = duckdb.connect()
+        glob = str(out / "*.parquet")
+        rows = con.execute("SELECT count(*), max(lap) FROM read_parquet(?)", [glob]).fetchone()
+        assert rows == (sum(1 for _ in iter_gpx(log_path)), 4)
+        lap2 = con.execute(
+            "SELECT min(idx), max(idx) FROM read_parquet(?) WHERE lap = 2", [glob]
+        ).fetchone()
+        assert lap2 == (laps[1].first_point + 1, laps[1].last_point)   # Crossing point closes lap 1
+
+    def test_db_segmenter_keeps_sample_rate(self, tmp_path):
+        pytest.importorskip("duckdb")
+        from tools.trace_stream import _segmenter_from_db
+
+        log_path = _write_gpx(tmp_path / "session.gpx", _session(laps=0.5))
+        seg = _segmenter_from_db(tmp_path / "kisti.duckdb", log_path, sample_hz=25.0)
+        assert seg.track is None and seg._dt == pytest.approx(0.04)     # --hz honoured with --db
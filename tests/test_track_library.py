@@ -0,0 +1,205 @@
+"""Tests for the bulk track library importer — tools/track_library.py.
+
+Test classes:
+  - TestImport: new tracks, sectors and outlines (with LODs) land in DuckDB
+  - TestManifest: unchanged / touched / copied files are not re-parsed
+  - TestDedupe: same-venue files and known tracks merge by proximity
+  - TestStartup: TimingManager parses ~/tracks in a spawned process; JSON outlines win
+"""
+
+import math
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from data.duckdb_store import SCHEMA_DDL
+from timing.track_db import TrackDatabase, TrackDefinition
+from timing.track_outline import Outline
+from tools import track_library
+
+_M_LAT = 111_320.0
+
+
+def _circle(lat: float, lon: float, radius_m: float = 300.0, n: int = 120) -> list[tuple[float, float]]:
+    m_lon = _M_LAT * math.cos(math.radians(lat))
+    return [
+        (lat + radius_m * math.sin(2 * math.pi * k / n) / _M_LAT,
+         lon + radius_m * math.cos(2 * math.pi * k / n) / m_lon)
+        for k in range(n)
+    ]
+
+
+def _write_csv(path: Path, trace) -> Path:
+    path.write_text("lat,lon\n" + "".join(f"{lat:.7f},{lon:.7f}\n" for lat, lon in trace))
+    return path
+
+
+def _write_gpx(path: Path, trace) -> Path:
+    pts = "".join(f'<trkpt lat="{lat:.7f}" lon="{lon:.7f}"/>' for lat, lon in trace)
+    path.write_text(
+        '<gpx xmlns="http://www.topografix.com/GPX/1/1"><trk><trkseg>'
+        f"{pts}</trkseg></trk></gpx>"
+    )
+    return path
+
+
+@pytest.fixture
+def conn():
+    c = duckdb.connect(":memory:")
+    c.execute(SCHEMA_DDL)
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def library(tmp_path):
+    lib = tmp_path / "tracks"
+    (lib / "gpx").mkdir(parents=True)
+    _write_csv(lib / "mission_raceway.csv", _circle(49.13, -122.31))
+    _write_gpx(lib / "gpx" / "area_27.gpx", _circle(49.45, -119.55))
+    return lib
+
+
+def _no_parse(path):
+    raise AssertionError(f"re-parsed {path}")
+
+
+class TestImport:
+
+    def test_tracks_sectors_and_outlines(self, conn, library):
+        report = track_library.import_library([library], conn, workers=1)
+        assert report.scanned == 2 and sorted(report.imported) == ["Area 27", "Mission Raceway"]
+        db = TrackDatabase(conn)
+        track = db.find_track(49.13, -122.31)
+        assert track.name == "Mission Raceway" and track.source == "import"
+        assert len(track.sectors) == 3
+        assert track.length_m == pytest.approx(2 * math.pi * 300.0, rel=0.01)
+        outline = db.get_outline(track.track_id)
+        assert isinstance(outline, Outline) and len(outline) >= 3
+        assert outline.lods[0][1].tolist() == list(range(len(outline)))   # Finest level: every point
+
+    def test_process_pool(self, conn, library):
+        report = track_library.import_library([library], conn, workers=2)
+        assert len(report.imported) == 2 and not report.failed
+
+    def test_bad_file_recorded_and_not_retried(self, conn, library, monkeypatch):
+        (library / "broken.gpx").write_text("<gpx></gpx>")
+        report = track_library.import_library([library], conn, workers=1)
+        assert report.failed == ["broken.gpx"] and len(report.imported) == 2
+        monkeypatch.setattr(track_library, "parse_source", _no_parse)
+        assert track_library.import_library([library], conn, workers=1).unchanged == 3
+
+
+class TestManifest:
+
+    def test_unchanged_files_skipped(self, conn, library, monkeypatch):
+        track_library.import_library([library], conn, workers=1)
+        monkeypatch.setattr(track_library, "parse_source", _no_parse)
+        assert track_library.pending_sources(conn, track_library.scan_sources([library])) == []
+        report = track_library.import_library([library], conn, workers=1)
+        assert report.unchanged == 2 and not report.imported
+
+    def test_touched_or_copied_file_not_reparsed(self, conn, library, monkeypatch):
+        track_library.import_library([library], conn, workers=1)
+        monkeypatch.setattr(track_library, "parse_source", _no_parse)
+        csv = library / "mission_raceway.csv"
+        os.utime(csv, ns=(1, 1))
+        (library / "copy.csv").write_bytes(csv.read_bytes())
+        report = track_library.import_library([library], conn, workers=1)
+        assert report.unchanged == 1 and not report.imported
+        assert TrackDatabase(conn).track_count() == 2
+        ids = conn.execute("SELECT DISTINCT track_id FROM track_import_manifest WHERE path LIKE '%.csv'").fetchall()
+        assert len(ids) == 1                                    # Copy maps to the same track
+        assert track_library.pending_sources(conn, track_library.scan_sources([library])) == []
+
+    def test_changed_content_reimported(self, conn, library):
+        track_library.import_library([library], conn, workers=1)
+        _write_csv(library / "mission_raceway.csv", _circle(50.0, -120.0))
+        report = track_library.import_library([library], conn, workers=1)
+        assert report.imported == ["Mission Raceway"]
+
+
+class TestDedupe:
+
+    def test_same_venue_in_batch_merged(self, conn, library):
+        _write_gpx(library / "mission_rs3.gpx", _circle(49.1305, -122.3105, radius_m=310.0))
+        report = track_library.import_library([library], conn, workers=1)
+        assert len(report.imported) == 2 and report.merged == ["mission_rs3.gpx"]
+
+    def test_known_track_kept_and_outline_added(self, conn, library):
+        db = TrackDatabase(conn)
+        db.save_track(TrackDefinition("seeded", "Mission Raceway Park", 49.131, -122.309,
+                                      length_m=2250.0, source="seed"))
+        report = track_library.import_library([library], conn, workers=1)
+        assert report.merged == ["mission_raceway.csv"] and report.imported == ["Area 27"]
+        track = db.find_track(49.13, -122.31)
+        assert (track.track_id, track.name, track.source) == ("seeded", "Mission Raceway Park", "seed")
+        assert track.length_m == 2250.0
+        assert db.get_outline("seeded")
+
+
+class TestStartup:
+
+    def test_timing_manager_imports_in_background(self, tmp_path, library, monkeypatch):
+        from PySide6.QtWidgets import QApplication
+
+        from data.duckdb_store import DuckDBStore
+        from model.vehicle_state import DiffStateBridge
+        from timing.timing_manager import TimingManager
+
+        QApplication.instance() or QApplication([])
+        monkeypatch.setattr(Path, "home", classmethod(lambda cls: tmp_path))
+        pools = []
+        real_pool = track_library.ProcessPoolExecutor
+        monkeypatch.setattr(track_library, "ProcessPoolExecutor",
+                            lambda *a, **kw: pools.append(kw) or real_pool(*a, **kw))
+        store = DuckDBStore(db_path=tmp_path / "kisti.duckdb")
+        store.open()
+        try:
+            mgr = TimingManager(bridge=DiffStateBridge(), db_store=store)
+            assert mgr._import_thread is not None
+            mgr._import_thread.join(timeout=60)
+            db = TrackDatabase(store._conn)
+            assert db.find_track(49.45, -119.55).name == "Area 27"
+            # Parsed in a spawned process, not on the UI process's GIL
+            assert [kw["max_workers"] for kw in pools] == [1]
+            assert pools[0]["mp_context"].get_start_method() == "spawn"
+
+            monkeypatch.setattr(track_library, "parse_source", _no_parse)
+            again = TimingManager(bridge=DiffStateBridge(), db_store=store)
+            assert again._import_thread is None                 # Nothing new: no import
+        finally:
+            store.close()
+
+    def test_canonical_json_outline_preferred(self, tmp_path, library, monkeypatch):
+        from PySide6.QtWidgets import QApplication
+
+        from data.duckdb_store import DuckDBStore
+        from model.vehicle_state import DiffStateBridge
+        from timing.timing_manager import TimingManager
+        from timing.track_outline import save_outline
+
+        QApplication.instance() or QApplication([])
+        monkeypatch.setattr(Path, "home", classmethod(lambda cls: tmp_path / "no_library"))
+        store = DuckDBStore(db_path=tmp_path / "kisti.duckdb")
+        store.open()
+        try:
+            track_library.import_library([library], store._conn, workers=1)
+            track = TrackDatabase(store._conn).find_track(49.45, -119.55)
+            mgr = TimingManager(bridge=DiffStateBridge(), db_store=store)
+            mgr._outlines_dir = tmp_path / "outlines"
+            mgr._try_detect_track(49.45, -119.55)
+            assert mgr._active_outline == TrackDatabase(store._conn).get_outline(track.track_id)
+
+            canonical = [(49.45, -119.55), (49.451, -119.55), (49.451, -119.551)]
+            save_outline(track.track_id, canonical, mgr._outlines_dir)
+            mgr._try_detect_track(49.45, -119.55)
+            assert mgr._active_outline == [tuple(p) for p in canonical]
+        finally:
+            store.close()
@@ -0,0 +1,123 @@
+"""Tests for the LOD-cached track outline renderer (ui/track_map.py)."""
+
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QApplication
+
+from ui import track_map
+from ui.track_map import OutlineGeometry, outline_geometry, paint_track_map, sector_bounds
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _oval(n):
+    return [
+        (0.5 + 0.4 * math.cos(2 * math.pi * i / n), 0.5 + 0.3 * math.sin(2 * math.pi * i / n))
+        for i in range(n)
+    ]
+
+
+def _paint(outline, **kwargs):
+    image = QImage(320, 190, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.black)
+    p = QPainter(image)
+    paint_track_map(p, 0, 0, 320, 190, outline, **kwargs)
+    p.end()
+    return image
+
+
+class TestOutlineGeometry:
+
+    def test_levels_coarsen_with_epsilon(self, qapp):
+        geom = OutlineGeometry(_oval(5000))
+        counts = [len(idx) for _eps, idx in geom.levels]
+        assert counts[0] == 5000
+        assert counts == sorted(counts, reverse=True)
+        assert counts[-1] < 100
+
+    def test_level_follows_scale(self, qapp):
+        geom = OutlineGeometry(_oval(5000))
+        small, large = geom.level_for(100), geom.level_for(5000)
+        assert small > large            # Small panel → coarser level
+        assert geom.level_for(1e9) == 0
+
+    def test_path_cached_per_scale(self, qapp):
+        geom = OutlineGeometry(_oval(500))
+        assert geom.path(300, 170) is geom.path(300, 170)
+        assert geom.path(300, 170) is not geom.path(600, 340)
+        bounds = geom.path(300, 170).boundingRect()
+        assert bounds.right() == pytest.approx(0.9 * 300, abs=2)
+
+    def test_span_between_progress_values(self, qapp):
+        geom = OutlineGeometry(_oval(400))
+        span = geom.span(0.25, 0.5, 1.0, 1.0)
+        head, tail = span[0], span[span.size() - 1]
+        assert (head.x(), head.y()) == pytest.approx(geom.point_at(0.25))
+        assert (tail.x(), tail.y()) == pytest.approx(geom.point_at(0.5))
+        wrapped = geom.span(0.9, 1.1, 1.0, 1.0)   # Across start/finish
+        assert wrapped.size() > 2
+
+    def test_precomputed_levels_used(self, qapp):
+        import numpy as np
+
+        from timing.track_outline import Outline, outline_lods
+
+        points = _oval(1000)
+        lods = outline_lods(np.asarray(points))
+        geom = OutlineGeometry(Outline(points, lods))
+        assert geom.levels is lods
+        assert [len(i) for _e, i in lods] == [len(i) for _e, i in OutlineGeometry(points).levels]
+
+    def test_geometry_cached_by_identity(self, qapp):
+        outline = _oval(100)
+        assert outline_geometry(outline) is outline_geometry(outline)
+        assert outline_geometry(list(outline)) is not outline_geometry(outline)
+
+
+class TestSectorBounds:
+
+    def test_learned_and_even_split(self):
+        assert sector_bounds(1, [0.0, 0.3, 0.7], 3) == (0.3, 0.7)
+        assert sector_bounds(2, [0.0, 0.3, 0.7], 3) == (0.7, 1.0)
+        assert sector_bounds(1, [0.0], 4) == pytest.approx((0.25, 0.5))
+
+    def test_no_sectors(self):
+        assert sector_bounds(-1, [0.0, 0.5], 2) is None
+        assert sector_bounds(0, [0.0], 0) is None
+
+
+class TestPaintTrackMap:
+
+    def test_static_panel_built_once(self, qapp):
+        outline = _oval(3000)
+        track_map._PANELS.clear()
+        for i in range(3):
+            image = _paint(outline, progress=i / 10, track_name="Test", current_sector=1, sector_count=3)
+        panel = track_map._PANELS[(0, 0, 320, 190, "schematic")]
+        assert panel.layer.builds == 1
+        assert not image.isNull()
+        _paint(outline, progress=0.5, track_name="Other")
+        assert panel.layer.builds == 2          # Track name is part of the panel
+
+    def test_car_dot_drawn(self, qapp):
+        outline = _oval(200)
+        image = _paint(outline, progress=0.0)
+        x, y = outline_geometry(outline).point_at(0.0)
+        px = image.pixelColor(int(12 + x * 296), int(10 + y * 170))
+        assert px.red() > 200 and px.green() > 200    # White centre over orange rings
+
+    def test_short_outline_placeholder(self, qapp):
+        assert not _paint([(0.1, 0.1), (0.2, 0.2)], track_name="x").isNull()
@@ -14,6 +14,7 @@ from timing.track_outline import (
     save_outline,
     load_outline,
     import_ztracks_outline,
+    rdp_mask,
     _rdp,
     _perp_distance,
 )
@@ -123,6 +124,47 @@ class TestDownsampleRdp:
         assert len(curve_result) > len(straight_result)
 
 
+
+def _reference_rdp(points, epsilon):
+    """Textbook recursive RDP, for comparing against the batched version."""
+    if len(points) <= 2:
+        return list(points)
+    start, end = points[0], points[-1]
+    dists = [_perp_distance(pt, start, end) for pt in points[1:-1]]
+    i = max(range(len(dists)), key=dists.__getitem__) + 1
+    if dists[i - 1] > epsilon:
+        return _reference_rdp(points[: i + 1], epsilon)[:-1] + _reference_rdp(points[i:], epsilon)
+    return [start, end]
+
+
+class TestRdpMask:
+    def test_matches_recursive_reference(self):
+        import random
+        rng = random.Random(7)
+        n = 2000
+        pts = [
+            (0.5 + 0.4 * math.cos(2 * math.pi * i / n) + rng.gauss(0, 0.001),
+             0.5 + 0.3 * math.sin(4 * math.pi * i / n))
+            for i in range(n)
+        ]
+        pts.append(pts[0])  # Closed loop: first span has coincident endpoints
+        for eps in (0.0005, 0.002, 0.01):
+            assert _rdp(pts, eps) == _reference_rdp(pts, eps)
+
+    def test_handles_10k_point_trace(self):
+        import numpy as np
+        t = np.linspace(0, 2 * np.pi, 10_000)
+        xy = np.column_stack((0.5 + 0.4 * np.cos(t), 0.5 + 0.4 * np.sin(3 * t)))
+        keep = rdp_mask(xy, 0.001)
+        assert keep[0] and keep[-1]
+        assert 20 < keep.sum() < 1000
+
+    def test_empty_and_tiny(self):
+        import numpy as np
+        assert rdp_mask(np.empty((0, 2)), 0.1).tolist() == []
+        assert rdp_mask(np.array([[0.0, 0.0], [1.0, 1.0]]), 0.1).tolist() == [True, True]
+
+
 # ---------------------------------------------------------------------------
 # save_outline / load_outline
 # ---------------------------------------------------------------------------
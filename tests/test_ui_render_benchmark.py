@@ -0,0 +1,86 @@
+"""Tests for the headless render benchmark (scripts/ui_render_benchmark.py)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from model.vehicle_state import DiffState, SIDriveMode, SurfaceState
+from scripts.ui_render_benchmark import (
+    compare,
+    load_recorded,
+    run,
+    screen_factories,
+    synthetic_stream,
+    telemetry_row_to_state,
+)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class TestStreams:
+
+    def test_telemetry_row_mapping(self):
+        snap = telemetry_row_to_state({
+            "timestamp": None, "session_id": "x", "rpm": 5200.0,
+            "wheel_fl": 88.0, "lap_number": 3, "sector_index": 2,
+            "si_drive_mode": SIDriveMode.SPORT_SHARP.label, "surface_state": SurfaceState.WET.label,
+            "not_a_field": 1,
+        })
+        assert snap.rpm == 5200.0
+        assert snap.wheel_speed_fl == 88.0
+        assert snap.lap_count == 3 and snap.current_sector == 2
+        assert snap.si_drive_mode == SIDriveMode.SPORT_SHARP
+        assert snap.surface_state == SurfaceState.WET
+
+    def test_load_recorded_round_trip(self, tmp_path):
+        pytest.importorskip("duckdb")
+        from data.duckdb_store import DuckDBStore
+
+        db = tmp_path / "kisti.duckdb"
+        store = DuckDBStore(db)
+        store.open()
+        sid = store.start_session()
+        for rpm in (3000.0, 4000.0):
+            store.record_telemetry(sid, DiffState(rpm=rpm, wheel_speed_rr=61.0))
+        store.close()
+
+        states = load_recorded(db, sid)
+        assert [s.rpm for s in states] == [3000.0, 4000.0]
+        assert states[0].wheel_speed_rr == 61.0
+
+
+class TestBenchmark:
+
+    def test_factories_cover_every_screen(self):
+        assert list(screen_factories()) == [
+            "intelligent", "sport", "sharp", "sharp_track", "diff", "track", "kisti",
+        ]
+
+    def test_run_reports_all_passes(self, qapp):
+        results = run(["sharp", "diff"], 3, synthetic_stream, "synthetic")
+        assert results["meta"]["frames"] == 3
+        assert results["meta"]["size"] == [800, 480]
+        for name in ("sharp", "diff"):
+            r = results["screens"][name]
+            assert r["paint"]["mean_ms"] > 0
+            assert r["paint"]["p99_ms"] >= r["paint"]["p50_ms"]
+            assert set(r["alloc"]) == {"peak_kb_mean", "peak_kb_p99", "retained_blocks_per_frame"}
+            assert r["hotspots"] and r["hotspots"][0]["function"].startswith("ui")
+
+    def test_compare_flags_regressions(self):
+        base = {"screens": {"sharp": {"paint": {"mean_ms": 2.0, "p99_ms": 4.0}}}}
+        ok = {"screens": {"sharp": {"paint": {"mean_ms": 2.2, "p99_ms": 4.1}}}}
+        slow = {"screens": {"sharp": {"paint": {"mean_ms": 2.5, "p99_ms": 4.1}}}}
+        assert compare(ok, base, 0.15) == []
+        regressions = compare(slow, base, 0.15)
+        assert len(regressions) == 1 and "mean_ms" in regressions[0]
@@ -0,0 +1,210 @@
+"""Tests for the pluggable VAD backends (voice/vad.py)."""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+
+from voice.vad import (
+    FRAME_SAMPLES, HANGOVER_CONFIDENCE, SILERO_CONTEXT_SAMPLES, EnergyVAD,
+    SileroOnnxVAD, load_vad,
+)
+
+SAMPLES_DIR = Path(os.environ.get("KISTI_VAD_SAMPLES", "/tmp/kisti_wake_samples/real_positive/"))
+
+
+def _frame(level: float, seed: int = 0, tone: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    if tone:
+        t = np.arange(FRAME_SAMPLES) / 16000
+        samples = (level * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+    else:
+        samples = rng.normal(0, level, FRAME_SAMPLES).astype(np.float32)
+    return samples, (samples * 32768).astype(np.int16)
+
+
+def _fake_session(input_names, prob=0.7):
+    session = MagicMock()
+    session.get_inputs.return_value = [SimpleNamespace(name=n) for n in input_names]
+    calls = []
+
+    def run(_outputs, feeds):
+        calls.append({k: np.array(v, copy=True) for k, v in feeds.items()})
+        out = np.array([[prob]], dtype=np.float32)
+        if "state" in feeds:
+            return [out, feeds["state"] + 1.0]
+        return [out, feeds["h"] + 1.0, feeds["c"] + 2.0]
+
+    session.run.side_effect = run
+    return session, calls
+
+
+class TestEnergyVAD:
+
+    def test_noise_silent_speech_detected(self):
+        vad = EnergyVAD()
+        for i in range(30):
+            assert vad.confidence(*_frame(0.003, seed=i)) < 0.5
+        assert vad.confidence(*_frame(0.2, tone=True)) > 0.5
+
+    def test_floor_absorbs_steady_noise(self):
+        vad = EnergyVAD()
+        vad.confidence(*_frame(0.001))
+        quiet_floor = vad.noise_floor_db
+        for i in range(2000):
+            vad.confidence(*_frame(0.02, seed=i))
+        assert vad.noise_floor_db > quiet_floor + 20
+        vad._hangover = 0
+        assert vad.confidence(*_frame(0.02, seed=9999)) < 0.5
+
+    def test_floor_follows_quiet_quickly(self):
+        vad = EnergyVAD()
+        vad.confidence(*_frame(0.05))
+        for i in range(20):
+            vad.confidence(*_frame(0.001, seed=i))
+        assert vad.noise_floor_db < -50
+
+    def test_absolute_gate(self):
+        vad = EnergyVAD()
+        vad.confidence(*_frame(0.00001))
+        assert vad.confidence(*_frame(0.0015, tone=True)) == 0.0
+
+    def test_hangover_holds_decision(self):
+        vad = EnergyVAD(hangover_frames=3)
+        for i in range(10):
+            vad.confidence(*_frame(0.003, seed=i))
+        assert vad.confidence(*_frame(0.2, tone=True)) > 0.5
+        held = [vad.confidence(*_frame(0.003, seed=100 + i)) for i in range(4)]
+        assert held[:3] == [HANGOVER_CONFIDENCE] * 3
+        assert held[3] < 0.5
+
+    def test_reset_keeps_floor(self):
+        vad = EnergyVAD()
+        for i in range(10):
+            vad.confidence(*_frame(0.003, seed=i))
+        vad.confidence(*_frame(0.2, tone=True))
+        floor = vad.noise_floor_db
+        vad.reset_states()
+        assert vad.noise_floor_db == floor
+        assert vad.confidence(*_frame(0.003, seed=50)) < 0.5
+
+
+class TestSileroOnnxVAD:
+
+    def test_v5_state_and_context_carried(self):
+        session, calls = _fake_session(["input", "state", "sr"])
+        vad = SileroOnnxVAD(session=session)
+        a = np.arange(FRAME_SAMPLES, dtype=np.float32)
+        b = -np.arange(FRAME_SAMPLES, dtype=np.float32)
+        assert vad.confidence(a, None) == pytest.approx(0.7)
+        vad.confidence(b, None)
+
+        first, second = calls
+        assert first["input"].shape == (1, SILERO_CONTEXT_SAMPLES + FRAME_SAMPLES)
+        assert not first["input"][0, :SILERO_CONTEXT_SAMPLES].any()
+        np.testing.assert_array_equal(second["input"][0, :SILERO_CONTEXT_SAMPLES], a[-SILERO_CONTEXT_SAMPLES:])
+        np.testing.assert_array_equal(second["input"][0, SILERO_CONTEXT_SAMPLES:], b)
+        assert not first["state"].any()
+        assert (second["state"] == 1.0).all()
+        assert second["sr"].dtype == np.int64 and int(second["sr"]) == 16000
+
+    def test_v5_reset_clears_state_and_context(self):
+        session, calls = _fake_session(["input", "state", "sr"])
+        vad = SileroOnnxVAD(session=session)
+        vad.confidence(np.ones(FRAME_SAMPLES, dtype=np.float32), None)
+        vad.reset_states()
+        vad.confidence(np.ones(FRAME_SAMPLES, dtype=np.float32), None)
+        assert not calls[1]["state"].any()
+        assert not calls[1]["input"][0, :SILERO_CONTEXT_SAMPLES].any()
+
+    def test_v4_hidden_state(self):
+        session, calls = _fake_session(["input", "sr", "h", "c"])
+        vad = SileroOnnxVAD(session=session)
+        for _ in range(2):
+            vad.confidence(np.ones(FRAME_SAMPLES, dtype=np.float32), None)
+        assert calls[0]["input"].shape == (1, FRAME_SAMPLES)
+        assert (calls[1]["h"] == 1.0).all() and (calls[1]["c"] == 2.0).all()
+        vad.reset_states()
+        vad.confidence(np.ones(FRAME_SAMPLES, dtype=np.float32), None)
+        assert not calls[2]["h"].any() and not calls[2]["c"].any()
+
+    def test_missing_model(self, monkeypatch):
+        pytest.importorskip("onnxruntime")
+        monkeypatch.setattr("voice.vad.find_silero_onnx_model", lambda: None)
+        with pytest.raises(FileNotFoundError):
+            SileroOnnxVAD()
+
+
+class TestLoadVad:
+
+    def test_explicit_energy(self):
+        assert load_vad("energy").name == "energy"
+
+    def test_unknown_rejected(self):
+        with pytest.raises(ValueError):
+            load_vad("nope")
+
+    def test_auto_falls_through_in_order(self, monkeypatch):
+        import voice.vad as vad_mod
+
+        def unavailable(*_a, **_k):
+            raise ImportError("missing")
+
+        monkeypatch.setattr(vad_mod, "SileroOnnxVAD", unavailable)
+        monkeypatch.setattr(vad_mod, "SileroTorchVAD", unavailable)
+        monkeypatch.setattr(vad_mod, "WebRtcVAD", unavailable)
+        assert load_vad("auto").name == "energy"
+
+    def test_auto_prefers_onnx(self, monkeypatch):
+        import voice.vad as vad_mod
+
+        sentinel = SimpleNamespace(name="silero_onnx")
+        monkeypatch.setattr(vad_mod, "SileroOnnxVAD", lambda: sentinel)
+        assert load_vad("auto") is sentinel
+
+    def test_mic_loop_does_not_import_torch(self):
+        import inspect
+
+        from voice.mic_capture import MicCapture
+
+        assert "torch" not in inspect.getsource(MicCapture._vad_process)
+        assert "torch" not in inspect.getsource(MicCapture.start)
+
+
+def _sample_clips():
+    if not SAMPLES_DIR.is_dir():
+        return []
+    return sorted(SAMPLES_DIR.glob("*.wav"))
+
+
+@pytest.mark.skipif(not _sample_clips(), reason=f"no recorded samples in {SAMPLES_DIR}")
+class TestRecordedSampleParity:
+    """Accuracy on clips from scripts/record_wake_samples.py."""
+
+    def _tracks(self, name):
+        from scripts.vad_benchmark import frame_decisions, load_wav_frames
+
+        vad = load_vad(name)
+        return [frame_decisions(vad, load_wav_frames(p))[0] for p in _sample_clips()]
+
+    def test_onnx_matches_torch(self):
+        if importlib.util.find_spec("onnxruntime") is None or importlib.util.find_spec("torch") is None:
+            pytest.skip("needs onnxruntime and torch")
+        from scripts.vad_benchmark import agreement
+
+        onnx, torch = self._tracks("silero_onnx"), self._tracks("silero")
+        for a, b in zip(onnx, torch):
+            assert agreement(a, b) >= 0.98
+
+    @pytest.mark.parametrize("name", ["silero_onnx", "energy"])
+    def test_speech_found_in_every_positive(self, name):
+        if name == "silero_onnx" and importlib.util.find_spec("onnxruntime") is None:
+            pytest.skip("needs onnxruntime")
+        assert all(track.any() for track in self._tracks(name))
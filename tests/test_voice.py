@@ -3,6 +3,8 @@
 All tests use mocks (no Ollama, no WhisperTRT, no Piper, no audio hardware).
 """
 
+import math
+import random
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -20,7 +22,11 @@ from voice.mic_capture import (
     MicCapture, SAMPLE_RATE as MIC_SAMPLE_RATE, FRAME_BYTES,
     SPEECH_START_FRAMES, SPEECH_END_FRAMES, VAD_MODE,
 )
-from voice.led_waveform import LEDWaveformGenerator, LEDFrame
+from voice.led_waveform import (
+    LEDWaveformGenerator, LEDFrame, _gforce_leds, _kitt_leds, _rpm_leds,
+    _warmup_brightness, _warmup_color, _waveform_leds,
+)
+from can.led_output import encode_led_output
 from can.can_config import (
     LED_COUNT, LED_MODE_KITT, LED_MODE_OFF, LED_MODE_RPM,
     LED_MODE_WARMUP, LED_MODE_WAVEFORM,
@@ -383,6 +389,97 @@ class TestLEDWaveform:
         assert all(b == 0 for b in frame.brightnesses)
 
 
+class TestLEDAnimationTables:
+    """Table frames against the per-frame reference generators."""
+
+    @staticmethod
+    def _diff(a, b):
+        return max(abs(x - y) for x, y in zip(a, b))
+
+    @staticmethod
+    def _rgb(frame):
+        return (frame.color_r, frame.color_g, frame.color_b)
+
+    def test_waveform_matches_reference(self):
+        gen = LEDWaveformGenerator()
+        for k in range(1000):
+            amp = k / 999
+            ref, rgb = _waveform_leds(amp)
+            frame = gen.waveform_frame(amp)
+            assert self._diff(frame.brightnesses, ref) <= 1
+            assert self._rgb(frame) == rgb
+
+    def test_kitt_matches_reference(self):
+        """Within 4 levels, except LEDs right on the falloff steps (1 and 2 LEDs away)."""
+        gen = LEDWaveformGenerator()
+        phase = 0.0
+        for _ in range(600):
+            frame = gen.kitt_sweep_frame()
+            phase += 2.5 / 30.0
+            ref, _ = _kitt_leds(phase)
+            pos = (math.sin(phase) + 1.0) / 2.0 * (LED_COUNT - 1)
+            for i, (got, want) in enumerate(zip(frame.brightnesses, ref)):
+                if abs(got - want) > 4:
+                    assert min(abs(abs(i - pos) - step) for step in (1.0, 2.0)) < 0.02
+
+    def test_rpm_exact(self):
+        gen = LEDWaveformGenerator()
+        for rpm in range(0, 8001, 5):
+            frame = gen.rpm_shift_frame(float(rpm))
+            if rpm < 6500 * 0.6:
+                assert frame.brightnesses == [0] * LED_COUNT and self._rgb(frame) == (0, 0, 0)
+                continue
+            ref, rgb = _rpm_leds(max(0.0, min(1.0, (rpm - 3900.0) / (7500.0 - 3900.0))))
+            assert (frame.brightnesses, self._rgb(frame)) == (ref, rgb), rpm
+
+    def test_g_force_matches_reference(self):
+        gen = LEDWaveformGenerator()
+        rng = random.Random(7)
+        for _ in range(5000):
+            ax, ay = rng.uniform(-1.6, 1.6), rng.uniform(-1.6, 1.6)
+            ref, rgb = _gforce_leds(math.sqrt(ax ** 2 + ay ** 2))
+            frame = gen.g_force_frame(ax, ay)
+            assert [b > 0 for b in frame.brightnesses] == [b > 0 for b in ref]
+            assert self._diff(frame.brightnesses, ref) <= 1
+            assert self._diff(self._rgb(frame), rgb) <= 3
+        assert gen.g_force_frame(3.0, 3.0).brightnesses == [255] * LED_COUNT
+
+    def test_warmup_matches_reference(self):
+        gen = LEDWaveformGenerator()
+        phase = 0.0
+        for k in range(400):
+            progress = (k % 101) / 100
+            frame = gen.warmup_frame(progress)
+            phase += 1.0 / 30.0
+            assert abs(frame.brightnesses[0] - _warmup_brightness(phase * 2.0)) <= 1
+            assert self._diff(self._rgb(frame), _warmup_color(progress)) <= 3
+
+    def test_payloads_are_encoded_frames(self):
+        gen = LEDWaveformGenerator()
+        frames = [
+            gen.waveform_frame(0.7), gen.kitt_sweep_frame(), gen.rpm_shift_frame(7000.0),
+            gen.rpm_shift_frame(1000.0), gen.warmup_frame(0.3), gen.g_force_frame(0.8, 0.2),
+            gen.off_frame(),
+        ]
+        for frame in frames:
+            assert frame.payload == encode_led_output(
+                frame.mode, frame.brightnesses, frame.color_r, frame.color_g, frame.color_b)
+        assert LEDFrame(LED_MODE_KITT, [1] * LED_COUNT).encoded() == encode_led_output(
+            LED_MODE_KITT, [1] * LED_COUNT, 0, 0, 0)
+
+    def test_tables_shared(self):
+        assert LEDWaveformGenerator()._tables is LEDWaveformGenerator()._tables
+        a, b = LEDWaveformGenerator(), LEDWaveformGenerator()
+        assert a.warmup_frame(0.42) is b.warmup_frame(0.42)      # Table frame, not rebuilt
+
+    def test_module_is_qt_free(self):
+        import subprocess
+
+        code = "import sys, voice.led_waveform; assert 'PySide6' not in sys.modules"
+        root = Path(__file__).resolve().parent.parent
+        assert subprocess.run([sys.executable, "-c", code], cwd=root).returncode == 0
+
+
 # ========================================================================
 # LLM Token Cap tests
 # ========================================================================
@@ -442,11 +539,23 @@ class TestMicCapture:
         assert not mic.is_running
 
     def test_start_without_webrtcvad(self, monkeypatch):
-        """Graceful fallback when webrtcvad not installed."""
-        import importlib
-        import voice.mic_capture as mc
+        """Auto VAD falls back to the energy detector when nothing else loads."""
+        original_import = __builtins__.__import__ if hasattr(__builtins__, '__import__') else __import__
+        def mock_import(name, *args, **kwargs):
+            if name in ("webrtcvad", "onnxruntime", "torch", "silero_vad"):
+                raise ImportError(f"No module named '{name}'")
+            return original_import(name, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.__import__", mock_import)
+        monkeypatch.setattr(MicCapture, "_probe_mic", lambda self: False)
+        mic = MicCapture(vad_type="auto")
+        mic.start()
+        assert mic._vad_type == "energy"
+        assert not mic.is_available
+        assert not mic.is_running
 
-        # Simulate webrtcvad not being importable
+    def test_start_explicit_vad_missing(self, monkeypatch):
+        """An explicitly requested backend that can't load disables the mic."""
         original_import = __builtins__.__import__ if hasattr(__builtins__, '__import__') else __import__
         def mock_import(name, *args, **kwargs):
             if name == "webrtcvad":
@@ -454,8 +563,9 @@ class TestMicCapture:
             return original_import(name, *args, **kwargs)
 
         monkeypatch.setattr("builtins.__import__", mock_import)
-        mic = MicCapture()
+        mic = MicCapture(vad_type="webrtcvad")
         mic.start()
+        assert mic._vad is None
         assert not mic.is_available
         assert not mic.is_running
 
@@ -907,6 +1017,93 @@ class TestPipelineTrace:
         assert trace.source == "sensor"
         assert trace.query_text == "What is the temp?"
 
+    def test_streaming_first_token_and_first_word(self):
+        now = time.monotonic()
+        trace = PipelineTrace(
+            mic_captured_at=now,
+            stt_done_at=now + 0.100,
+            first_token_at=now + 0.100 + 0.400,
+            first_sentence_at=now + 0.100 + 0.600,
+            llm_done_at=now + 0.100 + 0.600,
+            tts_done_at=now + 0.100 + 0.600 + 0.200,
+            speaker_start_at=now + 0.100 + 0.600 + 0.210,
+        )
+        assert trace.first_token_ms == 400
+        assert trace.first_word_ms == 810
+        assert trace.llm_ms + trace.tts_ms == 800
+
+    def test_streaming_fields_zero_when_not_streamed(self, mock_pipeline_trace):
+        assert mock_pipeline_trace.first_token_ms == 0
+        assert mock_pipeline_trace.first_word_ms > 0
+
+
+class TestFrontierStreamingVoice:
+    """Streamed frontier sentences are queued for TTS on the first sentence."""
+
+    def _make_vm(self):
+        from unittest.mock import MagicMock
+        from voice.llm_engine import LLMResponse
+        from voice.voice_manager import VoiceManager
+
+        vm = VoiceManager(enable_mic=False)
+        vm._frontier = MagicMock()
+        vm._llm = MagicMock()
+        vm._llm.is_real = False  # No ack timer
+
+        def fake_query(**kwargs):
+            stream = kwargs["stream"]
+            stream.mark_token()
+            stream.put("Turbo lag is spool time.")
+            # First sentence is already queued while the LLM is still "generating"
+            assert not vm._speak_queue.empty()
+            stream.put("Bigger turbos lag more.")
+            stream.close()
+            return LLMResponse(
+                text=stream.text, model="m", tier="frontier_live", latency_s=0.5, tokens=8,
+            )
+
+        vm._llm.query.side_effect = fake_query
+        return vm
+
+    def test_stream_queued_once_with_trace(self):
+        vm = self._make_vm()
+        now = time.monotonic()
+        trace = PipelineTrace(mic_captured_at=now, stt_done_at=now)
+        vm.handle_voice_query("what causes turbo lag in general", trace=trace)
+
+        item = vm._speak_queue.get_nowait()
+        assert item.stream is not None
+        assert vm._speak_queue.empty()  # Full text not queued a second time
+        assert vm._active_trace is trace
+        assert trace.first_token_at > 0
+        assert trace.llm_done_at == trace.first_sentence_at
+        assert trace.source == "frontier_live"
+        assert vm._dialogue.turn_counter == 1
+
+    def test_track_stream_updates_echo_text(self):
+        vm = self._make_vm()
+        vm.handle_voice_query("what causes turbo lag in general")
+        item = vm._speak_queue.get_nowait()
+
+        spoken = list(vm._track_stream(item.stream))
+        assert spoken == ["Turbo lag is spool time.", "Bigger turbos lag more."]
+        assert vm._last_spoken_text == "turbo lag is spool time. bigger turbos lag more."
+
+    def test_streaming_disabled_queues_full_text(self):
+        from voice.llm_engine import LLMResponse
+
+        vm = self._make_vm()
+        vm._stream_frontier = False
+        vm._llm.query.side_effect = None
+        vm._llm.query.return_value = LLMResponse(
+            text="One. Two.", model="m", tier="frontier_live", latency_s=0.5, tokens=2,
+        )
+        vm.handle_voice_query("what causes turbo lag in general")
+        assert vm._llm.query.call_args.kwargs["stream"] is None
+        item = vm._speak_queue.get_nowait()
+        assert item.stream is None
+        assert item.text == "One. Two."
+
 
 # ========================================================================
 # Response Composer tests (Phase 4.2)
@@ -1555,7 +1752,6 @@ class TestECUSensorVoiceHandlers:
 
 import struct
 import wave
-import math
 
 
 class TestWakeWordTraining:
@@ -138,6 +138,33 @@ class TestAnswerFromTiming:
         result = vm._answer_from_timing("splits")
         assert "no sector" in result.lower()
 
+    def test_losing_time_names_worst_mini_sectors(self):
+        from timing.mini_sectors import MiniSectorTimer
+
+        mini = MiniSectorTimer(segment_m=50.0)
+        mini.configure(150.0, [5.0, 5.0, 5.0])
+        mini.start_lap()
+        mini.update(50.0, 5.0)
+        mini.update(100.0, 10.8)
+        mini.finish_lap(16.1)
+        vm = _make_vm()
+        vm._telemetry_snapshot = _make_snapshot()
+        mock_tm = MagicMock()
+        mock_tm.lap_timer.mini_sectors = mini
+        mock_tm.lap_timer._completed_laps = [MagicMock()]
+        vm._timing_manager = mock_tm
+        result = vm._answer_from_timing("where am i losing time")
+        assert result.startswith("Most time lost at 50 to 100 meters, 0.80; 100 to 150 meters, 0.30.")
+        assert "Optimal lap 15.0 seconds" in result
+
+    def test_losing_time_no_laps(self):
+        vm = _make_vm()
+        vm._telemetry_snapshot = _make_snapshot()
+        mock_tm = MagicMock()
+        mock_tm.lap_timer._completed_laps = []
+        vm._timing_manager = mock_tm
+        assert "complete a lap" in vm._answer_from_timing("what's my optimal lap").lower()
+
     def test_track_name(self):
         vm = _make_vm()
         vm._telemetry_snapshot = _make_snapshot()
@@ -521,9 +548,10 @@ class TestGPSDropoutRecovery:
     def test_large_jump_rejected(self):
         """GPS jump >500m should be skipped (satellite reacquire)."""
         from timing.timing_manager import TimingManager
-        from unittest.mock import MagicMock, PropertyMock
 
-        bridge = MagicMock()
+        from model.vehicle_state import DiffStateBridge
+
+        bridge = DiffStateBridge()
         mgr = TimingManager(bridge=bridge, db_store=None)
         mgr._active = True
         mgr._track_detected = True  # already have a track
@@ -533,10 +561,7 @@ class TestGPSDropoutRecovery:
         mgr._prev_gps_lon = -121.7534
 
         # Simulate a large jump (>500m away)
-        snap = MagicMock()
-        snap.gps_latitude = 37.0  # ~46km north
-        snap.gps_longitude = -121.7534
-        bridge.snapshot.return_value = snap
+        bridge.update_gps(37.0, -121.7534)  # ~46km north
 
         mgr._on_state_changed()
 
@@ -548,7 +573,9 @@ class TestGPSDropoutRecovery:
         """Small GPS movement should be passed through to LapTimer."""
         from timing.timing_manager import TimingManager
 
-        bridge = MagicMock()
+        from model.vehicle_state import DiffStateBridge
+
+        bridge = DiffStateBridge()
         mgr = TimingManager(bridge=bridge, db_store=None)
         mgr._active = True
         mgr._track_detected = True
@@ -557,10 +584,7 @@ class TestGPSDropoutRecovery:
         mgr._prev_gps_lon = -121.7534
 
         # Small movement (~11m)
-        snap = MagicMock()
-        snap.gps_latitude = 36.5842
-        snap.gps_longitude = -121.7534
-        bridge.snapshot.return_value = snap
+        bridge.update_gps(36.5842, -121.7534)
 
         # Should reach update_bridge_timing (which calls blockSignals)
         mgr._on_state_changed()
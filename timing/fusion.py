@@ -0,0 +1,150 @@
+"""GPS + IMU dead reckoning between GPS fixes for lap/sector timing.
+
+Pure Python — no Qt dependency.  Fully testable with synthetic traces.
+
+The GPS09 Pro delivers position at 10–25 Hz; crossing a line between two
+fixes 2–3 m apart is only as good as a straight-line interpolation across
+them.  GpsImuFusion fills the gap from the IMU (50–100 Hz):
+
+  - each fix anchors a local east/north frame (flat-earth, as in
+    ``timing.geo``) and the last GPS speed / course over ground
+  - every IMU sample advances the estimate: longitudinal g changes speed,
+    lateral g turns the heading (a_lat / v), position integrates along it
+  - when the next fix arrives, the dead-reckoned path is pulled onto it
+    by spreading the end-point error linearly over the interval, so the
+    corrected path starts and ends exactly on fixes and never jumps
+
+:meth:`GpsImuFusion.add_fix` returns that corrected path (ending with the
+fix itself) for LapTimer to consume in order; between fixes
+:meth:`GpsImuFusion.add_imu` returns the live estimate.  Without IMU or
+GPS speed/heading data the path is just the fix — plain GPS timing.
+
+All timestamps are capture times in the ``time.monotonic()`` domain.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+G = 9.80665                    # m/s² per g
+_M_PER_DEG_LAT = 111_320.0     # Same flat-earth scale as timing.geo
+
+
+class GpsImuFusion:
+    """Dead-reckoned positions between GPS fixes, corrected onto each fix.
+
+    Usage:
+        fusion = GpsImuFusion()
+        fusion.set_motion(speed_mps, heading_deg, ts)   # GPS ext frame
+        fusion.add_imu(accel_x, accel_y, ts)            # → (lat, lon) or None
+        for lat, lon, ts in fusion.add_fix(lat, lon, ts):
+            timer.update(lat, lon, ts)
+    """
+
+    # No dead reckoning across longer fix gaps (dropout: the path is unknown)
+    MAX_FIX_GAP_S: float = 1.0
+    # Below this speed lateral g doesn't steer (heading from a_lat / v blows up)
+    MIN_TURN_SPEED_MPS: float = 3.0
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all state — the next fix starts afresh."""
+        self._fix: Optional[tuple[float, float, float]] = None   # lat, lon, ts
+        self._m_per_deg_lon = _M_PER_DEG_LAT
+        self._has_motion = False
+        self._speed = 0.0              # m/s
+        self._heading = 0.0            # rad, clockwise from true north
+        self._accel = (0.0, 0.0)       # last IMU sample, m/s² (longitudinal, lateral)
+        self._ts = 0.0                 # time of the dead-reckoned state
+        self._east = 0.0               # m from the last fix
+        self._north = 0.0
+        self._travelled = 0.0          # m along the path since the last fix
+        self._samples: list[tuple[float, float, float]] = []   # ts, east, north
+        self.estimates = 0             # dead-reckoned positions produced
+
+    @property
+    def distance_since_fix(self) -> float:
+        """Dead-reckoned path length since the last fix (m)."""
+        return self._travelled
+
+    @property
+    def estimate_ts(self) -> Optional[float]:
+        """Time of the newest estimate (fix or IMU), None before any fix."""
+        return self._ts if self._fix is not None else None
+
+    def set_motion(self, speed_mps: float, heading_deg: float, ts: float) -> None:
+        """GPS speed and course over ground (the velocity dead reckoning starts from)."""
+        if self._fix is not None and ts > self._ts:
+            self._propagate(ts)
+        self._speed = max(0.0, speed_mps)
+        if speed_mps >= self.MIN_TURN_SPEED_MPS or not self._has_motion:
+            self._heading = math.radians(heading_deg)
+        self._has_motion = True
+
+    def add_imu(self, accel_x: float, accel_y: float, ts: float) -> Optional[tuple[float, float]]:
+        """Advance the estimate with an IMU sample (g); returns (lat, lon) or None."""
+        fix = self._fix
+        if fix is None or not self._has_motion or ts <= self._ts:
+            return None
+        if ts - fix[2] > self.MAX_FIX_GAP_S:
+            return None
+        self._propagate(ts)
+        self._accel = (accel_x * G, accel_y * G)
+        self._samples.append((ts, self._east, self._north))
+        self.estimates += 1
+        return self._to_latlon(self._east, self._north)
+
+    def add_fix(self, lat: float, lon: float, ts: float) -> list[tuple[float, float, float]]:
+        """Anchor on a GPS fix; returns the corrected path since the previous one.
+
+        The path is a list of (lat, lon, ts) in time order — the dead-reckoned
+        samples between the two fixes, shifted onto this fix — ending with the
+        fix itself.
+        """
+        path: list[tuple[float, float, float]] = []
+        prev = self._fix
+        if prev is not None and self._samples and 0.0 < ts - prev[2] <= self.MAX_FIX_GAP_S:
+            self._propagate(ts)
+            fix_east = (lon - prev[1]) * self._m_per_deg_lon
+            fix_north = (lat - prev[0]) * _M_PER_DEG_LAT
+            err_east = fix_east - self._east
+            err_north = fix_north - self._north
+            span = ts - prev[2]
+            for t, east, north in self._samples:
+                if t >= ts:
+                    break
+                w = (t - prev[2]) / span
+                s_lat, s_lon = self._to_latlon(east + err_east * w, north + err_north * w)
+                path.append((s_lat, s_lon, t))
+        path.append((lat, lon, ts))
+
+        self._fix = (lat, lon, ts)
+        self._m_per_deg_lon = _M_PER_DEG_LAT * math.cos(math.radians(lat))
+        self._ts = ts
+        self._east = self._north = self._travelled = 0.0
+        self._samples.clear()
+        return path
+
+    # ── Internal ───────────────────────────────────────────────────
+
+    def _propagate(self, ts: float) -> None:
+        """Integrate speed, heading and position from self._ts to ts."""
+        dt = ts - self._ts
+        if dt <= 0.0:
+            return
+        along, lateral = self._accel
+        if self._speed >= self.MIN_TURN_SPEED_MPS:
+            self._heading += lateral / self._speed * dt
+        self._speed = max(0.0, self._speed + along * dt)
+        step = self._speed * dt
+        self._east += step * math.sin(self._heading)
+        self._north += step * math.cos(self._heading)
+        self._travelled += step
+        self._ts = ts
+
+    def _to_latlon(self, east: float, north: float) -> tuple[float, float]:
+        lat0, lon0, _ = self._fix
+        return lat0 + north / _M_PER_DEG_LAT, lon0 + east / self._m_per_deg_lon
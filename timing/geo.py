@@ -2,6 +2,8 @@
 
 Pure functions — no Qt, no DiffState, no external dependencies.
 All angles in degrees, distances in meters, coordinates in WGS84.
+Whole-trace (NumPy) versions live in :mod:`timing.geo_array`;
+cumulative_distance() is a thin wrapper over it (imported on first use).
 """
 
 from __future__ import annotations
@@ -78,6 +80,84 @@ def line_segment_crossing(
     return None
 
 
+class LocalFrame:
+    """Local tangent-plane (east/north) projection about a fixed origin.
+
+    Built once per track so each GPS fix is converted to metres exactly
+    once; crossings and distances are then plain 2D arithmetic.  Scaled
+    to the haversine Earth radius, so short distances agree with
+    :func:`haversine_distance`.  Flat-earth: fine within a few km of the
+    origin, i.e. any circuit.
+    """
+
+    __slots__ = ("lat0", "lon0", "m_per_deg_lat", "m_per_deg_lon")
+
+    def __init__(self, lat0: float, lon0: float) -> None:
+        self.lat0 = lat0
+        self.lon0 = lon0
+        self.m_per_deg_lat = _R * math.pi / 180.0
+        self.m_per_deg_lon = self.m_per_deg_lat * math.cos(math.radians(lat0))
+
+    def project(self, lat: float, lon: float) -> tuple[float, float]:
+        """GPS point → (east, north) metres from the origin."""
+        return (lon - self.lon0) * self.m_per_deg_lon, (lat - self.lat0) * self.m_per_deg_lat
+
+    def unproject(self, x: float, y: float) -> tuple[float, float]:
+        """(east, north) metres → (lat, lon)."""
+        return self.lat0 + y / self.m_per_deg_lat, self.lon0 + x / self.m_per_deg_lon
+
+
+class TimingLine:
+    """A timing line segment precompiled into a :class:`LocalFrame`.
+
+    Holds the start point, direction vector and bounding box so
+    :meth:`crossing` is a box reject plus a few multiplies.
+    """
+
+    __slots__ = ("cx", "cy", "dx", "dy", "min_x", "max_x", "min_y", "max_y")
+
+    def __init__(self, x1: float, y1: float, x2: float, y2: float) -> None:
+        self.cx, self.cy = x1, y1
+        self.dx, self.dy = x2 - x1, y2 - y1
+        self.min_x, self.max_x = min(x1, x2), max(x1, x2)
+        self.min_y, self.max_y = min(y1, y2), max(y1, y2)
+
+    @classmethod
+    def from_latlon(
+        cls, frame: LocalFrame, lat1: float, lon1: float, lat2: float, lon2: float,
+    ) -> "TimingLine":
+        return cls(*frame.project(lat1, lon1), *frame.project(lat2, lon2))
+
+    def crossing(self, ax: float, ay: float, bx: float, by: float) -> Optional[float]:
+        """Fraction (0.0–1.0) along the path A → B where it crosses, or None.
+
+        Same result as :func:`line_segment_crossing` on projected points.
+        """
+        if ax < bx:
+            if bx < self.min_x or ax > self.max_x:
+                return None
+        elif ax < self.min_x or bx > self.max_x:
+            return None
+        if ay < by:
+            if by < self.min_y or ay > self.max_y:
+                return None
+        elif ay < self.min_y or by > self.max_y:
+            return None
+
+        abx = bx - ax
+        aby = by - ay
+        denom = abx * self.dy - aby * self.dx
+        if abs(denom) < 1e-12:
+            return None  # Parallel or coincident
+        acx = self.cx - ax
+        acy = self.cy - ay
+        t = (acx * self.dy - acy * self.dx) / denom
+        u = (acx * aby - acy * abx) / denom
+        if 0.0 <= t <= 1.0 and 0.0 <= u <= 1.0:
+            return t
+        return None
+
+
 def interpolate_crossing_time(prev_ts: float, curr_ts: float, fraction: float) -> float:
     """Interpolate the exact crossing time given timestamps and crossing fraction."""
     return prev_ts + (curr_ts - prev_ts) * fraction
@@ -127,13 +207,9 @@ def cumulative_distance(gps_trace: list[tuple[float, float]]) -> list[float]:
     """
     if not gps_trace:
         return []
-    distances = [0.0]
-    for i in range(1, len(gps_trace)):
-        prev_lat, prev_lon = gps_trace[i - 1]
-        curr_lat, curr_lon = gps_trace[i]
-        d = haversine_distance(prev_lat, prev_lon, curr_lat, curr_lon)
-        distances.append(distances[-1] + d)
-    return distances
+    from timing.geo_array import cumulative_distances, split_trace
+
+    return cumulative_distances(*split_trace(gps_trace)).tolist()
 
 
 def bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -0,0 +1,188 @@
+"""NumPy-vectorized GPS geometry for whole-trace processing.
+
+Array counterparts of :mod:`timing.geo` for batch work — learned traces,
+GPX/CSV imports, lap replays — where looping the scalar functions over
+tens of thousands of points in Python dominates.  Same formulas, same
+Earth radius and flat-earth scales, so results agree with the scalar
+versions to floating-point rounding.
+
+Per-fix code (LapTimer, TrackLearner.update) keeps using the scalar
+functions: NumPy call overhead is larger than the whole scalar
+computation for a single pair of points.
+
+Coordinates are passed as separate ``lats`` / ``lons`` arrays (any
+array-like; see :func:`split_trace` for a list of (lat, lon) tuples).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from timing.geo import _R, LocalFrame, TimingLine
+
+_M_PER_DEG = 111_320.0      # Flat-earth scale used by perpendicular_line
+
+
+def split_trace(trace: Iterable[tuple[float, float]]) -> tuple[np.ndarray, np.ndarray]:
+    """List of (lat, lon) tuples → (lats, lons) float64 arrays."""
+    pts = np.asarray(trace, dtype=np.float64).reshape(-1, 2)
+    return pts[:, 0], pts[:, 1]
+
+
+def haversine_distances(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Element-wise great-circle distance in meters (broadcasts)."""
+    rlat1, rlon1 = np.radians(lat1), np.radians(lon1)
+    rlat2, rlon2 = np.radians(lat2), np.radians(lon2)
+    a = (np.sin((rlat2 - rlat1) / 2) ** 2
+         + np.cos(rlat1) * np.cos(rlat2) * np.sin((rlon2 - rlon1) / 2) ** 2)
+    return _R * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def bearings(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Element-wise initial bearing from point 1 to point 2 in degrees (0–360)."""
+    rlat1, rlat2 = np.radians(lat1), np.radians(lat2)
+    dlon = np.radians(np.subtract(lon2, lon1))
+    x = np.sin(dlon) * np.cos(rlat2)
+    y = np.cos(rlat1) * np.sin(rlat2) - np.sin(rlat1) * np.cos(rlat2) * np.cos(dlon)
+    return (np.degrees(np.arctan2(x, y)) + 360) % 360
+
+
+def step_distances(lats, lons) -> np.ndarray:
+    """Distance of each step along a trace (length N-1)."""
+    lats, lons = np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64)
+    return haversine_distances(lats[:-1], lons[:-1], lats[1:], lons[1:])
+
+
+def cumulative_distances(lats, lons) -> np.ndarray:
+    """Cumulative distance along a trace in meters; first element 0.0."""
+    lats = np.asarray(lats, dtype=np.float64)
+    if not len(lats):
+        return np.zeros(0)
+    out = np.empty(len(lats))
+    out[0] = 0.0
+    np.cumsum(step_distances(lats, lons), out=out[1:])
+    return out
+
+
+def smoothed_bearings(lats, lons, half_window: int = 2) -> np.ndarray:
+    """Heading at every trace point from the points *half_window* either side.
+
+    Bearing from index i-h to i+h, clipped to the trace ends; where the
+    clipped window collapses to one point (1-point trace) the previous
+    point is used.  h=2 is the 5-point window track generation uses.
+    """
+    lats, lons = np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64)
+    n = len(lats)
+    idx = np.arange(n)
+    i0 = np.maximum(0, idx - half_window)
+    i1 = np.minimum(n - 1, idx + half_window)
+    same = i0 == i1
+    i0[same] = np.maximum(0, idx[same] - 1)
+    return bearings(lats[i0], lons[i0], lats[i1], lons[i1])
+
+
+def smooth_trace(lats, lons, window: int = 5) -> tuple[np.ndarray, np.ndarray]:
+    """Centred moving average of a trace (GPS jitter removal).
+
+    *window* points (odd); the window shrinks at the ends so the first and
+    last points are kept and the trace isn't pulled short.
+    """
+    lats, lons = np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64)
+    n = len(lats)
+    h = max(0, window // 2)
+    if n < 3 or h == 0:
+        return lats.copy(), lons.copy()
+    idx = np.arange(n)
+    half = np.minimum(np.minimum(idx, n - 1 - idx), h)     # Symmetric, shrinking at ends
+    lo, hi = idx - half, idx + half + 1
+
+    def _mean(v: np.ndarray) -> np.ndarray:
+        csum = np.concatenate(([0.0], np.cumsum(v)))
+        out = (csum[hi] - csum[lo]) / (hi - lo)
+        out[0], out[-1] = v[0], v[-1]           # Exact, not cumsum-rounded
+        return out
+
+    return _mean(lats), _mean(lons)
+
+
+def interpolate_at_distance(
+    lats, lons, cum_dists, targets,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Positions at the given distances along a trace.
+
+    Returns (lats, lons, segment index) — linear interpolation inside the
+    trace step containing each target (clamped to the trace).
+    """
+    lats, lons = np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64)
+    cum = np.asarray(cum_dists, dtype=np.float64)
+    targets = np.asarray(targets, dtype=np.float64)
+    seg = np.clip(np.searchsorted(cum, targets, side="right") - 1, 0, max(0, len(cum) - 2))
+    if len(cum) < 2:
+        return lats[seg], lons[seg], seg
+    d0, d1 = cum[seg], cum[seg + 1]
+    span = d1 - d0
+    frac = np.clip(np.divide(targets - d0, span, out=np.zeros_like(span), where=span > 0), 0.0, 1.0)
+    return (lats[seg] + frac * (lats[seg + 1] - lats[seg]),
+            lons[seg] + frac * (lons[seg + 1] - lons[seg]),
+            seg)
+
+
+def resample_by_distance(
+    lats, lons, step_m: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Resample a trace at fixed *step_m* distance intervals.
+
+    Returns (lats, lons, distances); the last original point is always
+    included so the resampled trace covers the full length.
+    """
+    if step_m <= 0.0:
+        raise ValueError(f"step_m must be positive, got {step_m}")
+    cum = cumulative_distances(lats, lons)
+    if len(cum) < 2:
+        return np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64), cum
+    total = cum[-1]
+    targets = np.arange(0.0, total, step_m)
+    if not len(targets) or targets[-1] < total:
+        targets = np.append(targets, total)
+    r_lats, r_lons, _ = interpolate_at_distance(lats, lons, cum, targets)
+    return r_lats, r_lons, targets
+
+
+def perpendicular_lines(
+    lats, lons, headings_deg, half_width_m: float = 15.0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Lines perpendicular to each heading, as (lat1, lon1, lat2, lon2) arrays."""
+    lats = np.asarray(lats, dtype=np.float64)
+    perp = np.radians((np.asarray(headings_deg, dtype=np.float64) + 90.0) % 360.0)
+    dlat = half_width_m * np.cos(perp) / _M_PER_DEG
+    dlon = half_width_m * np.sin(perp) / (_M_PER_DEG * np.cos(np.radians(lats)))
+    return lats + dlat, lons + dlon, lats - dlat, lons - dlon
+
+
+def project(frame: LocalFrame, lats, lons) -> tuple[np.ndarray, np.ndarray]:
+    """GPS arrays → (east, north) metre arrays in *frame*."""
+    x = (np.asarray(lons, dtype=np.float64) - frame.lon0) * frame.m_per_deg_lon
+    y = (np.asarray(lats, dtype=np.float64) - frame.lat0) * frame.m_per_deg_lat
+    return x, y
+
+
+def segment_crossings(xs, ys, line: TimingLine) -> tuple[np.ndarray, np.ndarray]:
+    """Every step of a projected path that crosses *line*.
+
+    Returns (step index i, fraction along step i → i+1) for all crossings
+    in path order — the batched form of :meth:`TimingLine.crossing`.
+    """
+    xs, ys = np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+    ax, ay, bx, by = xs[:-1], ys[:-1], xs[1:], ys[1:]
+    abx, aby = bx - ax, by - ay
+    denom = abx * line.dy - aby * line.dx
+    valid = np.abs(denom) >= 1e-12
+    safe = np.where(valid, denom, 1.0)
+    acx, acy = line.cx - ax, line.cy - ay
+    t = (acx * line.dy - acy * line.dx) / safe
+    u = (acx * aby - acy * abx) / safe
+    hit = valid & (t >= 0.0) & (t <= 1.0) & (u >= 0.0) & (u <= 1.0)
+    idx = np.flatnonzero(hit)
+    return idx, t[idx]
@@ -2,27 +2,39 @@
 
 Pure Python — no Qt dependency.  Fully testable with synthetic GPS traces.
 
-Consumes GPS updates at 10 Hz, detects start/finish and sector crossings
+Consumes GPS updates (10 Hz fixes, or the 50–100 Hz GPS+IMU path from
+``timing.fusion``), detects start/finish and sector crossings
 using the geometry primitives in ``timing.geo``, and produces TimingEvents
 for the UI layer to render.
 
+:meth:`LapTimer.set_track` compiles the timing lines into a per-track
+local east/north frame (``timing.geo.LocalFrame``) once; each fix is
+projected once and crossings / lap distance are plain 2D arithmetic.
+
 Supports:
   - Circuit timing (lap + sector splits)
   - Point-to-point timing (A → B)
   - Live delta-vs-reference (distance-indexed)
   - Predicted lap time
   - Theoretical best (best sector composition)
+  - Equal-distance micro-sectors with a live optimal lap (``timing.mini_sectors``)
+
+Best lap / best sectors / theoretical best are maintained incrementally as
+laps complete, and the event-driven state is published as an immutable
+:class:`TimingSnapshot` whose ``version`` changes only when it does.
 """
 
 from __future__ import annotations
 
 import bisect
 import logging
+import math
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional
 
-from timing.geo import haversine_distance, interpolate_crossing_time, line_segment_crossing
+from timing.geo import LocalFrame, TimingLine, interpolate_crossing_time
+from timing.mini_sectors import MiniSectorTimer
 from timing.track_db import SectorDefinition, StartFinishLine, TrackDefinition
 
 log = logging.getLogger("kisti.timing.lap_timer")
@@ -78,6 +90,29 @@ class ReferenceLap:
         return t0 + frac * (t1 - t0)
 
 
+@dataclass(frozen=True)
+class TimingSnapshot:
+    """Immutable view of the timing state that changes on lap/sector events.
+
+    ``version`` increases whenever any field changes, so consumers can
+    compare versions instead of contents.  Live values (elapsed time,
+    delta, predicted lap) change every update and are not included.
+    """
+
+    version: int
+    lap_count: int
+    current_sector: int
+    sector_count: int
+    sector_times: tuple[float, ...]
+    best_sector_times: tuple[Optional[float], ...]
+    best_lap_s: Optional[float]
+    theoretical_best_s: Optional[float]
+    lap_in_progress: bool
+    track_name: str
+    track_length_m: float
+    timing_mode: str              # 'circuit' | 'point_to_point' | ''
+
+
 # ── Completed-lap record (internal) ───────────────────────────────────
 
 @dataclass
@@ -112,6 +147,17 @@ class LapTimer:
         self._p2p_end_line: Optional[StartFinishLine] = None
         self._p2p_started: bool = False
 
+        # Timing lines compiled into the local frame (see _compile_lines)
+        self._frame: Optional[LocalFrame] = None
+        self._sf_line: Optional[TimingLine] = None
+        self._sector_lines: list[TimingLine] = []
+        self._p2p_start: Optional[TimingLine] = None
+        self._p2p_end: Optional[TimingLine] = None
+
+        self._mini = MiniSectorTimer()
+
+        self._version: int = 0
+        self._snapshot: Optional[TimingSnapshot] = None
         self._reset_timing_state()
 
     # ── Configuration ──────────────────────────────────────────────
@@ -120,6 +166,8 @@ class LapTimer:
         """Configure for a specific track and its sector boundaries."""
         self._track = track
         self._sectors = sorted(sectors, key=lambda s: s.sector_index)
+        self._compile_lines()
+        self._reset_mini_sectors()
         self._reset_timing_state()
         log.info("Track set: %s (%d sectors)", track.name, len(sectors))
 
@@ -129,6 +177,8 @@ class LapTimer:
         self._p2p_start_line = start_line
         self._p2p_end_line = end_line
         self._p2p_started = False
+        self._compile_lines()
+        self._reset_mini_sectors()
         self._reset_timing_state()
 
     def set_circuit_mode(self) -> None:
@@ -137,6 +187,8 @@ class LapTimer:
         self._p2p_start_line = None
         self._p2p_end_line = None
         self._p2p_started = False
+        self._compile_lines()
+        self._reset_mini_sectors()
         self._reset_timing_state()
 
     def set_reference_lap(self, lap_index: int) -> None:
@@ -159,6 +211,8 @@ class LapTimer:
         self._p2p_start_line = None
         self._p2p_end_line = None
         self._p2p_started = False
+        self._compile_lines()
+        self._reset_mini_sectors()
         self._reset_timing_state()
 
     # ── Core update loop ───────────────────────────────────────────
@@ -172,46 +226,60 @@ class LapTimer:
         if self._track is None and not self._p2p_mode:
             return []
 
+        x, y = self._frame.project(lat, lon)
+
         # First fix — store position and return
         if self._prev_lat is None:
             self._prev_lat = lat
             self._prev_lon = lon
+            self._prev_x = x
+            self._prev_y = y
             self._prev_ts = ts
             return []
 
         events: list[TimingEvent] = []
 
         if self._p2p_mode:
-            events = self._update_p2p(lat, lon, ts)
+            events = self._update_p2p(x, y, ts)
         else:
-            events = self._update_circuit(lat, lon, ts)
+            events = self._update_circuit(x, y, ts)
 
         self._prev_lat = lat
         self._prev_lon = lon
+        self._prev_x = x
+        self._prev_y = y
         self._prev_ts = ts
         return events
 
     # ── Delta / prediction queries ─────────────────────────────────
 
-    def get_delta(self) -> Optional[float]:
-        """Current time delta vs reference lap (positive = slower)."""
+    def get_delta(
+        self, at_ts: Optional[float] = None, extra_distance_m: float = 0.0,
+    ) -> Optional[float]:
+        """Current time delta vs reference lap (positive = slower).
+
+        at_ts / extra_distance_m evaluate it ahead of the last update — at a
+        dead-reckoned position extra_distance_m further along, at time at_ts.
+        """
         if self._reference is None or self._lap_start_ts is None:
             return None
         if self._prev_ts is None:
             return None
-        current_elapsed = self._prev_ts - self._lap_start_ts
-        current_dist = self._cumulative_distance
+        current_elapsed = (self._prev_ts if at_ts is None else at_ts) - self._lap_start_ts
+        current_dist = self._cumulative_distance + extra_distance_m
         ref_time = self._reference.time_at_distance(current_dist)
         return current_elapsed - ref_time
 
-    def get_predicted_lap(self) -> Optional[float]:
+    def get_predicted_lap(
+        self, at_ts: Optional[float] = None, extra_distance_m: float = 0.0,
+    ) -> Optional[float]:
         """Projected total lap time based on current pace + reference remaining."""
         if self._reference is None or self._lap_start_ts is None:
             return None
         if self._prev_ts is None:
             return None
-        current_elapsed = self._prev_ts - self._lap_start_ts
-        current_dist = self._cumulative_distance
+        current_elapsed = (self._prev_ts if at_ts is None else at_ts) - self._lap_start_ts
+        current_dist = self._cumulative_distance + extra_distance_m
         ref_time_at_dist = self._reference.time_at_distance(current_dist)
         ref_remaining = self._reference.total_time - ref_time_at_dist
         return current_elapsed + ref_remaining
@@ -221,12 +289,7 @@ class LapTimer:
 
         Returns None if any sector has no completed data.
         """
-        best = self.get_best_sector_times()
-        if not best:
-            return None
-        if any(t is None for t in best):
-            return None
-        return sum(best)
+        return self._theoretical_best
 
     def get_best_sector_times(self) -> list[Optional[float]]:
         """Best time for each sector across all completed laps.
@@ -234,22 +297,97 @@ class LapTimer:
         Returns a list with one entry per sector.  An entry is None if
         that sector has never been completed.
         """
-        if not self._sectors:
-            return []
-        n_sectors = len(self._sectors)
-        best: list[Optional[float]] = [None] * n_sectors
-        for lap in self._completed_laps:
-            for i, st in enumerate(lap.sector_times):
-                if i < n_sectors and (best[i] is None or st < best[i]):
-                    best[i] = st
-        return best
+        return list(self._best_sectors)
+
+    @property
+    def best_lap_s(self) -> Optional[float]:
+        """Fastest completed lap (or P2P run), None before the first."""
+        return self._best_lap
+
+    @property
+    def version(self) -> int:
+        """Increases whenever the :meth:`snapshot` state changes."""
+        return self._version
+
+    def snapshot(self) -> TimingSnapshot:
+        """Immutable event-driven timing state; the same object until it changes."""
+        snap = self._snapshot
+        if snap is None:
+            if self._p2p_mode:
+                mode = "point_to_point"
+            else:
+                mode = "circuit" if self._track else ""
+            snap = self._snapshot = TimingSnapshot(
+                version=self._version,
+                lap_count=self._lap_number,
+                current_sector=self._sector_index,
+                sector_count=len(self._sectors),
+                sector_times=tuple(self._current_sector_times),
+                best_sector_times=tuple(self._best_sectors),
+                best_lap_s=self._best_lap,
+                theoretical_best_s=self._theoretical_best,
+                lap_in_progress=self._lap_start_ts is not None,
+                track_name=self._track.name if self._track else "",
+                track_length_m=self._track.length_m if self._track else 0.0,
+                timing_mode=mode,
+            )
+        return snap
 
     def get_current_distance(self) -> float:
         """Cumulative distance in the current lap (meters)."""
         return self._cumulative_distance
 
+    @property
+    def mini_sectors(self) -> MiniSectorTimer:
+        """Equal-distance micro-sector bests / deltas for the current track."""
+        return self._mini
+
     # ── Internal helpers ───────────────────────────────────────────
 
+    def _compile_lines(self) -> None:
+        """Project the active timing lines into a local frame, once per configuration.
+
+        The frame is centred on the start/finish (or P2P start) line so the
+        lines, where precision matters, sit closest to the origin.
+        """
+        self._frame = None
+        self._sf_line = None
+        self._sector_lines = []
+        self._p2p_start = None
+        self._p2p_end = None
+
+        if self._p2p_mode and self._p2p_start_line is not None:
+            origin = self._p2p_start_line
+        elif self._track is not None and self._track.start_finish is not None:
+            origin = self._track.start_finish
+        elif self._track is not None:
+            self._frame = LocalFrame(self._track.center_lat, self._track.center_lon)
+            origin = None
+        else:
+            return
+        if origin is not None:
+            self._frame = LocalFrame((origin.lat1 + origin.lat2) / 2, (origin.lon1 + origin.lon2) / 2)
+
+        def compile_line(line: StartFinishLine) -> TimingLine:
+            return TimingLine.from_latlon(self._frame, line.lat1, line.lon1, line.lat2, line.lon2)
+
+        if self._track is not None and self._track.start_finish is not None:
+            self._sf_line = compile_line(self._track.start_finish)
+        self._sector_lines = [compile_line(s.line) for s in self._sectors]
+        if self._p2p_start_line is not None:
+            self._p2p_start = compile_line(self._p2p_start_line)
+        if self._p2p_end_line is not None:
+            self._p2p_end = compile_line(self._p2p_end_line)
+
+    def _reset_mini_sectors(self) -> None:
+        """New track or mode: drop micro-sector bests and layout.
+
+        The first timed lap lays the segments out from its own measured
+        distance (TrackDefinition.length_m is the official length, which
+        the GPS line around the lap can differ from by more than a segment).
+        """
+        self._mini.reset()
+
     def _reset_timing_state(self) -> None:
         """Reset all per-session timing state."""
         self._lap_number: int = 0
@@ -259,33 +397,56 @@ class LapTimer:
 
         self._prev_lat: Optional[float] = None
         self._prev_lon: Optional[float] = None
+        self._prev_x: float = 0.0          # Previous fix in the local frame (m)
+        self._prev_y: float = 0.0
         self._prev_ts: Optional[float] = None
 
         self._current_sector_times: list[float] = []
         self._completed_laps: list[_CompletedLap] = []
         self._reference: Optional[ReferenceLap] = None
 
+        # Aggregates over _completed_laps, kept up to date by _record_lap
+        self._best_lap: Optional[float] = None
+        self._best_sectors: list[Optional[float]] = [None] * len(self._sectors)
+        self._theoretical_best: Optional[float] = None
+
         # Distance trace for current lap
         self._distance_trace: list[float] = [0.0]
         self._time_trace: list[float] = [0.0]
         self._cumulative_distance: float = 0.0
+        self._dist_anchor: Optional[tuple[float, float]] = None  # Last (x, y) added to the trace
 
         # Track whether we have crossed start/finish at least once
         self._timing_active: bool = False
-
-    def _update_circuit(self, lat: float, lon: float, ts: float) -> list[TimingEvent]:
-        """Handle a GPS update in circuit (lap) mode."""
+        self._changed()
+
+    def _changed(self) -> None:
+        """Invalidate the published snapshot (lap / sector / configuration change)."""
+        self._version += 1
+        self._snapshot = None
+
+    def _record_lap(self, completed: _CompletedLap) -> None:
+        """Append a completed lap and fold it into the best-lap / best-sector aggregates."""
+        self._completed_laps.append(completed)
+        if self._best_lap is None or completed.total_time < self._best_lap:
+            self._best_lap = completed.total_time
+        best = self._best_sectors
+        for i, st in enumerate(completed.sector_times[:len(best)]):
+            if best[i] is None or st < best[i]:
+                best[i] = st
+        if best and all(t is not None for t in best):
+            self._theoretical_best = sum(best)
+        self._changed()
+
+    def _update_circuit(self, x: float, y: float, ts: float) -> list[TimingEvent]:
+        """Handle a GPS update (projected to x, y) in circuit (lap) mode."""
         events: list[TimingEvent] = []
-        sf = self._track.start_finish
+        sf = self._sf_line
         if sf is None:
             return events
 
         # Check start/finish crossing
-        sf_frac = line_segment_crossing(
-            self._prev_lat, self._prev_lon,
-            lat, lon,
-            sf.lat1, sf.lon1, sf.lat2, sf.lon2,
-        )
+        sf_frac = sf.crossing(self._prev_x, self._prev_y, x, y)
 
         if sf_frac is not None:
             crossing_ts = interpolate_crossing_time(self._prev_ts, ts, sf_frac)
@@ -299,8 +460,11 @@ class LapTimer:
                 self._sector_start_ts = crossing_ts
                 self._current_sector_times = []
                 self._cumulative_distance = 0.0
+                self._dist_anchor = None
                 self._distance_trace = [0.0]
                 self._time_trace = [0.0]
+                self._mini.start_lap()
+                self._changed()
             else:
                 # Lap complete
                 lap_time = crossing_ts - self._lap_start_ts
@@ -318,7 +482,8 @@ class LapTimer:
                     distance_array=list(self._distance_trace),
                     time_array=list(self._time_trace),
                 )
-                self._completed_laps.append(completed)
+                self._record_lap(completed)
+                self._mini.finish_lap(lap_time, completed.distance_array, completed.time_array)
 
                 # Delta vs reference
                 delta = 0.0
@@ -365,24 +530,39 @@ class LapTimer:
                 self._sector_start_ts = crossing_ts
                 self._current_sector_times = []
                 self._cumulative_distance = 0.0
+                self._dist_anchor = None
                 self._distance_trace = [0.0]
                 self._time_trace = [0.0]
+                self._mini.start_lap()
         else:
             # No start/finish crossing — update distance and check sectors
             if self._timing_active:
-                move_d = haversine_distance(self._prev_lat, self._prev_lon, lat, lon)
-                if move_d >= self._MIN_MOVE_M:
-                    self._cumulative_distance += move_d
-                    elapsed = ts - self._lap_start_ts
-                    self._distance_trace.append(self._cumulative_distance)
-                    self._time_trace.append(elapsed)
+                self._accumulate_distance(x, y, ts)
 
                 # Check sector crossings
-                events.extend(self._check_sectors(lat, lon, ts))
+                events.extend(self._check_sectors(x, y, ts))
 
         return events
 
-    def _check_sectors(self, lat: float, lon: float, ts: float) -> list[TimingEvent]:
+    def _accumulate_distance(self, x: float, y: float, ts: float) -> None:
+        """Extend the lap's distance trace once the car is _MIN_MOVE_M past the last point.
+
+        Measured from the last accepted point rather than the previous
+        update, so dense (dead-reckoned) updates closer together than
+        _MIN_MOVE_M still add up.
+        """
+        if self._dist_anchor is None:
+            self._dist_anchor = (self._prev_x, self._prev_y)
+        move_d = math.hypot(x - self._dist_anchor[0], y - self._dist_anchor[1])
+        if move_d >= self._MIN_MOVE_M:
+            self._cumulative_distance += move_d
+            self._dist_anchor = (x, y)
+            elapsed = ts - self._lap_start_ts
+            self._distance_trace.append(self._cumulative_distance)
+            self._time_trace.append(elapsed)
+            self._mini.update(self._cumulative_distance, elapsed)
+
+    def _check_sectors(self, x: float, y: float, ts: float) -> list[TimingEvent]:
         """Check for sector boundary crossings in order."""
         events: list[TimingEvent] = []
         if not self._sectors or not self._timing_active:
@@ -392,13 +572,7 @@ class LapTimer:
         if self._sector_index >= len(self._sectors):
             return events
 
-        sector = self._sectors[self._sector_index]
-        frac = line_segment_crossing(
-            self._prev_lat, self._prev_lon,
-            lat, lon,
-            sector.line.lat1, sector.line.lon1,
-            sector.line.lat2, sector.line.lon2,
-        )
+        frac = self._sector_lines[self._sector_index].crossing(self._prev_x, self._prev_y, x, y)
 
         if frac is not None:
             crossing_ts = interpolate_crossing_time(self._prev_ts, ts, frac)
@@ -421,22 +595,18 @@ class LapTimer:
 
             self._sector_index += 1
             self._sector_start_ts = crossing_ts
+            self._changed()
 
         return events
 
-    def _update_p2p(self, lat: float, lon: float, ts: float) -> list[TimingEvent]:
-        """Handle a GPS update in point-to-point mode."""
+    def _update_p2p(self, x: float, y: float, ts: float) -> list[TimingEvent]:
+        """Handle a GPS update (projected to x, y) in point-to-point mode."""
         events: list[TimingEvent] = []
 
         if not self._p2p_started:
             # Check for start line crossing
-            if self._p2p_start_line is not None:
-                frac = line_segment_crossing(
-                    self._prev_lat, self._prev_lon,
-                    lat, lon,
-                    self._p2p_start_line.lat1, self._p2p_start_line.lon1,
-                    self._p2p_start_line.lat2, self._p2p_start_line.lon2,
-                )
+            if self._p2p_start is not None:
+                frac = self._p2p_start.crossing(self._prev_x, self._prev_y, x, y)
                 if frac is not None:
                     crossing_ts = interpolate_crossing_time(self._prev_ts, ts, frac)
                     self._p2p_started = True
@@ -445,28 +615,21 @@ class LapTimer:
                     self._lap_start_ts = crossing_ts
                     self._sector_start_ts = crossing_ts
                     self._cumulative_distance = 0.0
+                    self._dist_anchor = None
                     self._distance_trace = [0.0]
                     self._time_trace = [0.0]
+                    self._mini.start_lap()
+                    self._changed()
         else:
             # Accumulate distance
-            move_d = haversine_distance(self._prev_lat, self._prev_lon, lat, lon)
-            if move_d >= self._MIN_MOVE_M:
-                self._cumulative_distance += move_d
-                elapsed = ts - self._lap_start_ts
-                self._distance_trace.append(self._cumulative_distance)
-                self._time_trace.append(elapsed)
+            self._accumulate_distance(x, y, ts)
 
             # Check sector crossings
-            events.extend(self._check_sectors(lat, lon, ts))
+            events.extend(self._check_sectors(x, y, ts))
 
             # Check for end line crossing
-            if self._p2p_end_line is not None:
-                frac = line_segment_crossing(
-                    self._prev_lat, self._prev_lon,
-                    lat, lon,
-                    self._p2p_end_line.lat1, self._p2p_end_line.lon1,
-                    self._p2p_end_line.lat2, self._p2p_end_line.lon2,
-                )
+            if self._p2p_end is not None:
+                frac = self._p2p_end.crossing(self._prev_x, self._prev_y, x, y)
                 if frac is not None:
                     crossing_ts = interpolate_crossing_time(self._prev_ts, ts, frac)
                     segment_time = crossing_ts - self._lap_start_ts
@@ -478,7 +641,8 @@ class LapTimer:
                         distance_array=list(self._distance_trace),
                         time_array=list(self._time_trace),
                     )
-                    self._completed_laps.append(completed)
+                    self._record_lap(completed)
+                    self._mini.finish_lap(segment_time, completed.distance_array, completed.time_array)
 
                     events.append(TimingEvent(
                         event_type=TimingEventType.P2P_SEGMENT_COMPLETE,
@@ -500,6 +664,7 @@ class LapTimer:
                     self._sector_start_ts = None
                     self._current_sector_times = []
                     self._cumulative_distance = 0.0
+                    self._dist_anchor = None
                     self._distance_trace = [0.0]
                     self._time_trace = [0.0]
 
@@ -0,0 +1,200 @@
+"""Automatic equal-distance micro-sectors for fine-grained lap analysis.
+
+Pure Python — no Qt dependency.  Fully testable with synthetic traces.
+
+The configured sectors (typically 3) say *which third* of the lap lost
+time; micro-sectors say which corner.  Each lap is split into N
+equal-distance segments (≈ ``segment_m`` long, N fixed per track so every
+lap uses the same boundaries) along LapTimer's cumulative distance trace.
+Segment boundary crossing times are interpolated between trace points,
+exactly like line crossings between GPS fixes.
+
+Everything is incremental: :meth:`MiniSectorTimer.update` runs at every
+distance-trace point and only does work when a boundary is passed —
+closing the segment, computing its delta vs best, improving the best and
+adjusting the optimal-lap composite (sum of bests) by the improvement.
+Best / current / delta times live in preallocated ``array('d')`` buffers.
+
+Layout comes from the persisted layout for the track, or else the first
+timed lap's measured distance (replayed from its distance trace).
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Optional
+
+_NONE = math.nan        # Segment not yet timed (current lap / delta)
+
+
+class MiniSectorTimer:
+    """Best-per-segment times, live optimal lap and per-segment deltas.
+
+    Usage (driven by LapTimer):
+        mini.start_lap()
+        mini.update(distance_m, elapsed_s)      # each distance-trace point
+        mini.finish_lap(lap_time_s, distance_trace, time_trace)
+    """
+
+    DEFAULT_SEGMENT_M: float = 50.0
+
+    def __init__(self, segment_m: float = DEFAULT_SEGMENT_M) -> None:
+        self.segment_m = segment_m
+        self.version = 0                # Increases whenever current/delta/best change
+        self.reset()
+
+    # ── Configuration ──────────────────────────────────────────────
+
+    def reset(self) -> None:
+        """Forget layout and bests (new track / timing mode)."""
+        self.segment_count = 0
+        self.segment_length_m = 0.0
+        self.best = array("d")          # Best time per segment (inf = never timed)
+        self.current = array("d")       # This lap's segment times (nan = not yet)
+        self.delta = array("d")         # This lap's time vs best per segment (nan = not yet)
+        self.last_delta = array("d")    # delta of the last completed lap
+        self._optimal_s = 0.0           # Sum of finite bests
+        self._timed = 0                 # Segments with a best time
+        self.start_lap()
+
+    def configure(self, lap_length_m: float, best: Optional[list[float]] = None) -> None:
+        """Fix the segment layout for a lap of *lap_length_m*.
+
+        *best* seeds the best times (e.g. persisted for this track); its
+        length then sets the segment count.
+        """
+        if best:
+            n = len(best)
+        else:
+            n = max(1, round(lap_length_m / self.segment_m))
+        self.segment_count = n
+        self.segment_length_m = lap_length_m / n
+        self.best = array("d", [math.inf] * n)
+        self.current = array("d", [_NONE] * n)
+        self.delta = array("d", [_NONE] * n)
+        self.last_delta = array("d", [_NONE] * n)
+        self._optimal_s = 0.0
+        self._timed = 0
+        for i, t in enumerate(best or ()):
+            if t is not None and math.isfinite(t) and t > 0.0:
+                self.best[i] = t
+                self._optimal_s += t
+                self._timed += 1
+        self.start_lap()
+
+    @property
+    def configured(self) -> bool:
+        return self.segment_count > 0
+
+    # ── Per-lap updates ────────────────────────────────────────────
+
+    def start_lap(self) -> None:
+        """Begin a lap at distance 0, time 0 (the S/F crossing)."""
+        n = self.segment_count
+        if n:
+            self.current[:] = array("d", [_NONE] * n)
+            self.delta[:] = array("d", [_NONE] * n)
+        self._next = 0                  # Segment in progress
+        self._seg_start_s = 0.0
+        self._prev_d = 0.0
+        self._prev_t = 0.0
+        self._lap_delta = 0.0           # Sum of this lap's segment deltas
+        self.version += 1
+
+    def update(self, distance_m: float, elapsed_s: float) -> int:
+        """Advance to a new distance-trace point; returns segments completed."""
+        completed = 0
+        if self.segment_count:
+            last = self.segment_count - 1
+            seg_len = self.segment_length_m
+            while self._next < last and distance_m >= (self._next + 1) * seg_len:
+                boundary = (self._next + 1) * seg_len
+                span = distance_m - self._prev_d
+                frac = (boundary - self._prev_d) / span if span > 0.0 else 1.0
+                self._close(self._prev_t + (elapsed_s - self._prev_t) * frac)
+                completed += 1
+        self._prev_d = distance_m
+        self._prev_t = elapsed_s
+        return completed
+
+    def finish_lap(
+        self,
+        lap_time_s: float,
+        distance_trace: Optional[list[float]] = None,
+        time_trace: Optional[list[float]] = None,
+    ) -> int:
+        """Close the final segment at the finish line; returns segments completed.
+
+        If no layout is configured yet, this lap's distance defines it and
+        the lap is replayed from its trace.  A lap that came up more than a
+        segment short (GPS trouble) doesn't time its final segment.
+        """
+        completed = 0
+        if not self.configured:
+            if not distance_trace or distance_trace[-1] <= 0.0:
+                return 0
+            self.configure(distance_trace[-1])
+            for d, t in zip(distance_trace, time_trace or ()):
+                completed += self.update(d, t)
+        if self._next == self.segment_count - 1:
+            self._close(lap_time_s)
+            completed += 1
+        self.last_delta[:] = self.delta
+        return completed
+
+    # ── Queries ────────────────────────────────────────────────────
+
+    @property
+    def optimal_lap_s(self) -> Optional[float]:
+        """Sum of best segment times, or None until every segment is timed."""
+        if not self.segment_count or self._timed < self.segment_count:
+            return None
+        return self._optimal_s
+
+    @property
+    def lap_delta_s(self) -> float:
+        """This lap's time lost (+) / gained (-) vs best over completed segments."""
+        return self._lap_delta
+
+    @property
+    def completed_segments(self) -> int:
+        """Segments completed so far this lap."""
+        return self._next
+
+    def best_times(self) -> list[Optional[float]]:
+        """Best time per segment (None = never timed)."""
+        return [t if math.isfinite(t) else None for t in self.best]
+
+    def lap_deltas(self) -> list[Optional[float]]:
+        """This lap's per-segment delta vs the best before it (None = not yet)."""
+        return [None if math.isnan(d) else d for d in self.delta]
+
+    def worst_segments(self, count: int = 3, last_lap: bool = False) -> list[tuple[int, float]]:
+        """(segment index, seconds lost) for the largest losses this lap (or the last one)."""
+        deltas = self.last_delta if last_lap else self.delta
+        losses = [(i, d) for i, d in enumerate(deltas) if d > 0.0]
+        losses.sort(key=lambda item: item[1], reverse=True)
+        return losses[:count]
+
+    # ── Internal ───────────────────────────────────────────────────
+
+    def _close(self, cross_s: float) -> None:
+        i = self._next
+        seg_time = cross_s - self._seg_start_s
+        self.current[i] = seg_time
+        best = self.best[i]
+        if math.isfinite(best):
+            self.delta[i] = seg_time - best
+            self._lap_delta += seg_time - best
+            if seg_time < best:
+                self._optimal_s -= best - seg_time
+                self.best[i] = seg_time
+        else:
+            self.delta[i] = 0.0
+            self.best[i] = seg_time
+            self._optimal_s += seg_time
+            self._timed += 1
+        self._seg_start_s = cross_s
+        self._next = i + 1
+        self.version += 1
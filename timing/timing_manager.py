@@ -6,23 +6,34 @@ timing events as Qt signals.
 
 Data flow:
     DiffStateBridge.state_changed → TimingManager._on_state_changed
-        → LapTimer.update(lat, lon, ts)
+        → DiffStateBridge.drain_motion() (GPS fixes + IMU samples, capture ts)
+        → GpsImuFusion
+        → LapTimer.update(lat, lon, ts) for each point of the fused path
         → TimingEvent → Qt signals + bridge.update_timing() + DuckDB
+
+Samples come from DiffStateBridge.drain_motion(): every GPS / IMU frame
+since the last call (none lost while the UI thread was busy), stamped with
+its bus receive time (set by CanListenerThread from python-can
+msg.timestamp) rather than when this slot runs, so UI / DB load on the
+main thread doesn't become timing jitter. Between fixes IMU samples
+refresh the live delta from the dead-reckoned position.
 """
 
 from __future__ import annotations
 
 import logging
-import time
+import threading
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtCore import QObject, Signal
 
-from timing.lap_timer import LapTimer, TimingEvent, TimingEventType
+from timing.fusion import GpsImuFusion
+from timing.geo import haversine_distance
+from timing.lap_timer import LapTimer, TimingEvent, TimingEventType, TimingSnapshot
 from timing.track_db import TrackDatabase
 from timing.track_learner import TrackLearner
-from timing.track_outline import load_outline, import_ztracks_outline
+from timing.track_outline import load_outline
 
 log = logging.getLogger("kisti.timing.timing_manager")
 
@@ -50,6 +61,7 @@ class TimingManager(QObject):
         self._bridge = bridge
         self._db_store = db_store
         self._timer = LapTimer()
+        self._fusion = GpsImuFusion()
         self._track_db: Optional[TrackDatabase] = None
         self._track_detected = False
         self._session_id: Optional[str] = None
@@ -72,8 +84,9 @@ class TimingManager(QObject):
             except Exception as exc:
                 log.warning("TrackDatabase init failed: %s", exc)
 
-        # Auto-import .ztracks outlines from ~/tracks/ if not already cached
-        self._auto_import_ztracks()
+        # Import new .ztracks / GPX / CSV files from ~/tracks/ (off the UI thread)
+        self._import_thread: Optional[threading.Thread] = None
+        self._import_track_library()
 
         # Loaded outline for the currently-detected track (runtime cache)
         # Pre-load first available outline so S# Track shows a circuit before GPS detection
@@ -87,6 +100,11 @@ class TimingManager(QObject):
         self._prev_gps_lat: float = 0.0
         self._prev_gps_lon: float = 0.0
 
+        # Event-driven part of get_timing_data(), keyed by snapshot versions
+        self._timing_data: dict = {}
+        self._timing_data_key: Optional[tuple] = None
+        self._timing_data_version: int = 0
+
     # ── Lifecycle ─────────────────────────────────────────────────────
 
     def start(self) -> None:
@@ -110,6 +128,7 @@ class TimingManager(QObject):
         if session_id is None:
             # Session ended — reset timing for next session
             self._timer.reset()
+            self._fusion.reset()
             self._track_detected = False
             self._track_learner = None
             self._learning_active = False
@@ -133,6 +152,11 @@ class TimingManager(QObject):
             "track_name": self._timer._track.name if self._timer._track else "Unknown",
         }
 
+    @property
+    def fusion(self) -> GpsImuFusion:
+        """The GPS+IMU dead-reckoning filter feeding the LapTimer."""
+        return self._fusion
+
     @property
     def lap_timer(self) -> LapTimer:
         """Direct access to the LapTimer for voice queries."""
@@ -150,80 +174,76 @@ class TimingManager(QObject):
 
         Returns keys expected by sharp_screen: lap_count, current_lap_time_ms,
         delta_ms, predicted_lap_ms, best_lap_ms, theoretical_best_ms,
-        track_name, sector_count, current_sector, sector_times, best_sector_times.
+        track_name, sector_count, current_sector, sector_times, best_sector_times,
+        mini_sector_deltas_ms, optimal_lap_ms, timing_version.
+
+        Only the live values (elapsed, delta, predicted, distance) are
+        computed per call; everything else comes from the LapTimer's
+        TimingSnapshot and is rebuilt only when its version (or the
+        mini-sector / outline state) changes.  ``timing_version`` changes
+        exactly when that part does, so screens can skip re-layout.
         """
         timer = self._timer
+        now_ts, extra_m = self._live_point()
 
         # Current lap elapsed time (ms)
         current_lap_ms = 0
-        if timer._lap_start_ts is not None and timer._prev_ts is not None:
+        if timer._lap_start_ts is not None and now_ts is not None:
             current_lap_ms = int(
-                (timer._prev_ts - timer._lap_start_ts) * 1000
+                (now_ts - timer._lap_start_ts) * 1000
             )
 
         # Delta and predicted (seconds → ms)
-        delta = timer.get_delta()
-        predicted = timer.get_predicted_lap()
-        theoretical = timer.get_theoretical_best()
+        delta = timer.get_delta(now_ts, extra_m)
+        predicted = timer.get_predicted_lap(now_ts, extra_m)
 
-        # Best lap time (ms) — use round() not int() to handle sub-ms precision
-        # in tests where monotonic timestamps are microseconds apart
-        best_lap_ms = 0
-        if timer._completed_laps:
-            best_s = min(lap.total_time for lap in timer._completed_laps)
-            best_lap_ms = max(1, round(best_s * 1000)) if best_s > 0 else 0
-
-        # Current sector times (seconds → ms)
-        sector_times = [
-            int(t * 1000) for t in timer._current_sector_times
-        ]
-
-        # Best sector times (seconds → ms, None → None)
-        best_sectors_s = timer.get_best_sector_times()
-        best_sector_times = [
-            int(t * 1000) if t is not None else None
-            for t in best_sectors_s
-        ]
+        data = dict(self._event_timing_data())
+        data["current_lap_time_ms"] = current_lap_ms
+        data["delta_ms"] = int(delta * 1000) if delta is not None else 0
+        data["predicted_lap_ms"] = int(predicted * 1000) if predicted is not None else 0
+        data["lap_distance_m"] = timer.get_current_distance() + extra_m
+        return data
 
-        return {
-            "lap_count": timer._lap_number,
-            "current_lap_time_ms": current_lap_ms,
-            "delta_ms": int(delta * 1000) if delta is not None else 0,
-            "predicted_lap_ms": int(predicted * 1000) if predicted is not None else 0,
-            "best_lap_ms": best_lap_ms,
-            "theoretical_best_ms": int(theoretical * 1000) if theoretical is not None else 0,
-            "track_name": timer._track.name if timer._track else "",
-            "sector_count": len(timer._sectors),
-            "current_sector": timer._sector_index,
-            "sector_times": sector_times,
-            "best_sector_times": best_sector_times,
-            "lap_in_progress": timer._lap_start_ts is not None,
-            "track_outline": self._active_outline,
-            "lap_distance_m": timer.get_current_distance(),
-            "track_length_m": timer._track.length_m if timer._track else 0.0,
-        }
+    @property
+    def timing_snapshot(self) -> TimingSnapshot:
+        """The LapTimer's current immutable TimingSnapshot."""
+        return self._timer.snapshot()
 
     # ── Internal ──────────────────────────────────────────────────────
 
     def _on_state_changed(self) -> None:
-        """Process bridge state updates — extract GPS and feed LapTimer."""
+        """Consume the GPS / IMU samples logged by the bridge, in capture order."""
         if not self._active:
             return
 
-        snap = self._bridge.snapshot()
-        lat = snap.gps_latitude
-        lon = snap.gps_longitude
+        fusion = self._fusion
+        changed = False
+        for kind, ts, a, b in self._bridge.drain_motion():
+            if kind == "gps":
+                changed |= self._on_gps_fix(a, b, ts)
+            elif kind == "imu":
+                changed |= fusion.add_imu(a, b, ts) is not None
+            elif kind == "gps_ext":
+                fusion.set_motion(a, b, ts)
+
+        # Update bridge with current timing state (live between fixes)
+        if changed:
+            self._update_bridge_timing()
+
+    def _on_gps_fix(self, lat: float, lon: float, ts: float) -> bool:
+        """Feed a GPS fix (and the fused path leading to it) to the LapTimer.
 
+        Returns False if the fix was skipped.
+        """
         # Skip if no GPS fix or position hasn't changed
         if lat == 0.0 and lon == 0.0:
-            return
+            return False
         if lat == self._prev_gps_lat and lon == self._prev_gps_lon:
-            return
+            return False
 
         # GPS jump filter — reject fixes >500m from last known position
         # (satellite reacquire after dropout can cause false S/F crossings)
         if self._prev_gps_lat != 0.0 and self._prev_gps_lon != 0.0:
-            from timing.geo import haversine_distance
             jump_m = haversine_distance(
                 self._prev_gps_lat, self._prev_gps_lon, lat, lon,
             )
@@ -235,7 +255,8 @@ class TimingManager(QObject):
                 # Update position but don't feed LapTimer
                 self._prev_gps_lat = lat
                 self._prev_gps_lon = lon
-                return
+                self._fusion.reset()
+                return False
 
         self._prev_gps_lat = lat
         self._prev_gps_lon = lon
@@ -244,90 +265,123 @@ class TimingManager(QObject):
         if not self._track_detected and self._track_db is not None:
             self._try_detect_track(lat, lon)
 
-        # Feed LapTimer
-        ts = time.monotonic()
-        events = self._timer.update(lat, lon, ts)
+        # Feed LapTimer with the fused path, stamped with bus receive time
+        events: list[TimingEvent] = []
+        for p_lat, p_lon, p_ts in self._fusion.add_fix(lat, lon, ts):
+            events.extend(self._timer.update(p_lat, p_lon, p_ts))
 
         # Process events
         for event in events:
             self._handle_event(event)
+        return True
+
+    def _event_timing_data(self) -> dict:
+        """The event-driven part of get_timing_data(), cached until it changes."""
+        snap = self._timer.snapshot()
+        mini = self._timer.mini_sectors
+        key = (snap.version, mini.version, id(self._active_outline))
+        if key == self._timing_data_key:
+            return self._timing_data
+
+        # Best lap time (ms) — use round() not int() to handle sub-ms precision
+        # in tests where monotonic timestamps are microseconds apart
+        best_lap_ms = 0
+        if snap.best_lap_s is not None and snap.best_lap_s > 0:
+            best_lap_ms = max(1, round(snap.best_lap_s * 1000))
+        theoretical = snap.theoretical_best_s
+        optimal = mini.optimal_lap_s
+
+        self._timing_data_version += 1
+        self._timing_data_key = key
+        self._timing_data = {
+            "timing_version": self._timing_data_version,
+            "lap_count": snap.lap_count,
+            "best_lap_ms": best_lap_ms,
+            "theoretical_best_ms": int(theoretical * 1000) if theoretical is not None else 0,
+            "track_name": snap.track_name,
+            "sector_count": snap.sector_count,
+            "current_sector": snap.current_sector,
+            # Sector times (seconds → ms, None → None)
+            "sector_times": [int(t * 1000) for t in snap.sector_times],
+            "best_sector_times": [
+                int(t * 1000) if t is not None else None
+                for t in snap.best_sector_times
+            ],
+            "lap_in_progress": snap.lap_in_progress,
+            "track_outline": self._active_outline,
+            "track_length_m": snap.track_length_m,
+            # Micro-sectors: this lap's loss per segment vs best (None = not reached)
+            "mini_sector_deltas_ms": [
+                round(d * 1000) if d is not None else None
+                for d in mini.lap_deltas()
+            ],
+            "optimal_lap_ms": round(optimal * 1000) if optimal is not None else 0,
+        }
+        return self._timing_data
 
-        # Update bridge with current timing state
-        self._update_bridge_timing()
+    def _live_point(self) -> tuple[Optional[float], float]:
+        """(time, metres past the LapTimer's last point) of the newest position estimate."""
+        ts = self._fusion.estimate_ts
+        if ts is None or self._timer._prev_ts is None:
+            return self._timer._prev_ts, 0.0
+        return max(ts, self._timer._prev_ts), self._fusion.distance_since_fix
 
     def _load_first_available_outline(self) -> list[tuple[float, float]]:
-        """Return the first cached outline found in the outlines directory."""
-        if not self._outlines_dir.exists():
-            return []
-        for outline_file in sorted(self._outlines_dir.glob("*.json")):
-            outline = load_outline(outline_file.stem, self._outlines_dir)
-            if outline:
-                log.info("Pre-loaded outline from %s (%d pts)", outline_file.name, len(outline))
-                return outline
+        """Return the first cached outline (outlines directory, then DuckDB)."""
+        if self._outlines_dir.exists():
+            for outline_file in sorted(self._outlines_dir.glob("*.json")):
+                outline = load_outline(outline_file.stem, self._outlines_dir)
+                if outline:
+                    log.info("Pre-loaded outline from %s (%d pts)", outline_file.name, len(outline))
+                    return outline
+        if self._track_db is not None:
+            try:
+                for track_id in self._track_db.outline_track_ids():
+                    outline = self._track_db.get_outline(track_id)
+                    if outline:
+                        log.info("Pre-loaded outline for %s (%d pts)", track_id[:8], len(outline))
+                        return outline
+            except Exception as exc:
+                log.warning("Could not pre-load outline from DuckDB: %s", exc)
         return []
 
-    def _auto_import_ztracks(self) -> None:
-        """Import any *.ztracks files from ~/tracks/ that aren't yet cached.
+    def _import_track_library(self) -> None:
+        """Bulk-import new or changed track files from ~/tracks/ into DuckDB.
 
-        Matches files by track name against the seeded track list.
-        Saves outlines to data/track_outlines/{track_id}.json.
-        Runs once at startup; silent on errors.
+        The check is a directory scan against the import manifest — files
+        already imported are never re-read, so startup doesn't pay for
+        them.  New files are parsed in a spawned process (isolate=True); the
+        background thread (own DuckDB cursor) only waits for it and writes
+        the results, so parsing never holds the GIL against the UI.  Tracks
+        and outlines are found on the next detection.  Silent on errors.
         """
-        ztracks_dir = Path.home() / "tracks"
-        if not ztracks_dir.exists():
+        library_dir = Path.home() / "tracks"
+        if self._track_db is None or not library_dir.exists():
             return
+        from tools import track_library
 
-        ztracks_files = list(ztracks_dir.glob("*.ztracks"))
-        if not ztracks_files:
+        conn = self._db_store._conn
+        try:
+            pending = track_library.pending_sources(conn, track_library.scan_sources([library_dir]))
+        except Exception as exc:
+            log.warning("Track library check failed: %s", exc)
+            return
+        if not pending:
             return
 
-        # Build name→track_id map from DuckDB if available
-        track_name_map: dict[str, str] = {}
-        if self._track_db is not None:
-            try:
-                tracks = self._track_db.list_tracks()
-                log.info("ztracks matching: %d tracks in DB", len(tracks))
-                for track in tracks:
-                    track_name_map[track.name.lower()] = track.track_id
-            except Exception as exc:
-                log.warning("Could not load track names for ztracks matching: %s", exc)
-        else:
-            log.warning("ztracks matching: _track_db is None — name match unavailable")
-
-        for ztracks_path in ztracks_files:
-            # Try to determine track_id from filename or name in file.
-            # Filename heuristic: mission_raceway_park.ztracks → "mission raceway park"
-            stem_words = ztracks_path.stem.replace('_', ' ').lower()
-
-            # Find matching track_id by name similarity (filename stem)
-            track_id = None
-            for db_name, tid in track_name_map.items():
-                if stem_words in db_name or db_name in stem_words:
-                    track_id = tid
-                    break
-
-            if track_id is None:
-                if not track_name_map:
-                    # No DB available — skip rather than writing a hash-named file.
-                    # Pre-committed canonical outline files will be loaded at startup.
-                    log.debug("Skipping %s — no DB for name match", ztracks_path.name)
-                    continue
-                import hashlib
-                track_id = hashlib.md5(ztracks_path.name.encode()).hexdigest()[:8] + \
-                           "-0000-0000-0000-000000000000"
-                log.warning("No DB match for %s (stem=%r) — using hash ID %s",
-                            ztracks_path.name, stem_words, track_id[:8])
-
-            cached = self._outlines_dir / f"{track_id}.json"
-            if cached.exists():
-                log.debug("Outline already cached for %s", ztracks_path.name)
-                continue
-
-            log.info("Auto-importing .ztracks: %s → %s", ztracks_path.name, track_id[:8])
+        def _run(cursor) -> None:
             try:
-                import_ztracks_outline(ztracks_path, track_id, self._outlines_dir)
+                track_library.import_library([library_dir], cursor, workers=1, isolate=True)
             except Exception as exc:
-                log.warning("Failed to import %s: %s", ztracks_path.name, exc)
+                log.warning("Track library import failed: %s", exc)
+            finally:
+                cursor.close()
+
+        log.info("Importing %d track files from %s in the background", len(pending), library_dir)
+        self._import_thread = threading.Thread(
+            target=_run, args=(conn.cursor(),), name="track-import", daemon=True,
+        )
+        self._import_thread.start()
 
     def _try_detect_track(self, lat: float, lon: float) -> None:
         """Attempt to auto-detect track, or learn a new one from GPS trace."""
@@ -336,8 +390,10 @@ class TimingManager(QObject):
         if track is not None:
             sectors = track.sectors
 
-            # Load cached GPS outline if available
-            outline = load_outline(track.track_id, self._outlines_dir)
+            # Load stored GPS outline if available (canonical JSON, then DuckDB import)
+            outline = load_outline(track.track_id, self._outlines_dir) or self._track_db.get_outline(
+                track.track_id,
+            )
             if outline:
                 track.outline = outline
                 self._active_outline = outline
@@ -346,6 +402,7 @@ class TimingManager(QObject):
                 self._active_outline = []
 
             self._timer.set_track(track, sectors)
+            self._load_mini_sectors(track.track_id)
             self._track_detected = True
             self._track_learner = None
             self._learning_active = False
@@ -383,6 +440,35 @@ class TimingManager(QObject):
         )
         self.track_detected.emit(track.name)
 
+    def _load_mini_sectors(self, track_id: str) -> None:
+        """Restore the track's best micro-sector times so the first lap has deltas."""
+        if self._db_store is None:
+            return
+        try:
+            saved = self._db_store.get_mini_sectors(track_id)
+        except Exception as exc:
+            log.warning("Failed to load mini-sectors: %s", exc)
+            return
+        if saved and saved["best_times"]:
+            best = saved["best_times"]
+            self._timer.mini_sectors.configure(saved["segment_length_m"] * len(best), best)
+            log.info("Loaded %d mini-sector bests", len(best))
+
+    def _save_mini_sectors(self) -> None:
+        """Persist the track's best micro-sector times (after each lap)."""
+        mini = self._timer.mini_sectors
+        if self._db_store is None or self._timer._track is None or not mini.configured:
+            return
+        try:
+            self._db_store.save_mini_sectors(
+                track_id=self._timer._track.track_id,
+                segment_length_m=mini.segment_length_m,
+                best_times=mini.best_times(),
+                optimal_lap_s=mini.optimal_lap_s,
+            )
+        except Exception as exc:
+            log.warning("Failed to save mini-sectors: %s", exc)
+
     def _handle_event(self, event: TimingEvent) -> None:
         """Emit Qt signals and record to DuckDB for a timing event."""
         if event.event_type == TimingEventType.LAP_COMPLETE:
@@ -409,6 +495,7 @@ class TimingManager(QObject):
                     )
                 except Exception as exc:
                     log.warning("Failed to record lap: %s", exc)
+            self._save_mini_sectors()
 
         elif event.event_type == TimingEventType.SECTOR_COMPLETE:
             payload = {
@@ -433,39 +520,37 @@ class TimingManager(QObject):
         update_timing() would otherwise fire state_changed, re-triggering
         _on_state_changed and doubling signal traffic on every GPS tick.
         """
-        delta = self._timer.get_delta()
-        predicted = self._timer.get_predicted_lap()
-        theoretical = self._timer.get_theoretical_best()
+        now_ts, extra_m = self._live_point()
+        delta = self._timer.get_delta(now_ts, extra_m)
+        predicted = self._timer.get_predicted_lap(now_ts, extra_m)
+        snap = self._timer.snapshot()
+        theoretical = snap.theoretical_best_s
 
-        # Current lap elapsed time
+        # Current lap elapsed time (up to the newest dead-reckoned estimate)
         current_lap_ms = 0
-        if self._timer._lap_start_ts is not None and self._timer._prev_ts is not None:
+        if self._timer._lap_start_ts is not None and now_ts is not None:
             current_lap_ms = int(
-                (self._timer._prev_ts - self._timer._lap_start_ts) * 1000
+                (now_ts - self._timer._lap_start_ts) * 1000
             )
 
         self._bridge.blockSignals(True)
         try:
             self._bridge.update_timing(
-            lap_count=self._timer._lap_number,
-            current_sector=self._timer._sector_index,
-            sector_count=len(self._timer._sectors),
+            lap_count=snap.lap_count,
+            current_sector=snap.current_sector,
+            sector_count=snap.sector_count,
             current_lap_time_ms=current_lap_ms,
             last_sector_time_ms=(
-                int(self._timer._current_sector_times[-1] * 1000)
-                if self._timer._current_sector_times
+                int(snap.sector_times[-1] * 1000)
+                if snap.sector_times
                 else 0
             ),
             delta_ms=int(delta * 1000) if delta is not None else 0,
             predicted_lap_ms=int(predicted * 1000) if predicted is not None else 0,
             theoretical_best_ms=int(theoretical * 1000) if theoretical is not None else 0,
-            track_name=self._timer._track.name if self._timer._track else "",
-            timing_mode=(
-                "point_to_point"
-                if self._timer._p2p_mode
-                else ("circuit" if self._timer._track else "")
-            ),
-            lap_distance_m=self._timer.get_current_distance(),
+            track_name=snap.track_name,
+            timing_mode=snap.timing_mode,
+            lap_distance_m=self._timer.get_current_distance() + extra_m,
             )
         finally:
             self._bridge.blockSignals(False)
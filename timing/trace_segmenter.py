@@ -0,0 +1,191 @@
+"""Streaming lap segmentation of long GPS logs in bounded memory.
+
+Pure Python — no Qt dependency.  Fully testable with synthetic traces.
+
+Multi-hour logger files (RaceRender / RS3 exports) are far too big to
+load as one trace.  TraceSegmenter consumes points one at a time and
+keeps only what the current lap needs:
+
+  - until a track is known, a TrackLearner learns it from the trace
+    (restarted from the current point once it runs past ``max_lap_m``
+    without closing — the drive to the circuit never returns to its
+    start, a point on the circuit does); on closure a ``"track"`` event
+    carries the generated TrackDefinition and sectors
+  - from then on each point is projected once into a LocalFrame and
+    checked against the precompiled start/finish and next sector
+    TimingLines, exactly as LapTimer does; each S/F crossing after the
+    first emits a ``"lap"`` event (interpolated times, distance, splits
+    and the stream index range of the lap's points)
+
+State is the previous point plus per-lap accumulators, so memory is
+constant once the track is known.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+from timing.geo import LocalFrame, TimingLine, interpolate_crossing_time
+from timing.track_db import SectorDefinition, TrackDefinition
+from timing.track_learner import TrackLearner
+
+log = logging.getLogger("kisti.timing.trace_segmenter")
+
+
+@dataclass
+class SegmentedLap:
+    """A lap found in the stream."""
+    lap_number: int
+    start_ts: float
+    end_ts: float
+    time_s: float
+    distance_m: float
+    sector_times: list[float]
+    first_point: int            # Stream index of the point that crossed S/F to start it
+    last_point: int             # Stream index of the point that crossed S/F
+
+
+@dataclass
+class TraceEvent:
+    kind: str                   # "track" | "lap"
+    point_index: int
+    track: Optional[TrackDefinition] = None
+    sectors: list[SectorDefinition] = field(default_factory=list)
+    lap: Optional[SegmentedLap] = None
+
+
+class TraceSegmenter:
+    """Splits a stream of GPS points into laps, learning the track if needed.
+
+    Usage:
+        seg = TraceSegmenter()                     # or TraceSegmenter(track, sectors)
+        for lat, lon, ts in points:
+            for event in seg.feed(lat, lon, ts):
+                ...
+    """
+
+    # Crossing S/F sooner than this fraction of the track length is GPS jitter
+    MIN_LAP_FRACTION: float = 0.5
+    MIN_LAP_M: float = 100.0
+
+    def __init__(
+        self,
+        track: Optional[TrackDefinition] = None,
+        sectors: Sequence[SectorDefinition] = (),
+        sample_hz: float = 10.0,
+        max_lap_m: float = 10_000.0,
+    ) -> None:
+        self._dt = 1.0 / sample_hz          # Time step for points without timestamps
+        self._max_lap_m = max_lap_m
+        self._learner: Optional[TrackLearner] = None
+        self._index = -1
+        self.last_ts = 0.0
+        self.track: Optional[TrackDefinition] = None
+        self.sectors: list[SectorDefinition] = []
+        self.laps_completed = 0
+        self._lap_start_ts: Optional[float] = None
+        if track is not None and track.start_finish is not None:
+            self._use_track(track, list(sectors))
+        else:
+            self._learner = TrackLearner()
+
+    @property
+    def current_lap(self) -> int:
+        """Lap the latest point belongs to (0 = before the first S/F crossing)."""
+        return self.laps_completed + 1 if self._lap_start_ts is not None else 0
+
+    def feed(self, lat: float, lon: float, ts: Optional[float] = None) -> list[TraceEvent]:
+        """Consume one point; returns any track / lap events it completes."""
+        self._index += 1
+        if ts is None:
+            ts = self.last_ts + self._dt if self._index else 0.0
+        self.last_ts = ts
+
+        if self._learner is not None:
+            return self._learn(lat, lon)
+
+        x, y = self._frame.project(lat, lon)
+        events: list[TraceEvent] = []
+        prev = self._prev
+        self._prev = (x, y, ts)
+        if prev is None:
+            return events
+        px, py, pts = prev
+        step = math.hypot(x - px, y - py)
+
+        if self._lap_start_ts is not None and self._next_sector < len(self._sector_lines):
+            frac = self._sector_lines[self._next_sector].crossing(px, py, x, y)
+            if frac is not None:
+                self._splits.append(interpolate_crossing_time(pts, ts, frac))
+                self._next_sector += 1
+
+        frac = self._sf_line.crossing(px, py, x, y)
+        if frac is not None:
+            cross_ts = interpolate_crossing_time(pts, ts, frac)
+            lap_dist = self._distance + step * frac
+            if self._lap_start_ts is None or lap_dist >= self._min_lap_m:
+                if self._lap_start_ts is not None:
+                    events.append(self._finish_lap(cross_ts, lap_dist))
+                self._start_lap(cross_ts, step * (1.0 - frac))
+                return events
+        self._distance += step
+        return events
+
+    # ── Internal ──────────────────────────────────────────────────────
+
+    def _learn(self, lat: float, lon: float) -> list[TraceEvent]:
+        learner = self._learner
+        if learner.update(lat, lon):
+            track, sectors = learner.result()
+            self._learner = None
+            self._use_track(track, sectors)
+            log.info("Track learned at point %d: %.0f m", self._index, track.length_m)
+            self._prev = (*self._frame.project(lat, lon), self.last_ts)
+            return [TraceEvent("track", self._index, track=track, sectors=sectors)]
+        if learner.total_distance > self._max_lap_m:
+            learner.reset()
+            learner.update(lat, lon)
+        return []
+
+    def _use_track(self, track: TrackDefinition, sectors: list[SectorDefinition]) -> None:
+        self.track = track
+        self.sectors = sorted(sectors, key=lambda s: s.sector_index)
+        sf = track.start_finish
+        self._frame = LocalFrame((sf.lat1 + sf.lat2) / 2, (sf.lon1 + sf.lon2) / 2)
+        self._sf_line = TimingLine.from_latlon(self._frame, sf.lat1, sf.lon1, sf.lat2, sf.lon2)
+        self._sector_lines = [
+            TimingLine.from_latlon(self._frame, s.line.lat1, s.line.lon1, s.line.lat2, s.line.lon2)
+            for s in self.sectors
+        ]
+        self._min_lap_m = max(self.MIN_LAP_M, track.length_m * self.MIN_LAP_FRACTION)
+        self._prev: Optional[tuple[float, float, float]] = None
+        self._lap_start_ts = None
+        self._lap_first_point = 0
+        self._distance = 0.0
+        self._splits: list[float] = []
+        self._next_sector = 0
+
+    def _start_lap(self, cross_ts: float, distance_m: float) -> None:
+        self._lap_start_ts = cross_ts
+        self._lap_first_point = self._index
+        self._distance = distance_m
+        self._splits = []
+        self._next_sector = 0
+
+    def _finish_lap(self, cross_ts: float, distance_m: float) -> TraceEvent:
+        self.laps_completed += 1
+        marks = [self._lap_start_ts, *self._splits, cross_ts]
+        lap = SegmentedLap(
+            lap_number=self.laps_completed,
+            start_ts=self._lap_start_ts,
+            end_ts=cross_ts,
+            time_s=cross_ts - self._lap_start_ts,
+            distance_m=distance_m,
+            sector_times=[b - a for a, b in zip(marks, marks[1:])],
+            first_point=self._lap_first_point,
+            last_point=self._index,
+        )
+        return TraceEvent("lap", self._index, lap=lap)
@@ -51,7 +51,42 @@ class TrackDefinition:
     source: str = "manual"  # 'manual' | 'learned' | 'seed'
     sectors: list[SectorDefinition] = field(default_factory=list)
     outline: list[tuple[float, float]] = field(default_factory=list)
-    """Normalized (0-1) track outline points — runtime only, not persisted to DuckDB."""
+    """Normalized (0-1) track outline points — stored separately (save_outline)."""
+
+
+def track_from_entry(
+    entry: dict, source: str = "seed",
+) -> tuple[TrackDefinition, list[SectorDefinition]]:
+    """Build a track + sectors from a tracks_seed.json-format entry."""
+    track_id = entry.get("track_id", str(uuid.uuid4()))
+    sf = entry.get("start_finish")
+    track = TrackDefinition(
+        track_id=track_id,
+        name=entry["name"],
+        center_lat=entry["center_lat"],
+        center_lon=entry["center_lon"],
+        radius_m=entry.get("radius_m", 2000.0),
+        track_type=entry.get("track_type", "circuit"),
+        start_finish=StartFinishLine(**sf) if sf else None,
+        country=entry.get("country", ""),
+        region=entry.get("region", ""),
+        length_m=entry.get("length_m", 0.0),
+        source=source,
+    )
+    sectors = [
+        SectorDefinition(
+            sector_id=sd.get("sector_id", str(uuid.uuid4())),
+            track_id=track_id,
+            sector_index=i,
+            line=StartFinishLine(
+                sd["line_lat1"], sd["line_lon1"],
+                sd["line_lat2"], sd["line_lon2"],
+            ),
+            name=sd.get("name", f"Sector {i + 1}"),
+        )
+        for i, sd in enumerate(entry.get("sectors", []))
+    ]
+    return track, sectors
 
 
 class TrackDatabase:
@@ -162,10 +197,57 @@ class TrackDatabase:
             )
 
     def delete_track(self, track_id: str) -> None:
-        """Delete a track and its sectors."""
+        """Delete a track, its sectors and outline."""
         self._conn.execute("DELETE FROM track_sectors WHERE track_id = ?", [track_id])
+        self._conn.execute("DELETE FROM track_outlines WHERE track_id = ?", [track_id])
         self._conn.execute("DELETE FROM tracks WHERE track_id = ?", [track_id])
 
+    def save_outline(
+        self,
+        track_id: str,
+        outline: list[tuple[float, float]],
+        lods: Optional[list] = None,
+    ) -> None:
+        """Save a normalized outline with its levels of detail (replaces existing).
+
+        *lods* is :func:`timing.track_outline.outline_lods` output — computed
+        here if not given.
+        """
+        import numpy as np
+
+        from timing.track_outline import outline_lods
+
+        if lods is None:
+            lods = outline_lods(np.asarray(outline, dtype=np.float64).reshape(-1, 2))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO track_outlines VALUES (?, ?, ?, CURRENT_TIMESTAMP)",
+            [
+                track_id,
+                json.dumps([[x, y] for x, y in outline]),
+                json.dumps([[eps, np.asarray(idx).tolist()] for eps, idx in lods]),
+            ],
+        )
+
+    def get_outline(self, track_id: str):
+        """Stored outline as a :class:`timing.track_outline.Outline`, or None."""
+        import numpy as np
+
+        from timing.track_outline import Outline
+
+        row = self._conn.execute(
+            "SELECT points, lods FROM track_outlines WHERE track_id = ?", [track_id],
+        ).fetchone()
+        if row is None:
+            return None
+        points = [(float(x), float(y)) for x, y in json.loads(row[0])]
+        lods = [(float(eps), np.asarray(idx, dtype=np.int64)) for eps, idx in json.loads(row[1] or "[]")]
+        return Outline(points, lods or None)
+
+    def outline_track_ids(self) -> list[str]:
+        """Track IDs with a stored outline, sorted."""
+        rows = self._conn.execute("SELECT track_id FROM track_outlines ORDER BY track_id").fetchall()
+        return [r[0] for r in rows]
+
     def list_tracks(self, limit: int = 50) -> list[TrackDefinition]:
         """List all tracks."""
         rows = self._conn.execute(
@@ -198,42 +280,10 @@ class TrackDatabase:
         count = 0
 
         for entry in data:
-            track_id = entry.get("track_id", str(uuid.uuid4()))
-            sf = entry.get("start_finish")
-            start_finish = StartFinishLine(**sf) if sf else None
-
-            track = TrackDefinition(
-                track_id=track_id,
-                name=entry["name"],
-                center_lat=entry["center_lat"],
-                center_lon=entry["center_lon"],
-                radius_m=entry.get("radius_m", 2000.0),
-                track_type=entry.get("track_type", "circuit"),
-                start_finish=start_finish,
-                country=entry.get("country", ""),
-                region=entry.get("region", ""),
-                length_m=entry.get("length_m", 0.0),
-                source="seed",
-            )
+            track, sectors = track_from_entry(entry, source="seed")
             self.save_track(track)
-
-            # Import sectors if present
-            sectors_data = entry.get("sectors", [])
-            sectors = []
-            for i, sd in enumerate(sectors_data):
-                sectors.append(SectorDefinition(
-                    sector_id=sd.get("sector_id", str(uuid.uuid4())),
-                    track_id=track_id,
-                    sector_index=i,
-                    line=StartFinishLine(
-                        sd["line_lat1"], sd["line_lon1"],
-                        sd["line_lat2"], sd["line_lon2"],
-                    ),
-                    name=sd.get("name", f"Sector {i + 1}"),
-                ))
             if sectors:
-                self.save_sectors(track_id, sectors)
-
+                self.save_sectors(track.track_id, sectors)
             count += 1
 
         log.info("Seeded %d tracks from %s", count, json_path.name)
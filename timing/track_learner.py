@@ -9,17 +9,12 @@ Pure Python — no Qt dependency.  Follows the same pattern as LapTimer.
 
 from __future__ import annotations
 
-import bisect
 import logging
 import uuid
 from typing import Optional
 
-from timing.geo import (
-    bearing,
-    cumulative_distance,
-    haversine_distance,
-    perpendicular_line,
-)
+from timing import geo_array
+from timing.geo import haversine_distance, perpendicular_line
 from timing.track_db import SectorDefinition, StartFinishLine, TrackDefinition
 
 log = logging.getLogger("kisti.timing.track_learner")
@@ -139,65 +134,43 @@ class TrackLearner:
         """Build TrackDefinition + SectorDefinitions from the recorded trace."""
         track_id = str(uuid.uuid4())
 
+        lats, lons = geo_array.split_trace(self._trace)
+        headings = geo_array.smoothed_bearings(lats, lons)
+
         # ── Start/finish line ─────────────────────────────────────
         # Use the heading at the closure point (last few points)
         closure_lat, closure_lon = self._trace[-1]
-        sf_heading = self._smoothed_bearing(len(self._trace) - 1)
         (sf_lat1, sf_lon1), (sf_lat2, sf_lon2) = perpendicular_line(
-            closure_lat, closure_lon, sf_heading, self._half_width,
+            closure_lat, closure_lon, float(headings[-1]), self._half_width,
         )
         start_finish = StartFinishLine(sf_lat1, sf_lon1, sf_lat2, sf_lon2)
 
         # ── Track center (centroid) ───────────────────────────────
-        n = len(self._trace)
-        center_lat = sum(p[0] for p in self._trace) / n
-        center_lon = sum(p[1] for p in self._trace) / n
+        center_lat = float(lats.mean())
+        center_lon = float(lons.mean())
 
         # ── Track radius ──────────────────────────────────────────
-        max_dist = max(
-            haversine_distance(center_lat, center_lon, p[0], p[1])
-            for p in self._trace
-        )
+        max_dist = float(geo_array.haversine_distances(center_lat, center_lon, lats, lons).max())
         radius_m = max_dist + self._RADIUS_MARGIN_M
 
         # ── Sector boundaries ─────────────────────────────────────
-        cum_dists = cumulative_distance(self._trace)
-        total = cum_dists[-1]
-        sectors: list[SectorDefinition] = []
-
-        for i in range(self._num_sectors):
-            # Place sector lines at equal-distance fractions
-            frac = (i + 1) / (self._num_sectors + 1)
-            target_dist = total * frac
-
-            # Find the trace index at this distance (binary search)
-            idx = bisect.bisect_right(cum_dists, target_dist) - 1
-            idx = max(1, min(idx, n - 2))  # clamp to valid range
-
-            # Interpolate position
-            d0 = cum_dists[idx]
-            d1 = cum_dists[idx + 1]
-            seg_frac = (target_dist - d0) / (d1 - d0) if d1 > d0 else 0.0
-            lat0, lon0 = self._trace[idx]
-            lat1, lon1 = self._trace[idx + 1]
-            sec_lat = lat0 + seg_frac * (lat1 - lat0)
-            sec_lon = lon0 + seg_frac * (lon1 - lon0)
-
-            # Heading at sector point
-            sec_heading = self._smoothed_bearing(idx)
-
-            # Generate perpendicular line
-            (s_lat1, s_lon1), (s_lat2, s_lon2) = perpendicular_line(
-                sec_lat, sec_lon, sec_heading, self._half_width,
-            )
-
-            sectors.append(SectorDefinition(
+        # Equal-distance fractions, interpolated within the trace step
+        cum_dists = geo_array.cumulative_distances(lats, lons)
+        fractions = [(i + 1) / (self._num_sectors + 1) for i in range(self._num_sectors)]
+        sec_lats, sec_lons, seg = geo_array.interpolate_at_distance(
+            lats, lons, cum_dists, [cum_dists[-1] * f for f in fractions],
+        )
+        lines = geo_array.perpendicular_lines(sec_lats, sec_lons, headings[seg], self._half_width)
+        sectors = [
+            SectorDefinition(
                 sector_id=str(uuid.uuid4()),
                 track_id=track_id,
                 sector_index=i,
-                line=StartFinishLine(s_lat1, s_lon1, s_lat2, s_lon2),
+                line=StartFinishLine(*(float(v[i]) for v in lines)),
                 name=f"Sector {i + 1}",
-            ))
+            )
+            for i in range(self._num_sectors)
+        ]
 
         # ── Build TrackDefinition ─────────────────────────────────
         self._track = TrackDefinition(
@@ -212,16 +185,3 @@ class TrackLearner:
             source="learned",
         )
         self._sectors = sectors
-
-    def _smoothed_bearing(self, idx: int) -> float:
-        """Compute bearing at trace index using a 5-point window for stability."""
-        n = len(self._trace)
-        # Look back and forward up to 2 points
-        i0 = max(0, idx - 2)
-        i1 = min(n - 1, idx + 2)
-        # Ensure we have at least 2 distinct points
-        if i0 == i1:
-            i0 = max(0, idx - 1)
-        lat0, lon0 = self._trace[i0]
-        lat1, lon1 = self._trace[i1]
-        return bearing(lat0, lon0, lat1, lon1)
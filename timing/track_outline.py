@@ -5,7 +5,13 @@ Used to convert raw .ztracks GPS data into a form suitable for QPainter:
   - Downsample with Ramer-Douglas-Peucker to keep ~80 representative points
   - Save/load as JSON keyed by track_id
 
-No numpy — pure Python math only (Jetson RAM constraint).
+Normalization and RDP are NumPy-vectorized (the UI process already loads
+NumPy): RDP runs on an explicit stack — no recursion limit — with each
+span's distances computed in one array op, so 10k-point learned traces
+simplify in milliseconds. rdp_mask() exposes the keep-mask for callers
+building several levels of detail from one array; outline_lods() builds
+the set ui/track_map.py draws from, and an :class:`Outline` carries them
+precomputed (the bulk importer stores them in DuckDB).
 """
 
 from __future__ import annotations
@@ -15,11 +21,42 @@ import logging
 import math
 from pathlib import Path
 
+import numpy as np
+
 log = logging.getLogger("kisti.timing.track_outline")
 
 # Default outlines directory (relative to repo root)
 _DEFAULT_OUTLINES_DIR = Path(__file__).parent.parent / "data" / "track_outlines"
 
+# Levels of detail: RDP epsilons in normalized (0-1) units, finest first
+LOD_EPSILONS = (0.0, 0.0005, 0.001, 0.002, 0.004, 0.008)
+
+
+class Outline(list):
+    """Normalized (x, y) outline points with precomputed levels of detail.
+
+    A plain list of points everywhere an outline is expected; ``lods``
+    holds :func:`outline_lods` output so drawing code needn't rebuild it.
+    """
+
+    __slots__ = ("lods",)
+
+    def __init__(self, points=(), lods: list[tuple[float, np.ndarray]] | None = None) -> None:
+        super().__init__(points)
+        self.lods = lods
+
+
+def outline_lods(xy: np.ndarray) -> list[tuple[float, np.ndarray]]:
+    """(epsilon, kept indices) per LOD_EPSILONS level, skipping levels that drop nothing new."""
+    n = len(xy)
+    levels: list[tuple[float, np.ndarray]] = []
+    for eps in LOD_EPSILONS:
+        idx = np.arange(n) if eps == 0.0 or n < 3 else np.flatnonzero(rdp_mask(xy, eps))
+        if levels and len(idx) == len(levels[-1][1]):
+            continue
+        levels.append((eps, idx))
+    return levels
+
 
 def normalize_outline(
     points: list[tuple[float, float]],
@@ -33,11 +70,11 @@ def normalize_outline(
     if len(points) < 2:
         return []
 
-    lats = [p[0] for p in points]
-    lons = [p[1] for p in points]
+    pts = np.asarray(points, dtype=np.float64)
+    lats, lons = pts[:, 0], pts[:, 1]
 
-    min_lat, max_lat = min(lats), max(lats)
-    min_lon, max_lon = min(lons), max(lons)
+    min_lat, max_lat = float(lats.min()), float(lats.max())
+    min_lon, max_lon = float(lons.min()), float(lons.max())
 
     lat_span = max_lat - min_lat
     lon_span = max_lon - min_lon
@@ -53,18 +90,10 @@ def normalize_outline(
 
     scale = max(lat_span, effective_lon_span) or 1.0
 
-    normalized: list[tuple[float, float]] = []
-    for lat, lon in points:
-        # Centre within a 0-1 box with a 5% margin
-        nx = 0.05 + 0.90 * ((lon - min_lon) * lon_scale) / scale
-        # Y flipped: north (high lat) → small y (top of screen)
-        ny = 0.05 + 0.90 * ((max_lat - lat)) / scale
-        # Clamp to [0, 1]
-        nx = max(0.0, min(1.0, nx))
-        ny = max(0.0, min(1.0, ny))
-        normalized.append((nx, ny))
-
-    return normalized
+    # Centre within a 0-1 box with a 5% margin; y flipped: north (high lat) → top
+    nx = np.clip(0.05 + 0.90 * ((lons - min_lon) * lon_scale) / scale, 0.0, 1.0)
+    ny = np.clip(0.05 + 0.90 * (max_lat - lats) / scale, 0.0, 1.0)
+    return list(zip(nx.tolist(), ny.tolist()))
 
 
 def downsample_rdp(
@@ -99,31 +128,70 @@ def downsample_rdp(
     return result
 
 
+def rdp_mask(xy: np.ndarray, epsilon: float) -> np.ndarray:
+    """Ramer-Douglas-Peucker keep-mask for an (N, 2) point array.
+
+    Iterative and batched: every open span of one subdivision depth is
+    measured in a single vectorized pass (per-span max via reduceat), so
+    the Python loop runs O(depth) times rather than once per span. First
+    and last points are always kept.
+    """
+    n = len(xy)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = keep[-1] = True
+    x, y = xy[:, 0], xy[:, 1]
+    first = np.array([0])
+    last = np.array([n - 1])
+    while len(first):
+        inner = last - first - 1
+        open_ = inner > 0
+        first, last, inner = first[open_], last[open_], inner[open_]
+        if not len(first):
+            break
+        # Flattened interior indices of every span, and the span each belongs to
+        span = np.repeat(np.arange(len(first)), inner)
+        offsets = np.cumsum(inner) - inner
+        idx = np.arange(len(span)) - offsets[span] + first[span] + 1
+
+        x1, y1 = x[first][span], y[first][span]
+        x2, y2 = x[last][span], y[last][span]
+        dx, dy = x2 - x1, y2 - y1
+        seg_len = np.hypot(dx, dy)
+        px, py = x[idx], y[idx]
+        closed = seg_len == 0.0     # Closed-loop span: distance to the shared endpoint
+        dist = np.where(
+            closed,
+            np.hypot(px - x1, py - y1),
+            np.abs(dy * px - dx * py + x2 * y1 - y2 * x1) / np.where(closed, 1.0, seg_len),
+        )
+
+        peak = np.maximum.reduceat(dist, offsets)
+        split_spans = np.flatnonzero(peak > epsilon)
+        if not len(split_spans):
+            break
+        # First index reaching each span's peak (matches the scalar argmax)
+        hit = np.flatnonzero(dist == peak[span])
+        hit_span, first_hit = np.unique(span[hit], return_index=True)
+        split_at = np.empty(len(first), dtype=np.int64)
+        split_at[hit_span] = idx[hit[first_hit]]
+        split_at = split_at[split_spans]
+        keep[split_at] = True
+        first = np.concatenate((first[split_spans], split_at))
+        last = np.concatenate((split_at, last[split_spans]))
+    return keep
+
+
 def _rdp(
     points: list[tuple[float, float]],
     epsilon: float,
 ) -> list[tuple[float, float]]:
-    """Recursive Ramer-Douglas-Peucker."""
+    """Ramer-Douglas-Peucker over a point list (see rdp_mask)."""
     if len(points) <= 2:
         return list(points)
-
-    # Find point with maximum perpendicular distance from the line start→end
-    start, end = points[0], points[-1]
-    max_dist = 0.0
-    max_idx = 0
-
-    for i in range(1, len(points) - 1):
-        dist = _perp_distance(points[i], start, end)
-        if dist > max_dist:
-            max_dist = dist
-            max_idx = i
-
-    if max_dist > epsilon:
-        left = _rdp(points[: max_idx + 1], epsilon)
-        right = _rdp(points[max_idx:], epsilon)
-        return left[:-1] + right
-    else:
-        return [start, end]
+    keep = rdp_mask(np.asarray(points, dtype=np.float64), epsilon)
+    return [points[i] for i in np.flatnonzero(keep).tolist()]
 
 
 def _perp_distance(
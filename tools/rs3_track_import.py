@@ -3,6 +3,9 @@
 Accepts GPX, CSV, or manual center-point entry. Outputs JSON matching the
 tracks_seed.json schema consumed by TrackDatabase.seed_tracks().
 
+iter_gpx() / iter_csv() stream points (with timestamps) in constant
+memory for multi-hour logger files; see tools/trace_stream.py.
+
 Usage:
     # GPX file (e.g., exported from RS3 GPS Manager)
     python3 -m tools.rs3_track_import --input track.gpx --name "Area 27" --country CA --region BC
@@ -20,25 +23,21 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import bisect
 import json
 import logging
 import sys
 import uuid
 import xml.etree.ElementTree as ET
+from datetime import datetime
 from pathlib import Path
+from typing import Iterator, Optional
 
-# Add repo root to path so timing.geo is importable
+# Add repo root to path so timing.geo_array is importable
 _REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
-from timing.geo import (
-    bearing,
-    cumulative_distance,
-    haversine_distance,
-    perpendicular_line,
-)
+from timing import geo_array
 
 log = logging.getLogger("kisti.tools.rs3_track_import")
 
@@ -57,70 +56,115 @@ DEFAULT_HALF_WIDTH_M = 15.0
 # ---------------------------------------------------------------------------
 
 
+def iter_gpx(path: Path) -> Iterator[tuple[float, float, Optional[float]]]:
+    """Stream (lat, lon, unix_ts or None) from a GPX file.
+
+    Handles GPX 1.1 / 1.0 / no namespace.  Uses iterparse and drops each
+    point element once read, so memory stays flat however long the log.
+    Yields <trkpt> elements; falls back to <wpt> waypoints (buffered —
+    there are few) if the file has no track points.
+    """
+    waypoints: list[tuple[float, float, Optional[float]]] = []
+    have_track = False
+    stack: list[ET.Element] = []
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+        stack.pop()
+        tag = elem.tag.rsplit("}", 1)[-1]
+        if tag not in ("trkpt", "wpt"):
+            continue
+        point = (float(elem.attrib["lat"]), float(elem.attrib["lon"]), _gpx_time(elem))
+        if stack:
+            stack[-1].remove(elem)      # Parent holds no finished points
+        if tag == "trkpt":
+            have_track = True
+            yield point
+        elif not have_track:
+            waypoints.append(point)
+    if not have_track:
+        yield from waypoints
+
+
+def _gpx_time(elem: ET.Element) -> Optional[float]:
+    for child in elem:
+        if child.tag.rsplit("}", 1)[-1] == "time" and child.text:
+            try:
+                return datetime.fromisoformat(child.text.strip().replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                return None
+    return None
+
+
 def parse_gpx(path: Path) -> list[tuple[float, float]]:
     """Parse GPX file and extract GPS trace as (lat, lon) tuples.
 
     Handles GPX 1.1 (with namespace) and GPX 1.0 (without namespace).
     Prefers <trkpt> elements; falls back to <wpt> waypoints.
     """
-    tree = ET.parse(path)
-    root = tree.getroot()
-
-    # Try GPX 1.1 namespace first, then bare tags
-    namespaces = [
-        "{http://www.topografix.com/GPX/1/1}",
-        "{http://www.topografix.com/GPX/1/0}",
-        "",
-    ]
-
-    points: list[tuple[float, float]] = []
-
-    for ns in namespaces:
-        # Try track points
-        for trkpt in root.iter(f"{ns}trkpt"):
-            lat = float(trkpt.attrib["lat"])
-            lon = float(trkpt.attrib["lon"])
-            points.append((lat, lon))
-        if points:
-            break
-
-        # Fallback to waypoints
-        for wpt in root.iter(f"{ns}wpt"):
-            lat = float(wpt.attrib["lat"])
-            lon = float(wpt.attrib["lon"])
-            points.append((lat, lon))
-        if points:
-            break
-
+    points = [(lat, lon) for lat, lon, _ts in iter_gpx(path)]
     if not points:
         raise ValueError(f"No GPS points found in {path}")
-
     return points
 
 
+# CSV header names (lower-case) recognised for each column
+_CSV_LAT = ("lat", "latitude")
+_CSV_LON = ("lon", "lng", "long", "longitude")
+_CSV_TIME = ("time", "timestamp", "ts", "elapsed", "elapsed_s", "time_s", "seconds")
+
+
+def iter_csv(path: Path) -> Iterator[tuple[float, float, Optional[float]]]:
+    """Stream (lat, lon, time or None) rows from a CSV file.
+
+    Reads line by line (buffered), never the whole file.  A non-numeric
+    first row is a header: lat/lon/time columns are found by name
+    (e.g. RaceRender's Latitude, Longitude, Time), else columns 0 and 1.
+    A bad data row after the first raises ValueError.
+    """
+    lat_col, lon_col, time_col = 0, 1, None
+    with open(path, newline="") as f:
+        for i, line in enumerate(f):
+            parts = line.strip().split(",")
+            if len(parts) < 2:
+                continue
+            try:
+                lat = float(parts[lat_col].strip())
+                lon = float(parts[lon_col].strip())
+            except (ValueError, IndexError):
+                if i == 0:
+                    lat_col, lon_col, time_col = _csv_columns(parts)
+                    continue  # Header row
+                raise ValueError(f"Bad CSV row {i + 1} in {path}: {line.strip()!r}") from None
+            ts = None
+            if time_col is not None and time_col < len(parts):
+                try:
+                    ts = float(parts[time_col])
+                except ValueError:
+                    pass
+            yield lat, lon, ts
+
+
+def _csv_columns(header: list[str]) -> tuple[int, int, Optional[int]]:
+    names = [h.strip().strip('"').lower() for h in header]
+
+    def find(candidates: tuple[str, ...]) -> Optional[int]:
+        return next((i for i, n in enumerate(names) if n in candidates), None)
+
+    lat, lon = find(_CSV_LAT), find(_CSV_LON)
+    if lat is None or lon is None:
+        lat, lon = 0, 1
+    return lat, lon, find(_CSV_TIME)
+
+
 def parse_csv(path: Path) -> list[tuple[float, float]]:
     """Parse CSV with lat,lon per row. Auto-detects and skips header."""
-    lines = path.read_text().strip().splitlines()
-    if not lines:
-        raise ValueError(f"Empty CSV file: {path}")
-
-    points: list[tuple[float, float]] = []
-    for i, line in enumerate(lines):
-        parts = line.strip().split(",")
-        if len(parts) < 2:
-            continue
-        try:
-            lat = float(parts[0].strip())
-            lon = float(parts[1].strip())
-            points.append((lat, lon))
-        except ValueError:
-            if i == 0:
-                continue  # Skip header row
-            raise
-
+    points = [(lat, lon) for lat, lon, _ts in iter_csv(path)]
     if not points:
-        raise ValueError(f"No valid GPS points in {path}")
-
+        with open(path) as f:
+            blank = not any(line.strip() for line in f)
+        raise ValueError(f"Empty CSV file: {path}" if blank else f"No valid GPS points in {path}")
     return points
 
 
@@ -129,18 +173,6 @@ def parse_csv(path: Path) -> list[tuple[float, float]]:
 # ---------------------------------------------------------------------------
 
 
-def _smoothed_bearing(trace: list[tuple[float, float]], idx: int) -> float:
-    """Compute bearing at trace index using a 5-point window for stability."""
-    n = len(trace)
-    i0 = max(0, idx - 2)
-    i1 = min(n - 1, idx + 2)
-    if i0 == i1:
-        i0 = max(0, idx - 1)
-    lat0, lon0 = trace[i0]
-    lat1, lon1 = trace[i1]
-    return bearing(lat0, lon0, lat1, lon1)
-
-
 def trace_to_track(
     gps_trace: list[tuple[float, float]],
     name: str,
@@ -172,59 +204,41 @@ def trace_to_track(
             f"GPS trace has {len(gps_trace)} points, need at least {MIN_TRACE_POINTS}"
         )
 
-    n = len(gps_trace)
+    lats, lons = geo_array.split_trace(gps_trace)
 
     # Center (centroid)
-    center_lat = sum(p[0] for p in gps_trace) / n
-    center_lon = sum(p[1] for p in gps_trace) / n
+    center_lat = float(lats.mean())
+    center_lon = float(lons.mean())
 
     # Radius (max distance from centroid + margin)
-    max_dist = max(
-        haversine_distance(center_lat, center_lon, p[0], p[1])
-        for p in gps_trace
-    )
+    max_dist = float(geo_array.haversine_distances(center_lat, center_lon, lats, lons).max())
     radius_m = max_dist + RADIUS_MARGIN_M
 
     # Length
-    cum_dists = cumulative_distance(gps_trace)
-    length_m = cum_dists[-1]
+    cum_dists = geo_array.cumulative_distances(lats, lons)
+    length_m = float(cum_dists[-1])
+
+    headings = geo_array.smoothed_bearings(lats, lons)
 
     # Start/finish line at first point
-    sf_heading = _smoothed_bearing(gps_trace, 0)
-    (sf_lat1, sf_lon1), (sf_lat2, sf_lon2) = perpendicular_line(
-        gps_trace[0][0], gps_trace[0][1], sf_heading, half_width_m,
+    sf_lat1, sf_lon1, sf_lat2, sf_lon2 = (
+        float(v) for v in geo_array.perpendicular_lines(lats[0], lons[0], headings[0], half_width_m)
     )
 
     # Sector boundaries at equal-distance fractions
-    sectors = []
-    for i in range(num_sectors):
-        frac = (i + 1) / (num_sectors + 1)
-        target_dist = length_m * frac
-
-        idx = bisect.bisect_right(cum_dists, target_dist) - 1
-        idx = max(1, min(idx, n - 2))
-
-        # Interpolate position
-        d0 = cum_dists[idx]
-        d1 = cum_dists[idx + 1]
-        seg_frac = (target_dist - d0) / (d1 - d0) if d1 > d0 else 0.0
-        lat0, lon0 = gps_trace[idx]
-        lat1, lon1 = gps_trace[idx + 1]
-        sec_lat = lat0 + seg_frac * (lat1 - lat0)
-        sec_lon = lon0 + seg_frac * (lon1 - lon0)
-
-        sec_heading = _smoothed_bearing(gps_trace, idx)
-        (s_lat1, s_lon1), (s_lat2, s_lon2) = perpendicular_line(
-            sec_lat, sec_lon, sec_heading, half_width_m,
-        )
-
-        sectors.append({
-            "line_lat1": round(s_lat1, 6),
-            "line_lon1": round(s_lon1, 6),
-            "line_lat2": round(s_lat2, 6),
-            "line_lon2": round(s_lon2, 6),
+    targets = [length_m * (i + 1) / (num_sectors + 1) for i in range(num_sectors)]
+    sec_lats, sec_lons, seg = geo_array.interpolate_at_distance(lats, lons, cum_dists, targets)
+    lines = geo_array.perpendicular_lines(sec_lats, sec_lons, headings[seg], half_width_m)
+    sectors = [
+        {
+            "line_lat1": round(float(lines[0][i]), 6),
+            "line_lon1": round(float(lines[1][i]), 6),
+            "line_lat2": round(float(lines[2][i]), 6),
+            "line_lon2": round(float(lines[3][i]), 6),
             "name": f"Sector {i + 1}",
-        })
+        }
+        for i in range(num_sectors)
+    ]
 
     return {
         "track_id": str(uuid.uuid4()),
@@ -284,14 +298,20 @@ def merge_to_seed(new_track: dict, seed_path: Path) -> None:
 
     Warns if a track with the same name already exists but still merges.
     """
+    merge_tracks_to_seed([new_track], seed_path)
+
+
+def merge_tracks_to_seed(new_tracks: list[dict], seed_path: Path) -> None:
+    """Append several track entries to a tracks_seed.json file in one write."""
     data = json.loads(seed_path.read_text()) if seed_path.exists() else []
 
-    for existing in data:
-        if existing.get("name") == new_track["name"]:
+    names = {existing.get("name") for existing in data}
+    for new_track in new_tracks:
+        if new_track["name"] in names:
             log.warning("Track '%s' already exists in seed file — adding anyway", new_track["name"])
-            break
+        names.add(new_track["name"])
 
-    data.append(new_track)
+    data.extend(new_tracks)
     seed_path.write_text(json.dumps(data, indent=2) + "\n")
 
 
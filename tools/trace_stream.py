@@ -0,0 +1,187 @@
+"""Trace stream — lap-segment multi-hour GPX / CSV logs in constant memory.
+
+Points stream from iter_gpx() / iter_csv() (tools/rs3_track_import.py)
+through a TraceSegmenter (timing/trace_segmenter.py), which learns the
+track (or uses one from the track database) and emits laps as they
+complete.  Optionally every raw point is written to Parquet for later
+overlay analysis: ParquetTraceWriter buffers a fixed number of rows and
+writes each chunk as a part file through DuckDB, so memory stays bounded
+however long the log.  Read the parts back with
+``SELECT * FROM read_parquet('<dir>/*.parquet') ORDER BY idx``.
+
+Usage:
+    python3 -m tools.trace_stream session.gpx
+    python3 -m tools.trace_stream racerender.csv --parquet out/session1
+    python3 -m tools.trace_stream session.gpx --db /data/duckdb/kisti.duckdb
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, Optional
+
+# Add repo root to path so timing/tools are importable when run as a script
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from data.duckdb_store import copy_columns_to_parquet
+from timing.trace_segmenter import TraceEvent, TraceSegmenter
+from tools.rs3_track_import import iter_csv, iter_gpx
+
+log = logging.getLogger("kisti.tools.trace_stream")
+
+DEFAULT_CHUNK_ROWS = 250_000
+
+
+class ParquetTraceWriter:
+    """Append (idx, ts, lat, lon, lap) rows to a directory of Parquet parts.
+
+    Rows are buffered in typed arrays and flushed every *chunk_rows* as
+    ``part-NNNNN.parquet`` via DuckDB COPY (DuckDB is already a dependency;
+    no pyarrow needed).
+    """
+
+    def __init__(self, out_dir: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
+        import duckdb  # type: ignore[import-untyped]
+
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self.parts: list[Path] = []
+        self._conn = duckdb.connect(":memory:")
+        self._reset_buffers()
+
+    def _reset_buffers(self) -> None:
+        self._idx = array("q")
+        self._ts = array("d")
+        self._lat = array("d")
+        self._lon = array("d")
+        self._lap = array("i")
+
+    def write(self, ts: float, lat: float, lon: float, lap: int) -> None:
+        self._idx.append(self.rows)
+        self._ts.append(ts)
+        self._lat.append(lat)
+        self._lon.append(lon)
+        self._lap.append(lap)
+        self.rows += 1
+        if len(self._idx) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows as the next part file."""
+        if not len(self._idx):
+            return
+        import numpy as np
+
+        chunk = {
+            "idx": np.frombuffer(self._idx, dtype=np.int64),
+            "ts": np.frombuffer(self._ts, dtype=np.float64),
+            "lat": np.frombuffer(self._lat, dtype=np.float64),
+            "lon": np.frombuffer(self._lon, dtype=np.float64),
+            "lap": np.frombuffer(self._lap, dtype=np.int32),
+        }
+        path = self.out_dir / f"part-{len(self.parts):05d}.parquet"
+        copy_columns_to_parquet(self._conn, chunk, path)
+        self.parts.append(path)
+        self._reset_buffers()
+
+    def close(self) -> list[Path]:
+        """Flush the last chunk; returns all part files written."""
+        self.flush()
+        self._conn.close()
+        return self.parts
+
+    def __enter__(self) -> "ParquetTraceWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def iter_points(path: Path) -> Iterator[tuple[float, float, Optional[float]]]:
+    """(lat, lon, ts or None) from a .gpx or .csv log, streamed."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gpx":
+        return iter_gpx(path)
+    if suffix == ".csv":
+        return iter_csv(path)
+    raise ValueError(f"Unsupported file format: {suffix} (use .gpx or .csv)")
+
+
+def stream_log(
+    path: Path,
+    segmenter: Optional[TraceSegmenter] = None,
+    parquet_dir: Optional[Path] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Iterator[TraceEvent]:
+    """Segment a log file, yielding track / lap events as they are found.
+
+    *segmenter* defaults to one that learns the track from the log.  With
+    *parquet_dir* every point is also written there, tagged with the lap
+    it belongs to (0 = before the first timed lap).
+    """
+    seg = segmenter or TraceSegmenter()
+    writer = ParquetTraceWriter(parquet_dir, chunk_rows) if parquet_dir is not None else None
+    try:
+        for lat, lon, ts in iter_points(path):
+            events = seg.feed(lat, lon, ts)
+            if writer is not None:
+                # A point that closes a lap belongs to the lap it completes
+                lap = events[-1].lap.lap_number if events and events[-1].lap else seg.current_lap
+                writer.write(seg.last_ts, lat, lon, lap)
+            yield from events
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _segmenter_from_db(db_path: Path, path: Path, sample_hz: float = 10.0) -> TraceSegmenter:
+    """Segmenter for the database track at the log's first point (learns if none)."""
+    from data.duckdb_store import DuckDBStore
+    from timing.track_db import TrackDatabase
+
+    first = next(iter_points(path), None)
+    store = DuckDBStore(db_path=db_path)
+    store.open()
+    try:
+        track = TrackDatabase(store._conn).find_track(first[0], first[1]) if first else None
+    finally:
+        store.close()
+    if track is None:
+        return TraceSegmenter(sample_hz=sample_hz)
+    log.info("Using track %s from %s", track.name, db_path)
+    return TraceSegmenter(track, track.sectors, sample_hz=sample_hz)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Lap-segment a GPX / CSV log in constant memory.")
+    parser.add_argument("input", type=Path, help="GPX or CSV log")
+    parser.add_argument("--parquet", type=Path, help="Write all points as Parquet parts into this directory")
+    parser.add_argument("--db", type=Path, help="Use the matching track from this DuckDB (else learn it)")
+    parser.add_argument("--hz", type=float, default=10.0, help="Sample rate for logs without timestamps")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    seg = (_segmenter_from_db(args.db, args.input, args.hz) if args.db
+           else TraceSegmenter(sample_hz=args.hz))
+    for event in stream_log(args.input, seg, args.parquet):
+        if event.kind == "track":
+            print(f"Track learned: {event.track.length_m:.0f} m, {len(event.sectors)} sectors "
+                  f"(point {event.point_index})")
+        else:
+            lap = event.lap
+            splits = " ".join(f"{t:.2f}" for t in lap.sector_times)
+            print(f"Lap {lap.lap_number:3d}  {lap.time_s:8.3f}s  {lap.distance_m:7.0f} m  [{splits}]")
+    print(f"{seg.laps_completed} laps")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
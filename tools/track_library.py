@@ -0,0 +1,304 @@
+"""Track library bulk import — directories of .ztracks / GPX / CSV into DuckDB.
+
+Scans source directories, parses new or changed files in a process pool
+(one file per task: parse, trace_to_track(), normalized outline and its
+RDP levels of detail), dedupes tracks by spatial proximity and writes
+tracks, sectors, outlines and the import manifest in one transaction.
+
+The manifest records each file's size, mtime and SHA-256: a file whose
+size/mtime are unchanged is skipped without being read, one whose content
+hash is already known is recorded but not re-parsed.  So the startup check
+(TimingManager) is a directory scan plus one SELECT, and only new files
+ever cost a parse.
+
+Dedupe: a parsed track whose centre lies within DEDUPE_DISTANCE_M of a
+known track (database or earlier in the same batch) is the same venue.
+Its outline is stored for that track if it has none.  Existing track
+definitions (seeded, learned) are never overwritten.
+
+Usage:
+    python3 -m tools.track_library ~/tracks
+    python3 -m tools.track_library ~/tracks ~/rs3_exports --workers 4
+    python3 -m tools.track_library ~/tracks --seed data/tracks_seed.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Add repo root to path so timing/tools are importable when run as a script
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from timing.geo import haversine_distance
+from timing.track_db import TrackDatabase, track_from_entry
+
+log = logging.getLogger("kisti.tools.track_library")
+
+SOURCE_SUFFIXES = (".ztracks", ".gpx", ".csv")
+
+# Track centres closer than this are the same venue
+DEDUPE_DISTANCE_M = 750.0
+
+_HASH_CHUNK = 1 << 20
+
+
+@dataclass
+class ImportReport:
+    """What one import_library() run did."""
+    scanned: int = 0
+    unchanged: int = 0                                  # Skipped via the manifest
+    imported: list[str] = field(default_factory=list)   # New track names
+    merged: list[str] = field(default_factory=list)     # Files deduped onto a known track
+    failed: list[str] = field(default_factory=list)     # File names that didn't parse
+    new_tracks: list[dict] = field(default_factory=list)  # tracks_seed.json entries
+
+
+# ---------------------------------------------------------------------------
+# Scanning + manifest
+# ---------------------------------------------------------------------------
+
+
+def scan_sources(dirs: Iterable[Path]) -> list[Path]:
+    """All track source files under *dirs* (recursive), sorted."""
+    found: set[Path] = set()
+    for d in dirs:
+        d = Path(d).expanduser()
+        if not d.is_dir():
+            continue
+        for path in d.rglob("*"):
+            if path.suffix.lower() in SOURCE_SUFFIXES and path.is_file():
+                found.add(path.resolve())
+    return sorted(found)
+
+
+def content_hash(path: Path) -> str:
+    """SHA-256 of a file's content (streamed)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _manifest(conn) -> dict[str, tuple]:
+    rows = conn.execute(
+        "SELECT path, size_bytes, mtime_ns, content_hash, track_id FROM track_import_manifest"
+    ).fetchall()
+    return {r[0]: r[1:] for r in rows}
+
+
+def pending_sources(conn, paths: Iterable[Path]) -> list[Path]:
+    """Files whose size or mtime differ from the manifest (new or touched)."""
+    manifest = _manifest(conn)
+    pending = []
+    for path in paths:
+        st = path.stat()
+        entry = manifest.get(str(path))
+        if entry is None or entry[0] != st.st_size or entry[1] != st.st_mtime_ns:
+            pending.append(path)
+    return pending
+
+
+# ---------------------------------------------------------------------------
+# Parsing (runs in worker processes)
+# ---------------------------------------------------------------------------
+
+
+def _name_from_stem(path: Path) -> str:
+    return path.stem.replace("_", " ").replace("-", " ").strip().title()
+
+
+def parse_source(path: str) -> dict:
+    """Parse one source file into a seed entry + outline.
+
+    Returns a picklable dict: path, track (tracks_seed.json entry or None),
+    outline, lods, error (None on success).
+    """
+    import numpy as np
+
+    from timing.track_outline import downsample_rdp, normalize_outline, outline_lods
+    from tools.rs3_track_import import parse_csv, parse_gpx, trace_to_track
+
+    src = Path(path)
+    result = {"path": path, "track": None, "outline": [], "lods": [], "error": None}
+    try:
+        suffix = src.suffix.lower()
+        if suffix == ".ztracks":
+            from tools.ztracks_parser import parse_ztracks
+
+            parsed = parse_ztracks(src)
+            name = parsed.name or _name_from_stem(src)
+            trace = [(p[0], p[1]) for p in parsed.points]
+        else:
+            trace = parse_gpx(src) if suffix == ".gpx" else parse_csv(src)
+            name = _name_from_stem(src)
+        result["track"] = trace_to_track(trace, name)
+        outline = downsample_rdp(normalize_outline(trace))
+        result["outline"] = outline
+        result["lods"] = outline_lods(np.asarray(outline, dtype=np.float64).reshape(-1, 2))
+    except Exception as exc:
+        result["error"] = f"{type(exc).__name__}: {exc}"
+    return result
+
+
+def _parse_all(paths: list[Path], workers: int, isolate: bool = False) -> list[dict]:
+    """parse_source() over *paths* — in a process pool when it's worth it (always if *isolate*)."""
+    args = [str(p) for p in paths]
+    if not args:
+        return []
+    if not isolate and (workers <= 1 or len(args) <= 1):
+        return [parse_source(a) for a in args]
+    # spawn, not fork: callers may be threaded (Qt, DuckDB)
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(args))), mp_context=ctx) as pool:
+        return list(pool.map(parse_source, args))
+
+
+# ---------------------------------------------------------------------------
+# Import
+# ---------------------------------------------------------------------------
+
+
+def import_library(
+    dirs: Iterable[Path],
+    conn,
+    workers: Optional[int] = None,
+    dedupe_m: float = DEDUPE_DISTANCE_M,
+    isolate: bool = False,
+) -> ImportReport:
+    """Import every new / changed track source under *dirs* into DuckDB.
+
+    *conn* is an open DuckDB connection with the KiSTI schema; *workers*
+    defaults to the CPU count (1 parses in-process).  *isolate* parses in
+    spawned processes even with one worker, so a caller inside the Qt
+    process (TimingManager) only waits and writes — no parse holds its GIL.
+    """
+    report = ImportReport()
+    paths = scan_sources(dirs)
+    report.scanned = len(paths)
+    todo = pending_sources(conn, paths)
+    report.unchanged = len(paths) - len(todo)
+    if not todo:
+        return report
+
+    manifest = _manifest(conn)
+    known_hashes = {entry[2]: entry[3] for entry in manifest.values()}
+    stats = {p: p.stat() for p in todo}
+    hashes = {p: content_hash(p) for p in todo}
+    # Touched but identical, or a copy of a file already imported: record only
+    to_parse = [p for p in todo if hashes[p] not in known_hashes]
+    results = {Path(r["path"]): r for r in _parse_all(to_parse, workers or os.cpu_count() or 1, isolate)}
+
+    db = TrackDatabase(conn)
+    known = [(t.track_id, t.center_lat, t.center_lon) for t in db.list_tracks(limit=1_000_000)]
+    with_outline = set(db.outline_track_ids())
+
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        for path in todo:
+            track_id = known_hashes.get(hashes[path])
+            parsed = results.get(path)
+            if parsed is not None:
+                track_id = _store(db, parsed, known, with_outline, dedupe_m, report)
+                known_hashes[hashes[path]] = track_id
+            st = stats[path]
+            conn.execute(
+                "INSERT OR REPLACE INTO track_import_manifest VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                [str(path), st.st_size, st.st_mtime_ns, hashes[path], track_id],
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    log.info(
+        "Track library: %d files, %d unchanged, %d new tracks, %d merged, %d failed",
+        report.scanned, report.unchanged, len(report.imported), len(report.merged), len(report.failed),
+    )
+    return report
+
+
+def _store(
+    db: TrackDatabase,
+    parsed: dict,
+    known: list[tuple[str, float, float]],
+    with_outline: set[str],
+    dedupe_m: float,
+    report: ImportReport,
+) -> Optional[str]:
+    """Write one parsed source; returns the track_id it maps to (None = failed)."""
+    name = Path(parsed["path"]).name
+    entry = parsed["track"]
+    if parsed["error"] or entry is None:
+        log.warning("Track import failed for %s: %s", name, parsed["error"])
+        report.failed.append(name)
+        return None
+
+    lat, lon = entry["center_lat"], entry["center_lon"]
+    nearest = min(known, key=lambda k: haversine_distance(lat, lon, k[1], k[2]), default=None)
+    if nearest is not None and haversine_distance(lat, lon, nearest[1], nearest[2]) <= dedupe_m:
+        track_id = nearest[0]
+        report.merged.append(name)
+    else:
+        track, sectors = track_from_entry(entry, source="import")
+        track_id = track.track_id
+        db.save_track(track)
+        db.save_sectors(track_id, sectors)
+        known.append((track_id, lat, lon))
+        report.imported.append(entry["name"])
+        report.new_tracks.append(entry)
+
+    if parsed["outline"] and track_id not in with_outline:
+        db.save_outline(track_id, parsed["outline"], parsed["lods"])
+        with_outline.add(track_id)
+    return track_id
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk import .ztracks / GPX / CSV track files into DuckDB.")
+    parser.add_argument("dirs", nargs="+", type=Path, help="Directories to scan (recursive)")
+    parser.add_argument("--db", type=Path, help="DuckDB path (default: the KiSTI database)")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
+    parser.add_argument("--seed", type=Path, help="Also append new tracks to this tracks_seed.json")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    from data.duckdb_store import DEFAULT_DB_PATH, DuckDBStore
+
+    store = DuckDBStore(db_path=args.db or DEFAULT_DB_PATH)
+    store.open()
+    try:
+        report = import_library(args.dirs, store._conn, workers=args.workers)
+    finally:
+        store.close()
+
+    print(f"{report.scanned} files: {report.unchanged} unchanged, {len(report.imported)} new tracks, "
+          f"{len(report.merged)} merged, {len(report.failed)} failed")
+    for name in report.imported:
+        print(f"  + {name}")
+    if args.seed and report.new_tracks:
+        from tools.rs3_track_import import merge_tracks_to_seed
+
+        merge_tracks_to_seed(report.new_tracks, args.seed)
+        print(f"Merged {len(report.new_tracks)} tracks into {args.seed}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
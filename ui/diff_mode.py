@@ -51,6 +51,7 @@ from PySide6.QtWidgets import (
 
 from can.can_config import STALE_TIMEOUT_S, UI_REFRESH_MS
 from model.vehicle_state import DiffState, DiffStateBridge, SurfaceState
+from ui.layers import StaticLayer
 from ui.theme import (
     BG_ACCENT,
     BG_DARK,
@@ -67,6 +68,9 @@ from ui.theme import (
     SILVER,
     WHITE,
     YELLOW,
+    color,
+    font,
+    pen,
 )
 from ui.widgets.diff_sparkline import DiffSparkline
 
@@ -198,6 +202,7 @@ class _TorqueSilhouette(QWidget):
         # Per-wheel speeds (km/h)
         self._ws = {"FL": 0.0, "FR": 0.0, "RL": 0.0, "RR": 0.0}
         self._ws_available = False
+        self._body_layer = StaticLayer(self._paint_static)
 
     def set_state(
         self,
@@ -220,11 +225,19 @@ class _TorqueSilhouette(QWidget):
     def paintEvent(self, event) -> None:  # noqa: N802
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
-        w, h = self.width(), self.height()
+        cx, cy, car_w, car_h = self._car_rect()
 
-        p.fillRect(0, 0, w, h, QColor(BG_DARK))
+        # Background + car body outline (cached; rebuilt on resize)
+        self._body_layer.draw(p)
+
+        # Draw wheels with torque glow
+        self._draw_wheels(p, cx, cy, car_w, car_h)
+
+        p.end()
 
-        # Calculate car dimensions — centered, padded
+    def _car_rect(self) -> tuple[float, float, float, float]:
+        """Car bbox (x, y, w, h) — centered, padded."""
+        w, h = self.width(), self.height()
         pad = 8
         avail_w = w - 2 * pad
         avail_h = h - 2 * pad
@@ -237,16 +250,11 @@ class _TorqueSilhouette(QWidget):
             car_h = avail_h
             car_w = car_h / car_aspect
 
-        cx = (w - car_w) / 2
-        cy = (h - car_h) / 2
+        return (w - car_w) / 2, (h - car_h) / 2, car_w, car_h
 
-        # Draw car body outline
-        self._draw_body(p, cx, cy, car_w, car_h)
-
-        # Draw wheels with torque glow
-        self._draw_wheels(p, cx, cy, car_w, car_h)
-
-        p.end()
+    def _paint_static(self, p: QPainter) -> None:
+        p.fillRect(0, 0, self.width(), self.height(), color(BG_DARK))
+        self._draw_body(p, *self._car_rect())
 
     def _draw_body(self, p: QPainter, cx: float, cy: float, cw: float, ch: float) -> None:
         """Draw 2014 STI hatchback top-down silhouette (from sti_heatmap_widget)."""
@@ -302,12 +310,12 @@ class _TorqueSilhouette(QWidget):
         p.drawPath(body)
 
         # Body outline — chrome
-        p.setPen(QPen(QColor(CHROME_MID), 1.5))
+        p.setPen(pen(CHROME_MID, 1.5))
         p.setBrush(Qt.NoBrush)
         p.drawPath(body)
 
         # Interior details — windshield
-        p.setPen(QPen(QColor(CHROME_DARK), 1))
+        p.setPen(pen(CHROME_DARK, 1))
         p.drawLine(int(cx + cw * 0.24), int(cy + ch * 0.20),
                    int(cx + cw * 0.30), int(cy + ch * 0.30))
         p.drawLine(int(cx + cw * 0.76), int(cy + ch * 0.20),
@@ -330,12 +338,12 @@ class _TorqueSilhouette(QWidget):
         scoop.lineTo(cx + cw * 0.56, cy + ch * 0.17)
         scoop.lineTo(cx + cw * 0.44, cy + ch * 0.17)
         scoop.closeSubpath()
-        p.setPen(QPen(QColor(CHROME_DARK), 1))
+        p.setPen(pen(CHROME_DARK, 1))
         p.setBrush(QColor(20, 20, 20))
         p.drawPath(scoop)
 
         # Center line
-        p.setPen(QPen(QColor(DIM), 0.5, Qt.DotLine))
+        p.setPen(pen(DIM, 0.5, Qt.DotLine))
         p.drawLine(int(cx + cw * 0.5), int(cy + ch * 0.02),
                    int(cx + cw * 0.5), int(cy + ch * 0.96))
 
@@ -438,13 +446,13 @@ class _TorqueSilhouette(QWidget):
             p.drawRoundedRect(rect, 3, 3)
 
             # Wheel label
-            p.setFont(QFont("Helvetica", 7, QFont.Bold))
-            p.setPen(QPen(QColor(GRAY)))
+            p.setFont(font(7, bold=True))
+            p.setPen(pen(GRAY))
             p.drawText(rect, Qt.AlignCenter, name)
 
         # LSD lock indicator text below car
         if self._ws_available and not self._stale:
-            p.setFont(QFont("Helvetica", 8, QFont.Bold))
+            p.setFont(font(8, bold=True))
             lock_label = f"LSD {lsd_lock * 100:.0f}%"
             lsd_color = QColor(CYAN) if lsd_lock > 0.7 else QColor(GREEN) if lsd_lock > 0.3 else QColor(YELLOW)
             p.setPen(QPen(lsd_color))
@@ -881,6 +889,7 @@ class DiffModeWidget(QWidget):
         self._bridge: Optional[DiffStateBridge] = None
         self._last_state = DiffState()
         self._mark_flash_until = 0.0
+        self._active = True
 
         self._build_ui()
         self._ensure_log_dir()
@@ -893,7 +902,36 @@ class DiffModeWidget(QWidget):
     def set_bridge(self, bridge: DiffStateBridge) -> None:
         """Connect to a DiffStateBridge for live data."""
         self._bridge = bridge
-        self._refresh_timer.start()
+        if self._active:
+            self._refresh_timer.start()
+
+    def activate(self) -> None:
+        """Resume 20 Hz bridge polling (see ui.screen_lifecycle)."""
+        self._active = True
+        if self._bridge is not None:
+            self._refresh_timer.start()
+
+    def deactivate(self) -> None:
+        """Stop polling the bridge while hidden."""
+        self._active = False
+        self._refresh_timer.stop()
+
+    def catch_up(self, frames: list[tuple[float, DiffState]]) -> None:
+        """Backfill the sparklines with frames missed while hidden.
+
+        The newest frame is left to the next _refresh(), which pushes it.
+        """
+        for _t, state in frames[:-1]:
+            self._push_samples(state)
+        if self._bridge is not None:
+            self._refresh()
+
+    def _push_samples(self, state: DiffState) -> None:
+        self._bottom.spark_lock.push(state.dccd_command_pct)
+        self._bottom.spark_slip.push(
+            state.slip_delta if state.slip_delta is not None else 0.0,
+        )
+        self._bottom.spark_throttle.push(state.throttle_pct)
 
     def _build_ui(self) -> None:
         root = QVBoxLayout(self)
@@ -998,11 +1036,7 @@ class DiffModeWidget(QWidget):
         )
 
         # Sparklines — push new sample each tick
-        self._bottom.spark_lock.push(state.dccd_command_pct)
-        self._bottom.spark_slip.push(
-            state.slip_delta if state.slip_delta is not None else 0.0,
-        )
-        self._bottom.spark_throttle.push(state.throttle_pct)
+        self._push_samples(state)
 
         # Trigger repaint on sparklines
         self._bottom.spark_lock.update()
@@ -6,6 +6,11 @@ envelope, fading trail, color-coded dot, and understeer/oversteer tint.
 Used by Sport and Sport Sharp screens. Follows the same module-level
 paint function pattern as road_condition.py.
 
+The envelope, reference rings, crosshair and axis labels never change for
+a given center/radius, so they are painted once into a StaticLayer per
+geometry and blitted; only the tint, trail, dot and magnitude are drawn
+per frame.
+
 Design principles:
   - Friction ELLIPSE (not circle): 1.0g lateral, 1.2g brake, 0.7g accel
   - Trail dots fade alpha over 0.5-1.0 seconds
@@ -17,13 +22,13 @@ Design principles:
 from __future__ import annotations
 
 import math
-from collections import deque
+from typing import Sequence
 
 from PySide6.QtCore import Qt, QRectF, QPointF
-from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPainterPath
+from PySide6.QtGui import QColor, QPainter, QPainterPath
 
+from ui.layers import StaticLayer
 from ui.theme import (
-    BG_DARK,
     WHITE,
     GRAY,
     DIM,
@@ -31,6 +36,9 @@ from ui.theme import (
     YELLOW,
     RED,
     CYAN,
+    color,
+    font,
+    pen,
 )
 
 # Asymmetric grip envelope (g)
@@ -52,7 +60,7 @@ def paint_g_ellipse(
     cy: float,
     radius: float,
     snap,
-    trail: deque,
+    trail: Sequence[tuple[float, float]],
     balance_ratio: float = 1.0,
     max_trail_dots: int = 20,
     accent_color: str = CYAN,
@@ -64,7 +72,8 @@ def paint_g_ellipse(
         cx, cy: Center of the ellipse in widget coords
         radius: Radius in pixels for the 1.0g lateral reference
         snap: DiffState snapshot (or None)
-        trail: deque of (lat_g, lon_g) tuples — owned by caller
+        trail: (lat_g, lon_g) tuples, oldest first — owned by caller
+               (e.g. TimedTrail.resample())
         balance_ratio: From BalanceAnalyzer (1.0 = neutral)
         max_trail_dots: How many trail dots to paint (0 = none)
         accent_color: Hex color for trail dots
@@ -78,23 +87,8 @@ def paint_g_ellipse(
     # --- Background: understeer/oversteer tint ---
     _paint_balance_tint(p, cx, cy, radius, balance_ratio)
 
-    # --- Envelope (90% capability) ---
-    _paint_envelope(p, cx, cy, radius)
-
-    # --- Concentric reference rings ---
-    _paint_rings(p, cx, cy, radius)
-
-    # --- Crosshair ---
-    p.setPen(QPen(QColor(DIM), 1, Qt.PenStyle.DotLine))
-    p.drawLine(QPointF(cx - radius, cy), QPointF(cx + radius, cy))
-    p.drawLine(QPointF(cx, cy - radius), QPointF(cx, cy + radius))
-
-    # --- Axis labels ---
-    p.setFont(QFont("Helvetica", 9, QFont.Weight.Bold))
-    p.setPen(QPen(QColor(GRAY)))
-    p.drawText(QRectF(cx - 20, cy - radius - 16, 40, 14), Qt.AlignCenter, "BRAKE")
-    p.drawText(QRectF(cx - radius - 14, cy - 7, 14, 14), Qt.AlignCenter, "L")
-    p.drawText(QRectF(cx + radius + 2, cy - 7, 14, 14), Qt.AlignCenter, "R")
+    # --- Envelope, rings, crosshair, axis labels (cached) ---
+    _chrome_layer(cx, cy, radius).draw(p)
 
     # --- Trail dots ---
     trail_len = len(trail)
@@ -104,11 +98,9 @@ def paint_g_ellipse(
             lat_g, lon_g = trail[i]
             progress = (i - start) / max(1, trail_len - 1 - start)
             alpha = int(30 + 180 * progress)
-            dot_color = QColor(accent_color)
-            dot_color.setAlpha(alpha)
             px, py = _g_to_pixel(lat_g, lon_g, cx, cy, radius)
             p.setPen(Qt.PenStyle.NoPen)
-            p.setBrush(dot_color)
+            p.setBrush(color(accent_color, alpha))
             p.drawEllipse(QPointF(px, py), 2, 2)
 
     # --- Current dot ---
@@ -129,14 +121,53 @@ def paint_g_ellipse(
     # --- G magnitude text ---
     g_mag = math.sqrt(lat_g ** 2 + lon_g ** 2)
     font_size = 18 if radius >= 100 else 14
-    p.setFont(QFont("Helvetica", font_size, QFont.Weight.Bold))
-    p.setPen(QPen(QColor(WHITE)))
+    p.setFont(font(font_size, bold=True))
+    p.setPen(pen(WHITE))
     p.drawText(
         QRectF(cx - 50, cy + radius + 4, 100, 24),
         Qt.AlignCenter, f"{g_mag:.2f}g",
     )
 
 
+# One cached chrome layer per (cx, cy, radius) — a handful per process
+_CHROME_LAYERS: dict[tuple[float, float, float], StaticLayer] = {}
+
+
+def _chrome_layer(cx: float, cy: float, radius: float) -> StaticLayer:
+    key = (cx, cy, radius)
+    layer = _CHROME_LAYERS.get(key)
+    if layer is None:
+        margin = 20  # Axis labels sit just outside the crosshair
+        layer = StaticLayer(
+            lambda lp: _paint_chrome(lp, cx, cy, radius),
+            rect=QRectF(cx - radius - margin, cy - radius - margin,
+                        2 * (radius + margin), 2 * (radius + margin)),
+        )
+        _CHROME_LAYERS[key] = layer
+    return layer
+
+
+def _paint_chrome(p: QPainter, cx: float, cy: float, radius: float) -> None:
+    """Static parts of the ellipse: envelope, rings, crosshair, axis labels."""
+    # --- Envelope (90% capability) ---
+    _paint_envelope(p, cx, cy, radius)
+
+    # --- Concentric reference rings ---
+    _paint_rings(p, cx, cy, radius)
+
+    # --- Crosshair ---
+    p.setPen(pen(DIM, 1, Qt.PenStyle.DotLine))
+    p.drawLine(QPointF(cx - radius, cy), QPointF(cx + radius, cy))
+    p.drawLine(QPointF(cx, cy - radius), QPointF(cx, cy + radius))
+
+    # --- Axis labels ---
+    p.setFont(font(9, bold=True))
+    p.setPen(pen(GRAY))
+    p.drawText(QRectF(cx - 20, cy - radius - 16, 40, 14), Qt.AlignCenter, "BRAKE")
+    p.drawText(QRectF(cx - radius - 14, cy - 7, 14, 14), Qt.AlignCenter, "L")
+    p.drawText(QRectF(cx + radius + 2, cy - 7, 14, 14), Qt.AlignCenter, "R")
+
+
 def _paint_envelope(p: QPainter, cx: float, cy: float, radius: float) -> None:
     """Paint the 90% friction ellipse envelope — barely visible."""
     # Build elliptical path (asymmetric top/bottom)
@@ -166,23 +197,19 @@ def _paint_envelope(p: QPainter, cx: float, cy: float, radius: float) -> None:
     path.closeSubpath()
 
     # Fill
-    fill = QColor(CYAN)
-    fill.setAlpha(12)
     p.setPen(Qt.PenStyle.NoPen)
-    p.setBrush(fill)
+    p.setBrush(color(CYAN, 12))
     p.drawPath(path)
 
     # Border
-    border = QColor(CYAN)
-    border.setAlpha(30)
-    p.setPen(QPen(border, 1))
+    p.setPen(pen(CYAN, 1, alpha=30))
     p.setBrush(Qt.BrushStyle.NoBrush)
     p.drawPath(path)
 
 
 def _paint_rings(p: QPainter, cx: float, cy: float, radius: float) -> None:
     """Concentric reference rings at 0.5g and 1.0g."""
-    p.setPen(QPen(QColor(DIM), 1))
+    p.setPen(pen(DIM, 1))
     p.setBrush(Qt.BrushStyle.NoBrush)
 
     # 0.5g ring
@@ -194,8 +221,8 @@ def _paint_rings(p: QPainter, cx: float, cy: float, radius: float) -> None:
     p.drawEllipse(QPointF(cx, cy), r10, r10)
 
     # Ring labels
-    p.setFont(QFont("Helvetica", 7))
-    p.setPen(QPen(QColor(GRAY)))
+    p.setFont(font(7))
+    p.setPen(pen(GRAY))
     p.drawText(QRectF(cx + r05 + 2, cy - 10, 24, 12), Qt.AlignLeft, "0.5g")
     p.drawText(QRectF(cx + r10 + 2, cy - 10, 24, 12), Qt.AlignLeft, "1.0g")
 
@@ -276,7 +303,7 @@ def _g_pct_of_envelope(lat_g: float, lon_g: float) -> float:
 def _dot_color(g_pct: float) -> QColor:
     """Green / yellow / red based on G percentage of envelope."""
     if g_pct < _GREEN_PCT:
-        return QColor(GREEN)
+        return color(GREEN)
     if g_pct < _YELLOW_PCT:
-        return QColor(YELLOW)
-    return QColor(RED)
+        return color(YELLOW)
+    return color(RED)
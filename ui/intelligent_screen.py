@@ -8,7 +8,7 @@ Color accent: MODE_I_ACCENT (#00AAFF) blue.
 
 Layout:
   y=0..114    Weather card — compact temp, humidity, pressure.
-  y=118..310  FLIR road surface — live IR image (inferno colormap).
+  y=118..310  FLIR road surface — live IR image (shared ThermalDisplay).
   y=316..455  Status strip — surface/slip/DCCD row + ABS/spread/VDC row.
 """
 
@@ -16,12 +16,10 @@ from __future__ import annotations
 
 from collections import deque
 
-import numpy as np
 from PySide6.QtCore import Qt, QRectF, QPointF
 from PySide6.QtGui import (
     QColor,
     QFont,
-    QImage,
     QPainter,
     QPen,
 )
@@ -37,6 +35,9 @@ from ui.road_condition import (
     worst_state_label,
 )
 from ui.g_force_ellipse import paint_g_ellipse
+from ui.layers import StaticLayer
+from ui.screen_lifecycle import TimerGroup
+from ui.thermal_display import ThermalDisplay
 from ui.theme import (
     BG_DARK,
     BG_PANEL,
@@ -50,6 +51,9 @@ from ui.theme import (
     CYAN,
     CHROME_DARK,
     MODE_I_ACCENT,
+    color,
+    font,
+    pen,
 )
 
 # ---------------------------------------------------------------------------
@@ -102,10 +106,7 @@ _H = 480
 # ---------------------------------------------------------------------------
 
 def _font(size: int, bold: bool = False) -> QFont:
-    f = QFont("Helvetica", size)
-    if bold:
-        f.setWeight(QFont.Bold)
-    return f
+    return font(size, bold)
 
 
 # ---------------------------------------------------------------------------
@@ -203,12 +204,10 @@ class IntelligentScreenWidget(QWidget):
       - Status strip (DCCD bar + surface badge + slip delta)
     """
 
-    def __init__(self, flir_reader=None, parent: QWidget | None = None) -> None:
+    def __init__(self, thermal: ThermalDisplay | None = None, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._snap: DiffState | None = None
-        self._cached_ir_image: QImage | None = None
-        self._prev_frame: np.ndarray | None = None  # temporal smoothing
-        self._frame_skip: int = 0  # process every 3rd frame (~3 Hz)
+        self._thermal = thermal  # shared FLIR image, rendered on first paint
 
         # Tell Qt we paint our entire rect every frame (compositorless X11)
         self.setAttribute(Qt.WA_OpaquePaintEvent)
@@ -227,6 +226,9 @@ class IntelligentScreenWidget(QWidget):
         # Alert banner rotation index (cycles every 20s when multiple alerts)
         self._alert_index: int = 0
 
+        # Weather card background + headings — painted once, blitted per frame
+        self._weather_card = StaticLayer(self._paint_weather_card, rect=self._CARD_RECT)
+
         # Force periodic repaint even without data (1 Hz)
         from PySide6.QtCore import QTimer
         self._repaint_timer = QTimer(self)
@@ -240,8 +242,12 @@ class IntelligentScreenWidget(QWidget):
         self._alert_rotate_timer.timeout.connect(self._rotate_alert)
         self._alert_rotate_timer.start()
 
-        if flir_reader is not None:
-            flir_reader.frame_updated.connect(self._on_frame_updated)
+        # Hidden: timers suspended, thermal frames ignored (never rendered)
+        self._timers = TimerGroup(self._repaint_timer, self._alert_rotate_timer)
+        self._active = True
+
+        if thermal is not None:
+            thermal.frame_ready.connect(self._on_thermal_frame)
 
     # ------------------------------------------------------------------
     # Public API
@@ -265,48 +271,26 @@ class IntelligentScreenWidget(QWidget):
         """Update coaching level from ModeManager (K5 button)."""
         self._coaching_level = level
 
+    def activate(self) -> None:
+        """Screen shown: resume timers; the next paint shows the newest thermal frame."""
+        self._active = True
+        self._timers.resume()
+        self.update()
+
+    def deactivate(self) -> None:
+        """Screen hidden: stop repaint/rotation timers and thermal processing."""
+        self._active = False
+        self._timers.suspend()
+
     def _rotate_alert(self) -> None:
         """Advance alert banner index every 20s."""
         self._alert_index += 1
         self.update()
 
-    def _on_frame_updated(self, frame) -> None:
-        """Receive raw uint16 thermal frame — enhance contrast, colormap, cache.
-
-        No frame skipping — process every frame at native 9Hz for responsive
-        road condition detection. Light temporal smoothing (90/10) for noise
-        reduction without perceptible lag.
-        """
-        f32 = frame.astype(np.float32)
-
-        # Light temporal smoothing: 90% new + 10% previous — noise only, no lag
-        if self._prev_frame is not None and self._prev_frame.shape == f32.shape:
-            f32 = 0.9 * f32 + 0.1 * self._prev_frame
-        self._prev_frame = f32
-
-        # Normalize to uint8
-        mn, mx = float(f32.min()), float(f32.max())
-        if mx == mn:
-            norm = np.zeros(f32.shape, dtype=np.uint8)
-        else:
-            norm = ((f32 - mn) / (mx - mn) * 255.0).astype(np.uint8)
-
-        # CLAHE — adaptive histogram equalization for thermal contrast
-        # Reuse cached CLAHE object (cv2.createCLAHE is cheap but no need to recreate)
-        try:
-            if not hasattr(self, '_clahe'):
-                import cv2
-                self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(4, 4))
-            norm = self._clahe.apply(norm)
-        except (ImportError, AttributeError):
-            pass
-
-        rgb = self._INFERNO_LUT[norm]  # single LUT index — fast
-        h, w = rgb.shape[:2]
-        self._cached_ir_image = QImage(
-            rgb.tobytes(), w, h, w * 3, QImage.Format_RGB888
-        )
-        self.update()
+    def _on_thermal_frame(self) -> None:
+        """New FLIR frame available — repaint if on screen (rendered lazily)."""
+        if self._active:
+            self.update()
 
     # ------------------------------------------------------------------
     # Paint
@@ -342,81 +326,87 @@ class IntelligentScreenWidget(QWidget):
     # BIG temperature, humidity, pressure.  Full width.
     # ==================================================================
 
-    def _draw_weather(self, p: QPainter) -> None:
-        snap = self._snap
-        available = snap is not None and snap.ambient_available
+    # Card geometry — 4-column layout: WEATHER | ROAD | HUMIDITY | PRESSURE
+    _CARD_RECT = QRectF(6, 4, _W - 12, 108)
+    _COL_W = (_W - 40) / 4.0  # ~190px each
+    _COLS = (20, 20 + _COL_W, 20 + _COL_W * 2, 20 + _COL_W * 3)
+    _PRS_RIGHT = _W - 20  # right edge with margin
 
-        # Card background (compact)
-        p.setPen(Qt.NoPen)
-        p.setBrush(QColor(BG_ACCENT))
-        p.drawRoundedRect(QRectF(6, 4, _W - 12, 108), 6, 6)
+    def _paint_weather_card(self, p: QPainter) -> None:
+        """Card background and static headings/captions (cached layer)."""
+        col_w, cols, prs_right = self._COL_W, self._COLS, self._PRS_RIGHT
 
-        # 4-column layout: WEATHER | ROAD | HUMIDITY | PRESSURE
-        col_w = (_W - 40) / 4.0  # ~190px each
-        cols = [20, 20 + col_w, 20 + col_w * 2, 20 + col_w * 3]
+        p.setPen(Qt.NoPen)
+        p.setBrush(color(BG_ACCENT))
+        p.drawRoundedRect(self._CARD_RECT, 6, 6)
 
-        # --- Col 1: WEATHER (ambient temp) ---
+        # Headings
         p.setFont(_font(10, bold=True))
-        p.setPen(QPen(QColor(MODE_I_ACCENT)))
+        p.setPen(pen(MODE_I_ACCENT))
         p.drawText(QRectF(cols[0], 6, col_w, 16),
                    Qt.AlignLeft | Qt.AlignVCenter, "WEATHER")
+        p.drawText(QRectF(cols[1], 6, col_w, 16),
+                   Qt.AlignLeft | Qt.AlignVCenter, "ROAD")
+        p.setPen(pen(GRAY))
+        p.drawText(QRectF(cols[2], 6, col_w, 16),
+                   Qt.AlignLeft | Qt.AlignVCenter, "HUMIDITY")
+        p.drawText(QRectF(cols[3], 6, prs_right - cols[3], 16),
+                   Qt.AlignRight | Qt.AlignVCenter, "BARO")
+
+        # Captions
+        p.setFont(_font(10))
+        p.drawText(QRectF(cols[0], 82, col_w, 16),
+                   Qt.AlignLeft | Qt.AlignVCenter, "AIR TEMP")
+        p.drawText(QRectF(cols[1], 82, col_w, 16),
+                   Qt.AlignLeft | Qt.AlignVCenter, "ROAD SURFACE")
+        p.drawText(QRectF(cols[2], 82, col_w, 16),
+                   Qt.AlignLeft | Qt.AlignVCenter, "RELATIVE")
+        p.drawText(QRectF(cols[3], 82, prs_right - cols[3], 16),
+                   Qt.AlignRight | Qt.AlignVCenter, "hPa")
+
+    def _draw_weather(self, p: QPainter) -> None:
+        snap = self._snap
+        available = snap is not None and snap.ambient_available
+        col_w, cols, prs_right = self._COL_W, self._COLS, self._PRS_RIGHT
+
+        # Card background + headings (cached)
+        self._weather_card.draw(p)
 
+        # --- Col 1: WEATHER (ambient temp) ---
         if available:
             temp_text = f"{snap.ambient_temp_c:.1f}\u00b0"
-            temp_color = QColor(WHITE)
+            temp_color = color(WHITE)
         else:
             temp_text = "---"
-            temp_color = QColor(GRAY)
+            temp_color = color(GRAY)
 
         p.setFont(_font(38, bold=True))
-        p.setPen(QPen(temp_color))
+        p.setPen(temp_color)
         p.drawText(QRectF(cols[0], 24, col_w, 56),
                    Qt.AlignLeft | Qt.AlignVCenter, temp_text)
 
-        p.setFont(_font(10))
-        p.setPen(QPen(QColor(GRAY)))
-        p.drawText(QRectF(cols[0], 82, col_w, 16),
-                   Qt.AlignLeft | Qt.AlignVCenter, "AIR TEMP")
-
         # --- Col 2: ROAD (FLIR surface temp) ---
-        p.setFont(_font(10, bold=True))
-        p.setPen(QPen(QColor(MODE_I_ACCENT)))
-        p.drawText(QRectF(cols[1], 6, col_w, 16),
-                   Qt.AlignLeft | Qt.AlignVCenter, "ROAD")
-
         if snap is not None and not snap.is_road_surface_stale():
             road_avg = (snap.road_temp_left + snap.road_temp_center + snap.road_temp_right) / 3.0
             road_text = f"{road_avg:.1f}\u00b0"
             road_color = _brake_heat_color(road_avg)
         else:
             road_text = "---"
-            road_color = QColor(GRAY)
+            road_color = color(GRAY)
 
-        p.setFont(_font(38, bold=True))
-        p.setPen(QPen(road_color))
+        p.setPen(road_color)
         p.drawText(QRectF(cols[1], 24, col_w, 56),
                    Qt.AlignLeft | Qt.AlignVCenter, road_text)
 
-        p.setFont(_font(10))
-        p.setPen(QPen(QColor(GRAY)))
-        p.drawText(QRectF(cols[1], 82, col_w, 16),
-                   Qt.AlignLeft | Qt.AlignVCenter, "ROAD SURFACE")
-
         # --- Col 3: HUMIDITY ---
-        p.setFont(_font(10, bold=True))
-        p.setPen(QPen(QColor(GRAY)))
-        p.drawText(QRectF(cols[2], 6, col_w, 16),
-                   Qt.AlignLeft | Qt.AlignVCenter, "HUMIDITY")
-
         if available:
             hum_text = f"{snap.ambient_humidity_pct:.0f}%"
-            hum_color = QColor(WHITE)
+            hum_color = color(WHITE)
         else:
             hum_text = "---"
-            hum_color = QColor(GRAY)
+            hum_color = color(GRAY)
 
-        p.setFont(_font(38, bold=True))
-        p.setPen(QPen(hum_color))
+        p.setPen(hum_color)
         p.drawText(QRectF(cols[2], 24, col_w, 56),
                    Qt.AlignLeft | Qt.AlignVCenter, hum_text)
 
@@ -427,35 +417,24 @@ class IntelligentScreenWidget(QWidget):
             _draw_trend_arrow_large(p, cols[2] + hum_tw + 6, 24, 56,
                                     snap.humidity_trend_pct_hr, threshold=2.0)
 
-        p.setFont(_font(10))
-        p.setPen(QPen(QColor(GRAY)))
-        p.drawText(QRectF(cols[2], 82, col_w, 16),
-                   Qt.AlignLeft | Qt.AlignVCenter, "RELATIVE")
-
         # --- Col 4: PRESSURE (right-aligned) ---
-        prs_right = _W - 20  # right edge with margin
-        p.setFont(_font(10, bold=True))
-        p.setPen(QPen(QColor(GRAY)))
-        p.drawText(QRectF(cols[3], 6, prs_right - cols[3], 16),
-                   Qt.AlignRight | Qt.AlignVCenter, "BARO")
-
         if available:
             prs_text = f"{snap.ambient_pressure_hpa:.0f}"
-            prs_color = QColor(WHITE)
+            prs_color = color(WHITE)
             # Color baro value by threat level
             threat = snap.weather_threat_level
             if threat == "STORM":
-                prs_color = QColor(RED)
+                prs_color = color(RED)
             elif threat == "RAIN_LIKELY":
-                prs_color = QColor(YELLOW)
+                prs_color = color(YELLOW)
             elif threat == "CHANGING":
-                prs_color = QColor(MODE_I_ACCENT)
+                prs_color = color(MODE_I_ACCENT)
         else:
             prs_text = "---"
-            prs_color = QColor(GRAY)
+            prs_color = color(GRAY)
 
         p.setFont(_font(38, bold=True))
-        p.setPen(QPen(prs_color))
+        p.setPen(prs_color)
         # Shift text left to leave room for arrow on the right
         prs_fm = p.fontMetrics()
         prs_tw = prs_fm.horizontalAdvance(prs_text)
@@ -468,11 +447,6 @@ class IntelligentScreenWidget(QWidget):
             _draw_trend_arrow_large(p, prs_text_x + prs_tw + 6, 24, 56,
                                     snap.pressure_trend_hpa_hr, threshold=0.5)
 
-        p.setFont(_font(10))
-        p.setPen(QPen(QColor(GRAY)))
-        p.drawText(QRectF(cols[3], 82, prs_right - cols[3], 16),
-                   Qt.AlignRight | Qt.AlignVCenter, "hPa")
-
         # Weather threat text removed — consolidated into rotating FLIR banner.
 
         # EC regional alert banner — drawn after FLIR so it overlays the thermal image.
@@ -497,17 +471,6 @@ class IntelligentScreenWidget(QWidget):
     # Forward-facing FLIR (grill-mounted) — road surface temp + warm-up.
     # ==================================================================
 
-    # ---------------------------------------------------------------------------
-    # Inferno colormap — precomputed 256-entry LUT (no per-frame np.interp)
-    # 0 → black, 64 → deep purple, 128 → orange, 192 → yellow, 255 → white
-    # ---------------------------------------------------------------------------
-    _INFERNO_LUT = np.zeros((256, 3), dtype=np.uint8)
-    _stops = np.array([[0,0,0],[59,7,100],[249,115,22],[253,224,71],[255,255,255]], dtype=np.float32)
-    _keys = np.array([0, 64, 128, 192, 255], dtype=np.float32)
-    for _ch in range(3):
-        _INFERNO_LUT[:, _ch] = np.interp(np.arange(256), _keys, _stops[:, _ch]).astype(np.uint8)
-    del _stops, _keys, _ch
-
     def _draw_flir_panel(self, p: QPainter) -> None:
         y0 = 118
         panel_h = 192  # y=118..310
@@ -515,9 +478,10 @@ class IntelligentScreenWidget(QWidget):
         # Warm-up badge (top-right, always shown)
         self._draw_warmup_badge(p, y0)
 
-        if self._cached_ir_image is not None:
-            # Blit cached QImage (colormap applied in _on_frame_updated)
-            p.drawImage(QRectF(0, y0, _W, panel_h), self._cached_ir_image)
+        ir_image = self._thermal.image() if self._thermal is not None else None
+        if ir_image is not None:
+            # Shared zero-copy QImage (colormap applied in ThermalDisplay)
+            p.drawImage(QRectF(0, y0, _W, panel_h), ir_image)
 
             pass  # clean thermal image — no label overlay
         else:
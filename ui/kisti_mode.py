@@ -21,6 +21,7 @@ import logging
 
 from data.models import RadarBand, AlertDirection
 from ui.theme import BG_DARK, BG_PANEL, HIGHLIGHT, GRAY, WHITE, CHROME_DARK, DIM
+from ui.screen_lifecycle import TimerGroup
 
 klog = logging.getLogger("kisti.ui.kisti_mode")
 
@@ -644,6 +645,10 @@ class KistiModeWidget(QWidget):
         self._boot_timer.timeout.connect(self._on_boot_ready)
         self._boot_timer.start()
 
+        # Animation-only timers, suspended while hidden. The typewriter, say-file,
+        # USB and envelope timers sequence the voice pipeline and keep running.
+        self._anim_timers = TimerGroup(self._waveform._timer, self._scan_bar._timer)
+
         # Start Piper warm-up immediately (runs in parallel with UI load)
         if self._audio_player and self._audio_player.is_available:
             import threading
@@ -657,6 +662,14 @@ class KistiModeWidget(QWidget):
         """Set the DiffStateBridge for ambient data access."""
         self._bridge = bridge
 
+    def activate(self):
+        """Resume waveform and scan bar animation (see ui.screen_lifecycle)."""
+        self._anim_timers.resume()
+
+    def deactivate(self):
+        """Pause animation while hidden; speech keeps playing."""
+        self._anim_timers.suspend()
+
     def _queue_lines(self, lines, urgency: str = "normal"):
         """Queue a list of lines to be spoken sequentially."""
         for line in lines:
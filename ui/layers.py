@@ -0,0 +1,110 @@
+"""KiSTI - Static Layer Cache
+
+QPainter screens redraw everything on every frame, but much of it never
+changes between frames: car silhouettes, gauge bezels, ellipse rings,
+card backgrounds, section labels, track outlines. A StaticLayer paints
+that content once into a pixmap and blits it on later frames:
+
+    self._chrome = StaticLayer(self._paint_chrome)       # full widget
+    ...
+    def paintEvent(self, event):
+        p = QPainter(self)
+        self._chrome.draw(p)                              # cached blit
+        ...dynamic content on top...
+
+The paint callback draws in the widget's own coordinates; pass rect= to
+cache only a region. Pixmaps are rendered at the device pixel ratio of
+the target, and are rebuilt when the target size, pixel ratio, theme
+generation (ui.theme.theme_changed) or the caller's key changes.
+
+Layers only help when their content sits above or below the dynamic
+content as a whole — split a widget into background / overlay layers
+rather than reordering what it paints.
+
+KISTI_UI_LAYER_CACHE=0 (or set_layer_cache_enabled(False)) paints the
+callbacks directly every frame, which is what scripts/ui_paint_benchmark.py
+compares against.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Callable, Hashable, Optional
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QPainter, QPixmap
+
+from ui.theme import theme_generation
+
+_enabled = os.environ.get("KISTI_UI_LAYER_CACHE", "1") != "0"
+
+
+def layer_cache_enabled() -> bool:
+    return _enabled
+
+
+def set_layer_cache_enabled(enabled: bool) -> None:
+    """Toggle pixmap caching for every StaticLayer (benchmarks, debugging)."""
+    global _enabled
+    _enabled = enabled
+
+
+class StaticLayer:
+    """Content painted once into a pixmap and blitted every frame.
+
+    Args:
+        paint: callback(painter) drawing the layer in target coordinates.
+        rect: region to cache (target coordinates); None = whole target.
+
+    The pixmap starts transparent, so a layer can sit over dynamic content
+    as well as under it.
+    """
+
+    def __init__(
+        self,
+        paint: Callable[[QPainter], None],
+        rect: Optional[QRectF] = None,
+    ) -> None:
+        self._paint = paint
+        self._rect = rect
+        self._pixmap: Optional[QPixmap] = None
+        self._state: tuple = ()
+        self.builds = 0                 # Times the pixmap was (re)rendered
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next draw (content inputs changed)."""
+        self._pixmap = None
+
+    def draw(self, p: QPainter, key: Hashable = None) -> None:
+        """Blit the layer, rebuilding it first if anything it depends on moved.
+
+        key: extra caller state the content depends on (e.g. a label that
+        changes rarely); a new key rebuilds the pixmap.
+        """
+        device = p.device()
+        rect = self._rect if self._rect is not None else QRectF(0, 0, device.width(), device.height())
+        if not _enabled:
+            p.save()
+            self._paint(p)
+            p.restore()
+            return
+
+        dpr = device.devicePixelRatioF()
+        state = (rect.x(), rect.y(), rect.width(), rect.height(), dpr, theme_generation(), key)
+        if self._pixmap is None or state != self._state:
+            self._pixmap = self._render(rect, dpr)
+            self._state = state
+        p.drawPixmap(rect.topLeft(), self._pixmap)
+
+    def _render(self, rect: QRectF, dpr: float) -> QPixmap:
+        pixmap = QPixmap(max(1, round(rect.width() * dpr)), max(1, round(rect.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        lp = QPainter(pixmap)
+        lp.setRenderHint(QPainter.RenderHint.Antialiasing)
+        lp.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        lp.translate(-rect.x(), -rect.y())
+        self._paint(lp)
+        lp.end()
+        self.builds += 1
+        return pixmap
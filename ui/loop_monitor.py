@@ -0,0 +1,293 @@
+"""KiSTI - Main-Thread Loop Monitor
+
+The Qt main thread hosts the mock CAN generator, AlertEngine, PatternEngine
+SQL, the coaching / condition timers, the telemetry flush and all painting.
+LoopMonitor shows whether it keeps up, and when it doesn't, who is to blame:
+
+  - event-loop lag: a PreciseTimer probe at the render cadence records
+    actual-minus-scheduled firing time; a probe a whole frame late is a
+    dropped frame
+  - per-subsystem time: watch() times every QTimer timeout (timers of a
+    subsystem object, or a bare QTimer) and every widget paint through an
+    event filter that delivers the event itself; wrap() / rewire() time
+    plain signal slots such as DiffStateBridge.state_changed consumers
+  - attribution: nested measurements (state_changed consumers run inside
+    the mock generator's timer) count as self time only, and main-thread
+    busy time nobody claimed is reported as "other"
+
+Each dropped frame becomes a DroppedFrame naming the subsystem with the
+most self time since the previous probe. Drops go to the kisti.ui.loop log
+(rate limited, plus a periodic summary); KISTI_LOOP_LOG=/path adds a
+rotating file. LoopMonitorOverlay (ui/widgets/loop_monitor_overlay.py)
+draws the live view.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from logging.handlers import RotatingFileHandler
+from typing import Callable, Iterable, Optional
+
+from PySide6.QtCore import QAbstractEventDispatcher, QEvent, QObject, Qt, QTimer, Signal
+from PySide6.QtWidgets import QWidget
+
+from ui.render_clock import DEFAULT_RENDER_FPS, FrameTimeHistogram
+
+log = logging.getLogger("kisti.ui.loop")
+
+OTHER = "other"              # Busy main-thread time no watched subsystem claimed
+DROP_HISTORY = 20
+DROP_LOG_INTERVAL_S = 1.0    # At most one drop line per second (rest counted)
+SUMMARY_INTERVAL_S = 60.0
+LOG_FILE_BYTES = 1_000_000
+LOG_FILE_BACKUPS = 3
+
+
+@dataclass
+class DroppedFrame:
+    """A probe that fired at least one whole frame late."""
+    t: float                          # Monotonic time of the late probe
+    lag_ms: float                     # How late it fired
+    frames: int                       # Whole frames missed
+    culprit: str                      # Subsystem with the most self time in the window
+    culprit_ms: float
+    breakdown: dict[str, float] = field(default_factory=dict)  # Top subsystems, ms
+
+    def describe(self) -> str:
+        rest = ", ".join(f"{name} {ms:.1f}" for name, ms in self.breakdown.items()
+                         if name != self.culprit)
+        line = f"late {self.lag_ms:.1f}ms ({self.frames} frame{'s' if self.frames > 1 else ''}) — {self.culprit} {self.culprit_ms:.1f}ms"
+        return f"{line} ({rest})" if rest else line
+
+
+class _Delivery(QObject):
+    """Event filter that delivers Timer / Paint events itself, timed."""
+
+    _TIMED = (QEvent.Type.Timer, QEvent.Type.Paint)
+
+    def __init__(self, monitor: "LoopMonitor") -> None:
+        super().__init__(monitor)
+        self._monitor = monitor
+        self.names: dict[int, str] = {}     # id(watched object) → subsystem
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # noqa: N802
+        if event.type() not in self._TIMED:
+            return False
+        name = self.names.get(id(obj))
+        if name is None:
+            return False
+        monitor = self._monitor
+        monitor._enter()
+        try:
+            obj.event(event)
+        finally:
+            monitor._exit(name)
+        return True
+
+
+class LoopMonitor(QObject):
+    """Event-loop lag probe plus per-subsystem main-thread timing.
+
+    Usage:
+        monitor = LoopMonitor(interval_ms=render_clock.interval_ms)
+        monitor.watch("alerts", alert_engine)           # its QTimers
+        monitor.watch("paint.sport", sport_screen)       # its paints
+        bridge.state_changed.connect(monitor.wrap("telemetry", on_state))
+        monitor.start()
+    """
+
+    dropped = Signal(object)    # DroppedFrame
+
+    def __init__(self, interval_ms: float = 1000.0 / DEFAULT_RENDER_FPS,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self.lag = FrameTimeHistogram()
+        self.subsystems: dict[str, FrameTimeHistogram] = {}
+        self.drops: deque[DroppedFrame] = deque(maxlen=DROP_HISTORY)
+        self.dropped_frames = 0
+        self._delivery = _Delivery(self)
+        self._stack: list[float] = []          # Child time accumulated per open measurement
+        self._window: dict[str, float] = {}    # Self time (ms) since the previous probe
+        self._busy_ms = 0.0
+        self._awake_at: Optional[float] = None
+        self._dispatcher: Optional[QAbstractEventDispatcher] = None
+        self._last_probe = 0.0
+        self._last_drop_log = 0.0
+        self._suppressed = 0
+        self._last_summary = 0.0
+        self._probe = QTimer(self)
+        self._probe.setTimerType(Qt.TimerType.PreciseTimer)
+        self._probe.setInterval(max(1, round(interval_ms)))
+        self._probe.timeout.connect(self._on_probe)
+        _attach_log_file(os.environ.get("KISTI_LOOP_LOG", ""))
+
+    # -- instrumentation ------------------------------------------------
+
+    def watch(self, name: str, *objects: QObject) -> None:
+        """Time QTimer timeouts and widget paints under `name`.
+
+        A QTimer or QWidget is watched directly; any other QObject stands for
+        the QTimers it owns (AlertEngine, PatternEngine, MockCanGenerator...).
+        """
+        for obj in objects:
+            targets: Iterable[QObject]
+            if isinstance(obj, (QTimer, QWidget)):
+                targets = (obj,)
+            else:
+                targets = obj.findChildren(QTimer)
+            for target in targets:
+                self._delivery.names[id(target)] = name
+                target.installEventFilter(self._delivery)
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        """fn, timed under `name` (connect the result instead of fn)."""
+        def timed(*args, **kwargs):
+            self._enter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._exit(name)
+        timed.__name__ = getattr(fn, "__name__", name)
+        timed.__wrapped__ = fn
+        return timed
+
+    def rewire(self, signal, slot: Callable, name: str) -> None:
+        """Replace an existing signal → slot connection with a timed one."""
+        signal.disconnect(slot)
+        signal.connect(self.wrap(name, slot))
+
+    def _enter(self) -> None:
+        self._stack.append(0.0)
+        self._stack.append(time.perf_counter())
+
+    def _exit(self, name: str) -> None:
+        total_ms = (time.perf_counter() - self._stack.pop()) * 1000.0
+        child_ms = self._stack.pop()
+        hist = self.subsystems.get(name)
+        if hist is None:
+            hist = self.subsystems[name] = FrameTimeHistogram()
+        hist.record(total_ms)
+        self._window[name] = self._window.get(name, 0.0) + total_ms - child_ms
+        if self._stack:
+            self._stack[-2] += total_ms       # Parent subtracts it from its self time
+
+    # -- lag probe ------------------------------------------------------
+
+    def start(self) -> None:
+        self._dispatcher = QAbstractEventDispatcher.instance()
+        if self._dispatcher is not None:
+            self._dispatcher.awake.connect(self._on_awake)
+            self._dispatcher.aboutToBlock.connect(self._on_block)
+        now = time.monotonic()
+        self._last_probe = now
+        self._last_summary = now
+        self._window.clear()
+        self._busy_ms = 0.0
+        self._probe.start()
+        log.info("Loop monitor: %.1fms probe, %d watched objects",
+                 self.interval_ms, len(self._delivery.names))
+
+    def stop(self) -> None:
+        self._probe.stop()
+        if self._dispatcher is not None:
+            self._dispatcher.awake.disconnect(self._on_awake)
+            self._dispatcher.aboutToBlock.disconnect(self._on_block)
+            self._dispatcher = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._probe.isActive()
+
+    def reset(self) -> None:
+        self.lag.reset()
+        self.subsystems.clear()
+        self.drops.clear()
+        self.dropped_frames = 0
+
+    def _on_awake(self) -> None:
+        self._awake_at = time.perf_counter()
+
+    def _on_block(self) -> None:
+        if self._awake_at is not None:
+            self._busy_ms += (time.perf_counter() - self._awake_at) * 1000.0
+            self._awake_at = None
+
+    def _on_probe(self) -> None:
+        self.record_probe(time.monotonic())
+
+    def record_probe(self, now: float) -> Optional[DroppedFrame]:
+        """Close the window ending at `now`; returns the drop, if it was one."""
+        lag_ms = max(0.0, (now - self._last_probe) * 1000.0 - self.interval_ms)
+        self._last_probe = now
+        self.lag.record(lag_ms)
+
+        window = self._window
+        if self._awake_at is not None:          # Busy right up to this probe
+            self._on_block()
+            self._awake_at = time.perf_counter()
+        other = self._busy_ms - sum(window.values())
+        if other > 0.5:
+            window[OTHER] = window.get(OTHER, 0.0) + other
+        self._busy_ms = 0.0
+
+        drop = None
+        if lag_ms >= self.interval_ms:
+            drop = self._drop(now, lag_ms, window)
+        self._window = {}
+
+        if now - self._last_summary >= SUMMARY_INTERVAL_S:
+            self._last_summary = now
+            log.info("Loop monitor: %s", self.summary())
+        return drop
+
+    def _drop(self, now: float, lag_ms: float, window: dict[str, float]) -> DroppedFrame:
+        ranked = sorted(window.items(), key=lambda kv: kv[1], reverse=True)[:4]
+        culprit, culprit_ms = ranked[0] if ranked else ("unattributed", 0.0)
+        drop = DroppedFrame(
+            t=now, lag_ms=lag_ms, frames=int(lag_ms // self.interval_ms),
+            culprit=culprit, culprit_ms=culprit_ms,
+            breakdown={name: round(ms, 2) for name, ms in ranked},
+        )
+        self.drops.append(drop)
+        self.dropped_frames += drop.frames
+        if now - self._last_drop_log >= DROP_LOG_INTERVAL_S:
+            more = f" (+{self._suppressed} more)" if self._suppressed else ""
+            log.info("Dropped frame: %s%s", drop.describe(), more)
+            self._last_drop_log = now
+            self._suppressed = 0
+        else:
+            self._suppressed += 1
+        self.dropped.emit(drop)
+        return drop
+
+    # -- reporting ------------------------------------------------------
+
+    def top(self, n: int = 6) -> list[tuple[str, FrameTimeHistogram]]:
+        """Subsystems by total main-thread time, largest first."""
+        ranked = sorted(self.subsystems.items(), key=lambda kv: kv[1].sum_ms, reverse=True)
+        return ranked[:n]
+
+    def summary(self) -> str:
+        worst = ", ".join(f"{name} {hist.mean_ms:.2f}/{hist.max_ms:.1f}ms"
+                          for name, hist in self.top(3))
+        return (
+            f"lag {self.lag.mean_ms:.1f}ms mean / {self.lag.max_ms:.1f}ms max, "
+            f"{self.dropped_frames} dropped frames; busiest (mean/max): {worst or 'none'}"
+        )
+
+
+def _attach_log_file(path: str) -> None:
+    """Mirror kisti.ui.loop to a rotating file (once per path)."""
+    if not path:
+        return
+    for handler in log.handlers:
+        if isinstance(handler, RotatingFileHandler) and handler.baseFilename == os.path.abspath(path):
+            return
+    handler = RotatingFileHandler(path, maxBytes=LOG_FILE_BYTES, backupCount=LOG_FILE_BACKUPS)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    log.addHandler(handler)
@@ -28,10 +28,13 @@ from ui.kisti_mode import KistiModeWidget
 from ui.street_mode import StreetModeWidget
 from ui.track_mode import TrackModeWidget
 from ui.diff_mode import DiffModeWidget
+from ui.thermal_display import ThermalDisplay
 from ui.video_mode import VideoModeWidget
 from ui.settings_mode import SettingsModeWidget
+from ui.screen_lifecycle import ScreenRouter
 from ui.splash_screen import SplashScreen
 from ui.widgets.critical_flash_overlay import CriticalFlashOverlay
+from ui.widgets.loop_monitor_overlay import LoopMonitorOverlay
 from can.kisti_can import create_can_source
 
 log = logging.getLogger("kisti.ui.main")
@@ -48,7 +51,8 @@ def _placeholder(text: str) -> QLabel:
 class MainWindow(QMainWindow):
     """800x480 fixed-size main window. SI-Drive selects between 3 screens."""
 
-    def __init__(self, fullscreen=False, bridge=None, mode_manager=None, flir_reader=None):
+    def __init__(self, fullscreen=False, bridge=None, mode_manager=None, flir_reader=None,
+                 loop_monitor=None):
         super().__init__()
         self.setWindowTitle("KiSTI")
         if fullscreen:
@@ -86,27 +90,48 @@ class MainWindow(QMainWindow):
         self._track_mode.hide()
 
         # === 3 SI-Drive screens + S# track variant + VIDEO overlay ===
-        self._intelligent_screen = IntelligentScreenWidget(flir_reader=flir_reader, parent=self)
+        # One thermal image per FLIR frame, shared by Intelligent and VIDEO
+        self._thermal = ThermalDisplay(flir_reader, parent=self)
+        self._intelligent_screen = IntelligentScreenWidget(thermal=self._thermal, parent=self)
         self._sport_screen = SportScreenWidget(self)
         self._sharp_screen = SportSharpScreenWidget(self)
         self._sharp_screen_track = SportSharpTrackScreenWidget(self)
-        self._video_mode = VideoModeWidget(flir_reader=flir_reader, parent=self)
+        self._video_mode = VideoModeWidget(thermal=self._thermal, parent=self)
 
         self._stack.addWidget(self._intelligent_screen)   # index 0: Intelligent
         self._stack.addWidget(self._sport_screen)         # index 1: Sport
         self._stack.addWidget(self._sharp_screen)         # index 2: Sport Sharp (canyon)
         self._stack.addWidget(self._sharp_screen_track)   # index 3: Sport Sharp (track)
         self._stack.addWidget(self._video_mode)           # index 4: VIDEO (thermal + cameras)
+        self._settings_mode = SettingsModeWidget(self)
+        self._stack.addWidget(self._settings_mode)        # index 5: SETTINGS (dev key 6)
 
         self._current_si_drive: int = 0  # Default: Intelligent (real sensors view)
         self._sharp_subpage: int = 0    # 0=canyon (index 2), 1=track (index 3)
         self._stack.setCurrentIndex(0)
 
+        # Only the visible screen is fed and runs timers; hidden ones catch up on activation
+        self._router = ScreenRouter(self._stack, parent=self)
+        for legacy in (self._kisti_mode, self._diff_mode, self._track_mode):
+            self._router.add_background(legacy)
+        self._router.start()
+
         # Critical flash overlay (WARNING/CRITICAL visual feedback in S# mode)
         self._flash_overlay = CriticalFlashOverlay(central)
         self._flash_overlay.setGeometry(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
         self._flash_overlay.raise_()
 
+        # Main-thread timing: per-screen paint cost + toggleable overlay
+        self._loop_overlay = None
+        if loop_monitor is not None:
+            for name, screen in self._screen_names().items():
+                loop_monitor.watch(f"paint.{name}", screen, *screen.findChildren(QWidget))
+            self._loop_overlay = LoopMonitorOverlay(loop_monitor, central)
+            self._loop_overlay.setGeometry(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+            self._settings_mode.enable_loop_overlay_toggle(self._loop_overlay.set_enabled)
+            overlay_key = QShortcut(QKeySequence(Qt.Key_F12), self)
+            overlay_key.activated.connect(self._toggle_loop_overlay)
+
         # Wire mode manager signals if provided
         if self._mode_manager is not None:
             self._mode_manager.si_drive_changed.connect(self._on_si_drive_changed)
@@ -118,8 +143,9 @@ class MainWindow(QMainWindow):
         shortcut = QShortcut(QKeySequence(Qt.Key_F11), self)
         shortcut.activated.connect(self._toggle_fullscreen)
 
-        # 1/2/3/4/5 keys to switch screens (dev/demo use; 4 = S# track, 5 = VIDEO)
-        for key, idx in [(Qt.Key_1, 0), (Qt.Key_2, 1), (Qt.Key_3, 2), (Qt.Key_4, 3), (Qt.Key_5, 4)]:
+        # 1-6 keys to switch screens (dev/demo use; 4 = S# track, 5 = VIDEO, 6 = SETTINGS)
+        for key, idx in [(Qt.Key_1, 0), (Qt.Key_2, 1), (Qt.Key_3, 2), (Qt.Key_4, 3), (Qt.Key_5, 4),
+                         (Qt.Key_6, 5)]:
             sc = QShortcut(QKeySequence(key), self)
             sc.activated.connect(lambda i=idx: self._stack.setCurrentIndex(i))
 
@@ -182,11 +208,37 @@ class MainWindow(QMainWindow):
         if self._current_si_drive == int(SIDriveMode.SPORT_SHARP):
             self._flash_overlay.flash(alert.severity, alert.short_message)
 
-    def update_from_bridge(self, snap) -> None:
-        """Feed DiffState snapshot to the active screen (called at 20Hz)."""
-        widget = self._stack.currentWidget()
-        if hasattr(widget, 'update_state'):
-            widget.update_state(snap)
+    def update_from_bridge(self, snap, now=None) -> None:
+        """Feed DiffState snapshot to the active screen (once per render clock frame)."""
+        self._router.feed(snap, now)
+
+    def push_to_screens(self, method: str, *args, screens=None) -> None:
+        """Latest-wins update (timing, coaching, ...) for every screen with `method`.
+
+        Delivered to the active screen now; hidden screens get the newest
+        value when they're activated. screens restricts the recipients.
+        """
+        self._router.push(method, *args, screens=screens)
+
+    @property
+    def driving_screens(self) -> tuple:
+        """Sport + both Sport Sharp variants (technique coaching recipients)."""
+        return (self._sport_screen, self._sharp_screen, self._sharp_screen_track)
+
+    def _screen_names(self) -> dict:
+        """Stack screens by short name (loop monitor labels)."""
+        return {
+            "intelligent": self._intelligent_screen,
+            "sport": self._sport_screen,
+            "sharp": self._sharp_screen,
+            "sharp_track": self._sharp_screen_track,
+            "video": self._video_mode,
+            "settings": self._settings_mode,
+        }
+
+    def _toggle_loop_overlay(self) -> None:
+        """F12: show/hide the main-thread timing overlay."""
+        self._settings_mode.set_loop_overlay_checked(self._loop_overlay.isHidden())
 
     def _on_data_updated(self, vehicle_state):
         """Route legacy VehicleState data to active screen."""
@@ -0,0 +1,265 @@
+"""KiSTI - Render Clock
+
+Drives every screen from one fixed-cadence clock instead of repainting on
+each decoded CAN frame. The bus mix decides how often DiffStateBridge fires
+state_changed (20-200+ Hz depending on what's connected); the render clock
+decouples that from painting:
+
+  - state_changed only marks the clock dirty (no snapshot, no paint)
+  - each tick takes at most ONE snapshot and emits frame(snap, now)
+  - ticks with no new data since the last frame are skipped
+  - the interval is a whole number of display refresh periods, so 30 fps
+    on a 60 Hz panel paints on every other vblank
+
+UI CPU is then bounded by the frame rate, not by bus load. Widgets that
+show motion over time (G-force trails) keep a TimedTrail — samples stamped
+with monotonic time and resampled at a fixed time step when painted — so a
+trail covers the same seconds at 30 fps, 60 fps or a stalled bus.
+
+Frame cost and tick jitter are recorded in FrameTimeHistograms exposed as
+RenderClock.stats.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import numpy as np
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+
+from ui.widgets.time_series import RingBuffer
+
+log = logging.getLogger("kisti.ui.render_clock")
+
+RENDER_FPS_CHOICES = (30, 60)
+DEFAULT_RENDER_FPS = 30
+
+# Histogram bucket upper edges (ms); last bucket is open-ended
+HISTOGRAM_EDGES_MS = (1.0, 2.0, 4.0, 8.0, 12.0, 16.7, 25.0, 33.3, 50.0, 100.0)
+
+
+def resolve_fps(fps: Optional[int] = None) -> int:
+    """Requested fps (arg → KISTI_UI_FPS → default), snapped to 30 or 60."""
+    if fps is None:
+        try:
+            fps = int(os.environ.get("KISTI_UI_FPS", DEFAULT_RENDER_FPS))
+        except ValueError:
+            fps = DEFAULT_RENDER_FPS
+    return min(RENDER_FPS_CHOICES, key=lambda choice: abs(choice - fps))
+
+
+def frame_interval_ms(fps: int, refresh_hz: Optional[float] = None) -> float:
+    """Frame interval as a whole number of display refresh periods."""
+    if not refresh_hz or refresh_hz <= 0:
+        return 1000.0 / fps
+    periods = max(1, round(refresh_hz / fps))
+    return 1000.0 * periods / refresh_hz
+
+
+class FrameTimeHistogram:
+    """Fixed-bucket histogram of frame times (ms). O(1) record, no per-frame allocation."""
+
+    def __init__(self, edges_ms: tuple[float, ...] = HISTOGRAM_EDGES_MS) -> None:
+        self.edges_ms = edges_ms
+        self.counts = [0] * (len(edges_ms) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        i = 0
+        edges = self.edges_ms
+        while i < len(edges) and ms > edges[i]:
+            i += 1
+        self.counts[i] += 1
+        self.total += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.sum_ms / self.total if self.total else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Upper bucket edge containing the pct-th frame (max_ms for the open bucket)."""
+        if not self.total:
+            return 0.0
+        target = pct / 100.0 * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return self.edges_ms[i] if i < len(self.edges_ms) else self.max_ms
+        return self.max_ms
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.edges_ms) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def as_dict(self) -> dict:
+        labels = [f"<={e:g}" for e in self.edges_ms] + [f">{self.edges_ms[-1]:g}"]
+        return {
+            "frames": self.total,
+            "mean_ms": round(self.mean_ms, 3),
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+@dataclass
+class RenderClockStats:
+    """Render clock counters since start (or the last reset)."""
+    frames: int = 0             # Ticks that painted
+    skipped: int = 0            # Ticks with no new data
+    notifications: int = 0      # state_changed signals absorbed
+    work: FrameTimeHistogram = field(default_factory=FrameTimeHistogram)      # Snapshot + frame handlers
+    interval: FrameTimeHistogram = field(default_factory=FrameTimeHistogram)  # Tick-to-tick
+
+    def summary(self) -> str:
+        return (
+            f"{self.frames} frames ({self.skipped} idle, {self.notifications} bus updates), "
+            f"work {self.work.mean_ms:.2f}ms mean / {self.work.percentile(99):g}ms p99, "
+            f"interval {self.interval.mean_ms:.1f}ms mean / {self.interval.max_ms:.1f}ms max"
+        )
+
+
+class RenderClock(QObject):
+    """Fixed-cadence frame clock fed by a snapshot function.
+
+    Usage:
+        clock = RenderClock(bridge.snapshot, fps=30)
+        bridge.state_changed.connect(clock.mark_dirty)
+        clock.frame.connect(lambda snap, now: window.update_from_bridge(snap))
+        clock.start()
+    """
+
+    frame = Signal(object, float)   # (DiffState snapshot, monotonic time)
+
+    STATS_INTERVAL_S = 60.0
+
+    def __init__(
+        self,
+        snapshot_fn: Callable[[], object],
+        fps: Optional[int] = None,
+        refresh_hz: Optional[float] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._snapshot_fn = snapshot_fn
+        self.fps = resolve_fps(fps)
+        self.interval_ms = frame_interval_ms(self.fps, refresh_hz)
+        self.stats = RenderClockStats()
+        self._dirty = False
+        self._last_tick = 0.0
+        self._last_log = 0.0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(max(1, round(self.interval_ms)))
+        self._timer.timeout.connect(self.tick)
+
+    def mark_dirty(self) -> None:
+        """New data available (connect to DiffStateBridge.state_changed)."""
+        self._dirty = True
+        self.stats.notifications += 1
+
+    def start(self) -> None:
+        self._last_tick = 0.0
+        self._last_log = time.monotonic()
+        self._timer.start()
+        log.info("Render clock: %d fps (%.1fms interval)", self.fps, self.interval_ms)
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    @property
+    def is_running(self) -> bool:
+        return self._timer.isActive()
+
+    def tick(self) -> None:
+        """One frame: snapshot once and emit, unless nothing changed."""
+        now = time.monotonic()
+        if self._last_tick:
+            self.stats.interval.record((now - self._last_tick) * 1000.0)
+        self._last_tick = now
+
+        if not self._dirty:
+            self.stats.skipped += 1
+            return
+        self._dirty = False
+
+        t0 = time.perf_counter()
+        self.frame.emit(self._snapshot_fn(), now)
+        self.stats.work.record((time.perf_counter() - t0) * 1000.0)
+        self.stats.frames += 1
+
+        if now - self._last_log >= self.STATS_INTERVAL_S:
+            self._last_log = now
+            log.info("Render clock: %s", self.stats.summary())
+
+
+class TimedTrail:
+    """Time-stamped (x, y) history, resampled at a fixed time step for painting.
+
+    Replaces fixed-length deques whose time span depended on how often
+    samples arrived. Samples live in preallocated RingBuffers. Supports
+    len() and indexing over the raw samples.
+    """
+
+    def __init__(self, span_s: float = 1.0, max_samples: int = 512) -> None:
+        self.span_s = span_s
+        self._t = RingBuffer(max_samples)
+        self._x = RingBuffer(max_samples)
+        self._y = RingBuffer(max_samples)
+
+    def append(self, x: float, y: float, t: Optional[float] = None) -> None:
+        t = time.monotonic() if t is None else t
+        self._t.push(t)
+        self._x.push(x)
+        self._y.push(y)
+        cutoff = t - self.span_s
+        while len(self._t) > 2 and self._t[1] <= cutoff:  # Keep one sample before the window
+            self._t.drop_oldest()
+            self._x.drop_oldest()
+            self._y.drop_oldest()
+
+    def clear(self) -> None:
+        self._t.clear()
+        self._x.clear()
+        self._y.clear()
+
+    def __len__(self) -> int:
+        return len(self._t)
+
+    def __getitem__(self, i: int) -> tuple[float, float]:
+        return self._x[i], self._y[i]
+
+    def resample(self, count: int, now: Optional[float] = None) -> list[tuple[float, float]]:
+        """count points evenly spaced in time over the trail's window, oldest first.
+
+        The window ends at the latest sample and starts span_s before `now`
+        (or at the oldest sample, if the trail is younger than that).
+        """
+        n = len(self._t)
+        if n == 0 or count <= 0:
+            return []
+        if n == 1 or count == 1:
+            return [(self._x[-1], self._y[-1])]
+        t = self._t.values()
+        end = t[-1]
+        now = end if now is None else now
+        start = max(t[0], now - self.span_s)
+        if start >= end:
+            return [(self._x[-1], self._y[-1])]
+        grid = np.linspace(start, end, count)
+        xs = np.interp(grid, t, self._x.values())
+        ys = np.interp(grid, t, self._y.values())
+        return list(zip(xs.tolist(), ys.tolist()))
@@ -0,0 +1,217 @@
+"""KiSTI - Screen Lifecycle
+
+Only the screen on top of MainWindow's stack should cost CPU. Screens opt
+into a small duck-typed protocol, like update_state():
+
+  - activate() / deactivate(): resume / suspend the screen's own timers and
+    data feeds (repaint ticks, alert rotation, bridge polling, camera frames)
+  - catch_up(frames): called on activation with the (monotonic time,
+    DiffState) frames the screen missed while hidden, oldest first — screens
+    with time-based history (G trails, sparklines) replay them; screens
+    without it just get update_state() with the newest snapshot
+
+ScreenRouter owns the routing: it records every render-clock snapshot in a
+StateHistory, feeds only the current screen, and keeps the latest value of
+each side-channel push (timing, coaching, grip, ...) so a screen that was
+hidden when it arrived gets it the moment it's shown. Stack changes (SI
+Drive knob via ModeManager, K6 sub-page, dev keys) all go through
+QStackedWidget.currentChanged, so every path switches lifecycles.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from typing import Any, Iterable, Optional
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QStackedWidget, QWidget
+
+log = logging.getLogger("kisti.ui.lifecycle")
+
+# Snapshot history kept for catch-up: covers the longest on-screen trail
+# (S# G trail, 1.5 s) with room to spare, at up to 60 fps
+HISTORY_SECONDS = 5.0
+HISTORY_FRAMES = 300
+
+
+class TimerGroup:
+    """Timers a screen suspends while hidden.
+
+    suspend() stops the ones that are running and remembers them; resume()
+    restarts only those, so timers the screen itself stopped stay stopped.
+    """
+
+    def __init__(self, *timers: QTimer) -> None:
+        self._timers: list[QTimer] = list(timers)
+        self._suspended: list[QTimer] = []
+
+    def add(self, *timers: QTimer) -> None:
+        self._timers.extend(timers)
+
+    def suspend(self) -> None:
+        for timer in self._timers:
+            if timer.isActive() and timer not in self._suspended:
+                timer.stop()
+                self._suspended.append(timer)
+
+    def resume(self) -> None:
+        for timer in self._suspended:
+            timer.start()
+        self._suspended.clear()
+
+    @property
+    def suspended(self) -> bool:
+        return bool(self._suspended)
+
+
+class StateHistory:
+    """Bounded (monotonic time, snapshot) history, oldest first."""
+
+    def __init__(self, max_age_s: float = HISTORY_SECONDS, max_frames: int = HISTORY_FRAMES) -> None:
+        self.max_age_s = max_age_s
+        self._frames: deque[tuple[float, Any]] = deque(maxlen=max_frames)
+
+    def record(self, snap: Any, now: float) -> None:
+        self._frames.append((now, snap))
+        cutoff = now - self.max_age_s
+        while self._frames[0][0] < cutoff:
+            self._frames.popleft()
+
+    def since(self, t: float) -> list[tuple[float, Any]]:
+        """Frames recorded strictly after t (all of them for t = 0)."""
+        out = []
+        for frame in reversed(self._frames):
+            if frame[0] <= t:
+                break
+            out.append(frame)
+        out.reverse()
+        return out
+
+    def latest(self) -> Optional[tuple[float, Any]]:
+        return self._frames[-1] if self._frames else None
+
+    def clear(self) -> None:
+        self._frames.clear()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+
+class ScreenRouter(QObject):
+    """Feeds the current stack screen; suspends the rest.
+
+    Usage:
+        router = ScreenRouter(stack)
+        router.add_background(legacy_widget)    # never shown: stays suspended
+        router.start()
+        render_clock.frame.connect(router.feed)
+        router.push("update_timing", timing_data)
+    """
+
+    def __init__(self, stack: QStackedWidget, history: Optional[StateHistory] = None,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._stack = stack
+        self.history = history if history is not None else StateHistory()
+        self._background: list[QWidget] = []
+        self._active: Optional[QWidget] = None
+        self._fed_at: dict[int, float] = {}        # id(widget) → time of last frame fed
+        self._push_seq = 0
+        self._pushes: dict[tuple, tuple[int, tuple]] = {}  # (method, targets) → (seq, args)
+        self._seen_seq: dict[int, int] = {}        # id(widget) → push seq when last active
+        self._started = False
+
+    def add_background(self, widget: QWidget) -> None:
+        """Register a widget outside the stack (kept for data compat, never shown)."""
+        self._background.append(widget)
+        if self._started:
+            _call(widget, "deactivate")
+
+    def start(self) -> None:
+        """Suspend every screen but the current one and begin routing."""
+        self._started = True
+        current = self._stack.currentWidget()
+        for widget in self._screens():
+            if widget is not current:
+                _call(widget, "deactivate")
+        self._active = None
+        self._switch_to(current)
+        self._stack.currentChanged.connect(self._on_current_changed)
+
+    @property
+    def active(self) -> Optional[QWidget]:
+        return self._active
+
+    def feed(self, snap: Any, now: Optional[float] = None) -> None:
+        """Record a snapshot and hand it to the active screen only."""
+        now = time.monotonic() if now is None else now
+        self.history.record(snap, now)
+        widget = self._active
+        if widget is not None and hasattr(widget, "update_state"):
+            widget.update_state(snap)
+            self._fed_at[id(widget)] = now
+
+    def push(self, method: str, *args: Any, screens: Optional[Iterable[QWidget]] = None) -> None:
+        """Latest-wins side-channel update for screens that have `method`.
+
+        Delivered now if the active screen qualifies; replayed to the others
+        when they activate. screens limits delivery (same method name, e.g.
+        update_coaching, can carry different feeds to different screens).
+        """
+        targets = frozenset(id(w) for w in screens) if screens is not None else None
+        self._push_seq += 1
+        self._pushes[(method, targets)] = (self._push_seq, args)
+        widget = self._active
+        if widget is not None:
+            if targets is None or id(widget) in targets:
+                fn = getattr(widget, method, None)
+                if fn is not None:
+                    fn(*args)
+            self._seen_seq[id(widget)] = self._push_seq
+
+    def _screens(self) -> Iterable[QWidget]:
+        for i in range(self._stack.count()):
+            yield self._stack.widget(i)
+        yield from self._background
+
+    def _on_current_changed(self, _index: int) -> None:
+        self._switch_to(self._stack.currentWidget())
+
+    def _switch_to(self, widget: Optional[QWidget]) -> None:
+        if widget is self._active:
+            return
+        if self._active is not None:
+            _call(self._active, "deactivate")
+        self._active = widget
+        if widget is None:
+            return
+        _call(widget, "activate")
+        self._catch_up(widget)
+
+    def _catch_up(self, widget: QWidget) -> None:
+        key = id(widget)
+        seen = self._seen_seq.get(key, 0)
+        for (method, targets), (seq, args) in sorted(self._pushes.items(), key=lambda kv: kv[1][0]):
+            if seq > seen and (targets is None or key in targets):
+                fn = getattr(widget, method, None)
+                if fn is not None:
+                    fn(*args)
+        self._seen_seq[key] = self._push_seq
+
+        frames = self.history.since(self._fed_at.get(key, 0.0))
+        if not frames:
+            return
+        if hasattr(widget, "catch_up"):
+            widget.catch_up(frames)
+        elif hasattr(widget, "update_state"):
+            widget.update_state(frames[-1][1])
+        self._fed_at[key] = frames[-1][0]
+        log.debug("Caught up %s with %d frames", type(widget).__name__, len(frames))
+
+
+def _call(widget: QWidget, method: str) -> None:
+    fn = getattr(widget, method, None)
+    if fn is not None:
+        fn()
@@ -9,7 +9,7 @@ import os
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGridLayout,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGridLayout, QPushButton,
 )
 
 from ui.theme import (
@@ -154,10 +154,49 @@ class SettingsModeWidget(QWidget):
             self._sensor_labels[name] = dot
 
         info_col.addLayout(sensor_grid)
+
+        info_col.addSpacing(8)
+
+        # Diagnostics: main-thread timing overlay (shown once a LoopMonitor is wired)
+        self._diag_header = QLabel("DIAGNOSTICS")
+        self._diag_header.setStyleSheet(
+            f"font-size: {FONT_HEADER}px; font-weight: bold; color: {HIGHLIGHT};"
+        )
+        info_col.addWidget(self._diag_header)
+
+        self._loop_overlay_button = QPushButton("FRAME TIMING OVERLAY: OFF")
+        self._loop_overlay_button.setCheckable(True)
+        self._loop_overlay_button.setStyleSheet(
+            f"font-size: 11px; color: {WHITE}; background-color: {BG_ACCENT};"
+            f" border: 1px solid {CHROME_DARK}; padding: 4px;"
+        )
+        self._loop_overlay_button.toggled.connect(self._on_loop_overlay_toggled)
+        info_col.addWidget(self._loop_overlay_button)
+        self._loop_overlay_callback = None
+        self._diag_header.hide()
+        self._loop_overlay_button.hide()
+
         info_col.addStretch()
 
         layout.addLayout(info_col, stretch=60)
 
+    def enable_loop_overlay_toggle(self, callback) -> None:
+        """Show the frame timing toggle; callback(bool) shows/hides the overlay."""
+        self._loop_overlay_callback = callback
+        self._diag_header.show()
+        self._loop_overlay_button.show()
+
+    def set_loop_overlay_checked(self, checked: bool) -> None:
+        """Flip the toggle from elsewhere (F12) so button and overlay agree."""
+        self._loop_overlay_button.setChecked(checked)
+
+    def _on_loop_overlay_toggled(self, checked: bool) -> None:
+        self._loop_overlay_button.setText(
+            f"FRAME TIMING OVERLAY: {'ON' if checked else 'OFF'}"
+        )
+        if self._loop_overlay_callback is not None:
+            self._loop_overlay_callback(checked)
+
     def update_data(self, vehicle_state):
         """Update sensor connection status indicators."""
         for cam in vehicle_state.sensors.all_cameras():
@@ -29,7 +29,6 @@ from __future__ import annotations
 
 import math
 import time
-from collections import deque
 from typing import Optional
 
 from PySide6.QtCore import Qt, QRectF, QPointF
@@ -38,6 +37,7 @@ from PySide6.QtWidgets import QWidget
 
 from model.vehicle_state import DiffState
 from ui.g_force_ellipse import paint_g_ellipse
+from ui.render_clock import TimedTrail
 from ui.road_condition import (
     paint_zone_tint,
     paint_edge_glow,
@@ -59,6 +59,7 @@ from ui.theme import (
     FONT_BIG,
     FONT_XLARGE,
     FONT_MEGA,
+    font,
 )
 
 
@@ -126,10 +127,7 @@ _COOL_CRIT = 105.0
 # ---------------------------------------------------------------------------
 
 def _font(size: int, bold: bool = False) -> QFont:
-    f = QFont("Helvetica", size)
-    if bold:
-        f.setWeight(QFont.Bold)
-    return f
+    return font(size, bold)
 
 
 # ---------------------------------------------------------------------------
@@ -174,7 +172,7 @@ class SportSharpScreenWidget(QWidget):
         self._timing: dict = {}
 
         # G-force dot trail (canyon intensity feedback)
-        self._g_trail: deque[tuple[float, float]] = deque(maxlen=40)
+        self._g_trail = TimedTrail(span_s=1.5)
 
         # Paint counter for edge glow pulse
         self._paint_count: int = 0
@@ -198,9 +196,16 @@ class SportSharpScreenWidget(QWidget):
     # ------------------------------------------------------------------
 
     def update_state(self, snap: DiffState) -> None:
-        """Accept telemetry snapshot from DiffStateBridge (20 Hz)."""
+        """Accept telemetry snapshot (once per render clock frame)."""
+        self._snap = snap
+        self._g_trail.append(snap.imu_accel_y, snap.imu_accel_x)
+        self.update()
+
+    def catch_up(self, frames: list[tuple[float, DiffState]]) -> None:
+        """Replay (time, snapshot) frames missed while hidden into the G trail."""
+        for t, snap in frames:
+            self._g_trail.append(snap.imu_accel_y, snap.imu_accel_x, t)
         self._snap = snap
-        self._g_trail.append((snap.imu_accel_y, snap.imu_accel_x))
         self.update()
 
     def update_coaching(self, text: str, sentiment: str = "dim") -> None:
@@ -215,9 +220,15 @@ class SportSharpScreenWidget(QWidget):
         self._voice_ticker = lines
 
     def update_timing(self, timing_data: dict) -> None:
-        """Accept timing data — cached but not displayed in canyon mode."""
+        """Accept timing data — cached but not displayed in canyon mode.
+
+        Repaints only when the event-driven part changed (timing_version).
+        """
+        version = timing_data.get("timing_version")
+        changed = version is None or version != self._timing.get("timing_version")
         self._timing = timing_data
-        self.update()
+        if changed:
+            self.update()
 
     def update_balance(self, ratio: float, text: str, sentiment: str) -> None:
         """Accept balance ratio from BalanceAnalyzer."""
@@ -285,7 +296,7 @@ class SportSharpScreenWidget(QWidget):
             _G_CENTER_Y,
             _G_RADIUS,
             self._snap,
-            self._g_trail,
+            self._g_trail.resample(31),
             balance_ratio=self._balance_ratio,
             max_trail_dots=30,
             accent_color=MODE_SS_ACCENT,
@@ -310,7 +321,7 @@ class SportSharpScreenWidget(QWidget):
             p.drawText(QRectF(10, 4, 90, 22), Qt.AlignLeft | Qt.AlignVCenter, "OVER")
 
         # --- DCCD arc gauge (center) ---
-        dccd_pct = snap.dccd_pct if snap else 0.0
+        dccd_pct = snap.dccd_command_pct if snap else 0.0
         stale = snap is None or snap.is_diff_stale()
         cx, cy, arc_r = 400, 16, 12
 
@@ -21,15 +21,15 @@ Layout (800x480):
 
 from __future__ import annotations
 
-from collections import deque
 from typing import Optional
 
 from PySide6.QtCore import Qt, QRectF, QPointF
-from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from PySide6.QtGui import QColor, QPainter, QPen
 from PySide6.QtWidgets import QWidget
 
 from model.vehicle_state import DiffState
 from ui.g_force_ellipse import paint_g_ellipse
+from ui.render_clock import TimedTrail
 from ui.track_map import paint_track_map
 from ui.road_condition import (
     paint_zone_tint,
@@ -53,6 +53,7 @@ from ui.theme import (
     FONT_BIG,
     FONT_XLARGE,
     FONT_MEGA,
+    font,
 )
 
 
@@ -88,6 +89,8 @@ _MID_Y0 = 90
 _MID_Y1 = 280
 _SECTOR_Y0 = 280
 _SECTOR_Y1 = 380
+_MINI_RIBBON_H = 8    # Micro-sector loss ribbon along the bottom of the sector strip
+_MINI_LOSS_MS = 100   # Micro-sector loss drawn full red (yellow below half of this)
 _VITALS_Y0 = 380
 _VITALS_Y1 = 460  # Shortened to leave room for alert bar at y=460..480
 
@@ -202,7 +205,7 @@ class SportSharpTrackScreenWidget(QWidget):
         self._timing: dict = {}
 
         # G-force dot trail (canyon intensity feedback)
-        self._g_trail: deque[tuple[float, float]] = deque(maxlen=40)
+        self._g_trail = TimedTrail(span_s=0.5)  # Short tail — small circle
 
         # Sector pulse animation
         self._paint_count: int = 0
@@ -219,6 +222,7 @@ class SportSharpTrackScreenWidget(QWidget):
         # Track map outline (real GPS, replaces G-force circle on track days)
         self._track_outline: list = []
         self._lap_progress: float = 0.0
+        self._sector_starts: list[float] = [0.0]  # Lap progress where each sector began (learned)
         self._track_name: str = ""
         self._map_style: str = "schematic"  # "schematic" or "gt" — tap map panel to toggle
 
@@ -227,9 +231,16 @@ class SportSharpTrackScreenWidget(QWidget):
     # ------------------------------------------------------------------
 
     def update_state(self, snap: DiffState) -> None:
-        """Accept telemetry snapshot from DiffStateBridge (20 Hz)."""
+        """Accept telemetry snapshot (once per render clock frame)."""
+        self._snap = snap
+        self._g_trail.append(snap.imu_accel_y, snap.imu_accel_x)
+        self.update()
+
+    def catch_up(self, frames: list[tuple[float, DiffState]]) -> None:
+        """Replay (time, snapshot) frames missed while hidden into the G trail."""
+        for t, snap in frames:
+            self._g_trail.append(snap.imu_accel_y, snap.imu_accel_x, t)
         self._snap = snap
-        self._g_trail.append((snap.imu_accel_y, snap.imu_accel_x))
         self.update()
 
     def update_voice_ticker(self, lines: list[str]) -> None:
@@ -242,11 +253,19 @@ class SportSharpTrackScreenWidget(QWidget):
         Expected keys: lap_count, current_lap_time_ms, delta_ms,
         predicted_lap_ms, sector_times, current_sector, sector_count,
         best_lap_ms, best_sector_times, track_name, theoretical_best_ms,
-        track_outline, lap_distance_m, track_length_m
+        track_outline, lap_distance_m, track_length_m, mini_sector_deltas_ms,
+        timing_version (unchanged = only the live values moved)
         """
+        prev_sector = self._timing.get("current_sector", 0)
+        version = timing_data.get("timing_version")
+        changed = version is None or version != self._timing.get("timing_version")
         self._timing = timing_data
-        self._track_outline = timing_data.get("track_outline", self._track_outline)
-        self._track_name = timing_data.get("track_name", self._track_name)
+        if changed:
+            self._track_outline = timing_data.get("track_outline", self._track_outline)
+            track_name = timing_data.get("track_name", self._track_name)
+            if track_name != self._track_name:
+                self._sector_starts = [0.0]
+            self._track_name = track_name
 
         # Compute lap progress (0-1) for car dot position on track map
         dist_m = timing_data.get("lap_distance_m", 0.0)
@@ -259,6 +278,11 @@ class SportSharpTrackScreenWidget(QWidget):
             if predicted_ms > 0 and current_ms > 0:
                 self._lap_progress = min(1.0, current_ms / predicted_ms)
 
+        # Learn where sectors begin on the outline from the first crossing of each
+        sector = timing_data.get("current_sector", 0)
+        if changed and sector != prev_sector and sector == len(self._sector_starts):
+            self._sector_starts.append(self._lap_progress)
+
         self.update()
 
     def update_balance(self, ratio: float, text: str, sentiment: str) -> None:
@@ -308,6 +332,9 @@ class SportSharpTrackScreenWidget(QWidget):
                 progress=self._lap_progress,
                 track_name=self._track_name,
                 style=self._map_style,
+                current_sector=self._timing.get("current_sector", -1),
+                sector_starts=self._sector_starts,
+                sector_count=self._timing.get("sector_count", 0),
             )
         else:
             self._draw_g_force_circle(p)
@@ -348,7 +375,7 @@ class SportSharpTrackScreenWidget(QWidget):
 
         if not has_timing:
             p.setPen(QColor(GRAY))
-            p.setFont(QFont("Helvetica", FONT_HEADER, QFont.Bold))
+            p.setFont(font(FONT_HEADER, bold=True))
             p.drawText(bar_rect, Qt.AlignCenter, "NO TIMING")
             return
 
@@ -378,7 +405,7 @@ class SportSharpTrackScreenWidget(QWidget):
         delta_text = _fmt_delta_ms(delta_ms)
         text_color = QColor(GREEN) if delta_ms < 0 else QColor(RED) if delta_ms > 0 else QColor(WHITE)
         p.setPen(text_color)
-        p.setFont(QFont("Helvetica", FONT_XLARGE, QFont.Bold))
+        p.setFont(font(FONT_XLARGE, bold=True))
         p.drawText(bar_rect, Qt.AlignCenter, delta_text)
 
     # ------------------------------------------------------------------
@@ -399,19 +426,19 @@ class SportSharpTrackScreenWidget(QWidget):
         # --- Row 1: LAP label + track name (top) ---
         lap_label = f"LAP {lap_count}" if lap_count > 0 else "LAP --"
         p.setPen(QColor(GRAY))
-        p.setFont(QFont("Helvetica", 14, QFont.Bold))
+        p.setFont(font(14, bold=True))
         p.drawText(QRectF(20, _MID_Y0 + 4, 120, 24), Qt.AlignLeft | Qt.AlignVCenter, lap_label)
 
         track_name = timing.get("track_name", "")
         if track_name:
             p.setPen(QColor(DIM))
-            p.setFont(QFont("Helvetica", 12))
+            p.setFont(font(12))
             p.drawText(QRectF(150, _MID_Y0 + 4, 300, 24), Qt.AlignLeft | Qt.AlignVCenter, track_name)
 
         # --- Row 2: Current lap time — large, left-side centered ---
         lap_time_str = _fmt_time_ms(current_lap_ms)
         p.setPen(QColor(WHITE))
-        p.setFont(QFont("Courier", FONT_MEGA, QFont.Bold))  # 48pt — still big, fits left panel
+        p.setFont(font(FONT_MEGA, bold=True, family="Courier"))  # 48pt — still big, fits left panel
         time_rect = QRectF(0, _MID_Y0 + 30, tw, 70)
         p.drawText(time_rect, Qt.AlignCenter, lap_time_str)
 
@@ -419,7 +446,7 @@ class SportSharpTrackScreenWidget(QWidget):
         if predicted_ms > 0:
             pred_str = f"PRED  {_fmt_time_ms(predicted_ms)}"
             p.setPen(QColor(GRAY))
-            p.setFont(QFont("Courier", FONT_BIG, QFont.Bold))
+            p.setFont(font(FONT_BIG, bold=True, family="Courier"))
             pred_rect = QRectF(0, _MID_Y0 + 102, tw, 28)
             p.drawText(pred_rect, Qt.AlignCenter, pred_str)
 
@@ -429,13 +456,13 @@ class SportSharpTrackScreenWidget(QWidget):
         if best_ms > 0:
             best_str = f"BEST  {_fmt_time_ms(best_ms)}"
             p.setPen(QColor(DIM))
-            p.setFont(QFont("Helvetica", FONT_BASE, QFont.Bold))
+            p.setFont(font(FONT_BASE, bold=True))
             p.drawText(QRectF(20, info_y, tw - 40, 20), Qt.AlignLeft | Qt.AlignVCenter, best_str)
 
         if theoretical_ms > 0:
             theo_str = f"THEO  {_fmt_time_ms(theoretical_ms)}"
             p.setPen(QColor(DIM))
-            p.setFont(QFont("Helvetica", FONT_BASE, QFont.Bold))
+            p.setFont(font(FONT_BASE, bold=True))
             p.drawText(QRectF(20, info_y + 20, tw - 40, 20), Qt.AlignLeft | Qt.AlignVCenter, theo_str)
 
     # ------------------------------------------------------------------
@@ -446,7 +473,7 @@ class SportSharpTrackScreenWidget(QWidget):
     def _draw_g_force_circle(self, p: QPainter) -> None:
         # Clear the right panel area
         p.fillRect(_G_PANEL_X, _MID_Y0, _W - _G_PANEL_X, _MID_Y1 - _MID_Y0, QColor(BG_DARK))
-        paint_g_ellipse(p, _G_CENTER_X, _G_CENTER_Y, 80, self._snap, self._g_trail,
+        paint_g_ellipse(p, _G_CENTER_X, _G_CENTER_Y, 80, self._snap, self._g_trail.resample(11),
                         balance_ratio=self._balance_ratio, max_trail_dots=10,
                         accent_color=MODE_SS_ACCENT)
 
@@ -479,13 +506,18 @@ class SportSharpTrackScreenWidget(QWidget):
         current_sector = self._timing.get("current_sector", 0)
         sector_times = self._timing.get("sector_times", [])
         best_sector_times = self._timing.get("best_sector_times", [])
+        mini_deltas = self._timing.get("mini_sector_deltas_ms", [])
 
         sector_w = _BAR_W / sector_count
         gap = 3
+        block_h = strip_h - 6
+        if mini_deltas:
+            block_h -= _MINI_RIBBON_H + 2
+            self._draw_mini_sector_ribbon(p, mini_deltas, _SECTOR_Y1 - 3 - _MINI_RIBBON_H)
 
         for i in range(sector_count):
             sx = _BAR_X + i * sector_w
-            rect = QRectF(sx + gap / 2, _SECTOR_Y0 + 3, sector_w - gap, strip_h - 6)
+            rect = QRectF(sx + gap / 2, _SECTOR_Y0 + 3, sector_w - gap, block_h)
 
             if i < len(sector_times) and sector_times[i] is not None and sector_times[i] > 0:
                 sector_ms = sector_times[i]
@@ -501,7 +533,7 @@ class SportSharpTrackScreenWidget(QWidget):
                 # Sector time — large and readable
                 time_str = f"{sector_ms / 1000.0:.1f}"
                 p.setPen(QColor(WHITE))
-                p.setFont(QFont("Helvetica", FONT_HEADER, QFont.Bold))
+                p.setFont(font(FONT_HEADER, bold=True))
                 p.drawText(rect, Qt.AlignCenter, time_str)
 
                 # Sector insight + delta vs best — below the time
@@ -512,7 +544,7 @@ class SportSharpTrackScreenWidget(QWidget):
                     insight_text, insight_color = self._sector_insight(sector_ms, best_ms)
                     if insight_text:
                         p.setPen(insight_color)
-                        p.setFont(QFont("Helvetica", 11))
+                        p.setFont(font(11))
                         insight_rect = QRectF(
                             rect.x(), rect.y() + rect.height() * 0.48,
                             rect.width(), 16)
@@ -523,7 +555,7 @@ class SportSharpTrackScreenWidget(QWidget):
                     diff_color = QColor(WHITE)
                     diff_color.setAlpha(200)
                     p.setPen(diff_color)
-                    p.setFont(QFont("Helvetica", 10))
+                    p.setFont(font(10))
                     diff_rect = QRectF(rect.x(), rect.y() + rect.height() - 22, rect.width(), 18)
                     p.drawText(diff_rect, Qt.AlignCenter, diff_str)
 
@@ -538,7 +570,7 @@ class SportSharpTrackScreenWidget(QWidget):
 
                 # Sector number label
                 p.setPen(QColor(DIM))
-                p.setFont(QFont("Helvetica", 12))
+                p.setFont(font(12))
                 p.drawText(rect, Qt.AlignCenter, f"S{i + 1}")
             else:
                 # Future sector — dim
@@ -548,7 +580,7 @@ class SportSharpTrackScreenWidget(QWidget):
 
                 # Sector number label
                 p.setPen(QColor(DIM))
-                p.setFont(QFont("Helvetica", 10))
+                p.setFont(font(10))
                 p.drawText(rect, Qt.AlignCenter, f"S{i + 1}")
 
         # --- Brake quality dots above completed sectors ---
@@ -566,6 +598,19 @@ class SportSharpTrackScreenWidget(QWidget):
                     p.setBrush(dot_color)
                     p.drawEllipse(QPointF(dot_x, dot_y), dot_r, dot_r)
 
+    def _draw_mini_sector_ribbon(self, p: QPainter, deltas_ms: list, y: float) -> None:
+        """One cell per micro-sector: green = matched/beat best, yellow/red = time lost."""
+        cell_w = _BAR_W / len(deltas_ms)
+        for i, d in enumerate(deltas_ms):
+            if d is None:
+                color = QColor(DIM)
+            elif d <= 0:
+                color = QColor(GREEN)
+            else:
+                color = QColor(YELLOW if d < _MINI_LOSS_MS / 2 else RED)
+                color.setAlpha(140 + min(115, int(115 * d / _MINI_LOSS_MS)))
+            p.fillRect(QRectF(_BAR_X + i * cell_w, y, max(1.0, cell_w - 1), _MINI_RIBBON_H), color)
+
     # ------------------------------------------------------------------
     # FLIR brake temp strip (y=280..380) — shown when no sector data
     # ------------------------------------------------------------------
@@ -599,7 +644,7 @@ class SportSharpTrackScreenWidget(QWidget):
             p.fillRect(QRectF(zx + 2, bar_y, zone_w - 4, bar_h), col)
 
         # Label
-        p.setFont(QFont("Courier", FONT_BASE, QFont.Weight.Bold))
+        p.setFont(font(FONT_BASE, bold=True, family="Courier"))
         p.setPen(QColor(GRAY))
         p.drawText(QRectF(10, y0, _W - 20, 20),
                    Qt.AlignmentFlag.AlignCenter, "ROAD CONDITION")
@@ -767,7 +812,7 @@ class SportSharpTrackScreenWidget(QWidget):
         p.setPen(Qt.NoPen)
         p.setBrush(bg)
         p.drawRect(QRectF(0, bar_y, _W, bar_h))
-        p.setFont(QFont("Helvetica", 10, QFont.Bold))
+        p.setFont(font(10, bold=True))
         p.setPen(QPen(fg))
         p.drawText(QRectF(0, bar_y, _W, bar_h),
                    Qt.AlignCenter, text)
@@ -790,20 +835,20 @@ class SportSharpTrackScreenWidget(QWidget):
         """
         # Label — 13pt min for readability
         p.setPen(label_color)
-        p.setFont(QFont("Helvetica", 12, QFont.Bold))
+        p.setFont(font(12, bold=True))
         label_rect = QRectF(x, _VITALS_Y0 + 2, w, 16)
         p.drawText(label_rect, Qt.AlignCenter, label)
 
         # Value — large, bold, Helvetica to match rest of UI
         font_size = 32 if large else FONT_BIG  # 32pt warning, 26pt normal
         p.setPen(value_color)
-        p.setFont(QFont("Helvetica", font_size, QFont.Bold))
+        p.setFont(font(font_size, bold=True))
         value_rect = QRectF(x, _VITALS_Y0 + 18, w, 36)
         p.drawText(value_rect, Qt.AlignCenter, value)
 
         # Unit — smaller, below value
         p.setPen(label_color)
-        p.setFont(QFont("Helvetica", 11))
+        p.setFont(font(11))
         unit_rect = QRectF(x, _VITALS_Y0 + 54, w, 16)
         p.drawText(unit_rect, Qt.AlignCenter, unit)
 
@@ -830,7 +875,7 @@ class SportSharpTrackScreenWidget(QWidget):
 
         # "GRIP" label
         p.setPen(lc)
-        p.setFont(QFont("Helvetica", 12, QFont.Bold))
+        p.setFont(font(12, bold=True))
         p.drawText(QRectF(x, _VITALS_Y0 + 2, w, 16), Qt.AlignCenter, "GRIP")
 
         # Bar geometry — two bars side by side (F left, R right)
@@ -868,19 +913,19 @@ class SportSharpTrackScreenWidget(QWidget):
             # Sub-label (F / R) above bar
             sub_color = lc if worst < 90 else QColor(DIM)
             p.setPen(sub_color)
-            p.setFont(QFont("Helvetica", 10, QFont.Bold))
+            p.setFont(font(10, bold=True))
             p.drawText(QRectF(bx, bar_y - 14, bar_w, 14), Qt.AlignCenter, label)
 
             # Percentage inside bar
             pct_color = QColor(WHITE) if pct < 90 else QColor(DIM)
             font_size = 16 if large else 13
             p.setPen(pct_color)
-            p.setFont(QFont("Helvetica", font_size, QFont.Bold))
+            p.setFont(font(font_size, bold=True))
             p.drawText(QRectF(bx, bar_y, bar_w, bar_h), Qt.AlignCenter, f"{pct:.0f}")
 
         # Unit label below bars
         p.setPen(lc)
-        p.setFont(QFont("Helvetica", 11))
+        p.setFont(font(11))
         p.drawText(QRectF(x, _VITALS_Y0 + 54, w, 16), Qt.AlignCenter, "%")
 
     # ------------------------------------------------------------------
@@ -919,7 +964,7 @@ class SportSharpTrackScreenWidget(QWidget):
     def _paint_voice_ticker(self, p: QPainter) -> None:
         if not self._voice_ticker:
             return
-        p.setFont(QFont("Helvetica", 11))
+        p.setFont(font(11))
         alphas = [120, 70, 40]
         x, y0, w = 20, 458, 380
         for i, line in enumerate(self._voice_ticker):
@@ -18,13 +18,11 @@ Layout:
 
 from __future__ import annotations
 
-from collections import deque
 from typing import Optional
 
 from PySide6.QtCore import Qt, QRectF, QPointF
 from PySide6.QtGui import (
     QColor,
-    QFont,
     QPainter,
     QPen,
 )
@@ -32,6 +30,7 @@ from PySide6.QtWidgets import QWidget
 
 from model.vehicle_state import DiffState
 from ui.g_force_ellipse import paint_g_ellipse
+from ui.render_clock import TimedTrail
 from ui.road_condition import (
     paint_zone_tint,
     paint_edge_glow,
@@ -52,6 +51,7 @@ from ui.theme import (
     CYAN,
     CHROME_DARK,
     MODE_S_ACCENT,
+    font,
 )
 
 
@@ -115,8 +115,8 @@ class SportScreenWidget(QWidget):
         super().__init__(parent)
         self._snap: Optional[DiffState] = None
 
-        # G-force dot trail
-        self._g_trail: deque[tuple[float, float]] = deque(maxlen=100)
+        # G-force dot trail — last second, independent of frame rate
+        self._g_trail = TimedTrail(span_s=1.0)
 
         # Voice ticker (fed from main.py at 1Hz)
         self._voice_ticker: list[str] = []
@@ -147,9 +147,17 @@ class SportScreenWidget(QWidget):
     # ------------------------------------------------------------------
 
     def update_state(self, snap: DiffState) -> None:
-        """Called at 20 Hz from main timer with a DiffState snapshot."""
+        """Called once per render clock frame with a DiffState snapshot."""
+        self._snap = snap
+        self._g_trail.append(snap.imu_accel_y, snap.imu_accel_x)
+        self._brake_bias_pct = snap.brake_bias_pct
+        self.update()
+
+    def catch_up(self, frames: list[tuple[float, DiffState]]) -> None:
+        """Replay (time, snapshot) frames missed while hidden into the G trail."""
+        for t, snap in frames:
+            self._g_trail.append(snap.imu_accel_y, snap.imu_accel_x, t)
         self._snap = snap
-        self._g_trail.append((snap.imu_accel_y, snap.imu_accel_x))
         self._brake_bias_pct = snap.brake_bias_pct
         self.update()
 
@@ -233,7 +241,7 @@ class SportScreenWidget(QWidget):
         self, p: QPainter, snap: DiffState, stale: bool
     ) -> None:
         # DCCD label
-        p.setFont(QFont("Helvetica", 12, QFont.Weight.Bold))
+        p.setFont(font(12, bold=True))
         p.setPen(QPen(QColor(MODE_S_ACCENT)))
         p.drawText(QRectF(8, 4, 60, 20), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, "DCCD")
 
@@ -258,7 +266,7 @@ class SportScreenWidget(QWidget):
 
         # Percentage
         pct_str = f"{dccd:.0f}%" if not stale else "---%"
-        p.setFont(QFont("Helvetica", 14, QFont.Weight.Bold))
+        p.setFont(font(14, bold=True))
         p.setPen(QPen(QColor(WHITE) if not stale else QColor(GRAY)))
         p.drawText(QRectF(bar_x + bar_w + 6, bar_y, 60, bar_h),
                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, pct_str)
@@ -276,13 +284,13 @@ class SportScreenWidget(QWidget):
         slip_x = badge_x + badge_tw + 16
         if snap.slip_delta is not None and not stale:
             slip_color = self._wheel_delta_color(abs(snap.slip_delta))
-            p.setFont(QFont("Helvetica", 14, QFont.Weight.Bold))
+            p.setFont(font(14, bold=True))
             p.setPen(QPen(QColor(slip_color)))
             p.drawText(QRectF(slip_x, badge_y - 2, 160, row2_h),
                        Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
                        f"SLIP \u0394 {snap.slip_delta:+.1f} km/h")
         else:
-            p.setFont(QFont("Helvetica", 12))
+            p.setFont(font(12))
             p.setPen(QPen(QColor(GRAY)))
             p.drawText(QRectF(slip_x, badge_y - 2, 120, row2_h),
                        Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
@@ -294,7 +302,7 @@ class SportScreenWidget(QWidget):
             p.setPen(Qt.PenStyle.NoPen)
             p.setBrush(QColor(RED))
             p.drawEllipse(QPointF(16, ind_y), 5, 5)
-            p.setFont(QFont("Helvetica", 9, QFont.Weight.Bold))
+            p.setFont(font(9, bold=True))
             p.setPen(QPen(QColor(RED)))
             p.drawText(26, int(ind_y) + 4, "ABS")
 
@@ -302,7 +310,7 @@ class SportScreenWidget(QWidget):
             p.setPen(Qt.PenStyle.NoPen)
             p.setBrush(QColor(YELLOW))
             p.drawEllipse(QPointF(70, ind_y), 5, 5)
-            p.setFont(QFont("Helvetica", 9, QFont.Weight.Bold))
+            p.setFont(font(9, bold=True))
             p.setPen(QPen(QColor(YELLOW)))
             p.drawText(80, int(ind_y) + 4, "VDC")
 
@@ -381,7 +389,7 @@ class SportScreenWidget(QWidget):
         p.setPen(Qt.PenStyle.NoPen)
         p.setBrush(bg)
         p.drawRect(QRectF(0, bar_y, w, bar_h))
-        p.setFont(QFont("Helvetica", 10, QFont.Weight.Bold))
+        p.setFont(font(10, bold=True))
         p.setPen(QPen(fg))
         p.drawText(QRectF(0, bar_y, w, bar_h),
                    Qt.AlignmentFlag.AlignCenter, text)
@@ -462,7 +470,7 @@ class SportScreenWidget(QWidget):
                                      "BIAS", norm, bias_color, val_str)
         else:
             # Dark cockpit — invisible when not braking
-            p.setFont(QFont("Helvetica", 13, QFont.Weight.Bold))
+            p.setFont(font(13, bold=True))
             p.setPen(QPen(QColor(GRAY).darker(200)))
             p.drawText(QRectF(bar_x, y, label_w, bar_h),
                        Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, "BIAS")
@@ -516,7 +524,7 @@ class SportScreenWidget(QWidget):
     ) -> None:
         """Paint a single standard (left-to-right) bar with label and value."""
         # Label
-        p.setFont(QFont("Helvetica", 13, QFont.Weight.Bold))
+        p.setFont(font(13, bold=True))
         p.setPen(QPen(QColor(GRAY)))
         p.drawText(QRectF(bar_x, y, label_w, bar_h),
                    Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, label)
@@ -530,7 +538,7 @@ class SportScreenWidget(QWidget):
             p.fillRect(int(bx), int(y + 2), fw, int(bar_h - 4), QColor(fill_color))
 
         # Value text
-        p.setFont(QFont("Helvetica", 13, QFont.Weight.Bold))
+        p.setFont(font(13, bold=True))
         p.setPen(QPen(QColor(fill_color) if val_str != "---" else QColor(GRAY)))
         p.drawText(QRectF(bx + bar_w + 4, y, val_w, bar_h),
                    Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, val_str)
@@ -542,7 +550,7 @@ class SportScreenWidget(QWidget):
     ) -> None:
         """Paint a centered bar (deviation from center) with label and value."""
         # Label
-        p.setFont(QFont("Helvetica", 13, QFont.Weight.Bold))
+        p.setFont(font(13, bold=True))
         p.setPen(QPen(QColor(GRAY)))
         p.drawText(QRectF(bar_x, y, label_w, bar_h),
                    Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, label)
@@ -564,7 +572,7 @@ class SportScreenWidget(QWidget):
                 p.fillRect(int(center - fill_px), int(y + 2), fill_px, int(bar_h - 4), QColor(fill_color))
 
         # Value text
-        p.setFont(QFont("Helvetica", 13, QFont.Weight.Bold))
+        p.setFont(font(13, bold=True))
         p.setPen(QPen(QColor(fill_color) if val_str != "---" else QColor(GRAY)))
         p.drawText(QRectF(bx + bar_w + 4, y, val_w, bar_h),
                    Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, val_str)
@@ -575,7 +583,7 @@ class SportScreenWidget(QWidget):
 
     def _paint_g_ellipse(self, p: QPainter, snap: DiffState) -> None:
         p.fillRect(350, 100, 450, 340, QColor(BG_DARK))
-        paint_g_ellipse(p, _G_CENTER_X, _G_CENTER_Y, 130, snap, self._g_trail,
+        paint_g_ellipse(p, _G_CENTER_X, _G_CENTER_Y, 130, snap, self._g_trail.resample(21),
                         balance_ratio=self._balance_ratio, max_trail_dots=20,
                         accent_color=CYAN)
 
@@ -603,7 +611,7 @@ class SportScreenWidget(QWidget):
             sentiment_colors = {"green": GREEN, "amber": YELLOW, "dim": DIM}
             color = QColor(sentiment_colors.get(self._coaching_sentiment, DIM))
             p.setPen(color)
-            p.setFont(QFont("Helvetica", 11, QFont.Weight.Bold))
+            p.setFont(font(11, bold=True))
             elided = p.fontMetrics().elidedText(self._coaching_text, Qt.TextElideMode.ElideRight, w - 16)
             p.drawText(QRectF(8, line_y, w - 16, line_h),
                        Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided)
@@ -611,7 +619,7 @@ class SportScreenWidget(QWidget):
 
         # Priority 2: voice ticker (if available)
         if self._voice_ticker:
-            p.setFont(QFont("Helvetica", 10))
+            p.setFont(font(10))
             color = QColor(WHITE)
             color.setAlpha(150)
             p.setPen(color)
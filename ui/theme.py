@@ -2,8 +2,18 @@
 
 2014 Subaru WRX STI gauge cluster inspired.
 Black faces, STI cherry red accents, white text, chrome rings.
+
+Paint code gets fonts, colors, pens and brushes from the cached
+font()/color()/pen()/brush() accessors below instead of constructing new
+Qt objects on every repaint. QPainter copies them on set*(), so shared
+instances are safe — just never mutate one (copy with QColor(c) first).
 """
 
+from functools import lru_cache
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor, QFont, QPen
+
 # === 2014 STI Gauge Palette ===
 
 # Backgrounds
@@ -65,6 +75,59 @@ ROAD_BG_WET = (5, 12, 40)            # Deep blue
 ROAD_BG_COLD = (5, 25, 40)           # Deep cyan (not purple — peripheral discrimination)
 ROAD_BG_LOW_GRIP = (50, 5, 5)        # Deep red
 
+
+# === Cached paint objects ===
+
+_theme_generation = 0
+
+
+def theme_generation() -> int:
+    """Bumped by theme_changed(); static layers rebuild when it moves."""
+    return _theme_generation
+
+
+def theme_changed() -> None:
+    """Drop cached paint objects and invalidate every static layer."""
+    global _theme_generation
+    _theme_generation += 1
+    for cached in (color, font, pen, brush):
+        cached.cache_clear()
+
+
+@lru_cache(maxsize=512)
+def color(spec: str | tuple, alpha: int | None = None) -> QColor:
+    """QColor from a hex string or (r, g, b[, a]) tuple, optionally re-alpha'd."""
+    c = QColor(spec) if isinstance(spec, str) else QColor(*spec)
+    if alpha is not None:
+        c.setAlpha(alpha)
+    return c
+
+
+@lru_cache(maxsize=128)
+def font(size: int, bold: bool = False, family: str = "Helvetica") -> QFont:
+    f = QFont(family, size)
+    if bold:
+        f.setWeight(QFont.Weight.Bold)
+    return f
+
+
+@lru_cache(maxsize=256)
+def pen(
+    spec: str | tuple,
+    width: float = 1.0,
+    style: Qt.PenStyle = Qt.PenStyle.SolidLine,
+    cap: Qt.PenCapStyle = Qt.PenCapStyle.SquareCap,
+    join: Qt.PenJoinStyle = Qt.PenJoinStyle.BevelJoin,
+    alpha: int | None = None,
+) -> QPen:
+    return QPen(QBrush(color(spec, alpha)), width, style, cap, join)
+
+
+@lru_cache(maxsize=128)
+def brush(spec: str | tuple, alpha: int | None = None) -> QBrush:
+    return QBrush(color(spec, alpha))
+
+
 STYLESHEET = f"""
 QWidget {{
     background-color: {BG_DARK};
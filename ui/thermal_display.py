@@ -0,0 +1,173 @@
+"""KiSTI - Thermal Display
+
+One FLIR frame → one displayable QImage, shared by every thermal widget
+(Intelligent road-surface panel, VIDEO mode LiveThermalFeed).
+
+FLIRLeptonReader.frame_updated only hands the raw uint16 frame to
+ThermalDisplay.submit(), which stores it and emits frame_ready. Widgets on
+screen call update(); the first paint that asks for image() renders it:
+
+  - light temporal smoothing (90 % new / 10 % previous) into a persistent
+    float32 buffer
+  - min/max stretch to the full 16-bit range (no 8-bit quantization step)
+  - optional CLAHE contrast (cv2, 16-bit input) when OpenCV is available
+  - one np.take through a precomputed 65536-entry inferno → 0xFFRRGGBB
+    table into a persistent uint32 buffer
+  - QImage(Format_RGB32) constructed directly over that buffer — no
+    tobytes(), no copy(); the service owns the buffer so it outlives the
+    image
+
+Frames nobody looks at are never rendered, and a frame is rendered at most
+once however many widgets paint it. Buffers are reallocated only when the
+frame shape changes (Lepton 2.5 ↔ 3.5).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Optional
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtGui import QImage
+
+log = logging.getLogger("kisti.ui.thermal")
+
+# Weight of the incoming frame in the temporal smoothing (rest is history)
+SMOOTHING_NEW = 0.9
+
+# Inferno approximation: 0 → black, ¼ → deep purple, ½ → orange,
+# ¾ → yellow, full scale → white
+_INFERNO_STOPS = np.array(
+    [[0, 0, 0], [59, 7, 100], [249, 115, 22], [253, 224, 71], [255, 255, 255]],
+    dtype=np.float64,
+)
+
+
+def inferno_lut16() -> np.ndarray:
+    """65536-entry uint32 table mapping a 16-bit level to opaque 0xFFRRGGBB."""
+    levels = np.arange(65536, dtype=np.float64)
+    keys = np.linspace(0.0, 65535.0, len(_INFERNO_STOPS))
+    r, g, b = (
+        np.interp(levels, keys, _INFERNO_STOPS[:, ch]).astype(np.uint32)
+        for ch in range(3)
+    )
+    return np.uint32(0xFF000000) | (r << 16) | (g << 8) | b
+
+
+INFERNO_LUT16 = inferno_lut16()
+
+
+class ThermalDisplay(QObject):
+    """Renders the newest FLIR frame on demand into a shared QImage.
+
+    Usage:
+        thermal = ThermalDisplay(flir_reader)
+        thermal.frame_ready.connect(widget.update)
+        ...
+        image = thermal.image()         # in paintEvent; None before any frame
+    """
+
+    frame_ready = Signal()
+
+    def __init__(self, flir_reader=None, lut: np.ndarray = INFERNO_LUT16,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._lut = lut
+        self._raw: Optional[np.ndarray] = None      # newest submitted frame
+        self._dirty = False
+        self._shape: Optional[tuple[int, int]] = None
+        self._smooth: Optional[np.ndarray] = None   # float32 smoothing state
+        self._scratch: Optional[np.ndarray] = None  # float32 work buffer
+        self._level: Optional[np.ndarray] = None    # uint16 stretched levels
+        self._equalized: Optional[np.ndarray] = None
+        self._argb: Optional[np.ndarray] = None     # uint32 pixels behind the QImage
+        self._qimage: Optional[QImage] = None
+        self._clahe = _make_clahe()
+        self.frame_count = 0         # frames submitted
+        self.render_count = 0        # frames actually rendered
+        self.last_frame_ts = 0.0     # monotonic time of the newest frame
+
+        if flir_reader is not None:
+            flir_reader.frame_updated.connect(self.submit)
+
+    @Slot(object)
+    def submit(self, frame) -> None:
+        """Accept a raw uint16 frame; rendering waits until someone paints it."""
+        if frame is None or frame.size == 0 or frame.ndim != 2:
+            return
+        self._raw = frame
+        self._dirty = True
+        self.frame_count += 1
+        self.last_frame_ts = time.monotonic()
+        self.frame_ready.emit()
+
+    def staleness_ms(self, now: Optional[float] = None) -> int:
+        """Age of the newest frame in ms, -1 before any frame."""
+        if not self.last_frame_ts:
+            return -1
+        now = time.monotonic() if now is None else now
+        return int((now - self.last_frame_ts) * 1000)
+
+    def image(self) -> Optional[QImage]:
+        """The newest frame as an RGB32 QImage (rendered at most once per frame).
+
+        The image views this service's buffer: paint it, don't keep it — the
+        next frame overwrites the pixels in place.
+        """
+        if self._dirty:
+            self._render(self._raw)
+            self._dirty = False
+        return self._qimage
+
+    def _allocate(self, shape: tuple[int, int]) -> None:
+        self._shape = shape
+        self._smooth = None
+        self._scratch = np.empty(shape, dtype=np.float32)
+        self._level = np.empty(shape, dtype=np.uint16)
+        self._equalized = np.empty(shape, dtype=np.uint16)
+        self._argb = np.empty(shape, dtype=np.uint32)
+        log.debug("Thermal buffers allocated for %dx%d", shape[1], shape[0])
+
+    def _render(self, frame: np.ndarray) -> None:
+        if frame.shape != self._shape:
+            self._allocate(frame.shape)
+        scratch = self._scratch
+
+        if self._smooth is None:
+            self._smooth = frame.astype(np.float32)
+        else:
+            np.multiply(frame, SMOOTHING_NEW, out=scratch, casting="same_kind")
+            self._smooth *= 1.0 - SMOOTHING_NEW
+            self._smooth += scratch
+        smooth = self._smooth
+
+        lo, hi = float(smooth.min()), float(smooth.max())
+        if hi > lo:
+            np.subtract(smooth, lo, out=scratch)
+            scratch *= 65535.0 / (hi - lo)
+            np.minimum(scratch, 65535.0, out=scratch)
+            np.copyto(self._level, scratch, casting="unsafe")
+        else:
+            self._level.fill(0)
+
+        level = self._level
+        if self._clahe is not None:
+            self._clahe.apply(level, self._equalized)
+            level = self._equalized
+
+        np.take(self._lut, level, out=self._argb)
+        h, w = self._shape
+        # Fresh wrapper each frame (new cacheKey) over the same pixels
+        self._qimage = QImage(self._argb.data, w, h, w * 4, QImage.Format_RGB32)
+        self.render_count += 1
+
+
+def _make_clahe():
+    """CLAHE for thermal contrast if OpenCV is installed, else None."""
+    try:
+        import cv2
+        return cv2.createCLAHE(clipLimit=2.0, tileGridSize=(4, 4))
+    except (ImportError, AttributeError):
+        return None
@@ -6,17 +6,30 @@ a pure function called from paintEvent, no QWidget subclass.
 Usage in a screen's paintEvent:
     from ui.track_map import paint_track_map
     paint_track_map(p, x=480, y=90, w=320, h=190, outline=self._track_outline,
-                    progress=self._lap_progress, track_name="Mission Raceway")
+                    progress=self._lap_progress, track_name="Mission Raceway",
+                    current_sector=1, sector_starts=[0.0, 0.31], sector_count=3)
+
+The outline is never re-projected per frame. OutlineGeometry holds it as
+an array with Ramer-Douglas-Peucker levels of detail; the projected
+QPainterPath is built once per scale, at the coarsest level whose error
+stays under LOD_TOLERANCE_PX. The panel (background, track band,
+start/finish, name) is a cached StaticLayer; only the current-sector
+highlight and the car dot are painted each frame.
 """
 
 from __future__ import annotations
 
 import math
+from typing import Optional, Sequence
 
+import numpy as np
 from PySide6.QtCore import Qt, QPointF, QRectF
-from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen, QBrush
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QPen, QBrush, QPolygonF
 
-from ui.theme import BG_DARK, CHROME_DARK, CHROME_MID, DIM, GRAY, HIGHLIGHT, WHITE
+from timing.track_outline import outline_lods
+from ui.layers import StaticLayer
+from ui.theme import BG_DARK, CHROME_MID, DIM, HIGHLIGHT, font
+from ui.widgets.time_series import to_polygon
 
 # Car dot colours
 _CAR_OUTER = QColor(255, 80, 0, 60)
@@ -34,6 +47,123 @@ _GT_CURB = QColor(220, 220, 220)    # white edge/kerb line (wide stroke)
 _GT_ASPHALT = QColor(75, 75, 75)    # dark gray road surface (narrow stroke)
 _GT_SF = QColor(255, 200, 0)        # yellow start/finish line
 
+# Current-sector highlight, drawn over the edge line
+_SECTOR_SCHEMATIC = QColor(255, 160, 0, 170)
+_SECTOR_GT = QColor(255, 200, 0, 110)
+
+# Levels of detail (timing.track_outline.LOD_EPSILONS): a level is usable
+# while epsilon * pixels-per-unit stays under LOD_TOLERANCE_PX.
+LOD_TOLERANCE_PX = 0.5
+
+# Margin so track doesn't touch the panel edges
+_MARGIN_X, _MARGIN_Y = 12, 10
+
+
+class OutlineGeometry:
+    """A normalized outline with RDP levels of detail and cached projections.
+
+    Paths are built in "scaled" coordinates — normalized (0, 0) at the
+    origin, sx/sy pixels per unit — so callers position them with a
+    painter translate and a pan costs nothing.
+
+    Args:
+        outline: (x, y) points in 0-1 space (an Outline's precomputed
+            levels of detail are used as-is).
+        smooth: quadratic-bezier smoothing through segment midpoints.
+        close: add a closing segment back to the first point.
+    """
+
+    _MAX_PATHS = 8
+
+    def __init__(
+        self,
+        outline: Sequence[tuple[float, float]],
+        smooth: bool = True,
+        close: bool = True,
+    ) -> None:
+        self.source = outline
+        self.xy = np.asarray(outline, dtype=np.float64).reshape(-1, 2)
+        self.smooth = smooth
+        self.close = close
+        # (epsilon, kept indices), finest first
+        self.levels: list[tuple[float, np.ndarray]] = getattr(outline, "lods", None) or outline_lods(self.xy)
+        self._paths: dict[tuple[float, float], QPainterPath] = {}
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    def level_for(self, scale: float) -> int:
+        """Coarsest level whose simplification error is invisible at scale px/unit."""
+        best = 0
+        for i, (eps, _idx) in enumerate(self.levels):
+            if eps * scale <= LOD_TOLERANCE_PX:
+                best = i
+        return best
+
+    def path(self, sx: float, sy: float) -> QPainterPath:
+        """Outline projected at (sx, sy) px per unit — built once per scale."""
+        key = (round(sx, 3), round(sy, 3))
+        path = self._paths.get(key)
+        if path is None:
+            if len(self._paths) >= self._MAX_PATHS:
+                self._paths.clear()
+            eps, idx = self.levels[self.level_for(max(sx, sy))]
+            # Simplified levels are already within tolerance of the trace as a
+            # polyline; bezier smoothing there would cut the kept corners
+            path = _build_path((self.xy[idx] * (sx, sy)).tolist(), self.smooth and eps == 0.0, self.close)
+            self._paths[key] = path
+        return path
+
+    def point_at(self, progress: float) -> tuple[float, float]:
+        """(x, y) at 0-1 progress, by point index along the full-resolution outline."""
+        return _interpolate_outline(self.xy, progress)
+
+    def span(self, start: float, end: float, sx: float, sy: float) -> QPolygonF:
+        """Polyline between two progress values (scaled coordinates), at the path's LOD."""
+        n = len(self.xy)
+        if n < 2 or end <= start:
+            return QPolygonF()
+        idx = self.levels[self.level_for(max(sx, sy))][1]
+        a, b = (start % 1.0) * n, (start % 1.0 + (end - start)) * n
+        inner = idx[(idx > a) & (idx < b)] if b <= n else np.concatenate((idx[idx > a], idx[idx < b - n] + n))
+        head = _interpolate_outline(self.xy, start)
+        tail = _interpolate_outline(self.xy, end)
+        pts = np.vstack(([head], self.xy[inner % n], [tail]))
+        return to_polygon(pts[:, 0] * sx, pts[:, 1] * sy)
+
+
+# A few outlines per process: the active track's, plus TrackMapWidget's circuit
+_GEOMETRY: dict[int, OutlineGeometry] = {}
+_MAX_GEOMETRY = 4
+
+
+def outline_geometry(outline: Sequence[tuple[float, float]]) -> OutlineGeometry:
+    """Cached OutlineGeometry for an outline list (keyed by identity)."""
+    geom = _GEOMETRY.get(id(outline))
+    if geom is None or geom.source is not outline:
+        if len(_GEOMETRY) >= _MAX_GEOMETRY:
+            _GEOMETRY.clear()
+        geom = OutlineGeometry(outline)
+        _GEOMETRY[id(outline)] = geom
+    return geom
+
+
+class _MapPanel:
+    """Static half of one track map panel (per rect + style)."""
+
+    def __init__(self, x: int, y: int, w: int, h: int, style: str) -> None:
+        self.rect = (x, y, w, h)
+        self.style = style
+        self.geometry: Optional[OutlineGeometry] = None
+        self.track_name = ""
+        self.layer = StaticLayer(self._paint, rect=QRectF(x, y, w, h))
+
+    def _paint(self, p: QPainter) -> None:
+        _paint_static(p, *self.rect, self.geometry, self.track_name, self.style)
+
+
+_PANELS: dict[tuple, _MapPanel] = {}
+
 
 def paint_track_map(
     p: QPainter,
@@ -45,6 +175,9 @@ def paint_track_map(
     progress: float = 0.0,
     track_name: str = "",
     style: str = "schematic",
+    current_sector: int = -1,
+    sector_starts: Sequence[float] = (),
+    sector_count: int = 0,
 ) -> None:
     """Draw a circuit outline in the given screen rectangle.
 
@@ -55,30 +188,113 @@ def paint_track_map(
         progress: 0-1 lap progress (positions the car dot along outline).
         track_name: Shown in dim gray at bottom of the panel.
         style: "schematic" (thin outline) or "gt" (Gran Turismo thick road band).
+        current_sector: Sector to highlight (-1 = none).
+        sector_starts: 0-1 progress at which each sector begins; sectors
+            past the end of the list are spread evenly over the remainder.
+        sector_count: Total sectors (for the even split of unknown starts).
     """
     if len(outline) < 3:
         _draw_no_track(p, x, y, w, h, track_name)
         return
 
+    geom = outline_geometry(outline)
+    key = (x, y, w, h, style)
+    panel = _PANELS.get(key)
+    if panel is None:
+        panel = _PANELS[key] = _MapPanel(x, y, w, h, style)
+    panel.geometry = geom
+    panel.track_name = track_name
+    panel.layer.draw(p, key=(id(geom), track_name))
+
+    sx, sy = w - 2 * _MARGIN_X, h - 2 * _MARGIN_Y
+    ox, oy = x + _MARGIN_X, y + _MARGIN_Y
+
     p.save()
     p.setRenderHint(QPainter.Antialiasing)
     p.setClipRect(QRectF(x, y, w, h))
 
-    # Background fill
-    p.fillRect(x, y, w, h, QColor(BG_DARK))
+    # Current sector — the only part of the outline that changes per frame
+    bounds = sector_bounds(current_sector, sector_starts, sector_count)
+    if bounds is not None:
+        p.save()
+        p.translate(ox, oy)
+        width = 6 if style == "gt" else 4
+        p.setPen(QPen(_SECTOR_GT if style == "gt" else _SECTOR_SCHEMATIC, width,
+                      Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        p.setBrush(Qt.NoBrush)
+        p.drawPolyline(geom.span(*bounds, sx, sy))
+        p.restore()
 
-    # Margin so track doesn't touch edges
-    mx, my = 12, 10
+    # Car position dot
+    car_pt = geom.point_at(progress)
+    car = QPointF(ox + car_pt[0] * sx, oy + car_pt[1] * sy)
 
-    def sx(nx: float) -> float:
-        return x + mx + nx * (w - 2 * mx)
+    p.setPen(Qt.NoPen)
+    p.setBrush(QBrush(_CAR_OUTER))
+    p.drawEllipse(car, 9, 9)
+    p.setBrush(QBrush(_CAR_MID))
+    p.drawEllipse(car, 5, 5)
+    p.setBrush(QBrush(_CAR_INNER))
+    p.drawEllipse(car, 3, 3)
+    p.setBrush(QBrush(_CAR_CENTER))
+    p.drawEllipse(car, 1.2, 1.2)
+
+    p.restore()
+
+
+def sector_bounds(current_sector: int, sector_starts: Sequence[float],
+                  sector_count: int = 0) -> Optional[tuple[float, float]]:
+    """(start, end) lap progress of current_sector, or None if unknown.
+
+    sector_starts[i] is where sector i begins. Sectors without a recorded
+    start split the rest of the lap evenly (sector_count sets how many).
+    """
+    count = max(sector_count, len(sector_starts), current_sector + 1)
+    if current_sector < 0 or count < 2:
+        return None
+    starts = list(sector_starts[:count])
+    if not starts:
+        starts = [0.0]
+    known = len(starts)
+    step = (1.0 - starts[-1]) / (count - known + 1)
+    starts += [starts[-1] + step * k for k in range(1, count - known + 1)]
+    start = starts[current_sector]
+    end = starts[current_sector + 1] if current_sector + 1 < count else 1.0
+    if end <= start:
+        return None
+    return start, end
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _paint_static(
+    p: QPainter,
+    x: int,
+    y: int,
+    w: int,
+    h: int,
+    geom: Optional[OutlineGeometry],
+    track_name: str,
+    style: str,
+) -> None:
+    """Background, track band, start/finish and name (cached layer content)."""
+    p.save()
+    p.setClipRect(QRectF(x, y, w, h))
 
-    def sy(ny: float) -> float:
-        return y + my + ny * (h - 2 * my)
+    # Background fill
+    p.fillRect(x, y, w, h, QColor(BG_DARK))
+    if geom is None:
+        p.restore()
+        return
 
-    # Build circuit path
-    path = _build_path(outline, sx, sy)
+    sx, sy = w - 2 * _MARGIN_X, h - 2 * _MARGIN_Y
+    ox, oy = x + _MARGIN_X, y + _MARGIN_Y
 
+    p.save()
+    p.translate(ox, oy)
+    path = geom.path(sx, sy)
     if style == "gt":
         # Gran Turismo style: thick road band — white kerb border + dark asphalt surface
         # Draw wider white stroke first → creates the kerb/edge lines
@@ -93,95 +309,75 @@ def paint_track_map(
         p.drawPath(path)
         p.setPen(QPen(_TRACK_EDGE, 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
         p.drawPath(path)
+    p.restore()
 
     # Start/finish line at outline[0]
-    sf = outline[0]
-    sf_x, sf_y = sx(sf[0]), sy(sf[1])
+    sf, nxt = geom.xy[0], geom.xy[1]
+    sf_x, sf_y = ox + sf[0] * sx, oy + sf[1] * sy
     sf_color = _GT_SF if style == "gt" else _SF_LINE
     # Draw a short perpendicular tick across the track
-    if len(outline) >= 2:
-        nxt = outline[1]
-        dx = sx(nxt[0]) - sf_x
-        dy = sy(nxt[1]) - sf_y
-        length = math.hypot(dx, dy) or 1.0
-        perp_x, perp_y = -dy / length, dx / length
-        tick = 10 if style == "gt" else 8
-        p.setPen(QPen(sf_color, 2 if style == "schematic" else 3))
-        p.drawLine(
-            QPointF(sf_x - perp_x * tick, sf_y - perp_y * tick),
-            QPointF(sf_x + perp_x * tick, sf_y + perp_y * tick),
-        )
-
-    # Car position dot
-    car_pt = _interpolate_outline(outline, progress)
-    car_x, car_y = sx(car_pt[0]), sy(car_pt[1])
-
-    p.setPen(Qt.NoPen)
-    p.setBrush(QBrush(_CAR_OUTER))
-    p.drawEllipse(QPointF(car_x, car_y), 9, 9)
-    p.setBrush(QBrush(_CAR_MID))
-    p.drawEllipse(QPointF(car_x, car_y), 5, 5)
-    p.setBrush(QBrush(_CAR_INNER))
-    p.drawEllipse(QPointF(car_x, car_y), 3, 3)
-    p.setBrush(QBrush(_CAR_CENTER))
-    p.drawEllipse(QPointF(car_x, car_y), 1.2, 1.2)
+    dx = (nxt[0] - sf[0]) * sx
+    dy = (nxt[1] - sf[1]) * sy
+    length = math.hypot(dx, dy) or 1.0
+    perp_x, perp_y = -dy / length, dx / length
+    tick = 10 if style == "gt" else 8
+    p.setPen(QPen(sf_color, 2 if style == "schematic" else 3))
+    p.drawLine(
+        QPointF(sf_x - perp_x * tick, sf_y - perp_y * tick),
+        QPointF(sf_x + perp_x * tick, sf_y + perp_y * tick),
+    )
 
     # Track name — dim gray at bottom left
     if track_name:
-        label = track_name.upper()
         p.setPen(QColor(DIM))
-        p.setFont(QFont("Helvetica", 7))
-        p.drawText(x + 6, y + h - 5, label)
+        p.setFont(font(7))
+        p.drawText(x + 6, y + h - 5, track_name.upper())
 
     p.restore()
 
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
 def _build_path(
-    outline: list[tuple[float, float]],
-    sx,
-    sy,
+    points: list[list[float]],
+    smooth: bool = True,
+    close: bool = True,
 ) -> QPainterPath:
-    """Build a smooth QPainterPath from normalized outline points."""
+    """Build a QPainterPath through already-projected points.
+
+    smooth: quadratic bezier with control=point, end=midpoint(point, next).
+    """
     path = QPainterPath()
-    path.moveTo(sx(outline[0][0]), sy(outline[0][1]))
+    path.moveTo(points[0][0], points[0][1])
 
-    n = len(outline)
+    n = len(points)
     for i in range(1, n):
-        curr = outline[i]
-        if i + 1 < n:
-            nxt = outline[i + 1]
-            # Quadratic bezier: control=curr, end=midpoint(curr, nxt)
-            mx_ = (curr[0] + nxt[0]) / 2
-            my_ = (curr[1] + nxt[1]) / 2
-            path.quadTo(sx(curr[0]), sy(curr[1]), sx(mx_), sy(my_))
+        cx, cy = points[i]
+        if smooth and i + 1 < n:
+            nx, ny = points[i + 1]
+            path.quadTo(cx, cy, (cx + nx) / 2, (cy + ny) / 2)
         else:
-            path.lineTo(sx(curr[0]), sy(curr[1]))
+            path.lineTo(cx, cy)
 
-    # Close back to start
-    path.lineTo(sx(outline[0][0]), sy(outline[0][1]))
+    if close:
+        path.lineTo(points[0][0], points[0][1])
     return path
 
 
 def _interpolate_outline(
-    outline: list[tuple[float, float]],
+    outline,
     progress: float,
 ) -> tuple[float, float]:
     """Return (x, y) on the outline at 0-1 progress along the polyline."""
-    if not outline:
-        return (0.5, 0.5)
     n = len(outline)
+    if not n:
+        return (0.5, 0.5)
     seg_float = (progress % 1.0) * n
     idx = int(seg_float) % n
     frac = seg_float - int(seg_float)
     p0 = outline[idx]
     p1 = outline[(idx + 1) % n]
     return (
-        p0[0] + (p1[0] - p0[0]) * frac,
-        p0[1] + (p1[1] - p0[1]) * frac,
+        float(p0[0] + (p1[0] - p0[0]) * frac),
+        float(p0[1] + (p1[1] - p0[1]) * frac),
     )
 
 
@@ -196,7 +392,7 @@ def _draw_no_track(
     """Placeholder when no outline is loaded yet."""
     p.fillRect(x, y, w, h, QColor(BG_DARK))
     p.setPen(QColor(DIM))
-    p.setFont(QFont("Helvetica", 8))
+    p.setFont(font(8))
     cx, cy = x + w // 2, y + h // 2
     label = track_name.upper() if track_name else "NO TRACK OUTLINE"
     fm_w = len(label) * 5  # rough estimate
@@ -22,6 +22,8 @@ class TrackModeWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._brake_counter = 0
+        self._active = True
+        self._pending_timing = None   # Newest snapshot received while hidden
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
@@ -72,8 +74,21 @@ class TrackModeWidget(QWidget):
 
         self._findings_list.update_findings(vehicle_state.findings)
 
+    def activate(self) -> None:
+        """Screen shown: apply the newest timing parked while hidden."""
+        self._active = True
+        if self._pending_timing is not None:
+            snap, self._pending_timing = self._pending_timing, None
+            self.update_timing(snap)
+
+    def deactivate(self) -> None:
+        self._active = False
+
     def update_timing(self, snap) -> None:
         """Update timing display from a DiffState snapshot."""
+        if not self._active:
+            self._pending_timing = snap
+            return
         self._timing_display.update_timing(
             lap_count=snap.lap_count,
             current_sector=snap.current_sector,
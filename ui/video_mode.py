@@ -18,7 +18,7 @@ from ui.widgets.camera_feeds import (
 class VideoModeWidget(QWidget):
     """VIDEO mode: quad camera feed layout."""
 
-    def __init__(self, flir_reader=None, parent=None):
+    def __init__(self, thermal=None, parent=None):
         super().__init__(parent)
 
         layout = QGridLayout(self)
@@ -26,7 +26,7 @@ class VideoModeWidget(QWidget):
         layout.setSpacing(2)
 
         self._rgb = RGBCameraFeed(self)
-        self._ir = LiveThermalFeed(self)
+        self._ir = LiveThermalFeed(thermal, self)
         self._lidar = LiDARCameraFeed(self)
         self._weather = WeatherOverlayFeed(self)
 
@@ -35,28 +35,31 @@ class VideoModeWidget(QWidget):
         layout.addWidget(self._lidar, 1, 0)     # Bottom-left
         layout.addWidget(self._weather, 1, 1)   # Bottom-right
 
-        # Connect live thermal frames if reader provided
-        if flir_reader is not None:
-            flir_reader.frame_updated.connect(self._ir.on_frame)
-
         # Frame advance timer (15 fps for animated feeds)
         self._anim_timer = QTimer(self)
         self._anim_timer.setInterval(67)  # ~15fps
         self._anim_timer.timeout.connect(self._advance_frames)
         self._active = False
 
-    def showEvent(self, event):
-        """Start animation when tab becomes visible."""
-        super().showEvent(event)
+        # Repaint the thermal tile per FLIR frame (shared ThermalDisplay image)
+        if thermal is not None:
+            thermal.frame_ready.connect(self._on_thermal_frame)
+
+    def activate(self):
+        """Screen shown: start animation; the thermal tile shows the newest frame."""
         self._active = True
         self._anim_timer.start()
+        self._ir.update()
 
-    def hideEvent(self, event):
-        """Stop animation when tab is hidden to save CPU."""
-        super().hideEvent(event)
+    def deactivate(self):
+        """Screen hidden: stop animation; thermal frames go unrendered."""
         self._active = False
         self._anim_timer.stop()
 
+    def _on_thermal_frame(self):
+        if self._active:
+            self._ir.update()
+
     def _advance_frames(self):
         # LiveThermalFeed.advance_frame() is a no-op — signal-driven
         self._rgb.advance_frame()
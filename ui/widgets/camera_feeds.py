@@ -2,7 +2,7 @@
 
 Simulated feeds for RGB/LiDAR/Weather views and live thermal from FLIR Lepton 3.5.
   - RGB: Canyon road with fall foliage (Duffey Lake Road, BC)
-  - FLIR Lepton: Live 160x120 thermal image, INFERNO colormap
+  - FLIR Lepton: Live 160x120 thermal image (shared ThermalDisplay)
   - LiDAR: Point cloud / depth wireframe
   - Weather: Conditions overlay
 """
@@ -11,10 +11,10 @@ import math
 import random
 import time
 
-from PySide6.QtCore import Qt, QPointF, QRectF, Slot
+from PySide6.QtCore import Qt, QPointF, QRectF
 from PySide6.QtGui import (
     QPainter, QPen, QColor, QFont, QLinearGradient, QRadialGradient,
-    QPolygonF, QPainterPath, QImage,
+    QPolygonF, QPainterPath,
 )
 from PySide6.QtWidgets import QWidget
 
@@ -184,60 +184,17 @@ class RGBCameraFeed(_BaseCameraFeed):
 
 
 class LiveThermalFeed(QWidget):
-    """Live FLIR Lepton 3.5 thermal feed — 160x120, INFERNO colormap.
+    """Live FLIR Lepton 3.5 thermal feed — 160x120, inferno colormap.
 
-    Receives raw uint16 numpy frames via on_frame() slot (connected to
-    FLIRLeptonReader.frame_updated signal). Normalizes to 8-bit, applies
-    cv2.COLORMAP_INFERNO, and scales to widget size with aspect ratio preserved.
-    Falls back to a dark NO SIGNAL panel if no frame received.
+    Paints the shared ThermalDisplay image (rendered once per FLIR frame for
+    every thermal widget), scaled to widget size with aspect ratio preserved.
+    The owner calls update() when ThermalDisplay.frame_ready fires. Falls
+    back to a dark NO SIGNAL panel if no frame received.
     """
 
-    def __init__(self, parent=None):
+    def __init__(self, thermal=None, parent=None):
         super().__init__(parent)
-        self._qimage = None          # last rendered QImage (RGB888)
-        self._last_frame_ts = 0.0    # monotonic timestamp of last received frame
-        self._frame_count = 0
-        self._cv2 = None
-        self._np = None
-        try:
-            import cv2
-            import numpy as np
-            self._cv2 = cv2
-            self._np = np
-        except ImportError:
-            pass
-
-    @Slot(object)
-    def on_frame(self, np_frame) -> None:
-        """Receive a raw uint16 numpy frame and convert to displayable QImage."""
-        if self._cv2 is None or self._np is None:
-            return
-        try:
-            frame = self._np.array(np_frame, dtype=self._np.uint16)
-            if frame.size == 0:
-                return
-
-            # Normalize 16-bit to 8-bit
-            f_min = float(frame.min())
-            f_max = float(frame.max())
-            if f_max > f_min:
-                norm = ((frame.astype(self._np.float32) - f_min) / (f_max - f_min) * 255.0)
-            else:
-                norm = self._np.zeros_like(frame, dtype=self._np.float32)
-            gray8 = norm.astype(self._np.uint8)
-
-            # Apply INFERNO colormap (BGR output from cv2)
-            colored = self._cv2.applyColorMap(gray8, self._cv2.COLORMAP_INFERNO)
-            # Convert BGR -> RGB
-            rgb = self._cv2.cvtColor(colored, self._cv2.COLOR_BGR2RGB)
-
-            h, w, _ = rgb.shape
-            self._qimage = QImage(rgb.tobytes(), w, h, w * 3, QImage.Format_RGB888).copy()
-            self._last_frame_ts = time.monotonic()
-            self._frame_count += 1
-            self.update()
-        except Exception:
-            pass
+        self._thermal = thermal
 
     def advance_frame(self) -> None:
         """No-op — this feed is signal-driven, not timer-driven."""
@@ -247,15 +204,17 @@ class LiveThermalFeed(QWidget):
         p = QPainter(self)
         w, h = self.width(), self.height()
 
-        staleness_ms = int((time.monotonic() - self._last_frame_ts) * 1000) if self._last_frame_ts else -1
+        thermal = self._thermal
+        staleness_ms = thermal.staleness_ms() if thermal is not None else -1
+        image = thermal.image() if thermal is not None and 0 <= staleness_ms < 2000 else None
 
-        if self._qimage is not None and staleness_ms < 2000:
-            # Scale with aspect ratio preserved, centered
-            scaled = self._qimage.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            x_off = (w - scaled.width()) // 2
-            y_off = (h - scaled.height()) // 2
+        if image is not None:
+            # Scale with aspect ratio preserved, centered (no scaled() copy)
+            scale = min(w / image.width(), h / image.height())
+            sw, sh = image.width() * scale, image.height() * scale
             p.fillRect(0, 0, w, h, QColor(BG_DARK))
-            p.drawImage(x_off, y_off, scaled)
+            p.setRenderHint(QPainter.SmoothPixmapTransform)
+            p.drawImage(QRectF((w - sw) / 2, (h - sh) / 2, sw, sh), image)
         else:
             # NO SIGNAL panel
             p.fillRect(0, 0, w, h, QColor("#0A0A0A"))
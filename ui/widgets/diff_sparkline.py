@@ -1,7 +1,8 @@
 """KiSTI - DIFF Sparkline Widget
 
 Ring-buffer QPainter sparkline for 10-second rolling history.
-200 samples at 20 Hz.  Lightweight: no plotting libs, no QPixmap cache.
+200 samples at 20 Hz by default; longer windows cost the same to draw
+(min/max decimation per pixel column, see ui.widgets.time_series).
 
 Renders:
   - Dark background
@@ -13,26 +14,18 @@ Renders:
 
 from __future__ import annotations
 
-from collections import deque
-
 from PySide6.QtCore import Qt, QPointF, QRectF
-from PySide6.QtGui import (
-    QColor,
-    QFont,
-    QLinearGradient,
-    QPainter,
-    QPainterPath,
-    QPen,
-)
+from PySide6.QtGui import QColor, QPainter, QPen
 from PySide6.QtWidgets import QWidget
 
-from ui.theme import BG_DARK, DIM, GRAY, WHITE
+from ui.theme import BG_DARK, DIM, GRAY, color, font, pen
+from ui.widgets.time_series import TimeSeriesWidget
 
 # 10 seconds at 20 Hz = 200 samples
 BUFFER_SIZE: int = 200
 
 
-class DiffSparkline(QWidget):
+class DiffSparkline(TimeSeriesWidget):
     """Compact sparkline with ring buffer, label, and optional zero-line.
 
     Args:
@@ -41,6 +34,7 @@ class DiffSparkline(QWidget):
         min_val: Expected minimum value (for Y-axis scaling).
         max_val: Expected maximum value.
         show_zero_line: Draw a horizontal line at y=0 (for signed signals).
+        capacity: Samples of history kept (default 10 s at 20 Hz).
         parent: Parent widget.
     """
 
@@ -52,9 +46,10 @@ class DiffSparkline(QWidget):
         max_val: float = 100.0,
         show_zero_line: bool = False,
         compact: bool = False,
+        capacity: int = BUFFER_SIZE,
         parent: QWidget | None = None,
     ) -> None:
-        super().__init__(parent)
+        super().__init__(capacity, parent)
         self._label = label
         self._color = QColor(color)
         self._min_val = min_val
@@ -62,21 +57,14 @@ class DiffSparkline(QWidget):
         self._show_zero_line = show_zero_line
         self._compact = compact
         self._label_w = 36 if compact else 48
-        self._buffer: deque[float] = deque(maxlen=BUFFER_SIZE)
 
         # Fill color = line color at 25% opacity
         self._fill_color = QColor(self._color)
         self._fill_color.setAlphaF(0.20)
+        self._line_pen = QPen(self._color, 1.5)
 
         self.setMinimumHeight(22 if compact else 28)
 
-    def push(self, value: float) -> None:
-        """Append a sample to the ring buffer."""
-        self._buffer.append(value)
-
-    def clear_buffer(self) -> None:
-        self._buffer.clear()
-
     def paintEvent(self, event) -> None:  # noqa: N802
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
@@ -84,7 +72,7 @@ class DiffSparkline(QWidget):
         h = self.height()
 
         # Background
-        p.fillRect(0, 0, w, h, QColor(BG_DARK))
+        p.fillRect(0, 0, w, h, color(BG_DARK))
 
         # Label area
         label_w = self._label_w
@@ -92,58 +80,31 @@ class DiffSparkline(QWidget):
         chart_w = w - label_w - 2  # 2px right margin
 
         # Draw label
-        p.setPen(QPen(QColor(GRAY), 1))
-        p.setFont(QFont("Helvetica", 8 if self._compact else 9, QFont.Bold))
+        p.setPen(pen(GRAY, 1))
+        p.setFont(font(8 if self._compact else 9, bold=True))
         p.drawText(QRectF(2, 0, label_w - 4, h), Qt.AlignVCenter | Qt.AlignLeft, self._label)
 
         # Border around chart area
-        p.setPen(QPen(QColor(DIM), 1))
+        p.setPen(pen(DIM, 1))
         p.drawRect(chart_x, 0, chart_w, h - 1)
 
-        n = len(self._buffer)
-        if n < 2:
+        if len(self._buffer) < 2:
             p.end()
             return
 
         # Y-axis range — use configured min/max but auto-expand if data exceeds
-        lo = self._min_val
-        hi = self._max_val
-        data_lo = min(self._buffer)
-        data_hi = max(self._buffer)
-        if data_lo < lo:
-            lo = data_lo
-        if data_hi > hi:
-            hi = data_hi
+        lo = min(self._min_val, self._buffer.min)
+        hi = max(self._max_val, self._buffer.max)
         span = hi - lo if hi != lo else 1.0
 
         # Zero line
         if self._show_zero_line and lo < 0 < hi:
             zero_y = h - 1 - (0 - lo) / span * (h - 2)
-            p.setPen(QPen(QColor(DIM), 1, Qt.DashLine))
+            p.setPen(pen(DIM, 1, Qt.DashLine))
             p.drawLine(QPointF(chart_x, zero_y), QPointF(chart_x + chart_w, zero_y))
 
-        # Build point list
-        points: list[QPointF] = []
-        for i, v in enumerate(self._buffer):
-            x = chart_x + chart_w * i / (n - 1)
-            y = h - 1 - (v - lo) / span * (h - 2)
-            points.append(QPointF(x, y))
-
-        # Filled area under curve
-        fill_path = QPainterPath()
-        fill_path.moveTo(QPointF(points[0].x(), h - 1))
-        for pt in points:
-            fill_path.lineTo(pt)
-        fill_path.lineTo(QPointF(points[-1].x(), h - 1))
-        fill_path.closeSubpath()
-        p.setPen(Qt.NoPen)
-        p.setBrush(self._fill_color)
-        p.drawPath(fill_path)
-
-        # Signal line
-        p.setPen(QPen(self._color, 1.5))
-        p.setBrush(Qt.NoBrush)
-        for i in range(len(points) - 1):
-            p.drawLine(points[i], points[i + 1])
+        # Filled area under curve + signal line
+        self.draw_series(p, QRectF(chart_x, 1, chart_w, h - 2), lo, hi,
+                         self._line_pen, self._fill_color)
 
         p.end()
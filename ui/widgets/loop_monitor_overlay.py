@@ -0,0 +1,105 @@
+"""KiSTI - Loop Monitor Overlay
+
+Translucent top-right panel over every screen showing main-thread health
+from a LoopMonitor: event-loop lag, dropped frames, the busiest subsystems
+and the culprits of the most recent drops. Toggled from SETTINGS (or F12);
+repaints at 2 Hz only while shown.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtCore import QRectF, Qt, QTimer
+from PySide6.QtGui import QPainter
+from PySide6.QtWidgets import QWidget
+
+from ui.loop_monitor import LoopMonitor
+from ui.theme import CYAN, GRAY, GREEN, RED, WHITE, YELLOW, brush, color, font, pen
+
+_PANEL_W = 300
+_ROW_H = 13
+_PAD = 6
+_TOP_ROWS = 6
+_DROP_ROWS = 3
+
+
+class LoopMonitorOverlay(QWidget):
+    """Live LoopMonitor readout; transparent to input."""
+
+    def __init__(self, monitor: LoopMonitor, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self._monitor = monitor
+        self._timer = QTimer(self)
+        self._timer.setInterval(500)
+        self._timer.timeout.connect(self.update)
+        self.hide()
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Show (and start refreshing) or hide the overlay."""
+        if enabled:
+            self.show()
+            self.raise_()
+            self._timer.start()
+        else:
+            self._timer.stop()
+            self.hide()
+
+    def paintEvent(self, event) -> None:  # noqa: N802
+        monitor = self._monitor
+        top = monitor.top(_TOP_ROWS)
+        drops = list(monitor.drops)[-_DROP_ROWS:]
+        rows = 3 + len(top) + (1 + len(drops) if drops else 0)
+        x0 = self.width() - _PANEL_W - _PAD
+        panel = QRectF(x0, _PAD, _PANEL_W, rows * _ROW_H + 2 * _PAD)
+
+        p = QPainter(self)
+        p.fillRect(panel, brush("#000000", alpha=190))
+        p.setPen(pen(GRAY))
+        p.drawRect(panel)
+
+        x, y = x0 + _PAD, _PAD * 2 + 9
+        lag = monitor.lag
+        late = lag.percentile(99) >= monitor.interval_ms
+        p.setFont(font(8, bold=True))
+        p.setPen(color(CYAN))
+        p.drawText(int(x), int(y), "MAIN THREAD")
+        p.setPen(color(RED if late else GREEN))
+        p.drawText(int(x + 90), int(y),
+                   f"lag {lag.mean_ms:.1f} / p99 {lag.percentile(99):g} / max {lag.max_ms:.0f} ms")
+        y += _ROW_H
+        p.setPen(color(RED if monitor.dropped_frames else WHITE))
+        p.drawText(int(x), int(y), f"dropped frames: {monitor.dropped_frames}")
+        y += _ROW_H
+
+        p.setFont(font(7, bold=True))
+        p.setPen(color(GRAY))
+        p.drawText(int(x), int(y), "SUBSYSTEM")
+        for label, dx in (("calls", 150), ("mean", 195), ("max ms", 240)):
+            p.drawText(int(x + dx), int(y), label)
+        y += _ROW_H
+
+        p.setFont(font(7))
+        for name, hist in top:
+            p.setPen(color(YELLOW if hist.max_ms >= monitor.interval_ms else WHITE))
+            p.drawText(int(x), int(y), name[:24])
+            p.drawText(int(x + 150), int(y), str(hist.total))
+            p.drawText(int(x + 195), int(y), f"{hist.mean_ms:.2f}")
+            p.drawText(int(x + 240), int(y), f"{hist.max_ms:.1f}")
+            y += _ROW_H
+
+        if drops:
+            p.setFont(font(7, bold=True))
+            p.setPen(color(GRAY))
+            p.drawText(int(x), int(y), "LAST DROPS")
+            y += _ROW_H
+            p.setFont(font(7))
+            p.setPen(color(RED))
+            for drop in reversed(drops):
+                p.drawText(int(x), int(y),
+                           f"+{drop.lag_ms:.0f}ms  {drop.culprit} {drop.culprit_ms:.1f}ms")
+                y += _ROW_H
+        p.end()
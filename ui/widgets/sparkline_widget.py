@@ -3,52 +3,43 @@
 Mini QPainter line chart - STI style: red line on black face.
 """
 
-from PySide6.QtCore import Qt, QPointF
-from PySide6.QtGui import QPainter, QPen, QColor
-from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QPainter
 
-from ui.theme import RED, DIM, BG_DARK
+from ui.theme import RED, DIM, BG_DARK, color, pen
+from ui.widgets.time_series import TimeSeriesWidget
 
+# Samples kept; older values are dropped by update_data()/push()
+HISTORY_SIZE = 512
 
-class SparklineWidget(QWidget):
+
+class SparklineWidget(TimeSeriesWidget):
     """Compact sparkline chart - STI red needle style."""
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._data = []
+    def __init__(self, parent=None, capacity=HISTORY_SIZE):
+        super().__init__(capacity, parent)
         self.setFixedSize(60, 20)
 
     def update_data(self, values):
-        self._data = list(values)
+        self._buffer.clear()
+        self._buffer.extend(values)
         self.update()
 
     def paintEvent(self, event):
-        if len(self._data) < 2:
+        if len(self._buffer) < 2:
             return
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
         w, h = self.width(), self.height()
 
         # Black face
-        p.fillRect(0, 0, w, h, QColor(BG_DARK))
-
-        lo = min(self._data)
-        hi = max(self._data)
-        span = hi - lo if hi != lo else 1.0
+        p.fillRect(0, 0, w, h, color(BG_DARK))
 
         # Baseline
-        p.setPen(QPen(QColor(DIM), 1))
+        p.setPen(pen(DIM, 1))
         p.drawLine(0, h // 2, w, h // 2)
 
         # Sparkline - red like a needle trace
-        p.setPen(QPen(QColor(RED), 1.5))
-        n = len(self._data)
-        points = []
-        for i, v in enumerate(self._data):
-            x = w * i / (n - 1)
-            y = h - (h - 2) * (v - lo) / span - 1
-            points.append(QPointF(x, y))
-        for i in range(len(points) - 1):
-            p.drawLine(points[i], points[i + 1])
+        self.draw_series(p, QRectF(0, 1, w, h - 2), self._buffer.min, self._buffer.max, pen(RED, 1.5))
 
         p.end()
@@ -10,15 +10,17 @@ import math
 
 from PySide6.QtCore import Qt, QRectF, QPointF
 from PySide6.QtGui import (
-    QPainter, QPen, QColor, QBrush, QFont, QPainterPath,
+    QPainter, QPen, QColor, QBrush, QPainterPath,
     QRadialGradient, QLinearGradient,
 )
 from PySide6.QtWidgets import QWidget
 
+from ui.layers import StaticLayer
 from ui.theme import (
     BG_DARK, BG_PANEL, HIGHLIGHT, CHERRY, WHITE, GRAY, DIM,
     CHROME_DARK, CHROME_MID,
     TIRE_BLUE, TIRE_GREEN, TIRE_YELLOW, TIRE_RED,
+    color, font, pen,
 )
 from config import (
     TIRE_TEMP_GREEN_MAX, TIRE_TEMP_YELLOW_MAX,
@@ -96,6 +98,9 @@ class StiHeatmapWidget(QWidget):
             "RR": (85.0, 250.0, 1.0),
         }
         self._oil_temp = 95.0
+        # Static layers — rebuilt automatically on resize
+        self._background = StaticLayer(self._paint_background)
+        self._body = StaticLayer(lambda p: self._draw_sti_hatch_body(p, *self._car_rect()))
 
     def update_data(self, vehicle_state):
         """Update from VehicleState."""
@@ -109,16 +114,28 @@ class StiHeatmapWidget(QWidget):
     def paintEvent(self, event):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
-        w, h = self.width(), self.height()
+        car_x, car_y, car_w, car_h = self._car_rect()
 
-        # Background
-        p.fillRect(0, 0, w, h, QColor(BG_DARK))
+        # Background, chrome border, header (cached)
+        self._background.draw(p)
 
-        # Chrome border
-        p.setPen(QPen(QColor(CHROME_DARK), 1))
-        p.drawRect(0, 0, w - 1, h - 1)
+        # -- Draw heatmap zones FIRST (behind the car) --
+        self._draw_heat_zones(p, car_x, car_y, car_w, car_h)
+
+        # -- STI hatchback silhouette outline (cached overlay) --
+        self._body.draw(p)
 
-        # Calculate car dimensions - centered, with padding
+        # -- Draw wheel positions with brake discs inside --
+        self._draw_wheels_and_brakes(p, car_x, car_y, car_w, car_h)
+
+        # -- Corner labels --
+        self._draw_corner_labels(p, car_x, car_y, car_w, car_h)
+
+        p.end()
+
+    def _car_rect(self):
+        """Car bbox (x, y, w, h) — centered, with padding."""
+        w, h = self.width(), self.height()
         pad = 16
         # Hatchback is slightly shorter than sedan — ~2.3:1 aspect
         avail_w = w - 2 * pad
@@ -126,34 +143,27 @@ class StiHeatmapWidget(QWidget):
         car_aspect = 2.3
 
         # Fit car into available space
-        if avail_h / avail_w > car_aspect:
+        if avail_h / max(avail_w, 1) > car_aspect:
             car_w = avail_w
             car_h = car_w * car_aspect
         else:
             car_h = avail_h
             car_w = car_h / car_aspect
 
-        car_x = (w - car_w) / 2
-        car_y = pad + 16 + (avail_h - car_h) / 2
+        return (w - car_w) / 2, pad + 16 + (avail_h - car_h) / 2, car_w, car_h
 
-        # Header label
-        p.setPen(QColor(HIGHLIGHT))
-        p.setFont(QFont("Helvetica", 10, QFont.Bold))
-        p.drawText(pad, pad + 12, "THERMAL MAP")
-
-        # -- Draw heatmap zones FIRST (behind the car) --
-        self._draw_heat_zones(p, car_x, car_y, car_w, car_h)
-
-        # -- Draw STI hatchback silhouette outline --
-        self._draw_sti_hatch_body(p, car_x, car_y, car_w, car_h)
-
-        # -- Draw wheel positions with brake discs inside --
-        self._draw_wheels_and_brakes(p, car_x, car_y, car_w, car_h)
+    def _paint_background(self, p):
+        w, h = self.width(), self.height()
+        p.fillRect(0, 0, w, h, color(BG_DARK))
 
-        # -- Corner labels --
-        self._draw_corner_labels(p, car_x, car_y, car_w, car_h)
+        # Chrome border
+        p.setPen(pen(CHROME_DARK, 1))
+        p.drawRect(0, 0, w - 1, h - 1)
 
-        p.end()
+        # Header label
+        p.setPen(color(HIGHLIGHT))
+        p.setFont(font(10, bold=True))
+        p.drawText(16, 28, "THERMAL MAP")
 
     def _draw_sti_hatch_body(self, p, cx, cy, cw, ch):
         """Draw 2014 STI 5-door hatchback top-down silhouette."""
@@ -209,14 +219,14 @@ class StiHeatmapWidget(QWidget):
         p.drawPath(body)
 
         # Body outline — chrome
-        p.setPen(QPen(QColor(CHROME_MID), 1.5))
+        p.setPen(pen(CHROME_MID, 1.5))
         p.setBrush(Qt.NoBrush)
         p.drawPath(body)
 
         # -- Interior details --
 
         # Windshield (A-pillars converging forward)
-        p.setPen(QPen(QColor(CHROME_DARK), 1))
+        p.setPen(pen(CHROME_DARK, 1))
         p.drawLine(int(cx + cw * 0.24), int(cy + ch * 0.20),
                    int(cx + cw * 0.30), int(cy + ch * 0.30))
         p.drawLine(int(cx + cw * 0.76), int(cy + ch * 0.20),
@@ -236,7 +246,7 @@ class StiHeatmapWidget(QWidget):
                    int(cx + cw * 0.68), int(cy + ch * 0.80))
 
         # Roof rails (hatch has them — C-pillar to D-pillar)
-        p.setPen(QPen(QColor(DIM), 1, Qt.DashLine))
+        p.setPen(pen(DIM, 1, Qt.DashLine))
         p.drawLine(int(cx + cw * 0.30), int(cy + ch * 0.30),
                    int(cx + cw * 0.30), int(cy + ch * 0.68))
         p.drawLine(int(cx + cw * 0.70), int(cy + ch * 0.30),
@@ -249,29 +259,29 @@ class StiHeatmapWidget(QWidget):
         scoop.lineTo(cx + cw * 0.56, cy + ch * 0.17)
         scoop.lineTo(cx + cw * 0.44, cy + ch * 0.17)
         scoop.closeSubpath()
-        p.setPen(QPen(QColor(CHROME_DARK), 1))
+        p.setPen(pen(CHROME_DARK, 1))
         p.setBrush(QColor(20, 20, 20))
         p.drawPath(scoop)
 
         # Rear spoiler / wing (STI hatch wing sits at roofline-tailgate junction)
         spoiler_y = cy + ch * 0.87
-        p.setPen(QPen(QColor(CHROME_MID), 2))
+        p.setPen(pen(CHROME_MID, 2))
         p.drawLine(int(cx + cw * 0.16), int(spoiler_y),
                    int(cx + cw * 0.84), int(spoiler_y))
         # Spoiler endplates (wider on hatch)
-        p.setPen(QPen(QColor(CHROME_MID), 1.5))
+        p.setPen(pen(CHROME_MID, 1.5))
         p.drawLine(int(cx + cw * 0.16), int(spoiler_y - 4),
                    int(cx + cw * 0.16), int(spoiler_y + 4))
         p.drawLine(int(cx + cw * 0.84), int(spoiler_y - 4),
                    int(cx + cw * 0.84), int(spoiler_y + 4))
 
         # Hatch seam line (where the hatch opens)
-        p.setPen(QPen(QColor(DIM), 0.5))
+        p.setPen(pen(DIM, 0.5))
         p.drawLine(int(cx + cw * 0.22), int(cy + ch * 0.84),
                    int(cx + cw * 0.78), int(cy + ch * 0.84))
 
         # Center line (subtle)
-        p.setPen(QPen(QColor(DIM), 0.5, Qt.DotLine))
+        p.setPen(pen(DIM, 0.5, Qt.DotLine))
         p.drawLine(int(cx + cw * 0.5), int(cy + ch * 0.02),
                    int(cx + cw * 0.5), int(cy + ch * 0.96))
 
@@ -392,7 +402,7 @@ class StiHeatmapWidget(QWidget):
 
     def _draw_corner_labels(self, p, cx, cy, cw, ch):
         """Draw small corner name labels near each wheel."""
-        p.setFont(QFont("Helvetica", 7, QFont.Bold))
+        p.setFont(font(7, bold=True))
 
         # Offset labels outside the wheels
         label_offsets = {
@@ -413,5 +423,5 @@ class StiHeatmapWidget(QWidget):
 
         # Engine label
         p.setPen(QColor(_oil_heat_color(self._oil_temp)))
-        p.setFont(QFont("Helvetica", 6))
+        p.setFont(font(6))
         p.drawText(int(cx + cw * 0.43), int(cy + ch * 0.22), "ENG")
@@ -0,0 +1,255 @@
+"""KiSTI - Time-Series Widget Base
+
+Shared plumbing for sparklines and trails:
+
+  - RingBuffer: preallocated NumPy ring buffer with O(1) amortized
+    running min/max (monotonic queues), so autoscaling never scans history
+  - minmax_columns(): per-pixel-column min/max reduction — a window of
+    minutes costs the same to draw as ten seconds, and spikes survive
+  - to_polygon(): NumPy x/y arrays → QPolygonF in one copy, drawn with a
+    single drawPolyline/drawPolygon instead of one drawLine per segment
+  - TimeSeriesWidget: QWidget base owning a RingBuffer with push() and
+    draw_series(painter, rect, lo, hi, pen, fill)
+"""
+
+from __future__ import annotations
+
+import ctypes
+from collections import deque
+from typing import Optional
+
+import numpy as np
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QColor, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import QWidget
+
+try:
+    import shiboken6
+except ImportError:  # pragma: no cover — ships with PySide6
+    shiboken6 = None
+
+
+class RingBuffer:
+    """Fixed-capacity float ring buffer with running min/max.
+
+    Oldest samples are overwritten once full. values() returns samples
+    oldest-first (a view when contiguous — copy it if you need to keep it
+    past the next push).
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self._data = np.zeros(capacity, dtype=dtype)
+        self._start = 0
+        self._len = 0
+        self._seq = 0   # Total samples ever pushed; oldest held = _seq - _len
+        self._min_q: deque[tuple[int, float]] = deque()  # Increasing values
+        self._max_q: deque[tuple[int, float]] = deque()  # Decreasing values
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> float:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("ring buffer index out of range")
+        return float(self._data[(self._start + i) % len(self._data)])
+
+    def push(self, value: float) -> None:
+        cap = len(self._data)
+        if self._len == cap:
+            self._data[self._start] = value
+            self._start = (self._start + 1) % cap
+        else:
+            self._data[(self._start + self._len) % cap] = value
+            self._len += 1
+        seq = self._seq
+        self._seq += 1
+        while self._min_q and self._min_q[-1][1] >= value:
+            self._min_q.pop()
+        self._min_q.append((seq, value))
+        while self._max_q and self._max_q[-1][1] <= value:
+            self._max_q.pop()
+        self._max_q.append((seq, value))
+        self._expire(self._min_q)   # Bounded by capacity even if min/max never read
+        self._expire(self._max_q)
+
+    def extend(self, values) -> None:
+        for v in values:
+            self.push(float(v))
+
+    def drop_oldest(self, count: int = 1) -> None:
+        count = min(count, self._len)
+        self._start = (self._start + count) % len(self._data)
+        self._len -= count
+
+    def clear(self) -> None:
+        self._start = 0
+        self._len = 0
+        self._min_q.clear()
+        self._max_q.clear()
+
+    def _expire(self, q: deque) -> None:
+        oldest = self._seq - self._len
+        while q and q[0][0] < oldest:
+            q.popleft()
+
+    @property
+    def min(self) -> float:
+        self._expire(self._min_q)
+        return self._min_q[0][1] if self._min_q else 0.0
+
+    @property
+    def max(self) -> float:
+        self._expire(self._max_q)
+        return self._max_q[0][1] if self._max_q else 0.0
+
+    def values(self) -> np.ndarray:
+        end = self._start + self._len
+        if end <= len(self._data):
+            return self._data[self._start:end]
+        return np.concatenate((self._data[self._start:], self._data[:end - len(self._data)]))
+
+
+def minmax_columns(values: np.ndarray, columns: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-column (min, max) of values split into ~columns equal time buckets.
+
+    Returns (sample_index, mins, maxs); sample_index is each bucket's
+    centre, with the first and last buckets pinned to the series ends.
+    """
+    n = len(values)
+    per_col = -(-n // max(1, columns))
+    cols = -(-n // per_col)
+    padded = np.empty(cols * per_col, dtype=np.float64)
+    padded[:n] = values
+    padded[n:] = values[-1]     # Only the last bucket is padded, with its own value
+    blocks = padded.reshape(cols, per_col)
+    idx = np.arange(cols) * per_col + (per_col - 1) / 2.0
+    idx[0] = 0.0
+    idx[-1] = n - 1
+    return idx, blocks.min(axis=1), blocks.max(axis=1)
+
+
+def _probe_fast_polygon() -> bool:
+    """True if QPolygonF storage is contiguous float64 pairs we can memmove into."""
+    if shiboken6 is None:
+        return False
+    try:
+        poly = QPolygonF()
+        poly.resize(2)
+        src = np.array([1.0, 2.0, 3.0, 4.0])
+        ctypes.memmove(shiboken6.getCppPointer(poly.data())[0], src.ctypes.data, src.nbytes)
+        return poly[0] == QPointF(1.0, 2.0) and poly[1] == QPointF(3.0, 4.0)
+    except Exception:
+        return False
+
+
+_FAST_POLYGON = _probe_fast_polygon()
+
+
+def to_polygon(xs: np.ndarray, ys: np.ndarray, polygon: Optional[QPolygonF] = None) -> QPolygonF:
+    """Fill (or create) a QPolygonF from coordinate arrays in one copy."""
+    n = len(xs)
+    if polygon is None:
+        polygon = QPolygonF()
+    if not _FAST_POLYGON:
+        polygon.clear()
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            polygon.append(QPointF(x, y))
+        return polygon
+    polygon.resize(n)
+    if n:
+        xy = np.empty((n, 2), dtype=np.float64)
+        xy[:, 0] = xs
+        xy[:, 1] = ys
+        ctypes.memmove(shiboken6.getCppPointer(polygon.data())[0], xy.ctypes.data, xy.nbytes)
+    return polygon
+
+
+class TimeSeriesWidget(QWidget):
+    """QWidget backed by a RingBuffer, drawn with one polygon call per layer.
+
+    draw_series() maps the buffer into a rect. Up to two samples per pixel
+    column it strokes a single polyline; past that it fills the per-column
+    min/max envelope instead (one monotone polygon — cheap to rasterize,
+    unlike a stroked zig-zag), so paint cost is bounded by the widget width,
+    not the history length.
+    """
+
+    def __init__(self, capacity: int, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._buffer = RingBuffer(capacity)
+        self._line = QPolygonF()  # Reused between paints
+        self._area = QPolygonF()
+
+    def push(self, value: float) -> None:
+        """Append a sample to the ring buffer."""
+        self._buffer.push(value)
+
+    def clear_buffer(self) -> None:
+        self._buffer.clear()
+
+    def draw_series(
+        self,
+        p: QPainter,
+        rect: QRectF,
+        lo: float,
+        hi: float,
+        line_pen: QPen,
+        fill: Optional[QColor] = None,
+    ) -> None:
+        """Draw the buffer into rect (lo at the bottom edge, hi at the top).
+
+        fill: optional color for the area between the curve and the bottom edge.
+        """
+        values = self._buffer.values()
+        n = len(values)
+        if n < 2:
+            return
+        span = hi - lo if hi != lo else 1.0
+        scale = rect.height() / span
+        bottom = rect.bottom()
+        columns = max(1, int(rect.width()))
+
+        if n <= 2 * columns:
+            xs = rect.left() + rect.width() * np.arange(n) / (n - 1)
+            ys = bottom - (values - lo) * scale
+            line = to_polygon(xs, ys, self._line)
+            if fill is not None:
+                self._fill_under(p, xs, ys, bottom, fill)
+            p.setPen(line_pen)
+            p.setBrush(Qt.NoBrush)
+            p.drawPolyline(line)
+            return
+
+        idx, mins, maxs = minmax_columns(values, columns)
+        xs = rect.left() + rect.width() * idx / (n - 1)
+        y_top = bottom - (maxs - lo) * scale
+        if fill is not None:
+            self._fill_under(p, xs, y_top, bottom, fill)
+        # Envelope band, widened by the pen so flat stretches keep its weight
+        half = line_pen.widthF() / 2.0
+        band = to_polygon(
+            np.concatenate((xs, xs[::-1])),
+            np.concatenate((y_top - half, (bottom - (mins - lo) * scale)[::-1] + half)),
+            self._line,
+        )
+        p.setPen(Qt.NoPen)
+        p.setBrush(line_pen.color())
+        p.drawPolygon(band)
+
+    def _fill_under(self, p: QPainter, xs: np.ndarray, ys: np.ndarray, bottom: float, fill: QColor) -> None:
+        area = to_polygon(
+            np.concatenate(((xs[0],), xs, (xs[-1],))),
+            np.concatenate(((bottom,), ys, (bottom,))),
+            self._area,
+        )
+        p.setPen(Qt.NoPen)
+        p.setBrush(fill)
+        p.drawPolygon(area)
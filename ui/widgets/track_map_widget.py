@@ -7,10 +7,15 @@ Main view: zoomed upcoming turn section. PIP: full track overview top-right.
 import math
 
 from PySide6.QtCore import Qt, QPointF, QRectF
-from PySide6.QtGui import QPainter, QPen, QColor, QBrush, QFont, QPainterPath
+from PySide6.QtGui import QPainter, QPen, QColor, QBrush
 from PySide6.QtWidgets import QWidget
 
-from ui.theme import DIM, CHROME_DARK, CHROME_MID, HIGHLIGHT, RED, WHITE, GRAY, BG_DARK, CYAN
+from ui.layers import StaticLayer
+from ui.track_map import OutlineGeometry
+from ui.theme import (
+    DIM, CHROME_DARK, CHROME_MID, HIGHLIGHT, RED, WHITE, GRAY, BG_DARK, CYAN,
+    brush, color, font, pen,
+)
 
 # Laguna Seca inspired circuit points (normalized 0-1)
 _CIRCUIT = [
@@ -61,19 +66,12 @@ def _interp_circuit(progress):
             p0[1] + (p1[1] - p0[1]) * seg_frac)
 
 
-def _build_track_path(tx, ty):
-    """Build smooth circuit QPainterPath using transform functions."""
-    path = QPainterPath()
-    path.moveTo(tx(_CIRCUIT[0][0]), ty(_CIRCUIT[0][1]))
-    for i in range(1, len(_CIRCUIT)):
-        curr = _CIRCUIT[i]
-        if i + 1 < len(_CIRCUIT):
-            nxt = _CIRCUIT[i + 1]
-            path.quadTo(tx(curr[0]), ty(curr[1]),
-                        tx((curr[0] + nxt[0]) / 2), ty((curr[1] + nxt[1]) / 2))
-        else:
-            path.lineTo(tx(curr[0]), ty(curr[1]))
-    return path
+# Outline geometry: smoothed path projected once per scale (the last point
+# already closes the loop)
+_CIRCUIT_GEOMETRY = OutlineGeometry(_CIRCUIT, smooth=True, close=False)
+
+# Zoomed view window in normalized units (~30% of track extent)
+_ZOOM = 0.28
 
 
 class TrackMapWidget(QWidget):
@@ -82,6 +80,7 @@ class TrackMapWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._progress = 0.0
+        self._pip_layer = StaticLayer(self._paint_pip_static)
 
     def update_position(self, gps_data):
         self._progress = (self._progress + 0.008) % 1.0
@@ -97,19 +96,15 @@ class TrackMapWidget(QWidget):
         w, h = self.width(), self.height()
 
         # Background
-        p.fillRect(0, 0, w, h, QColor(BG_DARK))
-        p.setPen(QPen(QColor(CHROME_DARK), 1))
+        p.fillRect(0, 0, w, h, color(BG_DARK))
+        p.setPen(pen(CHROME_DARK, 1))
         p.drawRect(0, 0, w - 1, h - 1)
 
         # Main view: zoomed upcoming section
         self._draw_zoomed_view(p, 0, 0, w, h)
 
         # PIP overview: top-right corner
-        pip_w = int(w * 0.30)
-        pip_h = int(h * 0.35)
-        pip_x = w - pip_w - 6
-        pip_y = 6
-        self._draw_pip_overview(p, pip_x, pip_y, pip_w, pip_h)
+        self._draw_pip_overview(p, *self._pip_rect())
 
         # Upcoming turn label — bottom left
         self._draw_turn_info(p, w, h)
@@ -127,38 +122,43 @@ class TrackMapWidget(QWidget):
         vcx = car_pos[0] + (ahead_pos[0] - car_pos[0]) * 0.4
         vcy = car_pos[1] + (ahead_pos[1] - car_pos[1]) * 0.4
 
-        # Zoom window in normalized coords (show ~30% of track extent)
-        zoom = 0.28
+        # Zoom window in normalized coords
+        zoom = _ZOOM
         vx0 = vcx - zoom / 2
         vy0 = vcy - zoom / 2
 
         m = 12
+        scale_x = (w - 2 * m) / zoom
+        scale_y = (h - 2 * m) / zoom
 
         def tx(nx):
-            return x + m + ((nx - vx0) / zoom) * (w - 2 * m)
+            return x + m + (nx - vx0) * scale_x
 
         def ty(ny):
-            return y + m + ((ny - vy0) / zoom) * (h - 2 * m)
+            return y + m + (ny - vy0) * scale_y
 
         # Clip to widget area
         p.save()
         p.setClipRect(QRectF(x, y, w, h))
 
-        # Track surface
-        track_path = _build_track_path(tx, ty)
-        p.setPen(QPen(QColor("#282828"), 14, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        # Track: cached path at this zoom, panned with the painter
+        track_path = _CIRCUIT_GEOMETRY.path(scale_x, scale_y)
+        p.save()
+        p.translate(x + m - vx0 * scale_x, y + m - vy0 * scale_y)
+        p.setPen(pen("#282828", 14, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
         p.drawPath(track_path)
 
         # Track edges
-        p.setPen(QPen(QColor(CHROME_MID), 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        p.setPen(pen(CHROME_MID, 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
         p.drawPath(track_path)
 
         # Center line
-        p.setPen(QPen(QColor("#444400"), 1, Qt.DashLine))
+        p.setPen(pen("#444400", 1, Qt.DashLine))
         p.drawPath(track_path)
+        p.restore()
 
         # Turn markers and labels
-        p.setFont(QFont("Helvetica", 10, QFont.Bold))
+        p.setFont(font(10, bold=True))
         for cx_n, cy_n, label, _ in _TURNS:
             sx = tx(cx_n)
             sy = ty(cy_n)
@@ -200,15 +200,42 @@ class TrackMapWidget(QWidget):
 
         p.restore()
 
+    def _pip_rect(self):
+        """PIP overview box (x, y, w, h): top-right corner."""
+        w, h = self.width(), self.height()
+        pip_w = int(w * 0.30)
+        pip_h = int(h * 0.35)
+        return w - pip_w - 6, 6, pip_w, pip_h
+
     def _draw_pip_overview(self, p, x, y, w, h):
         """Draw mini full-circuit overview in a PIP box."""
+        # Box, circuit, turn dots, label — only change on resize (cached)
+        self._pip_layer.draw(p)
+
+        m = 6
+
+        # Car dot
+        car_pos = _interp_circuit(self._progress)
+        car_sx = x + m + car_pos[0] * (w - 2 * m)
+        car_sy = y + m + car_pos[1] * (h - 2 * m)
+        p.setPen(Qt.NoPen)
+        p.setBrush(brush((255, 0, 0), alpha=80))
+        p.drawEllipse(QPointF(car_sx, car_sy), 5, 5)
+        p.setBrush(brush(HIGHLIGHT))
+        p.drawEllipse(QPointF(car_sx, car_sy), 3, 3)
+        p.setBrush(brush(WHITE))
+        p.drawEllipse(QPointF(car_sx, car_sy), 1, 1)
+
+    def _paint_pip_static(self, p):
+        x, y, w, h = self._pip_rect()
+
         # Semi-transparent background
         p.setPen(Qt.NoPen)
-        p.setBrush(QColor(0, 0, 0, 200))
+        p.setBrush(color((0, 0, 0), alpha=200))
         p.drawRoundedRect(QRectF(x, y, w, h), 4, 4)
 
         # Border
-        p.setPen(QPen(QColor(CHROME_DARK), 1))
+        p.setPen(pen(CHROME_DARK, 1))
         p.setBrush(Qt.NoBrush)
         p.drawRoundedRect(QRectF(x, y, w, h), 4, 4)
 
@@ -221,33 +248,24 @@ class TrackMapWidget(QWidget):
             return y + m + ny * (h - 2 * m)
 
         # Track path
-        track_path = _build_track_path(tx, ty)
-        p.setPen(QPen(QColor("#383838"), 3, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        track_path = _CIRCUIT_GEOMETRY.path(w - 2 * m, h - 2 * m)
+        p.save()
+        p.translate(x + m, y + m)
+        p.setPen(pen("#383838", 3, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
         p.drawPath(track_path)
-        p.setPen(QPen(QColor(CHROME_DARK), 1, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        p.setPen(pen(CHROME_DARK, 1, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
         p.drawPath(track_path)
+        p.restore()
 
         # Turn dots
+        p.setPen(Qt.NoPen)
+        p.setBrush(color(GRAY))
         for cx_n, cy_n, label, _ in _TURNS:
-            p.setPen(Qt.NoPen)
-            p.setBrush(QColor(GRAY))
             p.drawEllipse(QPointF(tx(cx_n), ty(cy_n)), 1.5, 1.5)
 
-        # Car dot
-        car_pos = _interp_circuit(self._progress)
-        car_sx = tx(car_pos[0])
-        car_sy = ty(car_pos[1])
-        p.setPen(Qt.NoPen)
-        p.setBrush(QBrush(QColor(255, 0, 0, 80)))
-        p.drawEllipse(QPointF(car_sx, car_sy), 5, 5)
-        p.setBrush(QBrush(QColor(HIGHLIGHT)))
-        p.drawEllipse(QPointF(car_sx, car_sy), 3, 3)
-        p.setBrush(QBrush(QColor(WHITE)))
-        p.drawEllipse(QPointF(car_sx, car_sy), 1, 1)
-
         # "LAGUNA SECA" label
-        p.setPen(QColor(GRAY))
-        p.setFont(QFont("Helvetica", 6))
+        p.setPen(color(GRAY))
+        p.setFont(font(6))
         p.drawText(x + m, y + h - m + 1, "LAGUNA SECA")
 
     def _draw_turn_info(self, p, w, h):
@@ -266,9 +284,9 @@ class TrackMapWidget(QWidget):
 
         if next_turn:
             p.setPen(QColor(CYAN))
-            p.setFont(QFont("Helvetica", 14, QFont.Bold))
+            p.setFont(font(14, bold=True))
             p.drawText(12, h - 28, next_turn)
 
             p.setPen(QColor(GRAY))
-            p.setFont(QFont("Helvetica", 8))
+            p.setFont(font(8))
             p.drawText(12, h - 14, "UPCOMING")
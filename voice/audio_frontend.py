@@ -0,0 +1,197 @@
+"""KiSTI - Mic Audio Front-End (NumPy ring buffer)
+
+The mic loop runs for the whole drive, one 32ms frame at a time. The
+front-end keeps every frame in one preallocated int16 ring and does all
+per-frame work in place:
+
+  - software gain (int32 scratch, clip, cast back into the ring slot)
+  - float32 conversion for the VAD (reused scratch buffer)
+  - RMS for the barge-in echo gate
+  - openwakeword 1280-sample chunk extraction (views over the ring)
+  - pre-roll + utterance extraction (absolute sample positions, no lists)
+
+No audio buffers are allocated per frame; the only copies out are the
+bytes handed to Qt signals when an utterance or partial window is emitted. Ring capacity is a multiple of
+both the VAD frame (512) and the OWW chunk (1280), so frame slots never
+wrap; OWW chunks only wrap after an OWW reset and are then copied into a
+scratch buffer.
+
+Per-frame CPU time is tracked in FrontEndStats and logged periodically
+by MicCapture; scripts/mic_frontend_benchmark.py compares CPU time and
+allocations against the previous bytes/list implementation.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+import numpy as np
+
+FRAME_SAMPLES = 512           # Silero VAD frame at 16kHz (32ms)
+OWW_CHUNK_SAMPLES = 1280      # openwakeword chunk (80ms)
+_RING_ALIGN = 2560            # lcm(FRAME_SAMPLES, OWW_CHUNK_SAMPLES)
+
+
+def ring_capacity(max_frames: int) -> int:
+    """Smallest aligned ring (samples) holding max_frames plus OWW slack."""
+    needed = (max_frames + 3) * FRAME_SAMPLES  # +3 frames: pending OWW chunk
+    return -(-needed // _RING_ALIGN) * _RING_ALIGN
+
+
+@dataclass
+class FrontEndStats:
+    """Per-frame processing cost for the always-on mic loop."""
+    frames: int = 0
+    cpu_ns: int = 0           # Thread CPU time spent in the loop body
+    max_cpu_ns: int = 0
+
+    @property
+    def mean_us(self) -> float:
+        return self.cpu_ns / self.frames / 1000 if self.frames else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.frames} frames, {self.mean_us:.1f}us/frame mean, "
+            f"{self.max_cpu_ns / 1000:.1f}us max"
+        )
+
+
+class AudioFrontEnd:
+    """Preallocated ring buffer for 16kHz mono int16 mic audio.
+
+    Usage:
+        fe = AudioFrontEnd(gain=3, max_frames=330)
+        while fe.fill(readinto):         # or fe.push(frame_bytes)
+            confidence = vad(fe.vad_float)
+            for chunk in fe.oww_chunks(undo_gain=True):
+                oww.predict(chunk)
+
+    Positions are absolute sample counts since construction; the ring maps
+    them onto storage modulo capacity.
+    """
+
+    def __init__(self, gain: int = 1, max_frames: int = 330) -> None:
+        self.gain = gain
+        self.capacity = ring_capacity(max_frames)
+        self.ring = np.zeros(self.capacity, dtype=np.int16)
+        self.written = 0                        # Absolute end-of-audio position
+        self.oww_pos = 0                        # Next OWW chunk start
+        self.stats = FrontEndStats()
+
+        self._landing = bytearray(FRAME_SAMPLES * 2)            # Raw frame from the pipe
+        self._landing_view = memoryview(self._landing)
+        self._raw = np.frombuffer(self._landing, dtype=np.int16)
+        self._wide = np.zeros(FRAME_SAMPLES, dtype=np.int32)    # Gain scratch
+        self.vad_float = np.zeros(FRAME_SAMPLES, dtype=np.float32)
+        self._oww_wide = np.zeros(OWW_CHUNK_SAMPLES, dtype=np.int32)
+        self._oww_out = np.zeros(OWW_CHUNK_SAMPLES, dtype=np.int16)
+        self._rms_scratch = np.zeros(OWW_CHUNK_SAMPLES, dtype=np.float32)
+        self._scale = np.float32(1.0 / 32768.0)
+        self._frame_start_ns = 0
+
+    # ---- Frame intake ----
+
+    def fill(self, readinto: Callable[[memoryview], int]) -> bool:
+        """Read one frame straight into the landing buffer. False on EOF."""
+        got = 0
+        while got < len(self._landing):
+            n = readinto(self._landing_view[got:])
+            if not n:
+                return False
+            got += n
+        self._commit()
+        return True
+
+    def push(self, frame: bytes) -> bool:
+        """Copy one frame of bytes in (for read_fn-style sources). False if short."""
+        if len(frame) < len(self._landing):
+            return False
+        self._landing_view[:] = frame[:len(self._landing)]
+        self._commit()
+        return True
+
+    def _commit(self) -> None:
+        self._frame_start_ns = time.thread_time_ns()
+        slot = self.written % self.capacity
+        dst = self.ring[slot:slot + FRAME_SAMPLES]
+        if self.gain == 1:
+            dst[:] = self._raw
+        else:
+            np.multiply(self._raw, self.gain, out=self._wide, dtype=np.int32)
+            np.clip(self._wide, -32768, 32767, out=self._wide)
+            np.copyto(dst, self._wide, casting="unsafe")
+        np.multiply(dst, self._scale, out=self.vad_float)
+        self.written += FRAME_SAMPLES
+
+    def frame_done(self) -> None:
+        """Close out per-frame CPU accounting (call at the end of the loop body)."""
+        if not self._frame_start_ns:
+            return
+        cost = time.thread_time_ns() - self._frame_start_ns
+        self._frame_start_ns = 0
+        self.stats.frames += 1
+        self.stats.cpu_ns += cost
+        if cost > self.stats.max_cpu_ns:
+            self.stats.max_cpu_ns = cost
+
+    # ---- Views ----
+
+    @property
+    def frame(self) -> np.ndarray:
+        """Latest frame (gained int16) as a view into the ring."""
+        slot = (self.written - FRAME_SAMPLES) % self.capacity
+        return self.ring[slot:slot + FRAME_SAMPLES]
+
+    def frame_bytes(self) -> bytes:
+        return self.frame.tobytes()
+
+    def pcm(self, start: int, end: int | None = None) -> bytes:
+        """Audio between absolute positions as bytes (the only copy-out)."""
+        end = self.written if end is None else end
+        start = max(start, end - self.capacity, 0)  # Older audio is overwritten
+        n = end - start
+        if n <= 0:
+            return b""
+        a = start % self.capacity
+        if a + n <= self.capacity:
+            return self.ring[a:a + n].tobytes()
+        return self.ring[a:].tobytes() + self.ring[:n - (self.capacity - a)].tobytes()
+
+    # ---- openwakeword chunking ----
+
+    def reset_oww(self) -> None:
+        """Drop any partial OWW chunk — next chunk starts at the next frame."""
+        self.oww_pos = self.written
+
+    def oww_chunks(self, undo_gain: bool = False) -> Iterator[np.ndarray]:
+        """Yield each complete 1280-sample chunk since the last call.
+
+        undo_gain=True floor-divides by the software gain (OWW was trained on
+        un-amplified audio). Yielded arrays are views or scratch buffers —
+        valid only until the next chunk. Calling reset_oww() mid-iteration
+        ends the iteration.
+        """
+        while self.oww_pos + OWW_CHUNK_SAMPLES <= self.written:
+            a = self.oww_pos % self.capacity
+            if a + OWW_CHUNK_SAMPLES <= self.capacity:
+                chunk = self.ring[a:a + OWW_CHUNK_SAMPLES]
+            else:
+                split = self.capacity - a
+                self._oww_out[:split] = self.ring[a:]
+                self._oww_out[split:] = self.ring[:OWW_CHUNK_SAMPLES - split]
+                chunk = self._oww_out
+            self.oww_pos += OWW_CHUNK_SAMPLES
+            if undo_gain and self.gain != 1:
+                np.copyto(self._oww_wide, chunk)
+                np.floor_divide(self._oww_wide, self.gain, out=self._oww_wide)
+                np.copyto(self._oww_out, self._oww_wide, casting="unsafe")
+                chunk = self._oww_out
+            yield chunk
+
+    def rms(self, samples: np.ndarray) -> int:
+        """Integer RMS of an int16 buffer (no temporaries)."""
+        scratch = self._rms_scratch if len(samples) == OWW_CHUNK_SAMPLES else self._rms_scratch[:len(samples)]
+        np.copyto(scratch, samples, casting="unsafe")
+        return int((float(np.dot(scratch, scratch)) / len(samples)) ** 0.5)
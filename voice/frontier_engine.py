@@ -13,6 +13,12 @@ Privacy-first design:
 Query resolution tier:
   persona (0ms) → frontier_cache (2ms) → live frontier (~500ms) → fallback
 
+Streaming mode: when the caller passes a SentenceStream, the live API call
+uses SSE (``"stream": true``) and hands each completed sentence to the
+stream as soon as it is decoded, so TTS can start on sentence one while
+the model is still generating. Mode truncation is applied on the fly —
+once the Sport/Sport# sentence budget is reached the connection is closed.
+
 Modeled on HybridSTTEngine WiFi-aware pattern (stt_engine.py:332-486).
 """
 
@@ -21,13 +27,14 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import queue
 import re
 import threading
 import time
 import urllib.error
 import urllib.request
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 from voice.llm_engine import (
     KISTI_SYSTEM_PROMPT,
@@ -56,6 +63,13 @@ CREATE TABLE IF NOT EXISTS frontier_cache (
 );
 """
 
+# Max sentences spoken per SI Drive mode (~100ms/word of Piper TTS each)
+MODE_MAX_SENTENCES: dict[str, int] = {"Intelligent": 99, "Sport": 2, "Sport #": 1}
+
+# Sentence boundary — same split as _truncate_sentences / tts_engine.split_sentences,
+# plus paragraph breaks (which _strip_markdown turns into ". " anyway)
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n{2,}')
+
 
 def _now() -> datetime:
     return datetime.now(timezone.utc)
@@ -81,6 +95,110 @@ def _strip_markdown(text: str) -> str:
     return text.strip()
 
 
+class SentenceAccumulator:
+    """Accumulates streamed text deltas and yields completed sentences.
+
+    A sentence is complete once its terminal punctuation is followed by
+    whitespace — the trailing fragment stays buffered until more text
+    arrives or flush() is called at end of stream.
+    """
+
+    def __init__(self) -> None:
+        self._buf = ""
+
+    def feed(self, delta: str) -> list[str]:
+        """Append a text delta. Returns sentences completed by it."""
+        self._buf += delta
+        done = []
+        while True:
+            m = _SENTENCE_BOUNDARY.search(self._buf)
+            if m is None:
+                break
+            sentence = _strip_markdown(self._buf[:m.start()])
+            self._buf = self._buf[m.end():]
+            if sentence:
+                done.append(sentence)
+        return done
+
+    def flush(self) -> list[str]:
+        """Return the buffered trailing fragment (end of stream)."""
+        sentence = _strip_markdown(self._buf)
+        self._buf = ""
+        return [sentence] if sentence else []
+
+
+class SentenceStream:
+    """Thread-safe hand-off of sentences from a streaming response to TTS.
+
+    Producer (frontier HTTP thread) calls mark_token()/put()/close().
+    Consumer (voice loop) iterates the stream; iteration ends when the
+    producer closes it or the consumer cancels (barge-in). put() returns
+    False after cancel() so the producer can drop the connection early.
+
+    Timestamps (time.monotonic) feed PipelineTrace:
+        first_token_at     — first text delta decoded
+        first_sentence_at  — first complete sentence handed to TTS
+    """
+
+    _CLOSED = object()
+
+    def __init__(self, on_first_sentence: Optional[Callable[[], None]] = None) -> None:
+        self._queue: queue.Queue = queue.Queue()
+        self._cancelled = threading.Event()
+        self._closed = False
+        self._on_first_sentence = on_first_sentence
+        self.sentences: list[str] = []
+        self.first_token_at: float = 0.0
+        self.first_sentence_at: float = 0.0
+
+    def mark_token(self) -> None:
+        if not self.first_token_at:
+            self.first_token_at = time.monotonic()
+
+    def put(self, sentence: str) -> bool:
+        """Hand a completed sentence to the consumer. False if cancelled."""
+        if self._cancelled.is_set() or self._closed:
+            return False
+        first = not self.sentences
+        self.sentences.append(sentence)
+        if first:
+            self.first_sentence_at = time.monotonic()
+        self._queue.put(sentence)
+        if first and self._on_first_sentence:
+            self._on_first_sentence()
+        return True
+
+    def close(self) -> None:
+        """Signal end of stream (idempotent)."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(self._CLOSED)
+
+    def cancel(self) -> None:
+        """Consumer-side abort — producer stops at its next put()."""
+        self._cancelled.set()
+        self._queue.put(self._CLOSED)
+
+    @property
+    def started(self) -> bool:
+        return bool(self.sentences)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.sentences)
+
+    def __iter__(self) -> Iterator[str]:
+        while not self._cancelled.is_set():
+            item = self._queue.get()
+            if item is self._CLOSED:
+                return
+            yield item
+
+
 class FrontierLLMEngine:
     """Cloud frontier AI with local DuckDB response cache.
 
@@ -210,6 +328,7 @@ class FrontierLLMEngine:
         memory_context: str = "",
         si_drive_mode: str = "Intelligent",
         conversation_history: list | None = None,
+        stream: Optional[SentenceStream] = None,
     ) -> Optional[LLMResponse]:
         """Try cache then live API. Returns None if unavailable.
 
@@ -219,15 +338,37 @@ class FrontierLLMEngine:
             memory_context: Relevant edge memories.
             si_drive_mode: Current driving mode.
             conversation_history: Recent DialogueTurn objects for multi-turn context.
+            stream: If given, a live API call streams sentences into it as
+                they complete. Cache hits never touch the stream. The stream
+                is always closed before returning.
 
         Returns:
             LLMResponse if cache hit or API success, None otherwise.
         """
+        try:
+            return self._query(
+                user_message, telemetry_context, memory_context, si_drive_mode,
+                conversation_history, stream,
+            )
+        finally:
+            if stream is not None:
+                stream.close()
+
+    def _query(
+        self,
+        user_message: str,
+        telemetry_context: str,
+        memory_context: str,
+        si_drive_mode: str,
+        conversation_history: list | None,
+        stream: Optional[SentenceStream],
+    ) -> Optional[LLMResponse]:
         if not self._running or not self._api_key:
             return None
 
         start_time = time.monotonic()
         has_history = bool(conversation_history)
+        max_s = MODE_MAX_SENTENCES.get(si_drive_mode, 2)
 
         # Tier 2: Check local cache first (skip if conversation has history —
         # same query in different contexts needs different answers)
@@ -235,7 +376,6 @@ class FrontierLLMEngine:
             query_hash = self._hash_query(user_message)
             cached = self._check_cache(query_hash)
             if cached is not None:
-                max_s = {"Intelligent": 99, "Sport": 2, "Sport #": 1}.get(si_drive_mode, 2)
                 cached = _truncate_sentences(cached, max_sentences=max_s)
                 latency = time.monotonic() - start_time
                 log.info("Frontier cache hit: %s (%.1fms)", query_hash[:8], latency * 1000)
@@ -255,17 +395,18 @@ class FrontierLLMEngine:
         response_text = self._call_api(
             user_message, telemetry_context, memory_context, si_drive_mode,
             conversation_history=conversation_history,
+            stream=stream,
         )
         if response_text is None:
             return None
 
         # Truncate to keep TTS latency bounded (~100ms/word on Piper)
-        max_s = {"Intelligent": 99, "Sport": 2, "Sport #": 1}.get(si_drive_mode, 2)
         response_text = _truncate_sentences(response_text, max_sentences=max_s)
 
         # Cache the response for offline replay (only standalone queries —
-        # conversation-dependent answers would be wrong in a different context)
-        if not has_history:
+        # conversation-dependent answers would be wrong in a different context).
+        # A barge-in cancelled stream is a partial answer — never cache it.
+        if not has_history and not (stream is not None and stream.cancelled):
             self._cache_response(query_hash, user_message, response_text, self._model)
 
         latency = time.monotonic() - start_time
@@ -337,6 +478,34 @@ class FrontierLLMEngine:
 
         return response_text
 
+    def peek_cache(self, query: str, si_drive_mode: str = "Intelligent") -> Optional[str]:
+        """Read-only cache lookup for speculation.
+
+        Returns the mode-truncated text query() would answer with on a cache
+        hit, without bumping hit counts or expiring rows.
+        """
+        if not self._running or not self._conn:
+            return None
+        try:
+            rows = self._conn.execute(
+                "SELECT response_text, created_at, ttl_days FROM frontier_cache "
+                "WHERE query_hash = ?",
+                [self._hash_query(query)],
+            ).fetchall()
+        except Exception:
+            return None
+        if not rows:
+            return None
+        response_text, created_at, ttl_days = rows[0]
+        if created_at and ttl_days:
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            if _now() > created_at + timedelta(days=ttl_days):
+                return None
+        return _truncate_sentences(
+            response_text, max_sentences=MODE_MAX_SENTENCES.get(si_drive_mode, 2),
+        )
+
     def _cache_response(
         self,
         query_hash: str,
@@ -396,12 +565,17 @@ class FrontierLLMEngine:
         memory_context: str,
         si_drive_mode: str,
         conversation_history: list | None = None,
+        stream: Optional[SentenceStream] = None,
     ) -> Optional[str]:
         """POST to Claude Messages API. Returns response text or None.
 
         When Zeus proxy is configured, routes through it first for
         centralized auth/logging/cost tracking. Falls back to direct
         Anthropic on proxy failure.
+
+        With a stream, requests SSE and forwards sentences as they complete.
+        Proxy → direct fallback only happens if the proxy failed before
+        anything was spoken.
         """
         # Give Claude enough room to finish 2 sentences cleanly.
         # System prompt enforces 1-2 sentences; _truncate_sentences is the backstop.
@@ -442,6 +616,23 @@ class FrontierLLMEngine:
             "messages": messages,
         }
 
+        if stream is not None:
+            payload["stream"] = True
+            max_sentences = MODE_MAX_SENTENCES.get(si_drive_mode, 2)
+            body = json.dumps(payload).encode("utf-8")
+            if self._proxy_url and self._proxy_key:
+                result = self._post_stream(
+                    f"{self._proxy_url}/api/proxy/anthropic/v1/messages",
+                    self._proxy_headers(), body, stream, max_sentences, "Zeus proxy",
+                )
+                if result is not None or stream.started:
+                    return result
+                log.warning("Zeus proxy stream failed — falling back to direct Anthropic")
+            return self._post_stream(
+                self._api_url, self._direct_headers(), body, stream, max_sentences,
+                "Frontier API",
+            )
+
         body = json.dumps(payload).encode("utf-8")
 
         # Try Zeus proxy first if configured
@@ -453,17 +644,27 @@ class FrontierLLMEngine:
 
         return self._post_direct(body)
 
+    def _proxy_headers(self) -> dict:
+        return {
+            "Content-Type": "application/json",
+            "X-API-Key": self._proxy_key,
+            "X-Script-Name": "kisti-frontier",
+        }
+
+    def _direct_headers(self) -> dict:
+        return {
+            "Content-Type": "application/json",
+            "x-api-key": self._api_key,
+            "anthropic-version": ANTHROPIC_VERSION,
+        }
+
     def _post_proxy(self, body: bytes) -> Optional[str]:
         """POST through Zeus proxy. Returns response text or None."""
         url = f"{self._proxy_url}/api/proxy/anthropic/v1/messages"
         req = urllib.request.Request(
             url,
             data=body,
-            headers={
-                "Content-Type": "application/json",
-                "X-API-Key": self._proxy_key,
-                "X-Script-Name": "kisti-frontier",
-            },
+            headers=self._proxy_headers(),
             method="POST",
         )
         try:
@@ -484,11 +685,7 @@ class FrontierLLMEngine:
         req = urllib.request.Request(
             self._api_url,
             data=body,
-            headers={
-                "Content-Type": "application/json",
-                "x-api-key": self._api_key,
-                "anthropic-version": ANTHROPIC_VERSION,
-            },
+            headers=self._direct_headers(),
             method="POST",
         )
         try:
@@ -517,3 +714,81 @@ class FrontierLLMEngine:
             log.warning("Frontier API returned empty response")
             return None
         return _strip_markdown(text)
+
+    def _post_stream(
+        self,
+        url: str,
+        headers: dict,
+        body: bytes,
+        stream: SentenceStream,
+        max_sentences: int,
+        label: str,
+    ) -> Optional[str]:
+        """POST with SSE streaming. Returns the full (stripped) text or None.
+
+        Each completed sentence goes to stream.put() as soon as it decodes.
+        Reading stops — and the connection is dropped — once max_sentences
+        have been emitted or the consumer cancels the stream.
+        """
+        req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+        acc = SentenceAccumulator()
+        emitted = 0
+        raw_parts: list[str] = []
+        try:
+            with urllib.request.urlopen(req, timeout=self.API_TIMEOUT_S) as resp:
+                for delta in self._iter_sse_text(resp):
+                    stream.mark_token()
+                    raw_parts.append(delta)
+                    for sentence in acc.feed(delta):
+                        if not stream.put(sentence):
+                            log.info("%s stream cancelled after %d sentences", label, emitted)
+                            return " ".join(stream.sentences) or None
+                        emitted += 1
+                        if emitted >= max_sentences:
+                            log.debug("%s stream truncated at %d sentences", label, emitted)
+                            return " ".join(stream.sentences)
+        except urllib.error.HTTPError as exc:
+            log.warning("%s stream HTTP error %d: %s", label, exc.code, exc.reason)
+            return " ".join(stream.sentences) or None
+        except (urllib.error.URLError, OSError) as exc:
+            log.warning("%s stream network error: %s", label, exc)
+            return " ".join(stream.sentences) or None
+        except (json.JSONDecodeError, KeyError, ValueError) as exc:
+            log.warning("%s stream parse error: %s", label, exc)
+            return " ".join(stream.sentences) or None
+
+        for sentence in acc.flush():
+            if emitted >= max_sentences or not stream.put(sentence):
+                break
+            emitted += 1
+
+        text = _strip_markdown("".join(raw_parts))
+        if not text:
+            log.warning("%s stream returned empty response", label)
+            return None
+        return text
+
+    @staticmethod
+    def _iter_sse_text(resp) -> Iterator[str]:
+        """Yield text deltas from a Messages API SSE response.
+
+        Only ``content_block_delta`` events with a ``text_delta`` carry text;
+        ``message_stop`` ends the stream and an ``error`` event raises.
+        """
+        for raw_line in resp:
+            line = raw_line.decode("utf-8").strip()
+            if not line.startswith("data:"):
+                continue  # event:/comment/keep-alive lines
+            data = line[5:].strip()
+            if not data:
+                continue
+            event = json.loads(data)
+            etype = event.get("type")
+            if etype == "content_block_delta":
+                delta = event.get("delta", {})
+                if delta.get("type") == "text_delta" and delta.get("text"):
+                    yield delta["text"]
+            elif etype == "message_stop":
+                return
+            elif etype == "error":
+                raise ValueError(event.get("error", {}).get("message", "stream error"))
@@ -0,0 +1,197 @@
+"""KiSTI - Compiled Intent Router
+
+Every voice handler (timing commands, cloud commands, live timing, ECU and
+ambient sensors, safety fast-path, persona) decides what to do by checking
+whether any of its keywords is a substring of the query. Done naively that
+is hundreds of `kw in query` scans per utterance, repeated handler after
+handler.
+
+KeywordTrie compiles all keywords into a character trie, emitted as a
+single regular expression with one lookahead per position, so the query is
+scanned once and every keyword occurrence (including keywords nested inside
+longer ones, e.g. "temp" in "oil temperature") is reported. Substring
+semantics are preserved exactly — "accelerat" still matches "acceleration".
+
+IntentRouter maps the hit set onto named keyword groups in handler
+precedence order and extracts slots (e.g. the lap number in "use lap 3 as
+reference"). Handlers test group membership instead of rescanning, and a
+handler whose family has no hit is skipped outright.
+
+KeywordTable replaces the "sum of matched keyword lengths" scoring loops
+with an inverted index, touching only entries that share a keyword with
+the query.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping, Optional, Sequence
+
+
+class KeywordTrie:
+    """All-occurrence substring matcher compiled from a keyword list.
+
+    Usage:
+        trie = KeywordTrie(["oil temp", "oil temperature", "temp"])
+        trie.scan("what's my oil temperature")
+        # → frozenset({"oil temp", "oil temperature", "temp"})
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self._keywords = frozenset(kw for kw in keywords if kw)
+        root: dict = {}
+        for kw in self._keywords:
+            node = root
+            for ch in kw:
+                node = node.setdefault(ch, {})
+            node[""] = True  # End-of-keyword marker
+
+        # The regex yields the longest keyword starting at each position;
+        # every shorter keyword starting there is one of its prefixes.
+        self._prefixes: dict[str, frozenset[str]] = {
+            kw: frozenset(kw[:i] for i in range(1, len(kw) + 1) if kw[:i] in self._keywords)
+            for kw in self._keywords
+        }
+        body = self._emit(root) if root else "(?!)"
+        self._pattern = re.compile(f"(?=({body}))", re.DOTALL)
+
+    @classmethod
+    def _emit(cls, node: dict) -> str:
+        """Render a trie node as a regex. Optional tails are greedy → longest match."""
+        branches = [re.escape(ch) + cls._emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    @property
+    def keywords(self) -> frozenset[str]:
+        return self._keywords
+
+    def scan(self, text: str) -> frozenset[str]:
+        """Return every keyword that occurs in text as a substring."""
+        hits: set[str] = set()
+        for m in self._pattern.finditer(text):
+            hits |= self._prefixes[m.group(1)]
+        return frozenset(hits)
+
+
+class KeywordTable:
+    """Keyword-scored response table: score = total length of matched keywords.
+
+    Entries are (keywords, response, category) tuples, e.g. PERSONA_RESPONSES.
+    best() returns the same winner as a linear scan with strict '>' — the
+    first entry (in table order) with the highest score.
+    """
+
+    def __init__(self, entries: Sequence[tuple[Sequence[str], str, str]]) -> None:
+        self.entries = list(entries)
+        self._index: dict[str, list[int]] = {}
+        for i, (keywords, _response, _category) in enumerate(self.entries):
+            for kw in keywords:
+                # Duplicates within one entry count twice, as in the linear sum
+                self._index.setdefault(kw, []).append(i)
+
+    @property
+    def keywords(self) -> frozenset[str]:
+        return frozenset(self._index)
+
+    def best(self, hits: frozenset[str],
+             allowed: Optional[set[str]] = None) -> tuple[int, Optional[int]]:
+        """Return (score, entry index) of the best match, or (0, None)."""
+        scores: dict[int, int] = {}
+        for kw in hits:
+            for i in self._index.get(kw, ()):
+                scores[i] = scores.get(i, 0) + len(kw)
+        best_score, best_index = 0, None
+        for i in sorted(scores):
+            if allowed is not None and self.entries[i][2] not in allowed:
+                continue
+            if scores[i] > best_score:
+                best_score, best_index = scores[i], i
+        return best_score, best_index
+
+
+@dataclass(frozen=True)
+class Route:
+    """One-pass classification of an utterance."""
+    hits: frozenset[str]                    # Every keyword found in the text
+    intents: tuple[str, ...]                # Matched groups, highest precedence first
+    slots: dict[str, int | str] = field(default_factory=dict)
+
+    @property
+    def intent(self) -> Optional[str]:
+        """Highest-precedence matched group, or None."""
+        return self.intents[0] if self.intents else None
+
+    def __contains__(self, group: str) -> bool:
+        return group in self.intents
+
+    def family(self, prefix: str) -> bool:
+        """True if any group in the family (e.g. "sensor.") matched or a slot was filled."""
+        return any(g.startswith(prefix) for g in self.intents) or any(
+            s.startswith(prefix) for s in self.slots
+        )
+
+
+@dataclass(frozen=True)
+class SlotPattern:
+    """Regex slot extracted only when its trigger keyword is present."""
+    name: str               # Slot name, family-prefixed ("timing_cmd.reference_lap")
+    trigger: str            # Cheap keyword gate — regex runs only on a hit
+    pattern: re.Pattern
+    convert: type = str
+
+
+class IntentRouter:
+    """Classifies an utterance into ranked keyword groups with slots.
+
+    Group order is precedence order: Route.intents lists matched groups in
+    the order their handlers would test them. Extra keywords (e.g. persona
+    tables) are compiled into the same trie so a single scan serves them too.
+    """
+
+    def __init__(
+        self,
+        groups: Mapping[str, Sequence[str]],
+        slots: Sequence[SlotPattern] = (),
+        extra_keywords: Iterable[str] = (),
+    ) -> None:
+        self._rank = {name: i for i, name in enumerate(groups)}
+        self._groups = {name: frozenset(kws) for name, kws in groups.items()}
+        self._by_keyword: dict[str, list[str]] = {}
+        for name, kws in self._groups.items():
+            for kw in kws:
+                self._by_keyword.setdefault(kw, []).append(name)
+        self._slots = tuple(slots)
+        self._trie = KeywordTrie(
+            set(self._by_keyword) | {s.trigger for s in self._slots} | set(extra_keywords)
+        )
+
+    @property
+    def groups(self) -> Mapping[str, frozenset[str]]:
+        return self._groups
+
+    def route(self, text: str) -> Route:
+        """Scan text once; return matched groups in precedence order plus slots."""
+        hits = self._trie.scan(text)
+        matched: set[str] = set()
+        for kw in hits:
+            names = self._by_keyword.get(kw)
+            if names:
+                matched.update(names)
+        slots: dict[str, int | str] = {}
+        for slot in self._slots:
+            if slot.trigger in hits:
+                m = slot.pattern.search(text)
+                if m:
+                    value = next(g for g in m.groups() if g is not None)
+                    slots[slot.name] = slot.convert(value)
+        return Route(
+            hits=hits,
+            intents=tuple(sorted(matched, key=self._rank.__getitem__)),
+            slots=slots,
+        )
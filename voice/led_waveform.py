@@ -8,6 +8,20 @@ Supports multiple LED modes:
   - RPM: Shift indicator (Sport/Sport Sharp)
   - KITT: Red sweep idle pattern (Intelligent idle)
   - Warm-up: Temperature-based color gradient
+
+The animations are compiled into lookup tables once (LEDAnimationTables,
+shared by every generator): each entry is a finished LEDFrame carrying its
+encoded 0x6C0/0x6C1 payload, so a 30 Hz frame is an index computation and
+a table read — no per-LED float math, no CAN encoding on the send path.
+Tables are indexed by:
+  - KITT: sweep phase, 1024 steps per cycle
+  - RPM: lit-LED count (exact — the pattern only changes at tenths)
+  - G-force: combined g in 0.005 g steps up to 2 g (saturated beyond)
+  - waveform: amplitude, 256 levels
+  - warm-up: pulse phase (256 steps) × progress (101 steps)
+
+The _*_leds() functions are the original per-frame generators; they build
+the tables and are the reference for the equivalence tests.
 """
 
 from __future__ import annotations
@@ -15,6 +29,7 @@ from __future__ import annotations
 import math
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from can.can_config import (
@@ -26,6 +41,17 @@ from can.can_config import (
     LED_MODE_WARMUP,
     LED_MODE_WAVEFORM,
 )
+from can.led_output import encode_led_output
+
+TAU = 2.0 * math.pi
+
+KITT_PHASE_STEPS = 1024        # Table steps per sweep cycle
+KITT_SPEED = 2.5               # Sweep phase (rad) per second
+GFORCE_STEPS_PER_G = 200       # 0.005 g buckets (aligned with the 0.2 g LED steps)
+GFORCE_MAX_G = 2.0             # All LEDs lit, full brightness, red beyond
+WAVEFORM_STEPS = 256           # Amplitude levels
+WARMUP_PULSE_STEPS = 256       # Table steps per pulse cycle
+WARMUP_PROGRESS_STEPS = 100    # Progress buckets (+1 for 1.0)
 
 
 @dataclass
@@ -36,14 +62,180 @@ class LEDFrame:
     color_r: int = 0                   # Base color R
     color_g: int = 0                   # Base color G
     color_b: int = 0                   # Base color B
+    payload: Optional[tuple[bytes, bytes]] = None  # Encoded (0x6C0, 0x6C1) data
+
+    def encoded(self) -> tuple[bytes, bytes]:
+        """CAN payload for this frame (precomputed for table frames)."""
+        if self.payload is None:
+            return encode_led_output(self.mode, self.brightnesses,
+                                     self.color_r, self.color_g, self.color_b)
+        return self.payload
+
+
+def _table_frame(mode: int, brightnesses: list[int], rgb: tuple[int, int, int]) -> LEDFrame:
+    r, g, b = rgb
+    return LEDFrame(mode=mode, brightnesses=brightnesses, color_r=r, color_g=g, color_b=b,
+                    payload=encode_led_output(mode, brightnesses, r, g, b))
+
+
+# ---------------------------------------------------------------------------
+# Reference generators (per-frame float math; used to build the tables)
+# ---------------------------------------------------------------------------
+
+def _waveform_leds(amplitude: float) -> tuple[list[int], tuple[int, int, int]]:
+    # Center-out pattern: center LEDs are brightest, edges fade
+    center = (LED_COUNT - 1) / 2.0
+    brightnesses = []
+    for i in range(LED_COUNT):
+        dist = abs(i - center) / center  # 0.0 at center, 1.0 at edge
+        # Amplitude scales height; distance from center scales falloff
+        b = amplitude * (1.0 - dist * 0.6)
+        brightnesses.append(max(0, min(255, int(b * 255))))
+    return brightnesses, (230, 0, 0)  # KiSTI red
+
+
+def _kitt_leds(phase: float) -> tuple[list[int], tuple[int, int, int]]:
+    # Ping-pong: position oscillates 0 → LED_COUNT-1 → 0
+    pos = (math.sin(phase) + 1.0) / 2.0 * (LED_COUNT - 1)
+
+    brightnesses = []
+    for i in range(LED_COUNT):
+        dist = abs(i - pos)
+        # Sharp falloff: bright at position, fading to neighbors
+        if dist < 1.0:
+            b = int(255 * (1.0 - dist))
+        elif dist < 2.0:
+            b = int(80 * (2.0 - dist))
+        elif dist < 3.0:
+            b = int(20 * (3.0 - dist))
+        else:
+            b = 0
+        brightnesses.append(b)
+    return brightnesses, (255, 0, 0)  # Red
+
+
+def _rpm_leds(frac: float) -> tuple[list[int], tuple[int, int, int]]:
+    # Map RPM fraction to number of active LEDs (1-10)
+    active_leds = max(1, int(frac * LED_COUNT))
+    brightnesses = [255 if i < active_leds else 0 for i in range(LED_COUNT)]
+
+    # Color: green → amber → red based on RPM fraction
+    if frac < 0.5:
+        return brightnesses, (0, 255, 0)       # Green
+    elif frac < 0.8:
+        return brightnesses, (255, 165, 0)     # Amber
+    return brightnesses, (255, 0, 0)           # Red
+
+
+def _warmup_brightness(pulse_angle: float) -> int:
+    # Gentle pulse
+    pulse = 0.5 + 0.5 * math.sin(pulse_angle)
+    return int(80 + 120 * pulse)
+
+
+def _warmup_color(progress: float) -> tuple[int, int, int]:
+    # Color transitions: deep blue → cherry red → green
+    if progress < 0.5:
+        # Cold → warming: blue to red
+        t = progress * 2.0
+        return int(204 * t), 0, int(255 * (1.0 - t))
+    # Warming → ready: red to green
+    t = (progress - 0.5) * 2.0
+    return int(204 * (1.0 - t)), int(204 * t), 0
+
+
+def _gforce_leds(combined_g: float) -> tuple[list[int], tuple[int, int, int]]:
+    # Number of lit LEDs scales with G-force (0g = 0, 2g = all 10)
+    lit_count = min(LED_COUNT, int(combined_g * 5))
+    center = LED_COUNT // 2
+
+    brightnesses = [0] * LED_COUNT
+    for i in range(lit_count):
+        # Spread from center outward
+        offset = i // 2
+        if i % 2 == 0:
+            idx = center + offset
+        else:
+            idx = center - 1 - offset
+        if 0 <= idx < LED_COUNT:
+            # Brightness scales with G (brighter at higher G)
+            brightnesses[idx] = min(255, int(128 + combined_g * 80))
+
+    # Color: green < 0.5g, amber 0.5-1.0g, red > 1.0g
+    if combined_g < 0.5:
+        return brightnesses, (0, 200, 0)
+    elif combined_g < 1.0:
+        t = (combined_g - 0.5) * 2.0  # 0..1
+        return brightnesses, (int(255 * t), int(200 * (1.0 - t * 0.35)), 0)
+    return brightnesses, (255, 0, 0)
+
+
+# ---------------------------------------------------------------------------
+# Compiled tables
+# ---------------------------------------------------------------------------
+
+class LEDAnimationTables:
+    """Every table-driven animation frame, built once.
+
+    Frames are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self.waveform = [
+            _table_frame(LED_MODE_WAVEFORM, *_waveform_leds(i / (WAVEFORM_STEPS - 1)))
+            for i in range(WAVEFORM_STEPS)
+        ]
+        self.kitt = [
+            _table_frame(LED_MODE_KITT, *_kitt_leds(i * TAU / KITT_PHASE_STEPS))
+            for i in range(KITT_PHASE_STEPS)
+        ]
+        # Index = lit LEDs (0-10) from frac; index -1 is "below display threshold"
+        self.rpm = [
+            _table_frame(LED_MODE_RPM, *_rpm_leds(n / LED_COUNT)) for n in range(LED_COUNT + 1)
+        ]
+        self.rpm_off = _table_frame(LED_MODE_RPM, [0] * LED_COUNT, (0, 0, 0))
+        # Bucket lower edges: LED count and color thresholds fall on bucket edges
+        self.gforce = [
+            _table_frame(LED_MODE_GFORCE, *_gforce_leds(i / GFORCE_STEPS_PER_G))
+            for i in range(int(GFORCE_MAX_G * GFORCE_STEPS_PER_G) + 1)
+        ]
+        self.off = _table_frame(LED_MODE_OFF, [0] * LED_COUNT, (0, 0, 0))
+
+        # Warm-up: pulse phase × progress.  Brightness lists and 0x6C0 data
+        # depend on the pulse only and are shared along each row.
+        warmup_colors = [_warmup_color(j / WARMUP_PROGRESS_STEPS) for j in range(WARMUP_PROGRESS_STEPS + 1)]
+        self.warmup: list[list[LEDFrame]] = []
+        for i in range(WARMUP_PULSE_STEPS):
+            level = _warmup_brightness(i * TAU / WARMUP_PULSE_STEPS)
+            levels = [level] * LED_COUNT
+            frame1 = bytes([LED_MODE_WARMUP] + [level] * 7)
+            self.warmup.append([
+                LEDFrame(mode=LED_MODE_WARMUP, brightnesses=levels, color_r=r, color_g=g, color_b=b,
+                         payload=(frame1, bytes([level, level, level, r, g, b, 0, 0])))
+                for r, g, b in warmup_colors
+            ])
+
+
+@lru_cache(maxsize=1)
+def led_animation_tables() -> LEDAnimationTables:
+    """The process-wide tables (built on first use)."""
+    return LEDAnimationTables()
 
 
 class LEDWaveformGenerator:
-    """Generates LED patterns for the MXG Strada dash shift lights."""
+    """Generates LED patterns for the MXG Strada dash shift lights.
+
+    Frames come from the shared LEDAnimationTables and carry their encoded
+    CAN payload; treat them as read-only.
+    """
+
+    _KITT_INDEX = KITT_PHASE_STEPS / TAU
+    _WARMUP_INDEX = WARMUP_PULSE_STEPS / TAU
 
     def __init__(self) -> None:
         self._kitt_phase: float = 0.0
         self._warmup_phase: float = 0.0
+        self._tables = led_animation_tables()
 
     def waveform_frame(self, amplitude: float) -> LEDFrame:
         """Generate a voice waveform LED frame.
@@ -54,20 +246,8 @@ class LEDWaveformGenerator:
         Returns:
             LEDFrame with KiSTI red waveform pattern.
         """
-        # Center-out pattern: center LEDs are brightest, edges fade
-        center = (LED_COUNT - 1) / 2.0
-        brightnesses = []
-        for i in range(LED_COUNT):
-            dist = abs(i - center) / center  # 0.0 at center, 1.0 at edge
-            # Amplitude scales height; distance from center scales falloff
-            b = amplitude * (1.0 - dist * 0.6)
-            brightnesses.append(max(0, min(255, int(b * 255))))
-
-        return LEDFrame(
-            mode=LED_MODE_WAVEFORM,
-            brightnesses=brightnesses,
-            color_r=230, color_g=0, color_b=0,  # KiSTI red
-        )
+        i = int(amplitude * (WAVEFORM_STEPS - 1) + 0.5)
+        return self._tables.waveform[min(max(i, 0), WAVEFORM_STEPS - 1)]
 
     def waveform_from_envelope(
         self, envelope: list[float], fps: int = 30,
@@ -84,29 +264,9 @@ class LEDWaveformGenerator:
         Returns:
             LEDFrame with red sweep pattern.
         """
-        self._kitt_phase += dt * 2.5  # sweep speed
-        # Ping-pong: position oscillates 0 → LED_COUNT-1 → 0
-        pos = (math.sin(self._kitt_phase) + 1.0) / 2.0 * (LED_COUNT - 1)
-
-        brightnesses = []
-        for i in range(LED_COUNT):
-            dist = abs(i - pos)
-            # Sharp falloff: bright at position, fading to neighbors
-            if dist < 1.0:
-                b = int(255 * (1.0 - dist))
-            elif dist < 2.0:
-                b = int(80 * (2.0 - dist))
-            elif dist < 3.0:
-                b = int(20 * (3.0 - dist))
-            else:
-                b = 0
-            brightnesses.append(b)
-
-        return LEDFrame(
-            mode=LED_MODE_KITT,
-            brightnesses=brightnesses,
-            color_r=255, color_g=0, color_b=0,  # Red
-        )
+        self._kitt_phase = (self._kitt_phase + dt * KITT_SPEED) % TAU
+        i = int(self._kitt_phase * self._KITT_INDEX + 0.5) % KITT_PHASE_STEPS
+        return self._tables.kitt[i]
 
     def rpm_shift_frame(
         self, rpm: float, shift_rpm: float = 6500.0, redline_rpm: float = 7500.0,
@@ -122,31 +282,12 @@ class LEDWaveformGenerator:
             LEDFrame with green→amber→red shift pattern.
         """
         # Scale RPM to 0.0-1.0 across the shift range
-        if rpm < shift_rpm * 0.6:
+        start = shift_rpm * 0.6
+        if rpm < start:
             # Below display threshold — off
-            return LEDFrame(mode=LED_MODE_RPM, brightnesses=[0] * LED_COUNT)
-
-        # Map RPM to number of active LEDs (1-10)
-        frac = max(0.0, min(1.0, (rpm - shift_rpm * 0.6) / (redline_rpm - shift_rpm * 0.6)))
-        active_leds = max(1, int(frac * LED_COUNT))
-
-        brightnesses = []
-        for i in range(LED_COUNT):
-            brightnesses.append(255 if i < active_leds else 0)
-
-        # Color: green → amber → red based on RPM fraction
-        if frac < 0.5:
-            r, g, b = 0, 255, 0       # Green
-        elif frac < 0.8:
-            r, g, b = 255, 165, 0     # Amber
-        else:
-            r, g, b = 255, 0, 0       # Red
-
-        return LEDFrame(
-            mode=LED_MODE_RPM,
-            brightnesses=brightnesses,
-            color_r=r, color_g=g, color_b=b,
-        )
+            return self._tables.rpm_off
+        frac = max(0.0, min(1.0, (rpm - start) / (redline_rpm - start)))
+        return self._tables.rpm[int(frac * LED_COUNT)]
 
     def warmup_frame(self, progress: float) -> LEDFrame:
         """Generate warm-up state LED pattern.
@@ -157,33 +298,10 @@ class LEDWaveformGenerator:
         Returns:
             LEDFrame with blue→red→green color transition.
         """
-        self._warmup_phase += 1.0 / 30.0
-
-        # Gentle pulse
-        pulse = 0.5 + 0.5 * math.sin(self._warmup_phase * 2.0)
-        base_brightness = int(80 + 120 * pulse)
-
-        brightnesses = [base_brightness] * LED_COUNT
-
-        # Color transitions: deep blue → cherry red → green
-        if progress < 0.5:
-            # Cold → warming: blue to red
-            t = progress * 2.0
-            r = int(204 * t)
-            g = 0
-            b = int(255 * (1.0 - t))
-        else:
-            # Warming → ready: red to green
-            t = (progress - 0.5) * 2.0
-            r = int(204 * (1.0 - t))
-            g = int(204 * t)
-            b = 0
-
-        return LEDFrame(
-            mode=LED_MODE_WARMUP,
-            brightnesses=brightnesses,
-            color_r=r, color_g=g, color_b=b,
-        )
+        self._warmup_phase = (self._warmup_phase + 1.0 / 30.0) % math.pi
+        i = int(self._warmup_phase * 2.0 * self._WARMUP_INDEX + 0.5) % WARMUP_PULSE_STEPS
+        j = int(progress * WARMUP_PROGRESS_STEPS + 0.5)
+        return self._tables.warmup[i][min(max(j, 0), WARMUP_PROGRESS_STEPS)]
 
     def g_force_frame(self, accel_x: float, accel_y: float) -> LEDFrame:
         """Generate G-force visualization LED pattern.
@@ -198,47 +316,12 @@ class LEDWaveformGenerator:
         Returns:
             LEDFrame with G-force magnitude mapped to brightness and color.
         """
-        combined_g = math.sqrt(accel_x ** 2 + accel_y ** 2)
-
-        # Number of lit LEDs scales with G-force (0g = 0, 2g = all 10)
-        lit_count = min(LED_COUNT, int(combined_g * 5))
-        center = LED_COUNT // 2
-
-        brightnesses = [0] * LED_COUNT
-        for i in range(lit_count):
-            # Spread from center outward
-            offset = i // 2
-            if i % 2 == 0:
-                idx = center + offset
-            else:
-                idx = center - 1 - offset
-            if 0 <= idx < LED_COUNT:
-                # Brightness scales with G (brighter at higher G)
-                brightnesses[idx] = min(255, int(128 + combined_g * 80))
-
-        # Color: green < 0.5g, amber 0.5-1.0g, red > 1.0g
-        if combined_g < 0.5:
-            r, g, b = 0, 200, 0
-        elif combined_g < 1.0:
-            t = (combined_g - 0.5) * 2.0  # 0..1
-            r = int(255 * t)
-            g = int(200 * (1.0 - t * 0.35))
-            b = 0
-        else:
-            r, g, b = 255, 0, 0
-
-        return LEDFrame(
-            mode=LED_MODE_GFORCE,
-            brightnesses=brightnesses,
-            color_r=r, color_g=g, color_b=b,
-        )
+        i = int(math.hypot(accel_x, accel_y) * GFORCE_STEPS_PER_G)
+        return self._tables.gforce[min(i, len(self._tables.gforce) - 1)]
 
     def off_frame(self) -> LEDFrame:
         """All LEDs off."""
-        return LEDFrame(
-            mode=LED_MODE_OFF,
-            brightnesses=[0] * LED_COUNT,
-        )
+        return self._tables.off
 
     def alert_flash_frame(
         self, severity: str, phase: float,
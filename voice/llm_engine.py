@@ -20,6 +20,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from data.car_jokes import CAR_JOKES, get_random_joke
+from voice.intent_router import KeywordTable, KeywordTrie
 
 log = logging.getLogger("kisti.voice.llm")
 
@@ -469,6 +470,15 @@ _INSTANT_RESPONSES: list[tuple[list[str], str, str]] = [
     or any(kw in _INSTANT_IDENTITY_KEYWORDS for kw in kws)
 ]
 
+# Self-reference keywords — driver is talking TO or ABOUT KiSTI
+_SELF_REFS = ("your", "my ", "you", " i ", "do i ", "kisti")
+
+# Compiled once at import: inverted keyword indexes for scoring, plus one
+# trie over every persona keyword so a query is scanned a single time
+_PERSONA_TABLE = KeywordTable(PERSONA_RESPONSES)
+_INSTANT_TABLE = KeywordTable(_INSTANT_RESPONSES)
+_PERSONA_TRIE = KeywordTrie(_PERSONA_TABLE.keywords | set(_SELF_REFS))
+
 
 @dataclass
 class LLMResponse:
@@ -480,22 +490,21 @@ class LLMResponse:
     tokens: int         # Approximate token count
 
 
-def _match_safety_fast_path(query: str, si_drive_mode: str = "Intelligent") -> Optional[str]:
+def _match_safety_fast_path(query: str, si_drive_mode: str = "Intelligent",
+                            hits: Optional[frozenset[str]] = None) -> Optional[str]:
     """Match query against instant-response entries only.
 
     Returns a response for safety-critical, joke, and identity/greeting queries.
     These should NEVER wait for a network call. Returns None for everything else,
     letting frontier handle it.
-    """
-    lower = query.lower()
-    best_score = 0
-    best_response = None
 
-    for keywords, response, _category in _INSTANT_RESPONSES:
-        score = sum(len(kw) for kw in keywords if kw in lower)
-        if score > best_score:
-            best_score = score
-            best_response = response
+    hits: keywords already found in the lowercased query by a trie that
+    covers the persona keywords (e.g. an IntentRouter scan) — skips rescanning.
+    """
+    if hits is None:
+        hits = _PERSONA_TRIE.scan(query.lower())
+    best_score, best_index = _INSTANT_TABLE.best(hits)
+    best_response = _INSTANT_TABLE.entries[best_index][1] if best_index is not None else None
 
     if best_response is None or best_score < 3:
         # Minimum score 3 prevents 2-char substring false positives
@@ -533,7 +542,8 @@ _MODE_ALLOWED_CATEGORIES: dict[str, set[str]] = {
 }
 
 
-def _match_persona(query: str, si_drive_mode: str = "Intelligent") -> Optional[str]:
+def _match_persona(query: str, si_drive_mode: str = "Intelligent",
+                   hits: Optional[frozenset[str]] = None) -> Optional[str]:
     """Match query against KiSTI persona keyword responses.
 
     Filters by category based on SI Drive mode:
@@ -544,28 +554,19 @@ def _match_persona(query: str, si_drive_mode: str = "Intelligent") -> Optional[s
     General knowledge questions ("how does", "what is", "why do", "compare",
     "explain", "difference between") require a higher match score so they
     pass through to the frontier engine instead of getting canned answers.
+
+    hits: keywords already found in the lowercased query by _PERSONA_TRIE.
     """
-    lower = query.lower()
+    if hits is None:
+        hits = _PERSONA_TRIE.scan(query.lower())
     allowed = _MODE_ALLOWED_CATEGORIES.get(si_drive_mode, {"safety", "tech", "fun"})
-    best_score = 0
-    best_response = None
-    best_category = None
-
-    for keywords, response, category in PERSONA_RESPONSES:
-        if category not in allowed:
-            continue
-        score = sum(len(kw) for kw in keywords if kw in lower)
-        if score > best_score:
-            best_score = score
-            best_response = response
-            best_category = category
-
-    if best_response is None or best_score == 0:
+    best_score, best_index = _PERSONA_TABLE.best(hits, allowed)
+
+    if best_index is None or best_score == 0:
         return None
+    _keywords, best_response, best_category = _PERSONA_TABLE.entries[best_index]
 
-    # Self-reference keywords — driver is talking TO or ABOUT KiSTI
-    _SELF_REFS = ("your", "my ", "you", " i ", "do i ", "kisti")
-    has_self_ref = any(s in lower for s in _SELF_REFS)
+    has_self_ref = not hits.isdisjoint(_SELF_REFS)
 
     # Routing: persona handles safety, jokes, and self-referencing queries.
     # Everything else needs a strong keyword match (score >= 10) to avoid
@@ -679,6 +680,7 @@ class LLMEngine:
         memory_context: str = "",
         si_drive_mode: str = "Intelligent",
         conversation_history: list | None = None,
+        stream: object = None,
     ) -> LLMResponse:
         """Send a query to the LLM (or persona fallback).
 
@@ -688,15 +690,18 @@ class LLMEngine:
             memory_context: Relevant memories from edge memory system.
             si_drive_mode: Current SI Drive mode name.
             conversation_history: Recent DialogueTurn objects for frontier context.
+            stream: Optional frontier SentenceStream — live frontier answers
+                are streamed into it sentence by sentence.
 
         Returns:
             LLMResponse with text and metadata.
         """
         start_time = time.monotonic()
+        hits = _PERSONA_TRIE.scan(user_message.lower())  # One scan for tiers 0 and 2
 
         # TIER 0: Safety fast-path — ALWAYS instant, never waits for network
         # Catches safety alerts, jokes, and identity/greeting queries.
-        safety_match = _match_safety_fast_path(user_message, si_drive_mode)
+        safety_match = _match_safety_fast_path(user_message, si_drive_mode, hits)
         if safety_match:
             latency = time.monotonic() - start_time
             return LLMResponse(
@@ -713,6 +718,7 @@ class LLMEngine:
                 frontier_resp = self._frontier.query(
                     user_message, telemetry_context, memory_context, si_drive_mode,
                     conversation_history=conversation_history,
+                    stream=stream,
                 )
                 if frontier_resp is not None:
                     return frontier_resp
@@ -721,7 +727,7 @@ class LLMEngine:
 
         # TIER 2: Persona fallback — offline or frontier failure
         # Full keyword matching gives better answers than a generic fallback.
-        persona_match = _match_persona(user_message, si_drive_mode)
+        persona_match = _match_persona(user_message, si_drive_mode, hits)
         if persona_match:
             latency = time.monotonic() - start_time
             return LLMResponse(
@@ -2,18 +2,26 @@
 
 Continuous audio capture from USB microphone via PulseAudio (parecord).
 Uses Silero VAD for high-accuracy speech boundary detection — dramatically
-reduces Whisper hallucinations by tightly clipping speech segments.
+reduces Whisper hallucinations by tightly clipping speech segments. The VAD
+backend is pluggable (voice/vad.py): Silero on ONNX Runtime by default, so
+the always-on loop never loads torch, with WebRTC and energy fallbacks.
 
 Optional openwakeword CPU pre-filter: when enabled, only utterances
 containing the wake word trigger STT — cutting ~90% of unnecessary GPU calls.
 
 When speech is detected, the complete utterance is emitted as raw PCM for
-Whisper transcription.
+Whisper transcription. With partials enabled, the utterance-so-far is also
+emitted every PARTIAL_INTERVAL_FRAMES during speech so the voice manager can
+speculate on the intent before endpointing.
+
+Per-frame work (gain, VAD float conversion, RMS, wake-word chunking) runs
+in place on a preallocated AudioFrontEnd ring buffer.
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
 import threading
 import time
@@ -21,6 +29,9 @@ from typing import Callable, Optional
 
 from PySide6.QtCore import QObject, Signal
 
+from voice.audio_frontend import AudioFrontEnd, FrontEndStats
+from voice.vad import VADBackend, load_vad
+
 log = logging.getLogger("kisti.voice.mic")
 
 SAMPLE_RATE = 16000       # Whisper expects 16kHz
@@ -37,12 +48,24 @@ SPEECH_THRESHOLD = 0.5    # Silero confidence threshold (0-1). Higher = stricter
 SPEECH_START_FRAMES = 6   # ~192ms of speech to trigger capture start
 SPEECH_END_FRAMES = 19    # ~608ms of silence to end utterance (was 14/448ms — still split on natural pauses; 600ms covers most mid-sentence pauses)
 MAX_UTTERANCE_S = 10.0    # Hard cap — prevent runaway capture
+MAX_UTTERANCE_FRAMES = int(MAX_UTTERANCE_S * 1000 / FRAME_DURATION_MS)  # Same cap in frames (ring size)
 MIN_UTTERANCE_S = 0.3     # Ignore very short bursts (clicks, bumps)
 
+# Partial windows: emit utterance-so-far every N frames during speech (~768ms)
+PARTIAL_INTERVAL_FRAMES = 24
+PARTIAL_MIN_S = 0.8       # Below this a partial window has no usable words
+
 # Pre-roll: keep N frames before speech detection fires.
 # 10 frames (~320ms) captures the wake word onset that Whisper otherwise drops.
 PRE_ROLL_FRAMES = 10
 
+# Software gain on the os.pipe() capture path: PA 300% + 3x software = ~900%.
+# 3x needed for Whisper to catch quieter words (e.g. "oil" in "oil temperature").
+SOFTWARE_GAIN = 3
+
+# Log front-end per-frame CPU cost every ~5 minutes of audio
+STATS_INTERVAL_FRAMES = 9375
+
 # openwakeword settings
 OWW_CHUNK_SAMPLES = 1280  # 80ms at 16kHz (openwakeword requirement)
 OWW_THRESHOLD = 0.5       # Wake word confidence threshold (0-1)
@@ -63,9 +86,11 @@ class MicCapture(QObject):
         speech_captured(bytes): Complete utterance as raw PCM
         listening_started(): VAD detected speech start
         listening_stopped(): VAD detected speech end
+        partial_speech(bytes): Utterance-so-far during speech (partials enabled)
     """
 
     speech_captured = Signal(bytes)
+    partial_speech = Signal(bytes)
     listening_started = Signal()
     listening_stopped = Signal()
 
@@ -74,41 +99,43 @@ class MicCapture(QObject):
         device: str = "default",
         wake_model: Optional[str] = None,
         parent: Optional[QObject] = None,
+        vad_type: Optional[str] = None,
     ) -> None:
         super().__init__(parent)
         self._device = device
         self._wake_model = wake_model  # Custom ONNX path or openwakeword model name
+        # VAD backend: auto | silero_onnx | silero | webrtcvad | energy
+        self._requested_vad = vad_type or os.environ.get("KISTI_VAD", "auto")
         self._running = False
         self._paused = False  # Pause during TTS playback to avoid echo
         self._thread: Optional[threading.Thread] = None
-        self._vad = None
+        self._vad: Optional[VADBackend] = None
+        self._vad_type = ""
         self._oww = None      # openwakeword model (CPU pre-filter)
         self._available = False
         self._last_wake_detected = False  # Set True when wake word detected in last utterance
         self._passthrough = False  # When True, skip wake word gate (conversation window)
         self._barge_in_mode = False    # True during TTS — mic active but OWW threshold raised
         self._active_oww_threshold = OWW_THRESHOLD_NORMAL
+        self._partials_enabled = False  # Emit partial_speech windows during speech
+        self._frontend: Optional[AudioFrontEnd] = None  # Ring buffer of the running loop
 
     def start(self) -> None:
         """Start capture thread. Safe to call even without a mic."""
         if self._running:
             return
 
-        # Initialize Silero VAD (CPU ONNX — no GPU needed)
+        # Initialize VAD (CPU — no GPU needed)
+        t0 = time.monotonic()
         try:
-            from silero_vad import load_silero_vad
-            self._vad = load_silero_vad()
-            self._vad_type = "silero"
-            log.info("Silero VAD loaded (CPU ONNX)")
-        except ImportError:
-            try:
-                import webrtcvad
-                self._vad = webrtcvad.Vad(VAD_MODE)
-                self._vad_type = "webrtcvad"
-                log.warning("Silero VAD not available — falling back to webrtcvad")
-            except ImportError:
-                log.warning("No VAD available — mic capture disabled")
-                return
+            self._vad = load_vad(self._requested_vad)
+        except (ImportError, FileNotFoundError, ValueError) as exc:
+            log.warning("No VAD available (%s: %s) — mic capture disabled", self._requested_vad, exc)
+            return
+        self._vad_type = self._vad.name
+        log.info("VAD loaded: %s (%.0fms)", self._vad_type, (time.monotonic() - t0) * 1000)
+        if self._vad_type not in ("silero_onnx", "silero"):
+            log.warning("Silero VAD not available — falling back to %s", self._vad_type)
 
         # Initialize openwakeword (CPU pre-filter — optional)
         # Priority: constructor arg → KISTI_WAKE_MODEL env → default hey_jarvis
@@ -270,26 +297,15 @@ class MicCapture(QObject):
         )
         _os.close(write_fd)  # Parent doesn't write — close our copy
 
-        def read_fn(n_bytes: int) -> bytes:
-            import numpy as _np
-            chunks = []
-            remaining = n_bytes
-            while remaining > 0:
-                chunk = _os.read(read_fd, remaining)
-                if not chunk:
-                    return b"".join(chunks)
-                chunks.append(chunk)
-                remaining -= len(chunk)
-            raw = b"".join(chunks)
-            # Software gain: PA 300% + 3x software = effective ~900%.
-            # 3x needed for Whisper to catch quieter words (e.g. "oil" in
-            # "oil temperature"). Echo loop mitigated by 0.8s guard + 30%
-            # word overlap suppression + response dedup in voice_manager.
-            arr = _np.frombuffer(raw, dtype=_np.int16).astype(_np.int32) * 3
-            return _np.clip(arr, -32768, 32767).astype(_np.int16).tobytes()
-
         try:
-            self._vad_process(read_fn, alive_fn=lambda: proc.poll() is None)
+            # Frames land directly in the front-end's buffer (no per-read bytes).
+            # Software gain is applied there — echo loop mitigated by 0.8s
+            # guard + 30% word overlap suppression + response dedup in voice_manager.
+            self._vad_process(
+                readinto_fn=lambda buf: _os.readv(read_fd, [buf]),
+                alive_fn=lambda: proc.poll() is None,
+                gain=SOFTWARE_GAIN,
+            )
         finally:
             proc.terminate()
             proc.wait(timeout=2)
@@ -310,7 +326,7 @@ class MicCapture(QObject):
 
         try:
             self._vad_process(
-                read_fn=lambda n: proc.stdout.read(n),
+                readinto_fn=proc.stdout.readinto,
                 alive_fn=lambda: proc.poll() is None,
             )
         finally:
@@ -319,50 +335,53 @@ class MicCapture(QObject):
 
     def _vad_process(
         self,
-        read_fn: Callable[[int], bytes],
-        alive_fn: Callable[[], bool],
+        read_fn: Optional[Callable[[int], bytes]] = None,
+        alive_fn: Callable[[], bool] = lambda: True,
+        readinto_fn: Optional[Callable[[memoryview], int]] = None,
+        gain: int = 1,
     ) -> None:
-        """Read frames via read_fn and detect speech utterances."""
-        import torch
-        import numpy as np
+        """Read frames and detect speech utterances.
 
-        pre_roll: list[bytes] = []
-        speech_buffer: list[bytes] = []
+        Frames come from readinto_fn (fills a buffer in place) or read_fn
+        (returns bytes). All per-frame work runs on an AudioFrontEnd ring
+        buffer; gain is the software gain applied on intake.
+        """
+        fe = AudioFrontEnd(gain=gain, max_frames=MAX_UTTERANCE_FRAMES + PRE_ROLL_FRAMES + 1)
+        self._frontend = fe
         voiced_count = 0
         silent_count = 0
         in_speech = False
         speech_start_time = 0.0
-        use_silero = self._vad_type == "silero"
-        oww_buffer = b""       # Accumulate frames for openwakeword (needs 1280 samples)
+        pre_roll_floor = 0     # Pre-roll never reaches back past a reset
+        utterance_start = 0    # Absolute ring position of the utterance (incl. pre-roll)
         wake_detected = False  # Wake word detected in current utterance
 
         while self._running and alive_fn():
-            frame = read_fn(FRAME_BYTES)
-            if len(frame) < FRAME_BYTES:
+            if readinto_fn is not None:
+                if not fe.fill(readinto_fn):
+                    break
+            elif not fe.push(read_fn(FRAME_BYTES)):
                 break
+            if fe.stats.frames and fe.stats.frames % STATS_INTERVAL_FRAMES == 0:
+                log.info("Mic front-end: %s", fe.stats.summary())
 
             if self._paused:
                 voiced_count = 0
                 silent_count = 0
                 in_speech = False
                 wake_detected = False
-                speech_buffer.clear()
-                pre_roll.clear()
-                oww_buffer = b""
-                if use_silero:
-                    self._vad.reset_states()
+                pre_roll_floor = fe.written
+                fe.reset_oww()
+                self._vad.reset_states()
+                fe.frame_done()
                 continue
 
             # Barge-in mode: only process wake word detection, skip VAD
             if self._barge_in_mode:
                 if self._oww is not None:
-                    oww_buffer += frame
-                    while len(oww_buffer) >= OWW_CHUNK_SAMPLES * 2:
-                        chunk = oww_buffer[:OWW_CHUNK_SAMPLES * 2]
-                        oww_buffer = oww_buffer[OWW_CHUNK_SAMPLES * 2:]
-                        oww_audio = np.frombuffer(chunk, dtype=np.int16)
+                    for oww_audio in fe.oww_chunks():
                         # RMS echo gate: high RMS during barge-in = speaker echo, not human
-                        frame_rms = int((oww_audio.astype(np.float32) ** 2).mean() ** 0.5)
+                        frame_rms = fe.rms(oww_audio)
                         if frame_rms > 5000:
                             continue  # Skip OWW — this is speaker echo, not a wake word
                         preds = self._oww.predict(oww_audio)
@@ -370,22 +389,19 @@ class MicCapture(QObject):
                             if score > self._active_oww_threshold:
                                 log.info("Barge-in wake word: %s (%.2f)", model_name, score)
                                 self._last_wake_detected = True
-                                self.speech_captured.emit(frame)
-                                oww_buffer = b""
+                                self.speech_captured.emit(fe.frame_bytes())
+                                fe.reset_oww()
                                 if self._oww is not None:
                                     self._oww.reset()
+                fe.frame_done()
                 continue
 
-            # Feed openwakeword (accumulate to 1280-sample chunks)
-            # OWW gets audio at original levels — undo the 3x software gain
-            # applied in read_fn. OWW was trained on normal audio; amplified
+            # Feed openwakeword (1280-sample chunks as views over the ring)
+            # OWW gets audio at original levels — undo the software gain
+            # applied on intake. OWW was trained on normal audio; amplified
             # audio clips and distorts the spectral patterns it relies on.
             if self._oww is not None:
-                oww_buffer += frame
-                while len(oww_buffer) >= OWW_CHUNK_SAMPLES * 2:
-                    chunk = oww_buffer[:OWW_CHUNK_SAMPLES * 2]
-                    oww_buffer = oww_buffer[OWW_CHUNK_SAMPLES * 2:]
-                    oww_audio = (np.frombuffer(chunk, dtype=np.int16).astype(np.int32) // 3).astype(np.int16)
+                for oww_audio in fe.oww_chunks(undo_gain=True):
                     preds = self._oww.predict(oww_audio)
                     for model_name, score in preds.items():
                         if score > self._active_oww_threshold:
@@ -394,20 +410,9 @@ class MicCapture(QObject):
                             wake_detected = True
 
             # Detect speech
-            if use_silero:
-                audio_float = torch.from_numpy(
-                    np.frombuffer(frame, dtype=np.int16).astype(np.float32) / 32768.0
-                )
-                confidence = self._vad(audio_float, SAMPLE_RATE).item()
-                is_speech = confidence > SPEECH_THRESHOLD
-            else:
-                is_speech = self._vad.is_speech(frame, SAMPLE_RATE)
+            is_speech = self._vad.confidence(fe.vad_float, fe.frame) > SPEECH_THRESHOLD
 
             if not in_speech:
-                pre_roll.append(frame)
-                if len(pre_roll) > PRE_ROLL_FRAMES:
-                    pre_roll.pop(0)
-
                 if is_speech:
                     voiced_count += 1
                 else:
@@ -417,29 +422,37 @@ class MicCapture(QObject):
                     in_speech = True
                     silent_count = 0
                     speech_start_time = time.monotonic()
-                    speech_buffer = list(pre_roll)
-                    speech_buffer.append(frame)
-                    pre_roll.clear()
+                    frame_start = fe.written - SILERO_CHUNK_SAMPLES
+                    utterance_start = max(
+                        frame_start - PRE_ROLL_FRAMES * SILERO_CHUNK_SAMPLES, pre_roll_floor,
+                    )
                     self.listening_started.emit()
                     log.debug("Speech start detected")
             else:
-                speech_buffer.append(frame)
-
                 if is_speech:
                     silent_count = 0
                 else:
                     silent_count += 1
 
+                n_frames = (fe.written - utterance_start) // SILERO_CHUNK_SAMPLES
+
+                # Rolling partial window — only while the driver is still talking
+                if (self._partials_enabled and silent_count == 0
+                        and n_frames % PARTIAL_INTERVAL_FRAMES == 0
+                        and n_frames * FRAME_DURATION_MS / 1000.0 >= PARTIAL_MIN_S):
+                    self.partial_speech.emit(fe.pcm(utterance_start))
+
                 elapsed = time.monotonic() - speech_start_time
 
-                if silent_count >= SPEECH_END_FRAMES or elapsed >= MAX_UTTERANCE_S:
+                if (silent_count >= SPEECH_END_FRAMES or elapsed >= MAX_UTTERANCE_S
+                        or n_frames >= MAX_UTTERANCE_FRAMES + PRE_ROLL_FRAMES):
                     in_speech = False
                     voiced_count = 0
                     silent_count = 0
 
-                    duration = len(speech_buffer) * FRAME_DURATION_MS / 1000.0
+                    duration = n_frames * FRAME_DURATION_MS / 1000.0
                     if duration >= MIN_UTTERANCE_S:
-                        pcm = b"".join(speech_buffer)
+                        pcm = fe.pcm(utterance_start)
                         self._last_wake_detected = wake_detected
                         if self._oww is not None and not wake_detected and not self._passthrough:
                             log.info("No wake word — skipping STT (%.1fs, passthrough=%s)",
@@ -451,22 +464,31 @@ class MicCapture(QObject):
                     else:
                         log.info("Discarding short utterance: %.1fs", duration)
 
-                    speech_buffer.clear()
+                    pre_roll_floor = fe.written
                     # Only reset OWW after successful detection — preserving the
                     # sliding window across utterance boundaries lets OWW detect
                     # "Hey Jarvis" even when Silero splits it at a natural pause.
                     if wake_detected and self._oww is not None:
                         self._oww.reset()
-                        oww_buffer = b""
+                        fe.reset_oww()
                     wake_detected = False
-                    if use_silero:
-                        self._vad.reset_states()
+                    self._vad.reset_states()
                     self.listening_stopped.emit()
+            fe.frame_done()
+
+    @property
+    def frontend_stats(self) -> Optional[FrontEndStats]:
+        """Per-frame CPU stats of the running audio front-end (None before start)."""
+        return self._frontend.stats if self._frontend is not None else None
 
     def set_passthrough(self, enabled: bool) -> None:
         """Enable/disable wake word bypass (for conversation window)."""
         self._passthrough = enabled
 
+    def set_partials_enabled(self, enabled: bool) -> None:
+        """Enable/disable partial_speech windows for speculative resolution."""
+        self._partials_enabled = enabled
+
     def set_barge_in_mode(self, enabled: bool) -> None:
         """Enable/disable barge-in mode (raised OWW threshold during TTS).
 
@@ -0,0 +1,218 @@
+"""KiSTI - Speculative Intent Resolution
+
+Resolves the probable answer while the driver is still speaking. MicCapture
+emits rolling partial windows of the in-progress utterance; each partial is
+transcribed locally and handed to SpeculativeResolver, which:
+
+  - resolves deterministic intents (timing, sensor, persona fast-path)
+    through the same read-only handlers the final query uses,
+  - prefetches edge-memory context and peeks the frontier cache for
+    questions that will go to the frontier tier,
+  - pre-synthesizes TTS for the probable answer.
+
+When the final transcript arrives the real pipeline runs as usual. Its
+answer is checked against the speculation: an identical answer text commits
+the pre-synthesized audio (and the memory context for an identical query).
+Anything else is discarded, so speculation can never change what KiSTI
+says — only how soon it says it.
+
+Commands with side effects (quiet, timing mode, remember, cloud) are never
+executed speculatively; they simply miss.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from voice.tts_engine import TTSResult
+
+log = logging.getLogger("kisti.voice.speculation")
+
+# Partial queries shorter than this carry too little intent to act on
+MIN_SPECULATIVE_WORDS = 2
+
+
+def normalize_query(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace for comparison."""
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
+
+
+@dataclass
+class Speculation:
+    """Work done ahead of endpointing for one probable query."""
+    query: str                          # Partial query (wake word stripped)
+    key: str                            # normalize_query(query)
+    source: str                         # "timing" | "sensor" | "persona" | "frontier_cache" | "memory"
+    answer: str = ""                    # Probable spoken answer ("" = memory prefetch only)
+    memory_context: Optional[str] = None
+    memory_ms: int = 0                  # Time spent building memory_context
+    tts: Optional[TTSResult] = None     # Pre-synthesized audio for answer
+    started_at: float = 0.0
+
+
+@dataclass
+class SpeculationStats:
+    """Hit rate and latency saved across the session."""
+    partials: int = 0       # Partial transcripts speculated on
+    utterances: int = 0     # Final transcripts that had a speculation
+    hits: int = 0           # Finals that committed speculative work
+    misses: int = 0         # Finals whose speculation was discarded
+    saved_ms: int = 0       # Synthesis + lookup time skipped by commits
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.utterances if self.utterances else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.hits}/{self.utterances} hits ({self.hit_rate:.0%}), "
+            f"saved {self.saved_ms}ms total over {self.partials} partials"
+        )
+
+
+class SpeculativeResolver:
+    """Speculates on partial transcripts and commits/discards on the final.
+
+    Callbacks (all must be free of side effects):
+        resolve(query) -> (source, answer) | None   deterministic answer
+        synthesize(text) -> TTSResult                TTS for the answer
+        memory_lookup(query) -> str                  edge-memory context
+        cache_peek(query) -> str | None              frontier cache text
+
+    Thread model: speculate() runs on the partial-STT worker; begin_final(),
+    take_tts(), take_memory_context() and finish() run on the final STT
+    worker. A generation counter drops partials that finish transcribing
+    after their utterance has already been finalized.
+    """
+
+    def __init__(
+        self,
+        resolve: Callable[[str], Optional[tuple[str, str]]],
+        synthesize: Callable[[str], TTSResult],
+        memory_lookup: Optional[Callable[[str], str]] = None,
+        cache_peek: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> None:
+        self._resolve = resolve
+        self._synthesize = synthesize
+        self._memory_lookup = memory_lookup
+        self._cache_peek = cache_peek
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._current: Optional[Speculation] = None
+        self._pending: Optional[Speculation] = None   # Frozen by begin_final()
+        self._committed = False
+        self._saved_ms = 0
+        self.stats = SpeculationStats()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def speculate(self, query: str, generation: int) -> Optional[Speculation]:
+        """Resolve and prefetch for a partial query. Returns the speculation.
+
+        A partial whose normalized text matches the current speculation is
+        skipped (nothing new to do). Stale generations are ignored.
+        """
+        key = normalize_query(query)
+        if len(key.split()) < MIN_SPECULATIVE_WORDS:
+            return None
+        with self._lock:
+            if generation != self._generation:
+                return None
+            if self._current is not None and self._current.key == key:
+                return self._current
+
+        spec = Speculation(query=query, key=key, source="", started_at=time.monotonic())
+        resolved = self._resolve(query)
+        if resolved is not None:
+            spec.source, spec.answer = resolved
+        else:
+            if self._memory_lookup is not None:
+                t0 = time.monotonic()
+                try:
+                    spec.memory_context = self._memory_lookup(query)
+                except Exception as exc:
+                    log.debug("Speculative memory lookup failed: %s", exc)
+                spec.memory_ms = round((time.monotonic() - t0) * 1000)
+                spec.source = "memory"
+            if self._cache_peek is not None:
+                cached = self._cache_peek(query)
+                if cached:
+                    spec.source, spec.answer = "frontier_cache", cached
+
+        if spec.answer:
+            try:
+                spec.tts = self._synthesize(spec.answer)
+            except Exception as exc:
+                log.debug("Speculative TTS failed: %s", exc)
+
+        with self._lock:
+            if generation != self._generation:
+                return None  # Final transcript arrived while we worked — drop
+            self._current = spec
+            self.stats.partials += 1
+        log.debug("Speculated [%s] '%s' → '%s'", spec.source or "none", query[:40], spec.answer[:40])
+        return spec
+
+    def begin_final(self) -> None:
+        """Final transcript arrived — freeze speculation, fence out late partials."""
+        with self._lock:
+            self._generation += 1
+            self._pending = self._current
+            self._current = None
+            self._committed = False
+            self._saved_ms = 0
+
+    def take_tts(self, answer: str) -> Optional[TTSResult]:
+        """Commit pre-synthesized audio if the final answer matches exactly."""
+        with self._lock:
+            spec = self._pending
+            if spec is None or spec.tts is None or spec.answer != answer:
+                return None
+            tts, spec.tts = spec.tts, None
+            self._committed = True
+            self._saved_ms += round(tts.latency_s * 1000)
+            return tts
+
+    def take_memory_context(self, query: str) -> Optional[str]:
+        """Commit prefetched memory context if the final query matches."""
+        with self._lock:
+            spec = self._pending
+            if spec is None or spec.memory_context is None:
+                return None
+            if spec.key != normalize_query(query):
+                return None
+            context, spec.memory_context = spec.memory_context, None
+            self._committed = True
+            self._saved_ms += spec.memory_ms
+            return context
+
+    def finish(self) -> int:
+        """Close out the utterance: record hit/miss, discard leftovers.
+
+        Returns milliseconds saved for this utterance (0 on miss).
+        """
+        with self._lock:
+            spec, self._pending = self._pending, None
+            if spec is None:
+                return 0
+            self.stats.utterances += 1
+            hit = self._committed
+            saved = self._saved_ms if hit else 0
+            if hit:
+                self.stats.hits += 1
+                self.stats.saved_ms += saved
+            else:
+                self.stats.misses += 1
+            self._committed = False
+            self._saved_ms = 0
+        log.info("Speculation %s [%s]: saved %dms — %s",
+                 "hit" if hit else "miss", spec.source or "none", saved,
+                 self.stats.summary())
+        return saved
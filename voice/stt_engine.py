@@ -310,6 +310,17 @@ class STTEngine:
             is_final=True,
         )
 
+    def transcribe_partial(self, audio_pcm: bytes) -> TranscriptionResult:
+        """Transcribe an in-progress utterance window (speculation).
+
+        Always uses the local backend (whisper.cpp server / PyTorch) — partial
+        windows fire several times per utterance and must never hit billed
+        cloud STT. Result is marked is_final=False.
+        """
+        result = STTEngine.transcribe(self, audio_pcm)
+        result.is_final = False
+        return result
+
     def transcribe_file(self, wav_path: str | Path) -> TranscriptionResult:
         """Transcribe a WAV file (16kHz mono expected)."""
         with wave.open(str(wav_path), "rb") as wf:
@@ -0,0 +1,248 @@
+"""KiSTI - Voice Activity Detection Backends
+
+MicCapture asks a VAD backend for a speech confidence (0-1) on every 32ms
+frame. Backends, selectable via MicCapture(vad_type=...) or KISTI_VAD:
+
+  silero_onnx  Silero VAD weights run directly on ONNX Runtime. State and
+               the 64-sample context window are explicit numpy buffers, so
+               the always-on mic loop never imports torch (hundreds of MB
+               resident, seconds of startup on the Jetson).
+  silero       Silero via the silero_vad package (torch). Reference backend.
+  webrtcvad    Google WebRTC VAD (binary decision).
+  energy       Dependency-free fallback: frame energy against an adaptive
+               noise floor, WebRTC-style hangover on decisions.
+
+"auto" tries them in that order and takes the first that loads.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+log = logging.getLogger("kisti.voice.vad")
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 512
+SILERO_CONTEXT_SAMPLES = 64     # v5 model prepends the previous frame's tail
+HANGOVER_CONFIDENCE = 0.51      # Reported by EnergyVAD while holding a decision
+
+VAD_TYPES = ("silero_onnx", "silero", "webrtcvad", "energy")
+WEBRTC_MODE = 3                 # Most aggressive — in-car noise rejection
+WEBRTC_FRAME_SAMPLES = 480      # WebRTC accepts 10/20/30ms frames only
+
+# Where to look for silero_vad.onnx (first hit wins)
+DEFAULT_MODEL_PATHS = (
+    "/data/models/silero_vad.onnx",
+)
+
+
+class VADBackend:
+    """Speech confidence per frame. Subclasses implement confidence()."""
+
+    name = "base"
+
+    def confidence(self, samples: np.ndarray, pcm: np.ndarray) -> float:
+        """Speech probability for one frame.
+
+        samples: float32 in [-1, 1); pcm: the same frame as int16.
+        """
+        raise NotImplementedError
+
+    def reset_states(self) -> None:
+        """Forget recurrent state between utterances."""
+
+
+def find_silero_onnx_model() -> Optional[Path]:
+    """Locate silero_vad.onnx without importing the (torch-based) package."""
+    candidates = [os.environ.get("KISTI_VAD_MODEL", "")]
+    candidates.extend(DEFAULT_MODEL_PATHS)
+    spec = importlib.util.find_spec("silero_vad")
+    if spec is not None and spec.origin:
+        candidates.append(str(Path(spec.origin).parent / "data" / "silero_vad.onnx"))
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            return Path(candidate)
+    return None
+
+
+class SileroOnnxVAD(VADBackend):
+    """Silero VAD on ONNX Runtime with explicit recurrent state.
+
+    Supports the v5 graph (inputs: input [1, 64+512], state [2, 1, 128],
+    sr) and the v4 graph (inputs: input [1, 512], h, c [2, 1, 64], sr).
+    All input buffers are preallocated and reused frame to frame.
+    """
+
+    name = "silero_onnx"
+
+    def __init__(self, model_path: Optional[str | Path] = None, session=None) -> None:
+        if session is None:
+            import onnxruntime as ort
+
+            path = Path(model_path) if model_path else find_silero_onnx_model()
+            if path is None:
+                raise FileNotFoundError("silero_vad.onnx not found (set KISTI_VAD_MODEL)")
+            opts = ort.SessionOptions()
+            opts.intra_op_num_threads = 1   # One frame at a time — threads only add overhead
+            opts.inter_op_num_threads = 1
+            session = ort.InferenceSession(
+                str(path), sess_options=opts, providers=["CPUExecutionProvider"],
+            )
+        self._session = session
+        names = {i.name for i in session.get_inputs()}
+        self._v5 = "state" in names
+        self._context = SILERO_CONTEXT_SAMPLES if self._v5 else 0
+        self._input = np.zeros((1, self._context + FRAME_SAMPLES), dtype=np.float32)
+        self._sr = np.array(SAMPLE_RATE, dtype=np.int64)
+        if self._v5:
+            self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        else:
+            self._h = np.zeros((2, 1, 64), dtype=np.float32)
+            self._c = np.zeros((2, 1, 64), dtype=np.float32)
+
+    def confidence(self, samples: np.ndarray, pcm: np.ndarray) -> float:
+        self._input[0, self._context:] = samples
+        if self._v5:
+            out, state = self._session.run(
+                None, {"input": self._input, "state": self._state, "sr": self._sr},
+            )
+            self._state = state
+            # Next frame's context is this frame's tail
+            self._input[0, :self._context] = self._input[0, -self._context:]
+        else:
+            out, self._h, self._c = self._session.run(
+                None, {"input": self._input, "h": self._h, "c": self._c, "sr": self._sr},
+            )
+        return float(out.reshape(-1)[0])
+
+    def reset_states(self) -> None:
+        self._input.fill(0.0)
+        if self._v5:
+            self._state = np.zeros_like(self._state)
+        else:
+            self._h = np.zeros_like(self._h)
+            self._c = np.zeros_like(self._c)
+
+
+class SileroTorchVAD(VADBackend):
+    """Silero VAD through the silero_vad package (pulls in torch)."""
+
+    name = "silero"
+
+    def __init__(self) -> None:
+        import torch
+        from silero_vad import load_silero_vad
+
+        self._torch = torch
+        self._model = load_silero_vad()
+
+    def confidence(self, samples: np.ndarray, pcm: np.ndarray) -> float:
+        return self._model(self._torch.from_numpy(samples), SAMPLE_RATE).item()
+
+    def reset_states(self) -> None:
+        self._model.reset_states()
+
+
+class WebRtcVAD(VADBackend):
+    """Google WebRTC VAD — binary decision reported as 0.0 / 1.0.
+
+    Judges the first 30ms of each 32ms frame (its largest legal frame size).
+    """
+
+    name = "webrtcvad"
+
+    def __init__(self, mode: int = WEBRTC_MODE) -> None:
+        import webrtcvad
+
+        self._vad = webrtcvad.Vad(mode)
+
+    def confidence(self, samples: np.ndarray, pcm: np.ndarray) -> float:
+        return 1.0 if self._vad.is_speech(pcm[:WEBRTC_FRAME_SAMPLES].tobytes(), SAMPLE_RATE) else 0.0
+
+
+class EnergyVAD(VADBackend):
+    """Energy detector against an adaptive noise floor (no dependencies).
+
+    Frame energy in dBFS is compared with a tracked noise floor: the floor
+    follows quiet frames quickly and loud frames only very slowly, so steady
+    road noise is absorbed while speech onsets stand out. Confidence is a
+    logistic of the margin above the floor; like WebRTC, a short hangover
+    holds a speech decision through brief dips between syllables.
+    """
+
+    name = "energy"
+
+    def __init__(
+        self,
+        margin_db: float = 9.0,         # Energy above floor for p=0.5
+        min_speech_db: float = -50.0,   # Absolute gate — never speech below this
+        fall_rate: float = 0.2,         # Floor tracking toward quieter frames
+        rise_rate: float = 0.005,       # Floor tracking toward louder frames (~6s)
+        hangover_frames: int = 4,
+    ) -> None:
+        self.margin_db = margin_db
+        self.min_speech_db = min_speech_db
+        self.fall_rate = fall_rate
+        self.rise_rate = rise_rate
+        self.hangover_frames = hangover_frames
+        self.noise_floor_db: Optional[float] = None  # Seeded from the first frame
+        self._hangover = 0
+
+    def confidence(self, samples: np.ndarray, pcm: np.ndarray) -> float:
+        energy = float(np.dot(samples, samples)) / max(len(samples), 1)
+        level_db = 10.0 * math.log10(energy + 1e-12)
+        if self.noise_floor_db is None:
+            self.noise_floor_db = level_db
+        margin = level_db - self.noise_floor_db
+
+        p = 1.0 / (1.0 + math.exp(-(margin - self.margin_db) / 2.0))
+        if level_db < self.min_speech_db:
+            p = 0.0
+
+        rate = self.fall_rate if level_db < self.noise_floor_db else self.rise_rate
+        self.noise_floor_db += rate * (level_db - self.noise_floor_db)
+
+        if p >= 0.5:
+            self._hangover = self.hangover_frames
+        elif self._hangover > 0:
+            self._hangover -= 1
+            p = max(p, HANGOVER_CONFIDENCE)  # Hold the speech decision through the dip
+        return p
+
+    def reset_states(self) -> None:
+        # Keep the learned noise floor — it describes the cabin, not the utterance
+        self._hangover = 0
+
+
+def load_vad(vad_type: str = "auto") -> VADBackend:
+    """Load a VAD backend by name; "auto" takes the first that loads.
+
+    Raises ImportError / FileNotFoundError for an explicit backend that
+    cannot load, and ValueError for an unknown name.
+    """
+    loaders = {
+        "silero_onnx": SileroOnnxVAD,
+        "silero": SileroTorchVAD,
+        "webrtcvad": WebRtcVAD,
+        "energy": EnergyVAD,
+    }
+    if vad_type != "auto":
+        if vad_type not in loaders:
+            raise ValueError(f"Unknown vad_type '{vad_type}' (expected auto or one of {VAD_TYPES})")
+        return loaders[vad_type]()
+
+    for name in VAD_TYPES:
+        try:
+            return loaders[name]()
+        except (ImportError, FileNotFoundError) as exc:
+            log.debug("VAD backend %s unavailable: %s", name, exc)
+        except Exception as exc:
+            log.warning("VAD backend %s failed to load: %s", name, exc)
+    raise ImportError("No VAD backend available")
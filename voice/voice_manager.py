@@ -24,16 +24,18 @@ import threading
 import time
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from PySide6.QtCore import QObject, QThread, Signal
 
 from model.vehicle_state import DiffState, SIDriveMode
-from voice.frontier_engine import FrontierLLMEngine
-from voice.llm_engine import LLMEngine, _match_safety_fast_path
+from voice.frontier_engine import FrontierLLMEngine, SentenceStream
+from voice.intent_router import IntentRouter, Route, SlotPattern
+from voice.llm_engine import LLMEngine, _INSTANT_TABLE, _match_safety_fast_path
 from voice.mic_capture import MicCapture
+from voice.speculation import SpeculativeResolver
 from voice.stt_engine import STTEngine, HybridSTTEngine
-from voice.tts_engine import TTSEngine, split_sentences
+from voice.tts_engine import TTSEngine, TTSResult, split_sentences
 from voice.led_waveform import LEDFrame, LEDWaveformGenerator
 
 log = logging.getLogger("kisti.voice")
@@ -54,6 +56,8 @@ class SpeakItem:
     """Priority queue item for TTS."""
     priority: int  # Higher = more critical, dropped first when queue full
     text: str = field(compare=False)
+    stream: Optional[SentenceStream] = field(default=None, compare=False)  # live frontier sentences
+    tts: Optional[TTSResult] = field(default=None, compare=False)  # pre-synthesized (speculation)
 
 
 @dataclass
@@ -137,12 +141,18 @@ class PipelineTrace:
 
     All timestamps are time.monotonic() values. Computed properties
     return milliseconds for logging and DuckDB storage.
+
+    Streamed frontier answers also set first_token_at/first_sentence_at,
+    and llm_done_at is the first sentence (not the full response), so
+    llm_ms + tts_ms is first-token latency plus one sentence of synthesis.
     """
     mic_captured_at: float = 0.0
     stt_done_at: float = 0.0
     llm_done_at: float = 0.0
     tts_done_at: float = 0.0
     speaker_start_at: float = 0.0
+    first_token_at: float = 0.0     # Streaming only: first text delta decoded
+    first_sentence_at: float = 0.0  # Streaming only: first sentence handed to TTS
     source: str = ""          # "persona" | "sensor" | "llm" | "command" | "system"
     query_text: str = ""      # First 120 chars of user query
 
@@ -170,6 +180,19 @@ class PipelineTrace:
             return round((self.speaker_start_at - self.mic_captured_at) * 1000)
         return 0
 
+    @property
+    def first_token_ms(self) -> int:
+        if self.first_token_at and self.stt_done_at:
+            return round((self.first_token_at - self.stt_done_at) * 1000)
+        return 0
+
+    @property
+    def first_word_ms(self) -> int:
+        """Transcript ready → first audio out (time-to-first-word)."""
+        if self.speaker_start_at and self.stt_done_at:
+            return round((self.speaker_start_at - self.stt_done_at) * 1000)
+        return 0
+
 
 SAMPLE_RATE = 16000
 CHUNK_SIZE = 1024  # samples per audio read
@@ -221,6 +244,16 @@ def _fuzzy_wake_word(text: str) -> bool:
     return False
 
 
+def _strip_wake_word(text: str) -> str:
+    """Strip the first matching wake word (and anything before it) from text."""
+    lower = text.lower()
+    for w in WAKE_WORDS:
+        idx = lower.find(w)
+        if idx >= 0:
+            return text[idx + len(w):].strip(" ,.")
+    return text
+
+
 def _edit_distance(a: str, b: str) -> int:
     """Levenshtein distance between two strings."""
     if len(a) < len(b):
@@ -240,6 +273,137 @@ QUIET_COMMANDS = [
 ]
 RESUME_COMMANDS = ["hey kisti", "hey keesti", "hey keesty", "hey keesey"]
 
+# Component-specific temperature queries should NEVER return ambient data
+_COMPONENT_QUALIFIERS = ("engine", "oil", "coolant", "tire", "tyre",
+                         "brake", "egt", "exhaust", "transmission", "trans",
+                         "cpu", "gpu", "processor", "chip", "board",
+                         "turbo", "intercooler", "radiator", "differential")
+
+# Multi-word phrases that unambiguously request live sensor data
+_ECU_LIVE_PHRASES = (
+    "oil temp", "oil temperature", "oil pressure", "oil psi",
+    "coolant temp", "coolant temperature", "engine temp", "water temp",
+    "intake temp", "intake air",
+    "boost pressure", "boost psi",
+    "fuel pressure", "fuel rail", "fuel psi",
+    "injector duty", "duty cycle",
+    "air fuel", "afr",
+    "flex fuel",
+    "engine speed",
+    "wheel speed", "wheel slip",
+    "brake pressure", "steering angle",
+    "lateral g", "g force", "how many g",
+    "tire pressure", "tyre pressure", "tire temp", "tyre temp",
+    "what gear", "which gear", "current gear",
+)
+
+# Bare component/sensor words — only block with a live-data indicator
+_ECU_COMPONENT_BARE = (
+    "boost", "rpm", "revs", "speed", "throttle",
+    "tire", "tyre", "brake", "braking",
+    "suspension", "sway", "camber", "alignment",
+    "battery", "voltage", "charging",
+    "lambda", "rich", "lean", "ethanol", "e85",
+    "manifold", "iat", "dccd", "accelerat",
+    "injector", "yaw",
+)
+
+# Words that signal a live-data request (vs general knowledge)
+_LIVE_DATA_INDICATORS = (
+    "what's my", "what is my", "whats my",
+    "how much", "how many", "how fast",
+    "current", "right now", "live", "actual",
+    "reading", "gauge", "sensor",
+    "pressure", "psi", "voltage", "percent",
+    "degrees", "temperature", "temp",
+)
+
+# Keyword groups for every command/timing/sensor handler, in the order the
+# handlers test them (Route.intents is ranked by this order). Group names
+# are family-prefixed so a handler with no hit in its family is skipped.
+_INTENT_GROUPS: dict[str, tuple[str, ...]] = {
+    # _handle_timing_command
+    "timing_cmd.p2p": ("point to point", "p2p mode", "p 2 p"),
+    "timing_cmd.set_start": ("set start", "mark start"),
+    "timing_cmd.set_end": ("set end", "mark end"),
+    "timing_cmd.circuit": ("circuit mode", "lap mode", "back to laps"),
+    # _handle_frontier_command (disable before enable: "deactivate" ⊃ "activate")
+    "cloud_cmd.disable": ("disable cloud", "turn off cloud", "deactivate cloud"),
+    "cloud_cmd.enable": ("enable cloud", "turn on cloud", "activate cloud"),
+    "cloud_cmd.status": ("cloud status", "is cloud"),
+    # _answer_from_timing
+    "timing.delta": ("delta", "gap", "ahead", "behind", "compared to"),
+    "timing.theoretical": ("theoretical", "best possible", "perfect lap"),
+    "timing.losing": ("losing time", "lose time", "losing the most", "optimal lap",
+                      "where can i improve", "where am i slow"),
+    "timing.last_lap": ("last lap", "lap time", "my time", "how fast"),
+    "timing.predicted": ("predicted", "projected", "on pace", "looking like"),
+    "timing.sectors": ("sector", "split", "splits"),
+    "timing.track": ("what track", "which track", "where am i", "track name", "circuit"),
+    "timing.lap_count": ("how many laps", "lap count", "laps done", "laps completed",
+                         "what lap", "which lap"),
+    "timing.best_lap": ("best lap", "fastest lap", "personal best", "my best"),
+    "timing.pace": ("my pace", "how am i doing", "how's my pace", "pace"),
+    # _answer_from_sensors — ECU guard
+    "sensor.temperature": ("temperature", "temp"),
+    "sensor.component": _COMPONENT_QUALIFIERS,
+    "sensor.ecu_live": _ECU_LIVE_PHRASES,
+    "sensor.ecu_bare": _ECU_COMPONENT_BARE,
+    "sensor.live_indicator": _LIVE_DATA_INDICATORS,
+    # _answer_from_sensors — ECU / CAN
+    "sensor.oil_temp": ("oil temp", "oil temperature"),
+    "sensor.oil_pressure": ("oil pressure", "oil psi"),
+    "sensor.coolant": ("coolant temp", "coolant temperature", "engine temp",
+                       "engine temperature", "water temp"),
+    "sensor.iat": ("intake temp", "intake air", "iat"),
+    "sensor.boost": ("boost pressure", "how much boost", "boost psi", "manifold"),
+    "sensor.battery": ("battery", "voltage", "charging"),
+    "sensor.fuel_pressure": ("fuel pressure", "fuel rail", "fuel psi"),
+    "sensor.injector": ("injector duty", "injector", "duty cycle"),
+    "sensor.lambda": ("lambda", "air fuel", "afr", "rich", "lean"),
+    "sensor.ethanol": ("ethanol", "e85", "flex fuel", "fuel content"),
+    "sensor.rpm": ("rpm", "revs", "engine speed"),
+    "sensor.speed": ("speed", "how fast", "going"),
+    "sensor.wheel": ("wheel",),
+    "sensor.wheel_speed": ("wheel speed", "wheel slip"),
+    "sensor.brake_pressure": ("brake pressure",),
+    "sensor.steering": ("steering angle", "steering wheel", "how far turned"),
+    "sensor.lateral_g": ("lateral g", "g force", "how many g"),
+    "sensor.yaw": ("yaw",),
+    "sensor.dccd": ("dccd",),
+    "sensor.dccd_detail": ("percent", "setting", "bias"),
+    "sensor.gear": ("what gear", "which gear", "current gear"),
+    # _answer_from_sensors — ambient (Yoctopuce)
+    "sensor.ambient_temp": ("temperature", "temp", "how hot", "how cold", "warm",
+                            "cold outside", "degrees"),
+    "sensor.humidity": ("humidity", "humid", "moisture", "damp"),
+    "sensor.barometric": ("pressure outside", "barometric", "barometer",
+                          "air pressure", "atmospheric"),
+    "sensor.altitude": ("density altitude", "altitude"),
+    "sensor.conditions": ("good day", "driving conditions", "good for driving",
+                          "should i drive", "nice out", "nice day"),
+    "sensor.weather": ("weather", "outside", "conditions", "what's it like"),
+}
+
+_INTENT_SLOTS = (
+    # "use lap N as reference" / "reference lap N"
+    SlotPattern(
+        name="timing_cmd.reference_lap", trigger="lap",
+        pattern=re.compile(r'(?:use\s+)?lap\s+(\d+)\s+as\s+reference|reference\s+lap\s+(\d+)'),
+        convert=int,
+    ),
+)
+
+# Built once at import; also covers the instant-response keywords so the
+# safety fast-path reuses the same scan
+_INTENT_ROUTER = IntentRouter(_INTENT_GROUPS, _INTENT_SLOTS, _INSTANT_TABLE.keywords)
+
+# Quiet/resume match on punctuation-stripped text, so they get their own router
+_COMMAND_ROUTER = IntentRouter({
+    "command.quiet": QUIET_COMMANDS,
+    "command.resume": RESUME_COMMANDS,
+})
+
 
 class VoiceState(IntEnum):
     """Voice pipeline state machine."""
@@ -294,6 +458,8 @@ class VoiceManager(QObject):
             proxy_key=proxy_key,
         ) if (anthropic_key or proxy_key) else None
         self._llm = LLMEngine(frontier=self._frontier)
+        # Stream live frontier answers sentence-by-sentence into TTS (KISTI_FRONTIER_STREAM=0 disables)
+        self._stream_frontier = os.environ.get("KISTI_FRONTIER_STREAM", "1") != "0"
         self._led = LEDWaveformGenerator()
         self._mic = MicCapture(device=mic_device, wake_model=os.environ.get("KISTI_WAKE_MODEL")) if enable_mic else None
 
@@ -313,6 +479,7 @@ class VoiceManager(QObject):
         self._stt_lock = threading.Lock()  # Serialize STT — one Whisper call at a time
         self._aplay_proc: Optional[subprocess.Popen] = None
         self._interrupted = False
+        self._speaking_stream: Optional[SentenceStream] = None  # Live stream in _do_speak (barge-in cancels)
         self._last_interaction: float = 0.0  # Timestamp of last wake word hit
         self._listen_window_s: float = 5.0   # Stay in conversation mode (tighter to reject hallucinations)
 
@@ -339,6 +506,7 @@ class VoiceManager(QObject):
         # Timing manager for voice queries and commands
         self._timing_manager = None  # TimingManager (set via set_timing_manager)
         self._p2p_start = None       # StartFinishLine for P2P start point
+        self._lap_analytics = None   # LapAnalytics (set via set_lap_analytics)
 
         # Pipeline trace for latency instrumentation
         self._active_trace: Optional[PipelineTrace] = None
@@ -347,9 +515,23 @@ class VoiceManager(QObject):
         self._duckdb_store = None
         self._session_id: str = ""
 
+        # Speculative intent resolution on partial transcripts while the
+        # driver is still speaking (KISTI_SPECULATE=0 disables)
+        self._speculate = os.environ.get("KISTI_SPECULATE", "1") != "0"
+        self._speculator = SpeculativeResolver(
+            resolve=self._resolve_speculative,
+            synthesize=lambda text: self._tts.speak(text),
+            memory_lookup=self._speculative_memory,
+            cache_peek=self._speculative_cache_peek,
+        )
+        self._partial_in_flight = False
+
         # Wire mic → STT → LLM pipeline
         if self._mic:
             self._mic.speech_captured.connect(self._on_speech_captured)
+            if self._speculate:
+                self._mic.partial_speech.connect(self._on_partial_speech)
+                self._mic.set_partials_enabled(True)
 
     def start(self) -> None:
         """Initialize all voice subsystems and start the worker thread."""
@@ -425,6 +607,10 @@ class VoiceManager(QObject):
         """Wire timing manager for voice queries and commands."""
         self._timing_manager = timing_mgr
 
+    def set_lap_analytics(self, analytics) -> None:
+        """Wire post-session lap analytics for "where did I lose time" queries."""
+        self._lap_analytics = analytics
+
     def set_telemetry(self, state: DiffState) -> None:
         """Update telemetry snapshot for LLM context. Logs notable changes."""
         prev = self._telemetry_snapshot
@@ -563,12 +749,17 @@ class VoiceManager(QObject):
     def _compose_and_speak(
         self, response: VoiceResponse, user_text: str = "",
         trace: Optional[PipelineTrace] = None,
+        stream: Optional[SentenceStream] = None,
     ) -> None:
         """Unified response handler: record turn, emit signal, queue speech.
 
         All voice query response paths create a VoiceResponse then call this.
         System messages via speak()/speak_alert() bypass this (own filtering).
+        A started stream is already queued and speaking (trace attached by
+        _queue_stream) — only the dialogue bookkeeping happens here.
         """
+        streamed = stream is not None and stream.started
+
         # Record dialogue turn if this was a user-initiated query
         if user_text:
             self._dialogue.record_turn(user_text, response)
@@ -577,7 +768,7 @@ class VoiceManager(QObject):
         self._last_response = response
 
         # Attach trace for completion in _do_speak
-        if trace:
+        if trace and not streamed:
             trace.source = response.source
             if user_text:
                 trace.query_text = user_text[:120]
@@ -589,9 +780,14 @@ class VoiceManager(QObject):
         # mic stuck paused. _do_speak is the sole audio path for query responses.
         # response_ready is still used for standalone messages like "Let me think about that."
 
-        # Queue for TTS (sole audio path — _do_speak handles echo suppression + barge-in)
-        if response.text:
-            item = SpeakItem(priority=30, text=response.text)  # advisory priority for LLM responses
+        # Queue for TTS (sole audio path — _do_speak handles echo suppression + barge-in).
+        # Audio pre-synthesized while the driver was still speaking is committed
+        # only if the final answer is identical to the speculated one.
+        if response.text and not streamed:
+            item = SpeakItem(
+                priority=30, text=response.text,  # advisory priority for LLM responses
+                tts=self._speculator.take_tts(response.text),
+            )
             try:
                 self._speak_queue.put_nowait(item)
             except queue.Full:
@@ -711,29 +907,33 @@ class VoiceManager(QObject):
                 return
 
         # Check for quiet/resume commands (strip punctuation for matching)
-        lower_nopunct = re.sub(r'[^\w\s]', '', lower)
-        if any(cmd in lower_nopunct for cmd in QUIET_COMMANDS):
+        command = _COMMAND_ROUTER.route(re.sub(r'[^\w\s]', '', lower))
+        if "command.quiet" in command:
             self._toggle_state = VoiceToggleState.QUIET
             self._set_state(VoiceState.QUIET)
             resp = VoiceResponse(text="Going quiet.", source="system", tier="system")
             self._compose_and_speak(resp, user_text=transcription)
             return
-        if any(cmd in lower_nopunct for cmd in RESUME_COMMANDS) and self._state == VoiceState.QUIET:
+        if "command.resume" in command and self._state == VoiceState.QUIET:
             self._toggle_state = VoiceToggleState.NORMAL
             self._set_state(VoiceState.IDLE)
             resp = VoiceResponse(text="I'm back. What do you need?", source="system", tier="system")
             self._compose_and_speak(resp, user_text=transcription)
             return
 
+        # One pass over the utterance classifies it for every handler below;
+        # handlers whose keyword family has no hit are skipped outright
+        route = _INTENT_ROUTER.route(lower)
+
         # Timing control commands
-        timing_cmd = self._handle_timing_command(lower)
+        timing_cmd = route.family("timing_cmd.") and self._handle_timing_command(lower, route)
         if timing_cmd:
             resp = VoiceResponse(text=timing_cmd, source="command", tier="system")
             self._compose_and_speak(resp, user_text=transcription, trace=trace)
             return
 
         # Frontier cloud control commands
-        frontier_cmd = self._handle_frontier_command(lower)
+        frontier_cmd = route.family("cloud_cmd.") and self._handle_frontier_command(lower, route)
         if frontier_cmd:
             resp = VoiceResponse(text=frontier_cmd, source="command", tier="system")
             self._compose_and_speak(resp, user_text=transcription, trace=trace)
@@ -742,7 +942,7 @@ class VoiceManager(QObject):
         self._set_state(VoiceState.THINKING)
 
         # Timing query — intercept lap/delta/sector questions with live data
-        timing_answer = self._answer_from_timing(lower)
+        timing_answer = route.family("timing.") and self._answer_from_timing(lower, route)
         if timing_answer:
             resp = VoiceResponse(
                 text=timing_answer, source="timing", tier="deterministic", latency_ms=0,
@@ -752,7 +952,7 @@ class VoiceManager(QObject):
             return
 
         # Live sensor query — intercept ambient/weather questions with real data
-        live = self._answer_from_sensors(lower)
+        live = route.family("sensor.") and self._answer_from_sensors(lower, route)
         if live:
             resp = VoiceResponse(
                 text=live, source="sensor", tier="deterministic", latency_ms=0,
@@ -772,12 +972,18 @@ class VoiceManager(QObject):
         # Build memory context (skip in Sport Sharp — token budget too tight)
         memory_context = ""
         if self._edge_memory and self._si_drive_mode != SIDriveMode.SPORT_SHARP:
-            memory_context = self._edge_memory.build_memory_context(resolved_query)
+            prefetched = None
+            if resolved_query == transcription:
+                prefetched = self._speculator.take_memory_context(transcription)
+            if prefetched is not None:
+                memory_context = prefetched
+            else:
+                memory_context = self._edge_memory.build_memory_context(resolved_query)
 
         # Timeout-based ack: fires "Let me think about that" only if frontier
         # takes >300ms. Safety fast-path returns instantly, cache hits <2ms,
         # so the ack only fires for live API calls.
-        is_instant = _match_safety_fast_path(lower, self._si_drive_mode.label) is not None
+        is_instant = _match_safety_fast_path(lower, self._si_drive_mode.label, route.hits) is not None
         ack_timer = None
         if not is_instant and self._llm.is_real:
             ack_timer = threading.Timer(
@@ -786,6 +992,14 @@ class VoiceManager(QObject):
             )
             ack_timer.start()
 
+        # Live frontier answers stream into TTS sentence by sentence — the
+        # first sentence starts speaking while the rest is still generating
+        stream = None
+        if self._stream_frontier and self._frontier is not None and not is_instant:
+            stream = SentenceStream(
+                on_first_sentence=lambda: self._queue_stream(stream, transcription, trace, ack_timer),
+            )
+
         # Query LLM (pass dialogue history so frontier has conversation context)
         response = self._llm.query(
             user_message=resolved_query,
@@ -793,13 +1007,15 @@ class VoiceManager(QObject):
             memory_context=memory_context,
             si_drive_mode=self._si_drive_mode.label,
             conversation_history=self._dialogue.last_turns,
+            stream=stream,
         )
 
         # Cancel ack if response arrived before the timer fired
         if ack_timer:
             ack_timer.cancel()
 
-        if trace:
+        # Streamed: llm_done_at was stamped at the first sentence
+        if trace and not (stream is not None and stream.started):
             trace.llm_done_at = time.monotonic()
 
         tier = "deterministic" if response.tier == "persona_match" else "interpretive"
@@ -822,7 +1038,117 @@ class VoiceManager(QObject):
                 except Exception:
                     pass
 
-        self._compose_and_speak(resp, user_text=transcription, trace=trace)
+        self._compose_and_speak(resp, user_text=transcription, trace=trace, stream=stream)
+
+    # ---- Speculation (partial transcripts) ----
+
+    def _resolve_speculative(self, query: str) -> Optional[tuple[str, str]]:
+        """Read-only probable answer for a partial query: (source, text).
+
+        Mirrors handle_voice_query's deterministic tiers (timing → sensor →
+        persona fast-path) without running any command handlers.
+        """
+        lower = query.lower().strip()
+        route = _INTENT_ROUTER.route(lower)
+        timing_answer = route.family("timing.") and self._answer_from_timing(lower, route)
+        if timing_answer:
+            return "timing", timing_answer
+        live = route.family("sensor.") and self._answer_from_sensors(lower, route)
+        if live:
+            return "sensor", live
+        safety = _match_safety_fast_path(lower, self._si_drive_mode.label, route.hits)
+        if safety:
+            return "persona", safety
+        return None
+
+    def _speculative_memory(self, query: str) -> Optional[str]:
+        """Prefetch edge-memory context for a query bound for the frontier."""
+        if not self._edge_memory or self._si_drive_mode == SIDriveMode.SPORT_SHARP:
+            return None
+        return self._edge_memory.build_memory_context(query)
+
+    def _speculative_cache_peek(self, query: str) -> Optional[str]:
+        """Peek the frontier cache (only consulted when there is no history)."""
+        if not self._frontier or self._dialogue.last_turns:
+            return None
+        return self._frontier.peek_cache(query, self._si_drive_mode.label)
+
+    def _on_partial_speech(self, pcm: bytes) -> None:
+        """Mic emitted a partial window mid-utterance — speculate on it.
+
+        At most one partial is transcribed at a time; partials never block
+        the final transcript (they skip if STT is busy and the final waits
+        briefly for an in-flight partial).
+        """
+        if self._state in (VoiceState.OFF, VoiceState.QUIET, VoiceState.SPEAKING):
+            return
+        if self._partial_in_flight or not self._stt.is_real:
+            return
+        generation = self._speculator.generation
+        self._partial_in_flight = True
+
+        def _process():
+            try:
+                if not self._stt_lock.acquire(blocking=False):
+                    return  # Final STT already running — partial is moot
+                try:
+                    result = self._stt.transcribe_partial(pcm)
+                finally:
+                    self._stt_lock.release()
+                query = self._partial_query(result.text)
+                if query:
+                    self._speculator.speculate(query, generation)
+            except Exception as exc:
+                log.debug("Partial speculation failed: %s", exc)
+            finally:
+                self._partial_in_flight = False
+
+        threading.Thread(target=_process, daemon=True, name="kisti-stt-partial").start()
+
+    def _partial_query(self, text: str) -> Optional[str]:
+        """Query a partial transcript would route as, or None if not addressed to KiSTI."""
+        text = text.strip()
+        if not text or text == "[mock transcription]":
+            return None
+        lower_clean = re.sub(r'[^\w\s]', '', text.lower())
+        has_wake_word = any(w in lower_clean for w in WAKE_WORDS) or _fuzzy_wake_word(lower_clean)
+        in_conversation = (time.monotonic() - self._last_interaction) < self._listen_window_s
+        if not (has_wake_word or in_conversation or self._state == VoiceState.LISTENING
+                or os.environ.get("KISTI_NO_WAKE", "")):
+            return None
+        query = _strip_wake_word(text) if has_wake_word else text
+        return query if len(query.split()) >= 2 else None
+
+    @property
+    def speculation_stats(self):
+        """SpeculationStats — hit rate and latency saved this session."""
+        return self._speculator.stats
+
+    def _queue_stream(
+        self, stream: SentenceStream, user_text: str,
+        trace: Optional[PipelineTrace], ack_timer: Optional[threading.Timer],
+    ) -> None:
+        """First streamed sentence arrived — start speaking it now.
+
+        Runs on the frontier HTTP thread. Attaches the trace (stamped with
+        the stream's first-token/first-sentence times) and queues a stream
+        item; _do_speak pulls the remaining sentences as they complete.
+        """
+        if ack_timer:
+            ack_timer.cancel()
+        if trace:
+            trace.first_token_at = stream.first_token_at
+            trace.first_sentence_at = stream.first_sentence_at
+            trace.llm_done_at = stream.first_sentence_at
+            trace.source = "frontier_live"
+            trace.query_text = user_text[:120]
+            self._active_trace = trace
+        self._last_response = VoiceResponse(text="", source="frontier_live", tier="interpretive")
+        try:
+            self._speak_queue.put_nowait(SpeakItem(priority=30, text="", stream=stream))
+        except queue.Full:
+            log.debug("Speak queue full, dropping stream: %s", user_text[:30])
+            stream.cancel()
 
     def _voice_loop(self) -> None:
         """Main voice processing loop (runs in worker thread)."""
@@ -832,7 +1158,7 @@ class VoiceManager(QObject):
                 try:
                     item = self._speak_queue.get(timeout=0.1)
                     if item:
-                        self._do_speak(item.text)
+                        self._do_speak(item.text, stream=item.stream, tts=item.tts)
                 except queue.Empty:
                     # No speech queued — generate idle LED pattern
                     if self._state == VoiceState.IDLE and self._si_drive_mode == SIDriveMode.INTELLIGENT:
@@ -861,6 +1187,14 @@ class VoiceManager(QObject):
         # Transcribe on a worker thread to avoid blocking Qt
         # Only one STT call at a time — drop captures that arrive while busy
         def _process():
+            # Fence out late partials; commit or discard speculation on exit
+            self._speculator.begin_final()
+            try:
+                _transcribe_and_route()
+            finally:
+                self._speculator.finish()
+
+        def _transcribe_and_route():
             trace = PipelineTrace(mic_captured_at=time.monotonic())
 
             # Conversation window passthrough: in text-wake-word mode,
@@ -868,7 +1202,11 @@ class VoiceManager(QObject):
             # gate speech. Wake word detection happens via Whisper text match.
             # Only disable passthrough when K2 push-to-talk explicitly toggles it.
 
-            if not self._stt_lock.acquire(blocking=False):
+            acquired = self._stt_lock.acquire(blocking=False)
+            if not acquired and self._partial_in_flight:
+                # A short partial window holds STT — wait for it rather than drop
+                acquired = self._stt_lock.acquire(timeout=1.0)
+            if not acquired:
                 log.debug("STT busy — dropping capture")
                 return
             try:
@@ -937,13 +1275,7 @@ class VoiceManager(QObject):
                 if self._mic:
                     self._mic.set_passthrough(True)
                 # Strip wake word prefix from the query
-                query = text
-                if has_wake_word:
-                    for w in WAKE_WORDS:
-                        idx = lower.find(w)
-                        if idx >= 0:
-                            query = text[idx + len(w):].strip(" ,.")
-                            break
+                query = _strip_wake_word(text) if has_wake_word else text
                 if query and len(query.split()) >= 2:
                     self.handle_voice_query(query, trace=trace)
                 else:
@@ -960,19 +1292,28 @@ class VoiceManager(QObject):
         if proc and proc.poll() is None:
             proc.terminate()
             log.info("TTS playback interrupted")
+        stream = self._speaking_stream
+        if stream is not None:
+            stream.cancel()
         self._interrupted = True
 
-    def _do_speak(self, text: str) -> None:
+    def _do_speak(self, text: str, stream: Optional[SentenceStream] = None,
+                  tts: Optional[TTSResult] = None) -> None:
         """Synthesize and play speech with LED waveform.
 
         Multi-sentence responses use streaming TTS: first sentence synthesizes
         and plays immediately, remaining sentences synthesize while audio plays.
         Cuts perceived latency from full-text TTS time to single-sentence TTS time.
+
+        With a SentenceStream, sentences are pulled as the frontier produces
+        them; barge-in cancels the stream so the HTTP read stops too.
+        Pre-synthesized audio (committed speculation) plays straight away.
         """
         self._set_state(VoiceState.SPEAKING)
         self._interrupted = False
-        self._last_spoken_text = text.lower()
-        self.speaking_text.emit(text)
+        if stream is None:
+            self._last_spoken_text = text.lower()
+            self.speaking_text.emit(text)
 
         trace = self._active_trace
 
@@ -982,13 +1323,23 @@ class VoiceManager(QObject):
         if self._last_response and not self._last_response.can_interrupt:
             can_barge = False
 
-        # Split into sentences for streaming TTS
-        sentences = split_sentences(text)
-
-        if len(sentences) > 1 and not self._interrupted:
-            self._speak_streamed(sentences, trace, can_barge)
+        if stream is not None:
+            self._speaking_stream = stream
+            try:
+                self._speak_streamed(self._track_stream(stream), trace, can_barge)
+            finally:
+                self._speaking_stream = None
+                stream.cancel()  # No-op if the producer finished; stops it otherwise
+        elif tts is not None:
+            self._speak_single(text, trace, can_barge, result=tts)
         else:
-            self._speak_single(text, trace, can_barge)
+            # Split into sentences for streaming TTS
+            sentences = split_sentences(text)
+
+            if len(sentences) > 1 and not self._interrupted:
+                self._speak_streamed(sentences, trace, can_barge)
+            else:
+                self._speak_single(text, trace, can_barge)
 
         # Clear waveform data — UI will stop animating on next poll
         self._waveform_data = None
@@ -1011,6 +1362,9 @@ class VoiceManager(QObject):
             log.info("Pipeline: STT=%dms LLM=%dms TTS=%dms total=%dms [%s]",
                      trace.stt_ms, trace.llm_ms, trace.tts_ms, trace.total_ms,
                      trace.source)
+            if trace.first_token_at:
+                log.info("Pipeline stream: first token=%dms first word=%dms",
+                         trace.first_token_ms, trace.first_word_ms)
             if self._duckdb_store:
                 try:
                     self._duckdb_store.record_voice_latency(
@@ -1028,9 +1382,10 @@ class VoiceManager(QObject):
         self._set_state(VoiceState.IDLE)
 
     def _speak_single(self, text: str, trace: Optional[PipelineTrace],
-                      can_barge: bool) -> None:
-        """Standard TTS path: synthesize full text then play."""
-        result = self._tts.speak(text)
+                      can_barge: bool, result: Optional[TTSResult] = None) -> None:
+        """Standard TTS path: synthesize full text (unless given) then play."""
+        if result is None:
+            result = self._tts.speak(text)
         if trace:
             trace.tts_done_at = time.monotonic()
 
@@ -1071,7 +1426,17 @@ class VoiceManager(QObject):
                 except OSError:
                     pass
 
-    def _speak_streamed(self, sentences: list[str], trace: Optional[PipelineTrace],
+    def _track_stream(self, stream: SentenceStream) -> Iterator[str]:
+        """Yield streamed sentences, updating echo text and the UI as they land."""
+        spoken: list[str] = []
+        for sentence in stream:
+            spoken.append(sentence)
+            text = " ".join(spoken)
+            self._last_spoken_text = text.lower()
+            self.speaking_text.emit(text)
+            yield sentence
+
+    def _speak_streamed(self, sentences: Iterable[str], trace: Optional[PipelineTrace],
                         can_barge: bool) -> None:
         """Streaming TTS: synthesize+play first sentence, overlap the rest.
 
@@ -1080,11 +1445,19 @@ class VoiceManager(QObject):
         Remaining sentences synthesize while the first plays — since TTS speed
         (~10 words/s) is faster than speech rate (~3 words/s), synthesis stays
         ahead of playback and audio is seamless.
+
+        ``sentences`` may be a list or a live iterator (SentenceStream) — later
+        sentences are pulled only after the first one is already playing.
         """
         import subprocess as _sp
 
+        sentence_iter = iter(sentences)
+        first_sentence = next(sentence_iter, None)
+        if first_sentence is None:
+            return
+
         # Synthesize first sentence — this is the perceived latency
-        first_result = self._tts.speak(sentences[0])
+        first_result = self._tts.speak(first_sentence)
         if trace:
             trace.tts_done_at = time.monotonic()
 
@@ -1112,7 +1485,7 @@ class VoiceManager(QObject):
         except Exception:
             # pacat unavailable — fall back to non-streaming
             log.debug("pacat unavailable for streaming, falling back to single-shot")
-            self._speak_single(" ".join(sentences), trace, can_barge)
+            self._speak_single(" ".join([first_sentence, *sentence_iter]), trace, can_barge)
             return
 
         self._aplay_proc = proc
@@ -1128,12 +1501,12 @@ class VoiceManager(QObject):
         all_envelope = list(first_result.amplitude_envelope)
         total_duration = first_result.duration_s
 
-        log.info("Streaming TTS: 1/%d (%.0fms synth, %.1fs audio)",
-                 len(sentences), first_result.latency_s * 1000, first_result.duration_s)
+        log.info("Streaming TTS: sentence 1 (%.0fms synth, %.1fs audio)",
+                 first_result.latency_s * 1000, first_result.duration_s)
 
         # Synthesize and write remaining sentences while first sentence plays.
         # TTS at ~100ms/word < speech at ~300ms/word, so synthesis stays ahead.
-        for i, sentence in enumerate(sentences[1:], start=2):
+        for i, sentence in enumerate(sentence_iter, start=2):
             if self._interrupted:
                 break
             result = self._tts.speak(sentence)
@@ -1145,8 +1518,8 @@ class VoiceManager(QObject):
                 break  # pacat terminated (barge-in or error)
             all_envelope.extend(result.amplitude_envelope)
             total_duration += result.duration_s
-            log.debug("Streaming TTS: %d/%d (%.0fms synth)",
-                      i, len(sentences), result.latency_s * 1000)
+            log.debug("Streaming TTS: sentence %d (%.0fms synth)",
+                      i, result.latency_s * 1000)
 
         # Close stdin — pacat continues playing buffered audio
         try:
@@ -1218,7 +1591,8 @@ class VoiceManager(QObject):
             log.warning("Audio playback failed: %s", exc)
             return None, None
 
-    def _handle_frontier_command(self, query_lower: str) -> Optional[str]:
+    def _handle_frontier_command(self, query_lower: str,
+                                 route: Optional[Route] = None) -> Optional[str]:
         """Handle frontier cloud control commands.
 
         Returns spoken confirmation, or None if not a frontier command.
@@ -1226,9 +1600,11 @@ class VoiceManager(QObject):
         """
         if not self._frontier or not self._edge_memory:
             return None
+        if route is None:
+            route = _INTENT_ROUTER.route(query_lower)
 
         # Disable cloud command (check before enable to avoid "activate"→"deactivate" substring match)
-        if any(phrase in query_lower for phrase in ["disable cloud", "turn off cloud", "deactivate cloud"]):
+        if "cloud_cmd.disable" in route:
             if not self._frontier.is_running:
                 return "Cloud is already disabled."
             self._frontier.stop()
@@ -1237,7 +1613,7 @@ class VoiceManager(QObject):
             return "Cloud disabled."
 
         # Enable cloud command
-        if any(phrase in query_lower for phrase in ["enable cloud", "turn on cloud", "activate cloud"]):
+        if "cloud_cmd.enable" in route:
             if self._frontier.is_running:
                 return "Cloud is already enabled."
             self._frontier.start()
@@ -1246,31 +1622,32 @@ class VoiceManager(QObject):
             return "Cloud enabled."
 
         # Status query
-        if "cloud status" in query_lower or "is cloud" in query_lower:
+        if "cloud_cmd.status" in route:
             status = "enabled" if self._frontier.is_running else "disabled"
             return f"Cloud is {status}."
 
         return None
 
-    def _handle_timing_command(self, query_lower: str) -> Optional[str]:
+    def _handle_timing_command(self, query_lower: str,
+                               route: Optional[Route] = None) -> Optional[str]:
         """Handle voice commands that control timing mode.
 
         Returns spoken confirmation, or None if not a timing command.
         """
         if self._timing_manager is None:
             return None
-
-        import re as _re
+        if route is None:
+            route = _INTENT_ROUTER.route(query_lower)
 
         timer = self._timing_manager.lap_timer
 
         # "point to point mode" / "P2P mode"
-        if any(w in query_lower for w in ["point to point", "p2p mode", "p 2 p"]):
+        if "timing_cmd.p2p" in route:
             log.info("Voice command: P2P mode requested")
             return "Point to point mode. Say set start point when ready."
 
         # "set start point" / "mark start"
-        if any(w in query_lower for w in ["set start", "mark start"]):
+        if "timing_cmd.set_start" in route:
             snap = self._telemetry_snapshot
             if snap and snap.gps_latitude != 0:
                 from timing.track_db import StartFinishLine
@@ -1283,7 +1660,7 @@ class VoiceManager(QObject):
             return "No GPS fix. Can't set start point."
 
         # "set end point" / "mark end"
-        if any(w in query_lower for w in ["set end", "mark end"]):
+        if "timing_cmd.set_end" in route:
             snap = self._telemetry_snapshot
             if snap and snap.gps_latitude != 0:
                 from timing.track_db import StartFinishLine
@@ -1299,15 +1676,14 @@ class VoiceManager(QObject):
             return "No GPS fix. Can't set end point."
 
         # "circuit mode" / "lap mode"
-        if any(w in query_lower for w in ["circuit mode", "lap mode", "back to laps"]):
+        if "timing_cmd.circuit" in route:
             timer.set_circuit_mode()
             log.info("Voice command: circuit mode")
             return "Circuit mode. Lap timing active."
 
         # "use lap N as reference" / "reference lap N"
-        match = _re.search(r'(?:use\s+)?lap\s+(\d+)\s+as\s+reference|reference\s+lap\s+(\d+)', query_lower)
-        if match:
-            lap_num = int(match.group(1) or match.group(2))
+        lap_num = route.slots.get("timing_cmd.reference_lap")
+        if lap_num is not None:
             idx = lap_num - 1  # 0-indexed
             if 0 <= idx < len(timer._completed_laps):
                 timer.set_reference_lap(idx)
@@ -1317,7 +1693,20 @@ class VoiceManager(QObject):
 
         return None
 
-    def _answer_from_timing(self, query_lower: str) -> Optional[str]:
+    def _answer_session_time_lost(self) -> Optional[str]:
+        """Corners that cost the most time, from the last analysed session."""
+        analysis = self._lap_analytics.latest if self._lap_analytics else None
+        if analysis is None:
+            return None
+        laps = analysis.overlay.lap_count
+        worst = analysis.time_lost()
+        if not worst:
+            return f"Last session, {laps} laps. Even pace through every corner."
+        parts = [f"corner {c.number} at {c.apex_m:.0f} meters, {s:.2f}" for c, s in worst]
+        return f"Last session, {laps} laps. Most time lost at " + "; ".join(parts) + "."
+
+    def _answer_from_timing(self, query_lower: str,
+                            route: Optional[Route] = None) -> Optional[str]:
         """Answer lap/delta/sector/track questions from live timing data.
 
         Returns a short spoken response if timing data is available for the
@@ -1326,6 +1715,8 @@ class VoiceManager(QObject):
         s = self._telemetry_snapshot
         if s is None or not s.track_name:
             return None
+        if route is None:
+            route = _INTENT_ROUTER.route(query_lower)
 
         def _fmt_time(ms: int) -> str:
             """Format milliseconds as M:SS.s or SS.s."""
@@ -1338,32 +1729,50 @@ class VoiceManager(QObject):
             return f"{secs:.1f} seconds"
 
         # Delta to reference
-        if any(w in query_lower for w in ["delta", "gap", "ahead", "behind", "compared to"]):
+        if "timing.delta" in route:
             if s.delta_ms == 0 and s.lap_count < 2:
                 return "No delta yet. I need a reference lap first."
             direction = "behind" if s.delta_ms > 0 else "ahead"
             return f"{abs(s.delta_ms) / 1000:.1f} seconds {direction} of reference."
 
         # Theoretical best
-        if any(w in query_lower for w in ["theoretical", "best possible", "perfect lap"]):
+        if "timing.theoretical" in route:
             if s.theoretical_best_ms <= 0:
                 return "Not enough sector data for a theoretical best yet."
             return f"Theoretical best is {_fmt_time(s.theoretical_best_ms)}."
 
+        # Micro-sectors: where the last lap lost time vs the best segments
+        if "timing.losing" in route:
+            if self._timing_manager is None:
+                return self._answer_session_time_lost()
+            timer = self._timing_manager.lap_timer
+            mini = timer.mini_sectors
+            if not mini.configured or not timer._completed_laps:
+                return (self._answer_session_time_lost()
+                        or "No mini-sector data yet. Complete a lap first.")
+            worst = mini.worst_segments(3, last_lap=True)
+            optimal = mini.optimal_lap_s
+            tail = f" Optimal lap {_fmt_time(round(optimal * 1000))}." if optimal else ""
+            if not worst:
+                return "Last lap matched your best everywhere." + tail
+            seg = mini.segment_length_m
+            parts = [f"{i * seg:.0f} to {(i + 1) * seg:.0f} meters, {d:.2f}" for i, d in worst]
+            return "Most time lost at " + "; ".join(parts) + "." + tail
+
         # Last lap / lap time
-        if any(w in query_lower for w in ["last lap", "lap time", "my time", "how fast"]):
+        if "timing.last_lap" in route:
             if s.current_lap_time_ms <= 0:
                 return "No lap time recorded yet."
             return f"Current lap: {_fmt_time(s.current_lap_time_ms)}. Lap {s.lap_count}."
 
         # Predicted lap
-        if any(w in query_lower for w in ["predicted", "projected", "on pace", "looking like"]):
+        if "timing.predicted" in route:
             if s.predicted_lap_ms <= 0:
                 return "Not enough data for a prediction yet."
             return f"Predicted lap: {_fmt_time(s.predicted_lap_ms)}."
 
         # Sector times (from TimingManager)
-        if any(w in query_lower for w in ["sector", "split", "splits"]):
+        if "timing.sectors" in route:
             if self._timing_manager is None:
                 return None
             best = self._timing_manager.lap_timer.get_best_sector_times()
@@ -1376,19 +1785,16 @@ class VoiceManager(QObject):
             return "Best sectors: " + ", ".join(parts) + "."
 
         # Track name
-        if any(w in query_lower for w in ["what track", "which track", "where am i", "track name", "circuit"]):
+        if "timing.track" in route:
             mode = "point to point" if s.timing_mode == "point_to_point" else "circuit"
             return f"{s.track_name}. {mode.capitalize()} mode. Lap {s.lap_count}."
 
         # Lap count / "what lap am I on?"
-        if any(w in query_lower for w in [
-            "how many laps", "lap count", "laps done", "laps completed",
-            "what lap", "which lap",
-        ]):
+        if "timing.lap_count" in route:
             return f"Lap {s.lap_count}." if s.lap_count > 0 else "No laps completed yet."
 
         # Best lap
-        if any(w in query_lower for w in ["best lap", "fastest lap", "personal best", "my best"]):
+        if "timing.best_lap" in route:
             if self._timing_manager is None:
                 return None
             summary = self._timing_manager.get_session_summary()
@@ -1400,7 +1806,7 @@ class VoiceManager(QObject):
             )
 
         # Pace / how am I doing?
-        if any(w in query_lower for w in ["my pace", "how am i doing", "how's my pace", "pace"]):
+        if "timing.pace" in route:
             if s.predicted_lap_ms > 0 and s.delta_ms != 0:
                 direction = "ahead" if s.delta_ms < 0 else "behind"
                 return (
@@ -1413,7 +1819,8 @@ class VoiceManager(QObject):
 
         return None
 
-    def _answer_from_sensors(self, query_lower: str) -> Optional[str]:
+    def _answer_from_sensors(self, query_lower: str,
+                             route: Optional[Route] = None) -> Optional[str]:
         """Answer sensor questions directly from live telemetry data.
 
         Checks ECU (CAN) and ambient (Yoctopuce) data independently.
@@ -1422,99 +1829,56 @@ class VoiceManager(QObject):
         s = self._telemetry_snapshot
         if s is None:
             return None
+        if route is None:
+            route = _INTENT_ROUTER.route(query_lower)
 
         # Guard: component-specific temperature queries should NEVER return
         # ambient data. Route to ECU handler (if CAN) or persona (if not).
-        _COMPONENT_QUALIFIERS = ("engine", "oil", "coolant", "tire", "tyre",
-                                 "brake", "egt", "exhaust", "transmission", "trans",
-                                 "cpu", "gpu", "processor", "chip", "board",
-                                 "turbo", "intercooler", "radiator", "differential")
-        if any(w in query_lower for w in ["temperature", "temp"]):
-            if any(cq in query_lower for cq in _COMPONENT_QUALIFIERS):
+        if "sensor.temperature" in route:
+            if "sensor.component" in route:
                 if not s.can_connected:
                     return "No ECU connected. Link G five not installed yet."
                 # CAN connected — let ECU block below handle it
 
         # === ECU / CAN sensor queries (when Link G5 is connected) ===
-        # Multi-word phrases that unambiguously request live sensor data
-        _ECU_LIVE_PHRASES = (
-            "oil temp", "oil temperature", "oil pressure", "oil psi",
-            "coolant temp", "coolant temperature", "engine temp", "water temp",
-            "intake temp", "intake air",
-            "boost pressure", "boost psi",
-            "fuel pressure", "fuel rail", "fuel psi",
-            "injector duty", "duty cycle",
-            "air fuel", "afr",
-            "flex fuel",
-            "engine speed",
-            "wheel speed", "wheel slip",
-            "brake pressure", "steering angle",
-            "lateral g", "g force", "how many g",
-            "tire pressure", "tyre pressure", "tire temp", "tyre temp",
-            "what gear", "which gear", "current gear",
-        )
-
-        # Bare component/sensor words — only block with a live-data indicator
-        _ECU_COMPONENT_BARE = (
-            "boost", "rpm", "revs", "speed", "throttle",
-            "tire", "tyre", "brake", "braking",
-            "suspension", "sway", "camber", "alignment",
-            "battery", "voltage", "charging",
-            "lambda", "rich", "lean", "ethanol", "e85",
-            "manifold", "iat", "dccd", "accelerat",
-            "injector", "yaw",
-        )
-
-        # Words that signal a live-data request (vs general knowledge)
-        _LIVE_DATA_INDICATORS = (
-            "what's my", "what is my", "whats my",
-            "how much", "how many", "how fast",
-            "current", "right now", "live", "actual",
-            "reading", "gauge", "sensor",
-            "pressure", "psi", "voltage", "percent",
-            "degrees", "temperature", "temp",
-        )
-
         if not s.can_connected:
             # Multi-word live phrases always block
-            if any(kw in query_lower for kw in _ECU_LIVE_PHRASES):
+            if "sensor.ecu_live" in route:
                 return "No ECU connected. Link G five not installed yet."
             # Bare component names only block with live-data indicator
-            has_component = any(kw in query_lower for kw in _ECU_COMPONENT_BARE)
-            has_live = any(ind in query_lower for ind in _LIVE_DATA_INDICATORS)
-            if has_component and has_live:
+            if "sensor.ecu_bare" in route and "sensor.live_indicator" in route:
                 return "No ECU connected. Link G five not installed yet."
 
         if s.can_connected:
             # Oil temperature
-            if any(w in query_lower for w in ["oil temp", "oil temperature"]):
+            if "sensor.oil_temp" in route:
                 if s.oil_temp_c > 0:
                     status = "cold" if s.oil_temp_c < 80 else "optimal" if s.oil_temp_c < 120 else "hot"
                     return f"Oil temperature {s.oil_temp_c:.0f} degrees. {status.capitalize()}."
                 return "Oil temperature sensor not reading yet."
 
             # Oil pressure
-            if any(w in query_lower for w in ["oil pressure", "oil psi"]):
+            if "sensor.oil_pressure" in route:
                 if s.oil_psi > 0:
                     status = "critical — pull over" if s.oil_psi < 25 else "normal" if s.oil_psi < 90 else "high"
                     return f"Oil pressure {s.oil_psi:.0f} PSI. {status.capitalize()}."
                 return "Oil pressure sensor not reading yet."
 
             # Coolant temperature
-            if any(w in query_lower for w in ["coolant temp", "coolant temperature", "engine temp", "engine temperature", "water temp"]):
+            if "sensor.coolant" in route:
                 if s.coolant_temp > 0:
                     status = "cold" if s.coolant_temp < 80 else "normal" if s.coolant_temp < 100 else "warning" if s.coolant_temp < 105 else "critical"
                     return f"Coolant {s.coolant_temp:.0f} degrees. {status.capitalize()}."
                 return "Coolant temperature sensor not reading yet."
 
             # Intake air temperature
-            if any(w in query_lower for w in ["intake temp", "intake air", "iat"]):
+            if "sensor.iat" in route:
                 if s.iat_c != 0:
                     return f"Intake air temperature {s.iat_c:.0f} degrees."
                 return "IAT sensor not reading yet."
 
             # Boost pressure
-            if any(w in query_lower for w in ["boost pressure", "how much boost", "boost psi", "manifold"]):
+            if "sensor.boost" in route:
                 if s.map_kpa > 0:
                     boost_psi = (s.map_kpa - 101.325) * 0.145038
                     if boost_psi > 0:
@@ -1523,82 +1887,82 @@ class VoiceManager(QObject):
                 return "MAP sensor not reading yet."
 
             # Battery voltage
-            if any(w in query_lower for w in ["battery", "voltage", "charging"]):
+            if "sensor.battery" in route:
                 if s.battery_v > 0:
                     status = "low" if s.battery_v < 12.4 else "normal" if s.battery_v < 14.8 else "high"
                     return f"Battery {s.battery_v:.1f} volts. {status.capitalize()}."
                 return "Battery voltage not reading yet."
 
             # Fuel pressure
-            if any(w in query_lower for w in ["fuel pressure", "fuel rail", "fuel psi"]):
+            if "sensor.fuel_pressure" in route:
                 if s.fuel_pressure_kpa > 0:
                     fuel_psi = s.fuel_pressure_kpa * 0.145038
                     return f"Fuel rail pressure {fuel_psi:.0f} PSI."
                 return "Fuel pressure sensor not reading yet."
 
             # Injector duty cycle
-            if any(w in query_lower for w in ["injector duty", "injector", "duty cycle"]):
+            if "sensor.injector" in route:
                 if s.injector_duty > 0:
                     status = "safe" if s.injector_duty < 80 else "high" if s.injector_duty < 95 else "maxed out"
                     return f"Injector duty cycle {s.injector_duty:.0f} percent. {status.capitalize()}."
                 return "Injector duty not reading yet."
 
             # Lambda / AFR
-            if any(w in query_lower for w in ["lambda", "air fuel", "afr", "rich", "lean"]):
+            if "sensor.lambda" in route:
                 if s.lambda_1 > 0:
                     status = "rich" if s.lambda_1 < 0.95 else "stoich" if s.lambda_1 < 1.05 else "lean"
                     return f"Lambda {s.lambda_1:.3f}. Running {status}."
                 return "Lambda sensor not reading yet."
 
             # Ethanol content
-            if any(w in query_lower for w in ["ethanol", "e85", "flex fuel", "fuel content"]):
+            if "sensor.ethanol" in route:
                 if s.ethanol_pct > 0:
                     return f"Ethanol content {s.ethanol_pct:.0f} percent."
                 return "Ethanol sensor not reading."
 
             # RPM
-            if any(w in query_lower for w in ["rpm", "revs", "engine speed"]):
+            if "sensor.rpm" in route:
                 return f"Engine at {s.rpm:.0f} RPM." if s.rpm > 0 else "Engine is off."
 
             # Vehicle speed
-            if any(w in query_lower for w in ["speed", "how fast", "going"]) and "wheel" not in query_lower:
+            if "sensor.speed" in route and "sensor.wheel" not in route:
                 if s.speed_kph > 0:
                     return f"Doing {s.speed_kph:.0f} km per hour."
                 return "Stationary."
 
             # Wheel speeds
-            if any(w in query_lower for w in ["wheel speed", "wheel slip"]):
+            if "sensor.wheel_speed" in route:
                 if s.wheel_speed_fl > 0 or s.wheel_speed_fr > 0:
                     return (f"Front left {s.wheel_speed_fl:.0f}, front right {s.wheel_speed_fr:.0f}, "
                             f"rear left {s.wheel_speed_rl:.0f}, rear right {s.wheel_speed_rr:.0f} km per hour.")
                 return "Wheel speed sensors not reading yet."
 
             # Brake pressure
-            if "brake pressure" in query_lower:
+            if "sensor.brake_pressure" in route:
                 if s.brake_pressure > 0:
                     return f"Brake pressure {s.brake_pressure:.0f} bar."
                 return "Brake pressure sensor not reading."
 
             # Steering angle
-            if any(w in query_lower for w in ["steering angle", "steering wheel", "how far turned"]):
+            if "sensor.steering" in route:
                 return f"Steering angle {s.steering_angle:.0f} degrees."
 
             # Lateral G / G-force (live)
-            if any(w in query_lower for w in ["lateral g", "g force", "how many g"]):
+            if "sensor.lateral_g" in route:
                 if s.lateral_g != 0:
                     return f"Lateral {abs(s.lateral_g):.2f} g {'right' if s.lateral_g > 0 else 'left'}."
                 return "No lateral load right now."
 
             # Yaw rate
-            if "yaw" in query_lower:
+            if "sensor.yaw" in route:
                 return f"Yaw rate {s.yaw_rate:.1f} degrees per second."
 
             # DCCD
-            if "dccd" in query_lower and ("percent" in query_lower or "setting" in query_lower or "bias" in query_lower):
+            if "sensor.dccd" in route and "sensor.dccd_detail" in route:
                 return f"DCCD commanding {s.dccd_command_pct:.0f} percent."
 
             # Gear
-            if any(w in query_lower for w in ["what gear", "which gear", "current gear"]):
+            if "sensor.gear" in route:
                 if s.gear == 0:
                     return "Neutral."
                 return f"Gear {s.gear}."
@@ -1606,24 +1970,23 @@ class VoiceManager(QObject):
         # === Ambient / weather queries (Yoctopuce) ===
         if s.ambient_available:
             # Ambient temperature (component temps already guarded at top of method)
-            if any(w in query_lower for w in ["temperature", "temp", "how hot", "how cold", "warm", "cold outside", "degrees"]):
+            if "sensor.ambient_temp" in route:
                 return f"{s.ambient_temp_c:.1f} degrees outside. Dew point {s.dew_point_c:.1f}."
 
             # Humidity
-            if any(w in query_lower for w in ["humidity", "humid", "moisture", "damp"]):
+            if "sensor.humidity" in route:
                 return f"Humidity is {s.ambient_humidity_pct:.0f} percent. Dew point {s.dew_point_c:.1f} degrees."
 
             # Barometric pressure
-            if any(w in query_lower for w in ["pressure outside", "barometric", "barometer", "air pressure", "atmospheric"]):
+            if "sensor.barometric" in route:
                 return f"Barometric pressure {s.ambient_pressure_hpa:.0f} millibars."
 
             # Density altitude
-            if any(w in query_lower for w in ["density altitude", "altitude"]):
+            if "sensor.altitude" in route:
                 return f"Density altitude {s.density_altitude_ft:.0f} feet."
 
             # Driving conditions / "good day" questions
-            if any(w in query_lower for w in ["good day", "driving conditions", "good for driving", "should i drive",
-                                               "nice out", "nice day"]):
+            if "sensor.conditions" in route:
                 temp = s.ambient_temp_c
                 humid = s.ambient_humidity_pct
                 grip = "dry" if humid < 70 else "damp" if humid < 85 else "wet"
@@ -1631,7 +1994,7 @@ class VoiceManager(QObject):
                 return f"{verdict}. {temp:.0f} degrees, {grip} conditions, {s.ambient_pressure_hpa:.0f} millibars."
 
             # General weather/outside/conditions
-            if any(w in query_lower for w in ["weather", "outside", "conditions", "what's it like"]):
+            if "sensor.weather" in route:
                 return f"{s.ambient_temp_c:.1f} degrees, {s.ambient_humidity_pct:.0f} percent humidity, {s.ambient_pressure_hpa:.0f} millibars."
 
         return None